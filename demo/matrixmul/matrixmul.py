@@ -7,11 +7,12 @@
 # against the Numpy implementation. You will need Numpy to run this demo.
 #
 # Run to see benchmark against Numpy.
+# Also shows the overhead of bounds checking.
 #
 import logging; logging.basicConfig(level=logging.DEBUG)
 
 # Import JIT features
-from pymothoa.jit import default_module, function
+from pymothoa.jit import JITModule, default_module, function
 
 # Import constructs for the Pymothoa dialect
 from pymothoa.dialect import *
@@ -44,7 +45,8 @@ def matrixmul_naive(Pn, Mn, Nn, n):
         for col in xrange(n):
             tmp = 0
             for i in xrange(n):
-                # Subscript works, but no bound checking.
+                # Subscript works. Indices are checked only in a module
+                # created with boundscheck=True (see below).
                 tmp += Mn[row*(n)+i]*Nn[i*(n)+col]
             Pn[row*(n)+col] = tmp
 
@@ -82,10 +84,47 @@ def matrixmul_cached_many(Pn, Mn, Nn, n, ct):
     for i in xrange(ct):
         matrixmul_cached(Pn[i*dim:], Mn[i*dim:], Nn[i*dim:], n)
 
+@function(args=[Array(Float), Array(Float), Array(Float), Int, Int])
+def matrixmul_parallel_many(Pn, Mn, Nn, n, ct):
+    '''Same as matrixmul_cached_many() but the matrices are distributed to
+    all cores. Each iteration of a "prange" loop must be independent.
+    '''
+    var (dim=Int)
+    dim = n*n
+    for i in prange(ct):
+        matrixmul_cached(Pn[i*dim:], Mn[i*dim:], Nn[i*dim:], n)
+
+@function(args=[NDArray(Float, 2), NDArray(Float, 2), NDArray(Float, 2)])
+def matrixmul_ndarray(P, M, N):
+    '''Naive implementation on 2-dimensional arrays.
+    The shape and strides come with the arrays. Works on any numpy view,
+    e.g. a transposed matrix, without copying.
+    '''
+    var ( tmp = Float )
+
+    for row in xrange(M.shape[0]):
+        for col in xrange(N.shape[1]):
+            tmp = 0
+            for i in xrange(M.shape[1]):
+                tmp += M[row, i] * N[i, col]
+            P[row, col] = tmp
 
 # We have done building the JIT code. Optimize it for speed.
 default_module.optimize()
 
+# The same kernels in a module that checks the indices of array accesses.
+# Indices that are loop counters (all of them in matrixmul_ndarray) are checked
+# once before the loop. The others are checked on every access.
+checked = JITModule('matrixmul_checked', modargs={'boundscheck': True})
+matrixmul_naive_checked = checked.function(
+                                args=[Array(Float), Array(Float), Array(Float), Int]
+                          )(matrixmul_naive.code_python)
+matrixmul_ndarray_checked = checked.function(
+                                args=[NDArray(Float, 2), NDArray(Float, 2),
+                                      NDArray(Float, 2)]
+                            )(matrixmul_ndarray.code_python)
+checked.optimize()
+
 #-------------------------------------------------------------------------------
 
 from pymothoa.util.testing import benchmark, benchmark_summary, relative_error
@@ -116,6 +155,8 @@ def main():
     ENTRY_CACHED = 'cached-jit'
     ENTRY_NAIVE = 'naive-jit'
     ENTRY_VECTOR = 'vector-jit'
+    ENTRY_PARALLEL = 'parallel-jit'
+    ENTRY_NDARRAY = 'ndarray-jit'
 
     # Set the number of element per row (or column) of matrix.
     # Feel free to change the value.
@@ -143,6 +184,13 @@ def main():
     matrixmul_cached(Pn, Mn, Nn, n)
     verify(Golden, Pn, n)
 
+    # Multiply by the transpose (a strided view) without copying.
+    M2 = Mn.reshape((n,n))
+    N2 = Nn.reshape((n,n))
+    P2 = np.zeros((n,n), dtype=c_float)
+    matrixmul_ndarray(P2, M2, N2.T)
+    verify(np.matrix(M2) * np.matrix(N2.T), P2, n)
+
     with benchmark('Matrix-Matrix Multiply %dx%d'%(n,n)) as bm:
         # Number of iteration
         REP = 1000
@@ -169,6 +217,38 @@ def main():
             P = Pn[i*dim:(i+1)*dim]
             verify(Goldens[i], P, n)
 
+        Pn = np.zeros(dim*REP, dtype=c_float)
+        with bm.entry(ENTRY_PARALLEL):
+            matrixmul_parallel_many(Pn, Mn, Nn, n, REP)
+
+        for i in xrange(REP):
+            P = Pn[i*dim:(i+1)*dim]
+            verify(Goldens[i], P, n)
+
+    # Bounds checking on larger matrices. Feel free to change the value.
+    m = 128
+    M2 = np.array(randomize_list(m*m), dtype=c_float)
+    N2 = np.array(randomize_list(m*m), dtype=c_float)
+    P2 = np.zeros(m*m, dtype=c_float)
+    Golden = np.matrix(M2.reshape((m,m))) * np.matrix(N2.reshape((m,m)))
+
+    with benchmark('Bounds checking %dx%d'%(m,m)) as bm:
+        with bm.entry(ENTRY_NAIVE):
+            matrixmul_naive(P2, M2, N2, m)
+
+        with bm.entry(ENTRY_NAIVE + ' checked'):
+            matrixmul_naive_checked(P2, M2, N2, m)
+        verify(Golden, P2, m)
+
+        with bm.entry(ENTRY_NDARRAY):
+            matrixmul_ndarray(P2.reshape((m,m)), M2.reshape((m,m)),
+                              N2.reshape((m,m)))
+
+        with bm.entry(ENTRY_NDARRAY + ' checked'):
+            matrixmul_ndarray_checked(P2.reshape((m,m)), M2.reshape((m,m)),
+                                      N2.reshape((m,m)))
+        verify(Golden, P2, m)
+
     benchmark_summary()
 
 if __name__ == '__main__':
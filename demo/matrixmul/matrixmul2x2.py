@@ -5,6 +5,8 @@
 #
 # This demo implements a simple vectorized matrix-matrix multiplication
 # for 2x2 squared matrices and compares against the Numpy implementation.
+# It also compiles the generic implementation with the size as a static
+# argument; its loops are unrolled for n=2.
 # You will need Numpy to run this demo.
 #
 # Run to see benchmark against Numpy.
@@ -81,6 +83,18 @@ def matrixmul_vector2x2_many(Pn, Mn, Nn, n, ct):
     for i in xrange(ct):
         matrixmul_vector2x2(Pn[i*dim:], Mn[i*dim:], Nn[i*dim:], n)
 
+# The generic kernel with n as a compile-time constant.
+matrixmul_static = function(args=[Array(Float), Array(Float), Array(Float), Int],
+                            static=['n'])(matrixmul_cached.code_python)
+
+@function(args=[Array(Float), Array(Float), Array(Float), Int, Int],
+          static=['n'])
+def matrixmul_static_many(Pn, Mn, Nn, n, ct):
+    var (dim=Int)
+    dim=n*n
+    for i in xrange(ct):
+        matrixmul_static(Pn[i*dim:], Mn[i*dim:], Nn[i*dim:], n)
+
 default_module.optimize()
 
 #-------------------------------------------------------------------------------
@@ -109,6 +123,7 @@ def main():
     ENTRY_CACHED = 'cached-jit'
     ENTRY_NAIVE = 'naive-jit'
     ENTRY_VECTOR = 'vector-jit'
+    ENTRY_STATIC = 'static-jit'
 
     n = 2
     dim = n**2
@@ -135,6 +150,10 @@ def main():
     matrixmul_vector2x2(Pn, Mn, Nn, n)
     verify(Golden, Pn, n)
 
+    Pn = np.zeros(dim, dtype=c_float)
+    matrixmul_static(Pn, Mn, Nn, n)
+    verify(Golden, Pn, n)
+
     with benchmark('Matrix-Matrix Multiply %dx%d'%(n,n)) as bm:
         REP = 10000
 
@@ -143,6 +162,7 @@ def main():
 
         Pn = np.zeros(dim*REP, dtype=c_float)
         Qn = np.zeros(dim*REP, dtype=c_float)
+        Sn = np.zeros(dim*REP, dtype=c_float)
 
         Goldens = []
         with bm.entry(ENTRY_NUMPY):
@@ -172,11 +192,17 @@ def main():
         with bm.entry(ENTRY_VECTOR):
             matrixmul_vector2x2_many(Qn, Mn, Nn, n, REP)
 
+        matrixmul_static_many(Sn[:dim], Mn, Nn, n, 1) # compile outside
+        with bm.entry(ENTRY_STATIC):
+            matrixmul_static_many(Sn, Mn, Nn, n, REP)
+
         for i in xrange(REP):
             P = Pn[i*dim:(i+1)*dim]
             Q = Qn[i*dim:(i+1)*dim]
+            S = Sn[i*dim:(i+1)*dim]
             verify(Goldens[i], P, n)
             verify(Goldens[i], Q, n)
+            verify(Goldens[i], S, n)
 
     benchmark_summary()
 
@@ -6,10 +6,12 @@
 # Implements reduce-add using Pymothoa.
 #
 # Run to see benchmark against builtin-reduce and Numpy.
+# Also shows the overhead of bounds checking, the effect of fast-math and the
+# builtin reductions.
 #
 
 # Import JIT features
-from pymothoa.jit import default_module, function
+from pymothoa.jit import JITModule, default_module, function
 
 # Import constructs for the Pymothoa dialect
 from pymothoa.types import *
@@ -28,7 +30,8 @@ def reduction(A, n):
     # from the raw Python code. Here, it means,
     # for ( int i=0; i<n; i++ )
     for i in xrange(n):
-        # Subscript works, but no bound checking.
+        # Subscript works. Indices are checked only in a module
+        # created with boundscheck=True (see below).
         tmp += A[i]
     return tmp
 
@@ -42,20 +45,52 @@ def reduction_vector(A, n):
 
     tmp = 0
     for i in xrange(0, n, 4): # Equal to: for (int i=0; i<n; i+=4)
-        for j in xrange(4):
-            tmp += A[i+j]
+        # Load A[i:i+4] with one vector instruction.
+        # Each lane accumulates a partial sum.
+        tmp += vload(A, i, 4)
 
     var ( result = Float )
 
     result = 0
     for k in xrange(4):
-        result = tmp[k]
+        result += tmp[k]
 
     return result
 
+@function(ret=Float, args=[Array(Float), Int])
+def reduction_builtin(A, n):
+    # The builtin reductions (sum, min, max) and dot and argmax of the
+    # dialect compile to a vectorized loop with several accumulators.
+    return sum(A[:n])
+
+@function(ret=Float, args=[Array(Float), Int])
+def reduction_parallel(A, n):
+    var ( tmp = Float )
+    tmp = 0
+
+    # Iterations of 'prange' run on all cores. Each thread accumulates
+    # into a private copy of 'tmp'. The copies are added at the end.
+    for i in prange(n):
+        tmp += A[i]
+    return tmp
+
 # We have done building the JIT code. Optimize it for speed.
 default_module.optimize()
 
+# The same kernel in a module that checks the indices of array accesses.
+# The check of A[i] is done once before the loop.
+checked = JITModule('reduce_checked', modargs={'boundscheck': True})
+reduction_checked = checked.function(ret=Float, args=[Array(Float), Int])(
+                        reduction.code_python)
+checked.optimize()
+
+# The same kernel with fast-math. The additions may be reassociated, so the
+# loop accumulates into a vector of partial sums.
+fast = JITModule('reduce_fastmath')
+reduction_fastmath = fast.function(ret=Float, args=[Array(Float), Int],
+                                   fastmath=True)(reduction.code_python)
+fast.optimize()
+
 #------------------------------------------------------------------------------
 
 def main():
@@ -77,12 +112,21 @@ def main():
         golden = reduce(lambda X, Y: X+Y, data_list)
         answer = reduction(data_list, len(data_list))
         answer2 = reduction_vector(data_list, len(data_list))
+        answer3 = reduction_parallel(data_list, len(data_list))
+        answer4 = reduction_fastmath(data_list, len(data_list))
+        answer5 = reduction_builtin(data_list, len(data_list))
 
         if relative_error(golden, answer)>0.01/100:
             raise AssertionError('Incorrect answer: reduction')
         if relative_error(golden, answer2)>0.01/100:
             print golden, answer2
             raise AssertionError('Incorrect answer: reduction_vector')
+        if relative_error(golden, answer3)>0.01/100:
+            raise AssertionError('Incorrect answer: reduction_parallel')
+        if relative_error(golden, answer4)>0.01/100:
+            raise AssertionError('Incorrect answer: reduction_fastmath')
+        if relative_error(golden, answer5)>0.01/100:
+            raise AssertionError('Incorrect answer: reduction_builtin')
 
         op = lambda X, Y: X+Y
 
@@ -106,12 +150,24 @@ def main():
             with bm.entry('JIT numpy'):
                 answer = reduction(data_numpy, N)
 
+            with bm.entry('JIT checked numpy'):
+                answer = reduction_checked(data_numpy, N)
+
+            with bm.entry('JIT fastmath numpy'):
+                answer = reduction_fastmath(data_numpy, N)
+
             with bm.entry('JIT vector array'):
-                answer = reduction(data_array, N)
+                answer = reduction_vector(data_array, N)
 
             with bm.entry('JIT vector numpy'):
                 answer = reduction_vector(data_numpy, N)
 
+            with bm.entry('JIT builtin sum numpy'):
+                answer = reduction_builtin(data_numpy, N)
+
+            with bm.entry('JIT parallel numpy'):
+                answer = reduction_parallel(data_numpy, N)
+
     benchmark_summary()
 
 if __name__ == '__main__':
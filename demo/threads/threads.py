@@ -0,0 +1,85 @@
+# Copyright (c) 2012, Siu Kwan Lam
+# All rights reserved.
+#
+# Threads Demo
+#
+# JIT functions declared with "nogil=True" release the GIL while they run.
+# Python threads calling such functions run in parallel on all cores.
+#
+# Run to see how the throughput scales with the number of threads.
+#
+
+# Import JIT features
+from pymothoa.jit import default_module, function
+
+# Import constructs for the Pymothoa dialect
+from pymothoa.dialect import *
+
+# Import the Pymothoa types
+from pymothoa.types import *
+
+@function(ret=Double, args=[Int], nogil=True)
+def leibniz_pi(n):
+    '''Approximate pi with n terms of the Leibniz series.
+    Pure computation: no memory traffic, no interpreter.
+    '''
+    var ( total = Double )
+    total = 0
+    for i in xrange(0, n, 2):
+        total += 1.0 / (2 * i + 1)
+        total -= 1.0 / (2 * i + 3)
+    return 4 * total
+
+# We have done building the JIT code. Optimize it for speed.
+default_module.optimize()
+
+#-------------------------------------------------------------------------------
+
+import threading
+from pymothoa.util.testing import Timer
+
+def run_threads(count, work):
+    '''Run the kernel on count threads. Each thread does the same work.
+    Returns the duration in seconds.
+    '''
+    threads = [threading.Thread(target=leibniz_pi, args=(work,))
+               for _ in xrange(count)]
+    timer = Timer()
+    with timer:
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    return timer.duration()
+
+def cpu_count():
+    try:
+        import multiprocessing
+        return multiprocessing.cpu_count()
+    except (ImportError, NotImplementedError):
+        return 1
+
+def main():
+    print 'Threads Demo'.center(80, '=')
+
+    # Number of terms computed by each thread.
+    # Feel free to modify.
+    work = 50 * 1000 * 1000
+
+    leibniz_pi(1000) # bind the function before timing
+
+    ncores = cpu_count()
+    base = run_threads(1, work)
+    print '%d core(s), %d terms per thread' % (ncores, work)
+    print
+    print '%8s %10s %10s %12s' % ('threads', 'time (s)', 'speedup', 'efficiency')
+    for count in range(1, ncores + 1):
+        dt = run_threads(count, work)
+        # Ideal scaling keeps the duration constant as threads are added.
+        speedup = count * base / dt
+        print '%8d %10.3f %10.2f %11.0f%%' % (count, dt, speedup,
+                                              100 * speedup / count)
+    print '='*80
+
+if __name__ == '__main__':
+    main()
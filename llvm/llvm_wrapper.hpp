@@ -19,7 +19,7 @@ This file contains SWIG directives that will go into the 'llvm_wrapper.i'.
 #include "llvm/Target/TargetData.h"
 #include "llvm/LinkAllPasses.h"
 
-#if LLVM_VERSION_MAJOR>=3 && LLVM_VERSION_MINOR>=2
+#if LLVM_VERSION_MAJOR>3 || (LLVM_VERSION_MAJOR==3 && LLVM_VERSION_MINOR>=2)
     #include "llvm/IRBuilder.h" // for 3.2svn
 #else
     #include "llvm/Support/IRBuilder.h" // for 3.1 and prior
@@ -33,6 +33,11 @@ This file contains SWIG directives that will go into the 'llvm_wrapper.i'.
 #include <vector>
 #include <cstdlib>
 
+/**
+ * Make the native runtime (see Runtime.cpp) visible to the JIT.
+ */
+void register_runtime_symbols();
+
 /*!swig-begin
 %module llvm_wrapper
 %{
@@ -82,6 +87,18 @@ enum {
     FCMP_TRUE = llvm::CmpInst::FCMP_TRUE,    // Always true (always folded)
 };
 
+/**
+ * Fast-math flags for the floating-point operations of Builder.
+ */
+enum {
+    FASTMATH_NNAN     = 1 << 0,  // assume no NaN operands or results
+    FASTMATH_NINF     = 1 << 1,  // assume no infinite operands or results
+    FASTMATH_NSZ      = 1 << 2,  // ignore the sign of zero
+    FASTMATH_ARCP     = 1 << 3,  // allow the reciprocal instead of division
+    FASTMATH_CONTRACT = 1 << 4,  // allow fusing into multiply-add
+    FASTMATH_REASSOC  = 1 << 5,  // allow reassociation
+};
+
 /**
  * Always return a pointer to a singleton object.
  * User should never delete the pointer.
@@ -97,6 +114,11 @@ public:
     static llvm::Type * make_void();
     static llvm::Type * make_pointer(llvm::Type * elemty);
     static llvm::Type * make_vector(llvm::Type * elemty, unsigned int elemct);
+    static llvm::Type * make_array(llvm::Type * elemty, unsigned int elemct);
+    /**
+     * @return A literal (unnamed) struct type with the given fields.
+     */
+    static llvm::Type * make_struct(std::vector<llvm::Type*> fieldtys);
 };
 
 class ConstantFactory{
@@ -105,6 +127,12 @@ public:
     static llvm::Value * make_int_signed(llvm::Type * ty, unsigned long long val);
     static llvm::Value * make_real(llvm::Type * ty, double val);
     static llvm::Value * make_undef(llvm::Type * ty);
+    static llvm::Value * make_null(llvm::Type * ty);
+    /**
+     * @return A constant pointer of type ty to a fixed address, e.g. of
+     *         a buffer allocated by Python.
+     */
+    static llvm::Value * make_pointer(llvm::Type * ty, unsigned long long addr);
 };
 
 
@@ -120,10 +148,75 @@ public:
     std::vector<llvm::Value*> arguments() const;
     unsigned int arg_size() const;
     bool verify() const;
+    /**
+     * @return The function as a value (e.g. for taking its address).
+     */
+    llvm::Value * as_value() const;
+    /**
+     * Hide the function from other modules. Use for helper functions
+     * generated for another function.
+     */
+    void set_internal();
+    /**
+     * Delete the body of the function so that it can be generated again.
+     * The function becomes a declaration.
+     */
+    void delete_body();
 private:
     llvm::Function * const func_;
 };
 
+/**
+ * Optimization passes for individual functions.
+ * Either the standard pipeline of an optimization level or an explicit list
+ * of named passes (see JITEngine::dump_passes). Only function, loop and
+ * basic-block passes can be run on a single function.
+ */
+class PassPipeline{
+public:
+    explicit PassPipeline(int optlevel=3);
+
+    /**
+     * Toggle the basic-block (SLP) vectorizer of the standard pipeline.
+     */
+    void set_vectorize(bool enable);
+
+    /**
+     * Size threshold for unrolling loops. Negative uses the LLVM default.
+     */
+    void set_unroll_threshold(int threshold);
+
+    /**
+     * Inline direct calls to functions of the module with at most this
+     * number of instructions before running the passes.
+     * Negative disables inlining.
+     */
+    void set_inline_threshold(int threshold);
+    int inline_threshold() const;
+
+    /**
+     * Append a named pass. Replaces the standard pipeline.
+     * @return False if the pass is unknown or cannot run on a function.
+     *         See last_error().
+     */
+    bool add_pass(const char name[]);
+
+    const char * last_error() const;
+
+    /**
+     * Add the passes to the pass manager.
+     */
+    void populate(llvm::FunctionPassManager & fpm) const;
+
+private:
+    int optlevel_;
+    bool vectorize_;
+    int unroll_threshold_;
+    int inline_threshold_;
+    std::vector<std::string> passes_;
+    std::string last_error_;
+};
+
 class JITEngine{
 public:
     JITEngine(std::string modname, int optlevel=3, bool vectorize=true);
@@ -141,6 +234,34 @@ public:
                                   llvm::Type *result,
                                   std::vector<llvm::Type*> params);
     const char * last_error() const;
+
+    /**
+     * Remove the function from the module.
+     * The function must not have been compiled to native code.
+     * All FunctionAdaptor to the function become invalid.
+     */
+    void delete_function(FunctionAdaptor fn);
+
+    /**
+     * Free the native code of a function and remove it from the module.
+     * All FunctionAdaptor to the function become invalid.
+     * @return False if the function is still used by other functions.
+     */
+    bool free_function(FunctionAdaptor fn);
+
+    /**
+     * @return Number of uses of the function by other code of the module,
+     *         e.g. call sites.
+     */
+    unsigned count_uses(FunctionAdaptor fn) const;
+
+    /**
+     * Declare an external global variable that is resolved by the JIT
+     * from the symbols of the process.
+     * @return Pointer to the global variable.
+     */
+    llvm::Value * declare_global(const char name[], llvm::Type * ty);
+
     /**
      * Verify the module.
      */
@@ -154,10 +275,94 @@ public:
      */
     void optimize_function(FunctionAdaptor fn) const;
 
+    /**
+     * Inline direct calls to functions defined in this module.
+     * @param threshold Only inline callees with at most this number of
+     *                  instructions. Negative inlines all.
+     * @return Number of inlined call sites.
+     */
+    unsigned inline_calls(FunctionAdaptor fn, int threshold=-1);
+
+    /**
+     * Optimize the function with the pipeline instead of the function
+     * passes of the module.
+     */
+    void run_pipeline(FunctionAdaptor fn, const PassPipeline & pipeline);
+
+    /**
+     * Infer the attributes of the functions of the module (e.g. readnone,
+     * readonly, nocapture) from their callees. The bodies of the
+     * functions are not changed.
+     */
+    void optimize_interprocedural();
+
     void * get_pointer_to_function(FunctionAdaptor fn);
 
+    /**
+     * Regenerate the native code of a function whose body has changed.
+     * Existing pointers to the old code remain valid; it jumps to the new
+     * code.
+     * @return Pointer to the new code, or NULL if the function has not
+     *         been compiled to native code yet.
+     */
+    void * recompile_function(FunctionAdaptor fn);
+
     std::string dump_asm(FunctionAdaptor fn);
 
+    /**
+     * @return Bitcode of a module containing the definition of the function
+     *         and declarations of everything it references.
+     */
+    std::string dump_bitcode(FunctionAdaptor fn);
+
+    /**
+     * Define the body of a declared function from bitcode produced by
+     * dump_bitcode().
+     * @return False on error. See last_error().
+     */
+    bool load_bitcode(FunctionAdaptor fn, std::string bitcode);
+
+    /**
+     * The internal functions defined along with the function by the last
+     * load_bitcode(), e.g. the outlined bodies of parallel loops.
+     */
+    unsigned loaded_helper_count() const;
+    FunctionAdaptor loaded_helper(unsigned i) const;
+
+    /**
+     * Write the native code of the whole module to a relocatable object
+     * file. The code is position independent for linking into a shared
+     * library.
+     * @param cpu Target CPU of the code. Empty uses the CPU of the JIT.
+     * @param features Target features, e.g. "+avx,-sse4a". Empty uses the
+     *                 features of the JIT if cpu is empty as well.
+     * @param symbol_suffix Appended to the names of the exported functions.
+     *                      Distinguishes the objects of different CPUs.
+     * @return False on error. See last_error().
+     */
+    bool emit_object(std::string path, std::string cpu="",
+                     std::string features="", std::string symbol_suffix="");
+
+    std::string target_triple() const;
+
+    static std::string host_cpu_name();
+
+    /**
+     * Select the CPU and the features (e.g. "+avx,-sse4a") of the native
+     * code. An empty CPU selects the host CPU, which is the default.
+     * @return False if the execution engine already exists; the target
+     *         cannot change after the first JITEngine is created.
+     */
+    static bool set_target(std::string cpu, std::string features);
+
+    static std::string target_cpu();
+    static std::string target_features();
+
+    /**
+     * @return Version of LLVM as 100 * major + minor, e.g. 301 for 3.1.
+     */
+    static int llvm_version();
+
     // Are these 3 functions necessary? Can I just use lock in ExecutionEngine?
     void start_multithreaded();
     void stop_multithreaded();
@@ -174,9 +379,12 @@ private:
 private:
     llvm::Module * module_;
     static llvm::ExecutionEngine * the_exec_engine_; //class-member singleton
+    static std::string target_cpu_;
+    static std::string target_features_;
     llvm::FunctionPassManager * fpm_; // run after function generation to reduce function in memory (as documented in LLVM)
     llvm::PassManager * mpm_;   // the primary pass manager
 
+    std::vector<llvm::Function*> loaded_helpers_; // see load_bitcode()
     std::string last_error_;
 };
 
@@ -193,6 +401,17 @@ public:
 
     llvm::BasicBlock * get_basic_block() const;
 
+    /**
+     * Tag the floating-point arithmetic created afterward with the
+     * FASTMATH_* flags. LLVM 3.2 and later use the fast-math flags of the
+     * instructions. Otherwise, the flags are kept as "pymothoa.fastmath"
+     * metadata. FASTMATH_REASSOC implies all the other flags since it maps
+     * to unsafe algebra. With FASTMATH_CONTRACT, fadd and fsub of a product
+     * emit llvm.fmuladd (LLVM 3.2 and later).
+     */
+    void set_fast_math(unsigned flags);
+    unsigned fast_math() const;
+
     llvm::Value * phi(llvm::Type * type, std::vector<llvm::BasicBlock*> in_blocks, std::vector<llvm::Value*> in_values, const char* name="");
 
     // intrinsic
@@ -272,30 +491,67 @@ public:
 
     void cond_branch(llvm::Value * Cond, llvm::BasicBlock * bb_true, llvm::BasicBlock * bb_false);
 
+    /**
+     * Conditional branch with "branch_weights" profile metadata. The weights
+     * are the relative frequencies of the two targets.
+     */
+    void cond_branch_weighted(llvm::Value * Cond, llvm::BasicBlock * bb_true, llvm::BasicBlock * bb_false, unsigned weight_true, unsigned weight_false);
+
     llvm::Value * call(FunctionAdaptor func, std::vector<llvm::Value*> args, const char * name="");
 
     void unreachable();
 
+    /**
+     * @return cond ? on_true : on_false. Selects by lane for a vector of
+     *         conditions.
+     */
+    llvm::Value * select(llvm::Value * cond, llvm::Value * on_true, llvm::Value * on_false, const char * name="");
+
     llvm::Value * alloc(llvm::Type * ty, const char * name="");
 
     llvm::Value * alloc_array(llvm::Type * ty, llvm::Value * ct, const char * name="");
 
     llvm::Value * load(llvm::Value * ptr, const char * name="");
 
+    /**
+     * Load with an explicit alignment in bytes, e.g. a vector from the
+     * address of an array element.
+     */
+    llvm::Value * load_aligned(llvm::Value * ptr, unsigned align, const char * name="");
+
     llvm::Value * store(llvm::Value * val, llvm::Value * ptr);
 
+    /**
+     * Store with an explicit alignment in bytes.
+     */
+    llvm::Value * store_aligned(llvm::Value * val, llvm::Value * ptr, unsigned align);
+
 
     // pointer
 
     llvm::Value * gep(llvm::Value * ptr, llvm::Value * idx, const char * name="");
     llvm::Value * gep2(llvm::Value * ptr, std::vector<llvm::Value*> indices, const char * name="");
 
+    llvm::Value * bitcast(llvm::Value * val, llvm::Type * ty, const char * name="");
+
+    /**
+     * @return i8* pointer to a null-terminated global string constant.
+     */
+    llvm::Value * global_string_ptr(const char value[], const char * name="");
+
     // vector function
 
     llvm::Value * extract_element(llvm::Value * vector, llvm::Value * idx, const char * name="");
 
     llvm::Value * insert_element(llvm::Value * vector, llvm::Value * newvalue, llvm::Value * idx, const char * name="");
 
+    /**
+     * @return Vector of the lanes of the concatenation of vector1 and
+     *         vector2 that are selected by mask. A negative index is an
+     *         undefined lane.
+     */
+    llvm::Value * shuffle(llvm::Value * vector1, llvm::Value * vector2, std::vector<int> mask, const char * name="");
+
     // helper
 
     /**
@@ -306,8 +562,13 @@ public:
 private:
     Builder(const Builder&);                //no impl
     Builder & operator = (const Builder&);    //no impl
+
+    llvm::Value * tag_fast_math(llvm::Value * value);
+    llvm::Value * contract(llvm::Value * lhs, llvm::Value * rhs,
+                           bool subtract, const char * name);
 private:
     llvm::IRBuilder<> builder_;
+    unsigned fast_math_;
 };
 
 //!swig-end
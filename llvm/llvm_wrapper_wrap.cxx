@@ -1,14 +1,18 @@
 /* ----------------------------------------------------------------------------
  * This file was automatically generated by SWIG (http://www.swig.org).
- * Version 2.0.4
- * 
- * This file is not intended to be easily readable and contains a number of 
+ * Version 3.0.12
+ *
+ * This file is not intended to be easily readable and contains a number of
  * coding conventions designed to improve portability and efficiency. Do not make
- * changes to this file unless you know what you are doing--modify the SWIG 
- * interface file instead. 
+ * changes to this file unless you know what you are doing--modify the SWIG
+ * interface file instead.
  * ----------------------------------------------------------------------------- */
 
+
+#ifndef SWIGPYTHON
 #define SWIGPYTHON
+#endif
+
 #define SWIG_PYTHON_DIRECTOR_NO_VTABLE
 
 
@@ -66,28 +70,28 @@ template <typename T> T SwigValueInit() {
 #ifndef SWIGUNUSED
 # if defined(__GNUC__)
 #   if !(defined(__cplusplus)) || (__GNUC__ > 3 || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4))
-#     define SWIGUNUSED __attribute__ ((__unused__)) 
+#     define SWIGUNUSED __attribute__ ((__unused__))
 #   else
 #     define SWIGUNUSED
 #   endif
 # elif defined(__ICC)
-#   define SWIGUNUSED __attribute__ ((__unused__)) 
+#   define SWIGUNUSED __attribute__ ((__unused__))
 # else
-#   define SWIGUNUSED 
+#   define SWIGUNUSED
 # endif
 #endif
 
 #ifndef SWIG_MSC_UNSUPPRESS_4505
 # if defined(_MSC_VER)
 #   pragma warning(disable : 4505) /* unreferenced local function has been removed */
-# endif 
+# endif
 #endif
 
 #ifndef SWIGUNUSEDPARM
 # ifdef __cplusplus
 #   define SWIGUNUSEDPARM(p)
 # else
-#   define SWIGUNUSEDPARM(p) p SWIGUNUSED 
+#   define SWIGUNUSEDPARM(p) p SWIGUNUSED
 # endif
 #endif
 
@@ -102,9 +106,11 @@ template <typename T> T SwigValueInit() {
 #endif
 
 /* exporting methods */
-#if (__GNUC__ >= 4) || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4)
-#  ifndef GCC_HASCLASSVISIBILITY
-#    define GCC_HASCLASSVISIBILITY
+#if defined(__GNUC__)
+#  if (__GNUC__ >= 4) || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4)
+#    ifndef GCC_HASCLASSVISIBILITY
+#      define GCC_HASCLASSVISIBILITY
+#    endif
 #  endif
 #endif
 
@@ -130,7 +136,7 @@ template <typename T> T SwigValueInit() {
 #   define SWIGSTDCALL __stdcall
 # else
 #   define SWIGSTDCALL
-# endif 
+# endif
 #endif
 
 /* Deal with Microsoft's attempt at deprecating C standard runtime functions */
@@ -143,10 +149,29 @@ template <typename T> T SwigValueInit() {
 # define _SCL_SECURE_NO_DEPRECATE
 #endif
 
+/* Deal with Apple's deprecated 'AssertMacros.h' from Carbon-framework */
+#if defined(__APPLE__) && !defined(__ASSERT_MACROS_DEFINE_VERSIONS_WITHOUT_UNDERSCORES)
+# define __ASSERT_MACROS_DEFINE_VERSIONS_WITHOUT_UNDERSCORES 0
+#endif
+
+/* Intel's compiler complains if a variable which was never initialised is
+ * cast to void, which is a common idiom which we use to indicate that we
+ * are aware a variable isn't used.  So we just silence that warning.
+ * See: https://github.com/swig/swig/issues/192 for more discussion.
+ */
+#ifdef __INTEL_COMPILER
+# pragma warning disable 592
+#endif
 
 
-/* Python.h has to appear first */
-#include <Python.h>
+#if defined(_DEBUG) && defined(SWIG_PYTHON_INTERPRETER_NO_DEBUG)
+/* Use debug wrappers with the Python release dll */
+# undef _DEBUG
+# include <Python.h>
+# define _DEBUG
+#else
+# include <Python.h>
+#endif
 
 /* -----------------------------------------------------------------------------
  * swigrun.swg
@@ -172,7 +197,7 @@ template <typename T> T SwigValueInit() {
   You can use the SWIGRUNTIME and SWIGRUNTIMEINLINE macros for
   creating a static or dynamic library from the SWIG runtime code.
   In 99.9% of the cases, SWIG just needs to declare them as 'static'.
-  
+
   But only do this if strictly necessary, ie, if you have problems
   with your compiler or suchlike.
 */
@@ -198,16 +223,16 @@ template <typename T> T SwigValueInit() {
 #define SWIG_POINTER_OWN           0x1
 
 
-/* 
+/*
    Flags/methods for returning states.
-   
-   The SWIG conversion methods, as ConvertPtr, return an integer 
+
+   The SWIG conversion methods, as ConvertPtr, return an integer
    that tells if the conversion was successful or not. And if not,
    an error code can be returned (see swigerrors.swg for the codes).
-   
+
    Use the following macros/flags to set or process the returning
    states.
-   
+
    In old versions of SWIG, code such as the following was usually written:
 
      if (SWIG_ConvertPtr(obj,vptr,ty.flags) != -1) {
@@ -240,23 +265,23 @@ template <typename T> T SwigValueInit() {
     } else {
       // fail code
     }
-    
+
    I.e., now SWIG_ConvertPtr can return new objects and you can
    identify the case and take care of the deallocation. Of course that
    also requires SWIG_ConvertPtr to return new result values, such as
 
-      int SWIG_ConvertPtr(obj, ptr,...) {         
-        if (<obj is ok>) {			       
-          if (<need new object>) {		       
-            *ptr = <ptr to new allocated object>; 
-            return SWIG_NEWOBJ;		       
-          } else {				       
-            *ptr = <ptr to old object>;	       
-            return SWIG_OLDOBJ;		       
-          } 				       
-        } else {				       
-          return SWIG_BADOBJ;		       
-        }					       
+      int SWIG_ConvertPtr(obj, ptr,...) {
+        if (<obj is ok>) {
+          if (<need new object>) {
+            *ptr = <ptr to new allocated object>;
+            return SWIG_NEWOBJ;
+          } else {
+            *ptr = <ptr to old object>;
+            return SWIG_OLDOBJ;
+          }
+        } else {
+          return SWIG_BADOBJ;
+        }
       }
 
    Of course, returning the plain '0(success)/-1(fail)' still works, but you can be
@@ -270,17 +295,17 @@ template <typename T> T SwigValueInit() {
        int fooi(int);
 
    and you call
- 
+
       food(1)   // cast rank '1'  (1 -> 1.0)
       fooi(1)   // cast rank '0'
 
    just use the SWIG_AddCast()/SWIG_CheckState()
 */
 
-#define SWIG_OK                    (0) 
+#define SWIG_OK                    (0)
 #define SWIG_ERROR                 (-1)
 #define SWIG_IsOK(r)               (r >= 0)
-#define SWIG_ArgError(r)           ((r != SWIG_ERROR) ? r : SWIG_TypeError)  
+#define SWIG_ArgError(r)           ((r != SWIG_ERROR) ? r : SWIG_TypeError)
 
 /* The CastRankLimit says how many bits are used for the cast rank */
 #define SWIG_CASTRANKLIMIT         (1 << 8)
@@ -311,14 +336,14 @@ template <typename T> T SwigValueInit() {
 #  endif
 #  define SWIG_CASTRANKMASK          ((SWIG_CASTRANKLIMIT) -1)
 #  define SWIG_CastRank(r)           (r & SWIG_CASTRANKMASK)
-SWIGINTERNINLINE int SWIG_AddCast(int r) { 
+SWIGINTERNINLINE int SWIG_AddCast(int r) {
   return SWIG_IsOK(r) ? ((SWIG_CastRank(r) < SWIG_MAXCASTRANK) ? (r + 1) : SWIG_ERROR) : r;
 }
-SWIGINTERNINLINE int SWIG_CheckState(int r) { 
-  return SWIG_IsOK(r) ? SWIG_CastRank(r) + 1 : 0; 
+SWIGINTERNINLINE int SWIG_CheckState(int r) {
+  return SWIG_IsOK(r) ? SWIG_CastRank(r) + 1 : 0;
 }
 #else /* no cast-rank mode */
-#  define SWIG_AddCast
+#  define SWIG_AddCast(r) (r)
 #  define SWIG_CheckState(r) (SWIG_IsOK(r) ? 1 : 0)
 #endif
 
@@ -362,7 +387,7 @@ typedef struct swig_module_info {
   void                    *clientdata;		/* Language specific module data */
 } swig_module_info;
 
-/* 
+/*
   Compare two type names skipping the space characters, therefore
   "char*" == "char *" and "Class<int>" == "Class<int >", etc.
 
@@ -382,18 +407,18 @@ SWIG_TypeNameComp(const char *f1, const char *l1,
 
 /*
   Check type equivalence in a name list like <name1>|<name2>|...
-  Return 0 if not equal, 1 if equal
+  Return 0 if equal, -1 if nb < tb, 1 if nb > tb
 */
 SWIGRUNTIME int
-SWIG_TypeEquiv(const char *nb, const char *tb) {
-  int equiv = 0;
+SWIG_TypeCmp(const char *nb, const char *tb) {
+  int equiv = 1;
   const char* te = tb + strlen(tb);
   const char* ne = nb;
-  while (!equiv && *ne) {
+  while (equiv != 0 && *ne) {
     for (nb = ne; *ne; ++ne) {
       if (*ne == '|') break;
     }
-    equiv = (SWIG_TypeNameComp(nb, ne, tb, te) == 0) ? 1 : 0;
+    equiv = SWIG_TypeNameComp(nb, ne, tb, te);
     if (*ne) ++ne;
   }
   return equiv;
@@ -401,24 +426,13 @@ SWIG_TypeEquiv(const char *nb, const char *tb) {
 
 /*
   Check type equivalence in a name list like <name1>|<name2>|...
-  Return 0 if equal, -1 if nb < tb, 1 if nb > tb
+  Return 0 if not equal, 1 if equal
 */
 SWIGRUNTIME int
-SWIG_TypeCompare(const char *nb, const char *tb) {
-  int equiv = 0;
-  const char* te = tb + strlen(tb);
-  const char* ne = nb;
-  while (!equiv && *ne) {
-    for (nb = ne; *ne; ++ne) {
-      if (*ne == '|') break;
-    }
-    equiv = (SWIG_TypeNameComp(nb, ne, tb, te) == 0) ? 1 : 0;
-    if (*ne) ++ne;
-  }
-  return equiv;
+SWIG_TypeEquiv(const char *nb, const char *tb) {
+  return SWIG_TypeCmp(nb, tb) == 0 ? 1 : 0;
 }
 
-
 /*
   Check the typename
 */
@@ -446,7 +460,7 @@ SWIG_TypeCheck(const char *c, swig_type_info *ty) {
   return 0;
 }
 
-/* 
+/*
   Identical to SWIG_TypeCheck, except strcmp is replaced with a pointer comparison
 */
 SWIGRUNTIME swig_cast_info *
@@ -481,7 +495,7 @@ SWIG_TypeCast(swig_cast_info *ty, void *ptr, int *newmemory) {
   return ((!ty) || (!ty->converter)) ? ptr : (*ty->converter)(ptr, newmemory);
 }
 
-/* 
+/*
    Dynamic pointer casting. Down an inheritance hierarchy
 */
 SWIGRUNTIME swig_type_info *
@@ -525,7 +539,7 @@ SWIG_TypePrettyName(const swig_type_info *type) {
     return type->name;
 }
 
-/* 
+/*
    Set the clientdata field for a type
 */
 SWIGRUNTIME void
@@ -533,14 +547,14 @@ SWIG_TypeClientData(swig_type_info *ti, void *clientdata) {
   swig_cast_info *cast = ti->cast;
   /* if (ti->clientdata == clientdata) return; */
   ti->clientdata = clientdata;
-  
+
   while (cast) {
     if (!cast->converter) {
       swig_type_info *tc = cast->type;
       if (!tc->clientdata) {
 	SWIG_TypeClientData(tc, clientdata);
       }
-    }    
+    }
     cast = cast->next;
   }
 }
@@ -549,31 +563,31 @@ SWIG_TypeNewClientData(swig_type_info *ti, void *clientdata) {
   SWIG_TypeClientData(ti, clientdata);
   ti->owndata = 1;
 }
-  
+
 /*
   Search for a swig_type_info structure only by mangled name
   Search is a O(log #types)
-  
-  We start searching at module start, and finish searching when start == end.  
+
+  We start searching at module start, and finish searching when start == end.
   Note: if start == end at the beginning of the function, we go all the way around
   the circular list.
 */
 SWIGRUNTIME swig_type_info *
-SWIG_MangledTypeQueryModule(swig_module_info *start, 
-                            swig_module_info *end, 
+SWIG_MangledTypeQueryModule(swig_module_info *start,
+                            swig_module_info *end,
 		            const char *name) {
   swig_module_info *iter = start;
   do {
     if (iter->size) {
-      register size_t l = 0;
-      register size_t r = iter->size - 1;
+      size_t l = 0;
+      size_t r = iter->size - 1;
       do {
 	/* since l+r >= 0, we can (>> 1) instead (/ 2) */
-	register size_t i = (l + r) >> 1; 
+	size_t i = (l + r) >> 1;
 	const char *iname = iter->types[i]->name;
 	if (iname) {
-	  register int compare = strcmp(name, iname);
-	  if (compare == 0) {	    
+	  int compare = strcmp(name, iname);
+	  if (compare == 0) {
 	    return iter->types[i];
 	  } else if (compare < 0) {
 	    if (i) {
@@ -598,14 +612,14 @@ SWIG_MangledTypeQueryModule(swig_module_info *start,
   Search for a swig_type_info structure for either a mangled name or a human readable name.
   It first searches the mangled names of the types, which is a O(log #types)
   If a type is not found it then searches the human readable names, which is O(#types).
-  
-  We start searching at module start, and finish searching when start == end.  
+
+  We start searching at module start, and finish searching when start == end.
   Note: if start == end at the beginning of the function, we go all the way around
   the circular list.
 */
 SWIGRUNTIME swig_type_info *
-SWIG_TypeQueryModule(swig_module_info *start, 
-                     swig_module_info *end, 
+SWIG_TypeQueryModule(swig_module_info *start,
+                     swig_module_info *end,
 		     const char *name) {
   /* STEP 1: Search the name field using binary search */
   swig_type_info *ret = SWIG_MangledTypeQueryModule(start, end, name);
@@ -616,7 +630,7 @@ SWIG_TypeQueryModule(swig_module_info *start,
        of the str field (the human readable name) */
     swig_module_info *iter = start;
     do {
-      register size_t i = 0;
+      size_t i = 0;
       for (; i < iter->size; ++i) {
 	if (iter->types[i]->str && (SWIG_TypeEquiv(iter->types[i]->str, name)))
 	  return iter->types[i];
@@ -624,56 +638,56 @@ SWIG_TypeQueryModule(swig_module_info *start,
       iter = iter->next;
     } while (iter != end);
   }
-  
+
   /* neither found a match */
   return 0;
 }
 
-/* 
+/*
    Pack binary data into a string
 */
 SWIGRUNTIME char *
 SWIG_PackData(char *c, void *ptr, size_t sz) {
   static const char hex[17] = "0123456789abcdef";
-  register const unsigned char *u = (unsigned char *) ptr;
-  register const unsigned char *eu =  u + sz;
+  const unsigned char *u = (unsigned char *) ptr;
+  const unsigned char *eu =  u + sz;
   for (; u != eu; ++u) {
-    register unsigned char uu = *u;
+    unsigned char uu = *u;
     *(c++) = hex[(uu & 0xf0) >> 4];
     *(c++) = hex[uu & 0xf];
   }
   return c;
 }
 
-/* 
+/*
    Unpack binary data from a string
 */
 SWIGRUNTIME const char *
 SWIG_UnpackData(const char *c, void *ptr, size_t sz) {
-  register unsigned char *u = (unsigned char *) ptr;
-  register const unsigned char *eu = u + sz;
+  unsigned char *u = (unsigned char *) ptr;
+  const unsigned char *eu = u + sz;
   for (; u != eu; ++u) {
-    register char d = *(c++);
-    register unsigned char uu;
+    char d = *(c++);
+    unsigned char uu;
     if ((d >= '0') && (d <= '9'))
-      uu = ((d - '0') << 4);
+      uu = (unsigned char)((d - '0') << 4);
     else if ((d >= 'a') && (d <= 'f'))
-      uu = ((d - ('a'-10)) << 4);
-    else 
+      uu = (unsigned char)((d - ('a'-10)) << 4);
+    else
       return (char *) 0;
     d = *(c++);
     if ((d >= '0') && (d <= '9'))
-      uu |= (d - '0');
+      uu |= (unsigned char)(d - '0');
     else if ((d >= 'a') && (d <= 'f'))
-      uu |= (d - ('a'-10));
-    else 
+      uu |= (unsigned char)(d - ('a'-10));
+    else
       return (char *) 0;
     *u = uu;
   }
   return c;
 }
 
-/* 
+/*
    Pack 'void *' into a string buffer.
 */
 SWIGRUNTIME char *
@@ -733,18 +747,18 @@ SWIG_UnpackDataName(const char *c, void *ptr, size_t sz, const char *name) {
 #endif
 
 /*  Errors in SWIG */
-#define  SWIG_UnknownError    	   -1 
-#define  SWIG_IOError        	   -2 
-#define  SWIG_RuntimeError   	   -3 
-#define  SWIG_IndexError     	   -4 
-#define  SWIG_TypeError      	   -5 
-#define  SWIG_DivisionByZero 	   -6 
-#define  SWIG_OverflowError  	   -7 
-#define  SWIG_SyntaxError    	   -8 
-#define  SWIG_ValueError     	   -9 
+#define  SWIG_UnknownError    	   -1
+#define  SWIG_IOError        	   -2
+#define  SWIG_RuntimeError   	   -3
+#define  SWIG_IndexError     	   -4
+#define  SWIG_TypeError      	   -5
+#define  SWIG_DivisionByZero 	   -6
+#define  SWIG_OverflowError  	   -7
+#define  SWIG_SyntaxError    	   -8
+#define  SWIG_ValueError     	   -9
 #define  SWIG_SystemError    	   -10
 #define  SWIG_AttributeError 	   -11
-#define  SWIG_MemoryError    	   -12 
+#define  SWIG_MemoryError    	   -12
 #define  SWIG_NullReferenceError   -13
 
 
@@ -756,6 +770,7 @@ SWIG_UnpackDataName(const char *c, void *ptr, size_t sz, const char *name) {
 #define PyInt_Check(x) PyLong_Check(x)
 #define PyInt_AsLong(x) PyLong_AsLong(x)
 #define PyInt_FromLong(x) PyLong_FromLong(x)
+#define PyInt_FromSize_t(x) PyLong_FromSize_t(x)
 #define PyString_Check(name) PyBytes_Check(name)
 #define PyString_FromString(x) PyUnicode_FromString(x)
 #define PyString_Format(fmt, args)  PyUnicode_Format(fmt, args)
@@ -847,10 +862,6 @@ PyString_FromFormat(const char *fmt, ...) {
 }
 #endif
 
-/* Add PyObject_Del for old Pythons */
-#if PY_VERSION_HEX < 0x01060000
-# define PyObject_Del(op) PyMem_DEL((op))
-#endif
 #ifndef PyObject_DEL
 # define PyObject_DEL PyObject_Del
 #endif
@@ -925,6 +936,10 @@ static long PyNumber_AsSsize_t (PyObject *x, void *SWIGUNUSEDPARM(exc))
 }
 #endif
 
+#if PY_VERSION_HEX < 0x02050000
+#define PyInt_FromSize_t(x) PyInt_FromLong((long)x)
+#endif
+
 #if PY_VERSION_HEX < 0x02040000
 #define Py_VISIT(op)				\
   do { 						\
@@ -961,6 +976,7 @@ typedef destructor freefunc;
 #if PY_VERSION_HEX < 0x03020000
 #define PyDescr_TYPE(x) (((PyDescrObject *)(x))->d_type)
 #define PyDescr_NAME(x) (((PyDescrObject *)(x))->d_name)
+#define Py_hash_t long
 #endif
 
 /* -----------------------------------------------------------------------------
@@ -1196,7 +1212,7 @@ SWIGRUNTIME PyObject* SWIG_PyInstanceMethod_New(PyObject *SWIGUNUSEDPARM(self),
 
 /* Runtime API */
 
-#define SWIG_GetModule(clientdata)                      SWIG_Python_GetModule()
+#define SWIG_GetModule(clientdata)                      SWIG_Python_GetModule(clientdata)
 #define SWIG_SetModule(clientdata, pointer)             SWIG_Python_SetModule(pointer)
 #define SWIG_NewClientData(obj)                         SwigPyClientData_New(obj)
 
@@ -1222,7 +1238,7 @@ SWIG_Python_SetErrorObj(PyObject *errtype, PyObject *obj) {
 SWIGINTERN void 
 SWIG_Python_SetErrorMsg(PyObject *errtype, const char *msg) {
   SWIG_PYTHON_THREAD_BEGIN_BLOCK;
-  PyErr_SetString(errtype, (char *) msg);
+  PyErr_SetString(errtype, msg);
   SWIG_PYTHON_THREAD_END_BLOCK;
 }
 
@@ -1241,7 +1257,11 @@ SwigPyBuiltin_AddPublicSymbol(PyObject *seq, const char *key) {
 
 SWIGINTERN void
 SWIG_Python_SetConstant(PyObject *d, PyObject *public_interface, const char *name, PyObject *obj) {   
+#if PY_VERSION_HEX < 0x02030000
   PyDict_SetItemString(d, (char *)name, obj);
+#else
+  PyDict_SetItemString(d, name, obj);
+#endif
   Py_DECREF(obj);
   if (public_interface)
     SwigPyBuiltin_AddPublicSymbol(public_interface, name);
@@ -1251,7 +1271,11 @@ SWIG_Python_SetConstant(PyObject *d, PyObject *public_interface, const char *nam
 
 SWIGINTERN void
 SWIG_Python_SetConstant(PyObject *d, const char *name, PyObject *obj) {   
+#if PY_VERSION_HEX < 0x02030000
   PyDict_SetItemString(d, (char *)name, obj);
+#else
+  PyDict_SetItemString(d, name, obj);
+#endif
   Py_DECREF(obj);                            
 }
 
@@ -1304,7 +1328,7 @@ SWIG_Python_AppendOutput(PyObject* result, PyObject* obj) {
 
 /* Unpack the argument tuple */
 
-SWIGINTERN int
+SWIGINTERN Py_ssize_t
 SWIG_Python_UnpackTuple(PyObject *args, const char *name, Py_ssize_t min, Py_ssize_t max, PyObject **objs)
 {
   if (!args) {
@@ -1318,7 +1342,7 @@ SWIG_Python_UnpackTuple(PyObject *args, const char *name, Py_ssize_t min, Py_ssi
   }  
   if (!PyTuple_Check(args)) {
     if (min <= 1 && max >= 1) {
-      register int i;
+      Py_ssize_t i;
       objs[0] = args;
       for (i = 1; i < max; ++i) {
 	objs[i] = 0;
@@ -1328,7 +1352,7 @@ SWIG_Python_UnpackTuple(PyObject *args, const char *name, Py_ssize_t min, Py_ssi
     PyErr_SetString(PyExc_SystemError, "UnpackTuple() argument list is not a tuple");
     return 0;
   } else {
-    register Py_ssize_t l = PyTuple_GET_SIZE(args);
+    Py_ssize_t l = PyTuple_GET_SIZE(args);
     if (l < min) {
       PyErr_Format(PyExc_TypeError, "%s expected %s%d arguments, got %d", 
 		   name, (min == max ? "" : "at least "), (int)min, (int)l);
@@ -1338,7 +1362,7 @@ SWIG_Python_UnpackTuple(PyObject *args, const char *name, Py_ssize_t min, Py_ssi
 		   name, (min == max ? "" : "at most "), (int)max, (int)l);
       return 0;
     } else {
-      register int i;
+      Py_ssize_t i;
       for (i = 0; i < l; ++i) {
 	objs[i] = PyTuple_GET_ITEM(args, i);
       }
@@ -1524,6 +1548,23 @@ typedef struct {
 #endif
 } SwigPyObject;
 
+
+#ifdef SWIGPYTHON_BUILTIN
+
+SWIGRUNTIME PyObject *
+SwigPyObject_get___dict__(PyObject *v, PyObject *SWIGUNUSEDPARM(args))
+{
+  SwigPyObject *sobj = (SwigPyObject *)v;
+
+  if (!sobj->dict)
+    sobj->dict = PyDict_New();
+
+  Py_INCREF(sobj->dict);
+  return sobj->dict;
+}
+
+#endif
+
 SWIGRUNTIME PyObject *
 SwigPyObject_long(SwigPyObject *v)
 {
@@ -1572,7 +1613,7 @@ SwigPyObject_repr(SwigPyObject *v, PyObject *args)
 #endif
 {
   const char *name = SWIG_TypePrettyName(v->ty);
-  PyObject *repr = SWIG_Python_str_FromFormat("<Swig Object of type '%s' at %p>", name, (void *)v);
+  PyObject *repr = SWIG_Python_str_FromFormat("<Swig Object of type '%s' at %p>", (name ? name : "unknown"), (void *)v);
   if (v->next) {
 # ifdef METH_NOARGS
     PyObject *nrep = SwigPyObject_repr((SwigPyObject *)v->next);
@@ -1591,34 +1632,6 @@ SwigPyObject_repr(SwigPyObject *v, PyObject *args)
   return repr;  
 }
 
-SWIGRUNTIME int
-SwigPyObject_print(SwigPyObject *v, FILE *fp, int SWIGUNUSEDPARM(flags))
-{
-  char *str;
-#ifdef METH_NOARGS
-  PyObject *repr = SwigPyObject_repr(v);
-#else
-  PyObject *repr = SwigPyObject_repr(v, NULL);
-#endif
-  if (repr) {
-    str = SWIG_Python_str_AsChar(repr); 
-    fputs(str, fp);
-    SWIG_Python_str_DelForPy3(str);
-    Py_DECREF(repr);
-    return 0; 
-  } else {
-    return 1; 
-  }
-}
-
-SWIGRUNTIME PyObject *
-SwigPyObject_str(SwigPyObject *v)
-{
-  char result[SWIG_BUFFER_SIZE];
-  return SWIG_PackVoidPtr(result, v->ptr, v->ty->name, sizeof(result)) ?
-    SWIG_Python_str_FromChar(result) : 0;
-}
-
 SWIGRUNTIME int
 SwigPyObject_compare(SwigPyObject *v, SwigPyObject *w)
 {
@@ -1690,16 +1703,32 @@ SwigPyObject_dealloc(PyObject *v)
     if (destroy) {
       /* destroy is always a VARARGS method */
       PyObject *res;
+
+      /* PyObject_CallFunction() has the potential to silently drop
+         the active active exception.  In cases of unnamed temporary
+         variable or where we just finished iterating over a generator
+         StopIteration will be active right now, and this needs to
+         remain true upon return from SwigPyObject_dealloc.  So save
+         and restore. */
+      
+      PyObject *val = NULL, *type = NULL, *tb = NULL;
+      PyErr_Fetch(&val, &type, &tb);
+
       if (data->delargs) {
-	/* we need to create a temporary object to carry the destroy operation */
-	PyObject *tmp = SwigPyObject_New(sobj->ptr, ty, 0);
-	res = SWIG_Python_CallFunctor(destroy, tmp);
-	Py_DECREF(tmp);
+        /* we need to create a temporary object to carry the destroy operation */
+        PyObject *tmp = SwigPyObject_New(sobj->ptr, ty, 0);
+        res = SWIG_Python_CallFunctor(destroy, tmp);
+        Py_DECREF(tmp);
       } else {
-	PyCFunction meth = PyCFunction_GET_FUNCTION(destroy);
-	PyObject *mself = PyCFunction_GET_SELF(destroy);
-	res = ((*meth)(mself, v));
+        PyCFunction meth = PyCFunction_GET_FUNCTION(destroy);
+        PyObject *mself = PyCFunction_GET_SELF(destroy);
+        res = ((*meth)(mself, v));
       }
+      if (!res)
+        PyErr_WriteUnraisable(destroy);
+
+      PyErr_Restore(val, type, tb);
+
       Py_XDECREF(res);
     } 
 #if !defined(SWIG_PYTHON_SILENT_MEMLEAK)
@@ -1723,6 +1752,7 @@ SwigPyObject_append(PyObject* v, PyObject* next)
   next = tmp;
 #endif
   if (!SwigPyObject_Check(next)) {
+    PyErr_SetString(PyExc_TypeError, "Attempt to append a non SwigPyObject");
     return NULL;
   }
   sobj->next = next;
@@ -1776,8 +1806,10 @@ SwigPyObject_own(PyObject *v, PyObject *args)
   PyObject *val = 0;
 #if (PY_VERSION_HEX < 0x02020000)
   if (!PyArg_ParseTuple(args,(char *)"|O:own",&val))
-#else
+#elif (PY_VERSION_HEX < 0x02050000)
   if (!PyArg_UnpackTuple(args, (char *)"own", 0, 1, &val)) 
+#else
+  if (!PyArg_UnpackTuple(args, "own", 0, 1, &val)) 
 #endif
     {
       return NULL;
@@ -1809,7 +1841,7 @@ SwigPyObject_own(PyObject *v, PyObject *args)
 static PyMethodDef
 swigobject_methods[] = {
   {(char *)"disown",  (PyCFunction)SwigPyObject_disown,  METH_NOARGS,  (char *)"releases ownership of the pointer"},
-  {(char *)"acquire", (PyCFunction)SwigPyObject_acquire, METH_NOARGS,  (char *)"aquires ownership of the pointer"},
+  {(char *)"acquire", (PyCFunction)SwigPyObject_acquire, METH_NOARGS,  (char *)"acquires ownership of the pointer"},
   {(char *)"own",     (PyCFunction)SwigPyObject_own,     METH_VARARGS, (char *)"returns/sets ownership of the pointer"},
   {(char *)"append",  (PyCFunction)SwigPyObject_append,  METH_O,       (char *)"appends another 'this' object"},
   {(char *)"next",    (PyCFunction)SwigPyObject_next,    METH_NOARGS,  (char *)"returns the next 'this' object"},
@@ -1820,7 +1852,7 @@ swigobject_methods[] = {
 static PyMethodDef
 swigobject_methods[] = {
   {(char *)"disown",  (PyCFunction)SwigPyObject_disown,  METH_VARARGS,  (char *)"releases ownership of the pointer"},
-  {(char *)"acquire", (PyCFunction)SwigPyObject_acquire, METH_VARARGS,  (char *)"aquires ownership of the pointer"},
+  {(char *)"acquire", (PyCFunction)SwigPyObject_acquire, METH_VARARGS,  (char *)"acquires ownership of the pointer"},
   {(char *)"own",     (PyCFunction)SwigPyObject_own,     METH_VARARGS,  (char *)"returns/sets ownership of the pointer"},
   {(char *)"append",  (PyCFunction)SwigPyObject_append,  METH_VARARGS,  (char *)"appends another 'this' object"},
   {(char *)"next",    (PyCFunction)SwigPyObject_next,    METH_VARARGS,  (char *)"returns the next 'this' object"},
@@ -1876,7 +1908,9 @@ SwigPyObject_TypeOnce(void) {
     (unaryfunc)SwigPyObject_oct,  /*nb_oct*/
     (unaryfunc)SwigPyObject_hex,  /*nb_hex*/
 #endif
-#if PY_VERSION_HEX >= 0x03000000 /* 3.0 */
+#if PY_VERSION_HEX >= 0x03050000 /* 3.5 */
+    0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0 /* nb_inplace_add -> nb_inplace_matrix_multiply */
+#elif PY_VERSION_HEX >= 0x03000000 /* 3.0 */
     0,0,0,0,0,0,0,0,0,0,0,0,0,0,0 /* nb_inplace_add -> nb_index, nb_inplace_divide removed */
 #elif PY_VERSION_HEX >= 0x02050000 /* 2.5.0 */
     0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0 /* nb_inplace_add -> nb_index */
@@ -1891,7 +1925,6 @@ SwigPyObject_TypeOnce(void) {
   static int type_init = 0;
   if (!type_init) {
     const PyTypeObject tmp = {
-      /* PyObject header changed in Python 3 */
 #if PY_VERSION_HEX >= 0x03000000
       PyVarObject_HEAD_INIT(NULL, 0)
 #else
@@ -1902,7 +1935,7 @@ SwigPyObject_TypeOnce(void) {
       sizeof(SwigPyObject),                 /* tp_basicsize */
       0,                                    /* tp_itemsize */
       (destructor)SwigPyObject_dealloc,     /* tp_dealloc */
-      (printfunc)SwigPyObject_print,        /* tp_print */
+      0,                                    /* tp_print */
 #if PY_VERSION_HEX < 0x02020000
       (getattrfunc)SwigPyObject_getattr,    /* tp_getattr */
 #else
@@ -1910,7 +1943,7 @@ SwigPyObject_TypeOnce(void) {
 #endif
       (setattrfunc)0,                       /* tp_setattr */
 #if PY_VERSION_HEX >= 0x03000000
-    0, /* tp_reserved in 3.0.1, tp_compare in 3.0.0 but not used */
+      0, /* tp_reserved in 3.0.1, tp_compare in 3.0.0 but not used */
 #else
       (cmpfunc)SwigPyObject_compare,        /* tp_compare */
 #endif
@@ -1920,7 +1953,7 @@ SwigPyObject_TypeOnce(void) {
       0,                                    /* tp_as_mapping */
       (hashfunc)0,                          /* tp_hash */
       (ternaryfunc)0,                       /* tp_call */
-      (reprfunc)SwigPyObject_str,           /* tp_str */
+      0,                                    /* tp_str */
       PyObject_GenericGetAttr,              /* tp_getattro */
       0,                                    /* tp_setattro */
       0,                                    /* tp_as_buffer */
@@ -1956,10 +1989,19 @@ SwigPyObject_TypeOnce(void) {
       0,                                    /* tp_del */
 #endif
 #if PY_VERSION_HEX >= 0x02060000
-      0,                                    /* tp_version */
+      0,                                    /* tp_version_tag */
+#endif
+#if PY_VERSION_HEX >= 0x03040000
+      0,                                    /* tp_finalize */
 #endif
 #ifdef COUNT_ALLOCS
-      0,0,0,0                               /* tp_alloc -> tp_next */
+      0,                                    /* tp_allocs */
+      0,                                    /* tp_frees */
+      0,                                    /* tp_maxalloc */
+#if PY_VERSION_HEX >= 0x02050000
+      0,                                    /* tp_prev */
+#endif
+      0                                     /* tp_next */
 #endif
     };
     swigpyobject_type = tmp;
@@ -2074,7 +2116,6 @@ SwigPyPacked_TypeOnce(void) {
   static int type_init = 0;
   if (!type_init) {
     const PyTypeObject tmp = {
-      /* PyObject header changed in Python 3 */
 #if PY_VERSION_HEX>=0x03000000
       PyVarObject_HEAD_INIT(NULL, 0)
 #else
@@ -2135,10 +2176,19 @@ SwigPyPacked_TypeOnce(void) {
       0,                                    /* tp_del */
 #endif
 #if PY_VERSION_HEX >= 0x02060000
-      0,                                    /* tp_version */
+      0,                                    /* tp_version_tag */
+#endif
+#if PY_VERSION_HEX >= 0x03040000
+      0,                                    /* tp_finalize */
 #endif
 #ifdef COUNT_ALLOCS
-      0,0,0,0                               /* tp_alloc -> tp_next */
+      0,                                    /* tp_allocs */
+      0,                                    /* tp_frees */
+      0,                                    /* tp_maxalloc */
+#if PY_VERSION_HEX >= 0x02050000
+      0,                                    /* tp_prev */
+#endif
+      0                                     /* tp_next */
 #endif
     };
     swigpypacked_type = tmp;
@@ -2297,10 +2347,11 @@ SWIGRUNTIME int
 SWIG_Python_ConvertPtrAndOwn(PyObject *obj, void **ptr, swig_type_info *ty, int flags, int *own) {
   int res;
   SwigPyObject *sobj;
+  int implicit_conv = (flags & SWIG_POINTER_IMPLICIT_CONV) != 0;
 
   if (!obj)
     return SWIG_ERROR;
-  if (obj == Py_None) {
+  if (obj == Py_None && !implicit_conv) {
     if (ptr)
       *ptr = 0;
     return SWIG_OK;
@@ -2349,7 +2400,7 @@ SWIG_Python_ConvertPtrAndOwn(PyObject *obj, void **ptr, swig_type_info *ty, int
     }
     res = SWIG_OK;
   } else {
-    if (flags & SWIG_POINTER_IMPLICIT_CONV) {
+    if (implicit_conv) {
       SwigPyClientData *data = ty ? (SwigPyClientData *) ty->clientdata : 0;
       if (data && !data->implicitconv) {
         PyObject *klass = data->klass;
@@ -2384,6 +2435,13 @@ SWIG_Python_ConvertPtrAndOwn(PyObject *obj, void **ptr, swig_type_info *ty, int
         }
       }
     }
+    if (!SWIG_IsOK(res) && obj == Py_None) {
+      if (ptr)
+        *ptr = 0;
+      if (PyErr_Occurred())
+        PyErr_Clear();
+      res = SWIG_OK;
+    }
   }
   return res;
 }
@@ -2471,24 +2529,30 @@ SWIG_Python_NewShadowInstance(SwigPyClientData *data, PyObject *swig_this)
     }
   } else {
 #if PY_VERSION_HEX >= 0x03000000
-    inst = PyBaseObject_Type.tp_new((PyTypeObject*) data->newargs, Py_None, Py_None);
-    PyObject_SetAttr(inst, SWIG_This(), swig_this);
-    Py_TYPE(inst)->tp_flags &= ~Py_TPFLAGS_VALID_VERSION_TAG;
+    inst = ((PyTypeObject*) data->newargs)->tp_new((PyTypeObject*) data->newargs, Py_None, Py_None);
+    if (inst) {
+      PyObject_SetAttr(inst, SWIG_This(), swig_this);
+      Py_TYPE(inst)->tp_flags &= ~Py_TPFLAGS_VALID_VERSION_TAG;
+    }
 #else
     PyObject *dict = PyDict_New();
-    PyDict_SetItem(dict, SWIG_This(), swig_this);
-    inst = PyInstance_NewRaw(data->newargs, dict);
-    Py_DECREF(dict);
+    if (dict) {
+      PyDict_SetItem(dict, SWIG_This(), swig_this);
+      inst = PyInstance_NewRaw(data->newargs, dict);
+      Py_DECREF(dict);
+    }
 #endif
   }
   return inst;
 #else
 #if (PY_VERSION_HEX >= 0x02010000)
-  PyObject *inst;
+  PyObject *inst = 0;
   PyObject *dict = PyDict_New();
-  PyDict_SetItem(dict, SWIG_This(), swig_this);
-  inst = PyInstance_NewRaw(data->newargs, dict);
-  Py_DECREF(dict);
+  if (dict) {
+    PyDict_SetItem(dict, SWIG_This(), swig_this);
+    inst = PyInstance_NewRaw(data->newargs, dict);
+    Py_DECREF(dict);
+  }
   return (PyObject *) inst;
 #else
   PyInstanceObject *inst = PyObject_NEW(PyInstanceObject, &PyInstance_Type);
@@ -2539,7 +2603,7 @@ SWIG_Python_SetSwigThis(PyObject *inst, PyObject *swig_this)
 SWIGINTERN PyObject *
 SWIG_Python_InitShadowInstance(PyObject *args) {
   PyObject *obj[2];
-  if (!SWIG_Python_UnpackTuple(args,(char*)"swiginit", 2, 2, obj)) {
+  if (!SWIG_Python_UnpackTuple(args, "swiginit", 2, 2, obj)) {
     return NULL;
   } else {
     SwigPyObject *sthis = SWIG_Python_GetSwigThis(obj[0]);
@@ -2575,18 +2639,21 @@ SWIG_Python_NewPointerObj(PyObject *self, void *ptr, swig_type_info *type, int f
 	  newobj = (SwigPyObject *) newobj->next;
         newobj->next = next_self;
         newobj = (SwigPyObject *)next_self;
+#ifdef SWIGPYTHON_BUILTIN
+        newobj->dict = 0;
+#endif
       }
     } else {
       newobj = PyObject_New(SwigPyObject, clientdata->pytype);
+#ifdef SWIGPYTHON_BUILTIN
+      newobj->dict = 0;
+#endif
     }
     if (newobj) {
       newobj->ptr = ptr;
       newobj->ty = type;
       newobj->own = own;
       newobj->next = 0;
-#ifdef SWIGPYTHON_BUILTIN
-      newobj->dict = 0;
-#endif
       return (PyObject*) newobj;
     }
     return SWIG_Py_Void();
@@ -2595,12 +2662,10 @@ SWIG_Python_NewPointerObj(PyObject *self, void *ptr, swig_type_info *type, int f
   assert(!(flags & SWIG_BUILTIN_TP_INIT));
 
   robj = SwigPyObject_New(ptr, type, own);
-  if (clientdata && !(flags & SWIG_POINTER_NOSHADOW)) {
+  if (robj && clientdata && !(flags & SWIG_POINTER_NOSHADOW)) {
     PyObject *inst = SWIG_Python_NewShadowInstance(clientdata, robj);
-    if (inst) {
-      Py_DECREF(robj);
-      robj = inst;
-    }
+    Py_DECREF(robj);
+    robj = inst;
   }
   return robj;
 }
@@ -2621,7 +2686,7 @@ void *SWIG_ReturnGlobalTypeList(void *);
 #endif
 
 SWIGRUNTIME swig_module_info *
-SWIG_Python_GetModule(void) {
+SWIG_Python_GetModule(void *SWIGUNUSEDPARM(clientdata)) {
   static void *type_pointer = (void *)0;
   /* first check if module already created */
   if (!type_pointer) {
@@ -2651,13 +2716,11 @@ PyModule_AddObject(PyObject *m, char *name, PyObject *o)
 {
   PyObject *dict;
   if (!PyModule_Check(m)) {
-    PyErr_SetString(PyExc_TypeError,
-		    "PyModule_AddObject() needs module as first arg");
+    PyErr_SetString(PyExc_TypeError, "PyModule_AddObject() needs module as first arg");
     return SWIG_ERROR;
   }
   if (!o) {
-    PyErr_SetString(PyExc_TypeError,
-		    "PyModule_AddObject() needs non-NULL value");
+    PyErr_SetString(PyExc_TypeError, "PyModule_AddObject() needs non-NULL value");
     return SWIG_ERROR;
   }
   
@@ -2747,7 +2810,7 @@ SWIG_Python_TypeQuery(const char *type)
     descriptor = (swig_type_info *) PyCObject_AsVoidPtr(obj);
 #endif
   } else {
-    swig_module_info *swig_module = SWIG_Python_GetModule();
+    swig_module_info *swig_module = SWIG_GetModule(0);
     descriptor = SWIG_TypeQueryModule(swig_module, swig_module, type);
     if (descriptor) {
 #ifdef SWIGPY_USE_CAPSULE
@@ -2815,7 +2878,7 @@ SwigPyObject_GetDesc(PyObject *self)
 {
   SwigPyObject *v = (SwigPyObject *)self;
   swig_type_info *ty = v ? v->ty : 0;
-  return ty ? ty->str : (char*)"";
+  return ty ? ty->str : "";
 }
 
 SWIGRUNTIME void
@@ -2872,23 +2935,24 @@ SWIG_Python_MustGetPtr(PyObject *obj, swig_type_info *ty, int SWIGUNUSEDPARM(arg
   return result;
 }
 
+#ifdef SWIGPYTHON_BUILTIN
 SWIGRUNTIME int
 SWIG_Python_NonDynamicSetAttr(PyObject *obj, PyObject *name, PyObject *value) {
   PyTypeObject *tp = obj->ob_type;
   PyObject *descr;
   PyObject *encoded_name;
   descrsetfunc f;
-  int res;
+  int res = -1;
 
-#ifdef Py_USING_UNICODE
+# ifdef Py_USING_UNICODE
   if (PyString_Check(name)) {
     name = PyUnicode_Decode(PyString_AsString(name), PyString_Size(name), NULL, NULL);
     if (!name)
       return -1;
   } else if (!PyUnicode_Check(name))
-#else
+# else
   if (!PyString_Check(name))
-#endif
+# endif
   {
     PyErr_Format(PyExc_TypeError, "attribute name must be string, not '%.200s'", name->ob_type->tp_name);
     return -1;
@@ -2901,7 +2965,6 @@ SWIG_Python_NonDynamicSetAttr(PyObject *obj, PyObject *name, PyObject *value) {
       goto done;
   }
 
-  res = -1;
   descr = _PyType_Lookup(tp, name);
   f = NULL;
   if (descr != NULL)
@@ -2923,6 +2986,7 @@ SWIG_Python_NonDynamicSetAttr(PyObject *obj, PyObject *name, PyObject *value) {
   Py_DECREF(name);
   return res;
 }
+#endif
 
 
 #ifdef __cplusplus
@@ -2946,26 +3010,26 @@ SWIG_Python_NonDynamicSetAttr(PyObject *obj, PyObject *name, PyObject *value) {
 #define SWIGTYPE_p_ConstantFactory swig_types[1]
 #define SWIGTYPE_p_FunctionAdaptor swig_types[2]
 #define SWIGTYPE_p_JITEngine swig_types[3]
-#define SWIGTYPE_p_TypeFactory swig_types[4]
-#define SWIGTYPE_p_allocator_type swig_types[5]
-#define SWIGTYPE_p_char swig_types[6]
-#define SWIGTYPE_p_const_reference swig_types[7]
-#define SWIGTYPE_p_difference_type swig_types[8]
-#define SWIGTYPE_p_llvm__BasicBlock swig_types[9]
-#define SWIGTYPE_p_llvm__Function swig_types[10]
-#define SWIGTYPE_p_llvm__Type swig_types[11]
-#define SWIGTYPE_p_llvm__Value swig_types[12]
-#define SWIGTYPE_p_p_PyObject swig_types[13]
-#define SWIGTYPE_p_reference swig_types[14]
-#define SWIGTYPE_p_size_type swig_types[15]
-#define SWIGTYPE_p_std__allocatorT_int_t swig_types[16]
-#define SWIGTYPE_p_std__allocatorT_llvm__BasicBlock_p_t swig_types[17]
-#define SWIGTYPE_p_std__allocatorT_llvm__Type_p_t swig_types[18]
-#define SWIGTYPE_p_std__allocatorT_llvm__Value_p_t swig_types[19]
-#define SWIGTYPE_p_std__allocatorT_std__string_t swig_types[20]
-#define SWIGTYPE_p_std__invalid_argument swig_types[21]
-#define SWIGTYPE_p_std__vectorT__Tp__Alloc_t swig_types[22]
-#define SWIGTYPE_p_std__vectorT__Tp_p__Alloc_t swig_types[23]
+#define SWIGTYPE_p_PassPipeline swig_types[4]
+#define SWIGTYPE_p_TypeFactory swig_types[5]
+#define SWIGTYPE_p_allocator_type swig_types[6]
+#define SWIGTYPE_p_char swig_types[7]
+#define SWIGTYPE_p_const_reference swig_types[8]
+#define SWIGTYPE_p_difference_type swig_types[9]
+#define SWIGTYPE_p_llvm__BasicBlock swig_types[10]
+#define SWIGTYPE_p_llvm__Function swig_types[11]
+#define SWIGTYPE_p_llvm__FunctionPassManager swig_types[12]
+#define SWIGTYPE_p_llvm__Type swig_types[13]
+#define SWIGTYPE_p_llvm__Value swig_types[14]
+#define SWIGTYPE_p_p_PyObject swig_types[15]
+#define SWIGTYPE_p_reference swig_types[16]
+#define SWIGTYPE_p_size_type swig_types[17]
+#define SWIGTYPE_p_std__allocatorT_int_t swig_types[18]
+#define SWIGTYPE_p_std__allocatorT_llvm__BasicBlock_p_t swig_types[19]
+#define SWIGTYPE_p_std__allocatorT_llvm__Type_p_t swig_types[20]
+#define SWIGTYPE_p_std__allocatorT_llvm__Value_p_t swig_types[21]
+#define SWIGTYPE_p_std__allocatorT_std__string_t swig_types[22]
+#define SWIGTYPE_p_std__invalid_argument swig_types[23]
 #define SWIGTYPE_p_std__vectorT_int_std__allocatorT_int_t_t swig_types[24]
 #define SWIGTYPE_p_std__vectorT_llvm__BasicBlock_p_std__allocatorT_llvm__BasicBlock_p_t_t swig_types[25]
 #define SWIGTYPE_p_std__vectorT_llvm__Type_p_std__allocatorT_llvm__Type_p_t_t swig_types[26]
@@ -2999,7 +3063,7 @@ static swig_module_info swig_module = {swig_types, 32, 0, 0, 0, 0};
 #endif
 #define SWIG_name    "_llvm_wrapper"
 
-#define SWIGVERSION 0x020004 
+#define SWIGVERSION 0x030012 
 #define SWIG_VERSION SWIGVERSION
 
 
@@ -3022,27 +3086,35 @@ namespace swig {
 
     SwigPtr_PyObject(const SwigPtr_PyObject& item) : _obj(item._obj)
     {
+      SWIG_PYTHON_THREAD_BEGIN_BLOCK;
       Py_XINCREF(_obj);      
+      SWIG_PYTHON_THREAD_END_BLOCK;
     }
     
     SwigPtr_PyObject(PyObject *obj, bool initial_ref = true) :_obj(obj)
     {
       if (initial_ref) {
+        SWIG_PYTHON_THREAD_BEGIN_BLOCK;
         Py_XINCREF(_obj);
+        SWIG_PYTHON_THREAD_END_BLOCK;
       }
     }
     
     SwigPtr_PyObject & operator=(const SwigPtr_PyObject& item) 
     {
+      SWIG_PYTHON_THREAD_BEGIN_BLOCK;
       Py_XINCREF(item._obj);
       Py_XDECREF(_obj);
       _obj = item._obj;
+      SWIG_PYTHON_THREAD_END_BLOCK;
       return *this;      
     }
     
     ~SwigPtr_PyObject() 
     {
+      SWIG_PYTHON_THREAD_BEGIN_BLOCK;
       Py_XDECREF(_obj);
+      SWIG_PYTHON_THREAD_END_BLOCK;
     }
     
     operator PyObject *() const
@@ -3085,6 +3157,7 @@ namespace swig {
 #endif
 
 
+#include <typeinfo>
 #include <stdexcept>
 
 
@@ -3096,10 +3169,11 @@ namespace swig {
 
 
 #include <string>
-#include <stdexcept>
+
+
 #include <stddef.h>
 
-  
+
 namespace swig {
   struct stop_iteration {
   };
@@ -3234,9 +3308,11 @@ SWIG_AsVal_double (PyObject *obj, double *val)
   if (PyFloat_Check(obj)) {
     if (val) *val = PyFloat_AsDouble(obj);
     return SWIG_OK;
+#if PY_VERSION_HEX < 0x03000000
   } else if (PyInt_Check(obj)) {
-    if (val) *val = PyInt_AsLong(obj);
+    if (val) *val = (double) PyInt_AsLong(obj);
     return SWIG_OK;
+#endif
   } else if (PyLong_Check(obj)) {
     double v = PyLong_AsDouble(obj);
     if (!PyErr_Occurred()) {
@@ -3310,6 +3386,7 @@ SWIG_CanCastAsInteger(double *d, double min, double max) {
 SWIGINTERN int
 SWIG_AsVal_unsigned_SS_long (PyObject *obj, unsigned long *val) 
 {
+#if PY_VERSION_HEX < 0x03000000
   if (PyInt_Check(obj)) {
     long v = PyInt_AsLong(obj);
     if (v >= 0) {
@@ -3318,13 +3395,16 @@ SWIG_AsVal_unsigned_SS_long (PyObject *obj, unsigned long *val)
     } else {
       return SWIG_OverflowError;
     }
-  } else if (PyLong_Check(obj)) {
+  } else
+#endif
+  if (PyLong_Check(obj)) {
     unsigned long v = PyLong_AsUnsignedLong(obj);
     if (!PyErr_Occurred()) {
       if (val) *val = v;
       return SWIG_OK;
     } else {
       PyErr_Clear();
+      return SWIG_OverflowError;
     }
   }
 #ifdef SWIG_PYTHON_CAST_MODE
@@ -3351,12 +3431,79 @@ SWIG_AsVal_unsigned_SS_long (PyObject *obj, unsigned long *val)
 }
 
 
+#include <limits.h>
+#if !defined(SWIG_NO_LLONG_MAX)
+# if !defined(LLONG_MAX) && defined(__GNUC__) && defined (__LONG_LONG_MAX__)
+#   define LLONG_MAX __LONG_LONG_MAX__
+#   define LLONG_MIN (-LLONG_MAX - 1LL)
+#   define ULLONG_MAX (LLONG_MAX * 2ULL + 1ULL)
+# endif
+#endif
+
+
+#if defined(LLONG_MAX) && !defined(SWIG_LONG_LONG_AVAILABLE)
+#  define SWIG_LONG_LONG_AVAILABLE
+#endif
+
+
+#ifdef SWIG_LONG_LONG_AVAILABLE
+SWIGINTERN int
+SWIG_AsVal_unsigned_SS_long_SS_long (PyObject *obj, unsigned long long *val)
+{
+  int res = SWIG_TypeError;
+  if (PyLong_Check(obj)) {
+    unsigned long long v = PyLong_AsUnsignedLongLong(obj);
+    if (!PyErr_Occurred()) {
+      if (val) *val = v;
+      return SWIG_OK;
+    } else {
+      PyErr_Clear();
+      res = SWIG_OverflowError;
+    }
+  } else {
+    unsigned long v;
+    res = SWIG_AsVal_unsigned_SS_long (obj,&v);
+    if (SWIG_IsOK(res)) {
+      if (val) *val = v;
+      return res;
+    }
+  }
+#ifdef SWIG_PYTHON_CAST_MODE
+  {
+    const double mant_max = 1LL << DBL_MANT_DIG;
+    double d;
+    res = SWIG_AsVal_double (obj,&d);
+    if (SWIG_IsOK(res) && !SWIG_CanCastAsInteger(&d, 0, mant_max))
+      return SWIG_OverflowError;
+    if (SWIG_IsOK(res) && SWIG_CanCastAsInteger(&d, 0, mant_max)) {
+      if (val) *val = (unsigned long long)(d);
+      return SWIG_AddCast(res);
+    }
+    res = SWIG_TypeError;
+  }
+#endif
+  return res;
+}
+#endif
+
+
 SWIGINTERNINLINE int
 SWIG_AsVal_size_t (PyObject * obj, size_t *val)
 {
-  unsigned long v;
-  int res = SWIG_AsVal_unsigned_SS_long (obj, val ? &v : 0);
-  if (SWIG_IsOK(res) && val) *val = static_cast< size_t >(v);
+  int res = SWIG_TypeError;
+#ifdef SWIG_LONG_LONG_AVAILABLE
+  if (sizeof(size_t) <= sizeof(unsigned long)) {
+#endif
+    unsigned long v;
+    res = SWIG_AsVal_unsigned_SS_long (obj, val ? &v : 0);
+    if (SWIG_IsOK(res) && val) *val = static_cast< size_t >(v);
+#ifdef SWIG_LONG_LONG_AVAILABLE
+  } else if (sizeof(size_t) <= sizeof(unsigned long long)) {
+    unsigned long long v;
+    res = SWIG_AsVal_unsigned_SS_long_SS_long (obj, val ? &v : 0);
+    if (SWIG_IsOK(res) && val) *val = static_cast< size_t >(v);
+  }
+#endif
   return res;
 }
 
@@ -3364,10 +3511,29 @@ SWIG_AsVal_size_t (PyObject * obj, size_t *val)
   #define SWIG_From_long   PyInt_FromLong 
 
 
+#ifdef SWIG_LONG_LONG_AVAILABLE
+SWIGINTERNINLINE PyObject* 
+SWIG_From_long_SS_long  (long long value)
+{
+  return ((value < LONG_MIN) || (value > LONG_MAX)) ?
+    PyLong_FromLongLong(value) : PyInt_FromLong(static_cast< long >(value));
+}
+#endif
+
+
 SWIGINTERNINLINE PyObject *
 SWIG_From_ptrdiff_t  (ptrdiff_t value)
 {    
-  return SWIG_From_long  (static_cast< long >(value));
+#ifdef SWIG_LONG_LONG_AVAILABLE
+  if (sizeof(ptrdiff_t) <= sizeof(long)) {
+#endif
+    return SWIG_From_long  (static_cast< long >(value));
+#ifdef SWIG_LONG_LONG_AVAILABLE
+  } else {
+    /* assume sizeof(ptrdiff_t) <= sizeof(long long) */
+    return SWIG_From_long_SS_long  (static_cast< long long >(value));
+  }
+#endif
 }
 
 
@@ -3381,16 +3547,20 @@ SWIGINTERNINLINE PyObject*
 SWIGINTERN int
 SWIG_AsVal_long (PyObject *obj, long* val)
 {
+#if PY_VERSION_HEX < 0x03000000
   if (PyInt_Check(obj)) {
     if (val) *val = PyInt_AsLong(obj);
     return SWIG_OK;
-  } else if (PyLong_Check(obj)) {
+  } else
+#endif
+  if (PyLong_Check(obj)) {
     long v = PyLong_AsLong(obj);
     if (!PyErr_Occurred()) {
       if (val) *val = v;
       return SWIG_OK;
     } else {
       PyErr_Clear();
+      return SWIG_OverflowError;
     }
   }
 #ifdef SWIG_PYTHON_CAST_MODE
@@ -3417,29 +3587,76 @@ SWIG_AsVal_long (PyObject *obj, long* val)
 }
 
 
-SWIGINTERNINLINE int
-SWIG_AsVal_ptrdiff_t (PyObject * obj, ptrdiff_t *val)
+#ifdef SWIG_LONG_LONG_AVAILABLE
+SWIGINTERN int
+SWIG_AsVal_long_SS_long (PyObject *obj, long long *val)
 {
-  long v;
-  int res = SWIG_AsVal_long (obj, val ? &v : 0);
-  if (SWIG_IsOK(res) && val) *val = static_cast< ptrdiff_t >(v);
-  return res;
-}
-
-
-#include <stdexcept>
-
-
-#include <algorithm>
-
-
-#include <vector>
-
-
-#include <string>
-
-
-namespace swig {  
+  int res = SWIG_TypeError;
+  if (PyLong_Check(obj)) {
+    long long v = PyLong_AsLongLong(obj);
+    if (!PyErr_Occurred()) {
+      if (val) *val = v;
+      return SWIG_OK;
+    } else {
+      PyErr_Clear();
+      res = SWIG_OverflowError;
+    }
+  } else {
+    long v;
+    res = SWIG_AsVal_long (obj,&v);
+    if (SWIG_IsOK(res)) {
+      if (val) *val = v;
+      return res;
+    }
+  }
+#ifdef SWIG_PYTHON_CAST_MODE
+  {
+    const double mant_max = 1LL << DBL_MANT_DIG;
+    const double mant_min = -mant_max;
+    double d;
+    res = SWIG_AsVal_double (obj,&d);
+    if (SWIG_IsOK(res) && !SWIG_CanCastAsInteger(&d, mant_min, mant_max))
+      return SWIG_OverflowError;
+    if (SWIG_IsOK(res) && SWIG_CanCastAsInteger(&d, mant_min, mant_max)) {
+      if (val) *val = (long long)(d);
+      return SWIG_AddCast(res);
+    }
+    res = SWIG_TypeError;
+  }
+#endif
+  return res;
+}
+#endif
+
+
+SWIGINTERNINLINE int
+SWIG_AsVal_ptrdiff_t (PyObject * obj, ptrdiff_t *val)
+{
+  int res = SWIG_TypeError;
+#ifdef SWIG_LONG_LONG_AVAILABLE
+  if (sizeof(ptrdiff_t) <= sizeof(long)) {
+#endif
+    long v;
+    res = SWIG_AsVal_long (obj, val ? &v : 0);
+    if (SWIG_IsOK(res) && val) *val = static_cast< ptrdiff_t >(v);
+#ifdef SWIG_LONG_LONG_AVAILABLE
+  } else if (sizeof(ptrdiff_t) <= sizeof(long long)) {
+    long long v;
+    res = SWIG_AsVal_long_SS_long (obj, val ? &v : 0);
+    if (SWIG_IsOK(res) && val) *val = static_cast< ptrdiff_t >(v);
+  }
+#endif
+  return res;
+}
+
+
+#include <algorithm>
+
+
+#include <vector>
+
+
+namespace swig {
   template <class Type>
   struct noconst_traits {
     typedef Type noconst_type;
@@ -3453,7 +3670,7 @@ namespace swig {
   /*
     type categories
   */
-  struct pointer_category { };  
+  struct pointer_category { };
   struct value_category { };
 
   /*
@@ -3466,12 +3683,25 @@ namespace swig {
     return traits<typename noconst_traits<Type >::noconst_type >::type_name();
   }
 
-  template <class Type> 
-  struct traits_info {
+  template <class Type> struct traits_info {
     static swig_type_info *type_query(std::string name) {
       name += " *";
       return SWIG_TypeQuery(name.c_str());
-    }    
+    }
+    static swig_type_info *type_info() {
+      static swig_type_info *info = type_query(type_name<Type>());
+      return info;
+    }
+  };
+
+  /*
+    Partial specialization for pointers (traits_info)
+  */
+  template <class Type> struct traits_info<Type *> {
+    static swig_type_info *type_query(std::string name) {
+      name += " *";
+      return SWIG_TypeQuery(name.c_str());
+    }
     static swig_type_info *type_info() {
       static swig_type_info *info = type_query(type_name<Type>());
       return info;
@@ -3484,7 +3714,7 @@ namespace swig {
   }
 
   /*
-    Partial specialization for pointers
+    Partial specialization for pointers (traits)
   */
   template <class Type> struct traits <Type *> {
     typedef pointer_category category;
@@ -3492,17 +3722,17 @@ namespace swig {
       std::string ptrname = name;
       ptrname += " *";
       return ptrname;
-    }    
+    }
     static const char* type_name() {
       static std::string name = make_ptr_name(swig::type_name<Type>());
       return name.c_str();
     }
   };
 
-  template <class Type, class Category> 
+  template <class Type, class Category>
   struct traits_as { };
- 
-  template <class Type, class Category> 
+
+  template <class Type, class Category>
   struct traits_check { };
 
 }
@@ -3554,7 +3784,8 @@ namespace swig {
   struct traits_asptr {   
     static int asptr(PyObject *obj, Type **val) {
       Type *p;
-      int res = SWIG_ConvertPtr(obj, (void**)&p, type_info<Type>(), 0);
+      swig_type_info *descriptor = type_info<Type>();
+      int res = descriptor ? SWIG_ConvertPtr(obj, (void **)&p, descriptor, 0) : SWIG_ERROR;
       if (SWIG_IsOK(res)) {
 	if (val) *val = p;
       }
@@ -3702,7 +3933,7 @@ namespace swig {
 
 namespace std {
   template <>
-  struct less <PyObject *>: public binary_function<PyObject *, PyObject *, bool>
+  struct less <PyObject *>
   {
     bool
     operator()(PyObject * v, PyObject *w) const
@@ -3727,7 +3958,7 @@ namespace std {
   };
 
   template <>
-  struct less <swig::SwigPtr_PyObject>: public binary_function<swig::SwigPtr_PyObject, swig::SwigPtr_PyObject, bool>
+  struct less <swig::SwigPtr_PyObject>
   {
     bool
     operator()(const swig::SwigPtr_PyObject& v, const swig::SwigPtr_PyObject& w) const
@@ -3737,7 +3968,7 @@ namespace std {
   };
 
   template <>
-  struct less <swig::SwigVar_PyObject>: public binary_function<swig::SwigVar_PyObject, swig::SwigVar_PyObject, bool>
+  struct less <swig::SwigVar_PyObject>
   {
     bool
     operator()(const swig::SwigVar_PyObject& v, const swig::SwigVar_PyObject& w) const
@@ -3780,8 +4011,9 @@ namespace swig {
 }
 
 namespace swig {
+  template <class Difference>
   inline size_t
-  check_index(ptrdiff_t i, size_t size, bool insert = false) {
+  check_index(Difference i, size_t size, bool insert = false) {
     if ( i < 0 ) {
       if ((size_t) (-i) <= size)
 	return (size_t) (i + size);
@@ -3790,20 +4022,46 @@ namespace swig {
     } else if (insert && ((size_t) i == size)) {
       return size;
     }
-    
     throw std::out_of_range("index out of range");
   }
 
-  inline size_t
-  slice_index(ptrdiff_t i, size_t size) {
-    if ( i < 0 ) {
-      if ((size_t) (-i) <= size) {
-	return (size_t) (i + size);
+  template <class Difference>
+  void
+  slice_adjust(Difference i, Difference j, Py_ssize_t step, size_t size, Difference &ii, Difference &jj, bool insert = false) {
+    if (step == 0) {
+      throw std::invalid_argument("slice step cannot be zero");
+    } else if (step > 0) {
+      // Required range: 0 <= i < size, 0 <= j < size, i <= j
+      if (i < 0) {
+        ii = 0;
+      } else if (i < (Difference)size) {
+        ii = i;
+      } else if (insert && (i >= (Difference)size)) {
+        ii = (Difference)size;
+      }
+      if (j < 0) {
+        jj = 0;
       } else {
-	throw std::out_of_range("index out of range");
+        jj = (j < (Difference)size) ? j : (Difference)size;
       }
+      if (jj < ii)
+        jj = ii;
     } else {
-      return ( (size_t) i < size ) ? ((size_t) i) : size;
+      // Required range: -1 <= i < size-1, -1 <= j < size-1, i >= j
+      if (i < -1) {
+        ii = -1;
+      } else if (i < (Difference) size) {
+        ii = i;
+      } else if (i >= (Difference)(size-1)) {
+        ii = (Difference)(size-1);
+      }
+      if (j < -1) {
+        jj = -1;
+      } else {
+        jj = (j < (Difference)size ) ? j : (Difference)(size-1);
+      }
+      if (ii < jj)
+        ii = jj;
     }
   }
 
@@ -3823,60 +4081,160 @@ namespace swig {
     return pos;
   }
 
+  template <class Sequence>
+  inline void
+  erase(Sequence* seq, const typename Sequence::iterator& position) {
+    seq->erase(position);
+  }
+
+  template <class Sequence>
+  struct traits_reserve {
+    static void reserve(Sequence & /*seq*/, typename Sequence::size_type /*n*/) {
+      // This should be specialized for types that support reserve
+    }
+  };
+
   template <class Sequence, class Difference>
   inline Sequence*
-  getslice(const Sequence* self, Difference i, Difference j) {
+  getslice(const Sequence* self, Difference i, Difference j, Py_ssize_t step) {
     typename Sequence::size_type size = self->size();
-    typename Sequence::size_type ii = swig::check_index(i, size);
-    typename Sequence::size_type jj = swig::slice_index(j, size);
-
-    if (jj > ii) {
-      typename Sequence::const_iterator vb = self->begin();
-      typename Sequence::const_iterator ve = self->begin();
-      std::advance(vb,ii);
-      std::advance(ve,jj);
-      return new Sequence(vb, ve);
+    Difference ii = 0;
+    Difference jj = 0;
+    swig::slice_adjust(i, j, step, size, ii, jj);
+
+    if (step > 0) {
+      typename Sequence::const_iterator sb = self->begin();
+      typename Sequence::const_iterator se = self->begin();
+      std::advance(sb,ii);
+      std::advance(se,jj);
+      if (step == 1) {
+        return new Sequence(sb, se);
+      } else {
+        Sequence *sequence = new Sequence();
+        swig::traits_reserve<Sequence>::reserve(*sequence, (jj - ii + step - 1) / step);
+        typename Sequence::const_iterator it = sb;
+        while (it!=se) {
+          sequence->push_back(*it);
+          for (Py_ssize_t c=0; c<step && it!=se; ++c)
+            it++;
+        }
+        return sequence;
+      } 
     } else {
-      return new Sequence();
+      Sequence *sequence = new Sequence();
+      swig::traits_reserve<Sequence>::reserve(*sequence, (ii - jj - step - 1) / -step);
+      typename Sequence::const_reverse_iterator sb = self->rbegin();
+      typename Sequence::const_reverse_iterator se = self->rbegin();
+      std::advance(sb,size-ii-1);
+      std::advance(se,size-jj-1);
+      typename Sequence::const_reverse_iterator it = sb;
+      while (it!=se) {
+        sequence->push_back(*it);
+        for (Py_ssize_t c=0; c<-step && it!=se; ++c)
+          it++;
+      }
+      return sequence;
     }
   }
 
   template <class Sequence, class Difference, class InputSeq>
   inline void
-  setslice(Sequence* self, Difference i, Difference j, const InputSeq& v = InputSeq()) {
+  setslice(Sequence* self, Difference i, Difference j, Py_ssize_t step, const InputSeq& is = InputSeq()) {
     typename Sequence::size_type size = self->size();
-    typename Sequence::size_type ii = swig::check_index(i, size, true);
-    typename Sequence::size_type jj = swig::slice_index(j, size);
-    if (jj < ii) jj = ii;
-    size_t ssize = jj - ii;
-    if (ssize <= v.size()) {
-      typename Sequence::iterator sb = self->begin();
-      typename InputSeq::const_iterator vmid = v.begin();
-      std::advance(sb,ii);
-      std::advance(vmid, jj - ii);
-      self->insert(std::copy(v.begin(), vmid, sb), vmid, v.end());
+    Difference ii = 0;
+    Difference jj = 0;
+    swig::slice_adjust(i, j, step, size, ii, jj, true);
+    if (step > 0) {
+      if (step == 1) {
+        size_t ssize = jj - ii;
+        if (ssize <= is.size()) {
+          // expanding/staying the same size
+          swig::traits_reserve<Sequence>::reserve(*self, self->size() - ssize + is.size());
+          typename Sequence::iterator sb = self->begin();
+          typename InputSeq::const_iterator isit = is.begin();
+          std::advance(sb,ii);
+          std::advance(isit, jj - ii);
+          self->insert(std::copy(is.begin(), isit, sb), isit, is.end());
+        } else {
+          // shrinking
+          typename Sequence::iterator sb = self->begin();
+          typename Sequence::iterator se = self->begin();
+          std::advance(sb,ii);
+          std::advance(se,jj);
+          self->erase(sb,se);
+          sb = self->begin();
+          std::advance(sb,ii);
+          self->insert(sb, is.begin(), is.end());
+        }
+      } else {
+        size_t replacecount = (jj - ii + step - 1) / step;
+        if (is.size() != replacecount) {
+          char msg[1024];
+          sprintf(msg, "attempt to assign sequence of size %lu to extended slice of size %lu", (unsigned long)is.size(), (unsigned long)replacecount);
+          throw std::invalid_argument(msg);
+        }
+        typename Sequence::const_iterator isit = is.begin();
+        typename Sequence::iterator it = self->begin();
+        std::advance(it,ii);
+        for (size_t rc=0; rc<replacecount; ++rc) {
+          *it++ = *isit++;
+          for (Py_ssize_t c=0; c<(step-1) && it != self->end(); ++c)
+            it++;
+        }
+      }
     } else {
-      typename Sequence::iterator sb = self->begin();
-      typename Sequence::iterator se = self->begin();
-      std::advance(sb,ii);
-      std::advance(se,jj);
-      self->erase(sb,se);
-      self->insert(sb, v.begin(), v.end());
+      size_t replacecount = (ii - jj - step - 1) / -step;
+      if (is.size() != replacecount) {
+        char msg[1024];
+        sprintf(msg, "attempt to assign sequence of size %lu to extended slice of size %lu", (unsigned long)is.size(), (unsigned long)replacecount);
+        throw std::invalid_argument(msg);
+      }
+      typename Sequence::const_iterator isit = is.begin();
+      typename Sequence::reverse_iterator it = self->rbegin();
+      std::advance(it,size-ii-1);
+      for (size_t rc=0; rc<replacecount; ++rc) {
+        *it++ = *isit++;
+        for (Py_ssize_t c=0; c<(-step-1) && it != self->rend(); ++c)
+          it++;
+      }
     }
   }
 
   template <class Sequence, class Difference>
   inline void
-  delslice(Sequence* self, Difference i, Difference j) {
+  delslice(Sequence* self, Difference i, Difference j, Py_ssize_t step) {
     typename Sequence::size_type size = self->size();
-    typename Sequence::size_type ii = swig::check_index(i, size, true);
-    typename Sequence::size_type jj = swig::slice_index(j, size);
-    if (jj > ii) {
+    Difference ii = 0;
+    Difference jj = 0;
+    swig::slice_adjust(i, j, step, size, ii, jj, true);
+    if (step > 0) {
       typename Sequence::iterator sb = self->begin();
-      typename Sequence::iterator se = self->begin();
       std::advance(sb,ii);
-      std::advance(se,jj);
-      self->erase(sb,se);
+      if (step == 1) {
+        typename Sequence::iterator se = self->begin();
+        std::advance(se,jj);
+        self->erase(sb,se);
+      } else {
+        typename Sequence::iterator it = sb;
+        size_t delcount = (jj - ii + step - 1) / step;
+        while (delcount) {
+          it = self->erase(it);
+          for (Py_ssize_t c=0; c<(step-1) && it != self->end(); ++c)
+            it++;
+          delcount--;
+        }
+      }
+    } else {
+      typename Sequence::reverse_iterator sb = self->rbegin();
+      std::advance(sb,size-ii-1);
+      typename Sequence::reverse_iterator it = sb;
+      size_t delcount = (ii - jj - step - 1) / -step;
+      while (delcount) {
+        it = typename Sequence::reverse_iterator(self->erase((++it).base()));
+        for (Py_ssize_t c=0; c<(-step-1) && it != self->rend(); ++c)
+          it++;
+        delcount--;
+      }
     }
   }
 }
@@ -4103,7 +4461,7 @@ namespace swig
   template <class T>
   struct SwigPySequence_Ref
   {
-    SwigPySequence_Ref(PyObject* seq, int index)
+    SwigPySequence_Ref(PyObject* seq, Py_ssize_t index)
       : _seq(seq), _index(index)
     {
     }
@@ -4115,7 +4473,7 @@ namespace swig
 	return swig::as<T>(item, true);
       } catch (std::exception& e) {
 	char msg[1024];
-	sprintf(msg, "in sequence element %d ", _index);
+	sprintf(msg, "in sequence element %d ", (int)_index);
 	if (!PyErr_Occurred()) {
 	  ::SWIG_Error(SWIG_TypeError,  swig::type_name<T>());
 	}
@@ -4133,7 +4491,7 @@ namespace swig
 
   private:
     PyObject* _seq;
-    int _index;
+    Py_ssize_t _index;
   };
 
   template <class T>
@@ -4154,13 +4512,13 @@ namespace swig
     typedef Reference reference;
     typedef T value_type;
     typedef T* pointer;
-    typedef int difference_type;
+    typedef Py_ssize_t difference_type;
 
     SwigPySequence_InputIterator()
     {
     }
 
-    SwigPySequence_InputIterator(PyObject* seq, int index)
+    SwigPySequence_InputIterator(PyObject* seq, Py_ssize_t index)
       : _seq(seq), _index(index)
     {
     }
@@ -4240,6 +4598,7 @@ namespace swig
     difference_type _index;
   };
 
+  // STL container wrapper around a Python sequence
   template <class T>
   struct SwigPySequence_Cont
   {
@@ -4247,8 +4606,8 @@ namespace swig
     typedef const SwigPySequence_Ref<T> const_reference;
     typedef T value_type;
     typedef T* pointer;
-    typedef int difference_type;
-    typedef int size_type;
+    typedef Py_ssize_t difference_type;
+    typedef size_t size_type;
     typedef const pointer const_pointer;
     typedef SwigPySequence_InputIterator<T, reference> iterator;
     typedef SwigPySequence_InputIterator<T, const_reference> const_iterator;
@@ -4309,13 +4668,13 @@ namespace swig
 
     bool check(bool set_err = true) const
     {
-      int s = size();
-      for (int i = 0; i < s; ++i) {
+      Py_ssize_t s = size();
+      for (Py_ssize_t i = 0; i < s; ++i) {
 	swig::SwigVar_PyObject item = PySequence_GetItem(_seq, i);
 	if (!swig::check<value_type>(item)) {
 	  if (set_err) {
 	    char msg[1024];
-	    sprintf(msg, "in sequence element %d", i);
+	    sprintf(msg, "in sequence element %d", (int)i);
 	    SWIG_Error(SWIG_RuntimeError, msg);
 	  }
 	  return false;
@@ -4348,13 +4707,18 @@ SWIGINTERN int
 SWIG_AsCharPtrAndSize(PyObject *obj, char** cptr, size_t* psize, int *alloc)
 {
 #if PY_VERSION_HEX>=0x03000000
+#if defined(SWIG_PYTHON_STRICT_BYTE_CHAR)
+  if (PyBytes_Check(obj))
+#else
   if (PyUnicode_Check(obj))
+#endif
 #else  
   if (PyString_Check(obj))
 #endif
   {
     char *cstr; Py_ssize_t len;
 #if PY_VERSION_HEX>=0x03000000
+#if !defined(SWIG_PYTHON_STRICT_BYTE_CHAR)
     if (!alloc && cptr) {
         /* We can't allow converting without allocation, since the internal
            representation of string in Python 3 is UCS-2/UCS-4 but we require
@@ -4363,8 +4727,9 @@ SWIG_AsCharPtrAndSize(PyObject *obj, char** cptr, size_t* psize, int *alloc)
         return SWIG_RuntimeError;
     }
     obj = PyUnicode_AsUTF8String(obj);
-    PyBytes_AsStringAndSize(obj, &cstr, &len);
     if(alloc) *alloc = SWIG_NEWOBJ;
+#endif
+    PyBytes_AsStringAndSize(obj, &cstr, &len);
 #else
     PyString_AsStringAndSize(obj, &cstr, &len);
 #endif
@@ -4384,27 +4749,58 @@ SWIG_AsCharPtrAndSize(PyObject *obj, char** cptr, size_t* psize, int *alloc)
 #else
 	if (*alloc == SWIG_NEWOBJ) 
 #endif
-	  {
-	    *cptr = reinterpret_cast< char* >(memcpy((new char[len + 1]), cstr, sizeof(char)*(len + 1)));
-	    *alloc = SWIG_NEWOBJ;
-	  }
-	else {
+	{
+	  *cptr = reinterpret_cast< char* >(memcpy(new char[len + 1], cstr, sizeof(char)*(len + 1)));
+	  *alloc = SWIG_NEWOBJ;
+	} else {
 	  *cptr = cstr;
 	  *alloc = SWIG_OLDOBJ;
 	}
       } else {
-        #if PY_VERSION_HEX>=0x03000000
-        assert(0); /* Should never reach here in Python 3 */
-        #endif
+#if PY_VERSION_HEX>=0x03000000
+#if defined(SWIG_PYTHON_STRICT_BYTE_CHAR)
+	*cptr = PyBytes_AsString(obj);
+#else
+	assert(0); /* Should never reach here with Unicode strings in Python 3 */
+#endif
+#else
 	*cptr = SWIG_Python_str_AsChar(obj);
+#endif
       }
     }
     if (psize) *psize = len + 1;
-#if PY_VERSION_HEX>=0x03000000
+#if PY_VERSION_HEX>=0x03000000 && !defined(SWIG_PYTHON_STRICT_BYTE_CHAR)
     Py_XDECREF(obj);
 #endif
     return SWIG_OK;
   } else {
+#if defined(SWIG_PYTHON_2_UNICODE)
+#if defined(SWIG_PYTHON_STRICT_BYTE_CHAR)
+#error "Cannot use both SWIG_PYTHON_2_UNICODE and SWIG_PYTHON_STRICT_BYTE_CHAR at once"
+#endif
+#if PY_VERSION_HEX<0x03000000
+    if (PyUnicode_Check(obj)) {
+      char *cstr; Py_ssize_t len;
+      if (!alloc && cptr) {
+        return SWIG_RuntimeError;
+      }
+      obj = PyUnicode_AsUTF8String(obj);
+      if (PyString_AsStringAndSize(obj, &cstr, &len) != -1) {
+        if (cptr) {
+          if (alloc) *alloc = SWIG_NEWOBJ;
+          *cptr = reinterpret_cast< char* >(memcpy(new char[len + 1], cstr, sizeof(char)*(len + 1)));
+        }
+        if (psize) *psize = len + 1;
+
+        Py_XDECREF(obj);
+        return SWIG_OK;
+      } else {
+        Py_XDECREF(obj);
+      }
+    }
+#endif
+#endif
+
     swig_type_info* pchar_descriptor = SWIG_pchar_descriptor();
     if (pchar_descriptor) {
       void* vptr = 0;
@@ -4479,9 +4875,17 @@ SWIG_FromCharPtrAndSize(const char* carray, size_t size)
 	SWIG_InternalNewPointerObj(const_cast< char * >(carray), pchar_descriptor, 0) : SWIG_Py_Void();
     } else {
 #if PY_VERSION_HEX >= 0x03000000
-      return PyUnicode_FromStringAndSize(carray, static_cast< int >(size));
+#if defined(SWIG_PYTHON_STRICT_BYTE_CHAR)
+      return PyBytes_FromStringAndSize(carray, static_cast< Py_ssize_t >(size));
+#else
+#if PY_VERSION_HEX >= 0x03010000
+      return PyUnicode_DecodeUTF8(carray, static_cast< Py_ssize_t >(size), "surrogateescape");
+#else
+      return PyUnicode_FromStringAndSize(carray, static_cast< Py_ssize_t >(size));
+#endif
+#endif
 #else
-      return PyString_FromStringAndSize(carray, static_cast< int >(size));
+      return PyString_FromStringAndSize(carray, static_cast< Py_ssize_t >(size));
 #endif
     }
   } else {
@@ -4498,17 +4902,17 @@ SWIG_From_std_string  (const std::string& s)
 
 
 namespace swig {
-  template <> struct traits<std::string > {
+  template <> struct traits< std::string > {
     typedef value_category category;
     static const char* type_name() { return"std::string"; }
-  };  
-  template <>  struct traits_asval<std::string > {   
+  };
+  template <>  struct traits_asval< std::string > {
     typedef std::string value_type;
-    static int asval(PyObject *obj, value_type *val) { 
+    static int asval(PyObject *obj, value_type *val) {
       return SWIG_AsVal_std_string (obj, val);
     }
   };
-  template <>  struct traits_from<std::string > {
+  template <>  struct traits_from< std::string > {
     typedef std::string value_type;
     static PyObject *from(const value_type& val) {
       return SWIG_From_std_string  (val);
@@ -4537,8 +4941,8 @@ namespace swig {
     static int asptr(PyObject *obj, sequence **seq) {
       if (obj == Py_None || SWIG_Python_GetSwigThis(obj)) {
 	sequence *p;
-	if (::SWIG_ConvertPtr(obj,(void**)&p,
-			      swig::type_info<sequence>(),0) == SWIG_OK) {
+	swig_type_info *descriptor = swig::type_info<sequence>();
+	if (descriptor && SWIG_IsOK(::SWIG_ConvertPtr(obj, (void **)&p, descriptor, 0))) {
 	  if (seq) *seq = p;
 	  return SWIG_OLDOBJ;
 	}
@@ -4577,15 +4981,14 @@ namespace swig {
 #ifdef SWIG_PYTHON_EXTRA_NATIVE_CONTAINERS
       swig_type_info *desc = swig::type_info<sequence>();
       if (desc && desc->clientdata) {
-	return SWIG_NewPointerObj(new sequence(seq), desc, SWIG_POINTER_OWN);
+	return SWIG_InternalNewPointerObj(new sequence(seq), desc, SWIG_POINTER_OWN);
       }
 #endif
       size_type size = seq.size();
       if (size <= (size_type)INT_MAX) {
-	PyObject *obj = PyTuple_New((int)size);
-	int i = 0;
-	for (const_iterator it = seq.begin();
-	     it != seq.end(); ++it, ++i) {
+	PyObject *obj = PyTuple_New((Py_ssize_t)size);
+	Py_ssize_t i = 0;
+	for (const_iterator it = seq.begin(); it != seq.end(); ++it, ++i) {
 	  PyTuple_SetItem(obj,i,swig::from<value_type>(*it));
 	}
 	return obj;
@@ -4599,6 +5002,13 @@ namespace swig {
 
 
   namespace swig {
+    template <class T>
+    struct traits_reserve<std::vector<T> > {
+      static void reserve(std::vector<T> &seq, typename std::vector<T>::size_type n) {
+        seq.reserve(n);
+      }
+    };
+
     template <class T>
     struct traits_asptr<std::vector<T> >  {
       static int asptr(PyObject *obj, std::vector<T> **vec) {
@@ -4616,7 +5026,7 @@ namespace swig {
 
 
       namespace swig {
-	template <>  struct traits<std::vector<std::string, std::allocator< std::string > > > {
+	template <>  struct traits<std::vector< std::string, std::allocator< std::string > > > {
 	  typedef pointer_category category;
 	  static const char* type_name() {
 	    return "std::vector<" "std::string" "," "std::allocator< std::string >" " >";
@@ -4641,34 +5051,49 @@ SWIGINTERNINLINE PyObject*
 SWIG_From_unsigned_SS_long  (unsigned long value)
 {
   return (value > LONG_MAX) ?
-    PyLong_FromUnsignedLong(value) : PyInt_FromLong(static_cast< long >(value)); 
+    PyLong_FromUnsignedLong(value) : PyInt_FromLong(static_cast< long >(value));
+}
+
+
+#ifdef SWIG_LONG_LONG_AVAILABLE
+SWIGINTERNINLINE PyObject* 
+SWIG_From_unsigned_SS_long_SS_long  (unsigned long long value)
+{
+  return (value > LONG_MAX) ?
+    PyLong_FromUnsignedLongLong(value) : PyInt_FromLong(static_cast< long >(value));
 }
+#endif
 
 
 SWIGINTERNINLINE PyObject *
 SWIG_From_size_t  (size_t value)
 {    
-  return SWIG_From_unsigned_SS_long  (static_cast< unsigned long >(value));
+#ifdef SWIG_LONG_LONG_AVAILABLE
+  if (sizeof(size_t) <= sizeof(unsigned long)) {
+#endif
+    return SWIG_From_unsigned_SS_long  (static_cast< unsigned long >(value));
+#ifdef SWIG_LONG_LONG_AVAILABLE
+  } else {
+    /* assume sizeof(size_t) <= sizeof(unsigned long long) */
+    return SWIG_From_unsigned_SS_long_SS_long  (static_cast< unsigned long long >(value));
+  }
+#endif
 }
 
-SWIGINTERN std::vector< std::string >::value_type std_vector_Sl_std_string_Sg__pop(std::vector< std::string > *self){
-      if (self->size() == 0)
-	throw std::out_of_range("pop from empty container");
-      std::vector<std::string,std::allocator< std::string > >::value_type x = self->back();
-      self->pop_back();
-      return x;
-    }
 SWIGINTERN std::vector< std::string,std::allocator< std::string > > *std_vector_Sl_std_string_Sg____getslice__(std::vector< std::string > *self,std::vector< std::string >::difference_type i,std::vector< std::string >::difference_type j){
-      return swig::getslice(self, i, j);
+      return swig::getslice(self, i, j, 1);
+    }
+SWIGINTERN void std_vector_Sl_std_string_Sg____setslice____SWIG_0(std::vector< std::string > *self,std::vector< std::string >::difference_type i,std::vector< std::string >::difference_type j){
+      swig::setslice(self, i, j, 1, std::vector< std::string,std::allocator< std::string > >());
     }
-SWIGINTERN void std_vector_Sl_std_string_Sg____setslice____SWIG_0(std::vector< std::string > *self,std::vector< std::string >::difference_type i,std::vector< std::string >::difference_type j,std::vector< std::string,std::allocator< std::string > > const &v=std::vector< std::string,std::allocator< std::string > >()){
-      swig::setslice(self, i, j, v);
+SWIGINTERN void std_vector_Sl_std_string_Sg____setslice____SWIG_1(std::vector< std::string > *self,std::vector< std::string >::difference_type i,std::vector< std::string >::difference_type j,std::vector< std::string,std::allocator< std::string > > const &v){
+      swig::setslice(self, i, j, 1, v);
     }
 SWIGINTERN void std_vector_Sl_std_string_Sg____delslice__(std::vector< std::string > *self,std::vector< std::string >::difference_type i,std::vector< std::string >::difference_type j){
-      swig::delslice(self, i, j);
+      swig::delslice(self, i, j, 1);
     }
 SWIGINTERN void std_vector_Sl_std_string_Sg____delitem____SWIG_0(std::vector< std::string > *self,std::vector< std::string >::difference_type i){
-      self->erase(swig::getpos(self,i));
+      swig::erase(self, swig::getpos(self, i));
     }
 SWIGINTERN std::vector< std::string,std::allocator< std::string > > *std_vector_Sl_std_string_Sg____getitem____SWIG_0(std::vector< std::string > *self,PySliceObject *slice){
       Py_ssize_t i, j, step;
@@ -4676,8 +5101,10 @@ SWIGINTERN std::vector< std::string,std::allocator< std::string > > *std_vector_
         SWIG_Error(SWIG_TypeError, "Slice object expected.");
         return NULL;
       }
-      PySlice_GetIndices(SWIGPY_SLICE_ARG(slice), self->size(), &i, &j, &step);
-      return swig::getslice(self, i, j);
+      PySlice_GetIndices(SWIGPY_SLICE_ARG(slice), (Py_ssize_t)self->size(), &i, &j, &step);
+      std::vector< std::string,std::allocator< std::string > >::difference_type id = i;
+      std::vector< std::string,std::allocator< std::string > >::difference_type jd = j;
+      return swig::getslice(self, id, jd, step);
     }
 SWIGINTERN void std_vector_Sl_std_string_Sg____setitem____SWIG_0(std::vector< std::string > *self,PySliceObject *slice,std::vector< std::string,std::allocator< std::string > > const &v){
       Py_ssize_t i, j, step;
@@ -4685,8 +5112,10 @@ SWIGINTERN void std_vector_Sl_std_string_Sg____setitem____SWIG_0(std::vector< st
         SWIG_Error(SWIG_TypeError, "Slice object expected.");
         return;
       }
-      PySlice_GetIndices(SWIGPY_SLICE_ARG(slice), self->size(), &i, &j, &step);
-      swig::setslice(self, i, j, v);
+      PySlice_GetIndices(SWIGPY_SLICE_ARG(slice), (Py_ssize_t)self->size(), &i, &j, &step);
+      std::vector< std::string,std::allocator< std::string > >::difference_type id = i;
+      std::vector< std::string,std::allocator< std::string > >::difference_type jd = j;
+      swig::setslice(self, id, jd, step, v);
     }
 SWIGINTERN void std_vector_Sl_std_string_Sg____setitem____SWIG_1(std::vector< std::string > *self,PySliceObject *slice){
       Py_ssize_t i, j, step;
@@ -4694,8 +5123,10 @@ SWIGINTERN void std_vector_Sl_std_string_Sg____setitem____SWIG_1(std::vector< st
         SWIG_Error(SWIG_TypeError, "Slice object expected.");
         return;
       }
-      PySlice_GetIndices(SWIGPY_SLICE_ARG(slice), self->size(), &i, &j, &step);
-      swig::delslice(self, i,j);
+      PySlice_GetIndices(SWIGPY_SLICE_ARG(slice), (Py_ssize_t)self->size(), &i, &j, &step);
+      std::vector< std::string,std::allocator< std::string > >::difference_type id = i;
+      std::vector< std::string,std::allocator< std::string > >::difference_type jd = j;
+      swig::delslice(self, id, jd, step);
     }
 SWIGINTERN void std_vector_Sl_std_string_Sg____delitem____SWIG_1(std::vector< std::string > *self,PySliceObject *slice){
       Py_ssize_t i, j, step;
@@ -4703,8 +5134,10 @@ SWIGINTERN void std_vector_Sl_std_string_Sg____delitem____SWIG_1(std::vector< st
         SWIG_Error(SWIG_TypeError, "Slice object expected.");
         return;
       }
-      PySlice_GetIndices(SWIGPY_SLICE_ARG(slice), self->size(), &i, &j, &step);
-      swig::delslice(self, i,j);
+      PySlice_GetIndices(SWIGPY_SLICE_ARG(slice), (Py_ssize_t)self->size(), &i, &j, &step);
+      std::vector< std::string,std::allocator< std::string > >::difference_type id = i;
+      std::vector< std::string,std::allocator< std::string > >::difference_type jd = j;
+      swig::delslice(self, id, jd, step);
     }
 SWIGINTERN std::vector< std::string >::value_type const &std_vector_Sl_std_string_Sg____getitem____SWIG_1(std::vector< std::string > const *self,std::vector< std::string >::difference_type i){
       return *(swig::cgetpos(self, i));
@@ -4712,19 +5145,20 @@ SWIGINTERN std::vector< std::string >::value_type const &std_vector_Sl_std_strin
 SWIGINTERN void std_vector_Sl_std_string_Sg____setitem____SWIG_2(std::vector< std::string > *self,std::vector< std::string >::difference_type i,std::vector< std::string >::value_type const &x){
       *(swig::getpos(self,i)) = x;
     }
+SWIGINTERN std::vector< std::string >::value_type std_vector_Sl_std_string_Sg__pop(std::vector< std::string > *self){
+      if (self->size() == 0)
+	throw std::out_of_range("pop from empty container");
+      std::vector< std::string,std::allocator< std::string > >::value_type x = self->back();
+      self->pop_back();
+      return x;
+    }
 SWIGINTERN void std_vector_Sl_std_string_Sg__append(std::vector< std::string > *self,std::vector< std::string >::value_type const &x){
       self->push_back(x);
     }
-
-#include <limits.h>
-#if !defined(SWIG_NO_LLONG_MAX)
-# if !defined(LLONG_MAX) && defined(__GNUC__) && defined (__LONG_LONG_MAX__)
-#   define LLONG_MAX __LONG_LONG_MAX__
-#   define LLONG_MIN (-LLONG_MAX - 1LL)
-#   define ULLONG_MAX (LLONG_MAX * 2ULL + 1ULL)
-# endif
-#endif
-
+SWIGINTERN std::vector< std::string >::iterator std_vector_Sl_std_string_Sg__erase__SWIG_0(std::vector< std::string > *self,std::vector< std::string >::iterator pos){ return self->erase(pos); }
+SWIGINTERN std::vector< std::string >::iterator std_vector_Sl_std_string_Sg__erase__SWIG_1(std::vector< std::string > *self,std::vector< std::string >::iterator first,std::vector< std::string >::iterator last){ return self->erase(first, last); }
+SWIGINTERN std::vector< std::string >::iterator std_vector_Sl_std_string_Sg__insert__SWIG_0(std::vector< std::string > *self,std::vector< std::string >::iterator pos,std::vector< std::string >::value_type const &x){ return self->insert(pos, x); }
+SWIGINTERN void std_vector_Sl_std_string_Sg__insert__SWIG_1(std::vector< std::string > *self,std::vector< std::string >::iterator pos,std::vector< std::string >::size_type n,std::vector< std::string >::value_type const &x){ self->insert(pos, n, x); }
 
 SWIGINTERN int
 SWIG_AsVal_int (PyObject * obj, int *val)
@@ -4742,25 +5176,25 @@ SWIG_AsVal_int (PyObject * obj, int *val)
 }
 
 
-SWIGINTERNINLINE PyObject *
-SWIG_From_int  (int value)
-{    
-  return SWIG_From_long  (value);
+SWIGINTERNINLINE PyObject*
+  SWIG_From_int  (int value)
+{
+  return PyInt_FromLong((long) value);
 }
 
 
 namespace swig {
-  template <> struct traits<int > {
+  template <> struct traits< int > {
     typedef value_category category;
     static const char* type_name() { return"int"; }
-  };  
-  template <>  struct traits_asval<int > {   
+  };
+  template <>  struct traits_asval< int > {
     typedef int value_type;
-    static int asval(PyObject *obj, value_type *val) { 
+    static int asval(PyObject *obj, value_type *val) {
       return SWIG_AsVal_int (obj, val);
     }
   };
-  template <>  struct traits_from<int > {
+  template <>  struct traits_from< int > {
     typedef int value_type;
     static PyObject *from(const value_type& val) {
       return SWIG_From_int  (val);
@@ -4770,7 +5204,7 @@ namespace swig {
 
 
       namespace swig {
-	template <>  struct traits<std::vector<int, std::allocator< int > > > {
+	template <>  struct traits<std::vector< int, std::allocator< int > > > {
 	  typedef pointer_category category;
 	  static const char* type_name() {
 	    return "std::vector<" "int" "," "std::allocator< int >" " >";
@@ -4790,24 +5224,20 @@ SWIGINTERN bool std_vector_Sl_int_Sg____bool__(std::vector< int > const *self){
 SWIGINTERN std::vector< int >::size_type std_vector_Sl_int_Sg____len__(std::vector< int > const *self){
       return self->size();
     }
-SWIGINTERN std::vector< int >::value_type std_vector_Sl_int_Sg__pop(std::vector< int > *self){
-      if (self->size() == 0)
-	throw std::out_of_range("pop from empty container");
-      std::vector<int,std::allocator< int > >::value_type x = self->back();
-      self->pop_back();
-      return x;
-    }
 SWIGINTERN std::vector< int,std::allocator< int > > *std_vector_Sl_int_Sg____getslice__(std::vector< int > *self,std::vector< int >::difference_type i,std::vector< int >::difference_type j){
-      return swig::getslice(self, i, j);
+      return swig::getslice(self, i, j, 1);
+    }
+SWIGINTERN void std_vector_Sl_int_Sg____setslice____SWIG_0(std::vector< int > *self,std::vector< int >::difference_type i,std::vector< int >::difference_type j){
+      swig::setslice(self, i, j, 1, std::vector< int,std::allocator< int > >());
     }
-SWIGINTERN void std_vector_Sl_int_Sg____setslice____SWIG_0(std::vector< int > *self,std::vector< int >::difference_type i,std::vector< int >::difference_type j,std::vector< int,std::allocator< int > > const &v=std::vector< int,std::allocator< int > >()){
-      swig::setslice(self, i, j, v);
+SWIGINTERN void std_vector_Sl_int_Sg____setslice____SWIG_1(std::vector< int > *self,std::vector< int >::difference_type i,std::vector< int >::difference_type j,std::vector< int,std::allocator< int > > const &v){
+      swig::setslice(self, i, j, 1, v);
     }
 SWIGINTERN void std_vector_Sl_int_Sg____delslice__(std::vector< int > *self,std::vector< int >::difference_type i,std::vector< int >::difference_type j){
-      swig::delslice(self, i, j);
+      swig::delslice(self, i, j, 1);
     }
 SWIGINTERN void std_vector_Sl_int_Sg____delitem____SWIG_0(std::vector< int > *self,std::vector< int >::difference_type i){
-      self->erase(swig::getpos(self,i));
+      swig::erase(self, swig::getpos(self, i));
     }
 SWIGINTERN std::vector< int,std::allocator< int > > *std_vector_Sl_int_Sg____getitem____SWIG_0(std::vector< int > *self,PySliceObject *slice){
       Py_ssize_t i, j, step;
@@ -4815,8 +5245,10 @@ SWIGINTERN std::vector< int,std::allocator< int > > *std_vector_Sl_int_Sg____get
         SWIG_Error(SWIG_TypeError, "Slice object expected.");
         return NULL;
       }
-      PySlice_GetIndices(SWIGPY_SLICE_ARG(slice), self->size(), &i, &j, &step);
-      return swig::getslice(self, i, j);
+      PySlice_GetIndices(SWIGPY_SLICE_ARG(slice), (Py_ssize_t)self->size(), &i, &j, &step);
+      std::vector< int,std::allocator< int > >::difference_type id = i;
+      std::vector< int,std::allocator< int > >::difference_type jd = j;
+      return swig::getslice(self, id, jd, step);
     }
 SWIGINTERN void std_vector_Sl_int_Sg____setitem____SWIG_0(std::vector< int > *self,PySliceObject *slice,std::vector< int,std::allocator< int > > const &v){
       Py_ssize_t i, j, step;
@@ -4824,8 +5256,10 @@ SWIGINTERN void std_vector_Sl_int_Sg____setitem____SWIG_0(std::vector< int > *se
         SWIG_Error(SWIG_TypeError, "Slice object expected.");
         return;
       }
-      PySlice_GetIndices(SWIGPY_SLICE_ARG(slice), self->size(), &i, &j, &step);
-      swig::setslice(self, i, j, v);
+      PySlice_GetIndices(SWIGPY_SLICE_ARG(slice), (Py_ssize_t)self->size(), &i, &j, &step);
+      std::vector< int,std::allocator< int > >::difference_type id = i;
+      std::vector< int,std::allocator< int > >::difference_type jd = j;
+      swig::setslice(self, id, jd, step, v);
     }
 SWIGINTERN void std_vector_Sl_int_Sg____setitem____SWIG_1(std::vector< int > *self,PySliceObject *slice){
       Py_ssize_t i, j, step;
@@ -4833,8 +5267,10 @@ SWIGINTERN void std_vector_Sl_int_Sg____setitem____SWIG_1(std::vector< int > *se
         SWIG_Error(SWIG_TypeError, "Slice object expected.");
         return;
       }
-      PySlice_GetIndices(SWIGPY_SLICE_ARG(slice), self->size(), &i, &j, &step);
-      swig::delslice(self, i,j);
+      PySlice_GetIndices(SWIGPY_SLICE_ARG(slice), (Py_ssize_t)self->size(), &i, &j, &step);
+      std::vector< int,std::allocator< int > >::difference_type id = i;
+      std::vector< int,std::allocator< int > >::difference_type jd = j;
+      swig::delslice(self, id, jd, step);
     }
 SWIGINTERN void std_vector_Sl_int_Sg____delitem____SWIG_1(std::vector< int > *self,PySliceObject *slice){
       Py_ssize_t i, j, step;
@@ -4842,8 +5278,10 @@ SWIGINTERN void std_vector_Sl_int_Sg____delitem____SWIG_1(std::vector< int > *se
         SWIG_Error(SWIG_TypeError, "Slice object expected.");
         return;
       }
-      PySlice_GetIndices(SWIGPY_SLICE_ARG(slice), self->size(), &i, &j, &step);
-      swig::delslice(self, i,j);
+      PySlice_GetIndices(SWIGPY_SLICE_ARG(slice), (Py_ssize_t)self->size(), &i, &j, &step);
+      std::vector< int,std::allocator< int > >::difference_type id = i;
+      std::vector< int,std::allocator< int > >::difference_type jd = j;
+      swig::delslice(self, id, jd, step);
     }
 SWIGINTERN std::vector< int >::value_type const &std_vector_Sl_int_Sg____getitem____SWIG_1(std::vector< int > const *self,std::vector< int >::difference_type i){
       return *(swig::cgetpos(self, i));
@@ -4851,12 +5289,23 @@ SWIGINTERN std::vector< int >::value_type const &std_vector_Sl_int_Sg____getitem
 SWIGINTERN void std_vector_Sl_int_Sg____setitem____SWIG_2(std::vector< int > *self,std::vector< int >::difference_type i,std::vector< int >::value_type const &x){
       *(swig::getpos(self,i)) = x;
     }
+SWIGINTERN std::vector< int >::value_type std_vector_Sl_int_Sg__pop(std::vector< int > *self){
+      if (self->size() == 0)
+	throw std::out_of_range("pop from empty container");
+      std::vector< int,std::allocator< int > >::value_type x = self->back();
+      self->pop_back();
+      return x;
+    }
 SWIGINTERN void std_vector_Sl_int_Sg__append(std::vector< int > *self,std::vector< int >::value_type const &x){
       self->push_back(x);
     }
+SWIGINTERN std::vector< int >::iterator std_vector_Sl_int_Sg__erase__SWIG_0(std::vector< int > *self,std::vector< int >::iterator pos){ return self->erase(pos); }
+SWIGINTERN std::vector< int >::iterator std_vector_Sl_int_Sg__erase__SWIG_1(std::vector< int > *self,std::vector< int >::iterator first,std::vector< int >::iterator last){ return self->erase(first, last); }
+SWIGINTERN std::vector< int >::iterator std_vector_Sl_int_Sg__insert__SWIG_0(std::vector< int > *self,std::vector< int >::iterator pos,std::vector< int >::value_type const &x){ return self->insert(pos, x); }
+SWIGINTERN void std_vector_Sl_int_Sg__insert__SWIG_1(std::vector< int > *self,std::vector< int >::iterator pos,std::vector< int >::size_type n,std::vector< int >::value_type const &x){ self->insert(pos, n, x); }
 
   namespace swig {
-    template <>  struct traits<llvm::Type > {
+    template <>  struct traits< llvm::Type > {
       typedef pointer_category category;
       static const char* type_name() { return"llvm::Type"; }
     };
@@ -4864,7 +5313,7 @@ SWIGINTERN void std_vector_Sl_int_Sg__append(std::vector< int > *self,std::vecto
 
 
       namespace swig {
-	template <>  struct traits<std::vector<llvm::Type*, std::allocator< llvm::Type * > > > {
+	template <>  struct traits<std::vector< llvm::Type*, std::allocator< llvm::Type * > > > {
 	  typedef value_category category;
 	  static const char* type_name() {
 	    return "std::vector<" "llvm::Type" " *," "std::allocator< llvm::Type * >" " >";
@@ -4884,24 +5333,20 @@ SWIGINTERN bool std_vector_Sl_llvm_Type_Sm__Sg____bool__(std::vector< llvm::Type
 SWIGINTERN std::vector< llvm::Type * >::size_type std_vector_Sl_llvm_Type_Sm__Sg____len__(std::vector< llvm::Type * > const *self){
       return self->size();
     }
-SWIGINTERN std::vector< llvm::Type * >::value_type std_vector_Sl_llvm_Type_Sm__Sg__pop(std::vector< llvm::Type * > *self){
-      if (self->size() == 0)
-	throw std::out_of_range("pop from empty container");
-      std::vector<llvm::Type*,std::allocator< llvm::Type * > >::value_type x = self->back();
-      self->pop_back();
-      return x;
-    }
 SWIGINTERN std::vector< llvm::Type *,std::allocator< llvm::Type * > > *std_vector_Sl_llvm_Type_Sm__Sg____getslice__(std::vector< llvm::Type * > *self,std::vector< llvm::Type * >::difference_type i,std::vector< llvm::Type * >::difference_type j){
-      return swig::getslice(self, i, j);
+      return swig::getslice(self, i, j, 1);
     }
-SWIGINTERN void std_vector_Sl_llvm_Type_Sm__Sg____setslice____SWIG_0(std::vector< llvm::Type * > *self,std::vector< llvm::Type * >::difference_type i,std::vector< llvm::Type * >::difference_type j,std::vector< llvm::Type *,std::allocator< llvm::Type * > > const &v=std::vector< llvm::Type *,std::allocator< llvm::Type * > >()){
-      swig::setslice(self, i, j, v);
+SWIGINTERN void std_vector_Sl_llvm_Type_Sm__Sg____setslice____SWIG_0(std::vector< llvm::Type * > *self,std::vector< llvm::Type * >::difference_type i,std::vector< llvm::Type * >::difference_type j){
+      swig::setslice(self, i, j, 1, std::vector< llvm::Type*,std::allocator< llvm::Type * > >());
+    }
+SWIGINTERN void std_vector_Sl_llvm_Type_Sm__Sg____setslice____SWIG_1(std::vector< llvm::Type * > *self,std::vector< llvm::Type * >::difference_type i,std::vector< llvm::Type * >::difference_type j,std::vector< llvm::Type *,std::allocator< llvm::Type * > > const &v){
+      swig::setslice(self, i, j, 1, v);
     }
 SWIGINTERN void std_vector_Sl_llvm_Type_Sm__Sg____delslice__(std::vector< llvm::Type * > *self,std::vector< llvm::Type * >::difference_type i,std::vector< llvm::Type * >::difference_type j){
-      swig::delslice(self, i, j);
+      swig::delslice(self, i, j, 1);
     }
 SWIGINTERN void std_vector_Sl_llvm_Type_Sm__Sg____delitem____SWIG_0(std::vector< llvm::Type * > *self,std::vector< llvm::Type * >::difference_type i){
-      self->erase(swig::getpos(self,i));
+      swig::erase(self, swig::getpos(self, i));
     }
 SWIGINTERN std::vector< llvm::Type *,std::allocator< llvm::Type * > > *std_vector_Sl_llvm_Type_Sm__Sg____getitem____SWIG_0(std::vector< llvm::Type * > *self,PySliceObject *slice){
       Py_ssize_t i, j, step;
@@ -4909,8 +5354,10 @@ SWIGINTERN std::vector< llvm::Type *,std::allocator< llvm::Type * > > *std_vecto
         SWIG_Error(SWIG_TypeError, "Slice object expected.");
         return NULL;
       }
-      PySlice_GetIndices(SWIGPY_SLICE_ARG(slice), self->size(), &i, &j, &step);
-      return swig::getslice(self, i, j);
+      PySlice_GetIndices(SWIGPY_SLICE_ARG(slice), (Py_ssize_t)self->size(), &i, &j, &step);
+      std::vector< llvm::Type*,std::allocator< llvm::Type * > >::difference_type id = i;
+      std::vector< llvm::Type*,std::allocator< llvm::Type * > >::difference_type jd = j;
+      return swig::getslice(self, id, jd, step);
     }
 SWIGINTERN void std_vector_Sl_llvm_Type_Sm__Sg____setitem____SWIG_0(std::vector< llvm::Type * > *self,PySliceObject *slice,std::vector< llvm::Type *,std::allocator< llvm::Type * > > const &v){
       Py_ssize_t i, j, step;
@@ -4918,8 +5365,10 @@ SWIGINTERN void std_vector_Sl_llvm_Type_Sm__Sg____setitem____SWIG_0(std::vector<
         SWIG_Error(SWIG_TypeError, "Slice object expected.");
         return;
       }
-      PySlice_GetIndices(SWIGPY_SLICE_ARG(slice), self->size(), &i, &j, &step);
-      swig::setslice(self, i, j, v);
+      PySlice_GetIndices(SWIGPY_SLICE_ARG(slice), (Py_ssize_t)self->size(), &i, &j, &step);
+      std::vector< llvm::Type*,std::allocator< llvm::Type * > >::difference_type id = i;
+      std::vector< llvm::Type*,std::allocator< llvm::Type * > >::difference_type jd = j;
+      swig::setslice(self, id, jd, step, v);
     }
 SWIGINTERN void std_vector_Sl_llvm_Type_Sm__Sg____setitem____SWIG_1(std::vector< llvm::Type * > *self,PySliceObject *slice){
       Py_ssize_t i, j, step;
@@ -4927,8 +5376,10 @@ SWIGINTERN void std_vector_Sl_llvm_Type_Sm__Sg____setitem____SWIG_1(std::vector<
         SWIG_Error(SWIG_TypeError, "Slice object expected.");
         return;
       }
-      PySlice_GetIndices(SWIGPY_SLICE_ARG(slice), self->size(), &i, &j, &step);
-      swig::delslice(self, i,j);
+      PySlice_GetIndices(SWIGPY_SLICE_ARG(slice), (Py_ssize_t)self->size(), &i, &j, &step);
+      std::vector< llvm::Type*,std::allocator< llvm::Type * > >::difference_type id = i;
+      std::vector< llvm::Type*,std::allocator< llvm::Type * > >::difference_type jd = j;
+      swig::delslice(self, id, jd, step);
     }
 SWIGINTERN void std_vector_Sl_llvm_Type_Sm__Sg____delitem____SWIG_1(std::vector< llvm::Type * > *self,PySliceObject *slice){
       Py_ssize_t i, j, step;
@@ -4936,8 +5387,10 @@ SWIGINTERN void std_vector_Sl_llvm_Type_Sm__Sg____delitem____SWIG_1(std::vector<
         SWIG_Error(SWIG_TypeError, "Slice object expected.");
         return;
       }
-      PySlice_GetIndices(SWIGPY_SLICE_ARG(slice), self->size(), &i, &j, &step);
-      swig::delslice(self, i,j);
+      PySlice_GetIndices(SWIGPY_SLICE_ARG(slice), (Py_ssize_t)self->size(), &i, &j, &step);
+      std::vector< llvm::Type*,std::allocator< llvm::Type * > >::difference_type id = i;
+      std::vector< llvm::Type*,std::allocator< llvm::Type * > >::difference_type jd = j;
+      swig::delslice(self, id, jd, step);
     }
 SWIGINTERN std::vector< llvm::Type * >::value_type std_vector_Sl_llvm_Type_Sm__Sg____getitem____SWIG_1(std::vector< llvm::Type * > *self,std::vector< llvm::Type * >::difference_type i){
       return *(swig::cgetpos(self, i));
@@ -4945,12 +5398,23 @@ SWIGINTERN std::vector< llvm::Type * >::value_type std_vector_Sl_llvm_Type_Sm__S
 SWIGINTERN void std_vector_Sl_llvm_Type_Sm__Sg____setitem____SWIG_2(std::vector< llvm::Type * > *self,std::vector< llvm::Type * >::difference_type i,std::vector< llvm::Type * >::value_type x){
       *(swig::getpos(self,i)) = x;
     }
+SWIGINTERN std::vector< llvm::Type * >::value_type std_vector_Sl_llvm_Type_Sm__Sg__pop(std::vector< llvm::Type * > *self){
+      if (self->size() == 0)
+	throw std::out_of_range("pop from empty container");
+      std::vector< llvm::Type*,std::allocator< llvm::Type * > >::value_type x = self->back();
+      self->pop_back();
+      return x;
+    }
 SWIGINTERN void std_vector_Sl_llvm_Type_Sm__Sg__append(std::vector< llvm::Type * > *self,std::vector< llvm::Type * >::value_type x){
       self->push_back(x);
     }
+SWIGINTERN std::vector< llvm::Type * >::iterator std_vector_Sl_llvm_Type_Sm__Sg__erase__SWIG_0(std::vector< llvm::Type * > *self,std::vector< llvm::Type * >::iterator pos){ return self->erase(pos); }
+SWIGINTERN std::vector< llvm::Type * >::iterator std_vector_Sl_llvm_Type_Sm__Sg__erase__SWIG_1(std::vector< llvm::Type * > *self,std::vector< llvm::Type * >::iterator first,std::vector< llvm::Type * >::iterator last){ return self->erase(first, last); }
+SWIGINTERN std::vector< llvm::Type * >::iterator std_vector_Sl_llvm_Type_Sm__Sg__insert__SWIG_0(std::vector< llvm::Type * > *self,std::vector< llvm::Type * >::iterator pos,std::vector< llvm::Type * >::value_type x){ return self->insert(pos, x); }
+SWIGINTERN void std_vector_Sl_llvm_Type_Sm__Sg__insert__SWIG_1(std::vector< llvm::Type * > *self,std::vector< llvm::Type * >::iterator pos,std::vector< llvm::Type * >::size_type n,std::vector< llvm::Type * >::value_type x){ self->insert(pos, n, x); }
 
   namespace swig {
-    template <>  struct traits<llvm::Value > {
+    template <>  struct traits< llvm::Value > {
       typedef pointer_category category;
       static const char* type_name() { return"llvm::Value"; }
     };
@@ -4958,7 +5422,7 @@ SWIGINTERN void std_vector_Sl_llvm_Type_Sm__Sg__append(std::vector< llvm::Type *
 
 
       namespace swig {
-	template <>  struct traits<std::vector<llvm::Value*, std::allocator< llvm::Value * > > > {
+	template <>  struct traits<std::vector< llvm::Value*, std::allocator< llvm::Value * > > > {
 	  typedef value_category category;
 	  static const char* type_name() {
 	    return "std::vector<" "llvm::Value" " *," "std::allocator< llvm::Value * >" " >";
@@ -4978,24 +5442,20 @@ SWIGINTERN bool std_vector_Sl_llvm_Value_Sm__Sg____bool__(std::vector< llvm::Val
 SWIGINTERN std::vector< llvm::Value * >::size_type std_vector_Sl_llvm_Value_Sm__Sg____len__(std::vector< llvm::Value * > const *self){
       return self->size();
     }
-SWIGINTERN std::vector< llvm::Value * >::value_type std_vector_Sl_llvm_Value_Sm__Sg__pop(std::vector< llvm::Value * > *self){
-      if (self->size() == 0)
-	throw std::out_of_range("pop from empty container");
-      std::vector<llvm::Value*,std::allocator< llvm::Value * > >::value_type x = self->back();
-      self->pop_back();
-      return x;
-    }
 SWIGINTERN std::vector< llvm::Value *,std::allocator< llvm::Value * > > *std_vector_Sl_llvm_Value_Sm__Sg____getslice__(std::vector< llvm::Value * > *self,std::vector< llvm::Value * >::difference_type i,std::vector< llvm::Value * >::difference_type j){
-      return swig::getslice(self, i, j);
+      return swig::getslice(self, i, j, 1);
+    }
+SWIGINTERN void std_vector_Sl_llvm_Value_Sm__Sg____setslice____SWIG_0(std::vector< llvm::Value * > *self,std::vector< llvm::Value * >::difference_type i,std::vector< llvm::Value * >::difference_type j){
+      swig::setslice(self, i, j, 1, std::vector< llvm::Value*,std::allocator< llvm::Value * > >());
     }
-SWIGINTERN void std_vector_Sl_llvm_Value_Sm__Sg____setslice____SWIG_0(std::vector< llvm::Value * > *self,std::vector< llvm::Value * >::difference_type i,std::vector< llvm::Value * >::difference_type j,std::vector< llvm::Value *,std::allocator< llvm::Value * > > const &v=std::vector< llvm::Value *,std::allocator< llvm::Value * > >()){
-      swig::setslice(self, i, j, v);
+SWIGINTERN void std_vector_Sl_llvm_Value_Sm__Sg____setslice____SWIG_1(std::vector< llvm::Value * > *self,std::vector< llvm::Value * >::difference_type i,std::vector< llvm::Value * >::difference_type j,std::vector< llvm::Value *,std::allocator< llvm::Value * > > const &v){
+      swig::setslice(self, i, j, 1, v);
     }
 SWIGINTERN void std_vector_Sl_llvm_Value_Sm__Sg____delslice__(std::vector< llvm::Value * > *self,std::vector< llvm::Value * >::difference_type i,std::vector< llvm::Value * >::difference_type j){
-      swig::delslice(self, i, j);
+      swig::delslice(self, i, j, 1);
     }
 SWIGINTERN void std_vector_Sl_llvm_Value_Sm__Sg____delitem____SWIG_0(std::vector< llvm::Value * > *self,std::vector< llvm::Value * >::difference_type i){
-      self->erase(swig::getpos(self,i));
+      swig::erase(self, swig::getpos(self, i));
     }
 SWIGINTERN std::vector< llvm::Value *,std::allocator< llvm::Value * > > *std_vector_Sl_llvm_Value_Sm__Sg____getitem____SWIG_0(std::vector< llvm::Value * > *self,PySliceObject *slice){
       Py_ssize_t i, j, step;
@@ -5003,8 +5463,10 @@ SWIGINTERN std::vector< llvm::Value *,std::allocator< llvm::Value * > > *std_vec
         SWIG_Error(SWIG_TypeError, "Slice object expected.");
         return NULL;
       }
-      PySlice_GetIndices(SWIGPY_SLICE_ARG(slice), self->size(), &i, &j, &step);
-      return swig::getslice(self, i, j);
+      PySlice_GetIndices(SWIGPY_SLICE_ARG(slice), (Py_ssize_t)self->size(), &i, &j, &step);
+      std::vector< llvm::Value*,std::allocator< llvm::Value * > >::difference_type id = i;
+      std::vector< llvm::Value*,std::allocator< llvm::Value * > >::difference_type jd = j;
+      return swig::getslice(self, id, jd, step);
     }
 SWIGINTERN void std_vector_Sl_llvm_Value_Sm__Sg____setitem____SWIG_0(std::vector< llvm::Value * > *self,PySliceObject *slice,std::vector< llvm::Value *,std::allocator< llvm::Value * > > const &v){
       Py_ssize_t i, j, step;
@@ -5012,8 +5474,10 @@ SWIGINTERN void std_vector_Sl_llvm_Value_Sm__Sg____setitem____SWIG_0(std::vector
         SWIG_Error(SWIG_TypeError, "Slice object expected.");
         return;
       }
-      PySlice_GetIndices(SWIGPY_SLICE_ARG(slice), self->size(), &i, &j, &step);
-      swig::setslice(self, i, j, v);
+      PySlice_GetIndices(SWIGPY_SLICE_ARG(slice), (Py_ssize_t)self->size(), &i, &j, &step);
+      std::vector< llvm::Value*,std::allocator< llvm::Value * > >::difference_type id = i;
+      std::vector< llvm::Value*,std::allocator< llvm::Value * > >::difference_type jd = j;
+      swig::setslice(self, id, jd, step, v);
     }
 SWIGINTERN void std_vector_Sl_llvm_Value_Sm__Sg____setitem____SWIG_1(std::vector< llvm::Value * > *self,PySliceObject *slice){
       Py_ssize_t i, j, step;
@@ -5021,8 +5485,10 @@ SWIGINTERN void std_vector_Sl_llvm_Value_Sm__Sg____setitem____SWIG_1(std::vector
         SWIG_Error(SWIG_TypeError, "Slice object expected.");
         return;
       }
-      PySlice_GetIndices(SWIGPY_SLICE_ARG(slice), self->size(), &i, &j, &step);
-      swig::delslice(self, i,j);
+      PySlice_GetIndices(SWIGPY_SLICE_ARG(slice), (Py_ssize_t)self->size(), &i, &j, &step);
+      std::vector< llvm::Value*,std::allocator< llvm::Value * > >::difference_type id = i;
+      std::vector< llvm::Value*,std::allocator< llvm::Value * > >::difference_type jd = j;
+      swig::delslice(self, id, jd, step);
     }
 SWIGINTERN void std_vector_Sl_llvm_Value_Sm__Sg____delitem____SWIG_1(std::vector< llvm::Value * > *self,PySliceObject *slice){
       Py_ssize_t i, j, step;
@@ -5030,8 +5496,10 @@ SWIGINTERN void std_vector_Sl_llvm_Value_Sm__Sg____delitem____SWIG_1(std::vector
         SWIG_Error(SWIG_TypeError, "Slice object expected.");
         return;
       }
-      PySlice_GetIndices(SWIGPY_SLICE_ARG(slice), self->size(), &i, &j, &step);
-      swig::delslice(self, i,j);
+      PySlice_GetIndices(SWIGPY_SLICE_ARG(slice), (Py_ssize_t)self->size(), &i, &j, &step);
+      std::vector< llvm::Value*,std::allocator< llvm::Value * > >::difference_type id = i;
+      std::vector< llvm::Value*,std::allocator< llvm::Value * > >::difference_type jd = j;
+      swig::delslice(self, id, jd, step);
     }
 SWIGINTERN std::vector< llvm::Value * >::value_type std_vector_Sl_llvm_Value_Sm__Sg____getitem____SWIG_1(std::vector< llvm::Value * > *self,std::vector< llvm::Value * >::difference_type i){
       return *(swig::cgetpos(self, i));
@@ -5039,12 +5507,23 @@ SWIGINTERN std::vector< llvm::Value * >::value_type std_vector_Sl_llvm_Value_Sm_
 SWIGINTERN void std_vector_Sl_llvm_Value_Sm__Sg____setitem____SWIG_2(std::vector< llvm::Value * > *self,std::vector< llvm::Value * >::difference_type i,std::vector< llvm::Value * >::value_type x){
       *(swig::getpos(self,i)) = x;
     }
+SWIGINTERN std::vector< llvm::Value * >::value_type std_vector_Sl_llvm_Value_Sm__Sg__pop(std::vector< llvm::Value * > *self){
+      if (self->size() == 0)
+	throw std::out_of_range("pop from empty container");
+      std::vector< llvm::Value*,std::allocator< llvm::Value * > >::value_type x = self->back();
+      self->pop_back();
+      return x;
+    }
 SWIGINTERN void std_vector_Sl_llvm_Value_Sm__Sg__append(std::vector< llvm::Value * > *self,std::vector< llvm::Value * >::value_type x){
       self->push_back(x);
     }
+SWIGINTERN std::vector< llvm::Value * >::iterator std_vector_Sl_llvm_Value_Sm__Sg__erase__SWIG_0(std::vector< llvm::Value * > *self,std::vector< llvm::Value * >::iterator pos){ return self->erase(pos); }
+SWIGINTERN std::vector< llvm::Value * >::iterator std_vector_Sl_llvm_Value_Sm__Sg__erase__SWIG_1(std::vector< llvm::Value * > *self,std::vector< llvm::Value * >::iterator first,std::vector< llvm::Value * >::iterator last){ return self->erase(first, last); }
+SWIGINTERN std::vector< llvm::Value * >::iterator std_vector_Sl_llvm_Value_Sm__Sg__insert__SWIG_0(std::vector< llvm::Value * > *self,std::vector< llvm::Value * >::iterator pos,std::vector< llvm::Value * >::value_type x){ return self->insert(pos, x); }
+SWIGINTERN void std_vector_Sl_llvm_Value_Sm__Sg__insert__SWIG_1(std::vector< llvm::Value * > *self,std::vector< llvm::Value * >::iterator pos,std::vector< llvm::Value * >::size_type n,std::vector< llvm::Value * >::value_type x){ self->insert(pos, n, x); }
 
   namespace swig {
-    template <>  struct traits<llvm::BasicBlock > {
+    template <>  struct traits< llvm::BasicBlock > {
       typedef pointer_category category;
       static const char* type_name() { return"llvm::BasicBlock"; }
     };
@@ -5052,7 +5531,7 @@ SWIGINTERN void std_vector_Sl_llvm_Value_Sm__Sg__append(std::vector< llvm::Value
 
 
       namespace swig {
-	template <>  struct traits<std::vector<llvm::BasicBlock*, std::allocator< llvm::BasicBlock * > > > {
+	template <>  struct traits<std::vector< llvm::BasicBlock*, std::allocator< llvm::BasicBlock * > > > {
 	  typedef value_category category;
 	  static const char* type_name() {
 	    return "std::vector<" "llvm::BasicBlock" " *," "std::allocator< llvm::BasicBlock * >" " >";
@@ -5072,24 +5551,20 @@ SWIGINTERN bool std_vector_Sl_llvm_BasicBlock_Sm__Sg____bool__(std::vector< llvm
 SWIGINTERN std::vector< llvm::BasicBlock * >::size_type std_vector_Sl_llvm_BasicBlock_Sm__Sg____len__(std::vector< llvm::BasicBlock * > const *self){
       return self->size();
     }
-SWIGINTERN std::vector< llvm::BasicBlock * >::value_type std_vector_Sl_llvm_BasicBlock_Sm__Sg__pop(std::vector< llvm::BasicBlock * > *self){
-      if (self->size() == 0)
-	throw std::out_of_range("pop from empty container");
-      std::vector<llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >::value_type x = self->back();
-      self->pop_back();
-      return x;
-    }
 SWIGINTERN std::vector< llvm::BasicBlock *,std::allocator< llvm::BasicBlock * > > *std_vector_Sl_llvm_BasicBlock_Sm__Sg____getslice__(std::vector< llvm::BasicBlock * > *self,std::vector< llvm::BasicBlock * >::difference_type i,std::vector< llvm::BasicBlock * >::difference_type j){
-      return swig::getslice(self, i, j);
+      return swig::getslice(self, i, j, 1);
     }
-SWIGINTERN void std_vector_Sl_llvm_BasicBlock_Sm__Sg____setslice____SWIG_0(std::vector< llvm::BasicBlock * > *self,std::vector< llvm::BasicBlock * >::difference_type i,std::vector< llvm::BasicBlock * >::difference_type j,std::vector< llvm::BasicBlock *,std::allocator< llvm::BasicBlock * > > const &v=std::vector< llvm::BasicBlock *,std::allocator< llvm::BasicBlock * > >()){
-      swig::setslice(self, i, j, v);
+SWIGINTERN void std_vector_Sl_llvm_BasicBlock_Sm__Sg____setslice____SWIG_0(std::vector< llvm::BasicBlock * > *self,std::vector< llvm::BasicBlock * >::difference_type i,std::vector< llvm::BasicBlock * >::difference_type j){
+      swig::setslice(self, i, j, 1, std::vector< llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >());
+    }
+SWIGINTERN void std_vector_Sl_llvm_BasicBlock_Sm__Sg____setslice____SWIG_1(std::vector< llvm::BasicBlock * > *self,std::vector< llvm::BasicBlock * >::difference_type i,std::vector< llvm::BasicBlock * >::difference_type j,std::vector< llvm::BasicBlock *,std::allocator< llvm::BasicBlock * > > const &v){
+      swig::setslice(self, i, j, 1, v);
     }
 SWIGINTERN void std_vector_Sl_llvm_BasicBlock_Sm__Sg____delslice__(std::vector< llvm::BasicBlock * > *self,std::vector< llvm::BasicBlock * >::difference_type i,std::vector< llvm::BasicBlock * >::difference_type j){
-      swig::delslice(self, i, j);
+      swig::delslice(self, i, j, 1);
     }
 SWIGINTERN void std_vector_Sl_llvm_BasicBlock_Sm__Sg____delitem____SWIG_0(std::vector< llvm::BasicBlock * > *self,std::vector< llvm::BasicBlock * >::difference_type i){
-      self->erase(swig::getpos(self,i));
+      swig::erase(self, swig::getpos(self, i));
     }
 SWIGINTERN std::vector< llvm::BasicBlock *,std::allocator< llvm::BasicBlock * > > *std_vector_Sl_llvm_BasicBlock_Sm__Sg____getitem____SWIG_0(std::vector< llvm::BasicBlock * > *self,PySliceObject *slice){
       Py_ssize_t i, j, step;
@@ -5097,8 +5572,10 @@ SWIGINTERN std::vector< llvm::BasicBlock *,std::allocator< llvm::BasicBlock * >
         SWIG_Error(SWIG_TypeError, "Slice object expected.");
         return NULL;
       }
-      PySlice_GetIndices(SWIGPY_SLICE_ARG(slice), self->size(), &i, &j, &step);
-      return swig::getslice(self, i, j);
+      PySlice_GetIndices(SWIGPY_SLICE_ARG(slice), (Py_ssize_t)self->size(), &i, &j, &step);
+      std::vector< llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >::difference_type id = i;
+      std::vector< llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >::difference_type jd = j;
+      return swig::getslice(self, id, jd, step);
     }
 SWIGINTERN void std_vector_Sl_llvm_BasicBlock_Sm__Sg____setitem____SWIG_0(std::vector< llvm::BasicBlock * > *self,PySliceObject *slice,std::vector< llvm::BasicBlock *,std::allocator< llvm::BasicBlock * > > const &v){
       Py_ssize_t i, j, step;
@@ -5106,8 +5583,10 @@ SWIGINTERN void std_vector_Sl_llvm_BasicBlock_Sm__Sg____setitem____SWIG_0(std::v
         SWIG_Error(SWIG_TypeError, "Slice object expected.");
         return;
       }
-      PySlice_GetIndices(SWIGPY_SLICE_ARG(slice), self->size(), &i, &j, &step);
-      swig::setslice(self, i, j, v);
+      PySlice_GetIndices(SWIGPY_SLICE_ARG(slice), (Py_ssize_t)self->size(), &i, &j, &step);
+      std::vector< llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >::difference_type id = i;
+      std::vector< llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >::difference_type jd = j;
+      swig::setslice(self, id, jd, step, v);
     }
 SWIGINTERN void std_vector_Sl_llvm_BasicBlock_Sm__Sg____setitem____SWIG_1(std::vector< llvm::BasicBlock * > *self,PySliceObject *slice){
       Py_ssize_t i, j, step;
@@ -5115,8 +5594,10 @@ SWIGINTERN void std_vector_Sl_llvm_BasicBlock_Sm__Sg____setitem____SWIG_1(std::v
         SWIG_Error(SWIG_TypeError, "Slice object expected.");
         return;
       }
-      PySlice_GetIndices(SWIGPY_SLICE_ARG(slice), self->size(), &i, &j, &step);
-      swig::delslice(self, i,j);
+      PySlice_GetIndices(SWIGPY_SLICE_ARG(slice), (Py_ssize_t)self->size(), &i, &j, &step);
+      std::vector< llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >::difference_type id = i;
+      std::vector< llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >::difference_type jd = j;
+      swig::delslice(self, id, jd, step);
     }
 SWIGINTERN void std_vector_Sl_llvm_BasicBlock_Sm__Sg____delitem____SWIG_1(std::vector< llvm::BasicBlock * > *self,PySliceObject *slice){
       Py_ssize_t i, j, step;
@@ -5124,8 +5605,10 @@ SWIGINTERN void std_vector_Sl_llvm_BasicBlock_Sm__Sg____delitem____SWIG_1(std::v
         SWIG_Error(SWIG_TypeError, "Slice object expected.");
         return;
       }
-      PySlice_GetIndices(SWIGPY_SLICE_ARG(slice), self->size(), &i, &j, &step);
-      swig::delslice(self, i,j);
+      PySlice_GetIndices(SWIGPY_SLICE_ARG(slice), (Py_ssize_t)self->size(), &i, &j, &step);
+      std::vector< llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >::difference_type id = i;
+      std::vector< llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >::difference_type jd = j;
+      swig::delslice(self, id, jd, step);
     }
 SWIGINTERN std::vector< llvm::BasicBlock * >::value_type std_vector_Sl_llvm_BasicBlock_Sm__Sg____getitem____SWIG_1(std::vector< llvm::BasicBlock * > *self,std::vector< llvm::BasicBlock * >::difference_type i){
       return *(swig::cgetpos(self, i));
@@ -5133,9 +5616,20 @@ SWIGINTERN std::vector< llvm::BasicBlock * >::value_type std_vector_Sl_llvm_Basi
 SWIGINTERN void std_vector_Sl_llvm_BasicBlock_Sm__Sg____setitem____SWIG_2(std::vector< llvm::BasicBlock * > *self,std::vector< llvm::BasicBlock * >::difference_type i,std::vector< llvm::BasicBlock * >::value_type x){
       *(swig::getpos(self,i)) = x;
     }
+SWIGINTERN std::vector< llvm::BasicBlock * >::value_type std_vector_Sl_llvm_BasicBlock_Sm__Sg__pop(std::vector< llvm::BasicBlock * > *self){
+      if (self->size() == 0)
+	throw std::out_of_range("pop from empty container");
+      std::vector< llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >::value_type x = self->back();
+      self->pop_back();
+      return x;
+    }
 SWIGINTERN void std_vector_Sl_llvm_BasicBlock_Sm__Sg__append(std::vector< llvm::BasicBlock * > *self,std::vector< llvm::BasicBlock * >::value_type x){
       self->push_back(x);
     }
+SWIGINTERN std::vector< llvm::BasicBlock * >::iterator std_vector_Sl_llvm_BasicBlock_Sm__Sg__erase__SWIG_0(std::vector< llvm::BasicBlock * > *self,std::vector< llvm::BasicBlock * >::iterator pos){ return self->erase(pos); }
+SWIGINTERN std::vector< llvm::BasicBlock * >::iterator std_vector_Sl_llvm_BasicBlock_Sm__Sg__erase__SWIG_1(std::vector< llvm::BasicBlock * > *self,std::vector< llvm::BasicBlock * >::iterator first,std::vector< llvm::BasicBlock * >::iterator last){ return self->erase(first, last); }
+SWIGINTERN std::vector< llvm::BasicBlock * >::iterator std_vector_Sl_llvm_BasicBlock_Sm__Sg__insert__SWIG_0(std::vector< llvm::BasicBlock * > *self,std::vector< llvm::BasicBlock * >::iterator pos,std::vector< llvm::BasicBlock * >::value_type x){ return self->insert(pos, x); }
+SWIGINTERN void std_vector_Sl_llvm_BasicBlock_Sm__Sg__insert__SWIG_1(std::vector< llvm::BasicBlock * > *self,std::vector< llvm::BasicBlock * >::iterator pos,std::vector< llvm::BasicBlock * >::size_type n,std::vector< llvm::BasicBlock * >::value_type x){ self->insert(pos, n, x); }
 
 SWIGINTERN int
 SWIG_AsVal_unsigned_SS_int (PyObject * obj, unsigned int *val)
@@ -5153,63 +5647,30 @@ SWIG_AsVal_unsigned_SS_int (PyObject * obj, unsigned int *val)
 }
 
 
+SWIGINTERNINLINE PyObject * 
+SWIG_FromCharPtr(const char *cptr)
+{ 
+  return SWIG_FromCharPtrAndSize(cptr, (cptr ? strlen(cptr) : 0));
+}
+
+
+
+
+
+SWIGINTERNINLINE PyObject*
+  SWIG_From_unsigned_SS_int  (unsigned int value)
+{
+  return PyInt_FromSize_t((size_t) value);
+}
+
+
 SWIGINTERN int
-SWIG_AsVal_unsigned_SS_long_SS_long (PyObject *obj, unsigned long long *val)
+SWIG_AsVal_bool (PyObject *obj, bool *val)
 {
-  int res = SWIG_TypeError;
-  if (PyLong_Check(obj)) {
-    unsigned long long v = PyLong_AsUnsignedLongLong(obj);
-    if (!PyErr_Occurred()) {
-      if (val) *val = v;
-      return SWIG_OK;
-    } else {
-      PyErr_Clear();
-    }
-  } else {
-    unsigned long v;
-    res = SWIG_AsVal_unsigned_SS_long (obj,&v);
-    if (SWIG_IsOK(res)) {
-      if (val) *val = v;
-      return res;
-    }
-  }
-#ifdef SWIG_PYTHON_CAST_MODE
-  {
-    const double mant_max = 1LL << DBL_MANT_DIG;
-    double d;
-    res = SWIG_AsVal_double (obj,&d);
-    if (SWIG_IsOK(res) && SWIG_CanCastAsInteger(&d, 0, mant_max)) {
-      if (val) *val = (unsigned long long)(d);
-      return SWIG_AddCast(res);
-    }
-    res = SWIG_TypeError;
-  }
-#endif
-  return res;
-}
-
-
-SWIGINTERNINLINE PyObject * 
-SWIG_FromCharPtr(const char *cptr)
-{ 
-  return SWIG_FromCharPtrAndSize(cptr, (cptr ? strlen(cptr) : 0));
-}
-
-
-
-
-
-SWIGINTERNINLINE PyObject *
-SWIG_From_unsigned_SS_int  (unsigned int value)
-{    
-  return SWIG_From_unsigned_SS_long  (value);
-}
-
-
-SWIGINTERN int
-SWIG_AsVal_bool (PyObject *obj, bool *val)
-{
-  int r = PyObject_IsTrue(obj);
+  int r;
+  if (!PyBool_Check(obj))
+    return SWIG_ERROR;
+  r = PyObject_IsTrue(obj);
   if (r == -1)
     return SWIG_ERROR;
   if (val) *val = r ? true : false;
@@ -5346,12 +5807,14 @@ fail:
 
 
 SWIGINTERN PyObject *_wrap_SwigPyIterator_incr(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[3];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[3] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 2) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
@@ -5463,12 +5926,14 @@ fail:
 
 
 SWIGINTERN PyObject *_wrap_SwigPyIterator_decr(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[3];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[3] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 2) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
@@ -6012,12 +6477,14 @@ fail:
 
 
 SWIGINTERN PyObject *_wrap_SwigPyIterator___sub__(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[3];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[3] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 2) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
@@ -6058,7 +6525,7 @@ fail:
 
 SWIGINTERN PyObject *SwigPyIterator_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *obj;
-  if (!PyArg_ParseTuple(args,(char*)"O:swigregister", &obj)) return NULL;
+  if (!PyArg_ParseTuple(args,(char *)"O:swigregister", &obj)) return NULL;
   SWIG_TypeNewClientData(SWIGTYPE_p_swig__SwigPyIterator, SWIG_NewClientData(obj));
   return SWIG_Py_Void();
 }
@@ -6153,34 +6620,6 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_ArrayString_pop(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *resultobj = 0;
-  std::vector< std::string > *arg1 = (std::vector< std::string > *) 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  PyObject * obj0 = 0 ;
-  std::vector< std::string >::value_type result;
-  
-  if (!PyArg_ParseTuple(args,(char *)"O:ArrayString_pop",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_std__string_std__allocatorT_std__string_t_t, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ArrayString_pop" "', argument " "1"" of type '" "std::vector< std::string > *""'"); 
-  }
-  arg1 = reinterpret_cast< std::vector< std::string > * >(argp1);
-  try {
-    result = std_vector_Sl_std_string_Sg__pop(arg1);
-  }
-  catch(std::out_of_range &_e) {
-    SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
-  }
-  
-  resultobj = SWIG_From_std_string(static_cast< std::string >(result));
-  return resultobj;
-fail:
-  return NULL;
-}
-
-
 SWIGINTERN PyObject *_wrap_ArrayString___getslice__(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   std::vector< std::string > *arg1 = (std::vector< std::string > *) 0 ;
@@ -6219,6 +6658,9 @@ SWIGINTERN PyObject *_wrap_ArrayString___getslice__(PyObject *SWIGUNUSEDPARM(sel
   catch(std::out_of_range &_e) {
     SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
   }
+  catch(std::invalid_argument &_e) {
+    SWIG_exception_fail(SWIG_ValueError, (&_e)->what());
+  }
   
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_std__vectorT_std__string_std__allocatorT_std__string_t_t, SWIG_POINTER_OWN |  0 );
   return resultobj;
@@ -6232,20 +6674,17 @@ SWIGINTERN PyObject *_wrap_ArrayString___setslice____SWIG_0(PyObject *SWIGUNUSED
   std::vector< std::string > *arg1 = (std::vector< std::string > *) 0 ;
   std::vector< std::string >::difference_type arg2 ;
   std::vector< std::string >::difference_type arg3 ;
-  std::vector< std::string,std::allocator< std::string > > *arg4 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   ptrdiff_t val2 ;
   int ecode2 = 0 ;
   ptrdiff_t val3 ;
   int ecode3 = 0 ;
-  int res4 = SWIG_OLDOBJ ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
-  PyObject * obj3 = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:ArrayString___setslice__",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOO:ArrayString___setslice__",&obj0,&obj1,&obj2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_std__string_std__allocatorT_std__string_t_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ArrayString___setslice__" "', argument " "1"" of type '" "std::vector< std::string > *""'"); 
@@ -6261,19 +6700,8 @@ SWIGINTERN PyObject *_wrap_ArrayString___setslice____SWIG_0(PyObject *SWIGUNUSED
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "ArrayString___setslice__" "', argument " "3"" of type '" "std::vector< std::string >::difference_type""'");
   } 
   arg3 = static_cast< std::vector< std::string >::difference_type >(val3);
-  {
-    std::vector<std::string,std::allocator< std::string > > *ptr = (std::vector<std::string,std::allocator< std::string > > *)0;
-    res4 = swig::asptr(obj3, &ptr);
-    if (!SWIG_IsOK(res4)) {
-      SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "ArrayString___setslice__" "', argument " "4"" of type '" "std::vector< std::string,std::allocator< std::string > > const &""'"); 
-    }
-    if (!ptr) {
-      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "ArrayString___setslice__" "', argument " "4"" of type '" "std::vector< std::string,std::allocator< std::string > > const &""'"); 
-    }
-    arg4 = ptr;
-  }
   try {
-    std_vector_Sl_std_string_Sg____setslice____SWIG_0(arg1,arg2,arg3,(std::vector< std::string,std::allocator< std::string > > const &)*arg4);
+    std_vector_Sl_std_string_Sg____setslice____SWIG_0(arg1,arg2,arg3);
   }
   catch(std::out_of_range &_e) {
     SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
@@ -6283,10 +6711,8 @@ SWIGINTERN PyObject *_wrap_ArrayString___setslice____SWIG_0(PyObject *SWIGUNUSED
   }
   
   resultobj = SWIG_Py_Void();
-  if (SWIG_IsNewObj(res4)) delete arg4;
   return resultobj;
 fail:
-  if (SWIG_IsNewObj(res4)) delete arg4;
   return NULL;
 }
 
@@ -6296,17 +6722,20 @@ SWIGINTERN PyObject *_wrap_ArrayString___setslice____SWIG_1(PyObject *SWIGUNUSED
   std::vector< std::string > *arg1 = (std::vector< std::string > *) 0 ;
   std::vector< std::string >::difference_type arg2 ;
   std::vector< std::string >::difference_type arg3 ;
+  std::vector< std::string,std::allocator< std::string > > *arg4 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   ptrdiff_t val2 ;
   int ecode2 = 0 ;
   ptrdiff_t val3 ;
   int ecode3 = 0 ;
+  int res4 = SWIG_OLDOBJ ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
+  PyObject * obj3 = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:ArrayString___setslice__",&obj0,&obj1,&obj2)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:ArrayString___setslice__",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_std__string_std__allocatorT_std__string_t_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ArrayString___setslice__" "', argument " "1"" of type '" "std::vector< std::string > *""'"); 
@@ -6322,8 +6751,19 @@ SWIGINTERN PyObject *_wrap_ArrayString___setslice____SWIG_1(PyObject *SWIGUNUSED
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "ArrayString___setslice__" "', argument " "3"" of type '" "std::vector< std::string >::difference_type""'");
   } 
   arg3 = static_cast< std::vector< std::string >::difference_type >(val3);
+  {
+    std::vector< std::string,std::allocator< std::string > > *ptr = (std::vector< std::string,std::allocator< std::string > > *)0;
+    res4 = swig::asptr(obj3, &ptr);
+    if (!SWIG_IsOK(res4)) {
+      SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "ArrayString___setslice__" "', argument " "4"" of type '" "std::vector< std::string,std::allocator< std::string > > const &""'"); 
+    }
+    if (!ptr) {
+      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "ArrayString___setslice__" "', argument " "4"" of type '" "std::vector< std::string,std::allocator< std::string > > const &""'"); 
+    }
+    arg4 = ptr;
+  }
   try {
-    std_vector_Sl_std_string_Sg____setslice____SWIG_0(arg1,arg2,arg3);
+    std_vector_Sl_std_string_Sg____setslice____SWIG_1(arg1,arg2,arg3,(std::vector< std::string,std::allocator< std::string > > const &)*arg4);
   }
   catch(std::out_of_range &_e) {
     SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
@@ -6333,25 +6773,29 @@ SWIGINTERN PyObject *_wrap_ArrayString___setslice____SWIG_1(PyObject *SWIGUNUSED
   }
   
   resultobj = SWIG_Py_Void();
+  if (SWIG_IsNewObj(res4)) delete arg4;
   return resultobj;
 fail:
+  if (SWIG_IsNewObj(res4)) delete arg4;
   return NULL;
 }
 
 
 SWIGINTERN PyObject *_wrap_ArrayString___setslice__(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[5];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 4) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
   if (argc == 3) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<std::string,std::allocator< std::string > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< std::string,std::allocator< std::string > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -6364,14 +6808,14 @@ SWIGINTERN PyObject *_wrap_ArrayString___setslice__(PyObject *self, PyObject *ar
           _v = SWIG_CheckState(res);
         }
         if (_v) {
-          return _wrap_ArrayString___setslice____SWIG_1(self, args);
+          return _wrap_ArrayString___setslice____SWIG_0(self, args);
         }
       }
     }
   }
   if (argc == 4) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<std::string,std::allocator< std::string > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< std::string,std::allocator< std::string > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -6384,10 +6828,10 @@ SWIGINTERN PyObject *_wrap_ArrayString___setslice__(PyObject *self, PyObject *ar
           _v = SWIG_CheckState(res);
         }
         if (_v) {
-          int res = swig::asptr(argv[3], (std::vector<std::string,std::allocator< std::string > >**)(0));
+          int res = swig::asptr(argv[3], (std::vector< std::string,std::allocator< std::string > >**)(0));
           _v = SWIG_CheckState(res);
           if (_v) {
-            return _wrap_ArrayString___setslice____SWIG_0(self, args);
+            return _wrap_ArrayString___setslice____SWIG_1(self, args);
           }
         }
       }
@@ -6397,8 +6841,8 @@ SWIGINTERN PyObject *_wrap_ArrayString___setslice__(PyObject *self, PyObject *ar
 fail:
   SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'ArrayString___setslice__'.\n"
     "  Possible C/C++ prototypes are:\n"
-    "    std::vector< std::string >::__setslice__(std::vector< std::string >::difference_type,std::vector< std::string >::difference_type,std::vector< std::string,std::allocator< std::string > > const &)\n"
-    "    std::vector< std::string >::__setslice__(std::vector< std::string >::difference_type,std::vector< std::string >::difference_type)\n");
+    "    std::vector< std::string >::__setslice__(std::vector< std::string >::difference_type,std::vector< std::string >::difference_type)\n"
+    "    std::vector< std::string >::__setslice__(std::vector< std::string >::difference_type,std::vector< std::string >::difference_type,std::vector< std::string,std::allocator< std::string > > const &)\n");
   return 0;
 }
 
@@ -6440,6 +6884,9 @@ SWIGINTERN PyObject *_wrap_ArrayString___delslice__(PyObject *SWIGUNUSEDPARM(sel
   catch(std::out_of_range &_e) {
     SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
   }
+  catch(std::invalid_argument &_e) {
+    SWIG_exception_fail(SWIG_ValueError, (&_e)->what());
+  }
   
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -6476,6 +6923,9 @@ SWIGINTERN PyObject *_wrap_ArrayString___delitem____SWIG_0(PyObject *SWIGUNUSEDP
   catch(std::out_of_range &_e) {
     SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
   }
+  catch(std::invalid_argument &_e) {
+    SWIG_exception_fail(SWIG_ValueError, (&_e)->what());
+  }
   
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -6512,8 +6962,11 @@ SWIGINTERN PyObject *_wrap_ArrayString___getitem____SWIG_0(PyObject *SWIGUNUSEDP
   catch(std::out_of_range &_e) {
     SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
   }
+  catch(std::invalid_argument &_e) {
+    SWIG_exception_fail(SWIG_ValueError, (&_e)->what());
+  }
   
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_std__vectorT_std__string_std__allocatorT_std__string_t_t, 0 |  0 );
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_std__vectorT_std__string_std__allocatorT_std__string_t_t, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
   return NULL;
@@ -6545,7 +6998,7 @@ SWIGINTERN PyObject *_wrap_ArrayString___setitem____SWIG_0(PyObject *SWIGUNUSEDP
     arg2 = (PySliceObject *) obj1;
   }
   {
-    std::vector<std::string,std::allocator< std::string > > *ptr = (std::vector<std::string,std::allocator< std::string > > *)0;
+    std::vector< std::string,std::allocator< std::string > > *ptr = (std::vector< std::string,std::allocator< std::string > > *)0;
     res3 = swig::asptr(obj2, &ptr);
     if (!SWIG_IsOK(res3)) {
       SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "ArrayString___setitem__" "', argument " "3"" of type '" "std::vector< std::string,std::allocator< std::string > > const &""'"); 
@@ -6601,6 +7054,9 @@ SWIGINTERN PyObject *_wrap_ArrayString___setitem____SWIG_1(PyObject *SWIGUNUSEDP
   catch(std::out_of_range &_e) {
     SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
   }
+  catch(std::invalid_argument &_e) {
+    SWIG_exception_fail(SWIG_ValueError, (&_e)->what());
+  }
   
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -6636,6 +7092,9 @@ SWIGINTERN PyObject *_wrap_ArrayString___delitem____SWIG_1(PyObject *SWIGUNUSEDP
   catch(std::out_of_range &_e) {
     SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
   }
+  catch(std::invalid_argument &_e) {
+    SWIG_exception_fail(SWIG_ValueError, (&_e)->what());
+  }
   
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -6645,18 +7104,20 @@ fail:
 
 
 SWIGINTERN PyObject *_wrap_ArrayString___delitem__(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[3];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[3] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 2) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
   if (argc == 2) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<std::string,std::allocator< std::string > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< std::string,std::allocator< std::string > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -6669,7 +7130,7 @@ SWIGINTERN PyObject *_wrap_ArrayString___delitem__(PyObject *self, PyObject *arg
   }
   if (argc == 2) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<std::string,std::allocator< std::string > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< std::string,std::allocator< std::string > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -6729,18 +7190,20 @@ fail:
 
 
 SWIGINTERN PyObject *_wrap_ArrayString___getitem__(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[3];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[3] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 2) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
   if (argc == 2) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<std::string,std::allocator< std::string > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< std::string,std::allocator< std::string > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -6753,7 +7216,7 @@ SWIGINTERN PyObject *_wrap_ArrayString___getitem__(PyObject *self, PyObject *arg
   }
   if (argc == 2) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<std::string,std::allocator< std::string > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< std::string,std::allocator< std::string > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -6828,18 +7291,20 @@ fail:
 
 
 SWIGINTERN PyObject *_wrap_ArrayString___setitem__(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[4];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[4] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 3) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
   if (argc == 2) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<std::string,std::allocator< std::string > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< std::string,std::allocator< std::string > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -6852,14 +7317,14 @@ SWIGINTERN PyObject *_wrap_ArrayString___setitem__(PyObject *self, PyObject *arg
   }
   if (argc == 3) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<std::string,std::allocator< std::string > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< std::string,std::allocator< std::string > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
         _v = PySlice_Check(argv[1]);
       }
       if (_v) {
-        int res = swig::asptr(argv[2], (std::vector<std::string,std::allocator< std::string > >**)(0));
+        int res = swig::asptr(argv[2], (std::vector< std::string,std::allocator< std::string > >**)(0));
         _v = SWIG_CheckState(res);
         if (_v) {
           return _wrap_ArrayString___setitem____SWIG_0(self, args);
@@ -6869,7 +7334,7 @@ SWIGINTERN PyObject *_wrap_ArrayString___setitem__(PyObject *self, PyObject *arg
   }
   if (argc == 3) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<std::string,std::allocator< std::string > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< std::string,std::allocator< std::string > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -6896,6 +7361,34 @@ fail:
 }
 
 
+SWIGINTERN PyObject *_wrap_ArrayString_pop(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  std::vector< std::string > *arg1 = (std::vector< std::string > *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  std::vector< std::string >::value_type result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:ArrayString_pop",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_std__string_std__allocatorT_std__string_t_t, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ArrayString_pop" "', argument " "1"" of type '" "std::vector< std::string > *""'"); 
+  }
+  arg1 = reinterpret_cast< std::vector< std::string > * >(argp1);
+  try {
+    result = std_vector_Sl_std_string_Sg__pop(arg1);
+  }
+  catch(std::out_of_range &_e) {
+    SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
+  }
+  
+  resultobj = SWIG_From_std_string(static_cast< std::string >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
 SWIGINTERN PyObject *_wrap_ArrayString_append(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   std::vector< std::string > *arg1 = (std::vector< std::string > *) 0 ;
@@ -6955,7 +7448,7 @@ SWIGINTERN PyObject *_wrap_new_ArrayString__SWIG_1(PyObject *SWIGUNUSEDPARM(self
   
   if (!PyArg_ParseTuple(args,(char *)"O:new_ArrayString",&obj0)) SWIG_fail;
   {
-    std::vector<std::string,std::allocator< std::string > > *ptr = (std::vector<std::string,std::allocator< std::string > > *)0;
+    std::vector< std::string,std::allocator< std::string > > *ptr = (std::vector< std::string,std::allocator< std::string > > *)0;
     res1 = swig::asptr(obj0, &ptr);
     if (!SWIG_IsOK(res1)) {
       SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "new_ArrayString" "', argument " "1"" of type '" "std::vector< std::string > const &""'"); 
@@ -7019,27 +7512,6 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_ArrayString_clear(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *resultobj = 0;
-  std::vector< std::string > *arg1 = (std::vector< std::string > *) 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  PyObject * obj0 = 0 ;
-  
-  if (!PyArg_ParseTuple(args,(char *)"O:ArrayString_clear",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_std__string_std__allocatorT_std__string_t_t, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ArrayString_clear" "', argument " "1"" of type '" "std::vector< std::string > *""'"); 
-  }
-  arg1 = reinterpret_cast< std::vector< std::string > * >(argp1);
-  (arg1)->clear();
-  resultobj = SWIG_Py_Void();
-  return resultobj;
-fail:
-  return NULL;
-}
-
-
 SWIGINTERN PyObject *_wrap_ArrayString_swap(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   std::vector< std::string > *arg1 = (std::vector< std::string > *) 0 ;
@@ -7073,28 +7545,6 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_ArrayString_get_allocator(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *resultobj = 0;
-  std::vector< std::string > *arg1 = (std::vector< std::string > *) 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  PyObject * obj0 = 0 ;
-  SwigValueWrapper< std::allocator< std::string > > result;
-  
-  if (!PyArg_ParseTuple(args,(char *)"O:ArrayString_get_allocator",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_std__string_std__allocatorT_std__string_t_t, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ArrayString_get_allocator" "', argument " "1"" of type '" "std::vector< std::string > const *""'"); 
-  }
-  arg1 = reinterpret_cast< std::vector< std::string > * >(argp1);
-  result = ((std::vector< std::string > const *)arg1)->get_allocator();
-  resultobj = SWIG_NewPointerObj((new std::vector< std::string >::allocator_type(static_cast< const std::vector< std::string >::allocator_type& >(result))), SWIGTYPE_p_std__allocatorT_std__string_t, SWIG_POINTER_OWN |  0 );
-  return resultobj;
-fail:
-  return NULL;
-}
-
-
 SWIGINTERN PyObject *_wrap_ArrayString_begin(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   std::vector< std::string > *arg1 = (std::vector< std::string > *) 0 ;
@@ -7187,6 +7637,49 @@ fail:
 }
 
 
+SWIGINTERN PyObject *_wrap_ArrayString_clear(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  std::vector< std::string > *arg1 = (std::vector< std::string > *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:ArrayString_clear",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_std__string_std__allocatorT_std__string_t_t, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ArrayString_clear" "', argument " "1"" of type '" "std::vector< std::string > *""'"); 
+  }
+  arg1 = reinterpret_cast< std::vector< std::string > * >(argp1);
+  (arg1)->clear();
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_ArrayString_get_allocator(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  std::vector< std::string > *arg1 = (std::vector< std::string > *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  SwigValueWrapper< std::allocator< std::string > > result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:ArrayString_get_allocator",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_std__string_std__allocatorT_std__string_t_t, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ArrayString_get_allocator" "', argument " "1"" of type '" "std::vector< std::string > const *""'"); 
+  }
+  arg1 = reinterpret_cast< std::vector< std::string > * >(argp1);
+  result = ((std::vector< std::string > const *)arg1)->get_allocator();
+  resultobj = SWIG_NewPointerObj((new std::vector< std::string >::allocator_type(static_cast< const std::vector< std::string >::allocator_type& >(result))), SWIGTYPE_p_std__allocatorT_std__string_t, SWIG_POINTER_OWN |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
 SWIGINTERN PyObject *_wrap_new_ArrayString__SWIG_2(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   std::vector< std::string >::size_type arg1 ;
@@ -7289,7 +7782,7 @@ SWIGINTERN PyObject *_wrap_ArrayString_erase__SWIG_0(PyObject *SWIGUNUSEDPARM(se
       SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "ArrayString_erase" "', argument " "2"" of type '" "std::vector< std::string >::iterator""'");
     }
   }
-  result = (arg1)->erase(arg2);
+  result = std_vector_Sl_std_string_Sg__erase__SWIG_0(arg1,arg2);
   resultobj = SWIG_NewPointerObj(swig::make_output_iterator(static_cast< const std::vector< std::string >::iterator & >(result)),
     swig::SwigPyIterator::descriptor(),SWIG_POINTER_OWN);
   return resultobj;
@@ -7342,7 +7835,7 @@ SWIGINTERN PyObject *_wrap_ArrayString_erase__SWIG_1(PyObject *SWIGUNUSEDPARM(se
       SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "ArrayString_erase" "', argument " "3"" of type '" "std::vector< std::string >::iterator""'");
     }
   }
-  result = (arg1)->erase(arg2,arg3);
+  result = std_vector_Sl_std_string_Sg__erase__SWIG_1(arg1,arg2,arg3);
   resultobj = SWIG_NewPointerObj(swig::make_output_iterator(static_cast< const std::vector< std::string >::iterator & >(result)),
     swig::SwigPyIterator::descriptor(),SWIG_POINTER_OWN);
   return resultobj;
@@ -7352,18 +7845,20 @@ fail:
 
 
 SWIGINTERN PyObject *_wrap_ArrayString_erase(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[4];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[4] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 3) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
   if (argc == 2) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<std::string,std::allocator< std::string > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< std::string,std::allocator< std::string > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       swig::SwigPyIterator *iter = 0;
@@ -7376,7 +7871,7 @@ SWIGINTERN PyObject *_wrap_ArrayString_erase(PyObject *self, PyObject *args) {
   }
   if (argc == 3) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<std::string,std::allocator< std::string > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< std::string,std::allocator< std::string > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       swig::SwigPyIterator *iter = 0;
@@ -7441,12 +7936,14 @@ fail:
 
 
 SWIGINTERN PyObject *_wrap_new_ArrayString(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[3];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[3] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 2) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
@@ -7465,7 +7962,7 @@ SWIGINTERN PyObject *_wrap_new_ArrayString(PyObject *self, PyObject *args) {
   }
   if (argc == 1) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<std::string,std::allocator< std::string > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< std::string,std::allocator< std::string > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       return _wrap_new_ArrayString__SWIG_1(self, args);
@@ -7671,18 +8168,20 @@ fail:
 
 
 SWIGINTERN PyObject *_wrap_ArrayString_resize(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[4];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[4] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 3) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
   if (argc == 2) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<std::string,std::allocator< std::string > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< std::string,std::allocator< std::string > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -7696,7 +8195,7 @@ SWIGINTERN PyObject *_wrap_ArrayString_resize(PyObject *self, PyObject *args) {
   }
   if (argc == 3) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<std::string,std::allocator< std::string > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< std::string,std::allocator< std::string > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -7765,7 +8264,7 @@ SWIGINTERN PyObject *_wrap_ArrayString_insert__SWIG_0(PyObject *SWIGUNUSEDPARM(s
     }
     arg3 = ptr;
   }
-  result = (arg1)->insert(arg2,(std::vector< std::string >::value_type const &)*arg3);
+  result = std_vector_Sl_std_string_Sg__insert__SWIG_0(arg1,arg2,(std::string const &)*arg3);
   resultobj = SWIG_NewPointerObj(swig::make_output_iterator(static_cast< const std::vector< std::string >::iterator & >(result)),
     swig::SwigPyIterator::descriptor(),SWIG_POINTER_OWN);
   if (SWIG_IsNewObj(res3)) delete arg3;
@@ -7827,7 +8326,7 @@ SWIGINTERN PyObject *_wrap_ArrayString_insert__SWIG_1(PyObject *SWIGUNUSEDPARM(s
     }
     arg4 = ptr;
   }
-  (arg1)->insert(arg2,arg3,(std::vector< std::string >::value_type const &)*arg4);
+  std_vector_Sl_std_string_Sg__insert__SWIG_1(arg1,arg2,arg3,(std::string const &)*arg4);
   resultobj = SWIG_Py_Void();
   if (SWIG_IsNewObj(res4)) delete arg4;
   return resultobj;
@@ -7838,18 +8337,20 @@ fail:
 
 
 SWIGINTERN PyObject *_wrap_ArrayString_insert(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[5];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 4) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
   if (argc == 3) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<std::string,std::allocator< std::string > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< std::string,std::allocator< std::string > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       swig::SwigPyIterator *iter = 0;
@@ -7866,7 +8367,7 @@ SWIGINTERN PyObject *_wrap_ArrayString_insert(PyObject *self, PyObject *args) {
   }
   if (argc == 4) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<std::string,std::allocator< std::string > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< std::string,std::allocator< std::string > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       swig::SwigPyIterator *iter = 0;
@@ -7972,7 +8473,7 @@ fail:
 
 SWIGINTERN PyObject *ArrayString_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *obj;
-  if (!PyArg_ParseTuple(args,(char*)"O:swigregister", &obj)) return NULL;
+  if (!PyArg_ParseTuple(args,(char *)"O:swigregister", &obj)) return NULL;
   SWIG_TypeNewClientData(SWIGTYPE_p_std__vectorT_std__string_std__allocatorT_std__string_t_t, SWIG_NewClientData(obj));
   return SWIG_Py_Void();
 }
@@ -8067,35 +8568,7 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_ArrayInt_pop(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *resultobj = 0;
-  std::vector< int > *arg1 = (std::vector< int > *) 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  PyObject * obj0 = 0 ;
-  std::vector< int >::value_type result;
-  
-  if (!PyArg_ParseTuple(args,(char *)"O:ArrayInt_pop",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_int_std__allocatorT_int_t_t, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ArrayInt_pop" "', argument " "1"" of type '" "std::vector< int > *""'"); 
-  }
-  arg1 = reinterpret_cast< std::vector< int > * >(argp1);
-  try {
-    result = (std::vector< int >::value_type)std_vector_Sl_int_Sg__pop(arg1);
-  }
-  catch(std::out_of_range &_e) {
-    SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
-  }
-  
-  resultobj = SWIG_From_int(static_cast< int >(result));
-  return resultobj;
-fail:
-  return NULL;
-}
-
-
-SWIGINTERN PyObject *_wrap_ArrayInt___getslice__(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_ArrayInt___getslice__(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   std::vector< int > *arg1 = (std::vector< int > *) 0 ;
   std::vector< int >::difference_type arg2 ;
@@ -8133,6 +8606,9 @@ SWIGINTERN PyObject *_wrap_ArrayInt___getslice__(PyObject *SWIGUNUSEDPARM(self),
   catch(std::out_of_range &_e) {
     SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
   }
+  catch(std::invalid_argument &_e) {
+    SWIG_exception_fail(SWIG_ValueError, (&_e)->what());
+  }
   
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_std__vectorT_int_std__allocatorT_int_t_t, SWIG_POINTER_OWN |  0 );
   return resultobj;
@@ -8146,20 +8622,17 @@ SWIGINTERN PyObject *_wrap_ArrayInt___setslice____SWIG_0(PyObject *SWIGUNUSEDPAR
   std::vector< int > *arg1 = (std::vector< int > *) 0 ;
   std::vector< int >::difference_type arg2 ;
   std::vector< int >::difference_type arg3 ;
-  std::vector< int,std::allocator< int > > *arg4 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   ptrdiff_t val2 ;
   int ecode2 = 0 ;
   ptrdiff_t val3 ;
   int ecode3 = 0 ;
-  int res4 = SWIG_OLDOBJ ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
-  PyObject * obj3 = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:ArrayInt___setslice__",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOO:ArrayInt___setslice__",&obj0,&obj1,&obj2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_int_std__allocatorT_int_t_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ArrayInt___setslice__" "', argument " "1"" of type '" "std::vector< int > *""'"); 
@@ -8175,19 +8648,8 @@ SWIGINTERN PyObject *_wrap_ArrayInt___setslice____SWIG_0(PyObject *SWIGUNUSEDPAR
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "ArrayInt___setslice__" "', argument " "3"" of type '" "std::vector< int >::difference_type""'");
   } 
   arg3 = static_cast< std::vector< int >::difference_type >(val3);
-  {
-    std::vector<int,std::allocator< int > > *ptr = (std::vector<int,std::allocator< int > > *)0;
-    res4 = swig::asptr(obj3, &ptr);
-    if (!SWIG_IsOK(res4)) {
-      SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "ArrayInt___setslice__" "', argument " "4"" of type '" "std::vector< int,std::allocator< int > > const &""'"); 
-    }
-    if (!ptr) {
-      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "ArrayInt___setslice__" "', argument " "4"" of type '" "std::vector< int,std::allocator< int > > const &""'"); 
-    }
-    arg4 = ptr;
-  }
   try {
-    std_vector_Sl_int_Sg____setslice____SWIG_0(arg1,arg2,arg3,(std::vector< int,std::allocator< int > > const &)*arg4);
+    std_vector_Sl_int_Sg____setslice____SWIG_0(arg1,arg2,arg3);
   }
   catch(std::out_of_range &_e) {
     SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
@@ -8197,10 +8659,8 @@ SWIGINTERN PyObject *_wrap_ArrayInt___setslice____SWIG_0(PyObject *SWIGUNUSEDPAR
   }
   
   resultobj = SWIG_Py_Void();
-  if (SWIG_IsNewObj(res4)) delete arg4;
   return resultobj;
 fail:
-  if (SWIG_IsNewObj(res4)) delete arg4;
   return NULL;
 }
 
@@ -8210,17 +8670,20 @@ SWIGINTERN PyObject *_wrap_ArrayInt___setslice____SWIG_1(PyObject *SWIGUNUSEDPAR
   std::vector< int > *arg1 = (std::vector< int > *) 0 ;
   std::vector< int >::difference_type arg2 ;
   std::vector< int >::difference_type arg3 ;
+  std::vector< int,std::allocator< int > > *arg4 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   ptrdiff_t val2 ;
   int ecode2 = 0 ;
   ptrdiff_t val3 ;
   int ecode3 = 0 ;
+  int res4 = SWIG_OLDOBJ ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
+  PyObject * obj3 = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:ArrayInt___setslice__",&obj0,&obj1,&obj2)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:ArrayInt___setslice__",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_int_std__allocatorT_int_t_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ArrayInt___setslice__" "', argument " "1"" of type '" "std::vector< int > *""'"); 
@@ -8236,8 +8699,19 @@ SWIGINTERN PyObject *_wrap_ArrayInt___setslice____SWIG_1(PyObject *SWIGUNUSEDPAR
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "ArrayInt___setslice__" "', argument " "3"" of type '" "std::vector< int >::difference_type""'");
   } 
   arg3 = static_cast< std::vector< int >::difference_type >(val3);
+  {
+    std::vector< int,std::allocator< int > > *ptr = (std::vector< int,std::allocator< int > > *)0;
+    res4 = swig::asptr(obj3, &ptr);
+    if (!SWIG_IsOK(res4)) {
+      SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "ArrayInt___setslice__" "', argument " "4"" of type '" "std::vector< int,std::allocator< int > > const &""'"); 
+    }
+    if (!ptr) {
+      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "ArrayInt___setslice__" "', argument " "4"" of type '" "std::vector< int,std::allocator< int > > const &""'"); 
+    }
+    arg4 = ptr;
+  }
   try {
-    std_vector_Sl_int_Sg____setslice____SWIG_0(arg1,arg2,arg3);
+    std_vector_Sl_int_Sg____setslice____SWIG_1(arg1,arg2,arg3,(std::vector< int,std::allocator< int > > const &)*arg4);
   }
   catch(std::out_of_range &_e) {
     SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
@@ -8247,25 +8721,29 @@ SWIGINTERN PyObject *_wrap_ArrayInt___setslice____SWIG_1(PyObject *SWIGUNUSEDPAR
   }
   
   resultobj = SWIG_Py_Void();
+  if (SWIG_IsNewObj(res4)) delete arg4;
   return resultobj;
 fail:
+  if (SWIG_IsNewObj(res4)) delete arg4;
   return NULL;
 }
 
 
 SWIGINTERN PyObject *_wrap_ArrayInt___setslice__(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[5];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 4) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
   if (argc == 3) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<int,std::allocator< int > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< int,std::allocator< int > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -8278,14 +8756,14 @@ SWIGINTERN PyObject *_wrap_ArrayInt___setslice__(PyObject *self, PyObject *args)
           _v = SWIG_CheckState(res);
         }
         if (_v) {
-          return _wrap_ArrayInt___setslice____SWIG_1(self, args);
+          return _wrap_ArrayInt___setslice____SWIG_0(self, args);
         }
       }
     }
   }
   if (argc == 4) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<int,std::allocator< int > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< int,std::allocator< int > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -8298,10 +8776,10 @@ SWIGINTERN PyObject *_wrap_ArrayInt___setslice__(PyObject *self, PyObject *args)
           _v = SWIG_CheckState(res);
         }
         if (_v) {
-          int res = swig::asptr(argv[3], (std::vector<int,std::allocator< int > >**)(0));
+          int res = swig::asptr(argv[3], (std::vector< int,std::allocator< int > >**)(0));
           _v = SWIG_CheckState(res);
           if (_v) {
-            return _wrap_ArrayInt___setslice____SWIG_0(self, args);
+            return _wrap_ArrayInt___setslice____SWIG_1(self, args);
           }
         }
       }
@@ -8311,8 +8789,8 @@ SWIGINTERN PyObject *_wrap_ArrayInt___setslice__(PyObject *self, PyObject *args)
 fail:
   SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'ArrayInt___setslice__'.\n"
     "  Possible C/C++ prototypes are:\n"
-    "    std::vector< int >::__setslice__(std::vector< int >::difference_type,std::vector< int >::difference_type,std::vector< int,std::allocator< int > > const &)\n"
-    "    std::vector< int >::__setslice__(std::vector< int >::difference_type,std::vector< int >::difference_type)\n");
+    "    std::vector< int >::__setslice__(std::vector< int >::difference_type,std::vector< int >::difference_type)\n"
+    "    std::vector< int >::__setslice__(std::vector< int >::difference_type,std::vector< int >::difference_type,std::vector< int,std::allocator< int > > const &)\n");
   return 0;
 }
 
@@ -8354,6 +8832,9 @@ SWIGINTERN PyObject *_wrap_ArrayInt___delslice__(PyObject *SWIGUNUSEDPARM(self),
   catch(std::out_of_range &_e) {
     SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
   }
+  catch(std::invalid_argument &_e) {
+    SWIG_exception_fail(SWIG_ValueError, (&_e)->what());
+  }
   
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -8390,6 +8871,9 @@ SWIGINTERN PyObject *_wrap_ArrayInt___delitem____SWIG_0(PyObject *SWIGUNUSEDPARM
   catch(std::out_of_range &_e) {
     SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
   }
+  catch(std::invalid_argument &_e) {
+    SWIG_exception_fail(SWIG_ValueError, (&_e)->what());
+  }
   
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -8426,8 +8910,11 @@ SWIGINTERN PyObject *_wrap_ArrayInt___getitem____SWIG_0(PyObject *SWIGUNUSEDPARM
   catch(std::out_of_range &_e) {
     SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
   }
+  catch(std::invalid_argument &_e) {
+    SWIG_exception_fail(SWIG_ValueError, (&_e)->what());
+  }
   
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_std__vectorT_int_std__allocatorT_int_t_t, 0 |  0 );
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_std__vectorT_int_std__allocatorT_int_t_t, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
   return NULL;
@@ -8459,7 +8946,7 @@ SWIGINTERN PyObject *_wrap_ArrayInt___setitem____SWIG_0(PyObject *SWIGUNUSEDPARM
     arg2 = (PySliceObject *) obj1;
   }
   {
-    std::vector<int,std::allocator< int > > *ptr = (std::vector<int,std::allocator< int > > *)0;
+    std::vector< int,std::allocator< int > > *ptr = (std::vector< int,std::allocator< int > > *)0;
     res3 = swig::asptr(obj2, &ptr);
     if (!SWIG_IsOK(res3)) {
       SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "ArrayInt___setitem__" "', argument " "3"" of type '" "std::vector< int,std::allocator< int > > const &""'"); 
@@ -8515,6 +9002,9 @@ SWIGINTERN PyObject *_wrap_ArrayInt___setitem____SWIG_1(PyObject *SWIGUNUSEDPARM
   catch(std::out_of_range &_e) {
     SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
   }
+  catch(std::invalid_argument &_e) {
+    SWIG_exception_fail(SWIG_ValueError, (&_e)->what());
+  }
   
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -8550,6 +9040,9 @@ SWIGINTERN PyObject *_wrap_ArrayInt___delitem____SWIG_1(PyObject *SWIGUNUSEDPARM
   catch(std::out_of_range &_e) {
     SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
   }
+  catch(std::invalid_argument &_e) {
+    SWIG_exception_fail(SWIG_ValueError, (&_e)->what());
+  }
   
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -8559,18 +9052,20 @@ fail:
 
 
 SWIGINTERN PyObject *_wrap_ArrayInt___delitem__(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[3];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[3] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 2) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
   if (argc == 2) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<int,std::allocator< int > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< int,std::allocator< int > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -8583,7 +9078,7 @@ SWIGINTERN PyObject *_wrap_ArrayInt___delitem__(PyObject *self, PyObject *args)
   }
   if (argc == 2) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<int,std::allocator< int > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< int,std::allocator< int > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -8643,18 +9138,20 @@ fail:
 
 
 SWIGINTERN PyObject *_wrap_ArrayInt___getitem__(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[3];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[3] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 2) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
   if (argc == 2) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<int,std::allocator< int > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< int,std::allocator< int > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -8667,7 +9164,7 @@ SWIGINTERN PyObject *_wrap_ArrayInt___getitem__(PyObject *self, PyObject *args)
   }
   if (argc == 2) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<int,std::allocator< int > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< int,std::allocator< int > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -8737,18 +9234,20 @@ fail:
 
 
 SWIGINTERN PyObject *_wrap_ArrayInt___setitem__(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[4];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[4] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 3) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
   if (argc == 2) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<int,std::allocator< int > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< int,std::allocator< int > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -8761,14 +9260,14 @@ SWIGINTERN PyObject *_wrap_ArrayInt___setitem__(PyObject *self, PyObject *args)
   }
   if (argc == 3) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<int,std::allocator< int > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< int,std::allocator< int > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
         _v = PySlice_Check(argv[1]);
       }
       if (_v) {
-        int res = swig::asptr(argv[2], (std::vector<int,std::allocator< int > >**)(0));
+        int res = swig::asptr(argv[2], (std::vector< int,std::allocator< int > >**)(0));
         _v = SWIG_CheckState(res);
         if (_v) {
           return _wrap_ArrayInt___setitem____SWIG_0(self, args);
@@ -8778,7 +9277,7 @@ SWIGINTERN PyObject *_wrap_ArrayInt___setitem__(PyObject *self, PyObject *args)
   }
   if (argc == 3) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<int,std::allocator< int > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< int,std::allocator< int > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -8807,6 +9306,34 @@ fail:
 }
 
 
+SWIGINTERN PyObject *_wrap_ArrayInt_pop(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  std::vector< int > *arg1 = (std::vector< int > *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  std::vector< int >::value_type result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:ArrayInt_pop",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_int_std__allocatorT_int_t_t, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ArrayInt_pop" "', argument " "1"" of type '" "std::vector< int > *""'"); 
+  }
+  arg1 = reinterpret_cast< std::vector< int > * >(argp1);
+  try {
+    result = (std::vector< int >::value_type)std_vector_Sl_int_Sg__pop(arg1);
+  }
+  catch(std::out_of_range &_e) {
+    SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
+  }
+  
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
 SWIGINTERN PyObject *_wrap_ArrayInt_append(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   std::vector< int > *arg1 = (std::vector< int > *) 0 ;
@@ -8861,7 +9388,7 @@ SWIGINTERN PyObject *_wrap_new_ArrayInt__SWIG_1(PyObject *SWIGUNUSEDPARM(self),
   
   if (!PyArg_ParseTuple(args,(char *)"O:new_ArrayInt",&obj0)) SWIG_fail;
   {
-    std::vector<int,std::allocator< int > > *ptr = (std::vector<int,std::allocator< int > > *)0;
+    std::vector< int,std::allocator< int > > *ptr = (std::vector< int,std::allocator< int > > *)0;
     res1 = swig::asptr(obj0, &ptr);
     if (!SWIG_IsOK(res1)) {
       SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "new_ArrayInt" "', argument " "1"" of type '" "std::vector< int > const &""'"); 
@@ -8925,27 +9452,6 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_ArrayInt_clear(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *resultobj = 0;
-  std::vector< int > *arg1 = (std::vector< int > *) 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  PyObject * obj0 = 0 ;
-  
-  if (!PyArg_ParseTuple(args,(char *)"O:ArrayInt_clear",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_int_std__allocatorT_int_t_t, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ArrayInt_clear" "', argument " "1"" of type '" "std::vector< int > *""'"); 
-  }
-  arg1 = reinterpret_cast< std::vector< int > * >(argp1);
-  (arg1)->clear();
-  resultobj = SWIG_Py_Void();
-  return resultobj;
-fail:
-  return NULL;
-}
-
-
 SWIGINTERN PyObject *_wrap_ArrayInt_swap(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   std::vector< int > *arg1 = (std::vector< int > *) 0 ;
@@ -8979,28 +9485,6 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_ArrayInt_get_allocator(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *resultobj = 0;
-  std::vector< int > *arg1 = (std::vector< int > *) 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  PyObject * obj0 = 0 ;
-  SwigValueWrapper< std::allocator< int > > result;
-  
-  if (!PyArg_ParseTuple(args,(char *)"O:ArrayInt_get_allocator",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_int_std__allocatorT_int_t_t, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ArrayInt_get_allocator" "', argument " "1"" of type '" "std::vector< int > const *""'"); 
-  }
-  arg1 = reinterpret_cast< std::vector< int > * >(argp1);
-  result = ((std::vector< int > const *)arg1)->get_allocator();
-  resultobj = SWIG_NewPointerObj((new std::vector< int >::allocator_type(static_cast< const std::vector< int >::allocator_type& >(result))), SWIGTYPE_p_std__allocatorT_int_t, SWIG_POINTER_OWN |  0 );
-  return resultobj;
-fail:
-  return NULL;
-}
-
-
 SWIGINTERN PyObject *_wrap_ArrayInt_begin(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   std::vector< int > *arg1 = (std::vector< int > *) 0 ;
@@ -9093,6 +9577,49 @@ fail:
 }
 
 
+SWIGINTERN PyObject *_wrap_ArrayInt_clear(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  std::vector< int > *arg1 = (std::vector< int > *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:ArrayInt_clear",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_int_std__allocatorT_int_t_t, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ArrayInt_clear" "', argument " "1"" of type '" "std::vector< int > *""'"); 
+  }
+  arg1 = reinterpret_cast< std::vector< int > * >(argp1);
+  (arg1)->clear();
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_ArrayInt_get_allocator(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  std::vector< int > *arg1 = (std::vector< int > *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  SwigValueWrapper< std::allocator< int > > result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:ArrayInt_get_allocator",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_int_std__allocatorT_int_t_t, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ArrayInt_get_allocator" "', argument " "1"" of type '" "std::vector< int > const *""'"); 
+  }
+  arg1 = reinterpret_cast< std::vector< int > * >(argp1);
+  result = ((std::vector< int > const *)arg1)->get_allocator();
+  resultobj = SWIG_NewPointerObj((new std::vector< int >::allocator_type(static_cast< const std::vector< int >::allocator_type& >(result))), SWIGTYPE_p_std__allocatorT_int_t, SWIG_POINTER_OWN |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
 SWIGINTERN PyObject *_wrap_new_ArrayInt__SWIG_2(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   std::vector< int >::size_type arg1 ;
@@ -9195,7 +9722,7 @@ SWIGINTERN PyObject *_wrap_ArrayInt_erase__SWIG_0(PyObject *SWIGUNUSEDPARM(self)
       SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "ArrayInt_erase" "', argument " "2"" of type '" "std::vector< int >::iterator""'");
     }
   }
-  result = (arg1)->erase(arg2);
+  result = std_vector_Sl_int_Sg__erase__SWIG_0(arg1,arg2);
   resultobj = SWIG_NewPointerObj(swig::make_output_iterator(static_cast< const std::vector< int >::iterator & >(result)),
     swig::SwigPyIterator::descriptor(),SWIG_POINTER_OWN);
   return resultobj;
@@ -9248,7 +9775,7 @@ SWIGINTERN PyObject *_wrap_ArrayInt_erase__SWIG_1(PyObject *SWIGUNUSEDPARM(self)
       SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "ArrayInt_erase" "', argument " "3"" of type '" "std::vector< int >::iterator""'");
     }
   }
-  result = (arg1)->erase(arg2,arg3);
+  result = std_vector_Sl_int_Sg__erase__SWIG_1(arg1,arg2,arg3);
   resultobj = SWIG_NewPointerObj(swig::make_output_iterator(static_cast< const std::vector< int >::iterator & >(result)),
     swig::SwigPyIterator::descriptor(),SWIG_POINTER_OWN);
   return resultobj;
@@ -9258,18 +9785,20 @@ fail:
 
 
 SWIGINTERN PyObject *_wrap_ArrayInt_erase(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[4];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[4] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 3) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
   if (argc == 2) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<int,std::allocator< int > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< int,std::allocator< int > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       swig::SwigPyIterator *iter = 0;
@@ -9282,7 +9811,7 @@ SWIGINTERN PyObject *_wrap_ArrayInt_erase(PyObject *self, PyObject *args) {
   }
   if (argc == 3) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<int,std::allocator< int > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< int,std::allocator< int > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       swig::SwigPyIterator *iter = 0;
@@ -9342,12 +9871,14 @@ fail:
 
 
 SWIGINTERN PyObject *_wrap_new_ArrayInt(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[3];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[3] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 2) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
@@ -9366,7 +9897,7 @@ SWIGINTERN PyObject *_wrap_new_ArrayInt(PyObject *self, PyObject *args) {
   }
   if (argc == 1) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<int,std::allocator< int > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< int,std::allocator< int > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       return _wrap_new_ArrayInt__SWIG_1(self, args);
@@ -9559,18 +10090,20 @@ fail:
 
 
 SWIGINTERN PyObject *_wrap_ArrayInt_resize(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[4];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[4] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 3) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
   if (argc == 2) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<int,std::allocator< int > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< int,std::allocator< int > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -9584,7 +10117,7 @@ SWIGINTERN PyObject *_wrap_ArrayInt_resize(PyObject *self, PyObject *args) {
   }
   if (argc == 3) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<int,std::allocator< int > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< int,std::allocator< int > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -9652,7 +10185,7 @@ SWIGINTERN PyObject *_wrap_ArrayInt_insert__SWIG_0(PyObject *SWIGUNUSEDPARM(self
   } 
   temp3 = static_cast< std::vector< int >::value_type >(val3);
   arg3 = &temp3;
-  result = (arg1)->insert(arg2,(std::vector< int >::value_type const &)*arg3);
+  result = std_vector_Sl_int_Sg__insert__SWIG_0(arg1,arg2,(int const &)*arg3);
   resultobj = SWIG_NewPointerObj(swig::make_output_iterator(static_cast< const std::vector< int >::iterator & >(result)),
     swig::SwigPyIterator::descriptor(),SWIG_POINTER_OWN);
   return resultobj;
@@ -9709,7 +10242,7 @@ SWIGINTERN PyObject *_wrap_ArrayInt_insert__SWIG_1(PyObject *SWIGUNUSEDPARM(self
   } 
   temp4 = static_cast< std::vector< int >::value_type >(val4);
   arg4 = &temp4;
-  (arg1)->insert(arg2,arg3,(std::vector< int >::value_type const &)*arg4);
+  std_vector_Sl_int_Sg__insert__SWIG_1(arg1,arg2,arg3,(int const &)*arg4);
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -9718,18 +10251,20 @@ fail:
 
 
 SWIGINTERN PyObject *_wrap_ArrayInt_insert(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[5];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 4) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
   if (argc == 3) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<int,std::allocator< int > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< int,std::allocator< int > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       swig::SwigPyIterator *iter = 0;
@@ -9748,7 +10283,7 @@ SWIGINTERN PyObject *_wrap_ArrayInt_insert(PyObject *self, PyObject *args) {
   }
   if (argc == 4) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<int,std::allocator< int > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< int,std::allocator< int > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       swig::SwigPyIterator *iter = 0;
@@ -9856,7 +10391,7 @@ fail:
 
 SWIGINTERN PyObject *ArrayInt_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *obj;
-  if (!PyArg_ParseTuple(args,(char*)"O:swigregister", &obj)) return NULL;
+  if (!PyArg_ParseTuple(args,(char *)"O:swigregister", &obj)) return NULL;
   SWIG_TypeNewClientData(SWIGTYPE_p_std__vectorT_int_std__allocatorT_int_t_t, SWIG_NewClientData(obj));
   return SWIG_Py_Void();
 }
@@ -9951,34 +10486,6 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_ArrayTypePtr_pop(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *resultobj = 0;
-  std::vector< llvm::Type * > *arg1 = (std::vector< llvm::Type * > *) 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  PyObject * obj0 = 0 ;
-  std::vector< llvm::Type * >::value_type result;
-  
-  if (!PyArg_ParseTuple(args,(char *)"O:ArrayTypePtr_pop",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_llvm__Type_p_std__allocatorT_llvm__Type_p_t_t, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ArrayTypePtr_pop" "', argument " "1"" of type '" "std::vector< llvm::Type * > *""'"); 
-  }
-  arg1 = reinterpret_cast< std::vector< llvm::Type * > * >(argp1);
-  try {
-    result = (std::vector< llvm::Type * >::value_type)std_vector_Sl_llvm_Type_Sm__Sg__pop(arg1);
-  }
-  catch(std::out_of_range &_e) {
-    SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
-  }
-  
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Type, 0 |  0 );
-  return resultobj;
-fail:
-  return NULL;
-}
-
-
 SWIGINTERN PyObject *_wrap_ArrayTypePtr___getslice__(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   std::vector< llvm::Type * > *arg1 = (std::vector< llvm::Type * > *) 0 ;
@@ -10017,6 +10524,9 @@ SWIGINTERN PyObject *_wrap_ArrayTypePtr___getslice__(PyObject *SWIGUNUSEDPARM(se
   catch(std::out_of_range &_e) {
     SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
   }
+  catch(std::invalid_argument &_e) {
+    SWIG_exception_fail(SWIG_ValueError, (&_e)->what());
+  }
   
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_std__vectorT_llvm__Type_p_std__allocatorT_llvm__Type_p_t_t, SWIG_POINTER_OWN |  0 );
   return resultobj;
@@ -10030,20 +10540,17 @@ SWIGINTERN PyObject *_wrap_ArrayTypePtr___setslice____SWIG_0(PyObject *SWIGUNUSE
   std::vector< llvm::Type * > *arg1 = (std::vector< llvm::Type * > *) 0 ;
   std::vector< llvm::Type * >::difference_type arg2 ;
   std::vector< llvm::Type * >::difference_type arg3 ;
-  std::vector< llvm::Type *,std::allocator< llvm::Type * > > *arg4 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   ptrdiff_t val2 ;
   int ecode2 = 0 ;
   ptrdiff_t val3 ;
   int ecode3 = 0 ;
-  int res4 = SWIG_OLDOBJ ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
-  PyObject * obj3 = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:ArrayTypePtr___setslice__",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOO:ArrayTypePtr___setslice__",&obj0,&obj1,&obj2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_llvm__Type_p_std__allocatorT_llvm__Type_p_t_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ArrayTypePtr___setslice__" "', argument " "1"" of type '" "std::vector< llvm::Type * > *""'"); 
@@ -10059,19 +10566,8 @@ SWIGINTERN PyObject *_wrap_ArrayTypePtr___setslice____SWIG_0(PyObject *SWIGUNUSE
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "ArrayTypePtr___setslice__" "', argument " "3"" of type '" "std::vector< llvm::Type * >::difference_type""'");
   } 
   arg3 = static_cast< std::vector< llvm::Type * >::difference_type >(val3);
-  {
-    std::vector<llvm::Type*,std::allocator< llvm::Type * > > *ptr = (std::vector<llvm::Type*,std::allocator< llvm::Type * > > *)0;
-    res4 = swig::asptr(obj3, &ptr);
-    if (!SWIG_IsOK(res4)) {
-      SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "ArrayTypePtr___setslice__" "', argument " "4"" of type '" "std::vector< llvm::Type *,std::allocator< llvm::Type * > > const &""'"); 
-    }
-    if (!ptr) {
-      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "ArrayTypePtr___setslice__" "', argument " "4"" of type '" "std::vector< llvm::Type *,std::allocator< llvm::Type * > > const &""'"); 
-    }
-    arg4 = ptr;
-  }
   try {
-    std_vector_Sl_llvm_Type_Sm__Sg____setslice____SWIG_0(arg1,arg2,arg3,(std::vector< llvm::Type *,std::allocator< llvm::Type * > > const &)*arg4);
+    std_vector_Sl_llvm_Type_Sm__Sg____setslice____SWIG_0(arg1,arg2,arg3);
   }
   catch(std::out_of_range &_e) {
     SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
@@ -10081,10 +10577,8 @@ SWIGINTERN PyObject *_wrap_ArrayTypePtr___setslice____SWIG_0(PyObject *SWIGUNUSE
   }
   
   resultobj = SWIG_Py_Void();
-  if (SWIG_IsNewObj(res4)) delete arg4;
   return resultobj;
 fail:
-  if (SWIG_IsNewObj(res4)) delete arg4;
   return NULL;
 }
 
@@ -10094,17 +10588,20 @@ SWIGINTERN PyObject *_wrap_ArrayTypePtr___setslice____SWIG_1(PyObject *SWIGUNUSE
   std::vector< llvm::Type * > *arg1 = (std::vector< llvm::Type * > *) 0 ;
   std::vector< llvm::Type * >::difference_type arg2 ;
   std::vector< llvm::Type * >::difference_type arg3 ;
+  std::vector< llvm::Type *,std::allocator< llvm::Type * > > *arg4 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   ptrdiff_t val2 ;
   int ecode2 = 0 ;
   ptrdiff_t val3 ;
   int ecode3 = 0 ;
+  int res4 = SWIG_OLDOBJ ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
+  PyObject * obj3 = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:ArrayTypePtr___setslice__",&obj0,&obj1,&obj2)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:ArrayTypePtr___setslice__",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_llvm__Type_p_std__allocatorT_llvm__Type_p_t_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ArrayTypePtr___setslice__" "', argument " "1"" of type '" "std::vector< llvm::Type * > *""'"); 
@@ -10120,8 +10617,19 @@ SWIGINTERN PyObject *_wrap_ArrayTypePtr___setslice____SWIG_1(PyObject *SWIGUNUSE
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "ArrayTypePtr___setslice__" "', argument " "3"" of type '" "std::vector< llvm::Type * >::difference_type""'");
   } 
   arg3 = static_cast< std::vector< llvm::Type * >::difference_type >(val3);
+  {
+    std::vector< llvm::Type*,std::allocator< llvm::Type * > > *ptr = (std::vector< llvm::Type*,std::allocator< llvm::Type * > > *)0;
+    res4 = swig::asptr(obj3, &ptr);
+    if (!SWIG_IsOK(res4)) {
+      SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "ArrayTypePtr___setslice__" "', argument " "4"" of type '" "std::vector< llvm::Type *,std::allocator< llvm::Type * > > const &""'"); 
+    }
+    if (!ptr) {
+      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "ArrayTypePtr___setslice__" "', argument " "4"" of type '" "std::vector< llvm::Type *,std::allocator< llvm::Type * > > const &""'"); 
+    }
+    arg4 = ptr;
+  }
   try {
-    std_vector_Sl_llvm_Type_Sm__Sg____setslice____SWIG_0(arg1,arg2,arg3);
+    std_vector_Sl_llvm_Type_Sm__Sg____setslice____SWIG_1(arg1,arg2,arg3,(std::vector< llvm::Type *,std::allocator< llvm::Type * > > const &)*arg4);
   }
   catch(std::out_of_range &_e) {
     SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
@@ -10131,25 +10639,29 @@ SWIGINTERN PyObject *_wrap_ArrayTypePtr___setslice____SWIG_1(PyObject *SWIGUNUSE
   }
   
   resultobj = SWIG_Py_Void();
+  if (SWIG_IsNewObj(res4)) delete arg4;
   return resultobj;
 fail:
+  if (SWIG_IsNewObj(res4)) delete arg4;
   return NULL;
 }
 
 
 SWIGINTERN PyObject *_wrap_ArrayTypePtr___setslice__(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[5];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 4) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
   if (argc == 3) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::Type*,std::allocator< llvm::Type * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::Type*,std::allocator< llvm::Type * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -10162,14 +10674,14 @@ SWIGINTERN PyObject *_wrap_ArrayTypePtr___setslice__(PyObject *self, PyObject *a
           _v = SWIG_CheckState(res);
         }
         if (_v) {
-          return _wrap_ArrayTypePtr___setslice____SWIG_1(self, args);
+          return _wrap_ArrayTypePtr___setslice____SWIG_0(self, args);
         }
       }
     }
   }
   if (argc == 4) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::Type*,std::allocator< llvm::Type * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::Type*,std::allocator< llvm::Type * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -10182,10 +10694,10 @@ SWIGINTERN PyObject *_wrap_ArrayTypePtr___setslice__(PyObject *self, PyObject *a
           _v = SWIG_CheckState(res);
         }
         if (_v) {
-          int res = swig::asptr(argv[3], (std::vector<llvm::Type*,std::allocator< llvm::Type * > >**)(0));
+          int res = swig::asptr(argv[3], (std::vector< llvm::Type*,std::allocator< llvm::Type * > >**)(0));
           _v = SWIG_CheckState(res);
           if (_v) {
-            return _wrap_ArrayTypePtr___setslice____SWIG_0(self, args);
+            return _wrap_ArrayTypePtr___setslice____SWIG_1(self, args);
           }
         }
       }
@@ -10195,8 +10707,8 @@ SWIGINTERN PyObject *_wrap_ArrayTypePtr___setslice__(PyObject *self, PyObject *a
 fail:
   SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'ArrayTypePtr___setslice__'.\n"
     "  Possible C/C++ prototypes are:\n"
-    "    std::vector< llvm::Type * >::__setslice__(std::vector< llvm::Type * >::difference_type,std::vector< llvm::Type * >::difference_type,std::vector< llvm::Type *,std::allocator< llvm::Type * > > const &)\n"
-    "    std::vector< llvm::Type * >::__setslice__(std::vector< llvm::Type * >::difference_type,std::vector< llvm::Type * >::difference_type)\n");
+    "    std::vector< llvm::Type * >::__setslice__(std::vector< llvm::Type * >::difference_type,std::vector< llvm::Type * >::difference_type)\n"
+    "    std::vector< llvm::Type * >::__setslice__(std::vector< llvm::Type * >::difference_type,std::vector< llvm::Type * >::difference_type,std::vector< llvm::Type *,std::allocator< llvm::Type * > > const &)\n");
   return 0;
 }
 
@@ -10238,6 +10750,9 @@ SWIGINTERN PyObject *_wrap_ArrayTypePtr___delslice__(PyObject *SWIGUNUSEDPARM(se
   catch(std::out_of_range &_e) {
     SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
   }
+  catch(std::invalid_argument &_e) {
+    SWIG_exception_fail(SWIG_ValueError, (&_e)->what());
+  }
   
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -10274,6 +10789,9 @@ SWIGINTERN PyObject *_wrap_ArrayTypePtr___delitem____SWIG_0(PyObject *SWIGUNUSED
   catch(std::out_of_range &_e) {
     SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
   }
+  catch(std::invalid_argument &_e) {
+    SWIG_exception_fail(SWIG_ValueError, (&_e)->what());
+  }
   
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -10310,8 +10828,11 @@ SWIGINTERN PyObject *_wrap_ArrayTypePtr___getitem____SWIG_0(PyObject *SWIGUNUSED
   catch(std::out_of_range &_e) {
     SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
   }
+  catch(std::invalid_argument &_e) {
+    SWIG_exception_fail(SWIG_ValueError, (&_e)->what());
+  }
   
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_std__vectorT_llvm__Type_p_std__allocatorT_llvm__Type_p_t_t, 0 |  0 );
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_std__vectorT_llvm__Type_p_std__allocatorT_llvm__Type_p_t_t, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
   return NULL;
@@ -10343,7 +10864,7 @@ SWIGINTERN PyObject *_wrap_ArrayTypePtr___setitem____SWIG_0(PyObject *SWIGUNUSED
     arg2 = (PySliceObject *) obj1;
   }
   {
-    std::vector<llvm::Type*,std::allocator< llvm::Type * > > *ptr = (std::vector<llvm::Type*,std::allocator< llvm::Type * > > *)0;
+    std::vector< llvm::Type*,std::allocator< llvm::Type * > > *ptr = (std::vector< llvm::Type*,std::allocator< llvm::Type * > > *)0;
     res3 = swig::asptr(obj2, &ptr);
     if (!SWIG_IsOK(res3)) {
       SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "ArrayTypePtr___setitem__" "', argument " "3"" of type '" "std::vector< llvm::Type *,std::allocator< llvm::Type * > > const &""'"); 
@@ -10399,6 +10920,9 @@ SWIGINTERN PyObject *_wrap_ArrayTypePtr___setitem____SWIG_1(PyObject *SWIGUNUSED
   catch(std::out_of_range &_e) {
     SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
   }
+  catch(std::invalid_argument &_e) {
+    SWIG_exception_fail(SWIG_ValueError, (&_e)->what());
+  }
   
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -10434,6 +10958,9 @@ SWIGINTERN PyObject *_wrap_ArrayTypePtr___delitem____SWIG_1(PyObject *SWIGUNUSED
   catch(std::out_of_range &_e) {
     SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
   }
+  catch(std::invalid_argument &_e) {
+    SWIG_exception_fail(SWIG_ValueError, (&_e)->what());
+  }
   
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -10443,18 +10970,20 @@ fail:
 
 
 SWIGINTERN PyObject *_wrap_ArrayTypePtr___delitem__(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[3];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[3] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 2) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
   if (argc == 2) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::Type*,std::allocator< llvm::Type * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::Type*,std::allocator< llvm::Type * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -10467,7 +10996,7 @@ SWIGINTERN PyObject *_wrap_ArrayTypePtr___delitem__(PyObject *self, PyObject *ar
   }
   if (argc == 2) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::Type*,std::allocator< llvm::Type * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::Type*,std::allocator< llvm::Type * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -10527,18 +11056,20 @@ fail:
 
 
 SWIGINTERN PyObject *_wrap_ArrayTypePtr___getitem__(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[3];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[3] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 2) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
   if (argc == 2) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::Type*,std::allocator< llvm::Type * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::Type*,std::allocator< llvm::Type * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -10551,7 +11082,7 @@ SWIGINTERN PyObject *_wrap_ArrayTypePtr___getitem__(PyObject *self, PyObject *ar
   }
   if (argc == 2) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::Type*,std::allocator< llvm::Type * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::Type*,std::allocator< llvm::Type * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -10619,18 +11150,20 @@ fail:
 
 
 SWIGINTERN PyObject *_wrap_ArrayTypePtr___setitem__(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[4];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[4] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 3) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
   if (argc == 2) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::Type*,std::allocator< llvm::Type * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::Type*,std::allocator< llvm::Type * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -10643,14 +11176,14 @@ SWIGINTERN PyObject *_wrap_ArrayTypePtr___setitem__(PyObject *self, PyObject *ar
   }
   if (argc == 3) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::Type*,std::allocator< llvm::Type * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::Type*,std::allocator< llvm::Type * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
         _v = PySlice_Check(argv[1]);
       }
       if (_v) {
-        int res = swig::asptr(argv[2], (std::vector<llvm::Type*,std::allocator< llvm::Type * > >**)(0));
+        int res = swig::asptr(argv[2], (std::vector< llvm::Type*,std::allocator< llvm::Type * > >**)(0));
         _v = SWIG_CheckState(res);
         if (_v) {
           return _wrap_ArrayTypePtr___setitem____SWIG_0(self, args);
@@ -10660,7 +11193,7 @@ SWIGINTERN PyObject *_wrap_ArrayTypePtr___setitem__(PyObject *self, PyObject *ar
   }
   if (argc == 3) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::Type*,std::allocator< llvm::Type * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::Type*,std::allocator< llvm::Type * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -10688,6 +11221,34 @@ fail:
 }
 
 
+SWIGINTERN PyObject *_wrap_ArrayTypePtr_pop(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  std::vector< llvm::Type * > *arg1 = (std::vector< llvm::Type * > *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  std::vector< llvm::Type * >::value_type result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:ArrayTypePtr_pop",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_llvm__Type_p_std__allocatorT_llvm__Type_p_t_t, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ArrayTypePtr_pop" "', argument " "1"" of type '" "std::vector< llvm::Type * > *""'"); 
+  }
+  arg1 = reinterpret_cast< std::vector< llvm::Type * > * >(argp1);
+  try {
+    result = (std::vector< llvm::Type * >::value_type)std_vector_Sl_llvm_Type_Sm__Sg__pop(arg1);
+  }
+  catch(std::out_of_range &_e) {
+    SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
+  }
+  
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Type, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
 SWIGINTERN PyObject *_wrap_ArrayTypePtr_append(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   std::vector< llvm::Type * > *arg1 = (std::vector< llvm::Type * > *) 0 ;
@@ -10740,7 +11301,7 @@ SWIGINTERN PyObject *_wrap_new_ArrayTypePtr__SWIG_1(PyObject *SWIGUNUSEDPARM(sel
   
   if (!PyArg_ParseTuple(args,(char *)"O:new_ArrayTypePtr",&obj0)) SWIG_fail;
   {
-    std::vector<llvm::Type*,std::allocator< llvm::Type * > > *ptr = (std::vector<llvm::Type*,std::allocator< llvm::Type * > > *)0;
+    std::vector< llvm::Type*,std::allocator< llvm::Type * > > *ptr = (std::vector< llvm::Type*,std::allocator< llvm::Type * > > *)0;
     res1 = swig::asptr(obj0, &ptr);
     if (!SWIG_IsOK(res1)) {
       SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "new_ArrayTypePtr" "', argument " "1"" of type '" "std::vector< llvm::Type * > const &""'"); 
@@ -10804,27 +11365,6 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_ArrayTypePtr_clear(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *resultobj = 0;
-  std::vector< llvm::Type * > *arg1 = (std::vector< llvm::Type * > *) 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  PyObject * obj0 = 0 ;
-  
-  if (!PyArg_ParseTuple(args,(char *)"O:ArrayTypePtr_clear",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_llvm__Type_p_std__allocatorT_llvm__Type_p_t_t, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ArrayTypePtr_clear" "', argument " "1"" of type '" "std::vector< llvm::Type * > *""'"); 
-  }
-  arg1 = reinterpret_cast< std::vector< llvm::Type * > * >(argp1);
-  (arg1)->clear();
-  resultobj = SWIG_Py_Void();
-  return resultobj;
-fail:
-  return NULL;
-}
-
-
 SWIGINTERN PyObject *_wrap_ArrayTypePtr_swap(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   std::vector< llvm::Type * > *arg1 = (std::vector< llvm::Type * > *) 0 ;
@@ -10858,28 +11398,6 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_ArrayTypePtr_get_allocator(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *resultobj = 0;
-  std::vector< llvm::Type * > *arg1 = (std::vector< llvm::Type * > *) 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  PyObject * obj0 = 0 ;
-  SwigValueWrapper< std::allocator< llvm::Type * > > result;
-  
-  if (!PyArg_ParseTuple(args,(char *)"O:ArrayTypePtr_get_allocator",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_llvm__Type_p_std__allocatorT_llvm__Type_p_t_t, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ArrayTypePtr_get_allocator" "', argument " "1"" of type '" "std::vector< llvm::Type * > const *""'"); 
-  }
-  arg1 = reinterpret_cast< std::vector< llvm::Type * > * >(argp1);
-  result = ((std::vector< llvm::Type * > const *)arg1)->get_allocator();
-  resultobj = SWIG_NewPointerObj((new std::vector< llvm::Type * >::allocator_type(static_cast< const std::vector< llvm::Type * >::allocator_type& >(result))), SWIGTYPE_p_std__allocatorT_llvm__Type_p_t, SWIG_POINTER_OWN |  0 );
-  return resultobj;
-fail:
-  return NULL;
-}
-
-
 SWIGINTERN PyObject *_wrap_ArrayTypePtr_begin(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   std::vector< llvm::Type * > *arg1 = (std::vector< llvm::Type * > *) 0 ;
@@ -10972,6 +11490,49 @@ fail:
 }
 
 
+SWIGINTERN PyObject *_wrap_ArrayTypePtr_clear(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  std::vector< llvm::Type * > *arg1 = (std::vector< llvm::Type * > *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:ArrayTypePtr_clear",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_llvm__Type_p_std__allocatorT_llvm__Type_p_t_t, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ArrayTypePtr_clear" "', argument " "1"" of type '" "std::vector< llvm::Type * > *""'"); 
+  }
+  arg1 = reinterpret_cast< std::vector< llvm::Type * > * >(argp1);
+  (arg1)->clear();
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_ArrayTypePtr_get_allocator(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  std::vector< llvm::Type * > *arg1 = (std::vector< llvm::Type * > *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  SwigValueWrapper< std::allocator< llvm::Type * > > result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:ArrayTypePtr_get_allocator",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_llvm__Type_p_std__allocatorT_llvm__Type_p_t_t, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ArrayTypePtr_get_allocator" "', argument " "1"" of type '" "std::vector< llvm::Type * > const *""'"); 
+  }
+  arg1 = reinterpret_cast< std::vector< llvm::Type * > * >(argp1);
+  result = ((std::vector< llvm::Type * > const *)arg1)->get_allocator();
+  resultobj = SWIG_NewPointerObj((new std::vector< llvm::Type * >::allocator_type(static_cast< const std::vector< llvm::Type * >::allocator_type& >(result))), SWIGTYPE_p_std__allocatorT_llvm__Type_p_t, SWIG_POINTER_OWN |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
 SWIGINTERN PyObject *_wrap_new_ArrayTypePtr__SWIG_2(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   std::vector< llvm::Type * >::size_type arg1 ;
@@ -11074,7 +11635,7 @@ SWIGINTERN PyObject *_wrap_ArrayTypePtr_erase__SWIG_0(PyObject *SWIGUNUSEDPARM(s
       SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "ArrayTypePtr_erase" "', argument " "2"" of type '" "std::vector< llvm::Type * >::iterator""'");
     }
   }
-  result = (arg1)->erase(arg2);
+  result = std_vector_Sl_llvm_Type_Sm__Sg__erase__SWIG_0(arg1,arg2);
   resultobj = SWIG_NewPointerObj(swig::make_output_iterator(static_cast< const std::vector< llvm::Type * >::iterator & >(result)),
     swig::SwigPyIterator::descriptor(),SWIG_POINTER_OWN);
   return resultobj;
@@ -11127,7 +11688,7 @@ SWIGINTERN PyObject *_wrap_ArrayTypePtr_erase__SWIG_1(PyObject *SWIGUNUSEDPARM(s
       SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "ArrayTypePtr_erase" "', argument " "3"" of type '" "std::vector< llvm::Type * >::iterator""'");
     }
   }
-  result = (arg1)->erase(arg2,arg3);
+  result = std_vector_Sl_llvm_Type_Sm__Sg__erase__SWIG_1(arg1,arg2,arg3);
   resultobj = SWIG_NewPointerObj(swig::make_output_iterator(static_cast< const std::vector< llvm::Type * >::iterator & >(result)),
     swig::SwigPyIterator::descriptor(),SWIG_POINTER_OWN);
   return resultobj;
@@ -11137,18 +11698,20 @@ fail:
 
 
 SWIGINTERN PyObject *_wrap_ArrayTypePtr_erase(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[4];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[4] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 3) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
   if (argc == 2) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::Type*,std::allocator< llvm::Type * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::Type*,std::allocator< llvm::Type * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       swig::SwigPyIterator *iter = 0;
@@ -11161,7 +11724,7 @@ SWIGINTERN PyObject *_wrap_ArrayTypePtr_erase(PyObject *self, PyObject *args) {
   }
   if (argc == 3) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::Type*,std::allocator< llvm::Type * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::Type*,std::allocator< llvm::Type * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       swig::SwigPyIterator *iter = 0;
@@ -11219,12 +11782,14 @@ fail:
 
 
 SWIGINTERN PyObject *_wrap_new_ArrayTypePtr(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[3];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[3] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 2) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
@@ -11243,7 +11808,7 @@ SWIGINTERN PyObject *_wrap_new_ArrayTypePtr(PyObject *self, PyObject *args) {
   }
   if (argc == 1) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::Type*,std::allocator< llvm::Type * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::Type*,std::allocator< llvm::Type * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       return _wrap_new_ArrayTypePtr__SWIG_1(self, args);
@@ -11429,18 +11994,20 @@ fail:
 
 
 SWIGINTERN PyObject *_wrap_ArrayTypePtr_resize(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[4];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[4] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 3) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
   if (argc == 2) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::Type*,std::allocator< llvm::Type * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::Type*,std::allocator< llvm::Type * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -11454,7 +12021,7 @@ SWIGINTERN PyObject *_wrap_ArrayTypePtr_resize(PyObject *self, PyObject *args) {
   }
   if (argc == 3) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::Type*,std::allocator< llvm::Type * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::Type*,std::allocator< llvm::Type * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -11519,7 +12086,7 @@ SWIGINTERN PyObject *_wrap_ArrayTypePtr_insert__SWIG_0(PyObject *SWIGUNUSEDPARM(
     SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "ArrayTypePtr_insert" "', argument " "3"" of type '" "std::vector< llvm::Type * >::value_type""'"); 
   }
   arg3 = reinterpret_cast< std::vector< llvm::Type * >::value_type >(argp3);
-  result = (arg1)->insert(arg2,arg3);
+  result = std_vector_Sl_llvm_Type_Sm__Sg__insert__SWIG_0(arg1,arg2,arg3);
   resultobj = SWIG_NewPointerObj(swig::make_output_iterator(static_cast< const std::vector< llvm::Type * >::iterator & >(result)),
     swig::SwigPyIterator::descriptor(),SWIG_POINTER_OWN);
   return resultobj;
@@ -11574,7 +12141,7 @@ SWIGINTERN PyObject *_wrap_ArrayTypePtr_insert__SWIG_1(PyObject *SWIGUNUSEDPARM(
     SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "ArrayTypePtr_insert" "', argument " "4"" of type '" "std::vector< llvm::Type * >::value_type""'"); 
   }
   arg4 = reinterpret_cast< std::vector< llvm::Type * >::value_type >(argp4);
-  (arg1)->insert(arg2,arg3,arg4);
+  std_vector_Sl_llvm_Type_Sm__Sg__insert__SWIG_1(arg1,arg2,arg3,arg4);
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -11583,18 +12150,20 @@ fail:
 
 
 SWIGINTERN PyObject *_wrap_ArrayTypePtr_insert(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[5];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 4) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
   if (argc == 3) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::Type*,std::allocator< llvm::Type * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::Type*,std::allocator< llvm::Type * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       swig::SwigPyIterator *iter = 0;
@@ -11612,7 +12181,7 @@ SWIGINTERN PyObject *_wrap_ArrayTypePtr_insert(PyObject *self, PyObject *args) {
   }
   if (argc == 4) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::Type*,std::allocator< llvm::Type * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::Type*,std::allocator< llvm::Type * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       swig::SwigPyIterator *iter = 0;
@@ -11719,7 +12288,7 @@ fail:
 
 SWIGINTERN PyObject *ArrayTypePtr_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *obj;
-  if (!PyArg_ParseTuple(args,(char*)"O:swigregister", &obj)) return NULL;
+  if (!PyArg_ParseTuple(args,(char *)"O:swigregister", &obj)) return NULL;
   SWIG_TypeNewClientData(SWIGTYPE_p_std__vectorT_llvm__Type_p_std__allocatorT_llvm__Type_p_t_t, SWIG_NewClientData(obj));
   return SWIG_Py_Void();
 }
@@ -11814,34 +12383,6 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_ArrayValuePtr_pop(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *resultobj = 0;
-  std::vector< llvm::Value * > *arg1 = (std::vector< llvm::Value * > *) 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  PyObject * obj0 = 0 ;
-  std::vector< llvm::Value * >::value_type result;
-  
-  if (!PyArg_ParseTuple(args,(char *)"O:ArrayValuePtr_pop",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_llvm__Value_p_std__allocatorT_llvm__Value_p_t_t, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ArrayValuePtr_pop" "', argument " "1"" of type '" "std::vector< llvm::Value * > *""'"); 
-  }
-  arg1 = reinterpret_cast< std::vector< llvm::Value * > * >(argp1);
-  try {
-    result = (std::vector< llvm::Value * >::value_type)std_vector_Sl_llvm_Value_Sm__Sg__pop(arg1);
-  }
-  catch(std::out_of_range &_e) {
-    SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
-  }
-  
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
-  return resultobj;
-fail:
-  return NULL;
-}
-
-
 SWIGINTERN PyObject *_wrap_ArrayValuePtr___getslice__(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   std::vector< llvm::Value * > *arg1 = (std::vector< llvm::Value * > *) 0 ;
@@ -11880,6 +12421,9 @@ SWIGINTERN PyObject *_wrap_ArrayValuePtr___getslice__(PyObject *SWIGUNUSEDPARM(s
   catch(std::out_of_range &_e) {
     SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
   }
+  catch(std::invalid_argument &_e) {
+    SWIG_exception_fail(SWIG_ValueError, (&_e)->what());
+  }
   
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_std__vectorT_llvm__Value_p_std__allocatorT_llvm__Value_p_t_t, SWIG_POINTER_OWN |  0 );
   return resultobj;
@@ -11893,20 +12437,17 @@ SWIGINTERN PyObject *_wrap_ArrayValuePtr___setslice____SWIG_0(PyObject *SWIGUNUS
   std::vector< llvm::Value * > *arg1 = (std::vector< llvm::Value * > *) 0 ;
   std::vector< llvm::Value * >::difference_type arg2 ;
   std::vector< llvm::Value * >::difference_type arg3 ;
-  std::vector< llvm::Value *,std::allocator< llvm::Value * > > *arg4 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   ptrdiff_t val2 ;
   int ecode2 = 0 ;
   ptrdiff_t val3 ;
   int ecode3 = 0 ;
-  int res4 = SWIG_OLDOBJ ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
-  PyObject * obj3 = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:ArrayValuePtr___setslice__",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOO:ArrayValuePtr___setslice__",&obj0,&obj1,&obj2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_llvm__Value_p_std__allocatorT_llvm__Value_p_t_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ArrayValuePtr___setslice__" "', argument " "1"" of type '" "std::vector< llvm::Value * > *""'"); 
@@ -11922,19 +12463,8 @@ SWIGINTERN PyObject *_wrap_ArrayValuePtr___setslice____SWIG_0(PyObject *SWIGUNUS
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "ArrayValuePtr___setslice__" "', argument " "3"" of type '" "std::vector< llvm::Value * >::difference_type""'");
   } 
   arg3 = static_cast< std::vector< llvm::Value * >::difference_type >(val3);
-  {
-    std::vector<llvm::Value*,std::allocator< llvm::Value * > > *ptr = (std::vector<llvm::Value*,std::allocator< llvm::Value * > > *)0;
-    res4 = swig::asptr(obj3, &ptr);
-    if (!SWIG_IsOK(res4)) {
-      SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "ArrayValuePtr___setslice__" "', argument " "4"" of type '" "std::vector< llvm::Value *,std::allocator< llvm::Value * > > const &""'"); 
-    }
-    if (!ptr) {
-      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "ArrayValuePtr___setslice__" "', argument " "4"" of type '" "std::vector< llvm::Value *,std::allocator< llvm::Value * > > const &""'"); 
-    }
-    arg4 = ptr;
-  }
   try {
-    std_vector_Sl_llvm_Value_Sm__Sg____setslice____SWIG_0(arg1,arg2,arg3,(std::vector< llvm::Value *,std::allocator< llvm::Value * > > const &)*arg4);
+    std_vector_Sl_llvm_Value_Sm__Sg____setslice____SWIG_0(arg1,arg2,arg3);
   }
   catch(std::out_of_range &_e) {
     SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
@@ -11944,10 +12474,8 @@ SWIGINTERN PyObject *_wrap_ArrayValuePtr___setslice____SWIG_0(PyObject *SWIGUNUS
   }
   
   resultobj = SWIG_Py_Void();
-  if (SWIG_IsNewObj(res4)) delete arg4;
   return resultobj;
 fail:
-  if (SWIG_IsNewObj(res4)) delete arg4;
   return NULL;
 }
 
@@ -11957,17 +12485,20 @@ SWIGINTERN PyObject *_wrap_ArrayValuePtr___setslice____SWIG_1(PyObject *SWIGUNUS
   std::vector< llvm::Value * > *arg1 = (std::vector< llvm::Value * > *) 0 ;
   std::vector< llvm::Value * >::difference_type arg2 ;
   std::vector< llvm::Value * >::difference_type arg3 ;
+  std::vector< llvm::Value *,std::allocator< llvm::Value * > > *arg4 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   ptrdiff_t val2 ;
   int ecode2 = 0 ;
   ptrdiff_t val3 ;
   int ecode3 = 0 ;
+  int res4 = SWIG_OLDOBJ ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
+  PyObject * obj3 = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:ArrayValuePtr___setslice__",&obj0,&obj1,&obj2)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:ArrayValuePtr___setslice__",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_llvm__Value_p_std__allocatorT_llvm__Value_p_t_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ArrayValuePtr___setslice__" "', argument " "1"" of type '" "std::vector< llvm::Value * > *""'"); 
@@ -11983,8 +12514,19 @@ SWIGINTERN PyObject *_wrap_ArrayValuePtr___setslice____SWIG_1(PyObject *SWIGUNUS
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "ArrayValuePtr___setslice__" "', argument " "3"" of type '" "std::vector< llvm::Value * >::difference_type""'");
   } 
   arg3 = static_cast< std::vector< llvm::Value * >::difference_type >(val3);
+  {
+    std::vector< llvm::Value*,std::allocator< llvm::Value * > > *ptr = (std::vector< llvm::Value*,std::allocator< llvm::Value * > > *)0;
+    res4 = swig::asptr(obj3, &ptr);
+    if (!SWIG_IsOK(res4)) {
+      SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "ArrayValuePtr___setslice__" "', argument " "4"" of type '" "std::vector< llvm::Value *,std::allocator< llvm::Value * > > const &""'"); 
+    }
+    if (!ptr) {
+      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "ArrayValuePtr___setslice__" "', argument " "4"" of type '" "std::vector< llvm::Value *,std::allocator< llvm::Value * > > const &""'"); 
+    }
+    arg4 = ptr;
+  }
   try {
-    std_vector_Sl_llvm_Value_Sm__Sg____setslice____SWIG_0(arg1,arg2,arg3);
+    std_vector_Sl_llvm_Value_Sm__Sg____setslice____SWIG_1(arg1,arg2,arg3,(std::vector< llvm::Value *,std::allocator< llvm::Value * > > const &)*arg4);
   }
   catch(std::out_of_range &_e) {
     SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
@@ -11994,25 +12536,29 @@ SWIGINTERN PyObject *_wrap_ArrayValuePtr___setslice____SWIG_1(PyObject *SWIGUNUS
   }
   
   resultobj = SWIG_Py_Void();
+  if (SWIG_IsNewObj(res4)) delete arg4;
   return resultobj;
 fail:
+  if (SWIG_IsNewObj(res4)) delete arg4;
   return NULL;
 }
 
 
 SWIGINTERN PyObject *_wrap_ArrayValuePtr___setslice__(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[5];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 4) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
   if (argc == 3) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::Value*,std::allocator< llvm::Value * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::Value*,std::allocator< llvm::Value * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -12025,14 +12571,14 @@ SWIGINTERN PyObject *_wrap_ArrayValuePtr___setslice__(PyObject *self, PyObject *
           _v = SWIG_CheckState(res);
         }
         if (_v) {
-          return _wrap_ArrayValuePtr___setslice____SWIG_1(self, args);
+          return _wrap_ArrayValuePtr___setslice____SWIG_0(self, args);
         }
       }
     }
   }
   if (argc == 4) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::Value*,std::allocator< llvm::Value * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::Value*,std::allocator< llvm::Value * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -12045,10 +12591,10 @@ SWIGINTERN PyObject *_wrap_ArrayValuePtr___setslice__(PyObject *self, PyObject *
           _v = SWIG_CheckState(res);
         }
         if (_v) {
-          int res = swig::asptr(argv[3], (std::vector<llvm::Value*,std::allocator< llvm::Value * > >**)(0));
+          int res = swig::asptr(argv[3], (std::vector< llvm::Value*,std::allocator< llvm::Value * > >**)(0));
           _v = SWIG_CheckState(res);
           if (_v) {
-            return _wrap_ArrayValuePtr___setslice____SWIG_0(self, args);
+            return _wrap_ArrayValuePtr___setslice____SWIG_1(self, args);
           }
         }
       }
@@ -12058,8 +12604,8 @@ SWIGINTERN PyObject *_wrap_ArrayValuePtr___setslice__(PyObject *self, PyObject *
 fail:
   SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'ArrayValuePtr___setslice__'.\n"
     "  Possible C/C++ prototypes are:\n"
-    "    std::vector< llvm::Value * >::__setslice__(std::vector< llvm::Value * >::difference_type,std::vector< llvm::Value * >::difference_type,std::vector< llvm::Value *,std::allocator< llvm::Value * > > const &)\n"
-    "    std::vector< llvm::Value * >::__setslice__(std::vector< llvm::Value * >::difference_type,std::vector< llvm::Value * >::difference_type)\n");
+    "    std::vector< llvm::Value * >::__setslice__(std::vector< llvm::Value * >::difference_type,std::vector< llvm::Value * >::difference_type)\n"
+    "    std::vector< llvm::Value * >::__setslice__(std::vector< llvm::Value * >::difference_type,std::vector< llvm::Value * >::difference_type,std::vector< llvm::Value *,std::allocator< llvm::Value * > > const &)\n");
   return 0;
 }
 
@@ -12101,6 +12647,9 @@ SWIGINTERN PyObject *_wrap_ArrayValuePtr___delslice__(PyObject *SWIGUNUSEDPARM(s
   catch(std::out_of_range &_e) {
     SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
   }
+  catch(std::invalid_argument &_e) {
+    SWIG_exception_fail(SWIG_ValueError, (&_e)->what());
+  }
   
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -12137,6 +12686,9 @@ SWIGINTERN PyObject *_wrap_ArrayValuePtr___delitem____SWIG_0(PyObject *SWIGUNUSE
   catch(std::out_of_range &_e) {
     SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
   }
+  catch(std::invalid_argument &_e) {
+    SWIG_exception_fail(SWIG_ValueError, (&_e)->what());
+  }
   
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -12173,8 +12725,11 @@ SWIGINTERN PyObject *_wrap_ArrayValuePtr___getitem____SWIG_0(PyObject *SWIGUNUSE
   catch(std::out_of_range &_e) {
     SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
   }
+  catch(std::invalid_argument &_e) {
+    SWIG_exception_fail(SWIG_ValueError, (&_e)->what());
+  }
   
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_std__vectorT_llvm__Value_p_std__allocatorT_llvm__Value_p_t_t, 0 |  0 );
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_std__vectorT_llvm__Value_p_std__allocatorT_llvm__Value_p_t_t, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
   return NULL;
@@ -12206,7 +12761,7 @@ SWIGINTERN PyObject *_wrap_ArrayValuePtr___setitem____SWIG_0(PyObject *SWIGUNUSE
     arg2 = (PySliceObject *) obj1;
   }
   {
-    std::vector<llvm::Value*,std::allocator< llvm::Value * > > *ptr = (std::vector<llvm::Value*,std::allocator< llvm::Value * > > *)0;
+    std::vector< llvm::Value*,std::allocator< llvm::Value * > > *ptr = (std::vector< llvm::Value*,std::allocator< llvm::Value * > > *)0;
     res3 = swig::asptr(obj2, &ptr);
     if (!SWIG_IsOK(res3)) {
       SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "ArrayValuePtr___setitem__" "', argument " "3"" of type '" "std::vector< llvm::Value *,std::allocator< llvm::Value * > > const &""'"); 
@@ -12262,6 +12817,9 @@ SWIGINTERN PyObject *_wrap_ArrayValuePtr___setitem____SWIG_1(PyObject *SWIGUNUSE
   catch(std::out_of_range &_e) {
     SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
   }
+  catch(std::invalid_argument &_e) {
+    SWIG_exception_fail(SWIG_ValueError, (&_e)->what());
+  }
   
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -12297,6 +12855,9 @@ SWIGINTERN PyObject *_wrap_ArrayValuePtr___delitem____SWIG_1(PyObject *SWIGUNUSE
   catch(std::out_of_range &_e) {
     SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
   }
+  catch(std::invalid_argument &_e) {
+    SWIG_exception_fail(SWIG_ValueError, (&_e)->what());
+  }
   
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -12306,18 +12867,20 @@ fail:
 
 
 SWIGINTERN PyObject *_wrap_ArrayValuePtr___delitem__(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[3];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[3] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 2) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
   if (argc == 2) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::Value*,std::allocator< llvm::Value * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::Value*,std::allocator< llvm::Value * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -12330,7 +12893,7 @@ SWIGINTERN PyObject *_wrap_ArrayValuePtr___delitem__(PyObject *self, PyObject *a
   }
   if (argc == 2) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::Value*,std::allocator< llvm::Value * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::Value*,std::allocator< llvm::Value * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -12390,18 +12953,20 @@ fail:
 
 
 SWIGINTERN PyObject *_wrap_ArrayValuePtr___getitem__(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[3];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[3] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 2) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
   if (argc == 2) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::Value*,std::allocator< llvm::Value * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::Value*,std::allocator< llvm::Value * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -12414,7 +12979,7 @@ SWIGINTERN PyObject *_wrap_ArrayValuePtr___getitem__(PyObject *self, PyObject *a
   }
   if (argc == 2) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::Value*,std::allocator< llvm::Value * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::Value*,std::allocator< llvm::Value * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -12482,18 +13047,20 @@ fail:
 
 
 SWIGINTERN PyObject *_wrap_ArrayValuePtr___setitem__(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[4];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[4] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 3) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
   if (argc == 2) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::Value*,std::allocator< llvm::Value * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::Value*,std::allocator< llvm::Value * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -12506,14 +13073,14 @@ SWIGINTERN PyObject *_wrap_ArrayValuePtr___setitem__(PyObject *self, PyObject *a
   }
   if (argc == 3) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::Value*,std::allocator< llvm::Value * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::Value*,std::allocator< llvm::Value * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
         _v = PySlice_Check(argv[1]);
       }
       if (_v) {
-        int res = swig::asptr(argv[2], (std::vector<llvm::Value*,std::allocator< llvm::Value * > >**)(0));
+        int res = swig::asptr(argv[2], (std::vector< llvm::Value*,std::allocator< llvm::Value * > >**)(0));
         _v = SWIG_CheckState(res);
         if (_v) {
           return _wrap_ArrayValuePtr___setitem____SWIG_0(self, args);
@@ -12523,7 +13090,7 @@ SWIGINTERN PyObject *_wrap_ArrayValuePtr___setitem__(PyObject *self, PyObject *a
   }
   if (argc == 3) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::Value*,std::allocator< llvm::Value * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::Value*,std::allocator< llvm::Value * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -12551,27 +13118,55 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_ArrayValuePtr_append(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_ArrayValuePtr_pop(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   std::vector< llvm::Value * > *arg1 = (std::vector< llvm::Value * > *) 0 ;
-  std::vector< llvm::Value * >::value_type arg2 = (std::vector< llvm::Value * >::value_type) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
   PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
+  std::vector< llvm::Value * >::value_type result;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:ArrayValuePtr_append",&obj0,&obj1)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"O:ArrayValuePtr_pop",&obj0)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_llvm__Value_p_std__allocatorT_llvm__Value_p_t_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ArrayValuePtr_append" "', argument " "1"" of type '" "std::vector< llvm::Value * > *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ArrayValuePtr_pop" "', argument " "1"" of type '" "std::vector< llvm::Value * > *""'"); 
   }
   arg1 = reinterpret_cast< std::vector< llvm::Value * > * >(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "ArrayValuePtr_append" "', argument " "2"" of type '" "std::vector< llvm::Value * >::value_type""'"); 
-  }
+  try {
+    result = (std::vector< llvm::Value * >::value_type)std_vector_Sl_llvm_Value_Sm__Sg__pop(arg1);
+  }
+  catch(std::out_of_range &_e) {
+    SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
+  }
+  
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_ArrayValuePtr_append(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  std::vector< llvm::Value * > *arg1 = (std::vector< llvm::Value * > *) 0 ;
+  std::vector< llvm::Value * >::value_type arg2 = (std::vector< llvm::Value * >::value_type) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OO:ArrayValuePtr_append",&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_llvm__Value_p_std__allocatorT_llvm__Value_p_t_t, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ArrayValuePtr_append" "', argument " "1"" of type '" "std::vector< llvm::Value * > *""'"); 
+  }
+  arg1 = reinterpret_cast< std::vector< llvm::Value * > * >(argp1);
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "ArrayValuePtr_append" "', argument " "2"" of type '" "std::vector< llvm::Value * >::value_type""'"); 
+  }
   arg2 = reinterpret_cast< std::vector< llvm::Value * >::value_type >(argp2);
   std_vector_Sl_llvm_Value_Sm__Sg__append(arg1,arg2);
   resultobj = SWIG_Py_Void();
@@ -12603,7 +13198,7 @@ SWIGINTERN PyObject *_wrap_new_ArrayValuePtr__SWIG_1(PyObject *SWIGUNUSEDPARM(se
   
   if (!PyArg_ParseTuple(args,(char *)"O:new_ArrayValuePtr",&obj0)) SWIG_fail;
   {
-    std::vector<llvm::Value*,std::allocator< llvm::Value * > > *ptr = (std::vector<llvm::Value*,std::allocator< llvm::Value * > > *)0;
+    std::vector< llvm::Value*,std::allocator< llvm::Value * > > *ptr = (std::vector< llvm::Value*,std::allocator< llvm::Value * > > *)0;
     res1 = swig::asptr(obj0, &ptr);
     if (!SWIG_IsOK(res1)) {
       SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "new_ArrayValuePtr" "', argument " "1"" of type '" "std::vector< llvm::Value * > const &""'"); 
@@ -12667,27 +13262,6 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_ArrayValuePtr_clear(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *resultobj = 0;
-  std::vector< llvm::Value * > *arg1 = (std::vector< llvm::Value * > *) 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  PyObject * obj0 = 0 ;
-  
-  if (!PyArg_ParseTuple(args,(char *)"O:ArrayValuePtr_clear",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_llvm__Value_p_std__allocatorT_llvm__Value_p_t_t, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ArrayValuePtr_clear" "', argument " "1"" of type '" "std::vector< llvm::Value * > *""'"); 
-  }
-  arg1 = reinterpret_cast< std::vector< llvm::Value * > * >(argp1);
-  (arg1)->clear();
-  resultobj = SWIG_Py_Void();
-  return resultobj;
-fail:
-  return NULL;
-}
-
-
 SWIGINTERN PyObject *_wrap_ArrayValuePtr_swap(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   std::vector< llvm::Value * > *arg1 = (std::vector< llvm::Value * > *) 0 ;
@@ -12721,28 +13295,6 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_ArrayValuePtr_get_allocator(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *resultobj = 0;
-  std::vector< llvm::Value * > *arg1 = (std::vector< llvm::Value * > *) 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  PyObject * obj0 = 0 ;
-  SwigValueWrapper< std::allocator< llvm::Value * > > result;
-  
-  if (!PyArg_ParseTuple(args,(char *)"O:ArrayValuePtr_get_allocator",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_llvm__Value_p_std__allocatorT_llvm__Value_p_t_t, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ArrayValuePtr_get_allocator" "', argument " "1"" of type '" "std::vector< llvm::Value * > const *""'"); 
-  }
-  arg1 = reinterpret_cast< std::vector< llvm::Value * > * >(argp1);
-  result = ((std::vector< llvm::Value * > const *)arg1)->get_allocator();
-  resultobj = SWIG_NewPointerObj((new std::vector< llvm::Value * >::allocator_type(static_cast< const std::vector< llvm::Value * >::allocator_type& >(result))), SWIGTYPE_p_std__allocatorT_llvm__Value_p_t, SWIG_POINTER_OWN |  0 );
-  return resultobj;
-fail:
-  return NULL;
-}
-
-
 SWIGINTERN PyObject *_wrap_ArrayValuePtr_begin(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   std::vector< llvm::Value * > *arg1 = (std::vector< llvm::Value * > *) 0 ;
@@ -12835,6 +13387,49 @@ fail:
 }
 
 
+SWIGINTERN PyObject *_wrap_ArrayValuePtr_clear(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  std::vector< llvm::Value * > *arg1 = (std::vector< llvm::Value * > *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:ArrayValuePtr_clear",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_llvm__Value_p_std__allocatorT_llvm__Value_p_t_t, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ArrayValuePtr_clear" "', argument " "1"" of type '" "std::vector< llvm::Value * > *""'"); 
+  }
+  arg1 = reinterpret_cast< std::vector< llvm::Value * > * >(argp1);
+  (arg1)->clear();
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_ArrayValuePtr_get_allocator(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  std::vector< llvm::Value * > *arg1 = (std::vector< llvm::Value * > *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  SwigValueWrapper< std::allocator< llvm::Value * > > result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:ArrayValuePtr_get_allocator",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_llvm__Value_p_std__allocatorT_llvm__Value_p_t_t, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ArrayValuePtr_get_allocator" "', argument " "1"" of type '" "std::vector< llvm::Value * > const *""'"); 
+  }
+  arg1 = reinterpret_cast< std::vector< llvm::Value * > * >(argp1);
+  result = ((std::vector< llvm::Value * > const *)arg1)->get_allocator();
+  resultobj = SWIG_NewPointerObj((new std::vector< llvm::Value * >::allocator_type(static_cast< const std::vector< llvm::Value * >::allocator_type& >(result))), SWIGTYPE_p_std__allocatorT_llvm__Value_p_t, SWIG_POINTER_OWN |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
 SWIGINTERN PyObject *_wrap_new_ArrayValuePtr__SWIG_2(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   std::vector< llvm::Value * >::size_type arg1 ;
@@ -12937,7 +13532,7 @@ SWIGINTERN PyObject *_wrap_ArrayValuePtr_erase__SWIG_0(PyObject *SWIGUNUSEDPARM(
       SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "ArrayValuePtr_erase" "', argument " "2"" of type '" "std::vector< llvm::Value * >::iterator""'");
     }
   }
-  result = (arg1)->erase(arg2);
+  result = std_vector_Sl_llvm_Value_Sm__Sg__erase__SWIG_0(arg1,arg2);
   resultobj = SWIG_NewPointerObj(swig::make_output_iterator(static_cast< const std::vector< llvm::Value * >::iterator & >(result)),
     swig::SwigPyIterator::descriptor(),SWIG_POINTER_OWN);
   return resultobj;
@@ -12990,7 +13585,7 @@ SWIGINTERN PyObject *_wrap_ArrayValuePtr_erase__SWIG_1(PyObject *SWIGUNUSEDPARM(
       SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "ArrayValuePtr_erase" "', argument " "3"" of type '" "std::vector< llvm::Value * >::iterator""'");
     }
   }
-  result = (arg1)->erase(arg2,arg3);
+  result = std_vector_Sl_llvm_Value_Sm__Sg__erase__SWIG_1(arg1,arg2,arg3);
   resultobj = SWIG_NewPointerObj(swig::make_output_iterator(static_cast< const std::vector< llvm::Value * >::iterator & >(result)),
     swig::SwigPyIterator::descriptor(),SWIG_POINTER_OWN);
   return resultobj;
@@ -13000,18 +13595,20 @@ fail:
 
 
 SWIGINTERN PyObject *_wrap_ArrayValuePtr_erase(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[4];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[4] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 3) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
   if (argc == 2) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::Value*,std::allocator< llvm::Value * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::Value*,std::allocator< llvm::Value * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       swig::SwigPyIterator *iter = 0;
@@ -13024,7 +13621,7 @@ SWIGINTERN PyObject *_wrap_ArrayValuePtr_erase(PyObject *self, PyObject *args) {
   }
   if (argc == 3) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::Value*,std::allocator< llvm::Value * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::Value*,std::allocator< llvm::Value * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       swig::SwigPyIterator *iter = 0;
@@ -13082,12 +13679,14 @@ fail:
 
 
 SWIGINTERN PyObject *_wrap_new_ArrayValuePtr(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[3];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[3] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 2) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
@@ -13106,7 +13705,7 @@ SWIGINTERN PyObject *_wrap_new_ArrayValuePtr(PyObject *self, PyObject *args) {
   }
   if (argc == 1) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::Value*,std::allocator< llvm::Value * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::Value*,std::allocator< llvm::Value * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       return _wrap_new_ArrayValuePtr__SWIG_1(self, args);
@@ -13292,18 +13891,20 @@ fail:
 
 
 SWIGINTERN PyObject *_wrap_ArrayValuePtr_resize(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[4];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[4] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 3) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
   if (argc == 2) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::Value*,std::allocator< llvm::Value * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::Value*,std::allocator< llvm::Value * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -13317,7 +13918,7 @@ SWIGINTERN PyObject *_wrap_ArrayValuePtr_resize(PyObject *self, PyObject *args)
   }
   if (argc == 3) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::Value*,std::allocator< llvm::Value * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::Value*,std::allocator< llvm::Value * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -13382,7 +13983,7 @@ SWIGINTERN PyObject *_wrap_ArrayValuePtr_insert__SWIG_0(PyObject *SWIGUNUSEDPARM
     SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "ArrayValuePtr_insert" "', argument " "3"" of type '" "std::vector< llvm::Value * >::value_type""'"); 
   }
   arg3 = reinterpret_cast< std::vector< llvm::Value * >::value_type >(argp3);
-  result = (arg1)->insert(arg2,arg3);
+  result = std_vector_Sl_llvm_Value_Sm__Sg__insert__SWIG_0(arg1,arg2,arg3);
   resultobj = SWIG_NewPointerObj(swig::make_output_iterator(static_cast< const std::vector< llvm::Value * >::iterator & >(result)),
     swig::SwigPyIterator::descriptor(),SWIG_POINTER_OWN);
   return resultobj;
@@ -13437,7 +14038,7 @@ SWIGINTERN PyObject *_wrap_ArrayValuePtr_insert__SWIG_1(PyObject *SWIGUNUSEDPARM
     SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "ArrayValuePtr_insert" "', argument " "4"" of type '" "std::vector< llvm::Value * >::value_type""'"); 
   }
   arg4 = reinterpret_cast< std::vector< llvm::Value * >::value_type >(argp4);
-  (arg1)->insert(arg2,arg3,arg4);
+  std_vector_Sl_llvm_Value_Sm__Sg__insert__SWIG_1(arg1,arg2,arg3,arg4);
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -13446,18 +14047,20 @@ fail:
 
 
 SWIGINTERN PyObject *_wrap_ArrayValuePtr_insert(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[5];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 4) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
   if (argc == 3) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::Value*,std::allocator< llvm::Value * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::Value*,std::allocator< llvm::Value * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       swig::SwigPyIterator *iter = 0;
@@ -13475,7 +14078,7 @@ SWIGINTERN PyObject *_wrap_ArrayValuePtr_insert(PyObject *self, PyObject *args)
   }
   if (argc == 4) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::Value*,std::allocator< llvm::Value * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::Value*,std::allocator< llvm::Value * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       swig::SwigPyIterator *iter = 0;
@@ -13582,7 +14185,7 @@ fail:
 
 SWIGINTERN PyObject *ArrayValuePtr_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *obj;
-  if (!PyArg_ParseTuple(args,(char*)"O:swigregister", &obj)) return NULL;
+  if (!PyArg_ParseTuple(args,(char *)"O:swigregister", &obj)) return NULL;
   SWIG_TypeNewClientData(SWIGTYPE_p_std__vectorT_llvm__Value_p_std__allocatorT_llvm__Value_p_t_t, SWIG_NewClientData(obj));
   return SWIG_Py_Void();
 }
@@ -13677,34 +14280,6 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_ArrayBBPtr_pop(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *resultobj = 0;
-  std::vector< llvm::BasicBlock * > *arg1 = (std::vector< llvm::BasicBlock * > *) 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  PyObject * obj0 = 0 ;
-  std::vector< llvm::BasicBlock * >::value_type result;
-  
-  if (!PyArg_ParseTuple(args,(char *)"O:ArrayBBPtr_pop",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_llvm__BasicBlock_p_std__allocatorT_llvm__BasicBlock_p_t_t, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ArrayBBPtr_pop" "', argument " "1"" of type '" "std::vector< llvm::BasicBlock * > *""'"); 
-  }
-  arg1 = reinterpret_cast< std::vector< llvm::BasicBlock * > * >(argp1);
-  try {
-    result = (std::vector< llvm::BasicBlock * >::value_type)std_vector_Sl_llvm_BasicBlock_Sm__Sg__pop(arg1);
-  }
-  catch(std::out_of_range &_e) {
-    SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
-  }
-  
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__BasicBlock, 0 |  0 );
-  return resultobj;
-fail:
-  return NULL;
-}
-
-
 SWIGINTERN PyObject *_wrap_ArrayBBPtr___getslice__(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   std::vector< llvm::BasicBlock * > *arg1 = (std::vector< llvm::BasicBlock * > *) 0 ;
@@ -13743,6 +14318,9 @@ SWIGINTERN PyObject *_wrap_ArrayBBPtr___getslice__(PyObject *SWIGUNUSEDPARM(self
   catch(std::out_of_range &_e) {
     SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
   }
+  catch(std::invalid_argument &_e) {
+    SWIG_exception_fail(SWIG_ValueError, (&_e)->what());
+  }
   
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_std__vectorT_llvm__BasicBlock_p_std__allocatorT_llvm__BasicBlock_p_t_t, SWIG_POINTER_OWN |  0 );
   return resultobj;
@@ -13756,20 +14334,17 @@ SWIGINTERN PyObject *_wrap_ArrayBBPtr___setslice____SWIG_0(PyObject *SWIGUNUSEDP
   std::vector< llvm::BasicBlock * > *arg1 = (std::vector< llvm::BasicBlock * > *) 0 ;
   std::vector< llvm::BasicBlock * >::difference_type arg2 ;
   std::vector< llvm::BasicBlock * >::difference_type arg3 ;
-  std::vector< llvm::BasicBlock *,std::allocator< llvm::BasicBlock * > > *arg4 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   ptrdiff_t val2 ;
   int ecode2 = 0 ;
   ptrdiff_t val3 ;
   int ecode3 = 0 ;
-  int res4 = SWIG_OLDOBJ ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
-  PyObject * obj3 = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:ArrayBBPtr___setslice__",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOO:ArrayBBPtr___setslice__",&obj0,&obj1,&obj2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_llvm__BasicBlock_p_std__allocatorT_llvm__BasicBlock_p_t_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ArrayBBPtr___setslice__" "', argument " "1"" of type '" "std::vector< llvm::BasicBlock * > *""'"); 
@@ -13785,19 +14360,8 @@ SWIGINTERN PyObject *_wrap_ArrayBBPtr___setslice____SWIG_0(PyObject *SWIGUNUSEDP
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "ArrayBBPtr___setslice__" "', argument " "3"" of type '" "std::vector< llvm::BasicBlock * >::difference_type""'");
   } 
   arg3 = static_cast< std::vector< llvm::BasicBlock * >::difference_type >(val3);
-  {
-    std::vector<llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > > *ptr = (std::vector<llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > > *)0;
-    res4 = swig::asptr(obj3, &ptr);
-    if (!SWIG_IsOK(res4)) {
-      SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "ArrayBBPtr___setslice__" "', argument " "4"" of type '" "std::vector< llvm::BasicBlock *,std::allocator< llvm::BasicBlock * > > const &""'"); 
-    }
-    if (!ptr) {
-      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "ArrayBBPtr___setslice__" "', argument " "4"" of type '" "std::vector< llvm::BasicBlock *,std::allocator< llvm::BasicBlock * > > const &""'"); 
-    }
-    arg4 = ptr;
-  }
   try {
-    std_vector_Sl_llvm_BasicBlock_Sm__Sg____setslice____SWIG_0(arg1,arg2,arg3,(std::vector< llvm::BasicBlock *,std::allocator< llvm::BasicBlock * > > const &)*arg4);
+    std_vector_Sl_llvm_BasicBlock_Sm__Sg____setslice____SWIG_0(arg1,arg2,arg3);
   }
   catch(std::out_of_range &_e) {
     SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
@@ -13807,10 +14371,8 @@ SWIGINTERN PyObject *_wrap_ArrayBBPtr___setslice____SWIG_0(PyObject *SWIGUNUSEDP
   }
   
   resultobj = SWIG_Py_Void();
-  if (SWIG_IsNewObj(res4)) delete arg4;
   return resultobj;
 fail:
-  if (SWIG_IsNewObj(res4)) delete arg4;
   return NULL;
 }
 
@@ -13820,17 +14382,20 @@ SWIGINTERN PyObject *_wrap_ArrayBBPtr___setslice____SWIG_1(PyObject *SWIGUNUSEDP
   std::vector< llvm::BasicBlock * > *arg1 = (std::vector< llvm::BasicBlock * > *) 0 ;
   std::vector< llvm::BasicBlock * >::difference_type arg2 ;
   std::vector< llvm::BasicBlock * >::difference_type arg3 ;
+  std::vector< llvm::BasicBlock *,std::allocator< llvm::BasicBlock * > > *arg4 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   ptrdiff_t val2 ;
   int ecode2 = 0 ;
   ptrdiff_t val3 ;
   int ecode3 = 0 ;
+  int res4 = SWIG_OLDOBJ ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
+  PyObject * obj3 = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:ArrayBBPtr___setslice__",&obj0,&obj1,&obj2)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:ArrayBBPtr___setslice__",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_llvm__BasicBlock_p_std__allocatorT_llvm__BasicBlock_p_t_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ArrayBBPtr___setslice__" "', argument " "1"" of type '" "std::vector< llvm::BasicBlock * > *""'"); 
@@ -13846,8 +14411,19 @@ SWIGINTERN PyObject *_wrap_ArrayBBPtr___setslice____SWIG_1(PyObject *SWIGUNUSEDP
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "ArrayBBPtr___setslice__" "', argument " "3"" of type '" "std::vector< llvm::BasicBlock * >::difference_type""'");
   } 
   arg3 = static_cast< std::vector< llvm::BasicBlock * >::difference_type >(val3);
+  {
+    std::vector< llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > > *ptr = (std::vector< llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > > *)0;
+    res4 = swig::asptr(obj3, &ptr);
+    if (!SWIG_IsOK(res4)) {
+      SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "ArrayBBPtr___setslice__" "', argument " "4"" of type '" "std::vector< llvm::BasicBlock *,std::allocator< llvm::BasicBlock * > > const &""'"); 
+    }
+    if (!ptr) {
+      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "ArrayBBPtr___setslice__" "', argument " "4"" of type '" "std::vector< llvm::BasicBlock *,std::allocator< llvm::BasicBlock * > > const &""'"); 
+    }
+    arg4 = ptr;
+  }
   try {
-    std_vector_Sl_llvm_BasicBlock_Sm__Sg____setslice____SWIG_0(arg1,arg2,arg3);
+    std_vector_Sl_llvm_BasicBlock_Sm__Sg____setslice____SWIG_1(arg1,arg2,arg3,(std::vector< llvm::BasicBlock *,std::allocator< llvm::BasicBlock * > > const &)*arg4);
   }
   catch(std::out_of_range &_e) {
     SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
@@ -13857,25 +14433,29 @@ SWIGINTERN PyObject *_wrap_ArrayBBPtr___setslice____SWIG_1(PyObject *SWIGUNUSEDP
   }
   
   resultobj = SWIG_Py_Void();
+  if (SWIG_IsNewObj(res4)) delete arg4;
   return resultobj;
 fail:
+  if (SWIG_IsNewObj(res4)) delete arg4;
   return NULL;
 }
 
 
 SWIGINTERN PyObject *_wrap_ArrayBBPtr___setslice__(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[5];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 4) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
   if (argc == 3) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -13888,14 +14468,14 @@ SWIGINTERN PyObject *_wrap_ArrayBBPtr___setslice__(PyObject *self, PyObject *arg
           _v = SWIG_CheckState(res);
         }
         if (_v) {
-          return _wrap_ArrayBBPtr___setslice____SWIG_1(self, args);
+          return _wrap_ArrayBBPtr___setslice____SWIG_0(self, args);
         }
       }
     }
   }
   if (argc == 4) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -13908,10 +14488,10 @@ SWIGINTERN PyObject *_wrap_ArrayBBPtr___setslice__(PyObject *self, PyObject *arg
           _v = SWIG_CheckState(res);
         }
         if (_v) {
-          int res = swig::asptr(argv[3], (std::vector<llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >**)(0));
+          int res = swig::asptr(argv[3], (std::vector< llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >**)(0));
           _v = SWIG_CheckState(res);
           if (_v) {
-            return _wrap_ArrayBBPtr___setslice____SWIG_0(self, args);
+            return _wrap_ArrayBBPtr___setslice____SWIG_1(self, args);
           }
         }
       }
@@ -13921,8 +14501,8 @@ SWIGINTERN PyObject *_wrap_ArrayBBPtr___setslice__(PyObject *self, PyObject *arg
 fail:
   SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'ArrayBBPtr___setslice__'.\n"
     "  Possible C/C++ prototypes are:\n"
-    "    std::vector< llvm::BasicBlock * >::__setslice__(std::vector< llvm::BasicBlock * >::difference_type,std::vector< llvm::BasicBlock * >::difference_type,std::vector< llvm::BasicBlock *,std::allocator< llvm::BasicBlock * > > const &)\n"
-    "    std::vector< llvm::BasicBlock * >::__setslice__(std::vector< llvm::BasicBlock * >::difference_type,std::vector< llvm::BasicBlock * >::difference_type)\n");
+    "    std::vector< llvm::BasicBlock * >::__setslice__(std::vector< llvm::BasicBlock * >::difference_type,std::vector< llvm::BasicBlock * >::difference_type)\n"
+    "    std::vector< llvm::BasicBlock * >::__setslice__(std::vector< llvm::BasicBlock * >::difference_type,std::vector< llvm::BasicBlock * >::difference_type,std::vector< llvm::BasicBlock *,std::allocator< llvm::BasicBlock * > > const &)\n");
   return 0;
 }
 
@@ -13964,6 +14544,9 @@ SWIGINTERN PyObject *_wrap_ArrayBBPtr___delslice__(PyObject *SWIGUNUSEDPARM(self
   catch(std::out_of_range &_e) {
     SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
   }
+  catch(std::invalid_argument &_e) {
+    SWIG_exception_fail(SWIG_ValueError, (&_e)->what());
+  }
   
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -14000,6 +14583,9 @@ SWIGINTERN PyObject *_wrap_ArrayBBPtr___delitem____SWIG_0(PyObject *SWIGUNUSEDPA
   catch(std::out_of_range &_e) {
     SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
   }
+  catch(std::invalid_argument &_e) {
+    SWIG_exception_fail(SWIG_ValueError, (&_e)->what());
+  }
   
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -14036,8 +14622,11 @@ SWIGINTERN PyObject *_wrap_ArrayBBPtr___getitem____SWIG_0(PyObject *SWIGUNUSEDPA
   catch(std::out_of_range &_e) {
     SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
   }
+  catch(std::invalid_argument &_e) {
+    SWIG_exception_fail(SWIG_ValueError, (&_e)->what());
+  }
   
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_std__vectorT_llvm__BasicBlock_p_std__allocatorT_llvm__BasicBlock_p_t_t, 0 |  0 );
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_std__vectorT_llvm__BasicBlock_p_std__allocatorT_llvm__BasicBlock_p_t_t, SWIG_POINTER_OWN |  0 );
   return resultobj;
 fail:
   return NULL;
@@ -14069,7 +14658,7 @@ SWIGINTERN PyObject *_wrap_ArrayBBPtr___setitem____SWIG_0(PyObject *SWIGUNUSEDPA
     arg2 = (PySliceObject *) obj1;
   }
   {
-    std::vector<llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > > *ptr = (std::vector<llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > > *)0;
+    std::vector< llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > > *ptr = (std::vector< llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > > *)0;
     res3 = swig::asptr(obj2, &ptr);
     if (!SWIG_IsOK(res3)) {
       SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "ArrayBBPtr___setitem__" "', argument " "3"" of type '" "std::vector< llvm::BasicBlock *,std::allocator< llvm::BasicBlock * > > const &""'"); 
@@ -14125,6 +14714,9 @@ SWIGINTERN PyObject *_wrap_ArrayBBPtr___setitem____SWIG_1(PyObject *SWIGUNUSEDPA
   catch(std::out_of_range &_e) {
     SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
   }
+  catch(std::invalid_argument &_e) {
+    SWIG_exception_fail(SWIG_ValueError, (&_e)->what());
+  }
   
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -14160,6 +14752,9 @@ SWIGINTERN PyObject *_wrap_ArrayBBPtr___delitem____SWIG_1(PyObject *SWIGUNUSEDPA
   catch(std::out_of_range &_e) {
     SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
   }
+  catch(std::invalid_argument &_e) {
+    SWIG_exception_fail(SWIG_ValueError, (&_e)->what());
+  }
   
   resultobj = SWIG_Py_Void();
   return resultobj;
@@ -14169,18 +14764,20 @@ fail:
 
 
 SWIGINTERN PyObject *_wrap_ArrayBBPtr___delitem__(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[3];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[3] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 2) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
   if (argc == 2) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -14193,7 +14790,7 @@ SWIGINTERN PyObject *_wrap_ArrayBBPtr___delitem__(PyObject *self, PyObject *args
   }
   if (argc == 2) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -14253,18 +14850,20 @@ fail:
 
 
 SWIGINTERN PyObject *_wrap_ArrayBBPtr___getitem__(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[3];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[3] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 2) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
   if (argc == 2) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -14277,7 +14876,7 @@ SWIGINTERN PyObject *_wrap_ArrayBBPtr___getitem__(PyObject *self, PyObject *args
   }
   if (argc == 2) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -14345,18 +14944,20 @@ fail:
 
 
 SWIGINTERN PyObject *_wrap_ArrayBBPtr___setitem__(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[4];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[4] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 3) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
   if (argc == 2) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -14369,14 +14970,14 @@ SWIGINTERN PyObject *_wrap_ArrayBBPtr___setitem__(PyObject *self, PyObject *args
   }
   if (argc == 3) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
         _v = PySlice_Check(argv[1]);
       }
       if (_v) {
-        int res = swig::asptr(argv[2], (std::vector<llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >**)(0));
+        int res = swig::asptr(argv[2], (std::vector< llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >**)(0));
         _v = SWIG_CheckState(res);
         if (_v) {
           return _wrap_ArrayBBPtr___setitem____SWIG_0(self, args);
@@ -14386,7 +14987,7 @@ SWIGINTERN PyObject *_wrap_ArrayBBPtr___setitem__(PyObject *self, PyObject *args
   }
   if (argc == 3) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -14414,6 +15015,34 @@ fail:
 }
 
 
+SWIGINTERN PyObject *_wrap_ArrayBBPtr_pop(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  std::vector< llvm::BasicBlock * > *arg1 = (std::vector< llvm::BasicBlock * > *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  std::vector< llvm::BasicBlock * >::value_type result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:ArrayBBPtr_pop",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_llvm__BasicBlock_p_std__allocatorT_llvm__BasicBlock_p_t_t, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ArrayBBPtr_pop" "', argument " "1"" of type '" "std::vector< llvm::BasicBlock * > *""'"); 
+  }
+  arg1 = reinterpret_cast< std::vector< llvm::BasicBlock * > * >(argp1);
+  try {
+    result = (std::vector< llvm::BasicBlock * >::value_type)std_vector_Sl_llvm_BasicBlock_Sm__Sg__pop(arg1);
+  }
+  catch(std::out_of_range &_e) {
+    SWIG_exception_fail(SWIG_IndexError, (&_e)->what());
+  }
+  
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__BasicBlock, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
 SWIGINTERN PyObject *_wrap_ArrayBBPtr_append(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   std::vector< llvm::BasicBlock * > *arg1 = (std::vector< llvm::BasicBlock * > *) 0 ;
@@ -14466,7 +15095,7 @@ SWIGINTERN PyObject *_wrap_new_ArrayBBPtr__SWIG_1(PyObject *SWIGUNUSEDPARM(self)
   
   if (!PyArg_ParseTuple(args,(char *)"O:new_ArrayBBPtr",&obj0)) SWIG_fail;
   {
-    std::vector<llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > > *ptr = (std::vector<llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > > *)0;
+    std::vector< llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > > *ptr = (std::vector< llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > > *)0;
     res1 = swig::asptr(obj0, &ptr);
     if (!SWIG_IsOK(res1)) {
       SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "new_ArrayBBPtr" "', argument " "1"" of type '" "std::vector< llvm::BasicBlock * > const &""'"); 
@@ -14530,42 +15159,21 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_ArrayBBPtr_clear(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_ArrayBBPtr_swap(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   std::vector< llvm::BasicBlock * > *arg1 = (std::vector< llvm::BasicBlock * > *) 0 ;
+  std::vector< llvm::BasicBlock * > *arg2 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
   PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:ArrayBBPtr_clear",&obj0)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OO:ArrayBBPtr_swap",&obj0,&obj1)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_llvm__BasicBlock_p_std__allocatorT_llvm__BasicBlock_p_t_t, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ArrayBBPtr_clear" "', argument " "1"" of type '" "std::vector< llvm::BasicBlock * > *""'"); 
-  }
-  arg1 = reinterpret_cast< std::vector< llvm::BasicBlock * > * >(argp1);
-  (arg1)->clear();
-  resultobj = SWIG_Py_Void();
-  return resultobj;
-fail:
-  return NULL;
-}
-
-
-SWIGINTERN PyObject *_wrap_ArrayBBPtr_swap(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *resultobj = 0;
-  std::vector< llvm::BasicBlock * > *arg1 = (std::vector< llvm::BasicBlock * > *) 0 ;
-  std::vector< llvm::BasicBlock * > *arg2 = 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
-  
-  if (!PyArg_ParseTuple(args,(char *)"OO:ArrayBBPtr_swap",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_llvm__BasicBlock_p_std__allocatorT_llvm__BasicBlock_p_t_t, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ArrayBBPtr_swap" "', argument " "1"" of type '" "std::vector< llvm::BasicBlock * > *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ArrayBBPtr_swap" "', argument " "1"" of type '" "std::vector< llvm::BasicBlock * > *""'"); 
   }
   arg1 = reinterpret_cast< std::vector< llvm::BasicBlock * > * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2, SWIGTYPE_p_std__vectorT_llvm__BasicBlock_p_std__allocatorT_llvm__BasicBlock_p_t_t,  0 );
@@ -14584,28 +15192,6 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_ArrayBBPtr_get_allocator(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *resultobj = 0;
-  std::vector< llvm::BasicBlock * > *arg1 = (std::vector< llvm::BasicBlock * > *) 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  PyObject * obj0 = 0 ;
-  SwigValueWrapper< std::allocator< llvm::BasicBlock * > > result;
-  
-  if (!PyArg_ParseTuple(args,(char *)"O:ArrayBBPtr_get_allocator",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_llvm__BasicBlock_p_std__allocatorT_llvm__BasicBlock_p_t_t, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ArrayBBPtr_get_allocator" "', argument " "1"" of type '" "std::vector< llvm::BasicBlock * > const *""'"); 
-  }
-  arg1 = reinterpret_cast< std::vector< llvm::BasicBlock * > * >(argp1);
-  result = ((std::vector< llvm::BasicBlock * > const *)arg1)->get_allocator();
-  resultobj = SWIG_NewPointerObj((new std::vector< llvm::BasicBlock * >::allocator_type(static_cast< const std::vector< llvm::BasicBlock * >::allocator_type& >(result))), SWIGTYPE_p_std__allocatorT_llvm__BasicBlock_p_t, SWIG_POINTER_OWN |  0 );
-  return resultobj;
-fail:
-  return NULL;
-}
-
-
 SWIGINTERN PyObject *_wrap_ArrayBBPtr_begin(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   std::vector< llvm::BasicBlock * > *arg1 = (std::vector< llvm::BasicBlock * > *) 0 ;
@@ -14698,6 +15284,49 @@ fail:
 }
 
 
+SWIGINTERN PyObject *_wrap_ArrayBBPtr_clear(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  std::vector< llvm::BasicBlock * > *arg1 = (std::vector< llvm::BasicBlock * > *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:ArrayBBPtr_clear",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_llvm__BasicBlock_p_std__allocatorT_llvm__BasicBlock_p_t_t, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ArrayBBPtr_clear" "', argument " "1"" of type '" "std::vector< llvm::BasicBlock * > *""'"); 
+  }
+  arg1 = reinterpret_cast< std::vector< llvm::BasicBlock * > * >(argp1);
+  (arg1)->clear();
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_ArrayBBPtr_get_allocator(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  std::vector< llvm::BasicBlock * > *arg1 = (std::vector< llvm::BasicBlock * > *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  SwigValueWrapper< std::allocator< llvm::BasicBlock * > > result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:ArrayBBPtr_get_allocator",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_std__vectorT_llvm__BasicBlock_p_std__allocatorT_llvm__BasicBlock_p_t_t, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ArrayBBPtr_get_allocator" "', argument " "1"" of type '" "std::vector< llvm::BasicBlock * > const *""'"); 
+  }
+  arg1 = reinterpret_cast< std::vector< llvm::BasicBlock * > * >(argp1);
+  result = ((std::vector< llvm::BasicBlock * > const *)arg1)->get_allocator();
+  resultobj = SWIG_NewPointerObj((new std::vector< llvm::BasicBlock * >::allocator_type(static_cast< const std::vector< llvm::BasicBlock * >::allocator_type& >(result))), SWIGTYPE_p_std__allocatorT_llvm__BasicBlock_p_t, SWIG_POINTER_OWN |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
 SWIGINTERN PyObject *_wrap_new_ArrayBBPtr__SWIG_2(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   std::vector< llvm::BasicBlock * >::size_type arg1 ;
@@ -14800,7 +15429,7 @@ SWIGINTERN PyObject *_wrap_ArrayBBPtr_erase__SWIG_0(PyObject *SWIGUNUSEDPARM(sel
       SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "ArrayBBPtr_erase" "', argument " "2"" of type '" "std::vector< llvm::BasicBlock * >::iterator""'");
     }
   }
-  result = (arg1)->erase(arg2);
+  result = std_vector_Sl_llvm_BasicBlock_Sm__Sg__erase__SWIG_0(arg1,arg2);
   resultobj = SWIG_NewPointerObj(swig::make_output_iterator(static_cast< const std::vector< llvm::BasicBlock * >::iterator & >(result)),
     swig::SwigPyIterator::descriptor(),SWIG_POINTER_OWN);
   return resultobj;
@@ -14853,7 +15482,7 @@ SWIGINTERN PyObject *_wrap_ArrayBBPtr_erase__SWIG_1(PyObject *SWIGUNUSEDPARM(sel
       SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "ArrayBBPtr_erase" "', argument " "3"" of type '" "std::vector< llvm::BasicBlock * >::iterator""'");
     }
   }
-  result = (arg1)->erase(arg2,arg3);
+  result = std_vector_Sl_llvm_BasicBlock_Sm__Sg__erase__SWIG_1(arg1,arg2,arg3);
   resultobj = SWIG_NewPointerObj(swig::make_output_iterator(static_cast< const std::vector< llvm::BasicBlock * >::iterator & >(result)),
     swig::SwigPyIterator::descriptor(),SWIG_POINTER_OWN);
   return resultobj;
@@ -14863,18 +15492,20 @@ fail:
 
 
 SWIGINTERN PyObject *_wrap_ArrayBBPtr_erase(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[4];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[4] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 3) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
   if (argc == 2) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       swig::SwigPyIterator *iter = 0;
@@ -14887,7 +15518,7 @@ SWIGINTERN PyObject *_wrap_ArrayBBPtr_erase(PyObject *self, PyObject *args) {
   }
   if (argc == 3) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       swig::SwigPyIterator *iter = 0;
@@ -14945,12 +15576,14 @@ fail:
 
 
 SWIGINTERN PyObject *_wrap_new_ArrayBBPtr(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[3];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[3] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 2) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
@@ -14969,7 +15602,7 @@ SWIGINTERN PyObject *_wrap_new_ArrayBBPtr(PyObject *self, PyObject *args) {
   }
   if (argc == 1) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       return _wrap_new_ArrayBBPtr__SWIG_1(self, args);
@@ -15155,18 +15788,20 @@ fail:
 
 
 SWIGINTERN PyObject *_wrap_ArrayBBPtr_resize(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[4];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[4] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 3) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
   if (argc == 2) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -15180,7 +15815,7 @@ SWIGINTERN PyObject *_wrap_ArrayBBPtr_resize(PyObject *self, PyObject *args) {
   }
   if (argc == 3) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       {
@@ -15245,7 +15880,7 @@ SWIGINTERN PyObject *_wrap_ArrayBBPtr_insert__SWIG_0(PyObject *SWIGUNUSEDPARM(se
     SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "ArrayBBPtr_insert" "', argument " "3"" of type '" "std::vector< llvm::BasicBlock * >::value_type""'"); 
   }
   arg3 = reinterpret_cast< std::vector< llvm::BasicBlock * >::value_type >(argp3);
-  result = (arg1)->insert(arg2,arg3);
+  result = std_vector_Sl_llvm_BasicBlock_Sm__Sg__insert__SWIG_0(arg1,arg2,arg3);
   resultobj = SWIG_NewPointerObj(swig::make_output_iterator(static_cast< const std::vector< llvm::BasicBlock * >::iterator & >(result)),
     swig::SwigPyIterator::descriptor(),SWIG_POINTER_OWN);
   return resultobj;
@@ -15300,7 +15935,7 @@ SWIGINTERN PyObject *_wrap_ArrayBBPtr_insert__SWIG_1(PyObject *SWIGUNUSEDPARM(se
     SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "ArrayBBPtr_insert" "', argument " "4"" of type '" "std::vector< llvm::BasicBlock * >::value_type""'"); 
   }
   arg4 = reinterpret_cast< std::vector< llvm::BasicBlock * >::value_type >(argp4);
-  (arg1)->insert(arg2,arg3,arg4);
+  std_vector_Sl_llvm_BasicBlock_Sm__Sg__insert__SWIG_1(arg1,arg2,arg3,arg4);
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -15309,18 +15944,20 @@ fail:
 
 
 SWIGINTERN PyObject *_wrap_ArrayBBPtr_insert(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[5];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 4) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
   if (argc == 3) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       swig::SwigPyIterator *iter = 0;
@@ -15338,7 +15975,7 @@ SWIGINTERN PyObject *_wrap_ArrayBBPtr_insert(PyObject *self, PyObject *args) {
   }
   if (argc == 4) {
     int _v;
-    int res = swig::asptr(argv[0], (std::vector<llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >**)(0));
+    int res = swig::asptr(argv[0], (std::vector< llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >**)(0));
     _v = SWIG_CheckState(res);
     if (_v) {
       swig::SwigPyIterator *iter = 0;
@@ -15445,7 +16082,7 @@ fail:
 
 SWIGINTERN PyObject *ArrayBBPtr_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *obj;
-  if (!PyArg_ParseTuple(args,(char*)"O:swigregister", &obj)) return NULL;
+  if (!PyArg_ParseTuple(args,(char *)"O:swigregister", &obj)) return NULL;
   SWIG_TypeNewClientData(SWIGTYPE_p_std__vectorT_llvm__BasicBlock_p_std__allocatorT_llvm__BasicBlock_p_t_t, SWIG_NewClientData(obj));
   return SWIG_Py_Void();
 }
@@ -15486,12 +16123,14 @@ fail:
 
 
 SWIGINTERN PyObject *_wrap_TypeFactory_make_int(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[2];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[2] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 1) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
@@ -15610,6 +16249,61 @@ fail:
 }
 
 
+SWIGINTERN PyObject *_wrap_TypeFactory_make_array(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  llvm::Type *arg1 = (llvm::Type *) 0 ;
+  unsigned int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  unsigned int val2 ;
+  int ecode2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  llvm::Type *result = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OO:TypeFactory_make_array",&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_llvm__Type, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TypeFactory_make_array" "', argument " "1"" of type '" "llvm::Type *""'"); 
+  }
+  arg1 = reinterpret_cast< llvm::Type * >(argp1);
+  ecode2 = SWIG_AsVal_unsigned_SS_int(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "TypeFactory_make_array" "', argument " "2"" of type '" "unsigned int""'");
+  } 
+  arg2 = static_cast< unsigned int >(val2);
+  result = (llvm::Type *)TypeFactory::make_array(arg1,arg2);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Type, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_TypeFactory_make_struct(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  std::vector< llvm::Type *,std::allocator< llvm::Type * > > arg1 ;
+  PyObject * obj0 = 0 ;
+  llvm::Type *result = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:TypeFactory_make_struct",&obj0)) SWIG_fail;
+  {
+    std::vector< llvm::Type*,std::allocator< llvm::Type * > > *ptr = (std::vector< llvm::Type*,std::allocator< llvm::Type * > > *)0;
+    int res = swig::asptr(obj0, &ptr);
+    if (!SWIG_IsOK(res) || !ptr) {
+      SWIG_exception_fail(SWIG_ArgError((ptr ? res : SWIG_TypeError)), "in method '" "TypeFactory_make_struct" "', argument " "1"" of type '" "std::vector< llvm::Type *,std::allocator< llvm::Type * > >""'"); 
+    }
+    arg1 = *ptr;
+    if (SWIG_IsNewObj(res)) delete ptr;
+  }
+  result = (llvm::Type *)TypeFactory::make_struct(arg1);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Type, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
 SWIGINTERN PyObject *_wrap_new_TypeFactory(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   TypeFactory *result = 0 ;
@@ -15646,7 +16340,7 @@ fail:
 
 SWIGINTERN PyObject *TypeFactory_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *obj;
-  if (!PyArg_ParseTuple(args,(char*)"O:swigregister", &obj)) return NULL;
+  if (!PyArg_ParseTuple(args,(char *)"O:swigregister", &obj)) return NULL;
   SWIG_TypeNewClientData(SWIGTYPE_p_TypeFactory, SWIG_NewClientData(obj));
   return SWIG_Py_Void();
 }
@@ -15766,6 +16460,59 @@ fail:
 }
 
 
+SWIGINTERN PyObject *_wrap_ConstantFactory_make_null(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  llvm::Type *arg1 = (llvm::Type *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  llvm::Value *result = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:ConstantFactory_make_null",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_llvm__Type, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ConstantFactory_make_null" "', argument " "1"" of type '" "llvm::Type *""'"); 
+  }
+  arg1 = reinterpret_cast< llvm::Type * >(argp1);
+  result = (llvm::Value *)ConstantFactory::make_null(arg1);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_ConstantFactory_make_pointer(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  llvm::Type *arg1 = (llvm::Type *) 0 ;
+  unsigned long long arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  unsigned long long val2 ;
+  int ecode2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  llvm::Value *result = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OO:ConstantFactory_make_pointer",&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_llvm__Type, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "ConstantFactory_make_pointer" "', argument " "1"" of type '" "llvm::Type *""'"); 
+  }
+  arg1 = reinterpret_cast< llvm::Type * >(argp1);
+  ecode2 = SWIG_AsVal_unsigned_SS_long_SS_long(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "ConstantFactory_make_pointer" "', argument " "2"" of type '" "unsigned long long""'");
+  } 
+  arg2 = static_cast< unsigned long long >(val2);
+  result = (llvm::Value *)ConstantFactory::make_pointer(arg1,arg2);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
 SWIGINTERN PyObject *_wrap_new_ConstantFactory(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   ConstantFactory *result = 0 ;
@@ -15802,7 +16549,7 @@ fail:
 
 SWIGINTERN PyObject *ConstantFactory_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *obj;
-  if (!PyArg_ParseTuple(args,(char*)"O:swigregister", &obj)) return NULL;
+  if (!PyArg_ParseTuple(args,(char *)"O:swigregister", &obj)) return NULL;
   SWIG_TypeNewClientData(SWIGTYPE_p_ConstantFactory, SWIG_NewClientData(obj));
   return SWIG_Py_Void();
 }
@@ -15988,7 +16735,7 @@ SWIGINTERN PyObject *_wrap_FunctionAdaptor_arguments(PyObject *SWIGUNUSEDPARM(se
   }
   arg1 = reinterpret_cast< FunctionAdaptor * >(argp1);
   result = ((FunctionAdaptor const *)arg1)->arguments();
-  resultobj = swig::from(static_cast< std::vector<llvm::Value*,std::allocator< llvm::Value * > > >(result));
+  resultobj = swig::from(static_cast< std::vector< llvm::Value*,std::allocator< llvm::Value * > > >(result));
   return resultobj;
 fail:
   return NULL;
@@ -16039,6 +16786,70 @@ fail:
 }
 
 
+SWIGINTERN PyObject *_wrap_FunctionAdaptor_as_value(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  FunctionAdaptor *arg1 = (FunctionAdaptor *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  llvm::Value *result = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:FunctionAdaptor_as_value",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_FunctionAdaptor, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "FunctionAdaptor_as_value" "', argument " "1"" of type '" "FunctionAdaptor const *""'"); 
+  }
+  arg1 = reinterpret_cast< FunctionAdaptor * >(argp1);
+  result = (llvm::Value *)((FunctionAdaptor const *)arg1)->as_value();
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_FunctionAdaptor_set_internal(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  FunctionAdaptor *arg1 = (FunctionAdaptor *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:FunctionAdaptor_set_internal",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_FunctionAdaptor, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "FunctionAdaptor_set_internal" "', argument " "1"" of type '" "FunctionAdaptor *""'"); 
+  }
+  arg1 = reinterpret_cast< FunctionAdaptor * >(argp1);
+  (arg1)->set_internal();
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_FunctionAdaptor_delete_body(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  FunctionAdaptor *arg1 = (FunctionAdaptor *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:FunctionAdaptor_delete_body",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_FunctionAdaptor, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "FunctionAdaptor_delete_body" "', argument " "1"" of type '" "FunctionAdaptor *""'"); 
+  }
+  arg1 = reinterpret_cast< FunctionAdaptor * >(argp1);
+  (arg1)->delete_body();
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
 SWIGINTERN PyObject *_wrap_delete_FunctionAdaptor(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   FunctionAdaptor *arg1 = (FunctionAdaptor *) 0 ;
@@ -16062,41 +16873,340 @@ fail:
 
 SWIGINTERN PyObject *FunctionAdaptor_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *obj;
-  if (!PyArg_ParseTuple(args,(char*)"O:swigregister", &obj)) return NULL;
+  if (!PyArg_ParseTuple(args,(char *)"O:swigregister", &obj)) return NULL;
   SWIG_TypeNewClientData(SWIGTYPE_p_FunctionAdaptor, SWIG_NewClientData(obj));
   return SWIG_Py_Void();
 }
 
-SWIGINTERN PyObject *_wrap_new_JITEngine__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_new_PassPipeline__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
-  std::string arg1 ;
-  int arg2 ;
-  bool arg3 ;
-  int val2 ;
-  int ecode2 = 0 ;
-  bool val3 ;
-  int ecode3 = 0 ;
+  int arg1 ;
+  int val1 ;
+  int ecode1 = 0 ;
   PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
-  PyObject * obj2 = 0 ;
-  JITEngine *result = 0 ;
+  PassPipeline *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:new_JITEngine",&obj0,&obj1,&obj2)) SWIG_fail;
-  {
-    std::string *ptr = (std::string *)0;
-    int res = SWIG_AsPtr_std_string(obj0, &ptr);
-    if (!SWIG_IsOK(res) || !ptr) {
-      SWIG_exception_fail(SWIG_ArgError((ptr ? res : SWIG_TypeError)), "in method '" "new_JITEngine" "', argument " "1"" of type '" "std::string""'"); 
-    }
-    arg1 = *ptr;
-    if (SWIG_IsNewObj(res)) delete ptr;
-  }
-  ecode2 = SWIG_AsVal_int(obj1, &val2);
-  if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "new_JITEngine" "', argument " "2"" of type '" "int""'");
+  if (!PyArg_ParseTuple(args,(char *)"O:new_PassPipeline",&obj0)) SWIG_fail;
+  ecode1 = SWIG_AsVal_int(obj0, &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "new_PassPipeline" "', argument " "1"" of type '" "int""'");
   } 
-  arg2 = static_cast< int >(val2);
-  ecode3 = SWIG_AsVal_bool(obj2, &val3);
+  arg1 = static_cast< int >(val1);
+  result = (PassPipeline *)new PassPipeline(arg1);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_PassPipeline, SWIG_POINTER_NEW |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_new_PassPipeline__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  PassPipeline *result = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)":new_PassPipeline")) SWIG_fail;
+  result = (PassPipeline *)new PassPipeline();
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_PassPipeline, SWIG_POINTER_NEW |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_new_PassPipeline(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[2] = {
+    0
+  };
+  Py_ssize_t ii;
+  
+  if (!PyTuple_Check(args)) SWIG_fail;
+  argc = args ? PyObject_Length(args) : 0;
+  for (ii = 0; (ii < 1) && (ii < argc); ii++) {
+    argv[ii] = PyTuple_GET_ITEM(args,ii);
+  }
+  if (argc == 0) {
+    return _wrap_new_PassPipeline__SWIG_1(self, args);
+  }
+  if (argc == 1) {
+    int _v;
+    {
+      int res = SWIG_AsVal_int(argv[0], NULL);
+      _v = SWIG_CheckState(res);
+    }
+    if (_v) {
+      return _wrap_new_PassPipeline__SWIG_0(self, args);
+    }
+  }
+  
+fail:
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'new_PassPipeline'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    PassPipeline::PassPipeline(int)\n"
+    "    PassPipeline::PassPipeline()\n");
+  return 0;
+}
+
+
+SWIGINTERN PyObject *_wrap_PassPipeline_set_vectorize(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  PassPipeline *arg1 = (PassPipeline *) 0 ;
+  bool arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  bool val2 ;
+  int ecode2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OO:PassPipeline_set_vectorize",&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_PassPipeline, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PassPipeline_set_vectorize" "', argument " "1"" of type '" "PassPipeline *""'"); 
+  }
+  arg1 = reinterpret_cast< PassPipeline * >(argp1);
+  ecode2 = SWIG_AsVal_bool(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "PassPipeline_set_vectorize" "', argument " "2"" of type '" "bool""'");
+  } 
+  arg2 = static_cast< bool >(val2);
+  (arg1)->set_vectorize(arg2);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_PassPipeline_set_unroll_threshold(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  PassPipeline *arg1 = (PassPipeline *) 0 ;
+  int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OO:PassPipeline_set_unroll_threshold",&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_PassPipeline, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PassPipeline_set_unroll_threshold" "', argument " "1"" of type '" "PassPipeline *""'"); 
+  }
+  arg1 = reinterpret_cast< PassPipeline * >(argp1);
+  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "PassPipeline_set_unroll_threshold" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = static_cast< int >(val2);
+  (arg1)->set_unroll_threshold(arg2);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_PassPipeline_set_inline_threshold(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  PassPipeline *arg1 = (PassPipeline *) 0 ;
+  int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OO:PassPipeline_set_inline_threshold",&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_PassPipeline, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PassPipeline_set_inline_threshold" "', argument " "1"" of type '" "PassPipeline *""'"); 
+  }
+  arg1 = reinterpret_cast< PassPipeline * >(argp1);
+  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "PassPipeline_set_inline_threshold" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = static_cast< int >(val2);
+  (arg1)->set_inline_threshold(arg2);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_PassPipeline_inline_threshold(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  PassPipeline *arg1 = (PassPipeline *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  int result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:PassPipeline_inline_threshold",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_PassPipeline, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PassPipeline_inline_threshold" "', argument " "1"" of type '" "PassPipeline const *""'"); 
+  }
+  arg1 = reinterpret_cast< PassPipeline * >(argp1);
+  result = (int)((PassPipeline const *)arg1)->inline_threshold();
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_PassPipeline_add_pass(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  PassPipeline *arg1 = (PassPipeline *) 0 ;
+  char *arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int res2 ;
+  char *buf2 = 0 ;
+  int alloc2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  bool result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OO:PassPipeline_add_pass",&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_PassPipeline, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PassPipeline_add_pass" "', argument " "1"" of type '" "PassPipeline *""'"); 
+  }
+  arg1 = reinterpret_cast< PassPipeline * >(argp1);
+  res2 = SWIG_AsCharPtrAndSize(obj1, &buf2, NULL, &alloc2);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "PassPipeline_add_pass" "', argument " "2"" of type '" "char const []""'");
+  }
+  arg2 = reinterpret_cast< char * >(buf2);
+  result = (bool)(arg1)->add_pass((char const (*))arg2);
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  if (alloc2 == SWIG_NEWOBJ) delete[] buf2;
+  return resultobj;
+fail:
+  if (alloc2 == SWIG_NEWOBJ) delete[] buf2;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_PassPipeline_last_error(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  PassPipeline *arg1 = (PassPipeline *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  char *result = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:PassPipeline_last_error",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_PassPipeline, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PassPipeline_last_error" "', argument " "1"" of type '" "PassPipeline const *""'"); 
+  }
+  arg1 = reinterpret_cast< PassPipeline * >(argp1);
+  result = (char *)((PassPipeline const *)arg1)->last_error();
+  resultobj = SWIG_FromCharPtr((const char *)result);
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_PassPipeline_populate(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  PassPipeline *arg1 = (PassPipeline *) 0 ;
+  llvm::FunctionPassManager *arg2 = 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OO:PassPipeline_populate",&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_PassPipeline, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "PassPipeline_populate" "', argument " "1"" of type '" "PassPipeline const *""'"); 
+  }
+  arg1 = reinterpret_cast< PassPipeline * >(argp1);
+  res2 = SWIG_ConvertPtr(obj1, &argp2, SWIGTYPE_p_llvm__FunctionPassManager,  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "PassPipeline_populate" "', argument " "2"" of type '" "llvm::FunctionPassManager &""'"); 
+  }
+  if (!argp2) {
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "PassPipeline_populate" "', argument " "2"" of type '" "llvm::FunctionPassManager &""'"); 
+  }
+  arg2 = reinterpret_cast< llvm::FunctionPassManager * >(argp2);
+  ((PassPipeline const *)arg1)->populate(*arg2);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_delete_PassPipeline(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  PassPipeline *arg1 = (PassPipeline *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:delete_PassPipeline",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_PassPipeline, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_PassPipeline" "', argument " "1"" of type '" "PassPipeline *""'"); 
+  }
+  arg1 = reinterpret_cast< PassPipeline * >(argp1);
+  delete arg1;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *PassPipeline_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *obj;
+  if (!PyArg_ParseTuple(args,(char *)"O:swigregister", &obj)) return NULL;
+  SWIG_TypeNewClientData(SWIGTYPE_p_PassPipeline, SWIG_NewClientData(obj));
+  return SWIG_Py_Void();
+}
+
+SWIGINTERN PyObject *_wrap_new_JITEngine__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  std::string arg1 ;
+  int arg2 ;
+  bool arg3 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  bool val3 ;
+  int ecode3 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  JITEngine *result = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OOO:new_JITEngine",&obj0,&obj1,&obj2)) SWIG_fail;
+  {
+    std::string *ptr = (std::string *)0;
+    int res = SWIG_AsPtr_std_string(obj0, &ptr);
+    if (!SWIG_IsOK(res) || !ptr) {
+      SWIG_exception_fail(SWIG_ArgError((ptr ? res : SWIG_TypeError)), "in method '" "new_JITEngine" "', argument " "1"" of type '" "std::string""'"); 
+    }
+    arg1 = *ptr;
+    if (SWIG_IsNewObj(res)) delete ptr;
+  }
+  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "new_JITEngine" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = static_cast< int >(val2);
+  ecode3 = SWIG_AsVal_bool(obj2, &val3);
   if (!SWIG_IsOK(ecode3)) {
     SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "new_JITEngine" "', argument " "3"" of type '" "bool""'");
   } 
@@ -16167,12 +17277,14 @@ fail:
 
 
 SWIGINTERN PyObject *_wrap_new_JITEngine(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[4];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[4] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 3) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
@@ -16308,7 +17420,7 @@ SWIGINTERN PyObject *_wrap_JITEngine_make_function(PyObject *SWIGUNUSEDPARM(self
   }
   arg3 = reinterpret_cast< llvm::Type * >(argp3);
   {
-    std::vector<llvm::Type*,std::allocator< llvm::Type * > > *ptr = (std::vector<llvm::Type*,std::allocator< llvm::Type * > > *)0;
+    std::vector< llvm::Type*,std::allocator< llvm::Type * > > *ptr = (std::vector< llvm::Type*,std::allocator< llvm::Type * > > *)0;
     int res = swig::asptr(obj3, &ptr);
     if (!SWIG_IsOK(res) || !ptr) {
       SWIG_exception_fail(SWIG_ArgError((ptr ? res : SWIG_TypeError)), "in method '" "JITEngine_make_function" "', argument " "4"" of type '" "std::vector< llvm::Type *,std::allocator< llvm::Type * > >""'"); 
@@ -16348,50 +17460,84 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_JITEngine_verify(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_JITEngine_delete_function(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   JITEngine *arg1 = (JITEngine *) 0 ;
+  SwigValueWrapper< FunctionAdaptor > arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
+  void *argp2 ;
+  int res2 = 0 ;
   PyObject * obj0 = 0 ;
-  bool result;
+  PyObject * obj1 = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:JITEngine_verify",&obj0)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OO:JITEngine_delete_function",&obj0,&obj1)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_JITEngine, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "JITEngine_verify" "', argument " "1"" of type '" "JITEngine const *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "JITEngine_delete_function" "', argument " "1"" of type '" "JITEngine *""'"); 
   }
   arg1 = reinterpret_cast< JITEngine * >(argp1);
-  result = (bool)((JITEngine const *)arg1)->verify();
-  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  {
+    res2 = SWIG_ConvertPtr(obj1, &argp2, SWIGTYPE_p_FunctionAdaptor,  0  | 0);
+    if (!SWIG_IsOK(res2)) {
+      SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "JITEngine_delete_function" "', argument " "2"" of type '" "FunctionAdaptor""'"); 
+    }  
+    if (!argp2) {
+      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "JITEngine_delete_function" "', argument " "2"" of type '" "FunctionAdaptor""'");
+    } else {
+      FunctionAdaptor * temp = reinterpret_cast< FunctionAdaptor * >(argp2);
+      arg2 = *temp;
+      if (SWIG_IsNewObj(res2)) delete temp;
+    }
+  }
+  (arg1)->delete_function(arg2);
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_JITEngine_optimize(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_JITEngine_free_function(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   JITEngine *arg1 = (JITEngine *) 0 ;
+  SwigValueWrapper< FunctionAdaptor > arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
+  void *argp2 ;
+  int res2 = 0 ;
   PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  bool result;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:JITEngine_optimize",&obj0)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OO:JITEngine_free_function",&obj0,&obj1)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_JITEngine, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "JITEngine_optimize" "', argument " "1"" of type '" "JITEngine *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "JITEngine_free_function" "', argument " "1"" of type '" "JITEngine *""'"); 
   }
   arg1 = reinterpret_cast< JITEngine * >(argp1);
-  (arg1)->optimize();
-  resultobj = SWIG_Py_Void();
+  {
+    res2 = SWIG_ConvertPtr(obj1, &argp2, SWIGTYPE_p_FunctionAdaptor,  0  | 0);
+    if (!SWIG_IsOK(res2)) {
+      SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "JITEngine_free_function" "', argument " "2"" of type '" "FunctionAdaptor""'"); 
+    }  
+    if (!argp2) {
+      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "JITEngine_free_function" "', argument " "2"" of type '" "FunctionAdaptor""'");
+    } else {
+      FunctionAdaptor * temp = reinterpret_cast< FunctionAdaptor * >(argp2);
+      arg2 = *temp;
+      if (SWIG_IsNewObj(res2)) delete temp;
+    }
+  }
+  result = (bool)(arg1)->free_function(arg2);
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_JITEngine_optimize_function(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_JITEngine_count_uses(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   JITEngine *arg1 = (JITEngine *) 0 ;
   SwigValueWrapper< FunctionAdaptor > arg2 ;
@@ -16401,27 +17547,114 @@ SWIGINTERN PyObject *_wrap_JITEngine_optimize_function(PyObject *SWIGUNUSEDPARM(
   int res2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
+  unsigned int result;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:JITEngine_optimize_function",&obj0,&obj1)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OO:JITEngine_count_uses",&obj0,&obj1)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_JITEngine, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "JITEngine_optimize_function" "', argument " "1"" of type '" "JITEngine const *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "JITEngine_count_uses" "', argument " "1"" of type '" "JITEngine const *""'"); 
   }
   arg1 = reinterpret_cast< JITEngine * >(argp1);
   {
     res2 = SWIG_ConvertPtr(obj1, &argp2, SWIGTYPE_p_FunctionAdaptor,  0  | 0);
     if (!SWIG_IsOK(res2)) {
-      SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "JITEngine_optimize_function" "', argument " "2"" of type '" "FunctionAdaptor""'"); 
+      SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "JITEngine_count_uses" "', argument " "2"" of type '" "FunctionAdaptor""'"); 
     }  
     if (!argp2) {
-      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "JITEngine_optimize_function" "', argument " "2"" of type '" "FunctionAdaptor""'");
+      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "JITEngine_count_uses" "', argument " "2"" of type '" "FunctionAdaptor""'");
     } else {
       FunctionAdaptor * temp = reinterpret_cast< FunctionAdaptor * >(argp2);
       arg2 = *temp;
       if (SWIG_IsNewObj(res2)) delete temp;
     }
   }
-  ((JITEngine const *)arg1)->optimize_function(arg2);
+  result = (unsigned int)((JITEngine const *)arg1)->count_uses(arg2);
+  resultobj = SWIG_From_unsigned_SS_int(static_cast< unsigned int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_JITEngine_declare_global(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  JITEngine *arg1 = (JITEngine *) 0 ;
+  char *arg2 ;
+  llvm::Type *arg3 = (llvm::Type *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int res2 ;
+  char *buf2 = 0 ;
+  int alloc2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  llvm::Value *result = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OOO:JITEngine_declare_global",&obj0,&obj1,&obj2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_JITEngine, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "JITEngine_declare_global" "', argument " "1"" of type '" "JITEngine *""'"); 
+  }
+  arg1 = reinterpret_cast< JITEngine * >(argp1);
+  res2 = SWIG_AsCharPtrAndSize(obj1, &buf2, NULL, &alloc2);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "JITEngine_declare_global" "', argument " "2"" of type '" "char const []""'");
+  }
+  arg2 = reinterpret_cast< char * >(buf2);
+  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Type, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "JITEngine_declare_global" "', argument " "3"" of type '" "llvm::Type *""'"); 
+  }
+  arg3 = reinterpret_cast< llvm::Type * >(argp3);
+  result = (llvm::Value *)(arg1)->declare_global((char const (*))arg2,arg3);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
+  if (alloc2 == SWIG_NEWOBJ) delete[] buf2;
+  return resultobj;
+fail:
+  if (alloc2 == SWIG_NEWOBJ) delete[] buf2;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_JITEngine_verify(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  JITEngine *arg1 = (JITEngine *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  bool result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:JITEngine_verify",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_JITEngine, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "JITEngine_verify" "', argument " "1"" of type '" "JITEngine const *""'"); 
+  }
+  arg1 = reinterpret_cast< JITEngine * >(argp1);
+  result = (bool)((JITEngine const *)arg1)->verify();
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_JITEngine_optimize(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  JITEngine *arg1 = (JITEngine *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:JITEngine_optimize",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_JITEngine, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "JITEngine_optimize" "', argument " "1"" of type '" "JITEngine *""'"); 
+  }
+  arg1 = reinterpret_cast< JITEngine * >(argp1);
+  (arg1)->optimize();
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -16429,7 +17662,7 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_JITEngine_get_pointer_to_function(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_JITEngine_optimize_function(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   JITEngine *arg1 = (JITEngine *) 0 ;
   SwigValueWrapper< FunctionAdaptor > arg2 ;
@@ -16439,109 +17672,218 @@ SWIGINTERN PyObject *_wrap_JITEngine_get_pointer_to_function(PyObject *SWIGUNUSE
   int res2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
-  void *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:JITEngine_get_pointer_to_function",&obj0,&obj1)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OO:JITEngine_optimize_function",&obj0,&obj1)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_JITEngine, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "JITEngine_get_pointer_to_function" "', argument " "1"" of type '" "JITEngine *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "JITEngine_optimize_function" "', argument " "1"" of type '" "JITEngine const *""'"); 
   }
   arg1 = reinterpret_cast< JITEngine * >(argp1);
   {
     res2 = SWIG_ConvertPtr(obj1, &argp2, SWIGTYPE_p_FunctionAdaptor,  0  | 0);
     if (!SWIG_IsOK(res2)) {
-      SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "JITEngine_get_pointer_to_function" "', argument " "2"" of type '" "FunctionAdaptor""'"); 
+      SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "JITEngine_optimize_function" "', argument " "2"" of type '" "FunctionAdaptor""'"); 
     }  
     if (!argp2) {
-      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "JITEngine_get_pointer_to_function" "', argument " "2"" of type '" "FunctionAdaptor""'");
+      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "JITEngine_optimize_function" "', argument " "2"" of type '" "FunctionAdaptor""'");
     } else {
       FunctionAdaptor * temp = reinterpret_cast< FunctionAdaptor * >(argp2);
       arg2 = *temp;
       if (SWIG_IsNewObj(res2)) delete temp;
     }
   }
-  result = (void *)(arg1)->get_pointer_to_function(arg2);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_void, 0 |  0 );
+  ((JITEngine const *)arg1)->optimize_function(arg2);
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_JITEngine_dump_asm(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_JITEngine_inline_calls__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   JITEngine *arg1 = (JITEngine *) 0 ;
   SwigValueWrapper< FunctionAdaptor > arg2 ;
+  int arg3 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   void *argp2 ;
   int res2 = 0 ;
+  int val3 ;
+  int ecode3 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
-  std::string result;
+  PyObject * obj2 = 0 ;
+  unsigned int result;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:JITEngine_dump_asm",&obj0,&obj1)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOO:JITEngine_inline_calls",&obj0,&obj1,&obj2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_JITEngine, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "JITEngine_dump_asm" "', argument " "1"" of type '" "JITEngine *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "JITEngine_inline_calls" "', argument " "1"" of type '" "JITEngine *""'"); 
   }
   arg1 = reinterpret_cast< JITEngine * >(argp1);
   {
     res2 = SWIG_ConvertPtr(obj1, &argp2, SWIGTYPE_p_FunctionAdaptor,  0  | 0);
     if (!SWIG_IsOK(res2)) {
-      SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "JITEngine_dump_asm" "', argument " "2"" of type '" "FunctionAdaptor""'"); 
+      SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "JITEngine_inline_calls" "', argument " "2"" of type '" "FunctionAdaptor""'"); 
     }  
     if (!argp2) {
-      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "JITEngine_dump_asm" "', argument " "2"" of type '" "FunctionAdaptor""'");
+      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "JITEngine_inline_calls" "', argument " "2"" of type '" "FunctionAdaptor""'");
     } else {
       FunctionAdaptor * temp = reinterpret_cast< FunctionAdaptor * >(argp2);
       arg2 = *temp;
       if (SWIG_IsNewObj(res2)) delete temp;
     }
   }
-  result = (arg1)->dump_asm(arg2);
-  resultobj = SWIG_From_std_string(static_cast< std::string >(result));
+  ecode3 = SWIG_AsVal_int(obj2, &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "JITEngine_inline_calls" "', argument " "3"" of type '" "int""'");
+  } 
+  arg3 = static_cast< int >(val3);
+  result = (unsigned int)(arg1)->inline_calls(arg2,arg3);
+  resultobj = SWIG_From_unsigned_SS_int(static_cast< unsigned int >(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_JITEngine_start_multithreaded(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_JITEngine_inline_calls__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   JITEngine *arg1 = (JITEngine *) 0 ;
+  SwigValueWrapper< FunctionAdaptor > arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
+  void *argp2 ;
+  int res2 = 0 ;
   PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  unsigned int result;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:JITEngine_start_multithreaded",&obj0)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OO:JITEngine_inline_calls",&obj0,&obj1)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_JITEngine, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "JITEngine_start_multithreaded" "', argument " "1"" of type '" "JITEngine *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "JITEngine_inline_calls" "', argument " "1"" of type '" "JITEngine *""'"); 
   }
   arg1 = reinterpret_cast< JITEngine * >(argp1);
-  (arg1)->start_multithreaded();
-  resultobj = SWIG_Py_Void();
+  {
+    res2 = SWIG_ConvertPtr(obj1, &argp2, SWIGTYPE_p_FunctionAdaptor,  0  | 0);
+    if (!SWIG_IsOK(res2)) {
+      SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "JITEngine_inline_calls" "', argument " "2"" of type '" "FunctionAdaptor""'"); 
+    }  
+    if (!argp2) {
+      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "JITEngine_inline_calls" "', argument " "2"" of type '" "FunctionAdaptor""'");
+    } else {
+      FunctionAdaptor * temp = reinterpret_cast< FunctionAdaptor * >(argp2);
+      arg2 = *temp;
+      if (SWIG_IsNewObj(res2)) delete temp;
+    }
+  }
+  result = (unsigned int)(arg1)->inline_calls(arg2);
+  resultobj = SWIG_From_unsigned_SS_int(static_cast< unsigned int >(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_JITEngine_stop_multithreaded(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_JITEngine_inline_calls(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[4] = {
+    0
+  };
+  Py_ssize_t ii;
+  
+  if (!PyTuple_Check(args)) SWIG_fail;
+  argc = args ? PyObject_Length(args) : 0;
+  for (ii = 0; (ii < 3) && (ii < argc); ii++) {
+    argv[ii] = PyTuple_GET_ITEM(args,ii);
+  }
+  if (argc == 2) {
+    int _v;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_JITEngine, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      int res = SWIG_ConvertPtr(argv[1], 0, SWIGTYPE_p_FunctionAdaptor, 0);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        return _wrap_JITEngine_inline_calls__SWIG_1(self, args);
+      }
+    }
+  }
+  if (argc == 3) {
+    int _v;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_JITEngine, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      int res = SWIG_ConvertPtr(argv[1], 0, SWIGTYPE_p_FunctionAdaptor, 0);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        {
+          int res = SWIG_AsVal_int(argv[2], NULL);
+          _v = SWIG_CheckState(res);
+        }
+        if (_v) {
+          return _wrap_JITEngine_inline_calls__SWIG_0(self, args);
+        }
+      }
+    }
+  }
+  
+fail:
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'JITEngine_inline_calls'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    JITEngine::inline_calls(FunctionAdaptor,int)\n"
+    "    JITEngine::inline_calls(FunctionAdaptor)\n");
+  return 0;
+}
+
+
+SWIGINTERN PyObject *_wrap_JITEngine_run_pipeline(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   JITEngine *arg1 = (JITEngine *) 0 ;
+  SwigValueWrapper< FunctionAdaptor > arg2 ;
+  PassPipeline *arg3 = 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
+  void *argp2 ;
+  int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
   PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:JITEngine_stop_multithreaded",&obj0)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOO:JITEngine_run_pipeline",&obj0,&obj1,&obj2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_JITEngine, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "JITEngine_stop_multithreaded" "', argument " "1"" of type '" "JITEngine *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "JITEngine_run_pipeline" "', argument " "1"" of type '" "JITEngine *""'"); 
   }
   arg1 = reinterpret_cast< JITEngine * >(argp1);
-  (arg1)->stop_multithreaded();
+  {
+    res2 = SWIG_ConvertPtr(obj1, &argp2, SWIGTYPE_p_FunctionAdaptor,  0  | 0);
+    if (!SWIG_IsOK(res2)) {
+      SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "JITEngine_run_pipeline" "', argument " "2"" of type '" "FunctionAdaptor""'"); 
+    }  
+    if (!argp2) {
+      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "JITEngine_run_pipeline" "', argument " "2"" of type '" "FunctionAdaptor""'");
+    } else {
+      FunctionAdaptor * temp = reinterpret_cast< FunctionAdaptor * >(argp2);
+      arg2 = *temp;
+      if (SWIG_IsNewObj(res2)) delete temp;
+    }
+  }
+  res3 = SWIG_ConvertPtr(obj2, &argp3, SWIGTYPE_p_PassPipeline,  0  | 0);
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "JITEngine_run_pipeline" "', argument " "3"" of type '" "PassPipeline const &""'"); 
+  }
+  if (!argp3) {
+    SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "JITEngine_run_pipeline" "', argument " "3"" of type '" "PassPipeline const &""'"); 
+  }
+  arg3 = reinterpret_cast< PassPipeline * >(argp3);
+  (arg1)->run_pipeline(arg2,(PassPipeline const &)*arg3);
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -16549,233 +17891,1488 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_JITEngine_is_multithreaded(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_JITEngine_optimize_interprocedural(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   JITEngine *arg1 = (JITEngine *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject * obj0 = 0 ;
-  bool result;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:JITEngine_is_multithreaded",&obj0)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"O:JITEngine_optimize_interprocedural",&obj0)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_JITEngine, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "JITEngine_is_multithreaded" "', argument " "1"" of type '" "JITEngine *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "JITEngine_optimize_interprocedural" "', argument " "1"" of type '" "JITEngine *""'"); 
   }
   arg1 = reinterpret_cast< JITEngine * >(argp1);
-  result = (bool)(arg1)->is_multithreaded();
-  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  (arg1)->optimize_interprocedural();
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_JITEngine_dump_passes(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_JITEngine_get_pointer_to_function(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   JITEngine *arg1 = (JITEngine *) 0 ;
+  SwigValueWrapper< FunctionAdaptor > arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
+  void *argp2 ;
+  int res2 = 0 ;
   PyObject * obj0 = 0 ;
-  std::string result;
+  PyObject * obj1 = 0 ;
+  void *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:JITEngine_dump_passes",&obj0)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OO:JITEngine_get_pointer_to_function",&obj0,&obj1)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_JITEngine, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "JITEngine_dump_passes" "', argument " "1"" of type '" "JITEngine *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "JITEngine_get_pointer_to_function" "', argument " "1"" of type '" "JITEngine *""'"); 
   }
   arg1 = reinterpret_cast< JITEngine * >(argp1);
-  result = (arg1)->dump_passes();
-  resultobj = SWIG_From_std_string(static_cast< std::string >(result));
+  {
+    res2 = SWIG_ConvertPtr(obj1, &argp2, SWIGTYPE_p_FunctionAdaptor,  0  | 0);
+    if (!SWIG_IsOK(res2)) {
+      SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "JITEngine_get_pointer_to_function" "', argument " "2"" of type '" "FunctionAdaptor""'"); 
+    }  
+    if (!argp2) {
+      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "JITEngine_get_pointer_to_function" "', argument " "2"" of type '" "FunctionAdaptor""'");
+    } else {
+      FunctionAdaptor * temp = reinterpret_cast< FunctionAdaptor * >(argp2);
+      arg2 = *temp;
+      if (SWIG_IsNewObj(res2)) delete temp;
+    }
+  }
+  result = (void *)(arg1)->get_pointer_to_function(arg2);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_void, 0 |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *JITEngine_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_JITEngine_recompile_function(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  JITEngine *arg1 = (JITEngine *) 0 ;
+  SwigValueWrapper< FunctionAdaptor > arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 ;
+  int res2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  void *result = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OO:JITEngine_recompile_function",&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_JITEngine, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "JITEngine_recompile_function" "', argument " "1"" of type '" "JITEngine *""'"); 
+  }
+  arg1 = reinterpret_cast< JITEngine * >(argp1);
+  {
+    res2 = SWIG_ConvertPtr(obj1, &argp2, SWIGTYPE_p_FunctionAdaptor,  0  | 0);
+    if (!SWIG_IsOK(res2)) {
+      SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "JITEngine_recompile_function" "', argument " "2"" of type '" "FunctionAdaptor""'"); 
+    }  
+    if (!argp2) {
+      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "JITEngine_recompile_function" "', argument " "2"" of type '" "FunctionAdaptor""'");
+    } else {
+      FunctionAdaptor * temp = reinterpret_cast< FunctionAdaptor * >(argp2);
+      arg2 = *temp;
+      if (SWIG_IsNewObj(res2)) delete temp;
+    }
+  }
+  result = (void *)(arg1)->recompile_function(arg2);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_void, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_JITEngine_dump_asm(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  JITEngine *arg1 = (JITEngine *) 0 ;
+  SwigValueWrapper< FunctionAdaptor > arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 ;
+  int res2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  std::string result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OO:JITEngine_dump_asm",&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_JITEngine, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "JITEngine_dump_asm" "', argument " "1"" of type '" "JITEngine *""'"); 
+  }
+  arg1 = reinterpret_cast< JITEngine * >(argp1);
+  {
+    res2 = SWIG_ConvertPtr(obj1, &argp2, SWIGTYPE_p_FunctionAdaptor,  0  | 0);
+    if (!SWIG_IsOK(res2)) {
+      SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "JITEngine_dump_asm" "', argument " "2"" of type '" "FunctionAdaptor""'"); 
+    }  
+    if (!argp2) {
+      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "JITEngine_dump_asm" "', argument " "2"" of type '" "FunctionAdaptor""'");
+    } else {
+      FunctionAdaptor * temp = reinterpret_cast< FunctionAdaptor * >(argp2);
+      arg2 = *temp;
+      if (SWIG_IsNewObj(res2)) delete temp;
+    }
+  }
+  result = (arg1)->dump_asm(arg2);
+  resultobj = SWIG_From_std_string(static_cast< std::string >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_JITEngine_dump_bitcode(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  JITEngine *arg1 = (JITEngine *) 0 ;
+  SwigValueWrapper< FunctionAdaptor > arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 ;
+  int res2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  std::string result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OO:JITEngine_dump_bitcode",&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_JITEngine, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "JITEngine_dump_bitcode" "', argument " "1"" of type '" "JITEngine *""'"); 
+  }
+  arg1 = reinterpret_cast< JITEngine * >(argp1);
+  {
+    res2 = SWIG_ConvertPtr(obj1, &argp2, SWIGTYPE_p_FunctionAdaptor,  0  | 0);
+    if (!SWIG_IsOK(res2)) {
+      SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "JITEngine_dump_bitcode" "', argument " "2"" of type '" "FunctionAdaptor""'"); 
+    }  
+    if (!argp2) {
+      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "JITEngine_dump_bitcode" "', argument " "2"" of type '" "FunctionAdaptor""'");
+    } else {
+      FunctionAdaptor * temp = reinterpret_cast< FunctionAdaptor * >(argp2);
+      arg2 = *temp;
+      if (SWIG_IsNewObj(res2)) delete temp;
+    }
+  }
+  result = (arg1)->dump_bitcode(arg2);
+  resultobj = SWIG_From_std_string(static_cast< std::string >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_JITEngine_load_bitcode(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  JITEngine *arg1 = (JITEngine *) 0 ;
+  SwigValueWrapper< FunctionAdaptor > arg2 ;
+  std::string arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 ;
+  int res2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  bool result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OOO:JITEngine_load_bitcode",&obj0,&obj1,&obj2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_JITEngine, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "JITEngine_load_bitcode" "', argument " "1"" of type '" "JITEngine *""'"); 
+  }
+  arg1 = reinterpret_cast< JITEngine * >(argp1);
+  {
+    res2 = SWIG_ConvertPtr(obj1, &argp2, SWIGTYPE_p_FunctionAdaptor,  0  | 0);
+    if (!SWIG_IsOK(res2)) {
+      SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "JITEngine_load_bitcode" "', argument " "2"" of type '" "FunctionAdaptor""'"); 
+    }  
+    if (!argp2) {
+      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "JITEngine_load_bitcode" "', argument " "2"" of type '" "FunctionAdaptor""'");
+    } else {
+      FunctionAdaptor * temp = reinterpret_cast< FunctionAdaptor * >(argp2);
+      arg2 = *temp;
+      if (SWIG_IsNewObj(res2)) delete temp;
+    }
+  }
+  {
+    std::string *ptr = (std::string *)0;
+    int res = SWIG_AsPtr_std_string(obj2, &ptr);
+    if (!SWIG_IsOK(res) || !ptr) {
+      SWIG_exception_fail(SWIG_ArgError((ptr ? res : SWIG_TypeError)), "in method '" "JITEngine_load_bitcode" "', argument " "3"" of type '" "std::string""'"); 
+    }
+    arg3 = *ptr;
+    if (SWIG_IsNewObj(res)) delete ptr;
+  }
+  result = (bool)(arg1)->load_bitcode(arg2,arg3);
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_JITEngine_loaded_helper_count(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  JITEngine *arg1 = (JITEngine *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  unsigned int result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:JITEngine_loaded_helper_count",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_JITEngine, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "JITEngine_loaded_helper_count" "', argument " "1"" of type '" "JITEngine const *""'"); 
+  }
+  arg1 = reinterpret_cast< JITEngine * >(argp1);
+  result = (unsigned int)((JITEngine const *)arg1)->loaded_helper_count();
+  resultobj = SWIG_From_unsigned_SS_int(static_cast< unsigned int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_JITEngine_loaded_helper(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  JITEngine *arg1 = (JITEngine *) 0 ;
+  unsigned int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  unsigned int val2 ;
+  int ecode2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  SwigValueWrapper< FunctionAdaptor > result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OO:JITEngine_loaded_helper",&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_JITEngine, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "JITEngine_loaded_helper" "', argument " "1"" of type '" "JITEngine const *""'"); 
+  }
+  arg1 = reinterpret_cast< JITEngine * >(argp1);
+  ecode2 = SWIG_AsVal_unsigned_SS_int(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "JITEngine_loaded_helper" "', argument " "2"" of type '" "unsigned int""'");
+  } 
+  arg2 = static_cast< unsigned int >(val2);
+  result = ((JITEngine const *)arg1)->loaded_helper(arg2);
+  resultobj = SWIG_NewPointerObj((new FunctionAdaptor(static_cast< const FunctionAdaptor& >(result))), SWIGTYPE_p_FunctionAdaptor, SWIG_POINTER_OWN |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_JITEngine_emit_object__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  JITEngine *arg1 = (JITEngine *) 0 ;
+  std::string arg2 ;
+  std::string arg3 ;
+  std::string arg4 ;
+  std::string arg5 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  PyObject * obj3 = 0 ;
+  PyObject * obj4 = 0 ;
+  bool result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OOOOO:JITEngine_emit_object",&obj0,&obj1,&obj2,&obj3,&obj4)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_JITEngine, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "JITEngine_emit_object" "', argument " "1"" of type '" "JITEngine *""'"); 
+  }
+  arg1 = reinterpret_cast< JITEngine * >(argp1);
+  {
+    std::string *ptr = (std::string *)0;
+    int res = SWIG_AsPtr_std_string(obj1, &ptr);
+    if (!SWIG_IsOK(res) || !ptr) {
+      SWIG_exception_fail(SWIG_ArgError((ptr ? res : SWIG_TypeError)), "in method '" "JITEngine_emit_object" "', argument " "2"" of type '" "std::string""'"); 
+    }
+    arg2 = *ptr;
+    if (SWIG_IsNewObj(res)) delete ptr;
+  }
+  {
+    std::string *ptr = (std::string *)0;
+    int res = SWIG_AsPtr_std_string(obj2, &ptr);
+    if (!SWIG_IsOK(res) || !ptr) {
+      SWIG_exception_fail(SWIG_ArgError((ptr ? res : SWIG_TypeError)), "in method '" "JITEngine_emit_object" "', argument " "3"" of type '" "std::string""'"); 
+    }
+    arg3 = *ptr;
+    if (SWIG_IsNewObj(res)) delete ptr;
+  }
+  {
+    std::string *ptr = (std::string *)0;
+    int res = SWIG_AsPtr_std_string(obj3, &ptr);
+    if (!SWIG_IsOK(res) || !ptr) {
+      SWIG_exception_fail(SWIG_ArgError((ptr ? res : SWIG_TypeError)), "in method '" "JITEngine_emit_object" "', argument " "4"" of type '" "std::string""'"); 
+    }
+    arg4 = *ptr;
+    if (SWIG_IsNewObj(res)) delete ptr;
+  }
+  {
+    std::string *ptr = (std::string *)0;
+    int res = SWIG_AsPtr_std_string(obj4, &ptr);
+    if (!SWIG_IsOK(res) || !ptr) {
+      SWIG_exception_fail(SWIG_ArgError((ptr ? res : SWIG_TypeError)), "in method '" "JITEngine_emit_object" "', argument " "5"" of type '" "std::string""'"); 
+    }
+    arg5 = *ptr;
+    if (SWIG_IsNewObj(res)) delete ptr;
+  }
+  result = (bool)(arg1)->emit_object(arg2,arg3,arg4,arg5);
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_JITEngine_emit_object__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  JITEngine *arg1 = (JITEngine *) 0 ;
+  std::string arg2 ;
+  std::string arg3 ;
+  std::string arg4 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  PyObject * obj3 = 0 ;
+  bool result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:JITEngine_emit_object",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_JITEngine, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "JITEngine_emit_object" "', argument " "1"" of type '" "JITEngine *""'"); 
+  }
+  arg1 = reinterpret_cast< JITEngine * >(argp1);
+  {
+    std::string *ptr = (std::string *)0;
+    int res = SWIG_AsPtr_std_string(obj1, &ptr);
+    if (!SWIG_IsOK(res) || !ptr) {
+      SWIG_exception_fail(SWIG_ArgError((ptr ? res : SWIG_TypeError)), "in method '" "JITEngine_emit_object" "', argument " "2"" of type '" "std::string""'"); 
+    }
+    arg2 = *ptr;
+    if (SWIG_IsNewObj(res)) delete ptr;
+  }
+  {
+    std::string *ptr = (std::string *)0;
+    int res = SWIG_AsPtr_std_string(obj2, &ptr);
+    if (!SWIG_IsOK(res) || !ptr) {
+      SWIG_exception_fail(SWIG_ArgError((ptr ? res : SWIG_TypeError)), "in method '" "JITEngine_emit_object" "', argument " "3"" of type '" "std::string""'"); 
+    }
+    arg3 = *ptr;
+    if (SWIG_IsNewObj(res)) delete ptr;
+  }
+  {
+    std::string *ptr = (std::string *)0;
+    int res = SWIG_AsPtr_std_string(obj3, &ptr);
+    if (!SWIG_IsOK(res) || !ptr) {
+      SWIG_exception_fail(SWIG_ArgError((ptr ? res : SWIG_TypeError)), "in method '" "JITEngine_emit_object" "', argument " "4"" of type '" "std::string""'"); 
+    }
+    arg4 = *ptr;
+    if (SWIG_IsNewObj(res)) delete ptr;
+  }
+  result = (bool)(arg1)->emit_object(arg2,arg3,arg4);
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_JITEngine_emit_object__SWIG_2(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  JITEngine *arg1 = (JITEngine *) 0 ;
+  std::string arg2 ;
+  std::string arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  bool result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OOO:JITEngine_emit_object",&obj0,&obj1,&obj2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_JITEngine, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "JITEngine_emit_object" "', argument " "1"" of type '" "JITEngine *""'"); 
+  }
+  arg1 = reinterpret_cast< JITEngine * >(argp1);
+  {
+    std::string *ptr = (std::string *)0;
+    int res = SWIG_AsPtr_std_string(obj1, &ptr);
+    if (!SWIG_IsOK(res) || !ptr) {
+      SWIG_exception_fail(SWIG_ArgError((ptr ? res : SWIG_TypeError)), "in method '" "JITEngine_emit_object" "', argument " "2"" of type '" "std::string""'"); 
+    }
+    arg2 = *ptr;
+    if (SWIG_IsNewObj(res)) delete ptr;
+  }
+  {
+    std::string *ptr = (std::string *)0;
+    int res = SWIG_AsPtr_std_string(obj2, &ptr);
+    if (!SWIG_IsOK(res) || !ptr) {
+      SWIG_exception_fail(SWIG_ArgError((ptr ? res : SWIG_TypeError)), "in method '" "JITEngine_emit_object" "', argument " "3"" of type '" "std::string""'"); 
+    }
+    arg3 = *ptr;
+    if (SWIG_IsNewObj(res)) delete ptr;
+  }
+  result = (bool)(arg1)->emit_object(arg2,arg3);
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_JITEngine_emit_object__SWIG_3(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  JITEngine *arg1 = (JITEngine *) 0 ;
+  std::string arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  bool result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OO:JITEngine_emit_object",&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_JITEngine, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "JITEngine_emit_object" "', argument " "1"" of type '" "JITEngine *""'"); 
+  }
+  arg1 = reinterpret_cast< JITEngine * >(argp1);
+  {
+    std::string *ptr = (std::string *)0;
+    int res = SWIG_AsPtr_std_string(obj1, &ptr);
+    if (!SWIG_IsOK(res) || !ptr) {
+      SWIG_exception_fail(SWIG_ArgError((ptr ? res : SWIG_TypeError)), "in method '" "JITEngine_emit_object" "', argument " "2"" of type '" "std::string""'"); 
+    }
+    arg2 = *ptr;
+    if (SWIG_IsNewObj(res)) delete ptr;
+  }
+  result = (bool)(arg1)->emit_object(arg2);
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_JITEngine_emit_object(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[6] = {
+    0
+  };
+  Py_ssize_t ii;
+  
+  if (!PyTuple_Check(args)) SWIG_fail;
+  argc = args ? PyObject_Length(args) : 0;
+  for (ii = 0; (ii < 5) && (ii < argc); ii++) {
+    argv[ii] = PyTuple_GET_ITEM(args,ii);
+  }
+  if (argc == 2) {
+    int _v;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_JITEngine, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      int res = SWIG_AsPtr_std_string(argv[1], (std::string**)(0));
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        return _wrap_JITEngine_emit_object__SWIG_3(self, args);
+      }
+    }
+  }
+  if (argc == 3) {
+    int _v;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_JITEngine, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      int res = SWIG_AsPtr_std_string(argv[1], (std::string**)(0));
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        int res = SWIG_AsPtr_std_string(argv[2], (std::string**)(0));
+        _v = SWIG_CheckState(res);
+        if (_v) {
+          return _wrap_JITEngine_emit_object__SWIG_2(self, args);
+        }
+      }
+    }
+  }
+  if (argc == 4) {
+    int _v;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_JITEngine, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      int res = SWIG_AsPtr_std_string(argv[1], (std::string**)(0));
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        int res = SWIG_AsPtr_std_string(argv[2], (std::string**)(0));
+        _v = SWIG_CheckState(res);
+        if (_v) {
+          int res = SWIG_AsPtr_std_string(argv[3], (std::string**)(0));
+          _v = SWIG_CheckState(res);
+          if (_v) {
+            return _wrap_JITEngine_emit_object__SWIG_1(self, args);
+          }
+        }
+      }
+    }
+  }
+  if (argc == 5) {
+    int _v;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_JITEngine, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      int res = SWIG_AsPtr_std_string(argv[1], (std::string**)(0));
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        int res = SWIG_AsPtr_std_string(argv[2], (std::string**)(0));
+        _v = SWIG_CheckState(res);
+        if (_v) {
+          int res = SWIG_AsPtr_std_string(argv[3], (std::string**)(0));
+          _v = SWIG_CheckState(res);
+          if (_v) {
+            int res = SWIG_AsPtr_std_string(argv[4], (std::string**)(0));
+            _v = SWIG_CheckState(res);
+            if (_v) {
+              return _wrap_JITEngine_emit_object__SWIG_0(self, args);
+            }
+          }
+        }
+      }
+    }
+  }
+  
+fail:
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'JITEngine_emit_object'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    JITEngine::emit_object(std::string,std::string,std::string,std::string)\n"
+    "    JITEngine::emit_object(std::string,std::string,std::string)\n"
+    "    JITEngine::emit_object(std::string,std::string)\n"
+    "    JITEngine::emit_object(std::string)\n");
+  return 0;
+}
+
+
+SWIGINTERN PyObject *_wrap_JITEngine_target_triple(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  JITEngine *arg1 = (JITEngine *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  std::string result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:JITEngine_target_triple",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_JITEngine, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "JITEngine_target_triple" "', argument " "1"" of type '" "JITEngine const *""'"); 
+  }
+  arg1 = reinterpret_cast< JITEngine * >(argp1);
+  result = ((JITEngine const *)arg1)->target_triple();
+  resultobj = SWIG_From_std_string(static_cast< std::string >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_JITEngine_host_cpu_name(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  std::string result;
+  
+  if (!PyArg_ParseTuple(args,(char *)":JITEngine_host_cpu_name")) SWIG_fail;
+  result = JITEngine::host_cpu_name();
+  resultobj = SWIG_From_std_string(static_cast< std::string >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_JITEngine_set_target(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  std::string arg1 ;
+  std::string arg2 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  bool result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OO:JITEngine_set_target",&obj0,&obj1)) SWIG_fail;
+  {
+    std::string *ptr = (std::string *)0;
+    int res = SWIG_AsPtr_std_string(obj0, &ptr);
+    if (!SWIG_IsOK(res) || !ptr) {
+      SWIG_exception_fail(SWIG_ArgError((ptr ? res : SWIG_TypeError)), "in method '" "JITEngine_set_target" "', argument " "1"" of type '" "std::string""'"); 
+    }
+    arg1 = *ptr;
+    if (SWIG_IsNewObj(res)) delete ptr;
+  }
+  {
+    std::string *ptr = (std::string *)0;
+    int res = SWIG_AsPtr_std_string(obj1, &ptr);
+    if (!SWIG_IsOK(res) || !ptr) {
+      SWIG_exception_fail(SWIG_ArgError((ptr ? res : SWIG_TypeError)), "in method '" "JITEngine_set_target" "', argument " "2"" of type '" "std::string""'"); 
+    }
+    arg2 = *ptr;
+    if (SWIG_IsNewObj(res)) delete ptr;
+  }
+  result = (bool)JITEngine::set_target(arg1,arg2);
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_JITEngine_target_cpu(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  std::string result;
+  
+  if (!PyArg_ParseTuple(args,(char *)":JITEngine_target_cpu")) SWIG_fail;
+  result = JITEngine::target_cpu();
+  resultobj = SWIG_From_std_string(static_cast< std::string >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_JITEngine_target_features(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  std::string result;
+  
+  if (!PyArg_ParseTuple(args,(char *)":JITEngine_target_features")) SWIG_fail;
+  result = JITEngine::target_features();
+  resultobj = SWIG_From_std_string(static_cast< std::string >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_JITEngine_llvm_version(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  int result;
+  
+  if (!PyArg_ParseTuple(args,(char *)":JITEngine_llvm_version")) SWIG_fail;
+  result = (int)JITEngine::llvm_version();
+  resultobj = SWIG_From_int(static_cast< int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_JITEngine_start_multithreaded(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  JITEngine *arg1 = (JITEngine *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:JITEngine_start_multithreaded",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_JITEngine, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "JITEngine_start_multithreaded" "', argument " "1"" of type '" "JITEngine *""'"); 
+  }
+  arg1 = reinterpret_cast< JITEngine * >(argp1);
+  (arg1)->start_multithreaded();
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_JITEngine_stop_multithreaded(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  JITEngine *arg1 = (JITEngine *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:JITEngine_stop_multithreaded",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_JITEngine, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "JITEngine_stop_multithreaded" "', argument " "1"" of type '" "JITEngine *""'"); 
+  }
+  arg1 = reinterpret_cast< JITEngine * >(argp1);
+  (arg1)->stop_multithreaded();
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_JITEngine_is_multithreaded(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  JITEngine *arg1 = (JITEngine *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  bool result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:JITEngine_is_multithreaded",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_JITEngine, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "JITEngine_is_multithreaded" "', argument " "1"" of type '" "JITEngine *""'"); 
+  }
+  arg1 = reinterpret_cast< JITEngine * >(argp1);
+  result = (bool)(arg1)->is_multithreaded();
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_JITEngine_dump_passes(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  JITEngine *arg1 = (JITEngine *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  std::string result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:JITEngine_dump_passes",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_JITEngine, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "JITEngine_dump_passes" "', argument " "1"" of type '" "JITEngine *""'"); 
+  }
+  arg1 = reinterpret_cast< JITEngine * >(argp1);
+  result = (arg1)->dump_passes();
+  resultobj = SWIG_From_std_string(static_cast< std::string >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *JITEngine_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *obj;
-  if (!PyArg_ParseTuple(args,(char*)"O:swigregister", &obj)) return NULL;
+  if (!PyArg_ParseTuple(args,(char *)"O:swigregister", &obj)) return NULL;
   SWIG_TypeNewClientData(SWIGTYPE_p_JITEngine, SWIG_NewClientData(obj));
   return SWIG_Py_Void();
 }
 
-SWIGINTERN PyObject *_wrap_new_Builder(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *resultobj = 0;
-  Builder *result = 0 ;
+SWIGINTERN PyObject *_wrap_new_Builder(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  Builder *result = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)":new_Builder")) SWIG_fail;
+  result = (Builder *)new Builder();
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Builder, SWIG_POINTER_NEW |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Builder_insert_at(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  Builder *arg1 = (Builder *) 0 ;
+  llvm::BasicBlock *arg2 = (llvm::BasicBlock *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OO:Builder_insert_at",&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_insert_at" "', argument " "1"" of type '" "Builder *""'"); 
+  }
+  arg1 = reinterpret_cast< Builder * >(argp1);
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__BasicBlock, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_insert_at" "', argument " "2"" of type '" "llvm::BasicBlock *""'"); 
+  }
+  arg2 = reinterpret_cast< llvm::BasicBlock * >(argp2);
+  (arg1)->insert_at(arg2);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Builder_get_basic_block(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  Builder *arg1 = (Builder *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  llvm::BasicBlock *result = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:Builder_get_basic_block",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_get_basic_block" "', argument " "1"" of type '" "Builder const *""'"); 
+  }
+  arg1 = reinterpret_cast< Builder * >(argp1);
+  result = (llvm::BasicBlock *)((Builder const *)arg1)->get_basic_block();
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__BasicBlock, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Builder_set_fast_math(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  Builder *arg1 = (Builder *) 0 ;
+  unsigned int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  unsigned int val2 ;
+  int ecode2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OO:Builder_set_fast_math",&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_set_fast_math" "', argument " "1"" of type '" "Builder *""'"); 
+  }
+  arg1 = reinterpret_cast< Builder * >(argp1);
+  ecode2 = SWIG_AsVal_unsigned_SS_int(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "Builder_set_fast_math" "', argument " "2"" of type '" "unsigned int""'");
+  } 
+  arg2 = static_cast< unsigned int >(val2);
+  (arg1)->set_fast_math(arg2);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Builder_fast_math(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  Builder *arg1 = (Builder *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  unsigned int result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:Builder_fast_math",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_fast_math" "', argument " "1"" of type '" "Builder const *""'"); 
+  }
+  arg1 = reinterpret_cast< Builder * >(argp1);
+  result = (unsigned int)((Builder const *)arg1)->fast_math();
+  resultobj = SWIG_From_unsigned_SS_int(static_cast< unsigned int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Builder_phi__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  Builder *arg1 = (Builder *) 0 ;
+  llvm::Type *arg2 = (llvm::Type *) 0 ;
+  std::vector< llvm::BasicBlock *,std::allocator< llvm::BasicBlock * > > arg3 ;
+  std::vector< llvm::Value *,std::allocator< llvm::Value * > > arg4 ;
+  char *arg5 = (char *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  int res5 ;
+  char *buf5 = 0 ;
+  int alloc5 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  PyObject * obj3 = 0 ;
+  PyObject * obj4 = 0 ;
+  llvm::Value *result = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OOOOO:Builder_phi",&obj0,&obj1,&obj2,&obj3,&obj4)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_phi" "', argument " "1"" of type '" "Builder *""'"); 
+  }
+  arg1 = reinterpret_cast< Builder * >(argp1);
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Type, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_phi" "', argument " "2"" of type '" "llvm::Type *""'"); 
+  }
+  arg2 = reinterpret_cast< llvm::Type * >(argp2);
+  {
+    std::vector< llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > > *ptr = (std::vector< llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > > *)0;
+    int res = swig::asptr(obj2, &ptr);
+    if (!SWIG_IsOK(res) || !ptr) {
+      SWIG_exception_fail(SWIG_ArgError((ptr ? res : SWIG_TypeError)), "in method '" "Builder_phi" "', argument " "3"" of type '" "std::vector< llvm::BasicBlock *,std::allocator< llvm::BasicBlock * > >""'"); 
+    }
+    arg3 = *ptr;
+    if (SWIG_IsNewObj(res)) delete ptr;
+  }
+  {
+    std::vector< llvm::Value*,std::allocator< llvm::Value * > > *ptr = (std::vector< llvm::Value*,std::allocator< llvm::Value * > > *)0;
+    int res = swig::asptr(obj3, &ptr);
+    if (!SWIG_IsOK(res) || !ptr) {
+      SWIG_exception_fail(SWIG_ArgError((ptr ? res : SWIG_TypeError)), "in method '" "Builder_phi" "', argument " "4"" of type '" "std::vector< llvm::Value *,std::allocator< llvm::Value * > >""'"); 
+    }
+    arg4 = *ptr;
+    if (SWIG_IsNewObj(res)) delete ptr;
+  }
+  res5 = SWIG_AsCharPtrAndSize(obj4, &buf5, NULL, &alloc5);
+  if (!SWIG_IsOK(res5)) {
+    SWIG_exception_fail(SWIG_ArgError(res5), "in method '" "Builder_phi" "', argument " "5"" of type '" "char const *""'");
+  }
+  arg5 = reinterpret_cast< char * >(buf5);
+  result = (llvm::Value *)(arg1)->phi(arg2,arg3,arg4,(char const *)arg5);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
+  if (alloc5 == SWIG_NEWOBJ) delete[] buf5;
+  return resultobj;
+fail:
+  if (alloc5 == SWIG_NEWOBJ) delete[] buf5;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Builder_phi__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  Builder *arg1 = (Builder *) 0 ;
+  llvm::Type *arg2 = (llvm::Type *) 0 ;
+  std::vector< llvm::BasicBlock *,std::allocator< llvm::BasicBlock * > > arg3 ;
+  std::vector< llvm::Value *,std::allocator< llvm::Value * > > arg4 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  PyObject * obj3 = 0 ;
+  llvm::Value *result = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_phi",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_phi" "', argument " "1"" of type '" "Builder *""'"); 
+  }
+  arg1 = reinterpret_cast< Builder * >(argp1);
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Type, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_phi" "', argument " "2"" of type '" "llvm::Type *""'"); 
+  }
+  arg2 = reinterpret_cast< llvm::Type * >(argp2);
+  {
+    std::vector< llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > > *ptr = (std::vector< llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > > *)0;
+    int res = swig::asptr(obj2, &ptr);
+    if (!SWIG_IsOK(res) || !ptr) {
+      SWIG_exception_fail(SWIG_ArgError((ptr ? res : SWIG_TypeError)), "in method '" "Builder_phi" "', argument " "3"" of type '" "std::vector< llvm::BasicBlock *,std::allocator< llvm::BasicBlock * > >""'"); 
+    }
+    arg3 = *ptr;
+    if (SWIG_IsNewObj(res)) delete ptr;
+  }
+  {
+    std::vector< llvm::Value*,std::allocator< llvm::Value * > > *ptr = (std::vector< llvm::Value*,std::allocator< llvm::Value * > > *)0;
+    int res = swig::asptr(obj3, &ptr);
+    if (!SWIG_IsOK(res) || !ptr) {
+      SWIG_exception_fail(SWIG_ArgError((ptr ? res : SWIG_TypeError)), "in method '" "Builder_phi" "', argument " "4"" of type '" "std::vector< llvm::Value *,std::allocator< llvm::Value * > >""'"); 
+    }
+    arg4 = *ptr;
+    if (SWIG_IsNewObj(res)) delete ptr;
+  }
+  result = (llvm::Value *)(arg1)->phi(arg2,arg3,arg4);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Builder_phi(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[6] = {
+    0
+  };
+  Py_ssize_t ii;
+  
+  if (!PyTuple_Check(args)) SWIG_fail;
+  argc = args ? PyObject_Length(args) : 0;
+  for (ii = 0; (ii < 5) && (ii < argc); ii++) {
+    argv[ii] = PyTuple_GET_ITEM(args,ii);
+  }
+  if (argc == 4) {
+    int _v;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      void *vptr = 0;
+      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Type, 0);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        int res = swig::asptr(argv[2], (std::vector< llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >**)(0));
+        _v = SWIG_CheckState(res);
+        if (_v) {
+          int res = swig::asptr(argv[3], (std::vector< llvm::Value*,std::allocator< llvm::Value * > >**)(0));
+          _v = SWIG_CheckState(res);
+          if (_v) {
+            return _wrap_Builder_phi__SWIG_1(self, args);
+          }
+        }
+      }
+    }
+  }
+  if (argc == 5) {
+    int _v;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      void *vptr = 0;
+      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Type, 0);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        int res = swig::asptr(argv[2], (std::vector< llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >**)(0));
+        _v = SWIG_CheckState(res);
+        if (_v) {
+          int res = swig::asptr(argv[3], (std::vector< llvm::Value*,std::allocator< llvm::Value * > >**)(0));
+          _v = SWIG_CheckState(res);
+          if (_v) {
+            int res = SWIG_AsCharPtrAndSize(argv[4], 0, NULL, 0);
+            _v = SWIG_CheckState(res);
+            if (_v) {
+              return _wrap_Builder_phi__SWIG_0(self, args);
+            }
+          }
+        }
+      }
+    }
+  }
+  
+fail:
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_phi'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    Builder::phi(llvm::Type *,std::vector< llvm::BasicBlock *,std::allocator< llvm::BasicBlock * > >,std::vector< llvm::Value *,std::allocator< llvm::Value * > >,char const *)\n"
+    "    Builder::phi(llvm::Type *,std::vector< llvm::BasicBlock *,std::allocator< llvm::BasicBlock * > >,std::vector< llvm::Value *,std::allocator< llvm::Value * > >)\n");
+  return 0;
+}
+
+
+SWIGINTERN PyObject *_wrap_Builder_intrinsic_pow__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  Builder *arg1 = (Builder *) 0 ;
+  llvm::Value *arg2 = (llvm::Value *) 0 ;
+  llvm::Value *arg3 = (llvm::Value *) 0 ;
+  char *arg4 = (char *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  int res4 ;
+  char *buf4 = 0 ;
+  int alloc4 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  PyObject * obj3 = 0 ;
+  llvm::Value *result = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_intrinsic_pow",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_intrinsic_pow" "', argument " "1"" of type '" "Builder *""'"); 
+  }
+  arg1 = reinterpret_cast< Builder * >(argp1);
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_intrinsic_pow" "', argument " "2"" of type '" "llvm::Value *""'"); 
+  }
+  arg2 = reinterpret_cast< llvm::Value * >(argp2);
+  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_intrinsic_pow" "', argument " "3"" of type '" "llvm::Value *""'"); 
+  }
+  arg3 = reinterpret_cast< llvm::Value * >(argp3);
+  res4 = SWIG_AsCharPtrAndSize(obj3, &buf4, NULL, &alloc4);
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_intrinsic_pow" "', argument " "4"" of type '" "char const *""'");
+  }
+  arg4 = reinterpret_cast< char * >(buf4);
+  result = (llvm::Value *)(arg1)->intrinsic_pow(arg2,arg3,(char const *)arg4);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
+  if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
+  return resultobj;
+fail:
+  if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Builder_intrinsic_pow__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  Builder *arg1 = (Builder *) 0 ;
+  llvm::Value *arg2 = (llvm::Value *) 0 ;
+  llvm::Value *arg3 = (llvm::Value *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  llvm::Value *result = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_intrinsic_pow",&obj0,&obj1,&obj2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_intrinsic_pow" "', argument " "1"" of type '" "Builder *""'"); 
+  }
+  arg1 = reinterpret_cast< Builder * >(argp1);
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_intrinsic_pow" "', argument " "2"" of type '" "llvm::Value *""'"); 
+  }
+  arg2 = reinterpret_cast< llvm::Value * >(argp2);
+  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_intrinsic_pow" "', argument " "3"" of type '" "llvm::Value *""'"); 
+  }
+  arg3 = reinterpret_cast< llvm::Value * >(argp3);
+  result = (llvm::Value *)(arg1)->intrinsic_pow(arg2,arg3);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Builder_intrinsic_pow(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  Py_ssize_t ii;
+  
+  if (!PyTuple_Check(args)) SWIG_fail;
+  argc = args ? PyObject_Length(args) : 0;
+  for (ii = 0; (ii < 4) && (ii < argc); ii++) {
+    argv[ii] = PyTuple_GET_ITEM(args,ii);
+  }
+  if (argc == 3) {
+    int _v;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      void *vptr = 0;
+      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Value, 0);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        void *vptr = 0;
+        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
+        _v = SWIG_CheckState(res);
+        if (_v) {
+          return _wrap_Builder_intrinsic_pow__SWIG_1(self, args);
+        }
+      }
+    }
+  }
+  if (argc == 4) {
+    int _v;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      void *vptr = 0;
+      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Value, 0);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        void *vptr = 0;
+        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
+        _v = SWIG_CheckState(res);
+        if (_v) {
+          int res = SWIG_AsCharPtrAndSize(argv[3], 0, NULL, 0);
+          _v = SWIG_CheckState(res);
+          if (_v) {
+            return _wrap_Builder_intrinsic_pow__SWIG_0(self, args);
+          }
+        }
+      }
+    }
+  }
   
-  if (!PyArg_ParseTuple(args,(char *)":new_Builder")) SWIG_fail;
-  result = (Builder *)new Builder();
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Builder, SWIG_POINTER_NEW |  0 );
-  return resultobj;
 fail:
-  return NULL;
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_intrinsic_pow'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    Builder::intrinsic_pow(llvm::Value *,llvm::Value *,char const *)\n"
+    "    Builder::intrinsic_pow(llvm::Value *,llvm::Value *)\n");
+  return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_insert_at(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_bitwise_and__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
-  llvm::BasicBlock *arg2 = (llvm::BasicBlock *) 0 ;
+  llvm::Value *arg2 = (llvm::Value *) 0 ;
+  llvm::Value *arg3 = (llvm::Value *) 0 ;
+  char *arg4 = (char *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   void *argp2 = 0 ;
   int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  int res4 ;
+  char *buf4 = 0 ;
+  int alloc4 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  PyObject * obj3 = 0 ;
+  llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:Builder_insert_at",&obj0,&obj1)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_bitwise_and",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_insert_at" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_bitwise_and" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__BasicBlock, 0 |  0 );
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_insert_at" "', argument " "2"" of type '" "llvm::BasicBlock *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_bitwise_and" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
-  arg2 = reinterpret_cast< llvm::BasicBlock * >(argp2);
-  (arg1)->insert_at(arg2);
-  resultobj = SWIG_Py_Void();
+  arg2 = reinterpret_cast< llvm::Value * >(argp2);
+  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_bitwise_and" "', argument " "3"" of type '" "llvm::Value *""'"); 
+  }
+  arg3 = reinterpret_cast< llvm::Value * >(argp3);
+  res4 = SWIG_AsCharPtrAndSize(obj3, &buf4, NULL, &alloc4);
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_bitwise_and" "', argument " "4"" of type '" "char const *""'");
+  }
+  arg4 = reinterpret_cast< char * >(buf4);
+  result = (llvm::Value *)(arg1)->bitwise_and(arg2,arg3,(char const *)arg4);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
+  if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
   return resultobj;
 fail:
+  if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_get_basic_block(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_bitwise_and__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
+  llvm::Value *arg2 = (llvm::Value *) 0 ;
+  llvm::Value *arg3 = (llvm::Value *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
   PyObject * obj0 = 0 ;
-  llvm::BasicBlock *result = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:Builder_get_basic_block",&obj0)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_bitwise_and",&obj0,&obj1,&obj2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_get_basic_block" "', argument " "1"" of type '" "Builder const *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_bitwise_and" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
-  result = (llvm::BasicBlock *)((Builder const *)arg1)->get_basic_block();
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__BasicBlock, 0 |  0 );
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_bitwise_and" "', argument " "2"" of type '" "llvm::Value *""'"); 
+  }
+  arg2 = reinterpret_cast< llvm::Value * >(argp2);
+  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_bitwise_and" "', argument " "3"" of type '" "llvm::Value *""'"); 
+  }
+  arg3 = reinterpret_cast< llvm::Value * >(argp3);
+  result = (llvm::Value *)(arg1)->bitwise_and(arg2,arg3);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_phi__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_bitwise_and(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  Py_ssize_t ii;
+  
+  if (!PyTuple_Check(args)) SWIG_fail;
+  argc = args ? PyObject_Length(args) : 0;
+  for (ii = 0; (ii < 4) && (ii < argc); ii++) {
+    argv[ii] = PyTuple_GET_ITEM(args,ii);
+  }
+  if (argc == 3) {
+    int _v;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      void *vptr = 0;
+      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Value, 0);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        void *vptr = 0;
+        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
+        _v = SWIG_CheckState(res);
+        if (_v) {
+          return _wrap_Builder_bitwise_and__SWIG_1(self, args);
+        }
+      }
+    }
+  }
+  if (argc == 4) {
+    int _v;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      void *vptr = 0;
+      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Value, 0);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        void *vptr = 0;
+        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
+        _v = SWIG_CheckState(res);
+        if (_v) {
+          int res = SWIG_AsCharPtrAndSize(argv[3], 0, NULL, 0);
+          _v = SWIG_CheckState(res);
+          if (_v) {
+            return _wrap_Builder_bitwise_and__SWIG_0(self, args);
+          }
+        }
+      }
+    }
+  }
+  
+fail:
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_bitwise_and'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    Builder::bitwise_and(llvm::Value *,llvm::Value *,char const *)\n"
+    "    Builder::bitwise_and(llvm::Value *,llvm::Value *)\n");
+  return 0;
+}
+
+
+SWIGINTERN PyObject *_wrap_Builder_bitwise_or__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
-  llvm::Type *arg2 = (llvm::Type *) 0 ;
-  std::vector< llvm::BasicBlock *,std::allocator< llvm::BasicBlock * > > arg3 ;
-  std::vector< llvm::Value *,std::allocator< llvm::Value * > > arg4 ;
-  char *arg5 = (char *) 0 ;
+  llvm::Value *arg2 = (llvm::Value *) 0 ;
+  llvm::Value *arg3 = (llvm::Value *) 0 ;
+  char *arg4 = (char *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   void *argp2 = 0 ;
   int res2 = 0 ;
-  int res5 ;
-  char *buf5 = 0 ;
-  int alloc5 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  int res4 ;
+  char *buf4 = 0 ;
+  int alloc4 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
   PyObject * obj3 = 0 ;
-  PyObject * obj4 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOOO:Builder_phi",&obj0,&obj1,&obj2,&obj3,&obj4)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_bitwise_or",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_phi" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_bitwise_or" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Type, 0 |  0 );
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_phi" "', argument " "2"" of type '" "llvm::Type *""'"); 
-  }
-  arg2 = reinterpret_cast< llvm::Type * >(argp2);
-  {
-    std::vector<llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > > *ptr = (std::vector<llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > > *)0;
-    int res = swig::asptr(obj2, &ptr);
-    if (!SWIG_IsOK(res) || !ptr) {
-      SWIG_exception_fail(SWIG_ArgError((ptr ? res : SWIG_TypeError)), "in method '" "Builder_phi" "', argument " "3"" of type '" "std::vector< llvm::BasicBlock *,std::allocator< llvm::BasicBlock * > >""'"); 
-    }
-    arg3 = *ptr;
-    if (SWIG_IsNewObj(res)) delete ptr;
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_bitwise_or" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
-  {
-    std::vector<llvm::Value*,std::allocator< llvm::Value * > > *ptr = (std::vector<llvm::Value*,std::allocator< llvm::Value * > > *)0;
-    int res = swig::asptr(obj3, &ptr);
-    if (!SWIG_IsOK(res) || !ptr) {
-      SWIG_exception_fail(SWIG_ArgError((ptr ? res : SWIG_TypeError)), "in method '" "Builder_phi" "', argument " "4"" of type '" "std::vector< llvm::Value *,std::allocator< llvm::Value * > >""'"); 
-    }
-    arg4 = *ptr;
-    if (SWIG_IsNewObj(res)) delete ptr;
+  arg2 = reinterpret_cast< llvm::Value * >(argp2);
+  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_bitwise_or" "', argument " "3"" of type '" "llvm::Value *""'"); 
   }
-  res5 = SWIG_AsCharPtrAndSize(obj4, &buf5, NULL, &alloc5);
-  if (!SWIG_IsOK(res5)) {
-    SWIG_exception_fail(SWIG_ArgError(res5), "in method '" "Builder_phi" "', argument " "5"" of type '" "char const *""'");
+  arg3 = reinterpret_cast< llvm::Value * >(argp3);
+  res4 = SWIG_AsCharPtrAndSize(obj3, &buf4, NULL, &alloc4);
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_bitwise_or" "', argument " "4"" of type '" "char const *""'");
   }
-  arg5 = reinterpret_cast< char * >(buf5);
-  result = (llvm::Value *)(arg1)->phi(arg2,arg3,arg4,(char const *)arg5);
+  arg4 = reinterpret_cast< char * >(buf4);
+  result = (llvm::Value *)(arg1)->bitwise_or(arg2,arg3,(char const *)arg4);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
-  if (alloc5 == SWIG_NEWOBJ) delete[] buf5;
+  if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
   return resultobj;
 fail:
-  if (alloc5 == SWIG_NEWOBJ) delete[] buf5;
+  if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_phi__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_bitwise_or__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
-  llvm::Type *arg2 = (llvm::Type *) 0 ;
-  std::vector< llvm::BasicBlock *,std::allocator< llvm::BasicBlock * > > arg3 ;
-  std::vector< llvm::Value *,std::allocator< llvm::Value * > > arg4 ;
+  llvm::Value *arg2 = (llvm::Value *) 0 ;
+  llvm::Value *arg3 = (llvm::Value *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   void *argp2 = 0 ;
   int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
-  PyObject * obj3 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_phi",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_bitwise_or",&obj0,&obj1,&obj2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_phi" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_bitwise_or" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Type, 0 |  0 );
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_phi" "', argument " "2"" of type '" "llvm::Type *""'"); 
-  }
-  arg2 = reinterpret_cast< llvm::Type * >(argp2);
-  {
-    std::vector<llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > > *ptr = (std::vector<llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > > *)0;
-    int res = swig::asptr(obj2, &ptr);
-    if (!SWIG_IsOK(res) || !ptr) {
-      SWIG_exception_fail(SWIG_ArgError((ptr ? res : SWIG_TypeError)), "in method '" "Builder_phi" "', argument " "3"" of type '" "std::vector< llvm::BasicBlock *,std::allocator< llvm::BasicBlock * > >""'"); 
-    }
-    arg3 = *ptr;
-    if (SWIG_IsNewObj(res)) delete ptr;
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_bitwise_or" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
-  {
-    std::vector<llvm::Value*,std::allocator< llvm::Value * > > *ptr = (std::vector<llvm::Value*,std::allocator< llvm::Value * > > *)0;
-    int res = swig::asptr(obj3, &ptr);
-    if (!SWIG_IsOK(res) || !ptr) {
-      SWIG_exception_fail(SWIG_ArgError((ptr ? res : SWIG_TypeError)), "in method '" "Builder_phi" "', argument " "4"" of type '" "std::vector< llvm::Value *,std::allocator< llvm::Value * > >""'"); 
-    }
-    arg4 = *ptr;
-    if (SWIG_IsNewObj(res)) delete ptr;
+  arg2 = reinterpret_cast< llvm::Value * >(argp2);
+  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_bitwise_or" "', argument " "3"" of type '" "llvm::Value *""'"); 
   }
-  result = (llvm::Value *)(arg1)->phi(arg2,arg3,arg4);
+  arg3 = reinterpret_cast< llvm::Value * >(argp3);
+  result = (llvm::Value *)(arg1)->bitwise_or(arg2,arg3);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   return resultobj;
 fail:
@@ -16783,59 +19380,55 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_phi(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[6];
-  int ii;
+SWIGINTERN PyObject *_wrap_Builder_bitwise_or(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
-  for (ii = 0; (ii < 5) && (ii < argc); ii++) {
+  argc = args ? PyObject_Length(args) : 0;
+  for (ii = 0; (ii < 4) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
-  if (argc == 4) {
+  if (argc == 3) {
     int _v;
     void *vptr = 0;
     int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
     _v = SWIG_CheckState(res);
     if (_v) {
       void *vptr = 0;
-      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Type, 0);
+      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Value, 0);
       _v = SWIG_CheckState(res);
       if (_v) {
-        int res = swig::asptr(argv[2], (std::vector<llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >**)(0));
+        void *vptr = 0;
+        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
         _v = SWIG_CheckState(res);
         if (_v) {
-          int res = swig::asptr(argv[3], (std::vector<llvm::Value*,std::allocator< llvm::Value * > >**)(0));
-          _v = SWIG_CheckState(res);
-          if (_v) {
-            return _wrap_Builder_phi__SWIG_1(self, args);
-          }
+          return _wrap_Builder_bitwise_or__SWIG_1(self, args);
         }
       }
     }
   }
-  if (argc == 5) {
+  if (argc == 4) {
     int _v;
     void *vptr = 0;
     int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
     _v = SWIG_CheckState(res);
     if (_v) {
       void *vptr = 0;
-      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Type, 0);
+      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Value, 0);
       _v = SWIG_CheckState(res);
       if (_v) {
-        int res = swig::asptr(argv[2], (std::vector<llvm::BasicBlock*,std::allocator< llvm::BasicBlock * > >**)(0));
+        void *vptr = 0;
+        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
         _v = SWIG_CheckState(res);
         if (_v) {
-          int res = swig::asptr(argv[3], (std::vector<llvm::Value*,std::allocator< llvm::Value * > >**)(0));
+          int res = SWIG_AsCharPtrAndSize(argv[3], 0, NULL, 0);
           _v = SWIG_CheckState(res);
           if (_v) {
-            int res = SWIG_AsCharPtrAndSize(argv[4], 0, NULL, 0);
-            _v = SWIG_CheckState(res);
-            if (_v) {
-              return _wrap_Builder_phi__SWIG_0(self, args);
-            }
+            return _wrap_Builder_bitwise_or__SWIG_0(self, args);
           }
         }
       }
@@ -16843,15 +19436,15 @@ SWIGINTERN PyObject *_wrap_Builder_phi(PyObject *self, PyObject *args) {
   }
   
 fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_phi'.\n"
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_bitwise_or'.\n"
     "  Possible C/C++ prototypes are:\n"
-    "    Builder::phi(llvm::Type *,std::vector< llvm::BasicBlock *,std::allocator< llvm::BasicBlock * > >,std::vector< llvm::Value *,std::allocator< llvm::Value * > >,char const *)\n"
-    "    Builder::phi(llvm::Type *,std::vector< llvm::BasicBlock *,std::allocator< llvm::BasicBlock * > >,std::vector< llvm::Value *,std::allocator< llvm::Value * > >)\n");
+    "    Builder::bitwise_or(llvm::Value *,llvm::Value *,char const *)\n"
+    "    Builder::bitwise_or(llvm::Value *,llvm::Value *)\n");
   return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_intrinsic_pow__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_bitwise_xor__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
@@ -16872,28 +19465,28 @@ SWIGINTERN PyObject *_wrap_Builder_intrinsic_pow__SWIG_0(PyObject *SWIGUNUSEDPAR
   PyObject * obj3 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_intrinsic_pow",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_bitwise_xor",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_intrinsic_pow" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_bitwise_xor" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_intrinsic_pow" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_bitwise_xor" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
   res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_intrinsic_pow" "', argument " "3"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_bitwise_xor" "', argument " "3"" of type '" "llvm::Value *""'"); 
   }
   arg3 = reinterpret_cast< llvm::Value * >(argp3);
   res4 = SWIG_AsCharPtrAndSize(obj3, &buf4, NULL, &alloc4);
   if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_intrinsic_pow" "', argument " "4"" of type '" "char const *""'");
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_bitwise_xor" "', argument " "4"" of type '" "char const *""'");
   }
   arg4 = reinterpret_cast< char * >(buf4);
-  result = (llvm::Value *)(arg1)->intrinsic_pow(arg2,arg3,(char const *)arg4);
+  result = (llvm::Value *)(arg1)->bitwise_xor(arg2,arg3,(char const *)arg4);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
   return resultobj;
@@ -16903,7 +19496,7 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_intrinsic_pow__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_bitwise_xor__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
@@ -16919,23 +19512,23 @@ SWIGINTERN PyObject *_wrap_Builder_intrinsic_pow__SWIG_1(PyObject *SWIGUNUSEDPAR
   PyObject * obj2 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_intrinsic_pow",&obj0,&obj1,&obj2)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_bitwise_xor",&obj0,&obj1,&obj2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_intrinsic_pow" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_bitwise_xor" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_intrinsic_pow" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_bitwise_xor" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
   res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_intrinsic_pow" "', argument " "3"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_bitwise_xor" "', argument " "3"" of type '" "llvm::Value *""'"); 
   }
   arg3 = reinterpret_cast< llvm::Value * >(argp3);
-  result = (llvm::Value *)(arg1)->intrinsic_pow(arg2,arg3);
+  result = (llvm::Value *)(arg1)->bitwise_xor(arg2,arg3);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   return resultobj;
 fail:
@@ -16943,13 +19536,15 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_intrinsic_pow(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[5];
-  int ii;
+SWIGINTERN PyObject *_wrap_Builder_bitwise_xor(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 4) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
@@ -16967,7 +19562,7 @@ SWIGINTERN PyObject *_wrap_Builder_intrinsic_pow(PyObject *self, PyObject *args)
         int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
         _v = SWIG_CheckState(res);
         if (_v) {
-          return _wrap_Builder_intrinsic_pow__SWIG_1(self, args);
+          return _wrap_Builder_bitwise_xor__SWIG_1(self, args);
         }
       }
     }
@@ -16989,7 +19584,7 @@ SWIGINTERN PyObject *_wrap_Builder_intrinsic_pow(PyObject *self, PyObject *args)
           int res = SWIG_AsCharPtrAndSize(argv[3], 0, NULL, 0);
           _v = SWIG_CheckState(res);
           if (_v) {
-            return _wrap_Builder_intrinsic_pow__SWIG_0(self, args);
+            return _wrap_Builder_bitwise_xor__SWIG_0(self, args);
           }
         }
       }
@@ -16997,15 +19592,143 @@ SWIGINTERN PyObject *_wrap_Builder_intrinsic_pow(PyObject *self, PyObject *args)
   }
   
 fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_intrinsic_pow'.\n"
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_bitwise_xor'.\n"
     "  Possible C/C++ prototypes are:\n"
-    "    Builder::intrinsic_pow(llvm::Value *,llvm::Value *,char const *)\n"
-    "    Builder::intrinsic_pow(llvm::Value *,llvm::Value *)\n");
+    "    Builder::bitwise_xor(llvm::Value *,llvm::Value *,char const *)\n"
+    "    Builder::bitwise_xor(llvm::Value *,llvm::Value *)\n");
   return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_bitwise_and__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_bitwise_not__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  Builder *arg1 = (Builder *) 0 ;
+  llvm::Value *arg2 = (llvm::Value *) 0 ;
+  char *arg3 = (char *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  int res3 ;
+  char *buf3 = 0 ;
+  int alloc3 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  llvm::Value *result = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_bitwise_not",&obj0,&obj1,&obj2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_bitwise_not" "', argument " "1"" of type '" "Builder *""'"); 
+  }
+  arg1 = reinterpret_cast< Builder * >(argp1);
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_bitwise_not" "', argument " "2"" of type '" "llvm::Value *""'"); 
+  }
+  arg2 = reinterpret_cast< llvm::Value * >(argp2);
+  res3 = SWIG_AsCharPtrAndSize(obj2, &buf3, NULL, &alloc3);
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_bitwise_not" "', argument " "3"" of type '" "char const *""'");
+  }
+  arg3 = reinterpret_cast< char * >(buf3);
+  result = (llvm::Value *)(arg1)->bitwise_not(arg2,(char const *)arg3);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
+  if (alloc3 == SWIG_NEWOBJ) delete[] buf3;
+  return resultobj;
+fail:
+  if (alloc3 == SWIG_NEWOBJ) delete[] buf3;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Builder_bitwise_not__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  Builder *arg1 = (Builder *) 0 ;
+  llvm::Value *arg2 = (llvm::Value *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  llvm::Value *result = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OO:Builder_bitwise_not",&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_bitwise_not" "', argument " "1"" of type '" "Builder *""'"); 
+  }
+  arg1 = reinterpret_cast< Builder * >(argp1);
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_bitwise_not" "', argument " "2"" of type '" "llvm::Value *""'"); 
+  }
+  arg2 = reinterpret_cast< llvm::Value * >(argp2);
+  result = (llvm::Value *)(arg1)->bitwise_not(arg2);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Builder_bitwise_not(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[4] = {
+    0
+  };
+  Py_ssize_t ii;
+  
+  if (!PyTuple_Check(args)) SWIG_fail;
+  argc = args ? PyObject_Length(args) : 0;
+  for (ii = 0; (ii < 3) && (ii < argc); ii++) {
+    argv[ii] = PyTuple_GET_ITEM(args,ii);
+  }
+  if (argc == 2) {
+    int _v;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      void *vptr = 0;
+      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Value, 0);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        return _wrap_Builder_bitwise_not__SWIG_1(self, args);
+      }
+    }
+  }
+  if (argc == 3) {
+    int _v;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      void *vptr = 0;
+      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Value, 0);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        int res = SWIG_AsCharPtrAndSize(argv[2], 0, NULL, 0);
+        _v = SWIG_CheckState(res);
+        if (_v) {
+          return _wrap_Builder_bitwise_not__SWIG_0(self, args);
+        }
+      }
+    }
+  }
+  
+fail:
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_bitwise_not'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    Builder::bitwise_not(llvm::Value *,char const *)\n"
+    "    Builder::bitwise_not(llvm::Value *)\n");
+  return 0;
+}
+
+
+SWIGINTERN PyObject *_wrap_Builder_shl__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
@@ -17026,28 +19749,28 @@ SWIGINTERN PyObject *_wrap_Builder_bitwise_and__SWIG_0(PyObject *SWIGUNUSEDPARM(
   PyObject * obj3 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_bitwise_and",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_shl",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_bitwise_and" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_shl" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_bitwise_and" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_shl" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
   res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_bitwise_and" "', argument " "3"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_shl" "', argument " "3"" of type '" "llvm::Value *""'"); 
   }
   arg3 = reinterpret_cast< llvm::Value * >(argp3);
   res4 = SWIG_AsCharPtrAndSize(obj3, &buf4, NULL, &alloc4);
   if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_bitwise_and" "', argument " "4"" of type '" "char const *""'");
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_shl" "', argument " "4"" of type '" "char const *""'");
   }
   arg4 = reinterpret_cast< char * >(buf4);
-  result = (llvm::Value *)(arg1)->bitwise_and(arg2,arg3,(char const *)arg4);
+  result = (llvm::Value *)(arg1)->shl(arg2,arg3,(char const *)arg4);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
   return resultobj;
@@ -17057,7 +19780,7 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_bitwise_and__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_shl__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
@@ -17073,23 +19796,23 @@ SWIGINTERN PyObject *_wrap_Builder_bitwise_and__SWIG_1(PyObject *SWIGUNUSEDPARM(
   PyObject * obj2 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_bitwise_and",&obj0,&obj1,&obj2)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_shl",&obj0,&obj1,&obj2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_bitwise_and" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_shl" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_bitwise_and" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_shl" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
   res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_bitwise_and" "', argument " "3"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_shl" "', argument " "3"" of type '" "llvm::Value *""'"); 
   }
   arg3 = reinterpret_cast< llvm::Value * >(argp3);
-  result = (llvm::Value *)(arg1)->bitwise_and(arg2,arg3);
+  result = (llvm::Value *)(arg1)->shl(arg2,arg3);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   return resultobj;
 fail:
@@ -17097,13 +19820,15 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_bitwise_and(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[5];
-  int ii;
+SWIGINTERN PyObject *_wrap_Builder_shl(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 4) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
@@ -17121,7 +19846,7 @@ SWIGINTERN PyObject *_wrap_Builder_bitwise_and(PyObject *self, PyObject *args) {
         int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
         _v = SWIG_CheckState(res);
         if (_v) {
-          return _wrap_Builder_bitwise_and__SWIG_1(self, args);
+          return _wrap_Builder_shl__SWIG_1(self, args);
         }
       }
     }
@@ -17143,7 +19868,7 @@ SWIGINTERN PyObject *_wrap_Builder_bitwise_and(PyObject *self, PyObject *args) {
           int res = SWIG_AsCharPtrAndSize(argv[3], 0, NULL, 0);
           _v = SWIG_CheckState(res);
           if (_v) {
-            return _wrap_Builder_bitwise_and__SWIG_0(self, args);
+            return _wrap_Builder_shl__SWIG_0(self, args);
           }
         }
       }
@@ -17151,15 +19876,15 @@ SWIGINTERN PyObject *_wrap_Builder_bitwise_and(PyObject *self, PyObject *args) {
   }
   
 fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_bitwise_and'.\n"
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_shl'.\n"
     "  Possible C/C++ prototypes are:\n"
-    "    Builder::bitwise_and(llvm::Value *,llvm::Value *,char const *)\n"
-    "    Builder::bitwise_and(llvm::Value *,llvm::Value *)\n");
+    "    Builder::shl(llvm::Value *,llvm::Value *,char const *)\n"
+    "    Builder::shl(llvm::Value *,llvm::Value *)\n");
   return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_bitwise_or__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_lshr__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
@@ -17180,28 +19905,28 @@ SWIGINTERN PyObject *_wrap_Builder_bitwise_or__SWIG_0(PyObject *SWIGUNUSEDPARM(s
   PyObject * obj3 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_bitwise_or",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_lshr",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_bitwise_or" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_lshr" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_bitwise_or" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_lshr" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
   res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_bitwise_or" "', argument " "3"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_lshr" "', argument " "3"" of type '" "llvm::Value *""'"); 
   }
   arg3 = reinterpret_cast< llvm::Value * >(argp3);
   res4 = SWIG_AsCharPtrAndSize(obj3, &buf4, NULL, &alloc4);
   if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_bitwise_or" "', argument " "4"" of type '" "char const *""'");
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_lshr" "', argument " "4"" of type '" "char const *""'");
   }
   arg4 = reinterpret_cast< char * >(buf4);
-  result = (llvm::Value *)(arg1)->bitwise_or(arg2,arg3,(char const *)arg4);
+  result = (llvm::Value *)(arg1)->lshr(arg2,arg3,(char const *)arg4);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
   return resultobj;
@@ -17211,7 +19936,7 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_bitwise_or__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_lshr__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
@@ -17227,23 +19952,23 @@ SWIGINTERN PyObject *_wrap_Builder_bitwise_or__SWIG_1(PyObject *SWIGUNUSEDPARM(s
   PyObject * obj2 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_bitwise_or",&obj0,&obj1,&obj2)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_lshr",&obj0,&obj1,&obj2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_bitwise_or" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_lshr" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_bitwise_or" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_lshr" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
   res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_bitwise_or" "', argument " "3"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_lshr" "', argument " "3"" of type '" "llvm::Value *""'"); 
   }
   arg3 = reinterpret_cast< llvm::Value * >(argp3);
-  result = (llvm::Value *)(arg1)->bitwise_or(arg2,arg3);
+  result = (llvm::Value *)(arg1)->lshr(arg2,arg3);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   return resultobj;
 fail:
@@ -17251,13 +19976,15 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_bitwise_or(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[5];
-  int ii;
+SWIGINTERN PyObject *_wrap_Builder_lshr(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 4) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
@@ -17275,7 +20002,7 @@ SWIGINTERN PyObject *_wrap_Builder_bitwise_or(PyObject *self, PyObject *args) {
         int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
         _v = SWIG_CheckState(res);
         if (_v) {
-          return _wrap_Builder_bitwise_or__SWIG_1(self, args);
+          return _wrap_Builder_lshr__SWIG_1(self, args);
         }
       }
     }
@@ -17297,7 +20024,7 @@ SWIGINTERN PyObject *_wrap_Builder_bitwise_or(PyObject *self, PyObject *args) {
           int res = SWIG_AsCharPtrAndSize(argv[3], 0, NULL, 0);
           _v = SWIG_CheckState(res);
           if (_v) {
-            return _wrap_Builder_bitwise_or__SWIG_0(self, args);
+            return _wrap_Builder_lshr__SWIG_0(self, args);
           }
         }
       }
@@ -17305,15 +20032,15 @@ SWIGINTERN PyObject *_wrap_Builder_bitwise_or(PyObject *self, PyObject *args) {
   }
   
 fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_bitwise_or'.\n"
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_lshr'.\n"
     "  Possible C/C++ prototypes are:\n"
-    "    Builder::bitwise_or(llvm::Value *,llvm::Value *,char const *)\n"
-    "    Builder::bitwise_or(llvm::Value *,llvm::Value *)\n");
+    "    Builder::lshr(llvm::Value *,llvm::Value *,char const *)\n"
+    "    Builder::lshr(llvm::Value *,llvm::Value *)\n");
   return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_bitwise_xor__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_ashr__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
@@ -17334,28 +20061,28 @@ SWIGINTERN PyObject *_wrap_Builder_bitwise_xor__SWIG_0(PyObject *SWIGUNUSEDPARM(
   PyObject * obj3 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_bitwise_xor",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_ashr",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_bitwise_xor" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_ashr" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_bitwise_xor" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_ashr" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
   res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_bitwise_xor" "', argument " "3"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_ashr" "', argument " "3"" of type '" "llvm::Value *""'"); 
   }
   arg3 = reinterpret_cast< llvm::Value * >(argp3);
   res4 = SWIG_AsCharPtrAndSize(obj3, &buf4, NULL, &alloc4);
   if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_bitwise_xor" "', argument " "4"" of type '" "char const *""'");
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_ashr" "', argument " "4"" of type '" "char const *""'");
   }
   arg4 = reinterpret_cast< char * >(buf4);
-  result = (llvm::Value *)(arg1)->bitwise_xor(arg2,arg3,(char const *)arg4);
+  result = (llvm::Value *)(arg1)->ashr(arg2,arg3,(char const *)arg4);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
   return resultobj;
@@ -17365,7 +20092,7 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_bitwise_xor__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_ashr__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
@@ -17381,23 +20108,23 @@ SWIGINTERN PyObject *_wrap_Builder_bitwise_xor__SWIG_1(PyObject *SWIGUNUSEDPARM(
   PyObject * obj2 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_bitwise_xor",&obj0,&obj1,&obj2)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_ashr",&obj0,&obj1,&obj2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_bitwise_xor" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_ashr" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_bitwise_xor" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_ashr" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
   res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_bitwise_xor" "', argument " "3"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_ashr" "', argument " "3"" of type '" "llvm::Value *""'"); 
   }
   arg3 = reinterpret_cast< llvm::Value * >(argp3);
-  result = (llvm::Value *)(arg1)->bitwise_xor(arg2,arg3);
+  result = (llvm::Value *)(arg1)->ashr(arg2,arg3);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   return resultobj;
 fail:
@@ -17405,13 +20132,15 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_bitwise_xor(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[5];
-  int ii;
+SWIGINTERN PyObject *_wrap_Builder_ashr(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 4) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
@@ -17429,7 +20158,7 @@ SWIGINTERN PyObject *_wrap_Builder_bitwise_xor(PyObject *self, PyObject *args) {
         int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
         _v = SWIG_CheckState(res);
         if (_v) {
-          return _wrap_Builder_bitwise_xor__SWIG_1(self, args);
+          return _wrap_Builder_ashr__SWIG_1(self, args);
         }
       }
     }
@@ -17451,7 +20180,7 @@ SWIGINTERN PyObject *_wrap_Builder_bitwise_xor(PyObject *self, PyObject *args) {
           int res = SWIG_AsCharPtrAndSize(argv[3], 0, NULL, 0);
           _v = SWIG_CheckState(res);
           if (_v) {
-            return _wrap_Builder_bitwise_xor__SWIG_0(self, args);
+            return _wrap_Builder_ashr__SWIG_0(self, args);
           }
         }
       }
@@ -17459,81 +20188,99 @@ SWIGINTERN PyObject *_wrap_Builder_bitwise_xor(PyObject *self, PyObject *args) {
   }
   
 fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_bitwise_xor'.\n"
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_ashr'.\n"
     "  Possible C/C++ prototypes are:\n"
-    "    Builder::bitwise_xor(llvm::Value *,llvm::Value *,char const *)\n"
-    "    Builder::bitwise_xor(llvm::Value *,llvm::Value *)\n");
+    "    Builder::ashr(llvm::Value *,llvm::Value *,char const *)\n"
+    "    Builder::ashr(llvm::Value *,llvm::Value *)\n");
   return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_bitwise_not__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_add__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
-  char *arg3 = (char *) 0 ;
+  llvm::Value *arg3 = (llvm::Value *) 0 ;
+  char *arg4 = (char *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   void *argp2 = 0 ;
   int res2 = 0 ;
-  int res3 ;
-  char *buf3 = 0 ;
-  int alloc3 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  int res4 ;
+  char *buf4 = 0 ;
+  int alloc4 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
+  PyObject * obj3 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_bitwise_not",&obj0,&obj1,&obj2)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_add",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_bitwise_not" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_add" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_bitwise_not" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_add" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
-  res3 = SWIG_AsCharPtrAndSize(obj2, &buf3, NULL, &alloc3);
+  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_bitwise_not" "', argument " "3"" of type '" "char const *""'");
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_add" "', argument " "3"" of type '" "llvm::Value *""'"); 
   }
-  arg3 = reinterpret_cast< char * >(buf3);
-  result = (llvm::Value *)(arg1)->bitwise_not(arg2,(char const *)arg3);
+  arg3 = reinterpret_cast< llvm::Value * >(argp3);
+  res4 = SWIG_AsCharPtrAndSize(obj3, &buf4, NULL, &alloc4);
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_add" "', argument " "4"" of type '" "char const *""'");
+  }
+  arg4 = reinterpret_cast< char * >(buf4);
+  result = (llvm::Value *)(arg1)->add(arg2,arg3,(char const *)arg4);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
-  if (alloc3 == SWIG_NEWOBJ) delete[] buf3;
+  if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
   return resultobj;
 fail:
-  if (alloc3 == SWIG_NEWOBJ) delete[] buf3;
+  if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_bitwise_not__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_add__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
+  llvm::Value *arg3 = (llvm::Value *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   void *argp2 = 0 ;
   int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:Builder_bitwise_not",&obj0,&obj1)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_add",&obj0,&obj1,&obj2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_bitwise_not" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_add" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_bitwise_not" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_add" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
-  result = (llvm::Value *)(arg1)->bitwise_not(arg2);
+  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_add" "', argument " "3"" of type '" "llvm::Value *""'"); 
+  }
+  arg3 = reinterpret_cast< llvm::Value * >(argp3);
+  result = (llvm::Value *)(arg1)->add(arg2,arg3);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   return resultobj;
 fail:
@@ -17541,17 +20288,19 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_bitwise_not(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[4];
-  int ii;
+SWIGINTERN PyObject *_wrap_Builder_add(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
-  for (ii = 0; (ii < 3) && (ii < argc); ii++) {
+  argc = args ? PyObject_Length(args) : 0;
+  for (ii = 0; (ii < 4) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
-  if (argc == 2) {
+  if (argc == 3) {
     int _v;
     void *vptr = 0;
     int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
@@ -17561,11 +20310,16 @@ SWIGINTERN PyObject *_wrap_Builder_bitwise_not(PyObject *self, PyObject *args) {
       int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Value, 0);
       _v = SWIG_CheckState(res);
       if (_v) {
-        return _wrap_Builder_bitwise_not__SWIG_1(self, args);
+        void *vptr = 0;
+        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
+        _v = SWIG_CheckState(res);
+        if (_v) {
+          return _wrap_Builder_add__SWIG_1(self, args);
+        }
       }
     }
   }
-  if (argc == 3) {
+  if (argc == 4) {
     int _v;
     void *vptr = 0;
     int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
@@ -17575,25 +20329,30 @@ SWIGINTERN PyObject *_wrap_Builder_bitwise_not(PyObject *self, PyObject *args) {
       int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Value, 0);
       _v = SWIG_CheckState(res);
       if (_v) {
-        int res = SWIG_AsCharPtrAndSize(argv[2], 0, NULL, 0);
+        void *vptr = 0;
+        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
         _v = SWIG_CheckState(res);
         if (_v) {
-          return _wrap_Builder_bitwise_not__SWIG_0(self, args);
+          int res = SWIG_AsCharPtrAndSize(argv[3], 0, NULL, 0);
+          _v = SWIG_CheckState(res);
+          if (_v) {
+            return _wrap_Builder_add__SWIG_0(self, args);
+          }
         }
       }
     }
   }
   
 fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_bitwise_not'.\n"
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_add'.\n"
     "  Possible C/C++ prototypes are:\n"
-    "    Builder::bitwise_not(llvm::Value *,char const *)\n"
-    "    Builder::bitwise_not(llvm::Value *)\n");
+    "    Builder::add(llvm::Value *,llvm::Value *,char const *)\n"
+    "    Builder::add(llvm::Value *,llvm::Value *)\n");
   return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_shl__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_sub__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
@@ -17614,28 +20373,28 @@ SWIGINTERN PyObject *_wrap_Builder_shl__SWIG_0(PyObject *SWIGUNUSEDPARM(self), P
   PyObject * obj3 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_shl",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_sub",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_shl" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_sub" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_shl" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_sub" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
   res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_shl" "', argument " "3"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_sub" "', argument " "3"" of type '" "llvm::Value *""'"); 
   }
   arg3 = reinterpret_cast< llvm::Value * >(argp3);
   res4 = SWIG_AsCharPtrAndSize(obj3, &buf4, NULL, &alloc4);
   if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_shl" "', argument " "4"" of type '" "char const *""'");
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_sub" "', argument " "4"" of type '" "char const *""'");
   }
   arg4 = reinterpret_cast< char * >(buf4);
-  result = (llvm::Value *)(arg1)->shl(arg2,arg3,(char const *)arg4);
+  result = (llvm::Value *)(arg1)->sub(arg2,arg3,(char const *)arg4);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
   return resultobj;
@@ -17645,7 +20404,7 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_shl__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_sub__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
@@ -17661,23 +20420,23 @@ SWIGINTERN PyObject *_wrap_Builder_shl__SWIG_1(PyObject *SWIGUNUSEDPARM(self), P
   PyObject * obj2 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_shl",&obj0,&obj1,&obj2)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_sub",&obj0,&obj1,&obj2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_shl" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_sub" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_shl" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_sub" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
   res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_shl" "', argument " "3"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_sub" "', argument " "3"" of type '" "llvm::Value *""'"); 
   }
   arg3 = reinterpret_cast< llvm::Value * >(argp3);
-  result = (llvm::Value *)(arg1)->shl(arg2,arg3);
+  result = (llvm::Value *)(arg1)->sub(arg2,arg3);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   return resultobj;
 fail:
@@ -17685,13 +20444,15 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_shl(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[5];
-  int ii;
+SWIGINTERN PyObject *_wrap_Builder_sub(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 4) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
@@ -17709,7 +20470,7 @@ SWIGINTERN PyObject *_wrap_Builder_shl(PyObject *self, PyObject *args) {
         int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
         _v = SWIG_CheckState(res);
         if (_v) {
-          return _wrap_Builder_shl__SWIG_1(self, args);
+          return _wrap_Builder_sub__SWIG_1(self, args);
         }
       }
     }
@@ -17731,7 +20492,7 @@ SWIGINTERN PyObject *_wrap_Builder_shl(PyObject *self, PyObject *args) {
           int res = SWIG_AsCharPtrAndSize(argv[3], 0, NULL, 0);
           _v = SWIG_CheckState(res);
           if (_v) {
-            return _wrap_Builder_shl__SWIG_0(self, args);
+            return _wrap_Builder_sub__SWIG_0(self, args);
           }
         }
       }
@@ -17739,15 +20500,15 @@ SWIGINTERN PyObject *_wrap_Builder_shl(PyObject *self, PyObject *args) {
   }
   
 fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_shl'.\n"
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_sub'.\n"
     "  Possible C/C++ prototypes are:\n"
-    "    Builder::shl(llvm::Value *,llvm::Value *,char const *)\n"
-    "    Builder::shl(llvm::Value *,llvm::Value *)\n");
+    "    Builder::sub(llvm::Value *,llvm::Value *,char const *)\n"
+    "    Builder::sub(llvm::Value *,llvm::Value *)\n");
   return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_lshr__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_mul__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
@@ -17768,28 +20529,28 @@ SWIGINTERN PyObject *_wrap_Builder_lshr__SWIG_0(PyObject *SWIGUNUSEDPARM(self),
   PyObject * obj3 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_lshr",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_mul",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_lshr" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_mul" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_lshr" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_mul" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
   res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_lshr" "', argument " "3"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_mul" "', argument " "3"" of type '" "llvm::Value *""'"); 
   }
   arg3 = reinterpret_cast< llvm::Value * >(argp3);
   res4 = SWIG_AsCharPtrAndSize(obj3, &buf4, NULL, &alloc4);
   if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_lshr" "', argument " "4"" of type '" "char const *""'");
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_mul" "', argument " "4"" of type '" "char const *""'");
   }
   arg4 = reinterpret_cast< char * >(buf4);
-  result = (llvm::Value *)(arg1)->lshr(arg2,arg3,(char const *)arg4);
+  result = (llvm::Value *)(arg1)->mul(arg2,arg3,(char const *)arg4);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
   return resultobj;
@@ -17799,7 +20560,7 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_lshr__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_mul__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
@@ -17815,23 +20576,23 @@ SWIGINTERN PyObject *_wrap_Builder_lshr__SWIG_1(PyObject *SWIGUNUSEDPARM(self),
   PyObject * obj2 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_lshr",&obj0,&obj1,&obj2)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_mul",&obj0,&obj1,&obj2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_lshr" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_mul" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_lshr" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_mul" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
   res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_lshr" "', argument " "3"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_mul" "', argument " "3"" of type '" "llvm::Value *""'"); 
   }
   arg3 = reinterpret_cast< llvm::Value * >(argp3);
-  result = (llvm::Value *)(arg1)->lshr(arg2,arg3);
+  result = (llvm::Value *)(arg1)->mul(arg2,arg3);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   return resultobj;
 fail:
@@ -17839,13 +20600,15 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_lshr(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[5];
-  int ii;
+SWIGINTERN PyObject *_wrap_Builder_mul(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 4) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
@@ -17863,7 +20626,7 @@ SWIGINTERN PyObject *_wrap_Builder_lshr(PyObject *self, PyObject *args) {
         int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
         _v = SWIG_CheckState(res);
         if (_v) {
-          return _wrap_Builder_lshr__SWIG_1(self, args);
+          return _wrap_Builder_mul__SWIG_1(self, args);
         }
       }
     }
@@ -17885,7 +20648,7 @@ SWIGINTERN PyObject *_wrap_Builder_lshr(PyObject *self, PyObject *args) {
           int res = SWIG_AsCharPtrAndSize(argv[3], 0, NULL, 0);
           _v = SWIG_CheckState(res);
           if (_v) {
-            return _wrap_Builder_lshr__SWIG_0(self, args);
+            return _wrap_Builder_mul__SWIG_0(self, args);
           }
         }
       }
@@ -17893,15 +20656,15 @@ SWIGINTERN PyObject *_wrap_Builder_lshr(PyObject *self, PyObject *args) {
   }
   
 fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_lshr'.\n"
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_mul'.\n"
     "  Possible C/C++ prototypes are:\n"
-    "    Builder::lshr(llvm::Value *,llvm::Value *,char const *)\n"
-    "    Builder::lshr(llvm::Value *,llvm::Value *)\n");
+    "    Builder::mul(llvm::Value *,llvm::Value *,char const *)\n"
+    "    Builder::mul(llvm::Value *,llvm::Value *)\n");
   return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_ashr__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_sdiv__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
@@ -17922,28 +20685,28 @@ SWIGINTERN PyObject *_wrap_Builder_ashr__SWIG_0(PyObject *SWIGUNUSEDPARM(self),
   PyObject * obj3 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_ashr",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_sdiv",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_ashr" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_sdiv" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_ashr" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_sdiv" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
   res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_ashr" "', argument " "3"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_sdiv" "', argument " "3"" of type '" "llvm::Value *""'"); 
   }
   arg3 = reinterpret_cast< llvm::Value * >(argp3);
   res4 = SWIG_AsCharPtrAndSize(obj3, &buf4, NULL, &alloc4);
   if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_ashr" "', argument " "4"" of type '" "char const *""'");
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_sdiv" "', argument " "4"" of type '" "char const *""'");
   }
   arg4 = reinterpret_cast< char * >(buf4);
-  result = (llvm::Value *)(arg1)->ashr(arg2,arg3,(char const *)arg4);
+  result = (llvm::Value *)(arg1)->sdiv(arg2,arg3,(char const *)arg4);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
   return resultobj;
@@ -17953,7 +20716,7 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_ashr__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_sdiv__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
@@ -17969,23 +20732,23 @@ SWIGINTERN PyObject *_wrap_Builder_ashr__SWIG_1(PyObject *SWIGUNUSEDPARM(self),
   PyObject * obj2 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_ashr",&obj0,&obj1,&obj2)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_sdiv",&obj0,&obj1,&obj2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_ashr" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_sdiv" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_ashr" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_sdiv" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
   res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_ashr" "', argument " "3"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_sdiv" "', argument " "3"" of type '" "llvm::Value *""'"); 
   }
   arg3 = reinterpret_cast< llvm::Value * >(argp3);
-  result = (llvm::Value *)(arg1)->ashr(arg2,arg3);
+  result = (llvm::Value *)(arg1)->sdiv(arg2,arg3);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   return resultobj;
 fail:
@@ -17993,13 +20756,15 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_ashr(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[5];
-  int ii;
+SWIGINTERN PyObject *_wrap_Builder_sdiv(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 4) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
@@ -18017,7 +20782,7 @@ SWIGINTERN PyObject *_wrap_Builder_ashr(PyObject *self, PyObject *args) {
         int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
         _v = SWIG_CheckState(res);
         if (_v) {
-          return _wrap_Builder_ashr__SWIG_1(self, args);
+          return _wrap_Builder_sdiv__SWIG_1(self, args);
         }
       }
     }
@@ -18039,7 +20804,7 @@ SWIGINTERN PyObject *_wrap_Builder_ashr(PyObject *self, PyObject *args) {
           int res = SWIG_AsCharPtrAndSize(argv[3], 0, NULL, 0);
           _v = SWIG_CheckState(res);
           if (_v) {
-            return _wrap_Builder_ashr__SWIG_0(self, args);
+            return _wrap_Builder_sdiv__SWIG_0(self, args);
           }
         }
       }
@@ -18047,15 +20812,15 @@ SWIGINTERN PyObject *_wrap_Builder_ashr(PyObject *self, PyObject *args) {
   }
   
 fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_ashr'.\n"
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_sdiv'.\n"
     "  Possible C/C++ prototypes are:\n"
-    "    Builder::ashr(llvm::Value *,llvm::Value *,char const *)\n"
-    "    Builder::ashr(llvm::Value *,llvm::Value *)\n");
+    "    Builder::sdiv(llvm::Value *,llvm::Value *,char const *)\n"
+    "    Builder::sdiv(llvm::Value *,llvm::Value *)\n");
   return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_add__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_udiv__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
@@ -18076,28 +20841,28 @@ SWIGINTERN PyObject *_wrap_Builder_add__SWIG_0(PyObject *SWIGUNUSEDPARM(self), P
   PyObject * obj3 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_add",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_udiv",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_add" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_udiv" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_add" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_udiv" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
   res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_add" "', argument " "3"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_udiv" "', argument " "3"" of type '" "llvm::Value *""'"); 
   }
   arg3 = reinterpret_cast< llvm::Value * >(argp3);
   res4 = SWIG_AsCharPtrAndSize(obj3, &buf4, NULL, &alloc4);
   if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_add" "', argument " "4"" of type '" "char const *""'");
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_udiv" "', argument " "4"" of type '" "char const *""'");
   }
   arg4 = reinterpret_cast< char * >(buf4);
-  result = (llvm::Value *)(arg1)->add(arg2,arg3,(char const *)arg4);
+  result = (llvm::Value *)(arg1)->udiv(arg2,arg3,(char const *)arg4);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
   return resultobj;
@@ -18107,7 +20872,7 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_add__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_udiv__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
@@ -18123,23 +20888,23 @@ SWIGINTERN PyObject *_wrap_Builder_add__SWIG_1(PyObject *SWIGUNUSEDPARM(self), P
   PyObject * obj2 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_add",&obj0,&obj1,&obj2)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_udiv",&obj0,&obj1,&obj2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_add" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_udiv" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_add" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_udiv" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
   res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_add" "', argument " "3"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_udiv" "', argument " "3"" of type '" "llvm::Value *""'"); 
   }
   arg3 = reinterpret_cast< llvm::Value * >(argp3);
-  result = (llvm::Value *)(arg1)->add(arg2,arg3);
+  result = (llvm::Value *)(arg1)->udiv(arg2,arg3);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   return resultobj;
 fail:
@@ -18147,13 +20912,15 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_add(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[5];
-  int ii;
+SWIGINTERN PyObject *_wrap_Builder_udiv(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 4) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
@@ -18171,7 +20938,7 @@ SWIGINTERN PyObject *_wrap_Builder_add(PyObject *self, PyObject *args) {
         int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
         _v = SWIG_CheckState(res);
         if (_v) {
-          return _wrap_Builder_add__SWIG_1(self, args);
+          return _wrap_Builder_udiv__SWIG_1(self, args);
         }
       }
     }
@@ -18193,7 +20960,7 @@ SWIGINTERN PyObject *_wrap_Builder_add(PyObject *self, PyObject *args) {
           int res = SWIG_AsCharPtrAndSize(argv[3], 0, NULL, 0);
           _v = SWIG_CheckState(res);
           if (_v) {
-            return _wrap_Builder_add__SWIG_0(self, args);
+            return _wrap_Builder_udiv__SWIG_0(self, args);
           }
         }
       }
@@ -18201,15 +20968,15 @@ SWIGINTERN PyObject *_wrap_Builder_add(PyObject *self, PyObject *args) {
   }
   
 fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_add'.\n"
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_udiv'.\n"
     "  Possible C/C++ prototypes are:\n"
-    "    Builder::add(llvm::Value *,llvm::Value *,char const *)\n"
-    "    Builder::add(llvm::Value *,llvm::Value *)\n");
+    "    Builder::udiv(llvm::Value *,llvm::Value *,char const *)\n"
+    "    Builder::udiv(llvm::Value *,llvm::Value *)\n");
   return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_sub__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_umod__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
@@ -18230,28 +20997,28 @@ SWIGINTERN PyObject *_wrap_Builder_sub__SWIG_0(PyObject *SWIGUNUSEDPARM(self), P
   PyObject * obj3 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_sub",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_umod",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_sub" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_umod" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_sub" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_umod" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
   res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_sub" "', argument " "3"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_umod" "', argument " "3"" of type '" "llvm::Value *""'"); 
   }
   arg3 = reinterpret_cast< llvm::Value * >(argp3);
   res4 = SWIG_AsCharPtrAndSize(obj3, &buf4, NULL, &alloc4);
   if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_sub" "', argument " "4"" of type '" "char const *""'");
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_umod" "', argument " "4"" of type '" "char const *""'");
   }
   arg4 = reinterpret_cast< char * >(buf4);
-  result = (llvm::Value *)(arg1)->sub(arg2,arg3,(char const *)arg4);
+  result = (llvm::Value *)(arg1)->umod(arg2,arg3,(char const *)arg4);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
   return resultobj;
@@ -18261,7 +21028,7 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_sub__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_umod__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
@@ -18277,23 +21044,23 @@ SWIGINTERN PyObject *_wrap_Builder_sub__SWIG_1(PyObject *SWIGUNUSEDPARM(self), P
   PyObject * obj2 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_sub",&obj0,&obj1,&obj2)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_umod",&obj0,&obj1,&obj2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_sub" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_umod" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_sub" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_umod" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
   res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_sub" "', argument " "3"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_umod" "', argument " "3"" of type '" "llvm::Value *""'"); 
   }
   arg3 = reinterpret_cast< llvm::Value * >(argp3);
-  result = (llvm::Value *)(arg1)->sub(arg2,arg3);
+  result = (llvm::Value *)(arg1)->umod(arg2,arg3);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   return resultobj;
 fail:
@@ -18301,13 +21068,15 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_sub(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[5];
-  int ii;
+SWIGINTERN PyObject *_wrap_Builder_umod(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 4) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
@@ -18325,7 +21094,7 @@ SWIGINTERN PyObject *_wrap_Builder_sub(PyObject *self, PyObject *args) {
         int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
         _v = SWIG_CheckState(res);
         if (_v) {
-          return _wrap_Builder_sub__SWIG_1(self, args);
+          return _wrap_Builder_umod__SWIG_1(self, args);
         }
       }
     }
@@ -18347,7 +21116,7 @@ SWIGINTERN PyObject *_wrap_Builder_sub(PyObject *self, PyObject *args) {
           int res = SWIG_AsCharPtrAndSize(argv[3], 0, NULL, 0);
           _v = SWIG_CheckState(res);
           if (_v) {
-            return _wrap_Builder_sub__SWIG_0(self, args);
+            return _wrap_Builder_umod__SWIG_0(self, args);
           }
         }
       }
@@ -18355,15 +21124,15 @@ SWIGINTERN PyObject *_wrap_Builder_sub(PyObject *self, PyObject *args) {
   }
   
 fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_sub'.\n"
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_umod'.\n"
     "  Possible C/C++ prototypes are:\n"
-    "    Builder::sub(llvm::Value *,llvm::Value *,char const *)\n"
-    "    Builder::sub(llvm::Value *,llvm::Value *)\n");
+    "    Builder::umod(llvm::Value *,llvm::Value *,char const *)\n"
+    "    Builder::umod(llvm::Value *,llvm::Value *)\n");
   return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_mul__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_smod__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
@@ -18384,28 +21153,28 @@ SWIGINTERN PyObject *_wrap_Builder_mul__SWIG_0(PyObject *SWIGUNUSEDPARM(self), P
   PyObject * obj3 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_mul",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_smod",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_mul" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_smod" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_mul" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_smod" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
   res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_mul" "', argument " "3"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_smod" "', argument " "3"" of type '" "llvm::Value *""'"); 
   }
   arg3 = reinterpret_cast< llvm::Value * >(argp3);
   res4 = SWIG_AsCharPtrAndSize(obj3, &buf4, NULL, &alloc4);
   if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_mul" "', argument " "4"" of type '" "char const *""'");
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_smod" "', argument " "4"" of type '" "char const *""'");
   }
   arg4 = reinterpret_cast< char * >(buf4);
-  result = (llvm::Value *)(arg1)->mul(arg2,arg3,(char const *)arg4);
+  result = (llvm::Value *)(arg1)->smod(arg2,arg3,(char const *)arg4);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
   return resultobj;
@@ -18415,7 +21184,7 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_mul__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_smod__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
@@ -18431,23 +21200,23 @@ SWIGINTERN PyObject *_wrap_Builder_mul__SWIG_1(PyObject *SWIGUNUSEDPARM(self), P
   PyObject * obj2 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_mul",&obj0,&obj1,&obj2)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_smod",&obj0,&obj1,&obj2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_mul" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_smod" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_mul" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_smod" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
   res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_mul" "', argument " "3"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_smod" "', argument " "3"" of type '" "llvm::Value *""'"); 
   }
   arg3 = reinterpret_cast< llvm::Value * >(argp3);
-  result = (llvm::Value *)(arg1)->mul(arg2,arg3);
+  result = (llvm::Value *)(arg1)->smod(arg2,arg3);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   return resultobj;
 fail:
@@ -18455,13 +21224,15 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_mul(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[5];
-  int ii;
+SWIGINTERN PyObject *_wrap_Builder_smod(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 4) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
@@ -18479,7 +21250,7 @@ SWIGINTERN PyObject *_wrap_Builder_mul(PyObject *self, PyObject *args) {
         int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
         _v = SWIG_CheckState(res);
         if (_v) {
-          return _wrap_Builder_mul__SWIG_1(self, args);
+          return _wrap_Builder_smod__SWIG_1(self, args);
         }
       }
     }
@@ -18501,7 +21272,7 @@ SWIGINTERN PyObject *_wrap_Builder_mul(PyObject *self, PyObject *args) {
           int res = SWIG_AsCharPtrAndSize(argv[3], 0, NULL, 0);
           _v = SWIG_CheckState(res);
           if (_v) {
-            return _wrap_Builder_mul__SWIG_0(self, args);
+            return _wrap_Builder_smod__SWIG_0(self, args);
           }
         }
       }
@@ -18509,99 +21280,117 @@ SWIGINTERN PyObject *_wrap_Builder_mul(PyObject *self, PyObject *args) {
   }
   
 fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_mul'.\n"
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_smod'.\n"
     "  Possible C/C++ prototypes are:\n"
-    "    Builder::mul(llvm::Value *,llvm::Value *,char const *)\n"
-    "    Builder::mul(llvm::Value *,llvm::Value *)\n");
+    "    Builder::smod(llvm::Value *,llvm::Value *,char const *)\n"
+    "    Builder::smod(llvm::Value *,llvm::Value *)\n");
   return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_sdiv__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_icmp__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
-  llvm::Value *arg2 = (llvm::Value *) 0 ;
+  int arg2 ;
   llvm::Value *arg3 = (llvm::Value *) 0 ;
-  char *arg4 = (char *) 0 ;
+  llvm::Value *arg4 = (llvm::Value *) 0 ;
+  char *arg5 = (char *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
   void *argp3 = 0 ;
   int res3 = 0 ;
-  int res4 ;
-  char *buf4 = 0 ;
-  int alloc4 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
+  int res5 ;
+  char *buf5 = 0 ;
+  int alloc5 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
   PyObject * obj3 = 0 ;
+  PyObject * obj4 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_sdiv",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOOO:Builder_icmp",&obj0,&obj1,&obj2,&obj3,&obj4)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_sdiv" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_icmp" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_sdiv" "', argument " "2"" of type '" "llvm::Value *""'"); 
-  }
-  arg2 = reinterpret_cast< llvm::Value * >(argp2);
+  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "Builder_icmp" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = static_cast< int >(val2);
   res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_sdiv" "', argument " "3"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_icmp" "', argument " "3"" of type '" "llvm::Value *""'"); 
   }
   arg3 = reinterpret_cast< llvm::Value * >(argp3);
-  res4 = SWIG_AsCharPtrAndSize(obj3, &buf4, NULL, &alloc4);
+  res4 = SWIG_ConvertPtr(obj3, &argp4,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_sdiv" "', argument " "4"" of type '" "char const *""'");
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_icmp" "', argument " "4"" of type '" "llvm::Value *""'"); 
   }
-  arg4 = reinterpret_cast< char * >(buf4);
-  result = (llvm::Value *)(arg1)->sdiv(arg2,arg3,(char const *)arg4);
+  arg4 = reinterpret_cast< llvm::Value * >(argp4);
+  res5 = SWIG_AsCharPtrAndSize(obj4, &buf5, NULL, &alloc5);
+  if (!SWIG_IsOK(res5)) {
+    SWIG_exception_fail(SWIG_ArgError(res5), "in method '" "Builder_icmp" "', argument " "5"" of type '" "char const *""'");
+  }
+  arg5 = reinterpret_cast< char * >(buf5);
+  result = (llvm::Value *)(arg1)->icmp(arg2,arg3,arg4,(char const *)arg5);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
-  if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
+  if (alloc5 == SWIG_NEWOBJ) delete[] buf5;
   return resultobj;
 fail:
-  if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
+  if (alloc5 == SWIG_NEWOBJ) delete[] buf5;
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_sdiv__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_icmp__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
-  llvm::Value *arg2 = (llvm::Value *) 0 ;
+  int arg2 ;
   llvm::Value *arg3 = (llvm::Value *) 0 ;
+  llvm::Value *arg4 = (llvm::Value *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
   void *argp3 = 0 ;
   int res3 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
+  PyObject * obj3 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_sdiv",&obj0,&obj1,&obj2)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_icmp",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_sdiv" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_icmp" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_sdiv" "', argument " "2"" of type '" "llvm::Value *""'"); 
-  }
-  arg2 = reinterpret_cast< llvm::Value * >(argp2);
+  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "Builder_icmp" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = static_cast< int >(val2);
   res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_sdiv" "', argument " "3"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_icmp" "', argument " "3"" of type '" "llvm::Value *""'"); 
   }
   arg3 = reinterpret_cast< llvm::Value * >(argp3);
-  result = (llvm::Value *)(arg1)->sdiv(arg2,arg3);
+  res4 = SWIG_ConvertPtr(obj3, &argp4,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_icmp" "', argument " "4"" of type '" "llvm::Value *""'"); 
+  }
+  arg4 = reinterpret_cast< llvm::Value * >(argp4);
+  result = (llvm::Value *)(arg1)->icmp(arg2,arg3,arg4);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   return resultobj;
 fail:
@@ -18609,53 +21398,67 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_sdiv(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[5];
-  int ii;
+SWIGINTERN PyObject *_wrap_Builder_icmp(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[6] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
-  for (ii = 0; (ii < 4) && (ii < argc); ii++) {
+  argc = args ? PyObject_Length(args) : 0;
+  for (ii = 0; (ii < 5) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
-  if (argc == 3) {
+  if (argc == 4) {
     int _v;
     void *vptr = 0;
     int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
     _v = SWIG_CheckState(res);
     if (_v) {
-      void *vptr = 0;
-      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Value, 0);
-      _v = SWIG_CheckState(res);
+      {
+        int res = SWIG_AsVal_int(argv[1], NULL);
+        _v = SWIG_CheckState(res);
+      }
       if (_v) {
         void *vptr = 0;
         int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
         _v = SWIG_CheckState(res);
         if (_v) {
-          return _wrap_Builder_sdiv__SWIG_1(self, args);
+          void *vptr = 0;
+          int res = SWIG_ConvertPtr(argv[3], &vptr, SWIGTYPE_p_llvm__Value, 0);
+          _v = SWIG_CheckState(res);
+          if (_v) {
+            return _wrap_Builder_icmp__SWIG_1(self, args);
+          }
         }
       }
     }
   }
-  if (argc == 4) {
+  if (argc == 5) {
     int _v;
     void *vptr = 0;
     int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
     _v = SWIG_CheckState(res);
     if (_v) {
-      void *vptr = 0;
-      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Value, 0);
-      _v = SWIG_CheckState(res);
+      {
+        int res = SWIG_AsVal_int(argv[1], NULL);
+        _v = SWIG_CheckState(res);
+      }
       if (_v) {
         void *vptr = 0;
         int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
         _v = SWIG_CheckState(res);
         if (_v) {
-          int res = SWIG_AsCharPtrAndSize(argv[3], 0, NULL, 0);
+          void *vptr = 0;
+          int res = SWIG_ConvertPtr(argv[3], &vptr, SWIGTYPE_p_llvm__Value, 0);
           _v = SWIG_CheckState(res);
           if (_v) {
-            return _wrap_Builder_sdiv__SWIG_0(self, args);
+            int res = SWIG_AsCharPtrAndSize(argv[4], 0, NULL, 0);
+            _v = SWIG_CheckState(res);
+            if (_v) {
+              return _wrap_Builder_icmp__SWIG_0(self, args);
+            }
           }
         }
       }
@@ -18663,99 +21466,81 @@ SWIGINTERN PyObject *_wrap_Builder_sdiv(PyObject *self, PyObject *args) {
   }
   
 fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_sdiv'.\n"
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_icmp'.\n"
     "  Possible C/C++ prototypes are:\n"
-    "    Builder::sdiv(llvm::Value *,llvm::Value *,char const *)\n"
-    "    Builder::sdiv(llvm::Value *,llvm::Value *)\n");
+    "    Builder::icmp(int,llvm::Value *,llvm::Value *,char const *)\n"
+    "    Builder::icmp(int,llvm::Value *,llvm::Value *)\n");
   return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_udiv__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_negative__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
-  llvm::Value *arg3 = (llvm::Value *) 0 ;
-  char *arg4 = (char *) 0 ;
+  char *arg3 = (char *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   void *argp2 = 0 ;
   int res2 = 0 ;
-  void *argp3 = 0 ;
-  int res3 = 0 ;
-  int res4 ;
-  char *buf4 = 0 ;
-  int alloc4 = 0 ;
+  int res3 ;
+  char *buf3 = 0 ;
+  int alloc3 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
-  PyObject * obj3 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_udiv",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_negative",&obj0,&obj1,&obj2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_udiv" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_negative" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_udiv" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_negative" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
-  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  res3 = SWIG_AsCharPtrAndSize(obj2, &buf3, NULL, &alloc3);
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_udiv" "', argument " "3"" of type '" "llvm::Value *""'"); 
-  }
-  arg3 = reinterpret_cast< llvm::Value * >(argp3);
-  res4 = SWIG_AsCharPtrAndSize(obj3, &buf4, NULL, &alloc4);
-  if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_udiv" "', argument " "4"" of type '" "char const *""'");
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_negative" "', argument " "3"" of type '" "char const *""'");
   }
-  arg4 = reinterpret_cast< char * >(buf4);
-  result = (llvm::Value *)(arg1)->udiv(arg2,arg3,(char const *)arg4);
+  arg3 = reinterpret_cast< char * >(buf3);
+  result = (llvm::Value *)(arg1)->negative(arg2,(char const *)arg3);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
-  if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
+  if (alloc3 == SWIG_NEWOBJ) delete[] buf3;
   return resultobj;
 fail:
-  if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
+  if (alloc3 == SWIG_NEWOBJ) delete[] buf3;
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_udiv__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_negative__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
-  llvm::Value *arg3 = (llvm::Value *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   void *argp2 = 0 ;
   int res2 = 0 ;
-  void *argp3 = 0 ;
-  int res3 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
-  PyObject * obj2 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_udiv",&obj0,&obj1,&obj2)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OO:Builder_negative",&obj0,&obj1)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_udiv" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_negative" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_udiv" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_negative" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
-  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
-  if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_udiv" "', argument " "3"" of type '" "llvm::Value *""'"); 
-  }
-  arg3 = reinterpret_cast< llvm::Value * >(argp3);
-  result = (llvm::Value *)(arg1)->udiv(arg2,arg3);
+  result = (llvm::Value *)(arg1)->negative(arg2);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   return resultobj;
 fail:
@@ -18763,17 +21548,19 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_udiv(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[5];
-  int ii;
+SWIGINTERN PyObject *_wrap_Builder_negative(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[4] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
-  for (ii = 0; (ii < 4) && (ii < argc); ii++) {
+  argc = args ? PyObject_Length(args) : 0;
+  for (ii = 0; (ii < 3) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
-  if (argc == 3) {
+  if (argc == 2) {
     int _v;
     void *vptr = 0;
     int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
@@ -18783,16 +21570,11 @@ SWIGINTERN PyObject *_wrap_Builder_udiv(PyObject *self, PyObject *args) {
       int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Value, 0);
       _v = SWIG_CheckState(res);
       if (_v) {
-        void *vptr = 0;
-        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
-        _v = SWIG_CheckState(res);
-        if (_v) {
-          return _wrap_Builder_udiv__SWIG_1(self, args);
-        }
+        return _wrap_Builder_negative__SWIG_1(self, args);
       }
     }
   }
-  if (argc == 4) {
+  if (argc == 3) {
     int _v;
     void *vptr = 0;
     int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
@@ -18802,30 +21584,25 @@ SWIGINTERN PyObject *_wrap_Builder_udiv(PyObject *self, PyObject *args) {
       int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Value, 0);
       _v = SWIG_CheckState(res);
       if (_v) {
-        void *vptr = 0;
-        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
+        int res = SWIG_AsCharPtrAndSize(argv[2], 0, NULL, 0);
         _v = SWIG_CheckState(res);
         if (_v) {
-          int res = SWIG_AsCharPtrAndSize(argv[3], 0, NULL, 0);
-          _v = SWIG_CheckState(res);
-          if (_v) {
-            return _wrap_Builder_udiv__SWIG_0(self, args);
-          }
+          return _wrap_Builder_negative__SWIG_0(self, args);
         }
       }
     }
   }
   
 fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_udiv'.\n"
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_negative'.\n"
     "  Possible C/C++ prototypes are:\n"
-    "    Builder::udiv(llvm::Value *,llvm::Value *,char const *)\n"
-    "    Builder::udiv(llvm::Value *,llvm::Value *)\n");
+    "    Builder::negative(llvm::Value *,char const *)\n"
+    "    Builder::negative(llvm::Value *)\n");
   return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_umod__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_fadd__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
@@ -18846,28 +21623,28 @@ SWIGINTERN PyObject *_wrap_Builder_umod__SWIG_0(PyObject *SWIGUNUSEDPARM(self),
   PyObject * obj3 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_umod",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_fadd",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_umod" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_fadd" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_umod" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_fadd" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
   res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_umod" "', argument " "3"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_fadd" "', argument " "3"" of type '" "llvm::Value *""'"); 
   }
   arg3 = reinterpret_cast< llvm::Value * >(argp3);
   res4 = SWIG_AsCharPtrAndSize(obj3, &buf4, NULL, &alloc4);
   if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_umod" "', argument " "4"" of type '" "char const *""'");
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_fadd" "', argument " "4"" of type '" "char const *""'");
   }
   arg4 = reinterpret_cast< char * >(buf4);
-  result = (llvm::Value *)(arg1)->umod(arg2,arg3,(char const *)arg4);
+  result = (llvm::Value *)(arg1)->fadd(arg2,arg3,(char const *)arg4);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
   return resultobj;
@@ -18877,7 +21654,7 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_umod__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_fadd__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
@@ -18893,23 +21670,23 @@ SWIGINTERN PyObject *_wrap_Builder_umod__SWIG_1(PyObject *SWIGUNUSEDPARM(self),
   PyObject * obj2 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_umod",&obj0,&obj1,&obj2)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_fadd",&obj0,&obj1,&obj2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_umod" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_fadd" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_umod" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_fadd" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
   res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_umod" "', argument " "3"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_fadd" "', argument " "3"" of type '" "llvm::Value *""'"); 
   }
   arg3 = reinterpret_cast< llvm::Value * >(argp3);
-  result = (llvm::Value *)(arg1)->umod(arg2,arg3);
+  result = (llvm::Value *)(arg1)->fadd(arg2,arg3);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   return resultobj;
 fail:
@@ -18917,13 +21694,15 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_umod(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[5];
-  int ii;
+SWIGINTERN PyObject *_wrap_Builder_fadd(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 4) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
@@ -18941,7 +21720,7 @@ SWIGINTERN PyObject *_wrap_Builder_umod(PyObject *self, PyObject *args) {
         int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
         _v = SWIG_CheckState(res);
         if (_v) {
-          return _wrap_Builder_umod__SWIG_1(self, args);
+          return _wrap_Builder_fadd__SWIG_1(self, args);
         }
       }
     }
@@ -18963,7 +21742,7 @@ SWIGINTERN PyObject *_wrap_Builder_umod(PyObject *self, PyObject *args) {
           int res = SWIG_AsCharPtrAndSize(argv[3], 0, NULL, 0);
           _v = SWIG_CheckState(res);
           if (_v) {
-            return _wrap_Builder_umod__SWIG_0(self, args);
+            return _wrap_Builder_fadd__SWIG_0(self, args);
           }
         }
       }
@@ -18971,15 +21750,15 @@ SWIGINTERN PyObject *_wrap_Builder_umod(PyObject *self, PyObject *args) {
   }
   
 fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_umod'.\n"
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_fadd'.\n"
     "  Possible C/C++ prototypes are:\n"
-    "    Builder::umod(llvm::Value *,llvm::Value *,char const *)\n"
-    "    Builder::umod(llvm::Value *,llvm::Value *)\n");
+    "    Builder::fadd(llvm::Value *,llvm::Value *,char const *)\n"
+    "    Builder::fadd(llvm::Value *,llvm::Value *)\n");
   return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_smod__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_fsub__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
@@ -19000,28 +21779,28 @@ SWIGINTERN PyObject *_wrap_Builder_smod__SWIG_0(PyObject *SWIGUNUSEDPARM(self),
   PyObject * obj3 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_smod",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_fsub",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_smod" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_fsub" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_smod" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_fsub" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
   res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_smod" "', argument " "3"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_fsub" "', argument " "3"" of type '" "llvm::Value *""'"); 
   }
   arg3 = reinterpret_cast< llvm::Value * >(argp3);
   res4 = SWIG_AsCharPtrAndSize(obj3, &buf4, NULL, &alloc4);
   if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_smod" "', argument " "4"" of type '" "char const *""'");
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_fsub" "', argument " "4"" of type '" "char const *""'");
   }
   arg4 = reinterpret_cast< char * >(buf4);
-  result = (llvm::Value *)(arg1)->smod(arg2,arg3,(char const *)arg4);
+  result = (llvm::Value *)(arg1)->fsub(arg2,arg3,(char const *)arg4);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
   return resultobj;
@@ -19031,7 +21810,7 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_smod__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_fsub__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
@@ -19047,23 +21826,23 @@ SWIGINTERN PyObject *_wrap_Builder_smod__SWIG_1(PyObject *SWIGUNUSEDPARM(self),
   PyObject * obj2 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_smod",&obj0,&obj1,&obj2)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_fsub",&obj0,&obj1,&obj2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_smod" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_fsub" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_smod" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_fsub" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
   res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_smod" "', argument " "3"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_fsub" "', argument " "3"" of type '" "llvm::Value *""'"); 
   }
   arg3 = reinterpret_cast< llvm::Value * >(argp3);
-  result = (llvm::Value *)(arg1)->smod(arg2,arg3);
+  result = (llvm::Value *)(arg1)->fsub(arg2,arg3);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   return resultobj;
 fail:
@@ -19071,13 +21850,15 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_smod(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[5];
-  int ii;
+SWIGINTERN PyObject *_wrap_Builder_fsub(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 4) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
@@ -19095,7 +21876,7 @@ SWIGINTERN PyObject *_wrap_Builder_smod(PyObject *self, PyObject *args) {
         int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
         _v = SWIG_CheckState(res);
         if (_v) {
-          return _wrap_Builder_smod__SWIG_1(self, args);
+          return _wrap_Builder_fsub__SWIG_1(self, args);
         }
       }
     }
@@ -19117,7 +21898,7 @@ SWIGINTERN PyObject *_wrap_Builder_smod(PyObject *self, PyObject *args) {
           int res = SWIG_AsCharPtrAndSize(argv[3], 0, NULL, 0);
           _v = SWIG_CheckState(res);
           if (_v) {
-            return _wrap_Builder_smod__SWIG_0(self, args);
+            return _wrap_Builder_fsub__SWIG_0(self, args);
           }
         }
       }
@@ -19125,117 +21906,99 @@ SWIGINTERN PyObject *_wrap_Builder_smod(PyObject *self, PyObject *args) {
   }
   
 fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_smod'.\n"
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_fsub'.\n"
     "  Possible C/C++ prototypes are:\n"
-    "    Builder::smod(llvm::Value *,llvm::Value *,char const *)\n"
-    "    Builder::smod(llvm::Value *,llvm::Value *)\n");
+    "    Builder::fsub(llvm::Value *,llvm::Value *,char const *)\n"
+    "    Builder::fsub(llvm::Value *,llvm::Value *)\n");
   return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_icmp__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_fmul__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
-  int arg2 ;
+  llvm::Value *arg2 = (llvm::Value *) 0 ;
   llvm::Value *arg3 = (llvm::Value *) 0 ;
-  llvm::Value *arg4 = (llvm::Value *) 0 ;
-  char *arg5 = (char *) 0 ;
+  char *arg4 = (char *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  int val2 ;
-  int ecode2 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
   void *argp3 = 0 ;
   int res3 = 0 ;
-  void *argp4 = 0 ;
-  int res4 = 0 ;
-  int res5 ;
-  char *buf5 = 0 ;
-  int alloc5 = 0 ;
+  int res4 ;
+  char *buf4 = 0 ;
+  int alloc4 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
   PyObject * obj3 = 0 ;
-  PyObject * obj4 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOOO:Builder_icmp",&obj0,&obj1,&obj2,&obj3,&obj4)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_fmul",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_icmp" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_fmul" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
-  ecode2 = SWIG_AsVal_int(obj1, &val2);
-  if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "Builder_icmp" "', argument " "2"" of type '" "int""'");
-  } 
-  arg2 = static_cast< int >(val2);
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_fmul" "', argument " "2"" of type '" "llvm::Value *""'"); 
+  }
+  arg2 = reinterpret_cast< llvm::Value * >(argp2);
   res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_icmp" "', argument " "3"" of type '" "llvm::Value *""'"); 
-  }
-  arg3 = reinterpret_cast< llvm::Value * >(argp3);
-  res4 = SWIG_ConvertPtr(obj3, &argp4,SWIGTYPE_p_llvm__Value, 0 |  0 );
-  if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_icmp" "', argument " "4"" of type '" "llvm::Value *""'"); 
-  }
-  arg4 = reinterpret_cast< llvm::Value * >(argp4);
-  res5 = SWIG_AsCharPtrAndSize(obj4, &buf5, NULL, &alloc5);
-  if (!SWIG_IsOK(res5)) {
-    SWIG_exception_fail(SWIG_ArgError(res5), "in method '" "Builder_icmp" "', argument " "5"" of type '" "char const *""'");
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_fmul" "', argument " "3"" of type '" "llvm::Value *""'"); 
   }
-  arg5 = reinterpret_cast< char * >(buf5);
-  result = (llvm::Value *)(arg1)->icmp(arg2,arg3,arg4,(char const *)arg5);
+  arg3 = reinterpret_cast< llvm::Value * >(argp3);
+  res4 = SWIG_AsCharPtrAndSize(obj3, &buf4, NULL, &alloc4);
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_fmul" "', argument " "4"" of type '" "char const *""'");
+  }
+  arg4 = reinterpret_cast< char * >(buf4);
+  result = (llvm::Value *)(arg1)->fmul(arg2,arg3,(char const *)arg4);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
-  if (alloc5 == SWIG_NEWOBJ) delete[] buf5;
+  if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
   return resultobj;
 fail:
-  if (alloc5 == SWIG_NEWOBJ) delete[] buf5;
+  if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_icmp__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_fmul__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
-  int arg2 ;
+  llvm::Value *arg2 = (llvm::Value *) 0 ;
   llvm::Value *arg3 = (llvm::Value *) 0 ;
-  llvm::Value *arg4 = (llvm::Value *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  int val2 ;
-  int ecode2 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
   void *argp3 = 0 ;
   int res3 = 0 ;
-  void *argp4 = 0 ;
-  int res4 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
-  PyObject * obj3 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_icmp",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_fmul",&obj0,&obj1,&obj2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_icmp" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_fmul" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
-  ecode2 = SWIG_AsVal_int(obj1, &val2);
-  if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "Builder_icmp" "', argument " "2"" of type '" "int""'");
-  } 
-  arg2 = static_cast< int >(val2);
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_fmul" "', argument " "2"" of type '" "llvm::Value *""'"); 
+  }
+  arg2 = reinterpret_cast< llvm::Value * >(argp2);
   res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_icmp" "', argument " "3"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_fmul" "', argument " "3"" of type '" "llvm::Value *""'"); 
   }
   arg3 = reinterpret_cast< llvm::Value * >(argp3);
-  res4 = SWIG_ConvertPtr(obj3, &argp4,SWIGTYPE_p_llvm__Value, 0 |  0 );
-  if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_icmp" "', argument " "4"" of type '" "llvm::Value *""'"); 
-  }
-  arg4 = reinterpret_cast< llvm::Value * >(argp4);
-  result = (llvm::Value *)(arg1)->icmp(arg2,arg3,arg4);
+  result = (llvm::Value *)(arg1)->fmul(arg2,arg3);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   return resultobj;
 fail:
@@ -19243,65 +22006,55 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_icmp(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[6];
-  int ii;
+SWIGINTERN PyObject *_wrap_Builder_fmul(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
-  for (ii = 0; (ii < 5) && (ii < argc); ii++) {
+  argc = args ? PyObject_Length(args) : 0;
+  for (ii = 0; (ii < 4) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
-  if (argc == 4) {
+  if (argc == 3) {
     int _v;
     void *vptr = 0;
     int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
     _v = SWIG_CheckState(res);
     if (_v) {
-      {
-        int res = SWIG_AsVal_int(argv[1], NULL);
-        _v = SWIG_CheckState(res);
-      }
+      void *vptr = 0;
+      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Value, 0);
+      _v = SWIG_CheckState(res);
       if (_v) {
         void *vptr = 0;
         int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
         _v = SWIG_CheckState(res);
         if (_v) {
-          void *vptr = 0;
-          int res = SWIG_ConvertPtr(argv[3], &vptr, SWIGTYPE_p_llvm__Value, 0);
-          _v = SWIG_CheckState(res);
-          if (_v) {
-            return _wrap_Builder_icmp__SWIG_1(self, args);
-          }
+          return _wrap_Builder_fmul__SWIG_1(self, args);
         }
       }
     }
   }
-  if (argc == 5) {
+  if (argc == 4) {
     int _v;
     void *vptr = 0;
     int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
     _v = SWIG_CheckState(res);
     if (_v) {
-      {
-        int res = SWIG_AsVal_int(argv[1], NULL);
-        _v = SWIG_CheckState(res);
-      }
+      void *vptr = 0;
+      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Value, 0);
+      _v = SWIG_CheckState(res);
       if (_v) {
         void *vptr = 0;
         int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
         _v = SWIG_CheckState(res);
         if (_v) {
-          void *vptr = 0;
-          int res = SWIG_ConvertPtr(argv[3], &vptr, SWIGTYPE_p_llvm__Value, 0);
+          int res = SWIG_AsCharPtrAndSize(argv[3], 0, NULL, 0);
           _v = SWIG_CheckState(res);
           if (_v) {
-            int res = SWIG_AsCharPtrAndSize(argv[4], 0, NULL, 0);
-            _v = SWIG_CheckState(res);
-            if (_v) {
-              return _wrap_Builder_icmp__SWIG_0(self, args);
-            }
+            return _wrap_Builder_fmul__SWIG_0(self, args);
           }
         }
       }
@@ -19309,81 +22062,99 @@ SWIGINTERN PyObject *_wrap_Builder_icmp(PyObject *self, PyObject *args) {
   }
   
 fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_icmp'.\n"
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_fmul'.\n"
     "  Possible C/C++ prototypes are:\n"
-    "    Builder::icmp(int,llvm::Value *,llvm::Value *,char const *)\n"
-    "    Builder::icmp(int,llvm::Value *,llvm::Value *)\n");
+    "    Builder::fmul(llvm::Value *,llvm::Value *,char const *)\n"
+    "    Builder::fmul(llvm::Value *,llvm::Value *)\n");
   return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_negative__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_fdiv__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
-  char *arg3 = (char *) 0 ;
+  llvm::Value *arg3 = (llvm::Value *) 0 ;
+  char *arg4 = (char *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   void *argp2 = 0 ;
   int res2 = 0 ;
-  int res3 ;
-  char *buf3 = 0 ;
-  int alloc3 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  int res4 ;
+  char *buf4 = 0 ;
+  int alloc4 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
+  PyObject * obj3 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_negative",&obj0,&obj1,&obj2)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_fdiv",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_negative" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_fdiv" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_negative" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_fdiv" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
-  res3 = SWIG_AsCharPtrAndSize(obj2, &buf3, NULL, &alloc3);
+  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_negative" "', argument " "3"" of type '" "char const *""'");
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_fdiv" "', argument " "3"" of type '" "llvm::Value *""'"); 
   }
-  arg3 = reinterpret_cast< char * >(buf3);
-  result = (llvm::Value *)(arg1)->negative(arg2,(char const *)arg3);
+  arg3 = reinterpret_cast< llvm::Value * >(argp3);
+  res4 = SWIG_AsCharPtrAndSize(obj3, &buf4, NULL, &alloc4);
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_fdiv" "', argument " "4"" of type '" "char const *""'");
+  }
+  arg4 = reinterpret_cast< char * >(buf4);
+  result = (llvm::Value *)(arg1)->fdiv(arg2,arg3,(char const *)arg4);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
-  if (alloc3 == SWIG_NEWOBJ) delete[] buf3;
+  if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
   return resultobj;
 fail:
-  if (alloc3 == SWIG_NEWOBJ) delete[] buf3;
+  if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_negative__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_fdiv__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
+  llvm::Value *arg3 = (llvm::Value *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   void *argp2 = 0 ;
   int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:Builder_negative",&obj0,&obj1)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_fdiv",&obj0,&obj1,&obj2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_negative" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_fdiv" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_negative" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_fdiv" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
-  result = (llvm::Value *)(arg1)->negative(arg2);
+  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_fdiv" "', argument " "3"" of type '" "llvm::Value *""'"); 
+  }
+  arg3 = reinterpret_cast< llvm::Value * >(argp3);
+  result = (llvm::Value *)(arg1)->fdiv(arg2,arg3);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   return resultobj;
 fail:
@@ -19391,17 +22162,19 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_negative(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[4];
-  int ii;
+SWIGINTERN PyObject *_wrap_Builder_fdiv(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
-  for (ii = 0; (ii < 3) && (ii < argc); ii++) {
+  argc = args ? PyObject_Length(args) : 0;
+  for (ii = 0; (ii < 4) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
-  if (argc == 2) {
+  if (argc == 3) {
     int _v;
     void *vptr = 0;
     int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
@@ -19411,11 +22184,16 @@ SWIGINTERN PyObject *_wrap_Builder_negative(PyObject *self, PyObject *args) {
       int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Value, 0);
       _v = SWIG_CheckState(res);
       if (_v) {
-        return _wrap_Builder_negative__SWIG_1(self, args);
+        void *vptr = 0;
+        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
+        _v = SWIG_CheckState(res);
+        if (_v) {
+          return _wrap_Builder_fdiv__SWIG_1(self, args);
+        }
       }
     }
   }
-  if (argc == 3) {
+  if (argc == 4) {
     int _v;
     void *vptr = 0;
     int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
@@ -19425,25 +22203,30 @@ SWIGINTERN PyObject *_wrap_Builder_negative(PyObject *self, PyObject *args) {
       int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Value, 0);
       _v = SWIG_CheckState(res);
       if (_v) {
-        int res = SWIG_AsCharPtrAndSize(argv[2], 0, NULL, 0);
+        void *vptr = 0;
+        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
         _v = SWIG_CheckState(res);
         if (_v) {
-          return _wrap_Builder_negative__SWIG_0(self, args);
+          int res = SWIG_AsCharPtrAndSize(argv[3], 0, NULL, 0);
+          _v = SWIG_CheckState(res);
+          if (_v) {
+            return _wrap_Builder_fdiv__SWIG_0(self, args);
+          }
         }
       }
     }
   }
   
 fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_negative'.\n"
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_fdiv'.\n"
     "  Possible C/C++ prototypes are:\n"
-    "    Builder::negative(llvm::Value *,char const *)\n"
-    "    Builder::negative(llvm::Value *)\n");
+    "    Builder::fdiv(llvm::Value *,llvm::Value *,char const *)\n"
+    "    Builder::fdiv(llvm::Value *,llvm::Value *)\n");
   return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_fadd__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_fmod__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
@@ -19464,28 +22247,28 @@ SWIGINTERN PyObject *_wrap_Builder_fadd__SWIG_0(PyObject *SWIGUNUSEDPARM(self),
   PyObject * obj3 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_fadd",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_fmod",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_fadd" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_fmod" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_fadd" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_fmod" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
   res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_fadd" "', argument " "3"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_fmod" "', argument " "3"" of type '" "llvm::Value *""'"); 
   }
   arg3 = reinterpret_cast< llvm::Value * >(argp3);
   res4 = SWIG_AsCharPtrAndSize(obj3, &buf4, NULL, &alloc4);
   if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_fadd" "', argument " "4"" of type '" "char const *""'");
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_fmod" "', argument " "4"" of type '" "char const *""'");
   }
   arg4 = reinterpret_cast< char * >(buf4);
-  result = (llvm::Value *)(arg1)->fadd(arg2,arg3,(char const *)arg4);
+  result = (llvm::Value *)(arg1)->fmod(arg2,arg3,(char const *)arg4);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
   return resultobj;
@@ -19495,7 +22278,7 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_fadd__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_fmod__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
@@ -19511,23 +22294,23 @@ SWIGINTERN PyObject *_wrap_Builder_fadd__SWIG_1(PyObject *SWIGUNUSEDPARM(self),
   PyObject * obj2 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_fadd",&obj0,&obj1,&obj2)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_fmod",&obj0,&obj1,&obj2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_fadd" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_fmod" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_fadd" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_fmod" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
   res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_fadd" "', argument " "3"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_fmod" "', argument " "3"" of type '" "llvm::Value *""'"); 
   }
   arg3 = reinterpret_cast< llvm::Value * >(argp3);
-  result = (llvm::Value *)(arg1)->fadd(arg2,arg3);
+  result = (llvm::Value *)(arg1)->fmod(arg2,arg3);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   return resultobj;
 fail:
@@ -19535,13 +22318,15 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_fadd(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[5];
-  int ii;
+SWIGINTERN PyObject *_wrap_Builder_fmod(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 4) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
@@ -19559,7 +22344,7 @@ SWIGINTERN PyObject *_wrap_Builder_fadd(PyObject *self, PyObject *args) {
         int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
         _v = SWIG_CheckState(res);
         if (_v) {
-          return _wrap_Builder_fadd__SWIG_1(self, args);
+          return _wrap_Builder_fmod__SWIG_1(self, args);
         }
       }
     }
@@ -19581,7 +22366,7 @@ SWIGINTERN PyObject *_wrap_Builder_fadd(PyObject *self, PyObject *args) {
           int res = SWIG_AsCharPtrAndSize(argv[3], 0, NULL, 0);
           _v = SWIG_CheckState(res);
           if (_v) {
-            return _wrap_Builder_fadd__SWIG_0(self, args);
+            return _wrap_Builder_fmod__SWIG_0(self, args);
           }
         }
       }
@@ -19589,99 +22374,117 @@ SWIGINTERN PyObject *_wrap_Builder_fadd(PyObject *self, PyObject *args) {
   }
   
 fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_fadd'.\n"
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_fmod'.\n"
     "  Possible C/C++ prototypes are:\n"
-    "    Builder::fadd(llvm::Value *,llvm::Value *,char const *)\n"
-    "    Builder::fadd(llvm::Value *,llvm::Value *)\n");
+    "    Builder::fmod(llvm::Value *,llvm::Value *,char const *)\n"
+    "    Builder::fmod(llvm::Value *,llvm::Value *)\n");
   return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_fsub__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_fcmp__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
-  llvm::Value *arg2 = (llvm::Value *) 0 ;
+  int arg2 ;
   llvm::Value *arg3 = (llvm::Value *) 0 ;
-  char *arg4 = (char *) 0 ;
+  llvm::Value *arg4 = (llvm::Value *) 0 ;
+  char *arg5 = (char *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
   void *argp3 = 0 ;
   int res3 = 0 ;
-  int res4 ;
-  char *buf4 = 0 ;
-  int alloc4 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
+  int res5 ;
+  char *buf5 = 0 ;
+  int alloc5 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
   PyObject * obj3 = 0 ;
+  PyObject * obj4 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_fsub",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOOO:Builder_fcmp",&obj0,&obj1,&obj2,&obj3,&obj4)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_fsub" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_fcmp" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_fsub" "', argument " "2"" of type '" "llvm::Value *""'"); 
-  }
-  arg2 = reinterpret_cast< llvm::Value * >(argp2);
+  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "Builder_fcmp" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = static_cast< int >(val2);
   res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_fsub" "', argument " "3"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_fcmp" "', argument " "3"" of type '" "llvm::Value *""'"); 
   }
   arg3 = reinterpret_cast< llvm::Value * >(argp3);
-  res4 = SWIG_AsCharPtrAndSize(obj3, &buf4, NULL, &alloc4);
+  res4 = SWIG_ConvertPtr(obj3, &argp4,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_fsub" "', argument " "4"" of type '" "char const *""'");
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_fcmp" "', argument " "4"" of type '" "llvm::Value *""'"); 
   }
-  arg4 = reinterpret_cast< char * >(buf4);
-  result = (llvm::Value *)(arg1)->fsub(arg2,arg3,(char const *)arg4);
+  arg4 = reinterpret_cast< llvm::Value * >(argp4);
+  res5 = SWIG_AsCharPtrAndSize(obj4, &buf5, NULL, &alloc5);
+  if (!SWIG_IsOK(res5)) {
+    SWIG_exception_fail(SWIG_ArgError(res5), "in method '" "Builder_fcmp" "', argument " "5"" of type '" "char const *""'");
+  }
+  arg5 = reinterpret_cast< char * >(buf5);
+  result = (llvm::Value *)(arg1)->fcmp(arg2,arg3,arg4,(char const *)arg5);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
-  if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
+  if (alloc5 == SWIG_NEWOBJ) delete[] buf5;
   return resultobj;
 fail:
-  if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
+  if (alloc5 == SWIG_NEWOBJ) delete[] buf5;
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_fsub__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_fcmp__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
-  llvm::Value *arg2 = (llvm::Value *) 0 ;
+  int arg2 ;
   llvm::Value *arg3 = (llvm::Value *) 0 ;
+  llvm::Value *arg4 = (llvm::Value *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
   void *argp3 = 0 ;
   int res3 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
+  PyObject * obj3 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_fsub",&obj0,&obj1,&obj2)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_fcmp",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_fsub" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_fcmp" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_fsub" "', argument " "2"" of type '" "llvm::Value *""'"); 
-  }
-  arg2 = reinterpret_cast< llvm::Value * >(argp2);
+  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "Builder_fcmp" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = static_cast< int >(val2);
   res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_fsub" "', argument " "3"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_fcmp" "', argument " "3"" of type '" "llvm::Value *""'"); 
   }
   arg3 = reinterpret_cast< llvm::Value * >(argp3);
-  result = (llvm::Value *)(arg1)->fsub(arg2,arg3);
+  res4 = SWIG_ConvertPtr(obj3, &argp4,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_fcmp" "', argument " "4"" of type '" "llvm::Value *""'"); 
+  }
+  arg4 = reinterpret_cast< llvm::Value * >(argp4);
+  result = (llvm::Value *)(arg1)->fcmp(arg2,arg3,arg4);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   return resultobj;
 fail:
@@ -19689,53 +22492,67 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_fsub(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[5];
-  int ii;
+SWIGINTERN PyObject *_wrap_Builder_fcmp(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[6] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
-  for (ii = 0; (ii < 4) && (ii < argc); ii++) {
+  argc = args ? PyObject_Length(args) : 0;
+  for (ii = 0; (ii < 5) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
-  if (argc == 3) {
+  if (argc == 4) {
     int _v;
     void *vptr = 0;
     int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
     _v = SWIG_CheckState(res);
     if (_v) {
-      void *vptr = 0;
-      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Value, 0);
-      _v = SWIG_CheckState(res);
+      {
+        int res = SWIG_AsVal_int(argv[1], NULL);
+        _v = SWIG_CheckState(res);
+      }
       if (_v) {
         void *vptr = 0;
         int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
         _v = SWIG_CheckState(res);
         if (_v) {
-          return _wrap_Builder_fsub__SWIG_1(self, args);
+          void *vptr = 0;
+          int res = SWIG_ConvertPtr(argv[3], &vptr, SWIGTYPE_p_llvm__Value, 0);
+          _v = SWIG_CheckState(res);
+          if (_v) {
+            return _wrap_Builder_fcmp__SWIG_1(self, args);
+          }
         }
       }
     }
   }
-  if (argc == 4) {
+  if (argc == 5) {
     int _v;
     void *vptr = 0;
     int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
     _v = SWIG_CheckState(res);
     if (_v) {
-      void *vptr = 0;
-      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Value, 0);
-      _v = SWIG_CheckState(res);
+      {
+        int res = SWIG_AsVal_int(argv[1], NULL);
+        _v = SWIG_CheckState(res);
+      }
       if (_v) {
         void *vptr = 0;
         int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
         _v = SWIG_CheckState(res);
         if (_v) {
-          int res = SWIG_AsCharPtrAndSize(argv[3], 0, NULL, 0);
+          void *vptr = 0;
+          int res = SWIG_ConvertPtr(argv[3], &vptr, SWIGTYPE_p_llvm__Value, 0);
           _v = SWIG_CheckState(res);
           if (_v) {
-            return _wrap_Builder_fsub__SWIG_0(self, args);
+            int res = SWIG_AsCharPtrAndSize(argv[4], 0, NULL, 0);
+            _v = SWIG_CheckState(res);
+            if (_v) {
+              return _wrap_Builder_fcmp__SWIG_0(self, args);
+            }
           }
         }
       }
@@ -19743,99 +22560,117 @@ SWIGINTERN PyObject *_wrap_Builder_fsub(PyObject *self, PyObject *args) {
   }
   
 fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_fsub'.\n"
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_fcmp'.\n"
     "  Possible C/C++ prototypes are:\n"
-    "    Builder::fsub(llvm::Value *,llvm::Value *,char const *)\n"
-    "    Builder::fsub(llvm::Value *,llvm::Value *)\n");
+    "    Builder::fcmp(int,llvm::Value *,llvm::Value *,char const *)\n"
+    "    Builder::fcmp(int,llvm::Value *,llvm::Value *)\n");
   return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_fmul__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_icast__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
-  llvm::Value *arg3 = (llvm::Value *) 0 ;
-  char *arg4 = (char *) 0 ;
+  llvm::Type *arg3 = (llvm::Type *) 0 ;
+  bool arg4 ;
+  char *arg5 = (char *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   void *argp2 = 0 ;
   int res2 = 0 ;
   void *argp3 = 0 ;
   int res3 = 0 ;
-  int res4 ;
-  char *buf4 = 0 ;
-  int alloc4 = 0 ;
+  bool val4 ;
+  int ecode4 = 0 ;
+  int res5 ;
+  char *buf5 = 0 ;
+  int alloc5 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
   PyObject * obj3 = 0 ;
+  PyObject * obj4 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_fmul",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOOO:Builder_icast",&obj0,&obj1,&obj2,&obj3,&obj4)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_fmul" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_icast" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_fmul" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_icast" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
-  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Type, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_fmul" "', argument " "3"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_icast" "', argument " "3"" of type '" "llvm::Type *""'"); 
   }
-  arg3 = reinterpret_cast< llvm::Value * >(argp3);
-  res4 = SWIG_AsCharPtrAndSize(obj3, &buf4, NULL, &alloc4);
-  if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_fmul" "', argument " "4"" of type '" "char const *""'");
+  arg3 = reinterpret_cast< llvm::Type * >(argp3);
+  ecode4 = SWIG_AsVal_bool(obj3, &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "Builder_icast" "', argument " "4"" of type '" "bool""'");
+  } 
+  arg4 = static_cast< bool >(val4);
+  res5 = SWIG_AsCharPtrAndSize(obj4, &buf5, NULL, &alloc5);
+  if (!SWIG_IsOK(res5)) {
+    SWIG_exception_fail(SWIG_ArgError(res5), "in method '" "Builder_icast" "', argument " "5"" of type '" "char const *""'");
   }
-  arg4 = reinterpret_cast< char * >(buf4);
-  result = (llvm::Value *)(arg1)->fmul(arg2,arg3,(char const *)arg4);
+  arg5 = reinterpret_cast< char * >(buf5);
+  result = (llvm::Value *)(arg1)->icast(arg2,arg3,arg4,(char const *)arg5);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
-  if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
+  if (alloc5 == SWIG_NEWOBJ) delete[] buf5;
   return resultobj;
 fail:
-  if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
+  if (alloc5 == SWIG_NEWOBJ) delete[] buf5;
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_fmul__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_icast__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
-  llvm::Value *arg3 = (llvm::Value *) 0 ;
+  llvm::Type *arg3 = (llvm::Type *) 0 ;
+  bool arg4 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   void *argp2 = 0 ;
   int res2 = 0 ;
   void *argp3 = 0 ;
   int res3 = 0 ;
+  bool val4 ;
+  int ecode4 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
+  PyObject * obj3 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_fmul",&obj0,&obj1,&obj2)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_icast",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_fmul" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_icast" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_fmul" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_icast" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
-  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Type, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_fmul" "', argument " "3"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_icast" "', argument " "3"" of type '" "llvm::Type *""'"); 
   }
-  arg3 = reinterpret_cast< llvm::Value * >(argp3);
-  result = (llvm::Value *)(arg1)->fmul(arg2,arg3);
+  arg3 = reinterpret_cast< llvm::Type * >(argp3);
+  ecode4 = SWIG_AsVal_bool(obj3, &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "Builder_icast" "', argument " "4"" of type '" "bool""'");
+  } 
+  arg4 = static_cast< bool >(val4);
+  result = (llvm::Value *)(arg1)->icast(arg2,arg3,arg4);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   return resultobj;
 fail:
@@ -19843,17 +22678,19 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_fmul(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[5];
-  int ii;
+SWIGINTERN PyObject *_wrap_Builder_icast(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[6] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
-  for (ii = 0; (ii < 4) && (ii < argc); ii++) {
+  argc = args ? PyObject_Length(args) : 0;
+  for (ii = 0; (ii < 5) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
-  if (argc == 3) {
+  if (argc == 4) {
     int _v;
     void *vptr = 0;
     int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
@@ -19864,15 +22701,21 @@ SWIGINTERN PyObject *_wrap_Builder_fmul(PyObject *self, PyObject *args) {
       _v = SWIG_CheckState(res);
       if (_v) {
         void *vptr = 0;
-        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
+        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Type, 0);
         _v = SWIG_CheckState(res);
         if (_v) {
-          return _wrap_Builder_fmul__SWIG_1(self, args);
+          {
+            int res = SWIG_AsVal_bool(argv[3], NULL);
+            _v = SWIG_CheckState(res);
+          }
+          if (_v) {
+            return _wrap_Builder_icast__SWIG_1(self, args);
+          }
         }
       }
     }
   }
-  if (argc == 4) {
+  if (argc == 5) {
     int _v;
     void *vptr = 0;
     int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
@@ -19883,13 +22726,19 @@ SWIGINTERN PyObject *_wrap_Builder_fmul(PyObject *self, PyObject *args) {
       _v = SWIG_CheckState(res);
       if (_v) {
         void *vptr = 0;
-        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
+        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Type, 0);
         _v = SWIG_CheckState(res);
         if (_v) {
-          int res = SWIG_AsCharPtrAndSize(argv[3], 0, NULL, 0);
-          _v = SWIG_CheckState(res);
+          {
+            int res = SWIG_AsVal_bool(argv[3], NULL);
+            _v = SWIG_CheckState(res);
+          }
           if (_v) {
-            return _wrap_Builder_fmul__SWIG_0(self, args);
+            int res = SWIG_AsCharPtrAndSize(argv[4], 0, NULL, 0);
+            _v = SWIG_CheckState(res);
+            if (_v) {
+              return _wrap_Builder_icast__SWIG_0(self, args);
+            }
           }
         }
       }
@@ -19897,19 +22746,19 @@ SWIGINTERN PyObject *_wrap_Builder_fmul(PyObject *self, PyObject *args) {
   }
   
 fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_fmul'.\n"
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_icast'.\n"
     "  Possible C/C++ prototypes are:\n"
-    "    Builder::fmul(llvm::Value *,llvm::Value *,char const *)\n"
-    "    Builder::fmul(llvm::Value *,llvm::Value *)\n");
+    "    Builder::icast(llvm::Value *,llvm::Type *,bool,char const *)\n"
+    "    Builder::icast(llvm::Value *,llvm::Type *,bool)\n");
   return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_fdiv__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_fcast__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
-  llvm::Value *arg3 = (llvm::Value *) 0 ;
+  llvm::Type *arg3 = (llvm::Type *) 0 ;
   char *arg4 = (char *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -19926,28 +22775,28 @@ SWIGINTERN PyObject *_wrap_Builder_fdiv__SWIG_0(PyObject *SWIGUNUSEDPARM(self),
   PyObject * obj3 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_fdiv",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_fcast",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_fdiv" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_fcast" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_fdiv" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_fcast" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
-  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Type, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_fdiv" "', argument " "3"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_fcast" "', argument " "3"" of type '" "llvm::Type *""'"); 
   }
-  arg3 = reinterpret_cast< llvm::Value * >(argp3);
+  arg3 = reinterpret_cast< llvm::Type * >(argp3);
   res4 = SWIG_AsCharPtrAndSize(obj3, &buf4, NULL, &alloc4);
   if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_fdiv" "', argument " "4"" of type '" "char const *""'");
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_fcast" "', argument " "4"" of type '" "char const *""'");
   }
   arg4 = reinterpret_cast< char * >(buf4);
-  result = (llvm::Value *)(arg1)->fdiv(arg2,arg3,(char const *)arg4);
+  result = (llvm::Value *)(arg1)->fcast(arg2,arg3,(char const *)arg4);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
   return resultobj;
@@ -19957,11 +22806,11 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_fdiv__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_fcast__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
-  llvm::Value *arg3 = (llvm::Value *) 0 ;
+  llvm::Type *arg3 = (llvm::Type *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   void *argp2 = 0 ;
@@ -19973,23 +22822,23 @@ SWIGINTERN PyObject *_wrap_Builder_fdiv__SWIG_1(PyObject *SWIGUNUSEDPARM(self),
   PyObject * obj2 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_fdiv",&obj0,&obj1,&obj2)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_fcast",&obj0,&obj1,&obj2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_fdiv" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_fcast" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_fdiv" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_fcast" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
-  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Type, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_fdiv" "', argument " "3"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_fcast" "', argument " "3"" of type '" "llvm::Type *""'"); 
   }
-  arg3 = reinterpret_cast< llvm::Value * >(argp3);
-  result = (llvm::Value *)(arg1)->fdiv(arg2,arg3);
+  arg3 = reinterpret_cast< llvm::Type * >(argp3);
+  result = (llvm::Value *)(arg1)->fcast(arg2,arg3);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   return resultobj;
 fail:
@@ -19997,13 +22846,15 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_fdiv(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[5];
-  int ii;
+SWIGINTERN PyObject *_wrap_Builder_fcast(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 4) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
@@ -20018,10 +22869,10 @@ SWIGINTERN PyObject *_wrap_Builder_fdiv(PyObject *self, PyObject *args) {
       _v = SWIG_CheckState(res);
       if (_v) {
         void *vptr = 0;
-        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
+        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Type, 0);
         _v = SWIG_CheckState(res);
         if (_v) {
-          return _wrap_Builder_fdiv__SWIG_1(self, args);
+          return _wrap_Builder_fcast__SWIG_1(self, args);
         }
       }
     }
@@ -20037,13 +22888,13 @@ SWIGINTERN PyObject *_wrap_Builder_fdiv(PyObject *self, PyObject *args) {
       _v = SWIG_CheckState(res);
       if (_v) {
         void *vptr = 0;
-        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
+        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Type, 0);
         _v = SWIG_CheckState(res);
         if (_v) {
           int res = SWIG_AsCharPtrAndSize(argv[3], 0, NULL, 0);
           _v = SWIG_CheckState(res);
           if (_v) {
-            return _wrap_Builder_fdiv__SWIG_0(self, args);
+            return _wrap_Builder_fcast__SWIG_0(self, args);
           }
         }
       }
@@ -20051,19 +22902,19 @@ SWIGINTERN PyObject *_wrap_Builder_fdiv(PyObject *self, PyObject *args) {
   }
   
 fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_fdiv'.\n"
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_fcast'.\n"
     "  Possible C/C++ prototypes are:\n"
-    "    Builder::fdiv(llvm::Value *,llvm::Value *,char const *)\n"
-    "    Builder::fdiv(llvm::Value *,llvm::Value *)\n");
+    "    Builder::fcast(llvm::Value *,llvm::Type *,char const *)\n"
+    "    Builder::fcast(llvm::Value *,llvm::Type *)\n");
   return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_fmod__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_sitofp__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
-  llvm::Value *arg3 = (llvm::Value *) 0 ;
+  llvm::Type *arg3 = (llvm::Type *) 0 ;
   char *arg4 = (char *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -20080,28 +22931,28 @@ SWIGINTERN PyObject *_wrap_Builder_fmod__SWIG_0(PyObject *SWIGUNUSEDPARM(self),
   PyObject * obj3 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_fmod",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_sitofp",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_fmod" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_sitofp" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_fmod" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_sitofp" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
-  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Type, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_fmod" "', argument " "3"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_sitofp" "', argument " "3"" of type '" "llvm::Type *""'"); 
   }
-  arg3 = reinterpret_cast< llvm::Value * >(argp3);
+  arg3 = reinterpret_cast< llvm::Type * >(argp3);
   res4 = SWIG_AsCharPtrAndSize(obj3, &buf4, NULL, &alloc4);
   if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_fmod" "', argument " "4"" of type '" "char const *""'");
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_sitofp" "', argument " "4"" of type '" "char const *""'");
   }
   arg4 = reinterpret_cast< char * >(buf4);
-  result = (llvm::Value *)(arg1)->fmod(arg2,arg3,(char const *)arg4);
+  result = (llvm::Value *)(arg1)->sitofp(arg2,arg3,(char const *)arg4);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
   return resultobj;
@@ -20111,11 +22962,11 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_fmod__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_sitofp__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
-  llvm::Value *arg3 = (llvm::Value *) 0 ;
+  llvm::Type *arg3 = (llvm::Type *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   void *argp2 = 0 ;
@@ -20127,23 +22978,23 @@ SWIGINTERN PyObject *_wrap_Builder_fmod__SWIG_1(PyObject *SWIGUNUSEDPARM(self),
   PyObject * obj2 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_fmod",&obj0,&obj1,&obj2)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_sitofp",&obj0,&obj1,&obj2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_fmod" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_sitofp" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_fmod" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_sitofp" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
-  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Type, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_fmod" "', argument " "3"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_sitofp" "', argument " "3"" of type '" "llvm::Type *""'"); 
   }
-  arg3 = reinterpret_cast< llvm::Value * >(argp3);
-  result = (llvm::Value *)(arg1)->fmod(arg2,arg3);
+  arg3 = reinterpret_cast< llvm::Type * >(argp3);
+  result = (llvm::Value *)(arg1)->sitofp(arg2,arg3);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   return resultobj;
 fail:
@@ -20151,13 +23002,15 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_fmod(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[5];
-  int ii;
+SWIGINTERN PyObject *_wrap_Builder_sitofp(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 4) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
@@ -20172,10 +23025,10 @@ SWIGINTERN PyObject *_wrap_Builder_fmod(PyObject *self, PyObject *args) {
       _v = SWIG_CheckState(res);
       if (_v) {
         void *vptr = 0;
-        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
+        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Type, 0);
         _v = SWIG_CheckState(res);
         if (_v) {
-          return _wrap_Builder_fmod__SWIG_1(self, args);
+          return _wrap_Builder_sitofp__SWIG_1(self, args);
         }
       }
     }
@@ -20191,13 +23044,13 @@ SWIGINTERN PyObject *_wrap_Builder_fmod(PyObject *self, PyObject *args) {
       _v = SWIG_CheckState(res);
       if (_v) {
         void *vptr = 0;
-        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
+        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Type, 0);
         _v = SWIG_CheckState(res);
         if (_v) {
           int res = SWIG_AsCharPtrAndSize(argv[3], 0, NULL, 0);
           _v = SWIG_CheckState(res);
           if (_v) {
-            return _wrap_Builder_fmod__SWIG_0(self, args);
+            return _wrap_Builder_sitofp__SWIG_0(self, args);
           }
         }
       }
@@ -20205,117 +23058,99 @@ SWIGINTERN PyObject *_wrap_Builder_fmod(PyObject *self, PyObject *args) {
   }
   
 fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_fmod'.\n"
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_sitofp'.\n"
     "  Possible C/C++ prototypes are:\n"
-    "    Builder::fmod(llvm::Value *,llvm::Value *,char const *)\n"
-    "    Builder::fmod(llvm::Value *,llvm::Value *)\n");
+    "    Builder::sitofp(llvm::Value *,llvm::Type *,char const *)\n"
+    "    Builder::sitofp(llvm::Value *,llvm::Type *)\n");
   return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_fcmp__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_fptosi__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
-  int arg2 ;
-  llvm::Value *arg3 = (llvm::Value *) 0 ;
-  llvm::Value *arg4 = (llvm::Value *) 0 ;
-  char *arg5 = (char *) 0 ;
+  llvm::Value *arg2 = (llvm::Value *) 0 ;
+  llvm::Type *arg3 = (llvm::Type *) 0 ;
+  char *arg4 = (char *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  int val2 ;
-  int ecode2 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
   void *argp3 = 0 ;
   int res3 = 0 ;
-  void *argp4 = 0 ;
-  int res4 = 0 ;
-  int res5 ;
-  char *buf5 = 0 ;
-  int alloc5 = 0 ;
+  int res4 ;
+  char *buf4 = 0 ;
+  int alloc4 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
   PyObject * obj3 = 0 ;
-  PyObject * obj4 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOOO:Builder_fcmp",&obj0,&obj1,&obj2,&obj3,&obj4)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_fptosi",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_fcmp" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_fptosi" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
-  ecode2 = SWIG_AsVal_int(obj1, &val2);
-  if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "Builder_fcmp" "', argument " "2"" of type '" "int""'");
-  } 
-  arg2 = static_cast< int >(val2);
-  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_fptosi" "', argument " "2"" of type '" "llvm::Value *""'"); 
+  }
+  arg2 = reinterpret_cast< llvm::Value * >(argp2);
+  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Type, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_fcmp" "', argument " "3"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_fptosi" "', argument " "3"" of type '" "llvm::Type *""'"); 
   }
-  arg3 = reinterpret_cast< llvm::Value * >(argp3);
-  res4 = SWIG_ConvertPtr(obj3, &argp4,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  arg3 = reinterpret_cast< llvm::Type * >(argp3);
+  res4 = SWIG_AsCharPtrAndSize(obj3, &buf4, NULL, &alloc4);
   if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_fcmp" "', argument " "4"" of type '" "llvm::Value *""'"); 
-  }
-  arg4 = reinterpret_cast< llvm::Value * >(argp4);
-  res5 = SWIG_AsCharPtrAndSize(obj4, &buf5, NULL, &alloc5);
-  if (!SWIG_IsOK(res5)) {
-    SWIG_exception_fail(SWIG_ArgError(res5), "in method '" "Builder_fcmp" "', argument " "5"" of type '" "char const *""'");
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_fptosi" "', argument " "4"" of type '" "char const *""'");
   }
-  arg5 = reinterpret_cast< char * >(buf5);
-  result = (llvm::Value *)(arg1)->fcmp(arg2,arg3,arg4,(char const *)arg5);
+  arg4 = reinterpret_cast< char * >(buf4);
+  result = (llvm::Value *)(arg1)->fptosi(arg2,arg3,(char const *)arg4);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
-  if (alloc5 == SWIG_NEWOBJ) delete[] buf5;
+  if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
   return resultobj;
 fail:
-  if (alloc5 == SWIG_NEWOBJ) delete[] buf5;
+  if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_fcmp__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_fptosi__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
-  int arg2 ;
-  llvm::Value *arg3 = (llvm::Value *) 0 ;
-  llvm::Value *arg4 = (llvm::Value *) 0 ;
+  llvm::Value *arg2 = (llvm::Value *) 0 ;
+  llvm::Type *arg3 = (llvm::Type *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  int val2 ;
-  int ecode2 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
   void *argp3 = 0 ;
   int res3 = 0 ;
-  void *argp4 = 0 ;
-  int res4 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
-  PyObject * obj3 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_fcmp",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_fptosi",&obj0,&obj1,&obj2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_fcmp" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_fptosi" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
-  ecode2 = SWIG_AsVal_int(obj1, &val2);
-  if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "Builder_fcmp" "', argument " "2"" of type '" "int""'");
-  } 
-  arg2 = static_cast< int >(val2);
-  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
-  if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_fcmp" "', argument " "3"" of type '" "llvm::Value *""'"); 
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_fptosi" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
-  arg3 = reinterpret_cast< llvm::Value * >(argp3);
-  res4 = SWIG_ConvertPtr(obj3, &argp4,SWIGTYPE_p_llvm__Value, 0 |  0 );
-  if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_fcmp" "', argument " "4"" of type '" "llvm::Value *""'"); 
+  arg2 = reinterpret_cast< llvm::Value * >(argp2);
+  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Type, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_fptosi" "', argument " "3"" of type '" "llvm::Type *""'"); 
   }
-  arg4 = reinterpret_cast< llvm::Value * >(argp4);
-  result = (llvm::Value *)(arg1)->fcmp(arg2,arg3,arg4);
+  arg3 = reinterpret_cast< llvm::Type * >(argp3);
+  result = (llvm::Value *)(arg1)->fptosi(arg2,arg3);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   return resultobj;
 fail:
@@ -20323,65 +23158,55 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_fcmp(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[6];
-  int ii;
+SWIGINTERN PyObject *_wrap_Builder_fptosi(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
-  for (ii = 0; (ii < 5) && (ii < argc); ii++) {
+  argc = args ? PyObject_Length(args) : 0;
+  for (ii = 0; (ii < 4) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
-  if (argc == 4) {
+  if (argc == 3) {
     int _v;
     void *vptr = 0;
     int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
     _v = SWIG_CheckState(res);
     if (_v) {
-      {
-        int res = SWIG_AsVal_int(argv[1], NULL);
-        _v = SWIG_CheckState(res);
-      }
+      void *vptr = 0;
+      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Value, 0);
+      _v = SWIG_CheckState(res);
       if (_v) {
         void *vptr = 0;
-        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
+        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Type, 0);
         _v = SWIG_CheckState(res);
         if (_v) {
-          void *vptr = 0;
-          int res = SWIG_ConvertPtr(argv[3], &vptr, SWIGTYPE_p_llvm__Value, 0);
-          _v = SWIG_CheckState(res);
-          if (_v) {
-            return _wrap_Builder_fcmp__SWIG_1(self, args);
-          }
+          return _wrap_Builder_fptosi__SWIG_1(self, args);
         }
       }
     }
   }
-  if (argc == 5) {
+  if (argc == 4) {
     int _v;
     void *vptr = 0;
     int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
     _v = SWIG_CheckState(res);
     if (_v) {
-      {
-        int res = SWIG_AsVal_int(argv[1], NULL);
-        _v = SWIG_CheckState(res);
-      }
+      void *vptr = 0;
+      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Value, 0);
+      _v = SWIG_CheckState(res);
       if (_v) {
         void *vptr = 0;
-        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
+        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Type, 0);
         _v = SWIG_CheckState(res);
         if (_v) {
-          void *vptr = 0;
-          int res = SWIG_ConvertPtr(argv[3], &vptr, SWIGTYPE_p_llvm__Value, 0);
+          int res = SWIG_AsCharPtrAndSize(argv[3], 0, NULL, 0);
           _v = SWIG_CheckState(res);
           if (_v) {
-            int res = SWIG_AsCharPtrAndSize(argv[4], 0, NULL, 0);
-            _v = SWIG_CheckState(res);
-            if (_v) {
-              return _wrap_Builder_fcmp__SWIG_0(self, args);
-            }
+            return _wrap_Builder_fptosi__SWIG_0(self, args);
           }
         }
       }
@@ -20389,117 +23214,99 @@ SWIGINTERN PyObject *_wrap_Builder_fcmp(PyObject *self, PyObject *args) {
   }
   
 fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_fcmp'.\n"
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_fptosi'.\n"
     "  Possible C/C++ prototypes are:\n"
-    "    Builder::fcmp(int,llvm::Value *,llvm::Value *,char const *)\n"
-    "    Builder::fcmp(int,llvm::Value *,llvm::Value *)\n");
+    "    Builder::fptosi(llvm::Value *,llvm::Type *,char const *)\n"
+    "    Builder::fptosi(llvm::Value *,llvm::Type *)\n");
   return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_icast__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_uitofp__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
   llvm::Type *arg3 = (llvm::Type *) 0 ;
-  bool arg4 ;
-  char *arg5 = (char *) 0 ;
+  char *arg4 = (char *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   void *argp2 = 0 ;
   int res2 = 0 ;
   void *argp3 = 0 ;
   int res3 = 0 ;
-  bool val4 ;
-  int ecode4 = 0 ;
-  int res5 ;
-  char *buf5 = 0 ;
-  int alloc5 = 0 ;
+  int res4 ;
+  char *buf4 = 0 ;
+  int alloc4 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
   PyObject * obj3 = 0 ;
-  PyObject * obj4 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOOO:Builder_icast",&obj0,&obj1,&obj2,&obj3,&obj4)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_uitofp",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_icast" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_uitofp" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_icast" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_uitofp" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
   res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Type, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_icast" "', argument " "3"" of type '" "llvm::Type *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_uitofp" "', argument " "3"" of type '" "llvm::Type *""'"); 
   }
   arg3 = reinterpret_cast< llvm::Type * >(argp3);
-  ecode4 = SWIG_AsVal_bool(obj3, &val4);
-  if (!SWIG_IsOK(ecode4)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "Builder_icast" "', argument " "4"" of type '" "bool""'");
-  } 
-  arg4 = static_cast< bool >(val4);
-  res5 = SWIG_AsCharPtrAndSize(obj4, &buf5, NULL, &alloc5);
-  if (!SWIG_IsOK(res5)) {
-    SWIG_exception_fail(SWIG_ArgError(res5), "in method '" "Builder_icast" "', argument " "5"" of type '" "char const *""'");
+  res4 = SWIG_AsCharPtrAndSize(obj3, &buf4, NULL, &alloc4);
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_uitofp" "', argument " "4"" of type '" "char const *""'");
   }
-  arg5 = reinterpret_cast< char * >(buf5);
-  result = (llvm::Value *)(arg1)->icast(arg2,arg3,arg4,(char const *)arg5);
+  arg4 = reinterpret_cast< char * >(buf4);
+  result = (llvm::Value *)(arg1)->uitofp(arg2,arg3,(char const *)arg4);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
-  if (alloc5 == SWIG_NEWOBJ) delete[] buf5;
+  if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
   return resultobj;
 fail:
-  if (alloc5 == SWIG_NEWOBJ) delete[] buf5;
+  if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_icast__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_uitofp__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
   llvm::Type *arg3 = (llvm::Type *) 0 ;
-  bool arg4 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   void *argp2 = 0 ;
   int res2 = 0 ;
   void *argp3 = 0 ;
   int res3 = 0 ;
-  bool val4 ;
-  int ecode4 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
-  PyObject * obj3 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_icast",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_uitofp",&obj0,&obj1,&obj2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_icast" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_uitofp" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_icast" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_uitofp" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
   res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Type, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_icast" "', argument " "3"" of type '" "llvm::Type *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_uitofp" "', argument " "3"" of type '" "llvm::Type *""'"); 
   }
   arg3 = reinterpret_cast< llvm::Type * >(argp3);
-  ecode4 = SWIG_AsVal_bool(obj3, &val4);
-  if (!SWIG_IsOK(ecode4)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "Builder_icast" "', argument " "4"" of type '" "bool""'");
-  } 
-  arg4 = static_cast< bool >(val4);
-  result = (llvm::Value *)(arg1)->icast(arg2,arg3,arg4);
+  result = (llvm::Value *)(arg1)->uitofp(arg2,arg3);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   return resultobj;
 fail:
@@ -20507,17 +23314,19 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_icast(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[6];
-  int ii;
+SWIGINTERN PyObject *_wrap_Builder_uitofp(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
-  for (ii = 0; (ii < 5) && (ii < argc); ii++) {
+  argc = args ? PyObject_Length(args) : 0;
+  for (ii = 0; (ii < 4) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
-  if (argc == 4) {
+  if (argc == 3) {
     int _v;
     void *vptr = 0;
     int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
@@ -20531,18 +23340,12 @@ SWIGINTERN PyObject *_wrap_Builder_icast(PyObject *self, PyObject *args) {
         int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Type, 0);
         _v = SWIG_CheckState(res);
         if (_v) {
-          {
-            int res = SWIG_AsVal_bool(argv[3], NULL);
-            _v = SWIG_CheckState(res);
-          }
-          if (_v) {
-            return _wrap_Builder_icast__SWIG_1(self, args);
-          }
+          return _wrap_Builder_uitofp__SWIG_1(self, args);
         }
       }
     }
   }
-  if (argc == 5) {
+  if (argc == 4) {
     int _v;
     void *vptr = 0;
     int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
@@ -20556,16 +23359,10 @@ SWIGINTERN PyObject *_wrap_Builder_icast(PyObject *self, PyObject *args) {
         int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Type, 0);
         _v = SWIG_CheckState(res);
         if (_v) {
-          {
-            int res = SWIG_AsVal_bool(argv[3], NULL);
-            _v = SWIG_CheckState(res);
-          }
+          int res = SWIG_AsCharPtrAndSize(argv[3], 0, NULL, 0);
+          _v = SWIG_CheckState(res);
           if (_v) {
-            int res = SWIG_AsCharPtrAndSize(argv[4], 0, NULL, 0);
-            _v = SWIG_CheckState(res);
-            if (_v) {
-              return _wrap_Builder_icast__SWIG_0(self, args);
-            }
+            return _wrap_Builder_uitofp__SWIG_0(self, args);
           }
         }
       }
@@ -20573,15 +23370,15 @@ SWIGINTERN PyObject *_wrap_Builder_icast(PyObject *self, PyObject *args) {
   }
   
 fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_icast'.\n"
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_uitofp'.\n"
     "  Possible C/C++ prototypes are:\n"
-    "    Builder::icast(llvm::Value *,llvm::Type *,bool,char const *)\n"
-    "    Builder::icast(llvm::Value *,llvm::Type *,bool)\n");
+    "    Builder::uitofp(llvm::Value *,llvm::Type *,char const *)\n"
+    "    Builder::uitofp(llvm::Value *,llvm::Type *)\n");
   return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_fcast__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_fptoui__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
@@ -20602,28 +23399,28 @@ SWIGINTERN PyObject *_wrap_Builder_fcast__SWIG_0(PyObject *SWIGUNUSEDPARM(self),
   PyObject * obj3 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_fcast",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_fptoui",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_fcast" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_fptoui" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_fcast" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_fptoui" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
   res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Type, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_fcast" "', argument " "3"" of type '" "llvm::Type *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_fptoui" "', argument " "3"" of type '" "llvm::Type *""'"); 
   }
   arg3 = reinterpret_cast< llvm::Type * >(argp3);
   res4 = SWIG_AsCharPtrAndSize(obj3, &buf4, NULL, &alloc4);
   if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_fcast" "', argument " "4"" of type '" "char const *""'");
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_fptoui" "', argument " "4"" of type '" "char const *""'");
   }
   arg4 = reinterpret_cast< char * >(buf4);
-  result = (llvm::Value *)(arg1)->fcast(arg2,arg3,(char const *)arg4);
+  result = (llvm::Value *)(arg1)->fptoui(arg2,arg3,(char const *)arg4);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
   return resultobj;
@@ -20633,7 +23430,7 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_fcast__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_fptoui__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
@@ -20649,23 +23446,23 @@ SWIGINTERN PyObject *_wrap_Builder_fcast__SWIG_1(PyObject *SWIGUNUSEDPARM(self),
   PyObject * obj2 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_fcast",&obj0,&obj1,&obj2)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_fptoui",&obj0,&obj1,&obj2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_fcast" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_fptoui" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_fcast" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_fptoui" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
   res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Type, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_fcast" "', argument " "3"" of type '" "llvm::Type *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_fptoui" "', argument " "3"" of type '" "llvm::Type *""'"); 
   }
   arg3 = reinterpret_cast< llvm::Type * >(argp3);
-  result = (llvm::Value *)(arg1)->fcast(arg2,arg3);
+  result = (llvm::Value *)(arg1)->fptoui(arg2,arg3);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   return resultobj;
 fail:
@@ -20673,13 +23470,15 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_fcast(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[5];
-  int ii;
+SWIGINTERN PyObject *_wrap_Builder_fptoui(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 4) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
@@ -20697,7 +23496,7 @@ SWIGINTERN PyObject *_wrap_Builder_fcast(PyObject *self, PyObject *args) {
         int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Type, 0);
         _v = SWIG_CheckState(res);
         if (_v) {
-          return _wrap_Builder_fcast__SWIG_1(self, args);
+          return _wrap_Builder_fptoui__SWIG_1(self, args);
         }
       }
     }
@@ -20719,34 +23518,227 @@ SWIGINTERN PyObject *_wrap_Builder_fcast(PyObject *self, PyObject *args) {
           int res = SWIG_AsCharPtrAndSize(argv[3], 0, NULL, 0);
           _v = SWIG_CheckState(res);
           if (_v) {
-            return _wrap_Builder_fcast__SWIG_0(self, args);
+            return _wrap_Builder_fptoui__SWIG_0(self, args);
           }
         }
       }
     }
   }
-  
+  
+fail:
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_fptoui'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    Builder::fptoui(llvm::Value *,llvm::Type *,char const *)\n"
+    "    Builder::fptoui(llvm::Value *,llvm::Type *)\n");
+  return 0;
+}
+
+
+SWIGINTERN PyObject *_wrap_Builder_ret(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  Builder *arg1 = (Builder *) 0 ;
+  llvm::Value *arg2 = (llvm::Value *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OO:Builder_ret",&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_ret" "', argument " "1"" of type '" "Builder *""'"); 
+  }
+  arg1 = reinterpret_cast< Builder * >(argp1);
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_ret" "', argument " "2"" of type '" "llvm::Value *""'"); 
+  }
+  arg2 = reinterpret_cast< llvm::Value * >(argp2);
+  (arg1)->ret(arg2);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Builder_ret_void(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  Builder *arg1 = (Builder *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:Builder_ret_void",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_ret_void" "', argument " "1"" of type '" "Builder *""'"); 
+  }
+  arg1 = reinterpret_cast< Builder * >(argp1);
+  (arg1)->ret_void();
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Builder_branch(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  Builder *arg1 = (Builder *) 0 ;
+  llvm::BasicBlock *arg2 = (llvm::BasicBlock *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OO:Builder_branch",&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_branch" "', argument " "1"" of type '" "Builder *""'"); 
+  }
+  arg1 = reinterpret_cast< Builder * >(argp1);
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__BasicBlock, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_branch" "', argument " "2"" of type '" "llvm::BasicBlock *""'"); 
+  }
+  arg2 = reinterpret_cast< llvm::BasicBlock * >(argp2);
+  (arg1)->branch(arg2);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Builder_cond_branch(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  Builder *arg1 = (Builder *) 0 ;
+  llvm::Value *arg2 = (llvm::Value *) 0 ;
+  llvm::BasicBlock *arg3 = (llvm::BasicBlock *) 0 ;
+  llvm::BasicBlock *arg4 = (llvm::BasicBlock *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  PyObject * obj3 = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_cond_branch",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_cond_branch" "', argument " "1"" of type '" "Builder *""'"); 
+  }
+  arg1 = reinterpret_cast< Builder * >(argp1);
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_cond_branch" "', argument " "2"" of type '" "llvm::Value *""'"); 
+  }
+  arg2 = reinterpret_cast< llvm::Value * >(argp2);
+  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__BasicBlock, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_cond_branch" "', argument " "3"" of type '" "llvm::BasicBlock *""'"); 
+  }
+  arg3 = reinterpret_cast< llvm::BasicBlock * >(argp3);
+  res4 = SWIG_ConvertPtr(obj3, &argp4,SWIGTYPE_p_llvm__BasicBlock, 0 |  0 );
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_cond_branch" "', argument " "4"" of type '" "llvm::BasicBlock *""'"); 
+  }
+  arg4 = reinterpret_cast< llvm::BasicBlock * >(argp4);
+  (arg1)->cond_branch(arg2,arg3,arg4);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Builder_cond_branch_weighted(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  Builder *arg1 = (Builder *) 0 ;
+  llvm::Value *arg2 = (llvm::Value *) 0 ;
+  llvm::BasicBlock *arg3 = (llvm::BasicBlock *) 0 ;
+  llvm::BasicBlock *arg4 = (llvm::BasicBlock *) 0 ;
+  unsigned int arg5 ;
+  unsigned int arg6 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
+  unsigned int val5 ;
+  int ecode5 = 0 ;
+  unsigned int val6 ;
+  int ecode6 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  PyObject * obj3 = 0 ;
+  PyObject * obj4 = 0 ;
+  PyObject * obj5 = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OOOOOO:Builder_cond_branch_weighted",&obj0,&obj1,&obj2,&obj3,&obj4,&obj5)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_cond_branch_weighted" "', argument " "1"" of type '" "Builder *""'"); 
+  }
+  arg1 = reinterpret_cast< Builder * >(argp1);
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_cond_branch_weighted" "', argument " "2"" of type '" "llvm::Value *""'"); 
+  }
+  arg2 = reinterpret_cast< llvm::Value * >(argp2);
+  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__BasicBlock, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_cond_branch_weighted" "', argument " "3"" of type '" "llvm::BasicBlock *""'"); 
+  }
+  arg3 = reinterpret_cast< llvm::BasicBlock * >(argp3);
+  res4 = SWIG_ConvertPtr(obj3, &argp4,SWIGTYPE_p_llvm__BasicBlock, 0 |  0 );
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_cond_branch_weighted" "', argument " "4"" of type '" "llvm::BasicBlock *""'"); 
+  }
+  arg4 = reinterpret_cast< llvm::BasicBlock * >(argp4);
+  ecode5 = SWIG_AsVal_unsigned_SS_int(obj4, &val5);
+  if (!SWIG_IsOK(ecode5)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode5), "in method '" "Builder_cond_branch_weighted" "', argument " "5"" of type '" "unsigned int""'");
+  } 
+  arg5 = static_cast< unsigned int >(val5);
+  ecode6 = SWIG_AsVal_unsigned_SS_int(obj5, &val6);
+  if (!SWIG_IsOK(ecode6)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode6), "in method '" "Builder_cond_branch_weighted" "', argument " "6"" of type '" "unsigned int""'");
+  } 
+  arg6 = static_cast< unsigned int >(val6);
+  (arg1)->cond_branch_weighted(arg2,arg3,arg4,arg5,arg6);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
 fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_fcast'.\n"
-    "  Possible C/C++ prototypes are:\n"
-    "    Builder::fcast(llvm::Value *,llvm::Type *,char const *)\n"
-    "    Builder::fcast(llvm::Value *,llvm::Type *)\n");
-  return 0;
+  return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_sitofp__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_call__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
-  llvm::Value *arg2 = (llvm::Value *) 0 ;
-  llvm::Type *arg3 = (llvm::Type *) 0 ;
+  SwigValueWrapper< FunctionAdaptor > arg2 ;
+  std::vector< llvm::Value *,std::allocator< llvm::Value * > > arg3 ;
   char *arg4 = (char *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
+  void *argp2 ;
   int res2 = 0 ;
-  void *argp3 = 0 ;
-  int res3 = 0 ;
   int res4 ;
   char *buf4 = 0 ;
   int alloc4 = 0 ;
@@ -20756,28 +23748,40 @@ SWIGINTERN PyObject *_wrap_Builder_sitofp__SWIG_0(PyObject *SWIGUNUSEDPARM(self)
   PyObject * obj3 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_sitofp",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_call",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_sitofp" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_call" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_sitofp" "', argument " "2"" of type '" "llvm::Value *""'"); 
+  {
+    res2 = SWIG_ConvertPtr(obj1, &argp2, SWIGTYPE_p_FunctionAdaptor,  0  | 0);
+    if (!SWIG_IsOK(res2)) {
+      SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_call" "', argument " "2"" of type '" "FunctionAdaptor""'"); 
+    }  
+    if (!argp2) {
+      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "Builder_call" "', argument " "2"" of type '" "FunctionAdaptor""'");
+    } else {
+      FunctionAdaptor * temp = reinterpret_cast< FunctionAdaptor * >(argp2);
+      arg2 = *temp;
+      if (SWIG_IsNewObj(res2)) delete temp;
+    }
   }
-  arg2 = reinterpret_cast< llvm::Value * >(argp2);
-  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Type, 0 |  0 );
-  if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_sitofp" "', argument " "3"" of type '" "llvm::Type *""'"); 
+  {
+    std::vector< llvm::Value*,std::allocator< llvm::Value * > > *ptr = (std::vector< llvm::Value*,std::allocator< llvm::Value * > > *)0;
+    int res = swig::asptr(obj2, &ptr);
+    if (!SWIG_IsOK(res) || !ptr) {
+      SWIG_exception_fail(SWIG_ArgError((ptr ? res : SWIG_TypeError)), "in method '" "Builder_call" "', argument " "3"" of type '" "std::vector< llvm::Value *,std::allocator< llvm::Value * > >""'"); 
+    }
+    arg3 = *ptr;
+    if (SWIG_IsNewObj(res)) delete ptr;
   }
-  arg3 = reinterpret_cast< llvm::Type * >(argp3);
   res4 = SWIG_AsCharPtrAndSize(obj3, &buf4, NULL, &alloc4);
   if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_sitofp" "', argument " "4"" of type '" "char const *""'");
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_call" "', argument " "4"" of type '" "char const *""'");
   }
   arg4 = reinterpret_cast< char * >(buf4);
-  result = (llvm::Value *)(arg1)->sitofp(arg2,arg3,(char const *)arg4);
+  result = (llvm::Value *)(arg1)->call(arg2,arg3,(char const *)arg4);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
   return resultobj;
@@ -20787,39 +23791,49 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_sitofp__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_call__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
-  llvm::Value *arg2 = (llvm::Value *) 0 ;
-  llvm::Type *arg3 = (llvm::Type *) 0 ;
+  SwigValueWrapper< FunctionAdaptor > arg2 ;
+  std::vector< llvm::Value *,std::allocator< llvm::Value * > > arg3 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
+  void *argp2 ;
   int res2 = 0 ;
-  void *argp3 = 0 ;
-  int res3 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_sitofp",&obj0,&obj1,&obj2)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_call",&obj0,&obj1,&obj2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_sitofp" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_call" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_sitofp" "', argument " "2"" of type '" "llvm::Value *""'"); 
+  {
+    res2 = SWIG_ConvertPtr(obj1, &argp2, SWIGTYPE_p_FunctionAdaptor,  0  | 0);
+    if (!SWIG_IsOK(res2)) {
+      SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_call" "', argument " "2"" of type '" "FunctionAdaptor""'"); 
+    }  
+    if (!argp2) {
+      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "Builder_call" "', argument " "2"" of type '" "FunctionAdaptor""'");
+    } else {
+      FunctionAdaptor * temp = reinterpret_cast< FunctionAdaptor * >(argp2);
+      arg2 = *temp;
+      if (SWIG_IsNewObj(res2)) delete temp;
+    }
   }
-  arg2 = reinterpret_cast< llvm::Value * >(argp2);
-  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Type, 0 |  0 );
-  if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_sitofp" "', argument " "3"" of type '" "llvm::Type *""'"); 
+  {
+    std::vector< llvm::Value*,std::allocator< llvm::Value * > > *ptr = (std::vector< llvm::Value*,std::allocator< llvm::Value * > > *)0;
+    int res = swig::asptr(obj2, &ptr);
+    if (!SWIG_IsOK(res) || !ptr) {
+      SWIG_exception_fail(SWIG_ArgError((ptr ? res : SWIG_TypeError)), "in method '" "Builder_call" "', argument " "3"" of type '" "std::vector< llvm::Value *,std::allocator< llvm::Value * > >""'"); 
+    }
+    arg3 = *ptr;
+    if (SWIG_IsNewObj(res)) delete ptr;
   }
-  arg3 = reinterpret_cast< llvm::Type * >(argp3);
-  result = (llvm::Value *)(arg1)->sitofp(arg2,arg3);
+  result = (llvm::Value *)(arg1)->call(arg2,arg3);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   return resultobj;
 fail:
@@ -20827,13 +23841,15 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_sitofp(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[5];
-  int ii;
+SWIGINTERN PyObject *_wrap_Builder_call(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 4) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
@@ -20843,15 +23859,13 @@ SWIGINTERN PyObject *_wrap_Builder_sitofp(PyObject *self, PyObject *args) {
     int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
     _v = SWIG_CheckState(res);
     if (_v) {
-      void *vptr = 0;
-      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Value, 0);
+      int res = SWIG_ConvertPtr(argv[1], 0, SWIGTYPE_p_FunctionAdaptor, 0);
       _v = SWIG_CheckState(res);
       if (_v) {
-        void *vptr = 0;
-        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Type, 0);
+        int res = swig::asptr(argv[2], (std::vector< llvm::Value*,std::allocator< llvm::Value * > >**)(0));
         _v = SWIG_CheckState(res);
         if (_v) {
-          return _wrap_Builder_sitofp__SWIG_1(self, args);
+          return _wrap_Builder_call__SWIG_1(self, args);
         }
       }
     }
@@ -20862,18 +23876,16 @@ SWIGINTERN PyObject *_wrap_Builder_sitofp(PyObject *self, PyObject *args) {
     int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
     _v = SWIG_CheckState(res);
     if (_v) {
-      void *vptr = 0;
-      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Value, 0);
+      int res = SWIG_ConvertPtr(argv[1], 0, SWIGTYPE_p_FunctionAdaptor, 0);
       _v = SWIG_CheckState(res);
       if (_v) {
-        void *vptr = 0;
-        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Type, 0);
+        int res = swig::asptr(argv[2], (std::vector< llvm::Value*,std::allocator< llvm::Value * > >**)(0));
         _v = SWIG_CheckState(res);
         if (_v) {
           int res = SWIG_AsCharPtrAndSize(argv[3], 0, NULL, 0);
           _v = SWIG_CheckState(res);
           if (_v) {
-            return _wrap_Builder_sitofp__SWIG_0(self, args);
+            return _wrap_Builder_call__SWIG_0(self, args);
           }
         }
       }
@@ -20881,99 +23893,138 @@ SWIGINTERN PyObject *_wrap_Builder_sitofp(PyObject *self, PyObject *args) {
   }
   
 fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_sitofp'.\n"
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_call'.\n"
     "  Possible C/C++ prototypes are:\n"
-    "    Builder::sitofp(llvm::Value *,llvm::Type *,char const *)\n"
-    "    Builder::sitofp(llvm::Value *,llvm::Type *)\n");
+    "    Builder::call(FunctionAdaptor,std::vector< llvm::Value *,std::allocator< llvm::Value * > >,char const *)\n"
+    "    Builder::call(FunctionAdaptor,std::vector< llvm::Value *,std::allocator< llvm::Value * > >)\n");
   return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_fptosi__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_unreachable(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  Builder *arg1 = (Builder *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:Builder_unreachable",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_unreachable" "', argument " "1"" of type '" "Builder *""'"); 
+  }
+  arg1 = reinterpret_cast< Builder * >(argp1);
+  (arg1)->unreachable();
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Builder_select__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
-  llvm::Type *arg3 = (llvm::Type *) 0 ;
-  char *arg4 = (char *) 0 ;
+  llvm::Value *arg3 = (llvm::Value *) 0 ;
+  llvm::Value *arg4 = (llvm::Value *) 0 ;
+  char *arg5 = (char *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   void *argp2 = 0 ;
   int res2 = 0 ;
   void *argp3 = 0 ;
   int res3 = 0 ;
-  int res4 ;
-  char *buf4 = 0 ;
-  int alloc4 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
+  int res5 ;
+  char *buf5 = 0 ;
+  int alloc5 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
   PyObject * obj3 = 0 ;
+  PyObject * obj4 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_fptosi",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOOO:Builder_select",&obj0,&obj1,&obj2,&obj3,&obj4)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_fptosi" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_select" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_fptosi" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_select" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
-  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Type, 0 |  0 );
+  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_fptosi" "', argument " "3"" of type '" "llvm::Type *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_select" "', argument " "3"" of type '" "llvm::Value *""'"); 
   }
-  arg3 = reinterpret_cast< llvm::Type * >(argp3);
-  res4 = SWIG_AsCharPtrAndSize(obj3, &buf4, NULL, &alloc4);
+  arg3 = reinterpret_cast< llvm::Value * >(argp3);
+  res4 = SWIG_ConvertPtr(obj3, &argp4,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_fptosi" "', argument " "4"" of type '" "char const *""'");
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_select" "', argument " "4"" of type '" "llvm::Value *""'"); 
   }
-  arg4 = reinterpret_cast< char * >(buf4);
-  result = (llvm::Value *)(arg1)->fptosi(arg2,arg3,(char const *)arg4);
+  arg4 = reinterpret_cast< llvm::Value * >(argp4);
+  res5 = SWIG_AsCharPtrAndSize(obj4, &buf5, NULL, &alloc5);
+  if (!SWIG_IsOK(res5)) {
+    SWIG_exception_fail(SWIG_ArgError(res5), "in method '" "Builder_select" "', argument " "5"" of type '" "char const *""'");
+  }
+  arg5 = reinterpret_cast< char * >(buf5);
+  result = (llvm::Value *)(arg1)->select(arg2,arg3,arg4,(char const *)arg5);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
-  if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
+  if (alloc5 == SWIG_NEWOBJ) delete[] buf5;
   return resultobj;
 fail:
-  if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
+  if (alloc5 == SWIG_NEWOBJ) delete[] buf5;
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_fptosi__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_select__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
-  llvm::Type *arg3 = (llvm::Type *) 0 ;
+  llvm::Value *arg3 = (llvm::Value *) 0 ;
+  llvm::Value *arg4 = (llvm::Value *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   void *argp2 = 0 ;
   int res2 = 0 ;
   void *argp3 = 0 ;
   int res3 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
+  PyObject * obj3 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_fptosi",&obj0,&obj1,&obj2)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_select",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_fptosi" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_select" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_fptosi" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_select" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
-  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Type, 0 |  0 );
+  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_fptosi" "', argument " "3"" of type '" "llvm::Type *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_select" "', argument " "3"" of type '" "llvm::Value *""'"); 
   }
-  arg3 = reinterpret_cast< llvm::Type * >(argp3);
-  result = (llvm::Value *)(arg1)->fptosi(arg2,arg3);
+  arg3 = reinterpret_cast< llvm::Value * >(argp3);
+  res4 = SWIG_ConvertPtr(obj3, &argp4,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_select" "', argument " "4"" of type '" "llvm::Value *""'"); 
+  }
+  arg4 = reinterpret_cast< llvm::Value * >(argp4);
+  result = (llvm::Value *)(arg1)->select(arg2,arg3,arg4);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   return resultobj;
 fail:
@@ -20981,17 +24032,19 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_fptosi(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[5];
-  int ii;
+SWIGINTERN PyObject *_wrap_Builder_select(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[6] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
-  for (ii = 0; (ii < 4) && (ii < argc); ii++) {
+  argc = args ? PyObject_Length(args) : 0;
+  for (ii = 0; (ii < 5) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
-  if (argc == 3) {
+  if (argc == 4) {
     int _v;
     void *vptr = 0;
     int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
@@ -21002,15 +24055,20 @@ SWIGINTERN PyObject *_wrap_Builder_fptosi(PyObject *self, PyObject *args) {
       _v = SWIG_CheckState(res);
       if (_v) {
         void *vptr = 0;
-        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Type, 0);
+        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
         _v = SWIG_CheckState(res);
         if (_v) {
-          return _wrap_Builder_fptosi__SWIG_1(self, args);
+          void *vptr = 0;
+          int res = SWIG_ConvertPtr(argv[3], &vptr, SWIGTYPE_p_llvm__Value, 0);
+          _v = SWIG_CheckState(res);
+          if (_v) {
+            return _wrap_Builder_select__SWIG_1(self, args);
+          }
         }
       }
     }
   }
-  if (argc == 4) {
+  if (argc == 5) {
     int _v;
     void *vptr = 0;
     int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
@@ -21021,13 +24079,18 @@ SWIGINTERN PyObject *_wrap_Builder_fptosi(PyObject *self, PyObject *args) {
       _v = SWIG_CheckState(res);
       if (_v) {
         void *vptr = 0;
-        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Type, 0);
+        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
         _v = SWIG_CheckState(res);
         if (_v) {
-          int res = SWIG_AsCharPtrAndSize(argv[3], 0, NULL, 0);
+          void *vptr = 0;
+          int res = SWIG_ConvertPtr(argv[3], &vptr, SWIGTYPE_p_llvm__Value, 0);
           _v = SWIG_CheckState(res);
           if (_v) {
-            return _wrap_Builder_fptosi__SWIG_0(self, args);
+            int res = SWIG_AsCharPtrAndSize(argv[4], 0, NULL, 0);
+            _v = SWIG_CheckState(res);
+            if (_v) {
+              return _wrap_Builder_select__SWIG_0(self, args);
+            }
           }
         }
       }
@@ -21035,99 +24098,81 @@ SWIGINTERN PyObject *_wrap_Builder_fptosi(PyObject *self, PyObject *args) {
   }
   
 fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_fptosi'.\n"
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_select'.\n"
     "  Possible C/C++ prototypes are:\n"
-    "    Builder::fptosi(llvm::Value *,llvm::Type *,char const *)\n"
-    "    Builder::fptosi(llvm::Value *,llvm::Type *)\n");
+    "    Builder::select(llvm::Value *,llvm::Value *,llvm::Value *,char const *)\n"
+    "    Builder::select(llvm::Value *,llvm::Value *,llvm::Value *)\n");
   return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_uitofp__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_alloc__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
-  llvm::Value *arg2 = (llvm::Value *) 0 ;
-  llvm::Type *arg3 = (llvm::Type *) 0 ;
-  char *arg4 = (char *) 0 ;
+  llvm::Type *arg2 = (llvm::Type *) 0 ;
+  char *arg3 = (char *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   void *argp2 = 0 ;
   int res2 = 0 ;
-  void *argp3 = 0 ;
-  int res3 = 0 ;
-  int res4 ;
-  char *buf4 = 0 ;
-  int alloc4 = 0 ;
+  int res3 ;
+  char *buf3 = 0 ;
+  int alloc3 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
-  PyObject * obj3 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_uitofp",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_alloc",&obj0,&obj1,&obj2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_uitofp" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_alloc" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Type, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_uitofp" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_alloc" "', argument " "2"" of type '" "llvm::Type *""'"); 
   }
-  arg2 = reinterpret_cast< llvm::Value * >(argp2);
-  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Type, 0 |  0 );
+  arg2 = reinterpret_cast< llvm::Type * >(argp2);
+  res3 = SWIG_AsCharPtrAndSize(obj2, &buf3, NULL, &alloc3);
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_uitofp" "', argument " "3"" of type '" "llvm::Type *""'"); 
-  }
-  arg3 = reinterpret_cast< llvm::Type * >(argp3);
-  res4 = SWIG_AsCharPtrAndSize(obj3, &buf4, NULL, &alloc4);
-  if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_uitofp" "', argument " "4"" of type '" "char const *""'");
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_alloc" "', argument " "3"" of type '" "char const *""'");
   }
-  arg4 = reinterpret_cast< char * >(buf4);
-  result = (llvm::Value *)(arg1)->uitofp(arg2,arg3,(char const *)arg4);
+  arg3 = reinterpret_cast< char * >(buf3);
+  result = (llvm::Value *)(arg1)->alloc(arg2,(char const *)arg3);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
-  if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
+  if (alloc3 == SWIG_NEWOBJ) delete[] buf3;
   return resultobj;
 fail:
-  if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
+  if (alloc3 == SWIG_NEWOBJ) delete[] buf3;
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_uitofp__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_alloc__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
-  llvm::Value *arg2 = (llvm::Value *) 0 ;
-  llvm::Type *arg3 = (llvm::Type *) 0 ;
+  llvm::Type *arg2 = (llvm::Type *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   void *argp2 = 0 ;
   int res2 = 0 ;
-  void *argp3 = 0 ;
-  int res3 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
-  PyObject * obj2 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_uitofp",&obj0,&obj1,&obj2)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OO:Builder_alloc",&obj0,&obj1)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_uitofp" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_alloc" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Type, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_uitofp" "', argument " "2"" of type '" "llvm::Value *""'"); 
-  }
-  arg2 = reinterpret_cast< llvm::Value * >(argp2);
-  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Type, 0 |  0 );
-  if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_uitofp" "', argument " "3"" of type '" "llvm::Type *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_alloc" "', argument " "2"" of type '" "llvm::Type *""'"); 
   }
-  arg3 = reinterpret_cast< llvm::Type * >(argp3);
-  result = (llvm::Value *)(arg1)->uitofp(arg2,arg3);
+  arg2 = reinterpret_cast< llvm::Type * >(argp2);
+  result = (llvm::Value *)(arg1)->alloc(arg2);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   return resultobj;
 fail:
@@ -21135,73 +24180,65 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_uitofp(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[5];
-  int ii;
+SWIGINTERN PyObject *_wrap_Builder_alloc(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[4] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
-  for (ii = 0; (ii < 4) && (ii < argc); ii++) {
+  argc = args ? PyObject_Length(args) : 0;
+  for (ii = 0; (ii < 3) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
-  if (argc == 3) {
+  if (argc == 2) {
     int _v;
     void *vptr = 0;
     int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
     _v = SWIG_CheckState(res);
     if (_v) {
       void *vptr = 0;
-      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Value, 0);
+      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Type, 0);
       _v = SWIG_CheckState(res);
       if (_v) {
-        void *vptr = 0;
-        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Type, 0);
-        _v = SWIG_CheckState(res);
-        if (_v) {
-          return _wrap_Builder_uitofp__SWIG_1(self, args);
-        }
+        return _wrap_Builder_alloc__SWIG_1(self, args);
       }
     }
   }
-  if (argc == 4) {
+  if (argc == 3) {
     int _v;
     void *vptr = 0;
     int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
     _v = SWIG_CheckState(res);
     if (_v) {
       void *vptr = 0;
-      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Value, 0);
+      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Type, 0);
       _v = SWIG_CheckState(res);
       if (_v) {
-        void *vptr = 0;
-        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Type, 0);
+        int res = SWIG_AsCharPtrAndSize(argv[2], 0, NULL, 0);
         _v = SWIG_CheckState(res);
         if (_v) {
-          int res = SWIG_AsCharPtrAndSize(argv[3], 0, NULL, 0);
-          _v = SWIG_CheckState(res);
-          if (_v) {
-            return _wrap_Builder_uitofp__SWIG_0(self, args);
-          }
+          return _wrap_Builder_alloc__SWIG_0(self, args);
         }
       }
     }
   }
   
 fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_uitofp'.\n"
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_alloc'.\n"
     "  Possible C/C++ prototypes are:\n"
-    "    Builder::uitofp(llvm::Value *,llvm::Type *,char const *)\n"
-    "    Builder::uitofp(llvm::Value *,llvm::Type *)\n");
+    "    Builder::alloc(llvm::Type *,char const *)\n"
+    "    Builder::alloc(llvm::Type *)\n");
   return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_fptoui__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_alloc_array__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
-  llvm::Value *arg2 = (llvm::Value *) 0 ;
-  llvm::Type *arg3 = (llvm::Type *) 0 ;
+  llvm::Type *arg2 = (llvm::Type *) 0 ;
+  llvm::Value *arg3 = (llvm::Value *) 0 ;
   char *arg4 = (char *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -21218,28 +24255,28 @@ SWIGINTERN PyObject *_wrap_Builder_fptoui__SWIG_0(PyObject *SWIGUNUSEDPARM(self)
   PyObject * obj3 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_fptoui",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_alloc_array",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_fptoui" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_alloc_array" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Type, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_fptoui" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_alloc_array" "', argument " "2"" of type '" "llvm::Type *""'"); 
   }
-  arg2 = reinterpret_cast< llvm::Value * >(argp2);
-  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Type, 0 |  0 );
+  arg2 = reinterpret_cast< llvm::Type * >(argp2);
+  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_fptoui" "', argument " "3"" of type '" "llvm::Type *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_alloc_array" "', argument " "3"" of type '" "llvm::Value *""'"); 
   }
-  arg3 = reinterpret_cast< llvm::Type * >(argp3);
+  arg3 = reinterpret_cast< llvm::Value * >(argp3);
   res4 = SWIG_AsCharPtrAndSize(obj3, &buf4, NULL, &alloc4);
   if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_fptoui" "', argument " "4"" of type '" "char const *""'");
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_alloc_array" "', argument " "4"" of type '" "char const *""'");
   }
   arg4 = reinterpret_cast< char * >(buf4);
-  result = (llvm::Value *)(arg1)->fptoui(arg2,arg3,(char const *)arg4);
+  result = (llvm::Value *)(arg1)->alloc_array(arg2,arg3,(char const *)arg4);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
   return resultobj;
@@ -21249,11 +24286,11 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_fptoui__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_alloc_array__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
-  llvm::Value *arg2 = (llvm::Value *) 0 ;
-  llvm::Type *arg3 = (llvm::Type *) 0 ;
+  llvm::Type *arg2 = (llvm::Type *) 0 ;
+  llvm::Value *arg3 = (llvm::Value *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   void *argp2 = 0 ;
@@ -21265,23 +24302,23 @@ SWIGINTERN PyObject *_wrap_Builder_fptoui__SWIG_1(PyObject *SWIGUNUSEDPARM(self)
   PyObject * obj2 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_fptoui",&obj0,&obj1,&obj2)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_alloc_array",&obj0,&obj1,&obj2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_fptoui" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_alloc_array" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Type, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_fptoui" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_alloc_array" "', argument " "2"" of type '" "llvm::Type *""'"); 
   }
-  arg2 = reinterpret_cast< llvm::Value * >(argp2);
-  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Type, 0 |  0 );
+  arg2 = reinterpret_cast< llvm::Type * >(argp2);
+  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_fptoui" "', argument " "3"" of type '" "llvm::Type *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_alloc_array" "', argument " "3"" of type '" "llvm::Value *""'"); 
   }
-  arg3 = reinterpret_cast< llvm::Type * >(argp3);
-  result = (llvm::Value *)(arg1)->fptoui(arg2,arg3);
+  arg3 = reinterpret_cast< llvm::Value * >(argp3);
+  result = (llvm::Value *)(arg1)->alloc_array(arg2,arg3);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   return resultobj;
 fail:
@@ -21289,13 +24326,15 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_fptoui(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[5];
-  int ii;
+SWIGINTERN PyObject *_wrap_Builder_alloc_array(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 4) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
@@ -21306,14 +24345,14 @@ SWIGINTERN PyObject *_wrap_Builder_fptoui(PyObject *self, PyObject *args) {
     _v = SWIG_CheckState(res);
     if (_v) {
       void *vptr = 0;
-      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Value, 0);
+      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Type, 0);
       _v = SWIG_CheckState(res);
       if (_v) {
         void *vptr = 0;
-        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Type, 0);
+        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
         _v = SWIG_CheckState(res);
         if (_v) {
-          return _wrap_Builder_fptoui__SWIG_1(self, args);
+          return _wrap_Builder_alloc_array__SWIG_1(self, args);
         }
       }
     }
@@ -21325,17 +24364,17 @@ SWIGINTERN PyObject *_wrap_Builder_fptoui(PyObject *self, PyObject *args) {
     _v = SWIG_CheckState(res);
     if (_v) {
       void *vptr = 0;
-      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Value, 0);
+      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Type, 0);
       _v = SWIG_CheckState(res);
       if (_v) {
         void *vptr = 0;
-        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Type, 0);
+        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
         _v = SWIG_CheckState(res);
         if (_v) {
           int res = SWIG_AsCharPtrAndSize(argv[3], 0, NULL, 0);
           _v = SWIG_CheckState(res);
           if (_v) {
-            return _wrap_Builder_fptoui__SWIG_0(self, args);
+            return _wrap_Builder_alloc_array__SWIG_0(self, args);
           }
         }
       }
@@ -21343,153 +24382,154 @@ SWIGINTERN PyObject *_wrap_Builder_fptoui(PyObject *self, PyObject *args) {
   }
   
 fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_fptoui'.\n"
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_alloc_array'.\n"
     "  Possible C/C++ prototypes are:\n"
-    "    Builder::fptoui(llvm::Value *,llvm::Type *,char const *)\n"
-    "    Builder::fptoui(llvm::Value *,llvm::Type *)\n");
+    "    Builder::alloc_array(llvm::Type *,llvm::Value *,char const *)\n"
+    "    Builder::alloc_array(llvm::Type *,llvm::Value *)\n");
   return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_ret(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_load__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
+  char *arg3 = (char *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   void *argp2 = 0 ;
   int res2 = 0 ;
+  int res3 ;
+  char *buf3 = 0 ;
+  int alloc3 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:Builder_ret",&obj0,&obj1)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_load",&obj0,&obj1,&obj2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_ret" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_load" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_ret" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_load" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
-  (arg1)->ret(arg2);
-  resultobj = SWIG_Py_Void();
-  return resultobj;
-fail:
-  return NULL;
-}
-
-
-SWIGINTERN PyObject *_wrap_Builder_ret_void(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *resultobj = 0;
-  Builder *arg1 = (Builder *) 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  PyObject * obj0 = 0 ;
-  
-  if (!PyArg_ParseTuple(args,(char *)"O:Builder_ret_void",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_ret_void" "', argument " "1"" of type '" "Builder *""'"); 
+  res3 = SWIG_AsCharPtrAndSize(obj2, &buf3, NULL, &alloc3);
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_load" "', argument " "3"" of type '" "char const *""'");
   }
-  arg1 = reinterpret_cast< Builder * >(argp1);
-  (arg1)->ret_void();
-  resultobj = SWIG_Py_Void();
+  arg3 = reinterpret_cast< char * >(buf3);
+  result = (llvm::Value *)(arg1)->load(arg2,(char const *)arg3);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
+  if (alloc3 == SWIG_NEWOBJ) delete[] buf3;
   return resultobj;
 fail:
+  if (alloc3 == SWIG_NEWOBJ) delete[] buf3;
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_branch(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_load__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
-  llvm::BasicBlock *arg2 = (llvm::BasicBlock *) 0 ;
+  llvm::Value *arg2 = (llvm::Value *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   void *argp2 = 0 ;
   int res2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
+  llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:Builder_branch",&obj0,&obj1)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OO:Builder_load",&obj0,&obj1)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_branch" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_load" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__BasicBlock, 0 |  0 );
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_branch" "', argument " "2"" of type '" "llvm::BasicBlock *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_load" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
-  arg2 = reinterpret_cast< llvm::BasicBlock * >(argp2);
-  (arg1)->branch(arg2);
-  resultobj = SWIG_Py_Void();
+  arg2 = reinterpret_cast< llvm::Value * >(argp2);
+  result = (llvm::Value *)(arg1)->load(arg2);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_cond_branch(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *resultobj = 0;
-  Builder *arg1 = (Builder *) 0 ;
-  llvm::Value *arg2 = (llvm::Value *) 0 ;
-  llvm::BasicBlock *arg3 = (llvm::BasicBlock *) 0 ;
-  llvm::BasicBlock *arg4 = (llvm::BasicBlock *) 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  void *argp3 = 0 ;
-  int res3 = 0 ;
-  void *argp4 = 0 ;
-  int res4 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
-  PyObject * obj2 = 0 ;
-  PyObject * obj3 = 0 ;
+SWIGINTERN PyObject *_wrap_Builder_load(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[4] = {
+    0
+  };
+  Py_ssize_t ii;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_cond_branch",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_cond_branch" "', argument " "1"" of type '" "Builder *""'"); 
-  }
-  arg1 = reinterpret_cast< Builder * >(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_cond_branch" "', argument " "2"" of type '" "llvm::Value *""'"); 
+  if (!PyTuple_Check(args)) SWIG_fail;
+  argc = args ? PyObject_Length(args) : 0;
+  for (ii = 0; (ii < 3) && (ii < argc); ii++) {
+    argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
-  arg2 = reinterpret_cast< llvm::Value * >(argp2);
-  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__BasicBlock, 0 |  0 );
-  if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_cond_branch" "', argument " "3"" of type '" "llvm::BasicBlock *""'"); 
+  if (argc == 2) {
+    int _v;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      void *vptr = 0;
+      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Value, 0);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        return _wrap_Builder_load__SWIG_1(self, args);
+      }
+    }
   }
-  arg3 = reinterpret_cast< llvm::BasicBlock * >(argp3);
-  res4 = SWIG_ConvertPtr(obj3, &argp4,SWIGTYPE_p_llvm__BasicBlock, 0 |  0 );
-  if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_cond_branch" "', argument " "4"" of type '" "llvm::BasicBlock *""'"); 
+  if (argc == 3) {
+    int _v;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      void *vptr = 0;
+      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Value, 0);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        int res = SWIG_AsCharPtrAndSize(argv[2], 0, NULL, 0);
+        _v = SWIG_CheckState(res);
+        if (_v) {
+          return _wrap_Builder_load__SWIG_0(self, args);
+        }
+      }
+    }
   }
-  arg4 = reinterpret_cast< llvm::BasicBlock * >(argp4);
-  (arg1)->cond_branch(arg2,arg3,arg4);
-  resultobj = SWIG_Py_Void();
-  return resultobj;
+  
 fail:
-  return NULL;
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_load'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    Builder::load(llvm::Value *,char const *)\n"
+    "    Builder::load(llvm::Value *)\n");
+  return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_call__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_load_aligned__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
-  SwigValueWrapper< FunctionAdaptor > arg2 ;
-  std::vector< llvm::Value *,std::allocator< llvm::Value * > > arg3 ;
+  llvm::Value *arg2 = (llvm::Value *) 0 ;
+  unsigned int arg3 ;
   char *arg4 = (char *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 ;
+  void *argp2 = 0 ;
   int res2 = 0 ;
+  unsigned int val3 ;
+  int ecode3 = 0 ;
   int res4 ;
   char *buf4 = 0 ;
   int alloc4 = 0 ;
@@ -21499,40 +24539,28 @@ SWIGINTERN PyObject *_wrap_Builder_call__SWIG_0(PyObject *SWIGUNUSEDPARM(self),
   PyObject * obj3 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_call",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_load_aligned",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_call" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_load_aligned" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
-  {
-    res2 = SWIG_ConvertPtr(obj1, &argp2, SWIGTYPE_p_FunctionAdaptor,  0  | 0);
-    if (!SWIG_IsOK(res2)) {
-      SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_call" "', argument " "2"" of type '" "FunctionAdaptor""'"); 
-    }  
-    if (!argp2) {
-      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "Builder_call" "', argument " "2"" of type '" "FunctionAdaptor""'");
-    } else {
-      FunctionAdaptor * temp = reinterpret_cast< FunctionAdaptor * >(argp2);
-      arg2 = *temp;
-      if (SWIG_IsNewObj(res2)) delete temp;
-    }
-  }
-  {
-    std::vector<llvm::Value*,std::allocator< llvm::Value * > > *ptr = (std::vector<llvm::Value*,std::allocator< llvm::Value * > > *)0;
-    int res = swig::asptr(obj2, &ptr);
-    if (!SWIG_IsOK(res) || !ptr) {
-      SWIG_exception_fail(SWIG_ArgError((ptr ? res : SWIG_TypeError)), "in method '" "Builder_call" "', argument " "3"" of type '" "std::vector< llvm::Value *,std::allocator< llvm::Value * > >""'"); 
-    }
-    arg3 = *ptr;
-    if (SWIG_IsNewObj(res)) delete ptr;
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_load_aligned" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
+  arg2 = reinterpret_cast< llvm::Value * >(argp2);
+  ecode3 = SWIG_AsVal_unsigned_SS_int(obj2, &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "Builder_load_aligned" "', argument " "3"" of type '" "unsigned int""'");
+  } 
+  arg3 = static_cast< unsigned int >(val3);
   res4 = SWIG_AsCharPtrAndSize(obj3, &buf4, NULL, &alloc4);
   if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_call" "', argument " "4"" of type '" "char const *""'");
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_load_aligned" "', argument " "4"" of type '" "char const *""'");
   }
   arg4 = reinterpret_cast< char * >(buf4);
-  result = (llvm::Value *)(arg1)->call(arg2,arg3,(char const *)arg4);
+  result = (llvm::Value *)(arg1)->load_aligned(arg2,arg3,(char const *)arg4);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
   return resultobj;
@@ -21542,49 +24570,39 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_call__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_load_aligned__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
-  SwigValueWrapper< FunctionAdaptor > arg2 ;
-  std::vector< llvm::Value *,std::allocator< llvm::Value * > > arg3 ;
+  llvm::Value *arg2 = (llvm::Value *) 0 ;
+  unsigned int arg3 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 ;
+  void *argp2 = 0 ;
   int res2 = 0 ;
+  unsigned int val3 ;
+  int ecode3 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_call",&obj0,&obj1,&obj2)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_load_aligned",&obj0,&obj1,&obj2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_call" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_load_aligned" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
-  {
-    res2 = SWIG_ConvertPtr(obj1, &argp2, SWIGTYPE_p_FunctionAdaptor,  0  | 0);
-    if (!SWIG_IsOK(res2)) {
-      SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_call" "', argument " "2"" of type '" "FunctionAdaptor""'"); 
-    }  
-    if (!argp2) {
-      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "Builder_call" "', argument " "2"" of type '" "FunctionAdaptor""'");
-    } else {
-      FunctionAdaptor * temp = reinterpret_cast< FunctionAdaptor * >(argp2);
-      arg2 = *temp;
-      if (SWIG_IsNewObj(res2)) delete temp;
-    }
-  }
-  {
-    std::vector<llvm::Value*,std::allocator< llvm::Value * > > *ptr = (std::vector<llvm::Value*,std::allocator< llvm::Value * > > *)0;
-    int res = swig::asptr(obj2, &ptr);
-    if (!SWIG_IsOK(res) || !ptr) {
-      SWIG_exception_fail(SWIG_ArgError((ptr ? res : SWIG_TypeError)), "in method '" "Builder_call" "', argument " "3"" of type '" "std::vector< llvm::Value *,std::allocator< llvm::Value * > >""'"); 
-    }
-    arg3 = *ptr;
-    if (SWIG_IsNewObj(res)) delete ptr;
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_load_aligned" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
-  result = (llvm::Value *)(arg1)->call(arg2,arg3);
+  arg2 = reinterpret_cast< llvm::Value * >(argp2);
+  ecode3 = SWIG_AsVal_unsigned_SS_int(obj2, &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "Builder_load_aligned" "', argument " "3"" of type '" "unsigned int""'");
+  } 
+  arg3 = static_cast< unsigned int >(val3);
+  result = (llvm::Value *)(arg1)->load_aligned(arg2,arg3);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   return resultobj;
 fail:
@@ -21592,13 +24610,15 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_call(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[5];
-  int ii;
+SWIGINTERN PyObject *_wrap_Builder_load_aligned(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 4) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
@@ -21608,13 +24628,16 @@ SWIGINTERN PyObject *_wrap_Builder_call(PyObject *self, PyObject *args) {
     int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
     _v = SWIG_CheckState(res);
     if (_v) {
-      int res = SWIG_ConvertPtr(argv[1], 0, SWIGTYPE_p_FunctionAdaptor, 0);
+      void *vptr = 0;
+      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Value, 0);
       _v = SWIG_CheckState(res);
       if (_v) {
-        int res = swig::asptr(argv[2], (std::vector<llvm::Value*,std::allocator< llvm::Value * > >**)(0));
-        _v = SWIG_CheckState(res);
+        {
+          int res = SWIG_AsVal_unsigned_SS_int(argv[2], NULL);
+          _v = SWIG_CheckState(res);
+        }
         if (_v) {
-          return _wrap_Builder_call__SWIG_1(self, args);
+          return _wrap_Builder_load_aligned__SWIG_1(self, args);
         }
       }
     }
@@ -21625,16 +24648,19 @@ SWIGINTERN PyObject *_wrap_Builder_call(PyObject *self, PyObject *args) {
     int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
     _v = SWIG_CheckState(res);
     if (_v) {
-      int res = SWIG_ConvertPtr(argv[1], 0, SWIGTYPE_p_FunctionAdaptor, 0);
+      void *vptr = 0;
+      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Value, 0);
       _v = SWIG_CheckState(res);
       if (_v) {
-        int res = swig::asptr(argv[2], (std::vector<llvm::Value*,std::allocator< llvm::Value * > >**)(0));
-        _v = SWIG_CheckState(res);
+        {
+          int res = SWIG_AsVal_unsigned_SS_int(argv[2], NULL);
+          _v = SWIG_CheckState(res);
+        }
         if (_v) {
           int res = SWIG_AsCharPtrAndSize(argv[3], 0, NULL, 0);
           _v = SWIG_CheckState(res);
           if (_v) {
-            return _wrap_Builder_call__SWIG_0(self, args);
+            return _wrap_Builder_load_aligned__SWIG_0(self, args);
           }
         }
       }
@@ -21642,165 +24668,107 @@ SWIGINTERN PyObject *_wrap_Builder_call(PyObject *self, PyObject *args) {
   }
   
 fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_call'.\n"
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_load_aligned'.\n"
     "  Possible C/C++ prototypes are:\n"
-    "    Builder::call(FunctionAdaptor,std::vector< llvm::Value *,std::allocator< llvm::Value * > >,char const *)\n"
-    "    Builder::call(FunctionAdaptor,std::vector< llvm::Value *,std::allocator< llvm::Value * > >)\n");
+    "    Builder::load_aligned(llvm::Value *,unsigned int,char const *)\n"
+    "    Builder::load_aligned(llvm::Value *,unsigned int)\n");
   return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_unreachable(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *resultobj = 0;
-  Builder *arg1 = (Builder *) 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  PyObject * obj0 = 0 ;
-  
-  if (!PyArg_ParseTuple(args,(char *)"O:Builder_unreachable",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_unreachable" "', argument " "1"" of type '" "Builder *""'"); 
-  }
-  arg1 = reinterpret_cast< Builder * >(argp1);
-  (arg1)->unreachable();
-  resultobj = SWIG_Py_Void();
-  return resultobj;
-fail:
-  return NULL;
-}
-
-
-SWIGINTERN PyObject *_wrap_Builder_alloc__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_store(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
-  llvm::Type *arg2 = (llvm::Type *) 0 ;
-  char *arg3 = (char *) 0 ;
+  llvm::Value *arg2 = (llvm::Value *) 0 ;
+  llvm::Value *arg3 = (llvm::Value *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   void *argp2 = 0 ;
   int res2 = 0 ;
-  int res3 ;
-  char *buf3 = 0 ;
-  int alloc3 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_alloc",&obj0,&obj1,&obj2)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_store",&obj0,&obj1,&obj2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_alloc" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_store" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Type, 0 |  0 );
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_alloc" "', argument " "2"" of type '" "llvm::Type *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_store" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
-  arg2 = reinterpret_cast< llvm::Type * >(argp2);
-  res3 = SWIG_AsCharPtrAndSize(obj2, &buf3, NULL, &alloc3);
+  arg2 = reinterpret_cast< llvm::Value * >(argp2);
+  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_alloc" "', argument " "3"" of type '" "char const *""'");
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_store" "', argument " "3"" of type '" "llvm::Value *""'"); 
   }
-  arg3 = reinterpret_cast< char * >(buf3);
-  result = (llvm::Value *)(arg1)->alloc(arg2,(char const *)arg3);
+  arg3 = reinterpret_cast< llvm::Value * >(argp3);
+  result = (llvm::Value *)(arg1)->store(arg2,arg3);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
-  if (alloc3 == SWIG_NEWOBJ) delete[] buf3;
   return resultobj;
 fail:
-  if (alloc3 == SWIG_NEWOBJ) delete[] buf3;
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_alloc__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_store_aligned(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
-  llvm::Type *arg2 = (llvm::Type *) 0 ;
+  llvm::Value *arg2 = (llvm::Value *) 0 ;
+  llvm::Value *arg3 = (llvm::Value *) 0 ;
+  unsigned int arg4 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   void *argp2 = 0 ;
   int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  unsigned int val4 ;
+  int ecode4 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  PyObject * obj3 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:Builder_alloc",&obj0,&obj1)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_store_aligned",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_alloc" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_store_aligned" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Type, 0 |  0 );
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_alloc" "', argument " "2"" of type '" "llvm::Type *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_store_aligned" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
-  arg2 = reinterpret_cast< llvm::Type * >(argp2);
-  result = (llvm::Value *)(arg1)->alloc(arg2);
+  arg2 = reinterpret_cast< llvm::Value * >(argp2);
+  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_store_aligned" "', argument " "3"" of type '" "llvm::Value *""'"); 
+  }
+  arg3 = reinterpret_cast< llvm::Value * >(argp3);
+  ecode4 = SWIG_AsVal_unsigned_SS_int(obj3, &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "Builder_store_aligned" "', argument " "4"" of type '" "unsigned int""'");
+  } 
+  arg4 = static_cast< unsigned int >(val4);
+  result = (llvm::Value *)(arg1)->store_aligned(arg2,arg3,arg4);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   return resultobj;
 fail:
-  return NULL;
-}
-
-
-SWIGINTERN PyObject *_wrap_Builder_alloc(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[4];
-  int ii;
-  
-  if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
-  for (ii = 0; (ii < 3) && (ii < argc); ii++) {
-    argv[ii] = PyTuple_GET_ITEM(args,ii);
-  }
-  if (argc == 2) {
-    int _v;
-    void *vptr = 0;
-    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
-    _v = SWIG_CheckState(res);
-    if (_v) {
-      void *vptr = 0;
-      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Type, 0);
-      _v = SWIG_CheckState(res);
-      if (_v) {
-        return _wrap_Builder_alloc__SWIG_1(self, args);
-      }
-    }
-  }
-  if (argc == 3) {
-    int _v;
-    void *vptr = 0;
-    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
-    _v = SWIG_CheckState(res);
-    if (_v) {
-      void *vptr = 0;
-      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Type, 0);
-      _v = SWIG_CheckState(res);
-      if (_v) {
-        int res = SWIG_AsCharPtrAndSize(argv[2], 0, NULL, 0);
-        _v = SWIG_CheckState(res);
-        if (_v) {
-          return _wrap_Builder_alloc__SWIG_0(self, args);
-        }
-      }
-    }
-  }
-  
-fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_alloc'.\n"
-    "  Possible C/C++ prototypes are:\n"
-    "    Builder::alloc(llvm::Type *,char const *)\n"
-    "    Builder::alloc(llvm::Type *)\n");
-  return 0;
+  return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_alloc_array__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_gep__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
-  llvm::Type *arg2 = (llvm::Type *) 0 ;
+  llvm::Value *arg2 = (llvm::Value *) 0 ;
   llvm::Value *arg3 = (llvm::Value *) 0 ;
   char *arg4 = (char *) 0 ;
   void *argp1 = 0 ;
@@ -21818,28 +24786,28 @@ SWIGINTERN PyObject *_wrap_Builder_alloc_array__SWIG_0(PyObject *SWIGUNUSEDPARM(
   PyObject * obj3 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_alloc_array",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_gep",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_alloc_array" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_gep" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Type, 0 |  0 );
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_alloc_array" "', argument " "2"" of type '" "llvm::Type *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_gep" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
-  arg2 = reinterpret_cast< llvm::Type * >(argp2);
+  arg2 = reinterpret_cast< llvm::Value * >(argp2);
   res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_alloc_array" "', argument " "3"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_gep" "', argument " "3"" of type '" "llvm::Value *""'"); 
   }
   arg3 = reinterpret_cast< llvm::Value * >(argp3);
   res4 = SWIG_AsCharPtrAndSize(obj3, &buf4, NULL, &alloc4);
   if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_alloc_array" "', argument " "4"" of type '" "char const *""'");
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_gep" "', argument " "4"" of type '" "char const *""'");
   }
   arg4 = reinterpret_cast< char * >(buf4);
-  result = (llvm::Value *)(arg1)->alloc_array(arg2,arg3,(char const *)arg4);
+  result = (llvm::Value *)(arg1)->gep(arg2,arg3,(char const *)arg4);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
   return resultobj;
@@ -21849,10 +24817,10 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_alloc_array__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_gep__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
-  llvm::Type *arg2 = (llvm::Type *) 0 ;
+  llvm::Value *arg2 = (llvm::Value *) 0 ;
   llvm::Value *arg3 = (llvm::Value *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -21865,23 +24833,23 @@ SWIGINTERN PyObject *_wrap_Builder_alloc_array__SWIG_1(PyObject *SWIGUNUSEDPARM(
   PyObject * obj2 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_alloc_array",&obj0,&obj1,&obj2)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_gep",&obj0,&obj1,&obj2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_alloc_array" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_gep" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Type, 0 |  0 );
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_alloc_array" "', argument " "2"" of type '" "llvm::Type *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_gep" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
-  arg2 = reinterpret_cast< llvm::Type * >(argp2);
+  arg2 = reinterpret_cast< llvm::Value * >(argp2);
   res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_alloc_array" "', argument " "3"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_gep" "', argument " "3"" of type '" "llvm::Value *""'"); 
   }
   arg3 = reinterpret_cast< llvm::Value * >(argp3);
-  result = (llvm::Value *)(arg1)->alloc_array(arg2,arg3);
+  result = (llvm::Value *)(arg1)->gep(arg2,arg3);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   return resultobj;
 fail:
@@ -21889,13 +24857,15 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_alloc_array(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[5];
-  int ii;
+SWIGINTERN PyObject *_wrap_Builder_gep(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 4) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
@@ -21906,14 +24876,14 @@ SWIGINTERN PyObject *_wrap_Builder_alloc_array(PyObject *self, PyObject *args) {
     _v = SWIG_CheckState(res);
     if (_v) {
       void *vptr = 0;
-      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Type, 0);
+      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Value, 0);
       _v = SWIG_CheckState(res);
       if (_v) {
         void *vptr = 0;
         int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
         _v = SWIG_CheckState(res);
         if (_v) {
-          return _wrap_Builder_alloc_array__SWIG_1(self, args);
+          return _wrap_Builder_gep__SWIG_1(self, args);
         }
       }
     }
@@ -21925,7 +24895,7 @@ SWIGINTERN PyObject *_wrap_Builder_alloc_array(PyObject *self, PyObject *args) {
     _v = SWIG_CheckState(res);
     if (_v) {
       void *vptr = 0;
-      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Type, 0);
+      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Value, 0);
       _v = SWIG_CheckState(res);
       if (_v) {
         void *vptr = 0;
@@ -21935,7 +24905,7 @@ SWIGINTERN PyObject *_wrap_Builder_alloc_array(PyObject *self, PyObject *args) {
           int res = SWIG_AsCharPtrAndSize(argv[3], 0, NULL, 0);
           _v = SWIG_CheckState(res);
           if (_v) {
-            return _wrap_Builder_alloc_array__SWIG_0(self, args);
+            return _wrap_Builder_gep__SWIG_0(self, args);
           }
         }
       }
@@ -21943,81 +24913,103 @@ SWIGINTERN PyObject *_wrap_Builder_alloc_array(PyObject *self, PyObject *args) {
   }
   
 fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_alloc_array'.\n"
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_gep'.\n"
     "  Possible C/C++ prototypes are:\n"
-    "    Builder::alloc_array(llvm::Type *,llvm::Value *,char const *)\n"
-    "    Builder::alloc_array(llvm::Type *,llvm::Value *)\n");
+    "    Builder::gep(llvm::Value *,llvm::Value *,char const *)\n"
+    "    Builder::gep(llvm::Value *,llvm::Value *)\n");
   return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_load__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_gep2__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
-  char *arg3 = (char *) 0 ;
+  std::vector< llvm::Value *,std::allocator< llvm::Value * > > arg3 ;
+  char *arg4 = (char *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   void *argp2 = 0 ;
   int res2 = 0 ;
-  int res3 ;
-  char *buf3 = 0 ;
-  int alloc3 = 0 ;
+  int res4 ;
+  char *buf4 = 0 ;
+  int alloc4 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
+  PyObject * obj3 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_load",&obj0,&obj1,&obj2)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_gep2",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_load" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_gep2" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_load" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_gep2" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
-  res3 = SWIG_AsCharPtrAndSize(obj2, &buf3, NULL, &alloc3);
-  if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_load" "', argument " "3"" of type '" "char const *""'");
+  {
+    std::vector< llvm::Value*,std::allocator< llvm::Value * > > *ptr = (std::vector< llvm::Value*,std::allocator< llvm::Value * > > *)0;
+    int res = swig::asptr(obj2, &ptr);
+    if (!SWIG_IsOK(res) || !ptr) {
+      SWIG_exception_fail(SWIG_ArgError((ptr ? res : SWIG_TypeError)), "in method '" "Builder_gep2" "', argument " "3"" of type '" "std::vector< llvm::Value *,std::allocator< llvm::Value * > >""'"); 
+    }
+    arg3 = *ptr;
+    if (SWIG_IsNewObj(res)) delete ptr;
   }
-  arg3 = reinterpret_cast< char * >(buf3);
-  result = (llvm::Value *)(arg1)->load(arg2,(char const *)arg3);
+  res4 = SWIG_AsCharPtrAndSize(obj3, &buf4, NULL, &alloc4);
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_gep2" "', argument " "4"" of type '" "char const *""'");
+  }
+  arg4 = reinterpret_cast< char * >(buf4);
+  result = (llvm::Value *)(arg1)->gep2(arg2,arg3,(char const *)arg4);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
-  if (alloc3 == SWIG_NEWOBJ) delete[] buf3;
+  if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
   return resultobj;
 fail:
-  if (alloc3 == SWIG_NEWOBJ) delete[] buf3;
+  if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_load__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_gep2__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
+  std::vector< llvm::Value *,std::allocator< llvm::Value * > > arg3 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   void *argp2 = 0 ;
   int res2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:Builder_load",&obj0,&obj1)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_gep2",&obj0,&obj1,&obj2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_load" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_gep2" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_load" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_gep2" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
-  result = (llvm::Value *)(arg1)->load(arg2);
+  {
+    std::vector< llvm::Value*,std::allocator< llvm::Value * > > *ptr = (std::vector< llvm::Value*,std::allocator< llvm::Value * > > *)0;
+    int res = swig::asptr(obj2, &ptr);
+    if (!SWIG_IsOK(res) || !ptr) {
+      SWIG_exception_fail(SWIG_ArgError((ptr ? res : SWIG_TypeError)), "in method '" "Builder_gep2" "', argument " "3"" of type '" "std::vector< llvm::Value *,std::allocator< llvm::Value * > >""'"); 
+    }
+    arg3 = *ptr;
+    if (SWIG_IsNewObj(res)) delete ptr;
+  }
+  result = (llvm::Value *)(arg1)->gep2(arg2,arg3);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   return resultobj;
 fail:
@@ -22025,17 +25017,19 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_load(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[4];
-  int ii;
+SWIGINTERN PyObject *_wrap_Builder_gep2(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
-  for (ii = 0; (ii < 3) && (ii < argc); ii++) {
+  argc = args ? PyObject_Length(args) : 0;
+  for (ii = 0; (ii < 4) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
-  if (argc == 2) {
+  if (argc == 3) {
     int _v;
     void *vptr = 0;
     int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
@@ -22045,11 +25039,15 @@ SWIGINTERN PyObject *_wrap_Builder_load(PyObject *self, PyObject *args) {
       int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Value, 0);
       _v = SWIG_CheckState(res);
       if (_v) {
-        return _wrap_Builder_load__SWIG_1(self, args);
+        int res = swig::asptr(argv[2], (std::vector< llvm::Value*,std::allocator< llvm::Value * > >**)(0));
+        _v = SWIG_CheckState(res);
+        if (_v) {
+          return _wrap_Builder_gep2__SWIG_1(self, args);
+        }
       }
     }
   }
-  if (argc == 3) {
+  if (argc == 4) {
     int _v;
     void *vptr = 0;
     int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
@@ -22059,69 +25057,33 @@ SWIGINTERN PyObject *_wrap_Builder_load(PyObject *self, PyObject *args) {
       int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Value, 0);
       _v = SWIG_CheckState(res);
       if (_v) {
-        int res = SWIG_AsCharPtrAndSize(argv[2], 0, NULL, 0);
+        int res = swig::asptr(argv[2], (std::vector< llvm::Value*,std::allocator< llvm::Value * > >**)(0));
         _v = SWIG_CheckState(res);
         if (_v) {
-          return _wrap_Builder_load__SWIG_0(self, args);
+          int res = SWIG_AsCharPtrAndSize(argv[3], 0, NULL, 0);
+          _v = SWIG_CheckState(res);
+          if (_v) {
+            return _wrap_Builder_gep2__SWIG_0(self, args);
+          }
         }
       }
     }
   }
   
 fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_load'.\n"
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_gep2'.\n"
     "  Possible C/C++ prototypes are:\n"
-    "    Builder::load(llvm::Value *,char const *)\n"
-    "    Builder::load(llvm::Value *)\n");
+    "    Builder::gep2(llvm::Value *,std::vector< llvm::Value *,std::allocator< llvm::Value * > >,char const *)\n"
+    "    Builder::gep2(llvm::Value *,std::vector< llvm::Value *,std::allocator< llvm::Value * > >)\n");
   return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_store(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *resultobj = 0;
-  Builder *arg1 = (Builder *) 0 ;
-  llvm::Value *arg2 = (llvm::Value *) 0 ;
-  llvm::Value *arg3 = (llvm::Value *) 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  void *argp3 = 0 ;
-  int res3 = 0 ;
-  PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
-  PyObject * obj2 = 0 ;
-  llvm::Value *result = 0 ;
-  
-  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_store",&obj0,&obj1,&obj2)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_store" "', argument " "1"" of type '" "Builder *""'"); 
-  }
-  arg1 = reinterpret_cast< Builder * >(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_store" "', argument " "2"" of type '" "llvm::Value *""'"); 
-  }
-  arg2 = reinterpret_cast< llvm::Value * >(argp2);
-  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
-  if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_store" "', argument " "3"" of type '" "llvm::Value *""'"); 
-  }
-  arg3 = reinterpret_cast< llvm::Value * >(argp3);
-  result = (llvm::Value *)(arg1)->store(arg2,arg3);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
-  return resultobj;
-fail:
-  return NULL;
-}
-
-
-SWIGINTERN PyObject *_wrap_Builder_gep__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_bitcast__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
-  llvm::Value *arg3 = (llvm::Value *) 0 ;
+  llvm::Type *arg3 = (llvm::Type *) 0 ;
   char *arg4 = (char *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -22138,28 +25100,28 @@ SWIGINTERN PyObject *_wrap_Builder_gep__SWIG_0(PyObject *SWIGUNUSEDPARM(self), P
   PyObject * obj3 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_gep",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_bitcast",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_gep" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_bitcast" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_gep" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_bitcast" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
-  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Type, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_gep" "', argument " "3"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_bitcast" "', argument " "3"" of type '" "llvm::Type *""'"); 
   }
-  arg3 = reinterpret_cast< llvm::Value * >(argp3);
+  arg3 = reinterpret_cast< llvm::Type * >(argp3);
   res4 = SWIG_AsCharPtrAndSize(obj3, &buf4, NULL, &alloc4);
   if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_gep" "', argument " "4"" of type '" "char const *""'");
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_bitcast" "', argument " "4"" of type '" "char const *""'");
   }
   arg4 = reinterpret_cast< char * >(buf4);
-  result = (llvm::Value *)(arg1)->gep(arg2,arg3,(char const *)arg4);
+  result = (llvm::Value *)(arg1)->bitcast(arg2,arg3,(char const *)arg4);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
   return resultobj;
@@ -22169,11 +25131,11 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_gep__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_bitcast__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
   llvm::Value *arg2 = (llvm::Value *) 0 ;
-  llvm::Value *arg3 = (llvm::Value *) 0 ;
+  llvm::Type *arg3 = (llvm::Type *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   void *argp2 = 0 ;
@@ -22185,23 +25147,23 @@ SWIGINTERN PyObject *_wrap_Builder_gep__SWIG_1(PyObject *SWIGUNUSEDPARM(self), P
   PyObject * obj2 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_gep",&obj0,&obj1,&obj2)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_bitcast",&obj0,&obj1,&obj2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_gep" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_bitcast" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
   res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_gep" "', argument " "2"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_bitcast" "', argument " "2"" of type '" "llvm::Value *""'"); 
   }
   arg2 = reinterpret_cast< llvm::Value * >(argp2);
-  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Type, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_gep" "', argument " "3"" of type '" "llvm::Value *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_bitcast" "', argument " "3"" of type '" "llvm::Type *""'"); 
   }
-  arg3 = reinterpret_cast< llvm::Value * >(argp3);
-  result = (llvm::Value *)(arg1)->gep(arg2,arg3);
+  arg3 = reinterpret_cast< llvm::Type * >(argp3);
+  result = (llvm::Value *)(arg1)->bitcast(arg2,arg3);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
   return resultobj;
 fail:
@@ -22209,13 +25171,15 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_gep(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[5];
-  int ii;
+SWIGINTERN PyObject *_wrap_Builder_bitcast(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 4) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
@@ -22230,10 +25194,10 @@ SWIGINTERN PyObject *_wrap_Builder_gep(PyObject *self, PyObject *args) {
       _v = SWIG_CheckState(res);
       if (_v) {
         void *vptr = 0;
-        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
+        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Type, 0);
         _v = SWIG_CheckState(res);
         if (_v) {
-          return _wrap_Builder_gep__SWIG_1(self, args);
+          return _wrap_Builder_bitcast__SWIG_1(self, args);
         }
       }
     }
@@ -22249,13 +25213,13 @@ SWIGINTERN PyObject *_wrap_Builder_gep(PyObject *self, PyObject *args) {
       _v = SWIG_CheckState(res);
       if (_v) {
         void *vptr = 0;
-        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
+        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Type, 0);
         _v = SWIG_CheckState(res);
         if (_v) {
           int res = SWIG_AsCharPtrAndSize(argv[3], 0, NULL, 0);
           _v = SWIG_CheckState(res);
           if (_v) {
-            return _wrap_Builder_gep__SWIG_0(self, args);
+            return _wrap_Builder_bitcast__SWIG_0(self, args);
           }
         }
       }
@@ -22263,166 +25227,142 @@ SWIGINTERN PyObject *_wrap_Builder_gep(PyObject *self, PyObject *args) {
   }
   
 fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_gep'.\n"
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_bitcast'.\n"
     "  Possible C/C++ prototypes are:\n"
-    "    Builder::gep(llvm::Value *,llvm::Value *,char const *)\n"
-    "    Builder::gep(llvm::Value *,llvm::Value *)\n");
+    "    Builder::bitcast(llvm::Value *,llvm::Type *,char const *)\n"
+    "    Builder::bitcast(llvm::Value *,llvm::Type *)\n");
   return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_gep2__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_global_string_ptr__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
-  llvm::Value *arg2 = (llvm::Value *) 0 ;
-  std::vector< llvm::Value *,std::allocator< llvm::Value * > > arg3 ;
-  char *arg4 = (char *) 0 ;
+  char *arg2 ;
+  char *arg3 = (char *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  int res4 ;
-  char *buf4 = 0 ;
-  int alloc4 = 0 ;
+  int res2 ;
+  char *buf2 = 0 ;
+  int alloc2 = 0 ;
+  int res3 ;
+  char *buf3 = 0 ;
+  int alloc3 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
-  PyObject * obj3 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_gep2",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_global_string_ptr",&obj0,&obj1,&obj2)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_gep2" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_global_string_ptr" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  res2 = SWIG_AsCharPtrAndSize(obj1, &buf2, NULL, &alloc2);
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_gep2" "', argument " "2"" of type '" "llvm::Value *""'"); 
-  }
-  arg2 = reinterpret_cast< llvm::Value * >(argp2);
-  {
-    std::vector<llvm::Value*,std::allocator< llvm::Value * > > *ptr = (std::vector<llvm::Value*,std::allocator< llvm::Value * > > *)0;
-    int res = swig::asptr(obj2, &ptr);
-    if (!SWIG_IsOK(res) || !ptr) {
-      SWIG_exception_fail(SWIG_ArgError((ptr ? res : SWIG_TypeError)), "in method '" "Builder_gep2" "', argument " "3"" of type '" "std::vector< llvm::Value *,std::allocator< llvm::Value * > >""'"); 
-    }
-    arg3 = *ptr;
-    if (SWIG_IsNewObj(res)) delete ptr;
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_global_string_ptr" "', argument " "2"" of type '" "char const []""'");
   }
-  res4 = SWIG_AsCharPtrAndSize(obj3, &buf4, NULL, &alloc4);
-  if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Builder_gep2" "', argument " "4"" of type '" "char const *""'");
+  arg2 = reinterpret_cast< char * >(buf2);
+  res3 = SWIG_AsCharPtrAndSize(obj2, &buf3, NULL, &alloc3);
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_global_string_ptr" "', argument " "3"" of type '" "char const *""'");
   }
-  arg4 = reinterpret_cast< char * >(buf4);
-  result = (llvm::Value *)(arg1)->gep2(arg2,arg3,(char const *)arg4);
+  arg3 = reinterpret_cast< char * >(buf3);
+  result = (llvm::Value *)(arg1)->global_string_ptr((char const (*))arg2,(char const *)arg3);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
-  if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
+  if (alloc2 == SWIG_NEWOBJ) delete[] buf2;
+  if (alloc3 == SWIG_NEWOBJ) delete[] buf3;
   return resultobj;
 fail:
-  if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
+  if (alloc2 == SWIG_NEWOBJ) delete[] buf2;
+  if (alloc3 == SWIG_NEWOBJ) delete[] buf3;
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_gep2__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Builder_global_string_ptr__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
-  llvm::Value *arg2 = (llvm::Value *) 0 ;
-  std::vector< llvm::Value *,std::allocator< llvm::Value * > > arg3 ;
+  char *arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
+  int res2 ;
+  char *buf2 = 0 ;
+  int alloc2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
-  PyObject * obj2 = 0 ;
   llvm::Value *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:Builder_gep2",&obj0,&obj1,&obj2)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OO:Builder_global_string_ptr",&obj0,&obj1)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_gep2" "', argument " "1"" of type '" "Builder *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_global_string_ptr" "', argument " "1"" of type '" "Builder *""'"); 
   }
   arg1 = reinterpret_cast< Builder * >(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  res2 = SWIG_AsCharPtrAndSize(obj1, &buf2, NULL, &alloc2);
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_gep2" "', argument " "2"" of type '" "llvm::Value *""'"); 
-  }
-  arg2 = reinterpret_cast< llvm::Value * >(argp2);
-  {
-    std::vector<llvm::Value*,std::allocator< llvm::Value * > > *ptr = (std::vector<llvm::Value*,std::allocator< llvm::Value * > > *)0;
-    int res = swig::asptr(obj2, &ptr);
-    if (!SWIG_IsOK(res) || !ptr) {
-      SWIG_exception_fail(SWIG_ArgError((ptr ? res : SWIG_TypeError)), "in method '" "Builder_gep2" "', argument " "3"" of type '" "std::vector< llvm::Value *,std::allocator< llvm::Value * > >""'"); 
-    }
-    arg3 = *ptr;
-    if (SWIG_IsNewObj(res)) delete ptr;
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_global_string_ptr" "', argument " "2"" of type '" "char const []""'");
   }
-  result = (llvm::Value *)(arg1)->gep2(arg2,arg3);
+  arg2 = reinterpret_cast< char * >(buf2);
+  result = (llvm::Value *)(arg1)->global_string_ptr((char const (*))arg2);
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
+  if (alloc2 == SWIG_NEWOBJ) delete[] buf2;
   return resultobj;
 fail:
+  if (alloc2 == SWIG_NEWOBJ) delete[] buf2;
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Builder_gep2(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[5];
-  int ii;
+SWIGINTERN PyObject *_wrap_Builder_global_string_ptr(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[4] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
-  for (ii = 0; (ii < 4) && (ii < argc); ii++) {
+  argc = args ? PyObject_Length(args) : 0;
+  for (ii = 0; (ii < 3) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
-  if (argc == 3) {
+  if (argc == 2) {
     int _v;
     void *vptr = 0;
     int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
     _v = SWIG_CheckState(res);
     if (_v) {
-      void *vptr = 0;
-      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Value, 0);
+      int res = SWIG_AsCharPtrAndSize(argv[1], 0, NULL, 0);
       _v = SWIG_CheckState(res);
       if (_v) {
-        int res = swig::asptr(argv[2], (std::vector<llvm::Value*,std::allocator< llvm::Value * > >**)(0));
-        _v = SWIG_CheckState(res);
-        if (_v) {
-          return _wrap_Builder_gep2__SWIG_1(self, args);
-        }
+        return _wrap_Builder_global_string_ptr__SWIG_1(self, args);
       }
     }
   }
-  if (argc == 4) {
+  if (argc == 3) {
     int _v;
     void *vptr = 0;
     int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
     _v = SWIG_CheckState(res);
     if (_v) {
-      void *vptr = 0;
-      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Value, 0);
+      int res = SWIG_AsCharPtrAndSize(argv[1], 0, NULL, 0);
       _v = SWIG_CheckState(res);
       if (_v) {
-        int res = swig::asptr(argv[2], (std::vector<llvm::Value*,std::allocator< llvm::Value * > >**)(0));
+        int res = SWIG_AsCharPtrAndSize(argv[2], 0, NULL, 0);
         _v = SWIG_CheckState(res);
         if (_v) {
-          int res = SWIG_AsCharPtrAndSize(argv[3], 0, NULL, 0);
-          _v = SWIG_CheckState(res);
-          if (_v) {
-            return _wrap_Builder_gep2__SWIG_0(self, args);
-          }
+          return _wrap_Builder_global_string_ptr__SWIG_0(self, args);
         }
       }
     }
   }
   
 fail:
-  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_gep2'.\n"
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_global_string_ptr'.\n"
     "  Possible C/C++ prototypes are:\n"
-    "    Builder::gep2(llvm::Value *,std::vector< llvm::Value *,std::allocator< llvm::Value * > >,char const *)\n"
-    "    Builder::gep2(llvm::Value *,std::vector< llvm::Value *,std::allocator< llvm::Value * > >)\n");
+    "    Builder::global_string_ptr(char const [],char const *)\n"
+    "    Builder::global_string_ptr(char const [])\n");
   return 0;
 }
 
@@ -22520,12 +25460,14 @@ fail:
 
 
 SWIGINTERN PyObject *_wrap_Builder_extract_element(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[5];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 4) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
@@ -22692,12 +25634,14 @@ fail:
 
 
 SWIGINTERN PyObject *_wrap_Builder_insert_element(PyObject *self, PyObject *args) {
-  int argc;
-  PyObject *argv[6];
-  int ii;
+  Py_ssize_t argc;
+  PyObject *argv[6] = {
+    0
+  };
+  Py_ssize_t ii;
   
   if (!PyTuple_Check(args)) SWIG_fail;
-  argc = args ? (int)PyObject_Length(args) : 0;
+  argc = args ? PyObject_Length(args) : 0;
   for (ii = 0; (ii < 5) && (ii < argc); ii++) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
@@ -22763,6 +25707,192 @@ fail:
 }
 
 
+SWIGINTERN PyObject *_wrap_Builder_shuffle__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  Builder *arg1 = (Builder *) 0 ;
+  llvm::Value *arg2 = (llvm::Value *) 0 ;
+  llvm::Value *arg3 = (llvm::Value *) 0 ;
+  std::vector< int,std::allocator< int > > arg4 ;
+  char *arg5 = (char *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  int res5 ;
+  char *buf5 = 0 ;
+  int alloc5 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  PyObject * obj3 = 0 ;
+  PyObject * obj4 = 0 ;
+  llvm::Value *result = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OOOOO:Builder_shuffle",&obj0,&obj1,&obj2,&obj3,&obj4)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_shuffle" "', argument " "1"" of type '" "Builder *""'"); 
+  }
+  arg1 = reinterpret_cast< Builder * >(argp1);
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_shuffle" "', argument " "2"" of type '" "llvm::Value *""'"); 
+  }
+  arg2 = reinterpret_cast< llvm::Value * >(argp2);
+  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_shuffle" "', argument " "3"" of type '" "llvm::Value *""'"); 
+  }
+  arg3 = reinterpret_cast< llvm::Value * >(argp3);
+  {
+    std::vector< int,std::allocator< int > > *ptr = (std::vector< int,std::allocator< int > > *)0;
+    int res = swig::asptr(obj3, &ptr);
+    if (!SWIG_IsOK(res) || !ptr) {
+      SWIG_exception_fail(SWIG_ArgError((ptr ? res : SWIG_TypeError)), "in method '" "Builder_shuffle" "', argument " "4"" of type '" "std::vector< int,std::allocator< int > >""'"); 
+    }
+    arg4 = *ptr;
+    if (SWIG_IsNewObj(res)) delete ptr;
+  }
+  res5 = SWIG_AsCharPtrAndSize(obj4, &buf5, NULL, &alloc5);
+  if (!SWIG_IsOK(res5)) {
+    SWIG_exception_fail(SWIG_ArgError(res5), "in method '" "Builder_shuffle" "', argument " "5"" of type '" "char const *""'");
+  }
+  arg5 = reinterpret_cast< char * >(buf5);
+  result = (llvm::Value *)(arg1)->shuffle(arg2,arg3,arg4,(char const *)arg5);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
+  if (alloc5 == SWIG_NEWOBJ) delete[] buf5;
+  return resultobj;
+fail:
+  if (alloc5 == SWIG_NEWOBJ) delete[] buf5;
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Builder_shuffle__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  Builder *arg1 = (Builder *) 0 ;
+  llvm::Value *arg2 = (llvm::Value *) 0 ;
+  llvm::Value *arg3 = (llvm::Value *) 0 ;
+  std::vector< int,std::allocator< int > > arg4 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  PyObject * obj3 = 0 ;
+  llvm::Value *result = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OOOO:Builder_shuffle",&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_Builder, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Builder_shuffle" "', argument " "1"" of type '" "Builder *""'"); 
+  }
+  arg1 = reinterpret_cast< Builder * >(argp1);
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Builder_shuffle" "', argument " "2"" of type '" "llvm::Value *""'"); 
+  }
+  arg2 = reinterpret_cast< llvm::Value * >(argp2);
+  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_llvm__Value, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Builder_shuffle" "', argument " "3"" of type '" "llvm::Value *""'"); 
+  }
+  arg3 = reinterpret_cast< llvm::Value * >(argp3);
+  {
+    std::vector< int,std::allocator< int > > *ptr = (std::vector< int,std::allocator< int > > *)0;
+    int res = swig::asptr(obj3, &ptr);
+    if (!SWIG_IsOK(res) || !ptr) {
+      SWIG_exception_fail(SWIG_ArgError((ptr ? res : SWIG_TypeError)), "in method '" "Builder_shuffle" "', argument " "4"" of type '" "std::vector< int,std::allocator< int > >""'"); 
+    }
+    arg4 = *ptr;
+    if (SWIG_IsNewObj(res)) delete ptr;
+  }
+  result = (llvm::Value *)(arg1)->shuffle(arg2,arg3,arg4);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_llvm__Value, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Builder_shuffle(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[6] = {
+    0
+  };
+  Py_ssize_t ii;
+  
+  if (!PyTuple_Check(args)) SWIG_fail;
+  argc = args ? PyObject_Length(args) : 0;
+  for (ii = 0; (ii < 5) && (ii < argc); ii++) {
+    argv[ii] = PyTuple_GET_ITEM(args,ii);
+  }
+  if (argc == 4) {
+    int _v;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      void *vptr = 0;
+      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Value, 0);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        void *vptr = 0;
+        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
+        _v = SWIG_CheckState(res);
+        if (_v) {
+          int res = swig::asptr(argv[3], (std::vector< int,std::allocator< int > >**)(0));
+          _v = SWIG_CheckState(res);
+          if (_v) {
+            return _wrap_Builder_shuffle__SWIG_1(self, args);
+          }
+        }
+      }
+    }
+  }
+  if (argc == 5) {
+    int _v;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Builder, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      void *vptr = 0;
+      int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_llvm__Value, 0);
+      _v = SWIG_CheckState(res);
+      if (_v) {
+        void *vptr = 0;
+        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_llvm__Value, 0);
+        _v = SWIG_CheckState(res);
+        if (_v) {
+          int res = swig::asptr(argv[3], (std::vector< int,std::allocator< int > >**)(0));
+          _v = SWIG_CheckState(res);
+          if (_v) {
+            int res = SWIG_AsCharPtrAndSize(argv[4], 0, NULL, 0);
+            _v = SWIG_CheckState(res);
+            if (_v) {
+              return _wrap_Builder_shuffle__SWIG_0(self, args);
+            }
+          }
+        }
+      }
+    }
+  }
+  
+fail:
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'Builder_shuffle'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    Builder::shuffle(llvm::Value *,llvm::Value *,std::vector< int,std::allocator< int > >,char const *)\n"
+    "    Builder::shuffle(llvm::Value *,llvm::Value *,std::vector< int,std::allocator< int > >)\n");
+  return 0;
+}
+
+
 SWIGINTERN PyObject *_wrap_Builder_is_block_closed(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   Builder *arg1 = (Builder *) 0 ;
@@ -22808,7 +25938,7 @@ fail:
 
 SWIGINTERN PyObject *Builder_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *obj;
-  if (!PyArg_ParseTuple(args,(char*)"O:swigregister", &obj)) return NULL;
+  if (!PyArg_ParseTuple(args,(char *)"O:swigregister", &obj)) return NULL;
   SWIG_TypeNewClientData(SWIGTYPE_p_Builder, SWIG_NewClientData(obj));
   return SWIG_Py_Void();
 }
@@ -22837,23 +25967,23 @@ static PyMethodDef SwigMethods[] = {
 	 { (char *)"ArrayString___nonzero__", _wrap_ArrayString___nonzero__, METH_VARARGS, NULL},
 	 { (char *)"ArrayString___bool__", _wrap_ArrayString___bool__, METH_VARARGS, NULL},
 	 { (char *)"ArrayString___len__", _wrap_ArrayString___len__, METH_VARARGS, NULL},
-	 { (char *)"ArrayString_pop", _wrap_ArrayString_pop, METH_VARARGS, NULL},
 	 { (char *)"ArrayString___getslice__", _wrap_ArrayString___getslice__, METH_VARARGS, NULL},
 	 { (char *)"ArrayString___setslice__", _wrap_ArrayString___setslice__, METH_VARARGS, NULL},
 	 { (char *)"ArrayString___delslice__", _wrap_ArrayString___delslice__, METH_VARARGS, NULL},
 	 { (char *)"ArrayString___delitem__", _wrap_ArrayString___delitem__, METH_VARARGS, NULL},
 	 { (char *)"ArrayString___getitem__", _wrap_ArrayString___getitem__, METH_VARARGS, NULL},
 	 { (char *)"ArrayString___setitem__", _wrap_ArrayString___setitem__, METH_VARARGS, NULL},
+	 { (char *)"ArrayString_pop", _wrap_ArrayString_pop, METH_VARARGS, NULL},
 	 { (char *)"ArrayString_append", _wrap_ArrayString_append, METH_VARARGS, NULL},
 	 { (char *)"ArrayString_empty", _wrap_ArrayString_empty, METH_VARARGS, NULL},
 	 { (char *)"ArrayString_size", _wrap_ArrayString_size, METH_VARARGS, NULL},
-	 { (char *)"ArrayString_clear", _wrap_ArrayString_clear, METH_VARARGS, NULL},
 	 { (char *)"ArrayString_swap", _wrap_ArrayString_swap, METH_VARARGS, NULL},
-	 { (char *)"ArrayString_get_allocator", _wrap_ArrayString_get_allocator, METH_VARARGS, NULL},
 	 { (char *)"ArrayString_begin", _wrap_ArrayString_begin, METH_VARARGS, NULL},
 	 { (char *)"ArrayString_end", _wrap_ArrayString_end, METH_VARARGS, NULL},
 	 { (char *)"ArrayString_rbegin", _wrap_ArrayString_rbegin, METH_VARARGS, NULL},
 	 { (char *)"ArrayString_rend", _wrap_ArrayString_rend, METH_VARARGS, NULL},
+	 { (char *)"ArrayString_clear", _wrap_ArrayString_clear, METH_VARARGS, NULL},
+	 { (char *)"ArrayString_get_allocator", _wrap_ArrayString_get_allocator, METH_VARARGS, NULL},
 	 { (char *)"ArrayString_pop_back", _wrap_ArrayString_pop_back, METH_VARARGS, NULL},
 	 { (char *)"ArrayString_erase", _wrap_ArrayString_erase, METH_VARARGS, NULL},
 	 { (char *)"new_ArrayString", _wrap_new_ArrayString, METH_VARARGS, NULL},
@@ -22871,23 +26001,23 @@ static PyMethodDef SwigMethods[] = {
 	 { (char *)"ArrayInt___nonzero__", _wrap_ArrayInt___nonzero__, METH_VARARGS, NULL},
 	 { (char *)"ArrayInt___bool__", _wrap_ArrayInt___bool__, METH_VARARGS, NULL},
 	 { (char *)"ArrayInt___len__", _wrap_ArrayInt___len__, METH_VARARGS, NULL},
-	 { (char *)"ArrayInt_pop", _wrap_ArrayInt_pop, METH_VARARGS, NULL},
 	 { (char *)"ArrayInt___getslice__", _wrap_ArrayInt___getslice__, METH_VARARGS, NULL},
 	 { (char *)"ArrayInt___setslice__", _wrap_ArrayInt___setslice__, METH_VARARGS, NULL},
 	 { (char *)"ArrayInt___delslice__", _wrap_ArrayInt___delslice__, METH_VARARGS, NULL},
 	 { (char *)"ArrayInt___delitem__", _wrap_ArrayInt___delitem__, METH_VARARGS, NULL},
 	 { (char *)"ArrayInt___getitem__", _wrap_ArrayInt___getitem__, METH_VARARGS, NULL},
 	 { (char *)"ArrayInt___setitem__", _wrap_ArrayInt___setitem__, METH_VARARGS, NULL},
+	 { (char *)"ArrayInt_pop", _wrap_ArrayInt_pop, METH_VARARGS, NULL},
 	 { (char *)"ArrayInt_append", _wrap_ArrayInt_append, METH_VARARGS, NULL},
 	 { (char *)"ArrayInt_empty", _wrap_ArrayInt_empty, METH_VARARGS, NULL},
 	 { (char *)"ArrayInt_size", _wrap_ArrayInt_size, METH_VARARGS, NULL},
-	 { (char *)"ArrayInt_clear", _wrap_ArrayInt_clear, METH_VARARGS, NULL},
 	 { (char *)"ArrayInt_swap", _wrap_ArrayInt_swap, METH_VARARGS, NULL},
-	 { (char *)"ArrayInt_get_allocator", _wrap_ArrayInt_get_allocator, METH_VARARGS, NULL},
 	 { (char *)"ArrayInt_begin", _wrap_ArrayInt_begin, METH_VARARGS, NULL},
 	 { (char *)"ArrayInt_end", _wrap_ArrayInt_end, METH_VARARGS, NULL},
 	 { (char *)"ArrayInt_rbegin", _wrap_ArrayInt_rbegin, METH_VARARGS, NULL},
 	 { (char *)"ArrayInt_rend", _wrap_ArrayInt_rend, METH_VARARGS, NULL},
+	 { (char *)"ArrayInt_clear", _wrap_ArrayInt_clear, METH_VARARGS, NULL},
+	 { (char *)"ArrayInt_get_allocator", _wrap_ArrayInt_get_allocator, METH_VARARGS, NULL},
 	 { (char *)"ArrayInt_pop_back", _wrap_ArrayInt_pop_back, METH_VARARGS, NULL},
 	 { (char *)"ArrayInt_erase", _wrap_ArrayInt_erase, METH_VARARGS, NULL},
 	 { (char *)"new_ArrayInt", _wrap_new_ArrayInt, METH_VARARGS, NULL},
@@ -22905,23 +26035,23 @@ static PyMethodDef SwigMethods[] = {
 	 { (char *)"ArrayTypePtr___nonzero__", _wrap_ArrayTypePtr___nonzero__, METH_VARARGS, NULL},
 	 { (char *)"ArrayTypePtr___bool__", _wrap_ArrayTypePtr___bool__, METH_VARARGS, NULL},
 	 { (char *)"ArrayTypePtr___len__", _wrap_ArrayTypePtr___len__, METH_VARARGS, NULL},
-	 { (char *)"ArrayTypePtr_pop", _wrap_ArrayTypePtr_pop, METH_VARARGS, NULL},
 	 { (char *)"ArrayTypePtr___getslice__", _wrap_ArrayTypePtr___getslice__, METH_VARARGS, NULL},
 	 { (char *)"ArrayTypePtr___setslice__", _wrap_ArrayTypePtr___setslice__, METH_VARARGS, NULL},
 	 { (char *)"ArrayTypePtr___delslice__", _wrap_ArrayTypePtr___delslice__, METH_VARARGS, NULL},
 	 { (char *)"ArrayTypePtr___delitem__", _wrap_ArrayTypePtr___delitem__, METH_VARARGS, NULL},
 	 { (char *)"ArrayTypePtr___getitem__", _wrap_ArrayTypePtr___getitem__, METH_VARARGS, NULL},
 	 { (char *)"ArrayTypePtr___setitem__", _wrap_ArrayTypePtr___setitem__, METH_VARARGS, NULL},
+	 { (char *)"ArrayTypePtr_pop", _wrap_ArrayTypePtr_pop, METH_VARARGS, NULL},
 	 { (char *)"ArrayTypePtr_append", _wrap_ArrayTypePtr_append, METH_VARARGS, NULL},
 	 { (char *)"ArrayTypePtr_empty", _wrap_ArrayTypePtr_empty, METH_VARARGS, NULL},
 	 { (char *)"ArrayTypePtr_size", _wrap_ArrayTypePtr_size, METH_VARARGS, NULL},
-	 { (char *)"ArrayTypePtr_clear", _wrap_ArrayTypePtr_clear, METH_VARARGS, NULL},
 	 { (char *)"ArrayTypePtr_swap", _wrap_ArrayTypePtr_swap, METH_VARARGS, NULL},
-	 { (char *)"ArrayTypePtr_get_allocator", _wrap_ArrayTypePtr_get_allocator, METH_VARARGS, NULL},
 	 { (char *)"ArrayTypePtr_begin", _wrap_ArrayTypePtr_begin, METH_VARARGS, NULL},
 	 { (char *)"ArrayTypePtr_end", _wrap_ArrayTypePtr_end, METH_VARARGS, NULL},
 	 { (char *)"ArrayTypePtr_rbegin", _wrap_ArrayTypePtr_rbegin, METH_VARARGS, NULL},
 	 { (char *)"ArrayTypePtr_rend", _wrap_ArrayTypePtr_rend, METH_VARARGS, NULL},
+	 { (char *)"ArrayTypePtr_clear", _wrap_ArrayTypePtr_clear, METH_VARARGS, NULL},
+	 { (char *)"ArrayTypePtr_get_allocator", _wrap_ArrayTypePtr_get_allocator, METH_VARARGS, NULL},
 	 { (char *)"ArrayTypePtr_pop_back", _wrap_ArrayTypePtr_pop_back, METH_VARARGS, NULL},
 	 { (char *)"ArrayTypePtr_erase", _wrap_ArrayTypePtr_erase, METH_VARARGS, NULL},
 	 { (char *)"new_ArrayTypePtr", _wrap_new_ArrayTypePtr, METH_VARARGS, NULL},
@@ -22939,23 +26069,23 @@ static PyMethodDef SwigMethods[] = {
 	 { (char *)"ArrayValuePtr___nonzero__", _wrap_ArrayValuePtr___nonzero__, METH_VARARGS, NULL},
 	 { (char *)"ArrayValuePtr___bool__", _wrap_ArrayValuePtr___bool__, METH_VARARGS, NULL},
 	 { (char *)"ArrayValuePtr___len__", _wrap_ArrayValuePtr___len__, METH_VARARGS, NULL},
-	 { (char *)"ArrayValuePtr_pop", _wrap_ArrayValuePtr_pop, METH_VARARGS, NULL},
 	 { (char *)"ArrayValuePtr___getslice__", _wrap_ArrayValuePtr___getslice__, METH_VARARGS, NULL},
 	 { (char *)"ArrayValuePtr___setslice__", _wrap_ArrayValuePtr___setslice__, METH_VARARGS, NULL},
 	 { (char *)"ArrayValuePtr___delslice__", _wrap_ArrayValuePtr___delslice__, METH_VARARGS, NULL},
 	 { (char *)"ArrayValuePtr___delitem__", _wrap_ArrayValuePtr___delitem__, METH_VARARGS, NULL},
 	 { (char *)"ArrayValuePtr___getitem__", _wrap_ArrayValuePtr___getitem__, METH_VARARGS, NULL},
 	 { (char *)"ArrayValuePtr___setitem__", _wrap_ArrayValuePtr___setitem__, METH_VARARGS, NULL},
+	 { (char *)"ArrayValuePtr_pop", _wrap_ArrayValuePtr_pop, METH_VARARGS, NULL},
 	 { (char *)"ArrayValuePtr_append", _wrap_ArrayValuePtr_append, METH_VARARGS, NULL},
 	 { (char *)"ArrayValuePtr_empty", _wrap_ArrayValuePtr_empty, METH_VARARGS, NULL},
 	 { (char *)"ArrayValuePtr_size", _wrap_ArrayValuePtr_size, METH_VARARGS, NULL},
-	 { (char *)"ArrayValuePtr_clear", _wrap_ArrayValuePtr_clear, METH_VARARGS, NULL},
 	 { (char *)"ArrayValuePtr_swap", _wrap_ArrayValuePtr_swap, METH_VARARGS, NULL},
-	 { (char *)"ArrayValuePtr_get_allocator", _wrap_ArrayValuePtr_get_allocator, METH_VARARGS, NULL},
 	 { (char *)"ArrayValuePtr_begin", _wrap_ArrayValuePtr_begin, METH_VARARGS, NULL},
 	 { (char *)"ArrayValuePtr_end", _wrap_ArrayValuePtr_end, METH_VARARGS, NULL},
 	 { (char *)"ArrayValuePtr_rbegin", _wrap_ArrayValuePtr_rbegin, METH_VARARGS, NULL},
 	 { (char *)"ArrayValuePtr_rend", _wrap_ArrayValuePtr_rend, METH_VARARGS, NULL},
+	 { (char *)"ArrayValuePtr_clear", _wrap_ArrayValuePtr_clear, METH_VARARGS, NULL},
+	 { (char *)"ArrayValuePtr_get_allocator", _wrap_ArrayValuePtr_get_allocator, METH_VARARGS, NULL},
 	 { (char *)"ArrayValuePtr_pop_back", _wrap_ArrayValuePtr_pop_back, METH_VARARGS, NULL},
 	 { (char *)"ArrayValuePtr_erase", _wrap_ArrayValuePtr_erase, METH_VARARGS, NULL},
 	 { (char *)"new_ArrayValuePtr", _wrap_new_ArrayValuePtr, METH_VARARGS, NULL},
@@ -22973,23 +26103,23 @@ static PyMethodDef SwigMethods[] = {
 	 { (char *)"ArrayBBPtr___nonzero__", _wrap_ArrayBBPtr___nonzero__, METH_VARARGS, NULL},
 	 { (char *)"ArrayBBPtr___bool__", _wrap_ArrayBBPtr___bool__, METH_VARARGS, NULL},
 	 { (char *)"ArrayBBPtr___len__", _wrap_ArrayBBPtr___len__, METH_VARARGS, NULL},
-	 { (char *)"ArrayBBPtr_pop", _wrap_ArrayBBPtr_pop, METH_VARARGS, NULL},
 	 { (char *)"ArrayBBPtr___getslice__", _wrap_ArrayBBPtr___getslice__, METH_VARARGS, NULL},
 	 { (char *)"ArrayBBPtr___setslice__", _wrap_ArrayBBPtr___setslice__, METH_VARARGS, NULL},
 	 { (char *)"ArrayBBPtr___delslice__", _wrap_ArrayBBPtr___delslice__, METH_VARARGS, NULL},
 	 { (char *)"ArrayBBPtr___delitem__", _wrap_ArrayBBPtr___delitem__, METH_VARARGS, NULL},
 	 { (char *)"ArrayBBPtr___getitem__", _wrap_ArrayBBPtr___getitem__, METH_VARARGS, NULL},
 	 { (char *)"ArrayBBPtr___setitem__", _wrap_ArrayBBPtr___setitem__, METH_VARARGS, NULL},
+	 { (char *)"ArrayBBPtr_pop", _wrap_ArrayBBPtr_pop, METH_VARARGS, NULL},
 	 { (char *)"ArrayBBPtr_append", _wrap_ArrayBBPtr_append, METH_VARARGS, NULL},
 	 { (char *)"ArrayBBPtr_empty", _wrap_ArrayBBPtr_empty, METH_VARARGS, NULL},
 	 { (char *)"ArrayBBPtr_size", _wrap_ArrayBBPtr_size, METH_VARARGS, NULL},
-	 { (char *)"ArrayBBPtr_clear", _wrap_ArrayBBPtr_clear, METH_VARARGS, NULL},
 	 { (char *)"ArrayBBPtr_swap", _wrap_ArrayBBPtr_swap, METH_VARARGS, NULL},
-	 { (char *)"ArrayBBPtr_get_allocator", _wrap_ArrayBBPtr_get_allocator, METH_VARARGS, NULL},
 	 { (char *)"ArrayBBPtr_begin", _wrap_ArrayBBPtr_begin, METH_VARARGS, NULL},
 	 { (char *)"ArrayBBPtr_end", _wrap_ArrayBBPtr_end, METH_VARARGS, NULL},
 	 { (char *)"ArrayBBPtr_rbegin", _wrap_ArrayBBPtr_rbegin, METH_VARARGS, NULL},
 	 { (char *)"ArrayBBPtr_rend", _wrap_ArrayBBPtr_rend, METH_VARARGS, NULL},
+	 { (char *)"ArrayBBPtr_clear", _wrap_ArrayBBPtr_clear, METH_VARARGS, NULL},
+	 { (char *)"ArrayBBPtr_get_allocator", _wrap_ArrayBBPtr_get_allocator, METH_VARARGS, NULL},
 	 { (char *)"ArrayBBPtr_pop_back", _wrap_ArrayBBPtr_pop_back, METH_VARARGS, NULL},
 	 { (char *)"ArrayBBPtr_erase", _wrap_ArrayBBPtr_erase, METH_VARARGS, NULL},
 	 { (char *)"new_ArrayBBPtr", _wrap_new_ArrayBBPtr, METH_VARARGS, NULL},
@@ -23009,6 +26139,8 @@ static PyMethodDef SwigMethods[] = {
 	 { (char *)"TypeFactory_make_void", _wrap_TypeFactory_make_void, METH_VARARGS, NULL},
 	 { (char *)"TypeFactory_make_pointer", _wrap_TypeFactory_make_pointer, METH_VARARGS, NULL},
 	 { (char *)"TypeFactory_make_vector", _wrap_TypeFactory_make_vector, METH_VARARGS, NULL},
+	 { (char *)"TypeFactory_make_array", _wrap_TypeFactory_make_array, METH_VARARGS, NULL},
+	 { (char *)"TypeFactory_make_struct", _wrap_TypeFactory_make_struct, METH_VARARGS, NULL},
 	 { (char *)"new_TypeFactory", _wrap_new_TypeFactory, METH_VARARGS, NULL},
 	 { (char *)"delete_TypeFactory", _wrap_delete_TypeFactory, METH_VARARGS, NULL},
 	 { (char *)"TypeFactory_swigregister", TypeFactory_swigregister, METH_VARARGS, NULL},
@@ -23016,6 +26148,8 @@ static PyMethodDef SwigMethods[] = {
 	 { (char *)"ConstantFactory_make_int_signed", _wrap_ConstantFactory_make_int_signed, METH_VARARGS, NULL},
 	 { (char *)"ConstantFactory_make_real", _wrap_ConstantFactory_make_real, METH_VARARGS, NULL},
 	 { (char *)"ConstantFactory_make_undef", _wrap_ConstantFactory_make_undef, METH_VARARGS, NULL},
+	 { (char *)"ConstantFactory_make_null", _wrap_ConstantFactory_make_null, METH_VARARGS, NULL},
+	 { (char *)"ConstantFactory_make_pointer", _wrap_ConstantFactory_make_pointer, METH_VARARGS, NULL},
 	 { (char *)"new_ConstantFactory", _wrap_new_ConstantFactory, METH_VARARGS, NULL},
 	 { (char *)"delete_ConstantFactory", _wrap_delete_ConstantFactory, METH_VARARGS, NULL},
 	 { (char *)"ConstantFactory_swigregister", ConstantFactory_swigregister, METH_VARARGS, NULL},
@@ -23029,18 +26163,50 @@ static PyMethodDef SwigMethods[] = {
 	 { (char *)"FunctionAdaptor_arguments", _wrap_FunctionAdaptor_arguments, METH_VARARGS, NULL},
 	 { (char *)"FunctionAdaptor_arg_size", _wrap_FunctionAdaptor_arg_size, METH_VARARGS, NULL},
 	 { (char *)"FunctionAdaptor_verify", _wrap_FunctionAdaptor_verify, METH_VARARGS, NULL},
+	 { (char *)"FunctionAdaptor_as_value", _wrap_FunctionAdaptor_as_value, METH_VARARGS, NULL},
+	 { (char *)"FunctionAdaptor_set_internal", _wrap_FunctionAdaptor_set_internal, METH_VARARGS, NULL},
+	 { (char *)"FunctionAdaptor_delete_body", _wrap_FunctionAdaptor_delete_body, METH_VARARGS, NULL},
 	 { (char *)"delete_FunctionAdaptor", _wrap_delete_FunctionAdaptor, METH_VARARGS, NULL},
 	 { (char *)"FunctionAdaptor_swigregister", FunctionAdaptor_swigregister, METH_VARARGS, NULL},
+	 { (char *)"new_PassPipeline", _wrap_new_PassPipeline, METH_VARARGS, NULL},
+	 { (char *)"PassPipeline_set_vectorize", _wrap_PassPipeline_set_vectorize, METH_VARARGS, NULL},
+	 { (char *)"PassPipeline_set_unroll_threshold", _wrap_PassPipeline_set_unroll_threshold, METH_VARARGS, NULL},
+	 { (char *)"PassPipeline_set_inline_threshold", _wrap_PassPipeline_set_inline_threshold, METH_VARARGS, NULL},
+	 { (char *)"PassPipeline_inline_threshold", _wrap_PassPipeline_inline_threshold, METH_VARARGS, NULL},
+	 { (char *)"PassPipeline_add_pass", _wrap_PassPipeline_add_pass, METH_VARARGS, NULL},
+	 { (char *)"PassPipeline_last_error", _wrap_PassPipeline_last_error, METH_VARARGS, NULL},
+	 { (char *)"PassPipeline_populate", _wrap_PassPipeline_populate, METH_VARARGS, NULL},
+	 { (char *)"delete_PassPipeline", _wrap_delete_PassPipeline, METH_VARARGS, NULL},
+	 { (char *)"PassPipeline_swigregister", PassPipeline_swigregister, METH_VARARGS, NULL},
 	 { (char *)"new_JITEngine", _wrap_new_JITEngine, METH_VARARGS, NULL},
 	 { (char *)"delete_JITEngine", _wrap_delete_JITEngine, METH_VARARGS, NULL},
 	 { (char *)"JITEngine_dump", _wrap_JITEngine_dump, METH_VARARGS, NULL},
 	 { (char *)"JITEngine_make_function", _wrap_JITEngine_make_function, METH_VARARGS, NULL},
 	 { (char *)"JITEngine_last_error", _wrap_JITEngine_last_error, METH_VARARGS, NULL},
+	 { (char *)"JITEngine_delete_function", _wrap_JITEngine_delete_function, METH_VARARGS, NULL},
+	 { (char *)"JITEngine_free_function", _wrap_JITEngine_free_function, METH_VARARGS, NULL},
+	 { (char *)"JITEngine_count_uses", _wrap_JITEngine_count_uses, METH_VARARGS, NULL},
+	 { (char *)"JITEngine_declare_global", _wrap_JITEngine_declare_global, METH_VARARGS, NULL},
 	 { (char *)"JITEngine_verify", _wrap_JITEngine_verify, METH_VARARGS, NULL},
 	 { (char *)"JITEngine_optimize", _wrap_JITEngine_optimize, METH_VARARGS, NULL},
 	 { (char *)"JITEngine_optimize_function", _wrap_JITEngine_optimize_function, METH_VARARGS, NULL},
+	 { (char *)"JITEngine_inline_calls", _wrap_JITEngine_inline_calls, METH_VARARGS, NULL},
+	 { (char *)"JITEngine_run_pipeline", _wrap_JITEngine_run_pipeline, METH_VARARGS, NULL},
+	 { (char *)"JITEngine_optimize_interprocedural", _wrap_JITEngine_optimize_interprocedural, METH_VARARGS, NULL},
 	 { (char *)"JITEngine_get_pointer_to_function", _wrap_JITEngine_get_pointer_to_function, METH_VARARGS, NULL},
+	 { (char *)"JITEngine_recompile_function", _wrap_JITEngine_recompile_function, METH_VARARGS, NULL},
 	 { (char *)"JITEngine_dump_asm", _wrap_JITEngine_dump_asm, METH_VARARGS, NULL},
+	 { (char *)"JITEngine_dump_bitcode", _wrap_JITEngine_dump_bitcode, METH_VARARGS, NULL},
+	 { (char *)"JITEngine_load_bitcode", _wrap_JITEngine_load_bitcode, METH_VARARGS, NULL},
+	 { (char *)"JITEngine_loaded_helper_count", _wrap_JITEngine_loaded_helper_count, METH_VARARGS, NULL},
+	 { (char *)"JITEngine_loaded_helper", _wrap_JITEngine_loaded_helper, METH_VARARGS, NULL},
+	 { (char *)"JITEngine_emit_object", _wrap_JITEngine_emit_object, METH_VARARGS, NULL},
+	 { (char *)"JITEngine_target_triple", _wrap_JITEngine_target_triple, METH_VARARGS, NULL},
+	 { (char *)"JITEngine_host_cpu_name", _wrap_JITEngine_host_cpu_name, METH_VARARGS, NULL},
+	 { (char *)"JITEngine_set_target", _wrap_JITEngine_set_target, METH_VARARGS, NULL},
+	 { (char *)"JITEngine_target_cpu", _wrap_JITEngine_target_cpu, METH_VARARGS, NULL},
+	 { (char *)"JITEngine_target_features", _wrap_JITEngine_target_features, METH_VARARGS, NULL},
+	 { (char *)"JITEngine_llvm_version", _wrap_JITEngine_llvm_version, METH_VARARGS, NULL},
 	 { (char *)"JITEngine_start_multithreaded", _wrap_JITEngine_start_multithreaded, METH_VARARGS, NULL},
 	 { (char *)"JITEngine_stop_multithreaded", _wrap_JITEngine_stop_multithreaded, METH_VARARGS, NULL},
 	 { (char *)"JITEngine_is_multithreaded", _wrap_JITEngine_is_multithreaded, METH_VARARGS, NULL},
@@ -23049,6 +26215,8 @@ static PyMethodDef SwigMethods[] = {
 	 { (char *)"new_Builder", _wrap_new_Builder, METH_VARARGS, NULL},
 	 { (char *)"Builder_insert_at", _wrap_Builder_insert_at, METH_VARARGS, NULL},
 	 { (char *)"Builder_get_basic_block", _wrap_Builder_get_basic_block, METH_VARARGS, NULL},
+	 { (char *)"Builder_set_fast_math", _wrap_Builder_set_fast_math, METH_VARARGS, NULL},
+	 { (char *)"Builder_fast_math", _wrap_Builder_fast_math, METH_VARARGS, NULL},
 	 { (char *)"Builder_phi", _wrap_Builder_phi, METH_VARARGS, NULL},
 	 { (char *)"Builder_intrinsic_pow", _wrap_Builder_intrinsic_pow, METH_VARARGS, NULL},
 	 { (char *)"Builder_bitwise_and", _wrap_Builder_bitwise_and, METH_VARARGS, NULL},
@@ -23083,16 +26251,23 @@ static PyMethodDef SwigMethods[] = {
 	 { (char *)"Builder_ret_void", _wrap_Builder_ret_void, METH_VARARGS, NULL},
 	 { (char *)"Builder_branch", _wrap_Builder_branch, METH_VARARGS, NULL},
 	 { (char *)"Builder_cond_branch", _wrap_Builder_cond_branch, METH_VARARGS, NULL},
+	 { (char *)"Builder_cond_branch_weighted", _wrap_Builder_cond_branch_weighted, METH_VARARGS, NULL},
 	 { (char *)"Builder_call", _wrap_Builder_call, METH_VARARGS, NULL},
 	 { (char *)"Builder_unreachable", _wrap_Builder_unreachable, METH_VARARGS, NULL},
+	 { (char *)"Builder_select", _wrap_Builder_select, METH_VARARGS, NULL},
 	 { (char *)"Builder_alloc", _wrap_Builder_alloc, METH_VARARGS, NULL},
 	 { (char *)"Builder_alloc_array", _wrap_Builder_alloc_array, METH_VARARGS, NULL},
 	 { (char *)"Builder_load", _wrap_Builder_load, METH_VARARGS, NULL},
+	 { (char *)"Builder_load_aligned", _wrap_Builder_load_aligned, METH_VARARGS, NULL},
 	 { (char *)"Builder_store", _wrap_Builder_store, METH_VARARGS, NULL},
+	 { (char *)"Builder_store_aligned", _wrap_Builder_store_aligned, METH_VARARGS, NULL},
 	 { (char *)"Builder_gep", _wrap_Builder_gep, METH_VARARGS, NULL},
 	 { (char *)"Builder_gep2", _wrap_Builder_gep2, METH_VARARGS, NULL},
+	 { (char *)"Builder_bitcast", _wrap_Builder_bitcast, METH_VARARGS, NULL},
+	 { (char *)"Builder_global_string_ptr", _wrap_Builder_global_string_ptr, METH_VARARGS, NULL},
 	 { (char *)"Builder_extract_element", _wrap_Builder_extract_element, METH_VARARGS, NULL},
 	 { (char *)"Builder_insert_element", _wrap_Builder_insert_element, METH_VARARGS, NULL},
+	 { (char *)"Builder_shuffle", _wrap_Builder_shuffle, METH_VARARGS, NULL},
 	 { (char *)"Builder_is_block_closed", _wrap_Builder_is_block_closed, METH_VARARGS, NULL},
 	 { (char *)"delete_Builder", _wrap_delete_Builder, METH_VARARGS, NULL},
 	 { (char *)"Builder_swigregister", Builder_swigregister, METH_VARARGS, NULL},
@@ -23106,6 +26281,7 @@ static swig_type_info _swigt__p_Builder = {"_p_Builder", "Builder *", 0, 0, (voi
 static swig_type_info _swigt__p_ConstantFactory = {"_p_ConstantFactory", "ConstantFactory *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_FunctionAdaptor = {"_p_FunctionAdaptor", "FunctionAdaptor *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_JITEngine = {"_p_JITEngine", "JITEngine *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_PassPipeline = {"_p_PassPipeline", "PassPipeline *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_TypeFactory = {"_p_TypeFactory", "TypeFactory *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_allocator_type = {"_p_allocator_type", "allocator_type *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_char = {"_p_char", "char *", 0, 0, (void*)0, 0};
@@ -23113,6 +26289,7 @@ static swig_type_info _swigt__p_const_reference = {"_p_const_reference", "const_
 static swig_type_info _swigt__p_difference_type = {"_p_difference_type", "difference_type *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_llvm__BasicBlock = {"_p_llvm__BasicBlock", "llvm::BasicBlock *|std::vector< llvm::BasicBlock * >::value_type", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_llvm__Function = {"_p_llvm__Function", "llvm::Function *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_llvm__FunctionPassManager = {"_p_llvm__FunctionPassManager", "llvm::FunctionPassManager *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_llvm__Type = {"_p_llvm__Type", "llvm::Type *|std::vector< llvm::Type * >::value_type", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_llvm__Value = {"_p_llvm__Value", "llvm::Value *|std::vector< llvm::Value * >::value_type", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_p_PyObject = {"_p_p_PyObject", "PyObject **", 0, 0, (void*)0, 0};
@@ -23124,8 +26301,6 @@ static swig_type_info _swigt__p_std__allocatorT_llvm__Type_p_t = {"_p_std__alloc
 static swig_type_info _swigt__p_std__allocatorT_llvm__Value_p_t = {"_p_std__allocatorT_llvm__Value_p_t", "std::vector< llvm::Value * >::allocator_type *|std::allocator< llvm::Value * > *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_std__allocatorT_std__string_t = {"_p_std__allocatorT_std__string_t", "std::vector< std::string >::allocator_type *|std::allocator< std::string > *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_std__invalid_argument = {"_p_std__invalid_argument", "std::invalid_argument *", 0, 0, (void*)0, 0};
-static swig_type_info _swigt__p_std__vectorT__Tp__Alloc_t = {"_p_std__vectorT__Tp__Alloc_t", "std::vector< _Tp,_Alloc > *", 0, 0, (void*)0, 0};
-static swig_type_info _swigt__p_std__vectorT__Tp_p__Alloc_t = {"_p_std__vectorT__Tp_p__Alloc_t", "std::vector< _Tp *,_Alloc > *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_std__vectorT_int_std__allocatorT_int_t_t = {"_p_std__vectorT_int_std__allocatorT_int_t_t", "std::vector< int,std::allocator< int > > *|std::vector< int > *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_std__vectorT_llvm__BasicBlock_p_std__allocatorT_llvm__BasicBlock_p_t_t = {"_p_std__vectorT_llvm__BasicBlock_p_std__allocatorT_llvm__BasicBlock_p_t_t", "std::vector< llvm::BasicBlock *,std::allocator< llvm::BasicBlock * > > *|std::vector< llvm::BasicBlock * > *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_std__vectorT_llvm__Type_p_std__allocatorT_llvm__Type_p_t_t = {"_p_std__vectorT_llvm__Type_p_std__allocatorT_llvm__Type_p_t_t", "std::vector< llvm::Type * > *|std::vector< llvm::Type *,std::allocator< llvm::Type * > > *", 0, 0, (void*)0, 0};
@@ -23140,6 +26315,7 @@ static swig_type_info *swig_type_initial[] = {
   &_swigt__p_ConstantFactory,
   &_swigt__p_FunctionAdaptor,
   &_swigt__p_JITEngine,
+  &_swigt__p_PassPipeline,
   &_swigt__p_TypeFactory,
   &_swigt__p_allocator_type,
   &_swigt__p_char,
@@ -23147,6 +26323,7 @@ static swig_type_info *swig_type_initial[] = {
   &_swigt__p_difference_type,
   &_swigt__p_llvm__BasicBlock,
   &_swigt__p_llvm__Function,
+  &_swigt__p_llvm__FunctionPassManager,
   &_swigt__p_llvm__Type,
   &_swigt__p_llvm__Value,
   &_swigt__p_p_PyObject,
@@ -23158,8 +26335,6 @@ static swig_type_info *swig_type_initial[] = {
   &_swigt__p_std__allocatorT_llvm__Value_p_t,
   &_swigt__p_std__allocatorT_std__string_t,
   &_swigt__p_std__invalid_argument,
-  &_swigt__p_std__vectorT__Tp__Alloc_t,
-  &_swigt__p_std__vectorT__Tp_p__Alloc_t,
   &_swigt__p_std__vectorT_int_std__allocatorT_int_t_t,
   &_swigt__p_std__vectorT_llvm__BasicBlock_p_std__allocatorT_llvm__BasicBlock_p_t_t,
   &_swigt__p_std__vectorT_llvm__Type_p_std__allocatorT_llvm__Type_p_t_t,
@@ -23174,6 +26349,7 @@ static swig_cast_info _swigc__p_Builder[] = {  {&_swigt__p_Builder, 0, 0, 0},{0,
 static swig_cast_info _swigc__p_ConstantFactory[] = {  {&_swigt__p_ConstantFactory, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_FunctionAdaptor[] = {  {&_swigt__p_FunctionAdaptor, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_JITEngine[] = {  {&_swigt__p_JITEngine, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_PassPipeline[] = {  {&_swigt__p_PassPipeline, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_TypeFactory[] = {  {&_swigt__p_TypeFactory, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_allocator_type[] = {  {&_swigt__p_allocator_type, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_char[] = {  {&_swigt__p_char, 0, 0, 0},{0, 0, 0, 0}};
@@ -23181,6 +26357,7 @@ static swig_cast_info _swigc__p_const_reference[] = {  {&_swigt__p_const_referen
 static swig_cast_info _swigc__p_difference_type[] = {  {&_swigt__p_difference_type, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_llvm__BasicBlock[] = {  {&_swigt__p_llvm__BasicBlock, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_llvm__Function[] = {  {&_swigt__p_llvm__Function, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_llvm__FunctionPassManager[] = {  {&_swigt__p_llvm__FunctionPassManager, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_llvm__Type[] = {  {&_swigt__p_llvm__Type, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_llvm__Value[] = {  {&_swigt__p_llvm__Value, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_p_PyObject[] = {  {&_swigt__p_p_PyObject, 0, 0, 0},{0, 0, 0, 0}};
@@ -23192,8 +26369,6 @@ static swig_cast_info _swigc__p_std__allocatorT_llvm__Type_p_t[] = {  {&_swigt__
 static swig_cast_info _swigc__p_std__allocatorT_llvm__Value_p_t[] = {  {&_swigt__p_std__allocatorT_llvm__Value_p_t, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_std__allocatorT_std__string_t[] = {  {&_swigt__p_std__allocatorT_std__string_t, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_std__invalid_argument[] = {  {&_swigt__p_std__invalid_argument, 0, 0, 0},{0, 0, 0, 0}};
-static swig_cast_info _swigc__p_std__vectorT__Tp__Alloc_t[] = {  {&_swigt__p_std__vectorT__Tp__Alloc_t, 0, 0, 0},{0, 0, 0, 0}};
-static swig_cast_info _swigc__p_std__vectorT__Tp_p__Alloc_t[] = {  {&_swigt__p_std__vectorT__Tp_p__Alloc_t, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_std__vectorT_int_std__allocatorT_int_t_t[] = {  {&_swigt__p_std__vectorT_int_std__allocatorT_int_t_t, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_std__vectorT_llvm__BasicBlock_p_std__allocatorT_llvm__BasicBlock_p_t_t[] = {  {&_swigt__p_std__vectorT_llvm__BasicBlock_p_std__allocatorT_llvm__BasicBlock_p_t_t, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_std__vectorT_llvm__Type_p_std__allocatorT_llvm__Type_p_t_t[] = {  {&_swigt__p_std__vectorT_llvm__Type_p_std__allocatorT_llvm__Type_p_t_t, 0, 0, 0},{0, 0, 0, 0}};
@@ -23208,6 +26383,7 @@ static swig_cast_info *swig_cast_initial[] = {
   _swigc__p_ConstantFactory,
   _swigc__p_FunctionAdaptor,
   _swigc__p_JITEngine,
+  _swigc__p_PassPipeline,
   _swigc__p_TypeFactory,
   _swigc__p_allocator_type,
   _swigc__p_char,
@@ -23215,6 +26391,7 @@ static swig_cast_info *swig_cast_initial[] = {
   _swigc__p_difference_type,
   _swigc__p_llvm__BasicBlock,
   _swigc__p_llvm__Function,
+  _swigc__p_llvm__FunctionPassManager,
   _swigc__p_llvm__Type,
   _swigc__p_llvm__Value,
   _swigc__p_p_PyObject,
@@ -23226,8 +26403,6 @@ static swig_cast_info *swig_cast_initial[] = {
   _swigc__p_std__allocatorT_llvm__Value_p_t,
   _swigc__p_std__allocatorT_std__string_t,
   _swigc__p_std__invalid_argument,
-  _swigc__p_std__vectorT__Tp__Alloc_t,
-  _swigc__p_std__vectorT__Tp_p__Alloc_t,
   _swigc__p_std__vectorT_int_std__allocatorT_int_t_t,
   _swigc__p_std__vectorT_llvm__BasicBlock_p_std__allocatorT_llvm__BasicBlock_p_t_t,
   _swigc__p_std__vectorT_llvm__Type_p_std__allocatorT_llvm__Type_p_t_t,
@@ -23249,18 +26424,18 @@ static swig_const_info swig_const_table[] = {
 #endif
 /* -----------------------------------------------------------------------------
  * Type initialization:
- * This problem is tough by the requirement that no dynamic 
- * memory is used. Also, since swig_type_info structures store pointers to 
+ * This problem is tough by the requirement that no dynamic
+ * memory is used. Also, since swig_type_info structures store pointers to
  * swig_cast_info structures and swig_cast_info structures store pointers back
- * to swig_type_info structures, we need some lookup code at initialization. 
- * The idea is that swig generates all the structures that are needed. 
- * The runtime then collects these partially filled structures. 
- * The SWIG_InitializeModule function takes these initial arrays out of 
+ * to swig_type_info structures, we need some lookup code at initialization.
+ * The idea is that swig generates all the structures that are needed.
+ * The runtime then collects these partially filled structures.
+ * The SWIG_InitializeModule function takes these initial arrays out of
  * swig_module, and does all the lookup, filling in the swig_module.types
  * array with the correct data and linking the correct swig_cast_info
  * structures together.
  *
- * The generated swig_type_info structures are assigned staticly to an initial 
+ * The generated swig_type_info structures are assigned statically to an initial
  * array. We just loop through that array, and handle each type individually.
  * First we lookup if this type has been already loaded, and if so, use the
  * loaded structure instead of the generated one. Then we have to fill in the
@@ -23270,17 +26445,17 @@ static swig_const_info swig_const_table[] = {
  * a column is one of the swig_cast_info structures for that type.
  * The cast_initial array is actually an array of arrays, because each row has
  * a variable number of columns. So to actually build the cast linked list,
- * we find the array of casts associated with the type, and loop through it 
+ * we find the array of casts associated with the type, and loop through it
  * adding the casts to the list. The one last trick we need to do is making
  * sure the type pointer in the swig_cast_info struct is correct.
  *
- * First off, we lookup the cast->type name to see if it is already loaded. 
+ * First off, we lookup the cast->type name to see if it is already loaded.
  * There are three cases to handle:
  *  1) If the cast->type has already been loaded AND the type we are adding
  *     casting info to has not been loaded (it is in this module), THEN we
  *     replace the cast->type pointer with the type pointer that has already
  *     been loaded.
- *  2) If BOTH types (the one we are adding casting info to, and the 
+ *  2) If BOTH types (the one we are adding casting info to, and the
  *     cast->type) are loaded, THEN the cast info has already been loaded by
  *     the previous module so we just ignore it.
  *  3) Finally, if cast->type has not already been loaded, then we add that
@@ -23304,9 +26479,7 @@ SWIGRUNTIME void
 SWIG_InitializeModule(void *clientdata) {
   size_t i;
   swig_module_info *module_head, *iter;
-  int found, init;
-  
-  clientdata = clientdata;
+  int init;
   
   /* check to see if the circular list has been setup, if not, set it up */
   if (swig_module.next==0) {
@@ -23325,27 +26498,23 @@ SWIG_InitializeModule(void *clientdata) {
     /* This is the first module loaded for this interpreter */
     /* so set the swig module into the interpreter */
     SWIG_SetModule(clientdata, &swig_module);
-    module_head = &swig_module;
   } else {
     /* the interpreter has loaded a SWIG module, but has it loaded this one? */
-    found=0;
     iter=module_head;
     do {
       if (iter==&swig_module) {
-        found=1;
-        break;
+        /* Our module is already in the list, so there's nothing more to do. */
+        return;
       }
       iter=iter->next;
     } while (iter!= module_head);
     
-    /* if the is found in the list, then all is done and we may leave */
-    if (found) return;
-    /* otherwise we must add out module into the list */
+    /* otherwise we must add our module into the list */
     swig_module.next = module_head->next;
     module_head->next = &swig_module;
   }
   
-  /* When multiple interpeters are used, a module could have already been initialized in
+  /* When multiple interpreters are used, a module could have already been initialized in
        a different interpreter, but not yet have a pointer in this interpreter.
        In this case, we do not want to continue adding types... everything should be
        set up already */
@@ -23592,7 +26761,7 @@ extern "C" {
       var = var->next;
     }
     if (res == NULL && !PyErr_Occurred()) {
-      PyErr_SetString(PyExc_NameError,"Unknown C global variable");
+      PyErr_Format(PyExc_AttributeError, "Unknown C global variable '%s'", n);
     }
     return res;
   }
@@ -23609,7 +26778,7 @@ extern "C" {
       var = var->next;
     }
     if (res == 1 && !PyErr_Occurred()) {
-      PyErr_SetString(PyExc_NameError,"Unknown C global variable");
+      PyErr_Format(PyExc_AttributeError, "Unknown C global variable '%s'", n);
     }
     return res;
   }
@@ -23621,7 +26790,6 @@ extern "C" {
     static int type_init = 0;
     if (!type_init) {
       const PyTypeObject tmp = {
-        /* PyObject header changed in Python 3 */
 #if PY_VERSION_HEX >= 0x03000000
         PyVarObject_HEAD_INIT(NULL, 0)
 #else
@@ -23659,10 +26827,19 @@ extern "C" {
         0,                                  /* tp_del */
 #endif
 #if PY_VERSION_HEX >= 0x02060000
-        0,                                  /* tp_version */
+        0,                                  /* tp_version_tag */
+#endif
+#if PY_VERSION_HEX >= 0x03040000
+        0,                                  /* tp_finalize */
 #endif
 #ifdef COUNT_ALLOCS
-        0,0,0,0                             /* tp_alloc -> tp_next */
+        0,                                  /* tp_allocs */
+        0,                                  /* tp_frees */
+        0,                                  /* tp_maxalloc */
+#if PY_VERSION_HEX >= 0x02050000
+        0,                                  /* tp_prev */
+#endif
+        0                                   /* tp_next */
 #endif
       };
       varlink_type = tmp;
@@ -23751,7 +26928,9 @@ extern "C" {
     size_t i;
     for (i = 0; methods[i].ml_name; ++i) {
       const char *c = methods[i].ml_doc;
-      if (c && (c = strstr(c, "swig_ptr: "))) {
+      if (!c) continue;
+      c = strstr(c, "swig_ptr: ");
+      if (c) {
         int j;
         swig_const_info *ci = 0;
         const char *name = c + 10;
@@ -23842,17 +27021,18 @@ SWIG_init(void) {
   static PyGetSetDef thisown_getset_def = {
     (char *)"thisown", SwigPyBuiltin_GetterClosure, SwigPyBuiltin_SetterClosure, NULL, &thisown_getset_closure
   };
-  PyObject *metatype_args;
   PyTypeObject *builtin_pytype;
   int builtin_base_count;
   swig_type_info *builtin_basetype;
   PyObject *tuple;
   PyGetSetDescrObject *static_getset;
   PyTypeObject *metatype;
+  PyTypeObject *swigpyobject;
   SwigPyClientData *cd;
   PyObject *public_interface, *public_symbol;
   PyObject *this_descr;
   PyObject *thisown_descr;
+  PyObject *self = 0;
   int i;
   
   (void)builtin_pytype;
@@ -23860,15 +27040,11 @@ SWIG_init(void) {
   (void)builtin_basetype;
   (void)tuple;
   (void)static_getset;
+  (void)self;
   
-  /* metatype is used to implement static member variables. */
-  metatype_args = Py_BuildValue("(s(O){})", "SwigPyObjectType", &PyType_Type);
-  assert(metatype_args);
-  metatype = (PyTypeObject *) PyType_Type.tp_call((PyObject *) &PyType_Type, metatype_args, NULL);
+  /* Metaclass is used to implement static member variables */
+  metatype = SwigPyObjectType();
   assert(metatype);
-  Py_DECREF(metatype_args);
-  metatype->tp_setattro = (setattrofunc) &SwigPyObjectType_setattro;
-  assert(PyType_Ready(metatype) >= 0);
 #endif
   
   /* Fix SwigMethods to carry the callback ptrs when needed */
@@ -23879,18 +27055,22 @@ SWIG_init(void) {
 #else
   m = Py_InitModule((char *) SWIG_name, SwigMethods);
 #endif
+  
   md = d = PyModule_GetDict(m);
+  (void)md;
   
   SWIG_InitializeModule(0);
   
 #ifdef SWIGPYTHON_BUILTIN
+  swigpyobject = SwigPyObject_TypeOnce();
+  
   SwigPyObject_stype = SWIG_MangledTypeQuery("_p_SwigPyObject");
   assert(SwigPyObject_stype);
   cd = (SwigPyClientData*) SwigPyObject_stype->clientdata;
   if (!cd) {
     SwigPyObject_stype->clientdata = &SwigPyObject_clientdata;
-    SwigPyObject_clientdata.pytype = SwigPyObject_TypeOnce();
-  } else if (SwigPyObject_TypeOnce()->tp_basicsize != cd->pytype->tp_basicsize) {
+    SwigPyObject_clientdata.pytype = swigpyobject;
+  } else if (swigpyobject->tp_basicsize != cd->pytype->tp_basicsize) {
     PyErr_SetString(PyExc_RuntimeError, "Import error: attempted to load two incompatible swig-generated modules.");
 # if PY_VERSION_HEX >= 0x03000000
     return NULL;
@@ -23947,6 +27127,12 @@ SWIG_init(void) {
   SWIG_Python_SetConstant(d, "FCMP_ULE",SWIG_From_int(static_cast< int >(FCMP_ULE)));
   SWIG_Python_SetConstant(d, "FCMP_UNE",SWIG_From_int(static_cast< int >(FCMP_UNE)));
   SWIG_Python_SetConstant(d, "FCMP_TRUE",SWIG_From_int(static_cast< int >(FCMP_TRUE)));
+  SWIG_Python_SetConstant(d, "FASTMATH_NNAN",SWIG_From_int(static_cast< int >(FASTMATH_NNAN)));
+  SWIG_Python_SetConstant(d, "FASTMATH_NINF",SWIG_From_int(static_cast< int >(FASTMATH_NINF)));
+  SWIG_Python_SetConstant(d, "FASTMATH_NSZ",SWIG_From_int(static_cast< int >(FASTMATH_NSZ)));
+  SWIG_Python_SetConstant(d, "FASTMATH_ARCP",SWIG_From_int(static_cast< int >(FASTMATH_ARCP)));
+  SWIG_Python_SetConstant(d, "FASTMATH_CONTRACT",SWIG_From_int(static_cast< int >(FASTMATH_CONTRACT)));
+  SWIG_Python_SetConstant(d, "FASTMATH_REASSOC",SWIG_From_int(static_cast< int >(FASTMATH_REASSOC)));
 #if PY_VERSION_HEX >= 0x03000000
   return m;
 #else
@@ -5,9 +5,10 @@ All rights reserved.
 
 #include "llvm_wrapper.hpp"
 #include "llvm/Intrinsics.h"
+#include "llvm/Metadata.h"
 
 Builder::Builder()
-    : builder_(llvm::getGlobalContext())
+    : builder_(llvm::getGlobalContext()), fast_math_(0)
 {
     //empty
 }
@@ -20,6 +21,75 @@ llvm::BasicBlock * Builder::get_basic_block() const {
     return builder_.GetInsertBlock();
 }
 
+void Builder::set_fast_math(unsigned flags){
+    fast_math_ = flags;
+}
+
+unsigned Builder::fast_math() const{
+    return fast_math_;
+}
+
+llvm::Value * Builder::tag_fast_math(llvm::Value * value){
+    using namespace llvm;
+
+    Instruction * inst = dyn_cast<Instruction>(value);
+    if ( !fast_math_ || !inst ) return value; // constants are folded
+
+#if LLVM_VERSION_MAJOR>3 || (LLVM_VERSION_MAJOR==3 && LLVM_VERSION_MINOR>=2)
+    // LLVM 3.2 has no separate flag for reassociation. Unsafe algebra is
+    // the only flag that allows it and it implies all the other flags.
+    FastMathFlags fmf;
+    if ( fast_math_ & FASTMATH_REASSOC ) fmf.setUnsafeAlgebra();
+    if ( fast_math_ & FASTMATH_NNAN ) fmf.setNoNaNs();
+    if ( fast_math_ & FASTMATH_NINF ) fmf.setNoInfs();
+    if ( fast_math_ & FASTMATH_NSZ ) fmf.setNoSignedZeros();
+    if ( fast_math_ & FASTMATH_ARCP ) fmf.setAllowReciprocal();
+    inst->setFastMathFlags(fmf);
+#else
+    // No fast-math flags on instructions. Keep them for inspection.
+    LLVMContext & ctx = inst->getContext();
+    Value * flags = ConstantInt::get(Type::getInt32Ty(ctx), fast_math_);
+    inst->setMetadata("pymothoa.fastmath", MDNode::get(ctx, flags));
+#endif
+    return inst;
+}
+
+llvm::Value * Builder::contract(llvm::Value * lhs, llvm::Value * rhs,
+                                bool subtract, const char * name){
+    using namespace llvm;
+
+    if ( !(fast_math_ & FASTMATH_CONTRACT) ) return 0;
+
+#if LLVM_VERSION_MAJOR>3 || (LLVM_VERSION_MAJOR==3 && LLVM_VERSION_MINOR>=2)
+    // Fuse a product that is not used elsewhere into llvm.fmuladd. The
+    // code generator fuses it if the target has a fused multiply-add.
+    // The product is left for the dead code elimination.
+    BinaryOperator * mul = dyn_cast<BinaryOperator>(lhs);
+    bool mul_first = mul && mul->getOpcode()==Instruction::FMul
+                     && mul->use_empty();
+    if ( !mul_first ){
+        mul = dyn_cast<BinaryOperator>(rhs);
+        if ( !mul || mul->getOpcode()!=Instruction::FMul || !mul->use_empty() )
+            return 0;
+    }
+
+    Value * a = mul->getOperand(0);
+    Value * b = mul->getOperand(1);
+    Value * c = mul_first ? rhs : lhs;
+    if ( subtract ){
+        if ( mul_first ) c = tag_fast_math(builder_.CreateFNeg(c)); // a*b - c
+        else a = tag_fast_math(builder_.CreateFNeg(a));             // c - a*b
+    }
+
+    llvm::Module * M = builder_.GetInsertBlock()->getParent()->getParent();
+    Function * fmuladd = Intrinsic::getDeclaration(M, Intrinsic::fmuladd,
+                                                   mul->getType());
+    return builder_.CreateCall3(fmuladd, a, b, c, name);
+#else
+    // llvm.fmuladd is new in LLVM 3.2. Contraction is not available.
+    return 0;
+#endif
+}
 
 using llvm::Value;
 
@@ -128,23 +198,25 @@ Value * Builder::negative(Value * value, const char * name){
 // float operations
 
 Value * Builder::fadd(Value * lhs, Value * rhs, const char * name){
-    return builder_.CreateFAdd(lhs, rhs, name);
+    if ( Value * fused = contract(lhs, rhs, false, name) ) return fused;
+    return tag_fast_math(builder_.CreateFAdd(lhs, rhs, name));
 }
 
 Value * Builder::fsub(Value * lhs, Value * rhs, const char * name){
-    return builder_.CreateFSub(lhs, rhs, name);
+    if ( Value * fused = contract(lhs, rhs, true, name) ) return fused;
+    return tag_fast_math(builder_.CreateFSub(lhs, rhs, name));
 }
 
 Value * Builder::fmul(Value * lhs, Value * rhs, const char * name){
-    return builder_.CreateFMul(lhs, rhs, name);
+    return tag_fast_math(builder_.CreateFMul(lhs, rhs, name));
 }
 
 Value * Builder::fdiv(Value * lhs, Value * rhs, const char * name){
-    return builder_.CreateFDiv(lhs, rhs, name);
+    return tag_fast_math(builder_.CreateFDiv(lhs, rhs, name));
 }
 
 Value * Builder::fmod(Value * lhs, Value * rhs, const char * name){
-    return builder_.CreateFRem(lhs, rhs, name);
+    return tag_fast_math(builder_.CreateFRem(lhs, rhs, name));
 }
 
 Value * Builder::fcmp(int op, Value * lhs, Value * rhs, const char * name){
@@ -195,6 +267,23 @@ void Builder::cond_branch(Value * Cond, llvm::BasicBlock * bb_true, llvm::BasicB
     builder_.CreateCondBr(Cond, bb_true, bb_false);
 }
 
+void Builder::cond_branch_weighted(Value * Cond, llvm::BasicBlock * bb_true, llvm::BasicBlock * bb_false, unsigned weight_true, unsigned weight_false){
+    using namespace llvm;
+    BranchInst * br = builder_.CreateCondBr(Cond, bb_true, bb_false);
+    LLVMContext & ctx = br->getContext();
+    Type * i32 = Type::getInt32Ty(ctx);
+    Value * weights[] = {
+        MDString::get(ctx, "branch_weights"),
+        ConstantInt::get(i32, weight_true),
+        ConstantInt::get(i32, weight_false),
+    };
+    br->setMetadata(LLVMContext::MD_prof, MDNode::get(ctx, weights));
+}
+
+Value * Builder::select(Value * cond, Value * on_true, Value * on_false, const char * name){
+    return builder_.CreateSelect(cond, on_true, on_false, name);
+}
+
 Value * Builder::alloc(llvm::Type * ty, const char * name){
     return builder_.CreateAlloca(ty, 0, name);
 }
@@ -207,10 +296,18 @@ Value * Builder::load(Value * ptr, const char * name){
     return builder_.CreateLoad(ptr, name);
 }
 
+Value * Builder::load_aligned(Value * ptr, unsigned align, const char * name){
+    return builder_.CreateAlignedLoad(ptr, align, name);
+}
+
 Value * Builder::store(Value * val, Value * ptr){
     return builder_.CreateStore(val, ptr);
 }
 
+Value * Builder::store_aligned(Value * val, Value * ptr, unsigned align){
+    return builder_.CreateAlignedStore(val, ptr, align);
+}
+
 Value * Builder::call(FunctionAdaptor func, std::vector<Value*> args, const char * name){
     return builder_.CreateCall(func.get_function(), args, name);
 }
@@ -230,6 +327,14 @@ Value * Builder::gep2(Value * ptr, std::vector<Value*> indices, const char * nam
     return builder_.CreateGEP(ptr, indices, name);
 }
 
+Value * Builder::bitcast(Value * val, llvm::Type * ty, const char * name){
+    return builder_.CreateBitCast(val, ty, name);
+}
+
+Value * Builder::global_string_ptr(const char value[], const char * name){
+    return builder_.CreateGlobalStringPtr(value, name);
+}
+
 // vector function
 
 Value * Builder::extract_element(Value * vector, Value * idx, const char * name){
@@ -240,6 +345,19 @@ Value * Builder::insert_element(Value * vector, Value * newvalue, Value * idx, c
     return builder_.CreateInsertElement(vector, newvalue, idx, name);
 }
 
+Value * Builder::shuffle(Value * vector1, Value * vector2, std::vector<int> mask, const char * name){
+    llvm::Type * i32 = llvm::Type::getInt32Ty(llvm::getGlobalContext());
+    std::vector<llvm::Constant*> lanes;
+    for (unsigned i = 0; i < mask.size(); ++i) {
+        if (mask[i] < 0)
+            lanes.push_back(llvm::UndefValue::get(i32));
+        else
+            lanes.push_back(llvm::ConstantInt::get(i32, mask[i]));
+    }
+    return builder_.CreateShuffleVector(vector1, vector2,
+                                        llvm::ConstantVector::get(lanes), name);
+}
+
 bool Builder::is_block_closed(){
     return get_basic_block()->getTerminator()!=0;
 }
@@ -22,3 +22,13 @@ Value * ConstantFactory::make_real(Type * ty, double val){
 Value * ConstantFactory::make_undef(Type * ty){
     return UndefValue::get(ty);
 }
+
+Value * ConstantFactory::make_null(Type * ty){
+    return Constant::getNullValue(ty);
+}
+
+Value * ConstantFactory::make_pointer(Type * ty, unsigned long long addr){
+    Constant * intaddr = ConstantInt::get(Type::getInt64Ty(ty->getContext()),
+                                          addr);
+    return ConstantExpr::getIntToPtr(intaddr, ty);
+}
@@ -70,3 +70,18 @@ bool FunctionAdaptor::verify() const {
     EnsureFunctionValid;
     return not llvm::verifyFunction(*func_);
 }
+
+llvm::Value * FunctionAdaptor::as_value() const {
+    EnsureFunctionValid;
+    return func_;
+}
+
+void FunctionAdaptor::set_internal() {
+    EnsureFunctionValid;
+    func_->setLinkage(llvm::GlobalValue::InternalLinkage);
+}
+
+void FunctionAdaptor::delete_body() {
+    EnsureFunctionValid;
+    func_->deleteBody();
+}
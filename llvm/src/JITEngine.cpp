@@ -10,8 +10,14 @@ All rights reserved.
 #include "llvm/Support/Host.h"
 #include "llvm/Support/TargetRegistry.h"
 #include "llvm/Transforms/IPO/PassManagerBuilder.h"
+#include "llvm/Transforms/Utils/Cloning.h"
+#include "llvm/Bitcode/ReaderWriter.h"
+#include "llvm/Support/MemoryBuffer.h"
+#include "llvm/ADT/SmallVector.h"
+#include "llvm/ADT/SmallPtrSet.h"
 
 #include <sstream>
+#include <set>
 
 class PassRegistryPrinter : public llvm::PassRegistrationListener{
 public:
@@ -40,6 +46,23 @@ void InitializePasses(){
 }
 
 llvm::ExecutionEngine * JITEngine::the_exec_engine_=0;
+std::string JITEngine::target_cpu_;
+std::string JITEngine::target_features_;
+
+/**
+ * Split a comma separated list of target features.
+ */
+static std::vector<std::string> split_features(const std::string & features){
+    std::vector<std::string> out;
+    std::string::size_type begin = 0;
+    while ( begin < features.size() ) {
+        std::string::size_type end = features.find(',', begin);
+        if ( end == std::string::npos ) end = features.size();
+        if ( end > begin ) out.push_back(features.substr(begin, end - begin));
+        begin = end + 1;
+    }
+    return out;
+}
 
 JITEngine::JITEngine(std::string modname, int optlevel, bool vectorize)
     : module_(0),
@@ -79,6 +102,11 @@ JITEngine::JITEngine(std::string modname, int optlevel, bool vectorize)
         engine_builder.setEngineKind(EngineKind::JIT); // force JIT
         engine_builder.setOptLevel(CodeGenOpt::Aggressive); // in order to use SSE
 
+        // Generate code for the selected CPU instead of a generic one.
+        if (target_cpu_.empty()) target_cpu_ = sys::getHostCPUName();
+        engine_builder.setMCPU(target_cpu_);
+        engine_builder.setMAttrs(split_features(target_features_));
+
         the_exec_engine_ = engine_builder.create();
 
         if (!the_exec_engine_) {
@@ -87,6 +115,8 @@ JITEngine::JITEngine(std::string modname, int optlevel, bool vectorize)
         }
 
         the_exec_engine_->DisableLazyCompilation(); // No lazy compiling
+
+        register_runtime_symbols();
     } else {
         // Simply add new module to the already existent execution-engine
         the_exec_engine_->addModule(module_);
@@ -178,6 +208,16 @@ const char * JITEngine::last_error() const {
     return last_error_.c_str();
 }
 
+llvm::Value * JITEngine::declare_global(const char name[], llvm::Type * ty){
+    using namespace llvm;
+    GlobalVariable * gv = module_->getGlobalVariable(name);
+    if (0==gv){
+        gv = new GlobalVariable(*module_, ty, false,
+                                GlobalValue::ExternalLinkage, 0, name);
+    }
+    return gv;
+}
+
 bool JITEngine::verify() const {
     return not llvm::verifyModule(*module_);
 }
@@ -186,14 +226,104 @@ void JITEngine::optimize(){
     mpm_->run(*module_);
 }
 
+void JITEngine::optimize_interprocedural(){
+    llvm::PassManager pm;
+    pm.add(llvm::createFunctionAttrsPass());
+    pm.run(*module_);
+}
+
 void JITEngine::optimize_function(FunctionAdaptor fn) const{
     fpm_->run(*fn.get_function());
 }
 
+void JITEngine::delete_function(FunctionAdaptor fn){
+    using namespace llvm;
+    Function * func = fn.get_function();
+    func->dropAllReferences();
+    if (!func->use_empty()){
+        func->replaceAllUsesWith(UndefValue::get(func->getType()));
+    }
+    func->eraseFromParent();
+}
+
+bool JITEngine::free_function(FunctionAdaptor fn){
+    llvm::Function * func = fn.get_function();
+    if ( !func->use_empty() ){
+        last_error_ = "Function is still used by other functions.";
+        return false;
+    }
+    the_exec_engine_->freeMachineCodeForFunction(func);
+    func->eraseFromParent();
+    return true;
+}
+
+unsigned JITEngine::count_uses(FunctionAdaptor fn) const{
+    return fn.get_function()->getNumUses();
+}
+
+static unsigned count_instructions(llvm::Function * fn){
+    unsigned count = 0;
+    for (llvm::Function::iterator bb = fn->begin(); bb != fn->end(); ++bb) {
+        count += bb->size();
+    }
+    return count;
+}
+
+unsigned JITEngine::inline_calls(FunctionAdaptor fn, int threshold){
+    using namespace llvm;
+
+    Function * func = fn.get_function();
+
+    // Collect the call sites first; inlining invalidates the iterators.
+    std::vector<CallInst*> calls;
+    for (Function::iterator bb = func->begin(); bb != func->end(); ++bb) {
+        for (BasicBlock::iterator it = bb->begin(); it != bb->end(); ++it) {
+            CallInst * call = dyn_cast<CallInst>(it);
+            if ( !call ) continue;
+            Function * callee = call->getCalledFunction();
+            if ( !callee || callee->isDeclaration() || callee == func )
+                continue;
+            if ( threshold >= 0
+                 && count_instructions(callee) > static_cast<unsigned>(threshold) )
+                continue;
+            calls.push_back(call);
+        }
+    }
+
+    unsigned count = 0;
+    for (std::vector<CallInst*>::iterator it = calls.begin(); it != calls.end(); ++it) {
+        InlineFunctionInfo ifi;
+        if ( InlineFunction(*it, ifi) ) ++count;
+    }
+    return count;
+}
+
+void JITEngine::run_pipeline(FunctionAdaptor fn, const PassPipeline & pipeline){
+    using namespace llvm;
+
+    if ( pipeline.inline_threshold() >= 0 )
+        inline_calls(fn, pipeline.inline_threshold());
+
+    FunctionPassManager fpm(module_);
+    fpm.add(new TargetData(*the_exec_engine_->getTargetData()));
+    pipeline.populate(fpm);
+
+    fpm.doInitialization();
+    fpm.run(*fn.get_function());
+    fpm.doFinalization();
+}
+
 void * JITEngine::get_pointer_to_function(FunctionAdaptor fn){
     return the_exec_engine_->getPointerToFunction(fn.get_function());
 }
 
+void * JITEngine::recompile_function(FunctionAdaptor fn){
+    llvm::Function * func = fn.get_function();
+    if ( !the_exec_engine_->getPointerToGlobalIfAvailable(func) )
+        return 0;
+    return the_exec_engine_->recompileAndRelinkFunction(func);
+}
+
 std::string JITEngine::dump_asm(FunctionAdaptor fn){
     using namespace llvm;
 
@@ -220,6 +350,248 @@ std::string JITEngine::dump_asm(FunctionAdaptor fn){
     return buffer;
 }
 
+bool JITEngine::emit_object(std::string path, std::string cpu,
+                            std::string features, std::string symbol_suffix){
+    using namespace llvm;
+
+    std::string error;
+    raw_fd_ostream out(path.c_str(), error, raw_fd_ostream::F_Binary);
+    if (!error.empty()){
+        last_error_ = error;
+        return false;
+    }
+
+    // The cpu and the features default to those of the JIT separately.
+    // The features of the JIT are not applied to another CPU.
+    if (features.empty() && cpu.empty()) features = target_features_;
+    if (cpu.empty()) cpu = target_cpu_;
+
+    // Rename the exported functions of a copy of the module.
+    Module * module = module_;
+    if (!symbol_suffix.empty()){
+        module = CloneModule(module_);
+        for (Module::iterator fn=module->begin(); fn!=module->end(); ++fn){
+            if (!fn->isDeclaration() && !fn->hasLocalLinkage())
+                fn->setName(fn->getName().str() + symbol_suffix);
+        }
+    }
+
+    // Same target as the JIT but position independent.
+    TargetMachine * tm = EngineBuilder(module).setRelocationModel(Reloc::PIC_)
+                                              .setMCPU(cpu)
+                                              .setMAttrs(split_features(features))
+                                              .selectTarget();
+
+    PassManager pm;
+    pm.add(new TargetData(*the_exec_engine_->getTargetData()));
+
+    bool ok = true;
+    {
+        formatted_raw_ostream fso(out);
+        if ( tm->addPassesToEmitFile(pm, fso, TargetMachine::CGFT_ObjectFile, true) ) {
+            last_error_ = "Target does not support emitting object files.";
+            ok = false;
+        } else {
+            pm.run(*module);
+        }
+    }
+    delete tm;
+    if (module != module_) delete module;
+    return ok;
+}
+
+/**
+ * Collect the internal functions that are referenced by fn, directly or
+ * through other internal functions (e.g. the outlined body of a prange loop).
+ */
+static void collect_local_functions(llvm::Function * fn,
+                                    llvm::SmallPtrSet<llvm::Function*, 8> & out){
+    using namespace llvm;
+    for (Function::iterator bb=fn->begin(); bb!=fn->end(); ++bb){
+        for (BasicBlock::iterator inst=bb->begin(); inst!=bb->end(); ++inst){
+            for (User::op_iterator op=inst->op_begin(); op!=inst->op_end(); ++op){
+                Function * callee = dyn_cast<Function>((*op)->stripPointerCasts());
+                if (callee && callee->hasLocalLinkage() && !callee->isDeclaration()
+                    && out.insert(callee)){
+                    collect_local_functions(callee, out);
+                }
+            }
+        }
+    }
+}
+
+std::string JITEngine::dump_bitcode(FunctionAdaptor fn){
+    using namespace llvm;
+
+    SmallPtrSet<Function*, 8> locals;
+    collect_local_functions(fn.get_function(), locals);
+
+    std::set<std::string> keep;
+    keep.insert(fn.name());
+    for (SmallPtrSet<Function*, 8>::iterator it=locals.begin(); it!=locals.end(); ++it){
+        keep.insert((*it)->getName());
+    }
+
+    // Work on a copy so that the bodies of the other functions can be
+    // stripped without touching the live module.
+    Module * clone = CloneModule(module_);
+    for (Module::iterator it=clone->begin(); it!=clone->end(); ++it){
+        if (!keep.count(it->getName()) && !it->isDeclaration()){
+            it->deleteBody();
+        }
+    }
+
+    std::string buffer;
+    raw_string_ostream rso(buffer);
+    WriteBitcodeToFile(clone, rso);
+    rso.flush();
+
+    delete clone;
+    return buffer;
+}
+
+bool JITEngine::load_bitcode(FunctionAdaptor fn, std::string bitcode){
+    using namespace llvm;
+
+    loaded_helpers_.clear();
+    Function * dst = fn.get_function();
+    if (!dst->isDeclaration()){
+        last_error_ = "Function is already defined.";
+        return false;
+    }
+
+    MemoryBuffer * buffer = MemoryBuffer::getMemBufferCopy(bitcode);
+    Module * loaded = ParseBitcodeFile(buffer, module_->getContext(), &last_error_);
+    delete buffer; // ParseBitcodeFile never takes ownership
+    if (0==loaded){
+        return false;
+    }
+
+    Function * src = loaded->getFunction(dst->getName());
+    if (0==src || src->isDeclaration()
+        || src->getFunctionType() != dst->getFunctionType()){
+        last_error_ = "Bitcode does not define a matching function.";
+        delete loaded;
+        return false;
+    }
+
+    // Clone the body into the existing declaration instead of linking the
+    // modules. The linker would replace the declaration with a new function
+    // and invalidate the FunctionAdaptor held by the caller.
+    // Internal functions and globals that come with the function are
+    // cloned as new definitions. Their names are only unique within the
+    // loaded module; LLVM renames them if the name is taken.
+    typedef std::vector<std::pair<Function*, Function*> > ClonePairs;
+    ClonePairs clones;
+    clones.push_back(std::make_pair(src, dst));
+
+    ValueToValueMapTy vmap;
+    for (Module::iterator it=loaded->begin(); it!=loaded->end(); ++it){
+        if (&*it == src) {
+            vmap[src] = dst;
+            continue;
+        }
+        if (it->hasLocalLinkage() && !it->isDeclaration()){
+            Function * local = Function::Create(it->getFunctionType(),
+                                                it->getLinkage(),
+                                                it->getName(),
+                                                module_);
+            vmap[&*it] = local;
+            clones.push_back(std::make_pair(&*it, local));
+        } else {
+            vmap[&*it] = module_->getOrInsertFunction(it->getName(),
+                                                      it->getFunctionType());
+        }
+    }
+
+    typedef std::vector<std::pair<GlobalVariable*, GlobalVariable*> > GlobalPairs;
+    GlobalPairs initialize;
+    for (Module::global_iterator it=loaded->global_begin();
+         it!=loaded->global_end(); ++it){
+        GlobalVariable * gv = 0;
+        if (!it->hasLocalLinkage()){
+            gv = module_->getGlobalVariable(it->getName());
+        }
+        if (0==gv){
+            gv = new GlobalVariable(*module_,
+                                    it->getType()->getElementType(),
+                                    it->isConstant(),
+                                    it->getLinkage(),
+                                    0,
+                                    it->getName());
+            gv->copyAttributesFrom(&*it);
+            if (it->hasInitializer()){
+                initialize.push_back(std::make_pair(&*it, gv));
+            }
+        }
+        vmap[&*it] = gv;
+    }
+
+    // The initializers may refer to other globals.
+    for (GlobalPairs::iterator it=initialize.begin(); it!=initialize.end(); ++it){
+        it->second->setInitializer(MapValue(it->first->getInitializer(), vmap));
+    }
+
+    for (ClonePairs::iterator it=clones.begin(); it!=clones.end(); ++it){
+        Function * from = it->first;
+        Function * to = it->second;
+        if (to!=dst) loaded_helpers_.push_back(to);
+
+        Function::arg_iterator to_arg = to->arg_begin();
+        for (Function::const_arg_iterator arg=from->arg_begin();
+             arg!=from->arg_end(); ++arg, ++to_arg){
+            vmap[&*arg] = &*to_arg;
+        }
+
+        SmallVector<ReturnInst*, 8> returns;
+        CloneFunctionInto(to, from, vmap, true, returns);
+        to->setLinkage(from->getLinkage());
+    }
+
+    delete loaded;
+    return true;
+}
+
+unsigned JITEngine::loaded_helper_count() const {
+    return loaded_helpers_.size();
+}
+
+FunctionAdaptor JITEngine::loaded_helper(unsigned i) const {
+    return FunctionAdaptor(loaded_helpers_.at(i));
+}
+
+std::string JITEngine::target_triple() const {
+    return module_->getTargetTriple();
+}
+
+std::string JITEngine::host_cpu_name(){
+    return llvm::sys::getHostCPUName();
+}
+
+bool JITEngine::set_target(std::string cpu, std::string features){
+    if (the_exec_engine_) return false;
+    target_cpu_ = cpu;
+    target_features_ = features;
+    return true;
+}
+
+std::string JITEngine::target_cpu(){
+    if (target_cpu_.empty()) return host_cpu_name();
+    return target_cpu_;
+}
+
+std::string JITEngine::target_features(){
+    return target_features_;
+}
+
+int JITEngine::llvm_version(){
+#ifdef LLVM_VERSION_MAJOR
+    return 100 * LLVM_VERSION_MAJOR + LLVM_VERSION_MINOR;
+#else
+    return 300; // the macros were added in 3.1
+#endif
+}
+
 std::string JITEngine::dump_passes(){
     using namespace llvm;
     PassRegistry &registry = *PassRegistry::getPassRegistry();
@@ -0,0 +1,117 @@
+/**
+Copyright (c) 2012, Siu Kwan Lam
+All rights reserved.
+**/
+
+#include "llvm_wrapper.hpp"
+
+#include "llvm/PassRegistry.h"
+#include "llvm/Transforms/Scalar.h"
+#include "llvm/Transforms/Vectorize.h"
+
+using namespace llvm;
+
+PassPipeline::PassPipeline(int optlevel)
+    : optlevel_(optlevel),
+      vectorize_(true),
+      unroll_threshold_(-1),
+      inline_threshold_(-1),
+      last_error_("no error")
+{ }
+
+void PassPipeline::set_vectorize(bool enable){
+    vectorize_ = enable;
+}
+
+void PassPipeline::set_unroll_threshold(int threshold){
+    unroll_threshold_ = threshold;
+}
+
+void PassPipeline::set_inline_threshold(int threshold){
+    inline_threshold_ = threshold;
+}
+
+int PassPipeline::inline_threshold() const{
+    return inline_threshold_;
+}
+
+bool PassPipeline::add_pass(const char name[]){
+    const PassInfo * info = PassRegistry::getPassRegistry()->getPassInfo(name);
+    if (0==info){
+        last_error_ = "Unknown pass: ";
+        last_error_ += name;
+        return false;
+    }
+
+    Pass * pass = info->createPass();
+    const PassKind kind = pass->getPassKind();
+    delete pass;
+    if (kind!=PT_Function && kind!=PT_Loop && kind!=PT_BasicBlock
+        && kind!=PT_Region){
+        last_error_ = "Not a function pass: ";
+        last_error_ += name;
+        return false;
+    }
+
+    passes_.push_back(name);
+    return true;
+}
+
+const char * PassPipeline::last_error() const{
+    return last_error_.c_str();
+}
+
+void PassPipeline::populate(FunctionPassManager & fpm) const{
+    if (!passes_.empty()){
+        PassRegistry & registry = *PassRegistry::getPassRegistry();
+        for (std::vector<std::string>::const_iterator it=passes_.begin();
+             it!=passes_.end(); ++it){
+            if (*it=="loop-unroll" && unroll_threshold_>=0){
+                fpm.add(createLoopUnrollPass(unroll_threshold_));
+            } else {
+                fpm.add(registry.getPassInfo(*it)->createPass());
+            }
+        }
+        return;
+    }
+
+    if (optlevel_<=0) return;
+
+    // The function passes of PassManagerBuilder::populateModulePassManager.
+    // The interprocedural passes need the whole module.
+    fpm.add(createTypeBasedAliasAnalysisPass());
+    fpm.add(createBasicAliasAnalysisPass());
+    fpm.add(createScalarReplAggregatesPass(-1, false));
+    fpm.add(createEarlyCSEPass());
+    if (optlevel_>1) fpm.add(createSimplifyLibCallsPass());
+    fpm.add(createJumpThreadingPass());
+    fpm.add(createCorrelatedValuePropagationPass());
+    fpm.add(createCFGSimplificationPass());
+    fpm.add(createInstructionCombiningPass());
+    fpm.add(createTailCallEliminationPass());
+    fpm.add(createCFGSimplificationPass());
+    fpm.add(createReassociatePass());
+    fpm.add(createLoopRotatePass());
+    fpm.add(createLICMPass());
+    fpm.add(createLoopUnswitchPass(optlevel_<3));
+    fpm.add(createInstructionCombiningPass());
+    fpm.add(createIndVarSimplifyPass());
+    fpm.add(createLoopIdiomPass());
+    fpm.add(createLoopDeletionPass());
+    fpm.add(createLoopUnrollPass(unroll_threshold_));
+    if (optlevel_>1) fpm.add(createGVNPass());
+    fpm.add(createMemCpyOptPass());
+    fpm.add(createSCCPPass());
+    fpm.add(createInstructionCombiningPass());
+    fpm.add(createJumpThreadingPass());
+    fpm.add(createCorrelatedValuePropagationPass());
+    fpm.add(createDeadStoreEliminationPass());
+    if (vectorize_){
+        fpm.add(createBBVectorizePass());
+        fpm.add(createInstructionCombiningPass());
+        if (optlevel_>1) fpm.add(createGVNPass());
+    }
+    fpm.add(createAggressiveDCEPass());
+    fpm.add(createCFGSimplificationPass());
+    fpm.add(createInstructionCombiningPass());
+}
@@ -0,0 +1,279 @@
+/**
+Copyright (c) 2012, Siu Kwan Lam
+All rights reserved.
+
+Native runtime support for the generated code.
+
+pymothoa_parallel_for runs the outlined body of a prange loop on a pool of
+worker threads. The iteration space is split into a fixed number of chunks.
+Every chunk is executed exactly once, even if it is empty, so that the body
+always writes its reduction partials. The calling thread takes part in the
+work and returns after all chunks are done.
+
+Loops started concurrently by several threads are queued. The workers take
+the chunks of the oldest loop first; each caller also works on the chunks
+of its own loop, so every loop makes progress. A parallel loop inside the
+body of another parallel loop runs serially on the thread that reaches it.
+
+The generated code never touches the interpreter inside the body. The GIL
+is released by the caller.
+
+Bounds-checked code reports an out-of-bounds index with pymothoa_bounds_error
+and returns from the function. The first violation is kept for the thread
+until the caller takes it with pymothoa_take_bounds_error and raises
+IndexError. Violations in the body of a parallel loop are handed over to the
+thread that started the loop.
+
+Compiled with PYMOTHOA_AOT defined, this file does not depend on LLVM and
+is linked into the shared libraries produced by pymothoa.aot.
+**/
+
+#ifndef PYMOTHOA_AOT
+#include "llvm_wrapper.hpp"
+#include "llvm/Support/DynamicLibrary.h"
+#endif
+#include <pthread.h>
+#include <unistd.h>
+#include <stdint.h>
+#include <cstdlib>
+
+namespace {
+
+struct BoundsError {
+    bool set;
+    int64_t index;
+    int64_t length;
+    int32_t line;
+};
+
+__thread BoundsError the_bounds_error; // of the current thread
+
+typedef void (*ParallelBody)(int64_t begin, int64_t end, int64_t chunk, void ** env);
+
+__thread bool the_parallel_body; // the current thread runs a chunk
+
+// A parallel loop. Lives on the stack of the thread that started it.
+struct Job {
+    ParallelBody body;
+    void ** env;
+    int64_t count;
+    int64_t nchunks;
+    int64_t next;           // next chunk to take
+    int64_t pending;        // chunks not done yet
+    BoundsError error;      // first violation in the loop
+    Job * queued;           // next job in the queue
+};
+
+class ThreadPool {
+public:
+    explicit ThreadPool(unsigned count)
+        : head_(0), tail_(0), workers_(0)
+    {
+        pthread_mutex_init(&mutex_, 0);
+        pthread_cond_init(&work_cv_, 0);
+        pthread_cond_init(&done_cv_, 0);
+
+        // The calling thread is one of the workers.
+        for (unsigned i=1; i<count; ++i){
+            pthread_t thread;
+            if (0==pthread_create(&thread, 0, &ThreadPool::worker_main, this)){
+                pthread_detach(thread);
+                ++workers_;
+            }
+        }
+    }
+
+    unsigned size() const {
+        return workers_ + 1;
+    }
+
+    void run(ParallelBody body, int64_t count, int64_t nchunks, void ** env){
+        if (nchunks<1) nchunks = 1;
+
+        // A parallel loop inside the body of another parallel loop runs
+        // serially on the thread that reaches it.
+        if (the_parallel_body){
+            for (int64_t i=0; i<nchunks; ++i){
+                execute(body, count, nchunks, i, env);
+            }
+            return;
+        }
+
+        Job job;
+        job.body = body;
+        job.env = env;
+        job.count = count;
+        job.nchunks = nchunks;
+        job.next = 0;
+        job.pending = nchunks;
+        job.error.set = false;
+        job.queued = 0;
+
+        pthread_mutex_lock(&mutex_);
+        if (tail_) tail_->queued = &job;
+        else head_ = &job;
+        tail_ = &job;
+        pthread_cond_broadcast(&work_cv_);
+
+        while (take_chunk(&job)) { }
+
+        while (job.pending>0){
+            pthread_cond_wait(&done_cv_, &mutex_);
+        }
+        pthread_mutex_unlock(&mutex_);
+
+        // Hand over a violation in the body to the calling thread.
+        if (job.error.set && !the_bounds_error.set){
+            the_bounds_error = job.error;
+        }
+    }
+
+private:
+    static void execute(ParallelBody body, int64_t count, int64_t nchunks,
+                        int64_t chunk, void ** env)
+    {
+        if (count<0) count = 0;
+        const int64_t begin = count * chunk / nchunks;
+        const int64_t end = count * (chunk + 1) / nchunks;
+        body(begin, end, chunk, env);
+    }
+
+    /**
+     * Remove a job from the queue once all its chunks are taken.
+     * Must be called with mutex_ held.
+     */
+    void dequeue(Job * job){
+        Job * prev = 0;
+        for (Job * it=head_; it; prev=it, it=it->queued){
+            if (it!=job) continue;
+            if (prev) prev->queued = job->queued;
+            else head_ = job->queued;
+            if (tail_==job) tail_ = prev;
+            job->queued = 0;
+            return;
+        }
+    }
+
+    /**
+     * Execute one chunk of the job.
+     * Must be called with mutex_ held. The lock is released while the
+     * chunk runs.
+     * @return False if no chunk is left.
+     */
+    bool take_chunk(Job * job){
+        if (job->next>=job->nchunks) return false;
+
+        const int64_t chunk = job->next++;
+        if (job->next==job->nchunks) dequeue(job);
+
+        pthread_mutex_unlock(&mutex_);
+        the_parallel_body = true;
+        execute(job->body, job->count, job->nchunks, chunk, job->env);
+        the_parallel_body = false;
+        pthread_mutex_lock(&mutex_);
+
+        if (the_bounds_error.set){
+            if (!job->error.set) job->error = the_bounds_error;
+            the_bounds_error.set = false;
+        }
+        if (0==--job->pending){
+            // Several callers may be waiting for their own job.
+            pthread_cond_broadcast(&done_cv_);
+        }
+        return true;
+    }
+
+    static void * worker_main(void * self){
+        static_cast<ThreadPool*>(self)->worker();
+        return 0;
+    }
+
+    void worker(){
+        pthread_mutex_lock(&mutex_);
+        for (;;){
+            if (!head_ || !take_chunk(head_)){
+                pthread_cond_wait(&work_cv_, &mutex_);
+            }
+        }
+    }
+
+private:
+    pthread_mutex_t mutex_;         // guards the queue and the jobs
+    pthread_cond_t  work_cv_;
+    pthread_cond_t  done_cv_;
+
+    Job * head_;                    // queue of the jobs with chunks left
+    Job * tail_;
+
+    unsigned workers_;
+};
+
+ThreadPool * the_thread_pool = 0;
+pthread_once_t the_thread_pool_once = PTHREAD_ONCE_INIT;
+
+void create_thread_pool(){
+    long count = 0;
+    const char * env = getenv("PYMOTHOA_NUM_THREADS");
+    if (env) count = atol(env);
+    if (count<1) count = sysconf(_SC_NPROCESSORS_ONLN);
+    if (count<1) count = 1;
+    the_thread_pool = new ThreadPool(count);
+}
+
+ThreadPool & get_thread_pool(){
+    pthread_once(&the_thread_pool_once, create_thread_pool);
+    return *the_thread_pool;
+}
+
+} // end anonymous namespace
+
+extern "C" {
+
+int64_t pymothoa_num_threads(){
+    return get_thread_pool().size();
+}
+
+void pymothoa_parallel_for(void * body, int64_t count, int64_t nchunks, void ** env){
+    get_thread_pool().run(reinterpret_cast<ParallelBody>(body), count, nchunks, env);
+}
+
+void pymothoa_bounds_error(int64_t index, int64_t length, int32_t line){
+    if (the_bounds_error.set) return; // keep the first one
+    the_bounds_error.set = true;
+    the_bounds_error.index = index;
+    the_bounds_error.length = length;
+    the_bounds_error.line = line;
+}
+
+int pymothoa_bounds_error_pending(){
+    return the_bounds_error.set;
+}
+
+int pymothoa_take_bounds_error(int64_t * index, int64_t * length, int32_t * line){
+    if (!the_bounds_error.set) return 0;
+    *index = the_bounds_error.index;
+    *length = the_bounds_error.length;
+    *line = the_bounds_error.line;
+    the_bounds_error.set = false;
+    return 1;
+}
+
+} // end extern "C"
+
+#ifndef PYMOTHOA_AOT
+void register_runtime_symbols(){
+    using llvm::sys::DynamicLibrary;
+    // The extension module is loaded with RTLD_LOCAL. Make the runtime
+    // visible to the JIT explicitly.
+    DynamicLibrary::AddSymbol("pymothoa_num_threads",
+                              reinterpret_cast<void*>(&pymothoa_num_threads));
+    DynamicLibrary::AddSymbol("pymothoa_parallel_for",
+                              reinterpret_cast<void*>(&pymothoa_parallel_for));
+    DynamicLibrary::AddSymbol("pymothoa_bounds_error",
+                              reinterpret_cast<void*>(&pymothoa_bounds_error));
+    DynamicLibrary::AddSymbol("pymothoa_bounds_error_pending",
+                              reinterpret_cast<void*>(&pymothoa_bounds_error_pending));
+    DynamicLibrary::AddSymbol("pymothoa_take_bounds_error",
+                              reinterpret_cast<void*>(&pymothoa_take_bounds_error));
+}
+#endif
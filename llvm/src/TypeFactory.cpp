@@ -35,3 +35,11 @@ Type * TypeFactory::make_vector(Type * elemty, unsigned int elemct){
     return VectorType::get(elemty, elemct);
 }
 
+Type * TypeFactory::make_array(Type * elemty, unsigned int elemct){
+    return ArrayType::get(elemty, elemct);
+}
+
+Type * TypeFactory::make_struct(std::vector<Type*> fieldtys){
+    return StructType::get(getGlobalContext(), fieldtys);
+}
+
@@ -0,0 +1,6 @@
+# Copyright (c) 2012, Siu Kwan Lam
+# All rights reserved.
+
+# Also the version of the code generator. Bump it when the generated code
+# changes so that the compilation caches are invalidated.
+__version__ = '0.1'
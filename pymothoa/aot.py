@@ -0,0 +1,355 @@
+# Copyright (c) 2012, Siu Kwan Lam
+# All rights reserved.
+#
+# Ahead-of-time compilation of JIT functions into a shared library.
+#
+#   python -m pymothoa.aot kernels.py -o kernels.so
+#
+# imports kernels.py, compiles its JIT functions and links their native code
+# into kernels.so. The signatures of the functions are stored in the library.
+#
+#   python -m pymothoa.aot kernels.py -o kernels.so --isa avx2,avx,sse2
+#
+# compiles a version of every function for each instruction set level (see
+# pymothoa.util.cpu). The loader selects the most capable version that the
+# CPU supports.
+#
+# load() binds the functions of the library with ctypes. It does not use LLVM;
+# only the loader part of this module is needed at runtime.
+#
+
+import os
+import sys
+import json
+import ctypes
+import logging
+
+from pymothoa.util.arrays import (array_adaptor, ndarray_adaptor, ndarray_struct,
+                                  checked_array_adaptor, checked_array_struct)
+from pymothoa.util.boundscheck import BoundsChecker
+from pymothoa.util import cpu
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_SYMBOL = 'pymothoa_aot_manifest'
+MANIFEST_VERSION = 1
+
+#-------------------------------------------------------------------------------
+# Loader
+
+_scalar_ctypes = {
+    'Void'   : None,
+    'Bool'   : ctypes.c_int8,   # same workaround as the JIT
+    'Int8'   : ctypes.c_int8,
+    'Int16'  : ctypes.c_int16,
+    'Int32'  : ctypes.c_int32,
+    'Int64'  : ctypes.c_int64,
+    'UInt8'  : ctypes.c_uint8,
+    'UInt16' : ctypes.c_uint16,
+    'UInt32' : ctypes.c_uint32,
+    'UInt64' : ctypes.c_uint64,
+    'Float'  : ctypes.c_float,
+    'Double' : ctypes.c_double,
+}
+
+def _parse_type(name, writable=False):
+    '''Returns (ctype, adaptor) for a type name of the manifest.
+    adaptor is None for scalars.
+    '''
+    if name.startswith('Array(') and name.endswith(')'):
+        elemctype = _scalar_ctypes[name[len('Array('):-1]]
+        return ctypes.POINTER(elemctype), array_adaptor(elemctype, writable)
+    if name.startswith('CheckedArray(') and name.endswith(')'):
+        elemctype = _scalar_ctypes[name[len('CheckedArray('):-1]]
+        adaptor = checked_array_adaptor(elemctype, writable)
+        return ctypes.POINTER(checked_array_struct(elemctype)), adaptor
+    if name.startswith('NDArray(') and name.endswith(')'):
+        elemname, ndim = name[len('NDArray('):-1].split(',')
+        elemctype = _scalar_ctypes[elemname.strip()]
+        ndim = int(ndim)
+        adaptor = ndarray_adaptor(elemctype, ndim, writable)
+        return ctypes.POINTER(ndarray_struct(elemctype, ndim)), adaptor
+    return _scalar_ctypes[name], None
+
+class AOTFunction(object):
+    '''A function of an AOT compiled library.
+    '''
+    def __init__(self, lib, entry, symbol_suffix=''):
+        self.name = entry['name']
+        self.symbol = entry['symbol'] + symbol_suffix
+        self.is_ret_bool = entry['ret'] == 'Bool'
+
+        c_retty, _ = _parse_type(entry['ret'])
+        c_argtys = []
+        self.adaptors = []
+        written = entry.get('written', [])
+        for i, arg in enumerate(entry['args']):
+            ctype, adaptor = _parse_type(arg, i in written)
+            c_argtys.append(ctype)
+            self.adaptors.append(adaptor)
+
+        # CFUNCTYPE releases the GIL during the call; PYFUNCTYPE holds it.
+        functype = ctypes.PYFUNCTYPE if entry['requires_gil'] else ctypes.CFUNCTYPE
+        self.c_funcptr = functype(c_retty, *c_argtys)((str(self.symbol), lib))
+
+        self.check_bounds = None
+        if entry.get('boundscheck'):
+            self.check_bounds = BoundsChecker.from_library(lib)
+
+    def __call__(self, *args):
+        if len(args) != len(self.adaptors):
+            raise TypeError('%s() takes exactly %d arguments (%d given)' % (
+                                self.name, len(self.adaptors), len(args)))
+        argvals = []
+        for adaptor, val in zip(self.adaptors, args):
+            if adaptor is not None:
+                val = adaptor(val)
+            argvals.append(val)
+
+        retval = self.c_funcptr(*argvals)
+        if self.check_bounds is not None:
+            self.check_bounds()
+        if self.is_ret_bool:
+            return bool(retval)
+        return retval
+
+class AOTLibrary(object):
+    '''The functions of a shared library built by pymothoa.aot.
+    They are accessible as attributes.
+    '''
+    def __init__(self, path, isa=None):
+        '''
+        isa -- Name of the instruction set level of the functions to use.
+               Defaults to the most capable one that the CPU supports.
+        '''
+        self.path = os.path.abspath(path)
+        self.lib = ctypes.CDLL(self.path)
+
+        try:
+            text = ctypes.c_char_p.in_dll(self.lib, MANIFEST_SYMBOL).value
+        except ValueError:
+            raise ImportError('%s is not built by pymothoa.aot' % path)
+        manifest = json.loads(text)
+        if manifest['version'] != MANIFEST_VERSION:
+            raise ImportError('%s is built by an incompatible version' % path)
+
+        # The CPU does not change while running. Select the version once.
+        variants = manifest.get('isa')
+        self.isa = None
+        suffix = ''
+        if variants:
+            if isa is None:
+                level = cpu.best_level(variants)
+                if level is None:
+                    raise ImportError('%s requires one of %s' % (
+                                        path, ', '.join(variants)))
+                isa = level.name
+            elif isa not in variants:
+                raise ImportError('%s is not built for %s' % (path, isa))
+            self.isa = isa
+            suffix = _isa_suffix(isa)
+
+        self.functions = {}
+        for entry in manifest['functions']:
+            self.functions[entry['name']] = AOTFunction(self.lib, entry, suffix)
+
+    def __getattr__(self, name):
+        try:
+            return self.__dict__['functions'][name]
+        except KeyError:
+            raise AttributeError(name)
+
+def load(path, namespace=None, isa=None):
+    '''Load a shared library built by pymothoa.aot.
+
+    namespace -- A dict (e.g. globals()) for binding the functions by name.
+    isa -- Instruction set level to use. See AOTLibrary.
+
+    Returns an AOTLibrary.
+    '''
+    library = AOTLibrary(path, isa=isa)
+    if namespace is not None:
+        namespace.update(library.functions)
+    return library
+
+def _isa_suffix(name):
+    '''Suffix of the symbols of the functions for an instruction set level.
+    '''
+    return '.isa_%s' % name.replace('.', '_')
+
+#-------------------------------------------------------------------------------
+# Compiler
+
+def _type_name(ty):
+    from pymothoa import types
+    from pymothoa.llvm_backend.types import public_type, LLVMCheckedArray
+    pubty = public_type(ty)
+    if isinstance(getattr(pubty, 'elemtype', None), types.Struct):
+        raise TypeError('Arrays of structs are not supported ahead-of-time.')
+    if isinstance(ty, LLVMCheckedArray):
+        return 'CheckedArray(%s)' % pubty.elemtype.__name__
+    if isinstance(pubty, types.Array):
+        return 'Array(%s)' % pubty.elemtype.__name__
+    if isinstance(pubty, types.NDArray):
+        return 'NDArray(%s, %d)' % (pubty.elemtype.__name__, pubty.ndim)
+    return pubty.__name__
+
+def collect_functions(module):
+    '''Returns the JIT functions of a Python module as (name, function) pairs.
+    The functions are compiled if necessary.
+    '''
+    from pymothoa.llvm_backend.function import (LLVMFuncDef, LLVMLazyFuncDef,
+                                                LLVMStaticFuncDef)
+    from pymothoa.llvm_backend.types import LLVMStruct
+    functions = []
+    for name, value in sorted(vars(module).items()):
+        if isinstance(value, LLVMLazyFuncDef):
+            logger.warning('Skipping %s: functions without argument types '
+                           'cannot be compiled ahead-of-time.', name)
+        elif isinstance(value, LLVMStaticFuncDef):
+            logger.warning('Skipping %s: functions with static arguments '
+                           'cannot be compiled ahead-of-time.', name)
+        elif isinstance(value, LLVMFuncDef):
+            if any(isinstance(getattr(X, 'elemtype', None), LLVMStruct)
+                   for X in value.argtys):
+                logger.warning('Skipping %s: arrays of structs are not '
+                               'supported ahead-of-time.', name)
+                continue
+            value.manager.wait()
+            if not value.compiled:
+                value.compile()
+            functions.append((name, value))
+    return functions
+
+def make_manifest(functions, isa=None):
+    '''
+    isa -- Names of the instruction set levels of the functions.
+    '''
+    entries = []
+    for name, fn in functions:
+        entries.append({
+            'name'          : name,
+            'symbol'        : fn.code_llvm.name(),
+            'ret'           : 'Bool' if fn.is_ret_bool else _type_name(fn.retty),
+            'args'          : map(_type_name, fn.argtys),
+            'requires_gil'  : fn.requires_gil,
+            'written'       : sorted(fn.written_args),
+            'boundscheck'   : fn.boundscheck,
+        })
+    manifest = {'version': MANIFEST_VERSION, 'functions': entries}
+    if isa:
+        manifest['isa'] = list(isa)
+    return manifest
+
+def _c_string(text):
+    return '"%s"' % ''.join('\\%03o' % ord(c) for c in text)
+
+def _runtime_source():
+    from pymothoa.llvm_backend import llvm
+    return os.path.join(os.path.dirname(llvm.__file__), 'src', 'Runtime.cpp')
+
+def _run(cmd):
+    import subprocess
+    logger.debug('Running %s', ' '.join(cmd))
+    subprocess.check_call(cmd)
+
+def build(functions, output, cc=None, cxx=None, isa=None):
+    '''Build a shared library from compiled JIT functions.
+
+    functions -- (name, function) pairs. The names are used by load().
+    output -- Path of the shared library.
+    cc, cxx -- C and C++ compilers. Default to $CC and $CXX.
+    isa -- Names of instruction set levels (see pymothoa.util.cpu).
+           A version of the functions is compiled for each level.
+           Defaults to a single version for the target of the JIT.
+    '''
+    import shutil, tempfile
+    cc = cc or os.environ.get('CC', 'cc')
+    cxx = cxx or os.environ.get('CXX', 'c++')
+
+    names = [name for name, _ in functions]
+    for name in set(names):
+        if names.count(name) > 1:
+            raise ValueError('Duplicated function name: %s' % name)
+
+    tmpdir = tempfile.mkdtemp(prefix='pymothoa-aot-')
+    try:
+        objects = []
+        managers = []
+        for _, fn in functions:
+            if fn.manager not in managers:
+                managers.append(fn.manager)
+        levels = map(cpu.isa_level, isa or [])
+        for i, manager in enumerate(managers):
+            if not levels:
+                path = os.path.join(tmpdir, 'module%d.o' % i)
+                manager.emit_object(path)
+                objects.append(path)
+            for level in levels:
+                path = os.path.join(tmpdir, 'module%d.%s.o' % (i, level.name))
+                manager.emit_object(path, cpu=level.cpu,
+                                    symbol_suffix=_isa_suffix(level.name))
+                objects.append(path)
+
+        manifest = os.path.join(tmpdir, 'manifest.c')
+        with open(manifest, 'w') as fout:
+            text = json.dumps(make_manifest(functions,
+                                            [X.name for X in levels]))
+            fout.write('const char * %s = %s;\n' % (MANIFEST_SYMBOL,
+                                                     _c_string(text)))
+        objects.append(manifest[:-2] + '.o')
+        _run([cc, '-c', '-fPIC', '-o', objects[-1], manifest])
+
+        # The parallel loops call into the runtime.
+        objects.append(os.path.join(tmpdir, 'runtime.o'))
+        _run([cxx, '-c', '-fPIC', '-O2', '-DPYMOTHOA_AOT',
+              '-o', objects[-1], _runtime_source()])
+
+        # Symbols of the Python C-API are resolved when the library is loaded.
+        flags = ['-shared']
+        if sys.platform == 'darwin':
+            flags += ['-undefined', 'dynamic_lookup']
+        _run([cxx] + flags + ['-o', output] + objects + ['-lpthread'])
+    finally:
+        shutil.rmtree(tmpdir)
+
+def main(argv=None):
+    import imp
+    import argparse
+    parser = argparse.ArgumentParser(prog='python -m pymothoa.aot',
+                description='Compile the JIT functions of Python modules '
+                            'into a shared library.')
+    parser.add_argument('modules', nargs='+', metavar='module.py')
+    parser.add_argument('-o', '--output', required=True,
+                        help='path of the shared library')
+    parser.add_argument('--isa', type=lambda X: X.split(','),
+                        help='comma separated instruction set levels to '
+                             'compile for (%s)' % ', '.join(
+                                    X.name for X in cpu.ISA_LEVELS))
+    parser.add_argument('-v', '--verbose', action='store_true')
+    options = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.DEBUG if options.verbose else logging.WARNING)
+
+    functions = []
+    for path in options.modules:
+        name = os.path.splitext(os.path.basename(path))[0]
+        sys.path.insert(0, os.path.dirname(os.path.abspath(path)))
+        module = imp.load_source(name, path)
+        functions += collect_functions(module)
+
+    if not functions:
+        parser.error('No JIT function is found.')
+
+    if options.isa:
+        try:
+            map(cpu.isa_level, options.isa)
+        except ValueError as e:
+            parser.error(str(e))
+
+    build(functions, options.output, isa=options.isa)
+    for name, fn in functions:
+        print '%s -> %s' % (name, fn.code_llvm.name())
+
+if __name__ == '__main__':
+    main()
@@ -5,6 +5,8 @@
 
 import logging
 import ast
+import copy
+import __builtin__
 
 import types, dialect
 
@@ -13,6 +15,55 @@ from compiler_errors import *
 
 logger = logging.getLogger(__name__)
 
+# Python builtins that are compiled as reductions of arrays and vectors
+# unless the name is defined by the module of the function.
+BUILTIN_REDUCTIONS = {
+    'sum'   : __builtin__.sum,
+    'min'   : __builtin__.min,
+    'max'   : __builtin__.max,
+}
+
+# Python builtins that are compiled as operations of scalars and vectors,
+# also unless the name is defined by the module of the function.
+# min and max of several arguments are also operations.
+BUILTIN_OPERATIONS = {
+    'abs'   : __builtin__.abs,
+    'min'   : __builtin__.min,
+    'max'   : __builtin__.max,
+}
+
+def is_parallel_loop(node, symbols):
+    '''Returns True if node is a for-loop over prange.
+    '''
+    iternode = node.iter
+    return (isinstance(iternode, ast.Call)
+            and isinstance(iternode.func, ast.Name)
+            and symbols.get(iternode.func.id) is dialect.prange)
+
+def written_names(node):
+    '''Returns the names of the arrays that the code of node may write to.
+    Conservative: arrays passed to calls or assigned to other variables are
+    assumed to be written.
+    '''
+    def array_name(X):
+        if isinstance(X, ast.Subscript): # slice
+            X = X.value
+        if isinstance(X, ast.Name):
+            return X.id
+
+    names = set()
+    for X in ast.walk(node):
+        if isinstance(X, ast.Subscript) and isinstance(X.ctx, ast.Store):
+            names.add(array_name(X.value))
+        elif isinstance(X, ast.Attribute) and isinstance(X.ctx, ast.Store):
+            names.add(array_name(X.value)) # field of a struct
+        elif isinstance(X, ast.Call):
+            names.update(map(array_name, X.args))
+        elif isinstance(X, ast.Assign):
+            names.add(array_name(X.value))
+    names.discard(None)
+    return names
+
 class CodeGenerationBase(ast.NodeVisitor):
 
     symbols = Descriptor(constant=True, constrains=instanceof(dict))
@@ -104,6 +155,18 @@ This error should have been caught by the Python parser.''')
         pass
 
     def visit_Call(self, node):
+        if isinstance(node.func, ast.Name) and node.func.id not in self.symbols:
+            name = node.func.id
+            if name in BUILTIN_OPERATIONS and (name == 'abs'
+                                               or len(node.args) > 1):
+                # Python builtins that are compiled as operations
+                return self.construct_operation(BUILTIN_OPERATIONS[name],
+                                                node)
+            if name in BUILTIN_REDUCTIONS:
+                # Python builtins that are compiled as reductions
+                return self.construct_reduction(BUILTIN_REDUCTIONS[name],
+                                                node)
+
         fn = self.visit(node.func)
 
         if type(fn) is type and issubclass(fn, dialect.Construct):
@@ -111,6 +174,12 @@ This error should have been caught by the Python parser.''')
             try:
                 handler = {
                     dialect.var: self.construct_var,
+                    dialect.dot: self.construct_reduction,
+                    dialect.argmax: self.construct_reduction,
+                    dialect.vload: self.construct_vload,
+                    dialect.vstore: self.construct_vstore,
+                    dialect.shuffle: self.construct_shuffle,
+                    dialect.select: self.construct_select,
                 }[fn]
             except KeyError:
                 raise NotImplementedError(
@@ -153,6 +222,127 @@ This error should have been caught by the Python parser.''')
             self.symbols[name] = variable
         return # return None
 
+    def construct_reduction(self, fn, node):
+        '''sum, min, max, dot or argmax of arrays or vectors.
+        '''
+        kind = fn.__name__
+        if node.keywords or node.starargs or node.kwargs:
+            raise InvalidCall(node, 'Cannot use keyword or star arguments.')
+        arity = 2 if fn is dialect.dot else 1
+        if len(node.args) != arity:
+            raise InvalidCall(node, '%s() takes %d sequence argument%s.'
+                                    % (kind, arity, 's' if arity > 1 else ''))
+        operands = map(self.reduction_operand, node.args)
+        return self.generate_reduction(kind, operands)
+
+    def reduction_operand(self, node):
+        '''Returns (sequence, lower, upper) of an argument of a reduction:
+        a slice A[lower:upper] of an array or a vector. The bounds are None
+        if they are omitted.
+        '''
+        if isinstance(node, ast.Subscript) and isinstance(node.slice, ast.Slice):
+            if node.slice.step is not None:
+                raise InvalidCall(node, 'Cannot reduce a slice with a step.')
+            bounds = [None if X is None else self.visit(X)
+                      for X in (node.slice.lower, node.slice.upper)]
+            return (self.visit(node.value),) + tuple(bounds)
+        return self.visit(node), None, None
+
+    def generate_reduction(self, kind, operands):
+        raise NotImplementedError
+
+    def construct_operation(self, fn, node):
+        '''abs(x), min(a, b, ...) or max(a, b, ...) of scalars or vectors.
+        '''
+        kind = fn.__name__
+        if node.keywords or node.starargs or node.kwargs:
+            raise InvalidCall(node, 'Cannot use keyword or star arguments.')
+        if fn is __builtin__.abs and len(node.args) != 1:
+            raise InvalidCall(node, 'abs() takes exactly 1 argument.')
+        values = map(self.visit, node.args)
+        if fn is __builtin__.abs:
+            return self.generate_abs(values[0])
+        return self.generate_minmax(kind, values)
+
+    def generate_minmax(self, kind, values):
+        raise NotImplementedError
+
+    def generate_abs(self, value):
+        raise NotImplementedError
+
+    def construct_vload(self, fn, node):
+        '''vload(A, i, n, aligned=False)
+        '''
+        aligned = self.construct_options(node, aligned=False)['aligned']
+        if len(node.args) != 3:
+            raise InvalidCall(node, 'vload() takes 3 arguments: '
+                                    'vload(array, index, count).')
+        array, index = map(self.visit, node.args[:2])
+        count = self.constant_number(node.args[2])
+        return self.generate_vector_load(array, index, count, aligned)
+
+    def construct_vstore(self, fn, node):
+        '''vstore(A, i, V, aligned=False)
+        '''
+        aligned = self.construct_options(node, aligned=False)['aligned']
+        if len(node.args) != 3:
+            raise InvalidCall(node, 'vstore() takes 3 arguments: '
+                                    'vstore(array, index, vector).')
+        array, index, vector = map(self.visit, node.args)
+        self.generate_vector_store(array, index, vector, aligned)
+
+    def construct_shuffle(self, fn, node):
+        '''shuffle(V, mask) or shuffle(V, W, mask)
+        '''
+        self.construct_options(node)
+        if len(node.args) not in (2, 3):
+            raise InvalidCall(node, 'shuffle() takes 2 or 3 arguments: '
+                                    'shuffle(vector, [vector,] mask).')
+        mask = node.args[-1]
+        if not isinstance(mask, (ast.Tuple, ast.List)):
+            raise InvalidCall(node, 'The mask of shuffle() must be a tuple '
+                                    'of constant indices.')
+        mask = map(self.constant_number, mask.elts)
+        vectors = map(self.visit, node.args[:-1])
+        second = vectors[1] if len(vectors) > 1 else None
+        return self.generate_shuffle(vectors[0], second, mask)
+
+    def construct_select(self, fn, node):
+        '''select(cond, a, b)
+        '''
+        self.construct_options(node)
+        if len(node.args) != 3:
+            raise InvalidCall(node, 'select() takes 3 arguments: '
+                                    'select(condition, on_true, on_false).')
+        cond, on_true, on_false = map(self.visit, node.args)
+        return self.generate_select(cond, on_true, on_false)
+
+    def construct_options(self, node, **defaults):
+        '''Returns the constant keyword arguments of a construct. defaults
+        is a dict of the accepted keywords -> default value.
+        '''
+        if node.starargs or node.kwargs:
+            raise InvalidCall(node, 'Cannot use star arguments.')
+        options = dict(defaults)
+        for kw in node.keywords:
+            if kw.arg not in defaults:
+                raise InvalidCall(node, 'Unexpected keyword argument "%s".'
+                                        % kw.arg)
+            options[kw.arg] = self.constant_number(kw.value)
+        return options
+
+    def generate_vector_load(self, array, index, count, aligned):
+        raise NotImplementedError
+
+    def generate_vector_store(self, array, index, vector, aligned):
+        raise NotImplementedError
+
+    def generate_shuffle(self, first, second, mask):
+        raise NotImplementedError
+
+    def generate_select(self, cond, on_true, on_false):
+        raise NotImplementedError
+
     def extract_type(self, node):
         if isinstance(node, ast.Name): # simple symbols
             if not isinstance(node.ctx, ast.Load):
@@ -276,11 +466,21 @@ This error should have been caught by the Python parser.''')
         self.generic_visit(node)
 
     def visit_Attribute(self, node):
+        value = self.visit(node.value)
         if isinstance(node.ctx, ast.Load):
-            value = self.visit(node.value)
-            return getattr(value, node.attr)
+            return self.generate_attribute(value, node.attr)
+        elif isinstance(node.ctx, ast.Store):
+            return self.generate_attribute_store(value, node.attr)
         else:
-            raise NotImplementedError('Storing into attribute is not supported.')
+            raise NotImplementedError('Deleting attribute is not supported.')
+
+    def generate_attribute(self, value, attr):
+        '''Attribute of a Python object (e.g. a module) by default.
+        '''
+        return getattr(value, attr)
+
+    def generate_attribute_store(self, value, attr):
+        raise NotImplementedError('Storing into attribute is not supported.')
 
     def visit_Compare(self, node):
         if len(node.ops)!=1:
@@ -344,7 +544,7 @@ This error should have been caught by the Python parser.''')
         return retval
 
     def visit_Num(self, node):
-        if type(node.n) is int:
+        if type(node.n) in (int, long):
             return self.generate_constant_int(node.n)
         elif type(node.n) is float:
             return self.generate_constant_real(node.n)
@@ -373,6 +573,27 @@ This error should have been caught by the Python parser.''')
             if not isinstance(node.slice, ast.Index):
                 raise AssertionError(ast.dump(node.slice))
             ptr = self.visit(node.value)
+            if isinstance(ptr, tuple): # e.g. A.shape
+                if not isinstance(node.ctx, ast.Load):
+                    raise InvalidSubscriptError(node, 'Cannot store into a tuple.')
+                try:
+                    return ptr[self.constant_number(node.slice.value)]
+                except (IndexError, TypeError, NotImplementedError):
+                    raise InvalidSubscriptError(
+                            node,
+                            'Tuple index must be a constant within range.'
+                          )
+            elif isinstance(ptr.type, types.GenericNDArray):
+                # Access element of N-dimensional array: A[i, j, ...]
+                if isinstance(node.slice.value, ast.Tuple):
+                    indices = map(self.visit, node.slice.value.elts)
+                else:
+                    indices = [self.visit(node.slice.value)]
+                if isinstance(node.ctx, ast.Load): # load
+                    return self.generate_ndarray_load_elem(ptr, indices)
+                elif isinstance(node.ctx, ast.Store): # store
+                    return self.generate_ndarray_store_elem(ptr, indices)
+
             idx = self.visit(node.slice.value)
             if isinstance(ptr.type, types.GenericVector):
                 # Access vector element
@@ -404,6 +625,12 @@ This error should have been caught by the Python parser.''')
     def generate_array_store_elem(self, ptr, idx):
         raise NotImplementedError
 
+    def generate_ndarray_load_elem(self, ptr, indices):
+        raise NotImplementedError
+
+    def generate_ndarray_store_elem(self, ptr, indices):
+        raise NotImplementedError
+
     def visit_Name(self, node):
         if isinstance(node.ctx, ast.Load): # load
             try: # lookup in the symbol table
@@ -443,7 +670,8 @@ This error should have been caught by the Python parser.''')
             raise InvalidUseOfConstruct(str_only_support_forrange)
 
         looptype = iternode.func.id
-        if looptype not in ['range', 'xrange']:
+        is_parallel = is_parallel_loop(node, self.symbols)
+        if looptype not in ['range', 'xrange'] and not is_parallel:
             raise InvalidUseOfConstruct(str_only_support_forrange)
 
         # counter variable
@@ -451,9 +679,6 @@ This error should have been caught by the Python parser.''')
         if counter_name in self.symbols:
             raise VariableRedeclarationError(node.target)
 
-        counter_ptr = self.generate_declare(node.target.id, types.Int)
-        self.symbols[counter_name] = counter_ptr
-
         # range information
         iternode_arg_N = len(iternode.args)
         if iternode_arg_N==1: # only END is given
@@ -473,11 +698,21 @@ This error should have been caught by the Python parser.''')
         endcount = self.visit(iternode.args[endcountpos]) # end count
 
         loopbody = node.body
-        self.generate_for_range(counter_ptr, initcount, endcount, step, loopbody)
+        if is_parallel:
+            # the counter is declared in the outlined loop body
+            self.generate_parallel_for_range(counter_name, initcount, endcount,
+                                             step, loopbody)
+        else:
+            counter_ptr = self.generate_declare(counter_name, types.Int)
+            self.symbols[counter_name] = counter_ptr
+            self.generate_for_range(counter_ptr, initcount, endcount, step, loopbody)
 
     def generate_for_range(self, counter, init, end, step, body):
         raise NotImplementedError
 
+    def generate_parallel_for_range(self, counter_name, init, end, step, body):
+        raise NotImplementedError
+
     def visit_BoolOp(self, node):
         if len(node.values)!=2: raise AssertionError
         return self.generate_boolop(node.op, node.values[0], node.values[1])
@@ -496,8 +731,10 @@ This error should have been caught by the Python parser.''')
 
     def visit_AugAssign(self, node):
         target = self.visit(node.target)
-        node.target.ctx = ast.Load() # change context to load
-        target_val = self.visit(node.target)
+        # load with a copy; the body of a loop may be generated more than once
+        loaded = copy.copy(node.target)
+        loaded.ctx = ast.Load()
+        target_val = self.visit(loaded)
         value = self.visit(node.value)
 
         result = self.generate_binop(type(node.op), target_val, value)
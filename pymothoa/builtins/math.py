@@ -7,6 +7,10 @@
 #       a C-pointer. I have not figure not how to pointer for non-array types
 #       yet.
 #
+# The functions that LLVM has an intrinsic for are compiled as the intrinsic
+# (see pymothoa.llvm_backend.intrinsics). All of them also take vectors of
+# Float or Double and apply to each lane.
+#
 
 from pymothoa.types import *
 
@@ -46,14 +50,23 @@ sqrt  = 'sqrt', Double, [Double]
 powf = 'powf', Float, [Float, Float]
 pow  = 'pow', Double, [Double, Double]
 
+fmaf = 'fmaf', Float, [Float, Float, Float]
+fma  = 'fma', Double, [Double, Double, Double]
+
 
 # exponential
 expf = 'expf', Float, [Float]
 exp  = 'exp', Double, [Double]
 
+exp2f = 'exp2f', Float, [Float]
+exp2  = 'exp2', Double, [Double]
+
 logf = 'logf', Float, [Float]
 log  = 'log', Double, [Double]
 
+log2f = 'log2f', Float, [Float]
+log2  = 'log2', Double, [Double]
+
 log10f = 'log10f', Float, [Float]
 log10  = 'log10', Double, [Double]
 
@@ -58,6 +58,9 @@ class InvalidSubscriptError(CompilerError):
 class InternalError(CompilerError):
     message = 'Internal Error.'
 
+class GILRequiredError(CompilerError):
+    message = 'Operation requires the Python interpreter (GIL) in a nogil function.'
+
 def wrap_by_function(e, func):
     '''Add source information to the exception.
     '''
@@ -12,3 +12,81 @@ class Construct(object):
 
 class var(Construct):
     pass
+
+class prange(Construct):
+    '''Parallel range for for-loops.
+
+    The iterations are distributed to a pool of native threads. Iterations
+    must be independent except for reductions of the form "x += expr",
+    "x -= expr" or "x *= expr" into scalar variables declared outside of
+    the loop. Other scalar variables assigned in the loop are private to
+    each thread.
+
+    The step may be negative like the step of xrange. Unlike xrange, a zero
+    step runs no iteration.
+
+    In Python code, it is the same as xrange, except for a zero step.
+    '''
+    def __new__(cls, *args):
+        if len(args) == 3 and args[2] == 0:
+            return xrange(0)
+        return xrange(*args)
+
+class dot(Construct):
+    '''Sum of the products of the elements of two sequences:
+    dot(A[:n], B[:n]) of two arrays or dot(U, V) of two vectors.
+
+    The builtins sum, min and max of a sequence are compiled the same way.
+    See LLVMCodeGenerator.generate_reduction.
+    '''
+    def __new__(cls, a, b):
+        return sum(x * y for x, y in zip(a, b))
+
+class argmax(Construct):
+    '''Index of the first largest element of a sequence: argmax(A[:n]) of an
+    array or argmax(V) of a vector. -1 for an empty sequence.
+    '''
+    def __new__(cls, seq):
+        best, index = None, -1
+        for i, x in enumerate(seq):
+            if index < 0 or x > best:
+                best, index = x, i
+        return index
+
+class vload(Construct):
+    '''Vector of the count elements of an array from A[i]: vload(A, i, count).
+    count is a constant. The load is a single instruction. With aligned=True,
+    the address must be a multiple of the size of the vector.
+    '''
+    def __new__(cls, array, index, count, aligned=False):
+        return list(array[index:index + count])
+
+class vstore(Construct):
+    '''Store the elements of a vector V to A[i:i + len(V)]: vstore(A, i, V).
+    With aligned=True, the address must be a multiple of the size of the
+    vector.
+    '''
+    def __new__(cls, array, index, vector, aligned=False):
+        array[index:index + len(vector)] = vector
+
+class shuffle(Construct):
+    '''Vector of the lanes of vectors selected by a tuple of constant
+    indices: shuffle(V, (3, 2, 1, 0)) reverses V; shuffle(V, W, (0, 4, 1, 5))
+    interleaves the low halves of V and W. Index len(V) + k is lane k of W.
+    The result has one lane per index.
+    '''
+    def __new__(cls, *args):
+        lanes = [x for vector in args[:-1] for x in vector]
+        return [lanes[k] for k in args[-1]]
+
+class select(Construct):
+    '''on_true if cond else on_false, without a branch:
+    select(cond, on_true, on_false). A comparison of vectors selects by
+    lane, e.g. select(V < W, V, W) is the minimum of each lane.
+    '''
+    def __new__(cls, cond, on_true, on_false):
+        if not hasattr(cond, '__iter__'):
+            return on_true if cond else on_false
+        lanes = lambda X: X if hasattr(X, '__iter__') else [X] * len(cond)
+        return [t if c else f
+                for c, t, f in zip(cond, lanes(on_true), lanes(on_false))]
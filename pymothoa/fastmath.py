@@ -0,0 +1,42 @@
+# Copyright (c) 2012, Siu Kwan Lam
+# All rights reserved.
+#
+# Fast-math flags of functions. Does not depend on LLVM.
+#
+#   @module.function(ret=Float, args=[Array(Float), Int], fastmath=True)
+#   @module.function(ret=Float, args=[Array(Float), Int],
+#                    fastmath=['reassoc', 'nsz'])
+#
+# The flags relax IEEE semantics of the floating-point operations of the
+# function. Results may differ in rounding from the strict code.
+#
+# LLVM before 5.0 has no separate flag for reassociation: reassoc implies
+# all the other flags on the instructions. contract fuses a product and an
+# addition into llvm.fmuladd; it has no effect before LLVM 3.2.
+#
+
+NNAN = 'nnan'           # assume no NaN operands or results
+NINF = 'ninf'           # assume no infinite operands or results
+NSZ = 'nsz'             # ignore the sign of zero
+ARCP = 'arcp'           # use the reciprocal of a constant divisor
+CONTRACT = 'contract'   # allow fusing multiply and add
+REASSOC = 'reassoc'     # reassociate reductions over loops
+
+FLAGS = (NNAN, NINF, NSZ, ARCP, CONTRACT, REASSOC)
+
+def fastmath_flags(value):
+    '''Returns the frozenset of flags for the fastmath option.
+    True enables all flags. False and None enable none.
+    '''
+    if value is None or value is False:
+        return frozenset()
+    if value is True:
+        return frozenset(FLAGS)
+    if isinstance(value, basestring):
+        value = [value]
+    flags = frozenset(value)
+    unknown = flags.difference(FLAGS)
+    if unknown:
+        raise ValueError('Unknown fast-math flags: %s'
+                         % ', '.join(sorted(unknown)))
+    return flags
@@ -10,12 +10,110 @@ class JITModule(object):
         from llvm_backend.module import LLVMModule
         self.module = LLVMModule(name, **modargs)
 
-    def function(self, func=None, ret=types.Void, args=[], later=False):
+    def function(self, func=None, ret=None, args=None, later=False,
+                 nogil=False, background=False, fallback=False,
+                 tiered=False, hot_calls=None, hot_seconds=None,
+                 pipeline=None, fastmath=None, static=None,
+                 max_specializations=None):
+        '''
+        ret -- Return type. Defaults to Void.
+        args -- List of argument types. If it is omitted for a function that
+                takes arguments, the function is compiled lazily for the
+                argument types of each call. The return type is inferred
+                unless ret is given.
+        nogil -- Release the GIL while the native code runs. The function
+                 must not use anything that requires the interpreter.
+        background -- Compile on a background thread. The future is the
+                      "future" attribute of the returned function.
+        fallback -- With background=True, calls made before the compilation
+                    completes run the Python code instead of waiting.
+        tiered -- Run the Python code until the function is hot, then compile
+                  it (on a background thread with background=True).
+                  The thresholds are hot_calls calls or hot_seconds seconds
+                  spent in the Python code. See LLVMFuncDef.enable_tiering.
+        pipeline -- Optimization passes of this function: a PassPipeline,
+                    an optimization level or a list of pass names.
+                    See pymothoa.pipeline.
+        fastmath -- Relax the IEEE semantics of the floating-point
+                    operations: True or a list of flags (nnan, ninf, nsz,
+                    arcp, contract, reassoc). With reassoc, floating-point
+                    reductions in loops are split into vectors of partial
+                    results; it implies the other flags. See
+                    pymothoa.fastmath.
+        static -- Names of arguments that are compile-time constants.
+                  A specialization is compiled for each distinct value and
+                  the value is folded into its code. At most
+                  max_specializations are kept; the least recently used
+                  one is freed. See LLVMStaticFuncDef.
+        '''
         def wrapper(func):
             assert type(func).__name__=='function', (
                     '"%s" is not a function.'%func.__name__
             )
-            llvmfn = self.module.new_function(func, ret, args)
+            if static:
+                if args is None:
+                    raise TypeError('Functions with static arguments must '
+                                    'declare the argument types.')
+                return self.module.new_static_function(
+                                func, types.Void if ret is None else ret,
+                                args, static, nogil=nogil, pipeline=pipeline,
+                                fastmath=fastmath,
+                                max_specializations=max_specializations)
+
+            if args is None and func.func_code.co_argcount:
+                return self.module.new_lazy_function(func, ret, nogil=nogil,
+                                                     pipeline=pipeline,
+                                                     fastmath=fastmath)
+
+            llvmfn = self.module.new_function(func,
+                                              types.Void if ret is None else ret,
+                                              args or [],
+                                              nogil=nogil,
+                                              pipeline=pipeline,
+                                              fastmath=fastmath)
+
+            if tiered:
+                llvmfn.enable_tiering(hot_calls, hot_seconds,
+                                      background=background)
+            elif background:
+                llvmfn.compile_async(fallback=fallback)
+            elif not later: # compile later flag
+                llvmfn.compile()
+
+            return llvmfn
+
+        if func is None:
+            return wrapper
+        else:
+            return wrapper(func)
+
+    def wait(self):
+        '''Wait for the background compilations of this module.
+        '''
+        self.module.wait()
+
+    def add_tier_listener(self, listener):
+        '''Call listener(function, old_tier, new_tier) on tier transitions of
+        the tiered functions of this module.
+        '''
+        self.module.add_tier_listener(listener)
+
+    def remove_tier_listener(self, listener):
+        self.module.remove_tier_listener(listener)
+
+    def vectorize(self, func=None, ret=types.Void, args=[], later=False,
+                  pipeline=None, fastmath=None):
+        '''Compile a scalar function and a version that maps it over arrays.
+        Returns the array version. The scalar version is its "kernel" attribute.
+        With later=True, the kernel must be compiled before the array version.
+        The pipeline and the fast-math flags are used for both versions.
+        '''
+        def wrapper(func):
+            kernel = self.function(func, ret=ret, args=args, later=later,
+                                   pipeline=pipeline, fastmath=fastmath)
+            llvmfn = self.module.new_vectorized(kernel, ret, args,
+                                                pipeline=pipeline,
+                                                fastmath=fastmath)
 
             if not later: # compile later flag
                 llvmfn.compile()
@@ -27,20 +125,86 @@ class JITModule(object):
         else:
             return wrapper(func)
 
-    def declaration(self, ret=types.Void, args=[]):
+    def declaration(self, ret=types.Void, args=[], requires_gil=False):
         def wrapper(func):
             namespace = func.func_globals['__name__']
             realname = '.'.join([namespace, func.__name__])
-            return self.module.new_declaration(realname, ret, args)
+            return self.module.new_declaration(realname, ret, args,
+                                               requires_gil=requires_gil)
         return wrapper
 
-    def declare_builtin(self, name, ret=types.Void, args=[]):
-        return self.module.new_declaration(name, ret, args)
+    def declare_builtin(self, name, ret=types.Void, args=[], requires_gil=None):
+        '''
+        requires_gil -- True if the function uses the Python interpreter.
+                        Defaults to True for the Python C-API (Py* names).
+        '''
+        return self.module.new_declaration(name, ret, args,
+                                           requires_gil=requires_gil)
 
     def optimize(self):
+        '''Run the module passes (including the interprocedural ones) over
+        all functions. This also applies to the functions that were
+        optimized with their own pipeline. Functions that were already
+        called are recompiled.
+        '''
         self.module.optimize()
         self.module.verify()
 
+    def finalize(self):
+        '''Inline the calls between the functions compiled since the last
+        finalization. This happens automatically before the first native
+        call of a function unless the module is created with
+        modargs={'finalize': False}. See LLVMModule.finalize.
+        '''
+        self.module.finalize(force=True)
+
+    @property
+    def profiler(self):
+        '''The Profiler of the module, or None unless it is created with
+        modargs={'profile': True}.
+        '''
+        return self.module.profiler
+
+    def _require_profiler(self):
+        if self.module.profiler is None:
+            raise RuntimeError("Module is not profiled. Create it with "
+                               "modargs={'profile': True}.")
+        return self.module.profiler
+
+    def stats(self):
+        '''Returns a dict of function name -> FunctionStats: the number of
+        calls and the native and the marshalling time of each function
+        that was called. See pymothoa.util.profiling.
+        '''
+        return self._require_profiler().stats()
+
+    def reset_stats(self):
+        self._require_profiler().reset()
+
+    def print_stats(self, sort='native_time'):
+        self._require_profiler().print_stats(sort)
+
+    def dump_stats(self, path):
+        '''Write the statistics to a file that pstats.Stats can read.
+        '''
+        self._require_profiler().dump(path)
+
+    def branch_counts(self):
+        '''Returns a dict of function name -> list of BranchCount of the
+        instrumented functions. The module must be created with
+        modargs={'instrument': True}.
+        See pymothoa.llvm_backend.instrument.
+        '''
+        return dict((fn.code_llvm.name(), fn.counters.counts())
+                    for fn in self.module.functions
+                    if fn.counters is not None)
+
+    def recompile_with_profile(self):
+        '''Generate the instrumented functions again with the branch weights
+        measured by their counters. The new code is not instrumented.
+        '''
+        self.module.recompile_with_profile()
+
     def __str__(self):
         return self.module.dump()
 
@@ -49,6 +213,7 @@ class JITModule(object):
 default_module = JITModule('default')
 
 function = default_module.function
+vectorize = default_module.vectorize
 declare_builtin = default_module.declare_builtin
 declaration = default_module.declaration
 
@@ -3,31 +3,78 @@
 
 import logging
 import ast
+import ctypes
 from contextlib import contextmanager
 
 from pymothoa.util.descriptor import Descriptor, instanceof
 from pymothoa import dialect
 from pymothoa.compiler_errors import *
 from pymothoa.backend import CodeGenerationBase
+from pymothoa import fastmath
 
 from types import *
 from values import *
+import instrument
+import intrinsics
 
 import llvm # binding
 
 logger = logging.getLogger(__name__)
 
+LLVM_VERSION = llvm.JITEngine.llvm_version()
+
+# Fast-math flags (see pymothoa.fastmath) of the instructions
+FASTMATH_BITS = {
+    fastmath.NNAN       : llvm.FASTMATH_NNAN,
+    fastmath.NINF       : llvm.FASTMATH_NINF,
+    fastmath.NSZ        : llvm.FASTMATH_NSZ,
+    fastmath.ARCP       : llvm.FASTMATH_ARCP,
+    fastmath.CONTRACT   : llvm.FASTMATH_CONTRACT,
+    fastmath.REASSOC    : llvm.FASTMATH_REASSOC,
+}
+
 class LLVMCodeGenerator(CodeGenerationBase):
     retty         = Descriptor(constant=True)
     argtys        = Descriptor(constant=True)
     function      = Descriptor(constant=True)
     entry_block   = Descriptor(constant=True)
-
-    def __init__(self, fnobj, retty, argtys, symbols):
+    jit_engine    = Descriptor(constant=True)
+
+    def __init__(self, fnobj, retty, argtys, symbols, jit_engine=None,
+                 nogil=False, boundscheck=False, first_line=1,
+                 fastmath=frozenset(), constants=None, counters=None,
+                 branch_weights=None):
+        '''
+        nogil -- The generated code runs without holding the GIL.
+                 Reject anything that requires the Python interpreter.
+        boundscheck -- Check the indices of array accesses. An out-of-bounds
+                       index is reported to the runtime and the function
+                       returns immediately.
+        first_line -- Line number of the source in its file. For reporting.
+        fastmath -- Set of fast-math flags. See pymothoa.fastmath.
+        constants -- Values of the static arguments by name. They are
+                     constants in the code and not in the signature.
+        counters -- BranchCounters. Count the branches of the if-statements
+                    and the loops. See pymothoa.llvm_backend.instrument.
+        branch_weights -- Branch weights of the if-statements and the loops
+                          by probe key, from the counters of a previous run.
+        '''
         super(LLVMCodeGenerator, self).__init__(symbols)
         self.function = fnobj
         self.retty = retty
         self.argtys = argtys
+        self.jit_engine = jit_engine
+        self.nogil = nogil
+        self.boundscheck = boundscheck
+        self.first_line = first_line
+        self.fastmath = fastmath
+        self.constants = constants or {}
+        self.counters = counters
+        self.branch_weights = branch_weights or {}
+        self.counter_base = None # pointer to the counter buffer
+        self.outlined = [] # helper functions generated for this function
+        self.ndarray_fields = {} # array variable -> loaded descriptor
+        self.hoisted = set() # (array, dimension, counter) checked before the loop
 
     @contextmanager
     def generate_function(self, name):
@@ -45,6 +92,7 @@ class LLVMCodeGenerator(CodeGenerationBase):
 
         # make instruction builder
         self.builder = llvm.Builder()
+        self.builder.set_fast_math(sum(FASTMATH_BITS[X] for X in self.fastmath))
         bb_body = self.function.append_basic_block("body")
         self.builder.insert_at(bb_body)
 
@@ -65,6 +113,9 @@ class LLVMCodeGenerator(CodeGenerationBase):
                 raise MissingReturnError(self.current_node)
 
     def generate_function_arguments(self, arguments):
+        # Static arguments are folded like numeric globals. See visit_Name.
+        self.symbols.update(self.constants)
+        arguments = [X for X in arguments if X not in self.constants]
         with self.relocate_to_entry():
             fn_args = self.function.arguments()
             for i, name in enumerate(arguments):
@@ -78,8 +129,43 @@ class LLVMCodeGenerator(CodeGenerationBase):
                 self.symbols[name] = var
 
     def generate_call(self, fn, args):
-        from function import LLVMFunction
+        from function import (LLVMFunction, LLVMFuncDecl, LLVMLazyFuncDef,
+                              LLVMStaticFuncDef)
+        if isinstance(fn, LLVMFuncDecl):
+            libm = intrinsics.math_function(fn.code_llvm.name())
+            if libm is not None and isinstance(fn.retty, LLVMBasicFloatMixin):
+                return self.generate_math(libm, fn, args)
+
+        if isinstance(fn, LLVMStaticFuncDef): # specialize for the constants
+            if len(args) != len(fn.argtys):
+                raise InvalidCall(self.current_node, 'Number of argument mismatch')
+            static = [args[i] for i in fn.static_indices]
+            if not all(isinstance(X, LLVMConstant) for X in static):
+                raise InvalidCall(
+                        self.current_node,
+                        'Static arguments of "%s" must be constants.'
+                        % fn.code_python.__name__
+                      )
+            args = [X for i, X in enumerate(args)
+                    if i not in fn.static_indices]
+            fn = fn.specialize(fn.key([X.number for X in static]))
+
+        if isinstance(fn, LLVMLazyFuncDef): # specialize for the arguments
+            argtys = [public_type(X.type) for X in args]
+            if fn.is_inferring(argtys):
+                raise FunctionDeclarationError(
+                        self.current_node,
+                        ('Cannot infer the return type of a recursive call. '
+                         'Specify "ret" in the decorator.')
+                      )
+            fn = fn.specialize(argtys)
+
         if isinstance(fn, LLVMFunction): # another function
+            if self.nogil and fn.requires_gil:
+                raise GILRequiredError(
+                        self.current_node,
+                        'Calling "%s" requires the GIL.' % fn.code_llvm.name()
+                      )
             retty = fn.retty
             argtys = fn.argtys
             fn = fn.code_llvm
@@ -91,7 +177,116 @@ class LLVMCodeGenerator(CodeGenerationBase):
 
         return self._call_function(fn, args, retty, argtys)
 
+    def generate_math(self, libm, fn, args):
+        '''Call a function of math.h declared with declare_builtin.
+        The arguments are scalars or vectors of the type of the function.
+        Calls the LLVM intrinsic of the function if there is one. Otherwise,
+        calls the libm function for each lane of vectors.
+        '''
+        builder = self.builder
+        if len(args) != len(fn.argtys):
+            raise InvalidCall(self.current_node, 'Number of argument mismatch')
+        elemty = fn.retty
+        lanes = set(X.type.elemcount for X in args
+                    if isinstance(X.type, LLVMVector))
+        if len(lanes) > 1:
+            raise InvalidCall(self.current_node,
+                              'Vectors of different sizes in "%s".'
+                              % fn.code_llvm.name())
+        ty = vector_type(elemty, lanes.pop()) if lanes else elemty
+        try:
+            values = [ty.cast(X, builder) for X in args]
+        except TypeError as e:
+            raise InvalidCall(self.current_node, str(e))
+
+        suffix = 'f%d' % (8 * ctypes.sizeof(elemty.ctype()))
+        if lanes:
+            suffix = 'v%d%s' % (ty.elemcount, suffix)
+        name = intrinsics.intrinsic_name(libm, suffix, LLVM_VERSION)
+        if name is not None:
+            intrinsic = self._declare_runtime(name, ty.type(),
+                                              [ty.type()] * len(values))
+            return LLVMTempValue(builder.call(intrinsic, values), ty)
+        if libm == 'fabs': # clear the sign bit
+            return LLVMTempValue(self._clear_sign(values[0], ty), ty)
+        if not lanes:
+            return LLVMTempValue(builder.call(fn.code_llvm, values), ty)
+
+        intty = LLVMType(types.Int)
+        result = llvm.ConstantFactory.make_undef(ty.type())
+        for i in range(ty.elemcount):
+            idx = LLVMConstant(intty, i).value(builder)
+            lane = builder.call(fn.code_llvm,
+                                [builder.extract_element(X, idx)
+                                 for X in values])
+            result = builder.insert_element(result, lane, idx)
+        return LLVMTempValue(result, ty)
+
+    def generate_minmax(self, kind, values):
+        '''min or max of scalars or vectors, like the builtins of Python:
+        the first of the smallest or largest. Vectors compare by lane.
+        '''
+        builder = self.builder
+        ty = values[0].type
+        for value in values[1:]:
+            if isinstance(value.type, LLVMVector):
+                ty = value.type.coerce(ty)
+            else:
+                ty = ty.coerce(value.type)
+        elemty = ty.elemtype if isinstance(ty, LLVMVector) else ty
+        if not isinstance(elemty, (LLVMBasicIntMixin, LLVMBasicFloatMixin)):
+            raise InvalidCall(self.current_node,
+                              '%s() of values that are not numbers.' % kind)
+        compare = ty.op_lt if kind == 'min' else ty.op_gt
+        values = [ty.cast(X, builder) for X in values]
+        result = values[0]
+        for value in values[1:]:
+            result = builder.select(compare(value, result, builder), value,
+                                    result)
+        return LLVMTempValue(result, ty)
+
+    def generate_abs(self, value):
+        builder = self.builder
+        ty = value.type
+        elemty = ty.elemtype if isinstance(ty, LLVMVector) else ty
+        if isinstance(elemty, LLVMBasicFloatMixin):
+            return LLVMTempValue(self._clear_sign(value.value(builder), ty),
+                                 ty)
+        if not isinstance(elemty, LLVMBasicIntMixin):
+            raise InvalidCall(self.current_node, 'abs() of a non-number.')
+        val = value.value(builder)
+        zero = ty.cast(LLVMConstant(elemty, 0), builder)
+        negated = ty.op_sub(zero, val, builder)
+        return LLVMTempValue(builder.select(ty.op_lt(val, zero, builder),
+                                            negated, val),
+                             ty)
+
+    def _clear_sign(self, value, ty):
+        # |value| of a float, double or vector of them
+        builder = self.builder
+        elemty = ty.elemtype if isinstance(ty, LLVMVector) else ty
+        bits = 8 * ctypes.sizeof(elemty.ctype())
+        intty = LLVMType(types.Int32 if bits == 32 else types.Int64)
+        mask = LLVMConstant(intty, int((1 << (bits - 1)) - 1))
+        if isinstance(ty, LLVMVector):
+            intty = vector_type(intty, ty.elemcount)
+        integer = builder.bitcast(value, intty.type())
+        cleared = builder.bitwise_and(integer, intty.cast(mask, builder))
+        return builder.bitcast(cleared, ty.type())
+
     def generate_assign(self, from_value, to_target):
+        if isinstance(to_target.type, LLVMNDArray):
+            # The descriptor is loaded once. See ndarray_descriptor().
+            raise InvalidUseOfConstruct(
+                    self.current_node,
+                    'Cannot assign to N-dimensional array variable.'
+                  )
+        if isinstance(to_target.type, LLVMCheckedArray):
+            # Same as above. See checked_array_fields().
+            raise InvalidUseOfConstruct(
+                    self.current_node,
+                    'Cannot assign to array variable in bounds-checked code.'
+                  )
         casted = to_target.type.cast(from_value, self.builder)
         self.builder.store(casted, to_target.pointer)
         return casted
@@ -102,6 +297,9 @@ class LLVMCodeGenerator(CodeGenerationBase):
         rval = ty.cast(rhs, self.builder)
         fn = getattr(ty, 'op_%s'%op_class.__name__.lower())
         pred = fn(lval, rval, self.builder)
+        if isinstance(ty, LLVMVector): # a Bool for each lane
+            return LLVMTempValue(pred, vector_type(LLVMType(types.Bool),
+                                                   ty.elemcount))
         return LLVMTempValue(pred, LLVMType(types.Bool))
 
     def generate_return(self, value=None):
@@ -121,6 +319,19 @@ class LLVMCodeGenerator(CodeGenerationBase):
         lval = ty.cast(lhs, self.builder)
         rval = ty.cast(rhs, self.builder)
 
+        if (op_class is ast.Div and fastmath.ARCP in self.fastmath
+            and isinstance(ty, LLVMRealBinOpMixin)):
+            divisor = self._constant_divisor()
+            if divisor:
+                recip = LLVMConstant(LLVMType(types.Double), 1.0 / divisor)
+                return LLVMTempValue(ty.op_mult(lval,
+                                                ty.cast(recip, self.builder),
+                                                self.builder),
+                                     ty)
+
+        if op_class is ast.Pow and isinstance(ty, LLVMIntBinOpMixin):
+            return LLVMTempValue(self._integer_power(ty, lval, rval, rhs), ty)
+
         try:
             fn = getattr(ty, 'op_%s'%op_class.__name__.lower())
         except AttributeError as e:
@@ -128,7 +339,103 @@ class LLVMCodeGenerator(CodeGenerationBase):
         else:
             return LLVMTempValue(fn(lval, rval, self.builder), ty)
 
+    def _integer_power(self, ty, base, exponent, rhs):
+        '''base ** exponent of integers by squaring, without a conversion to
+        floating-point. A constant exponent is unrolled into multiplications.
+        A negative exponent gives 0 unless base is 1 or -1, the truncated
+        value of 1 / base ** -exponent.
+
+        base, exponent -- LLVM values of type ty.
+        rhs -- The exponent as a LLVMValue.
+        '''
+        builder = self.builder
+        elemty = ty.elemtype if isinstance(ty, LLVMVector) else ty
+        const = lambda N: ty.cast(LLVMConstant(elemty, N), builder)
+        one = const(1)
+        zero = const(0)
+        minus_one = ty.op_sub(zero, one, builder)
+        def reciprocal(odd):
+            # 1 / base ** -exponent truncated; odd is an i1 value
+            return builder.select(
+                        ty.op_eq(base, one, builder), one,
+                        builder.select(ty.op_eq(base, minus_one, builder),
+                                       builder.select(odd, minus_one, one),
+                                       zero))
+        if isinstance(rhs, LLVMConstant) and not isinstance(ty, LLVMVector):
+            count, result, power = rhs.number, None, base
+            if count < 0:
+                odd = LLVMConstant(LLVMType(types.Bool), count & 1)
+                return reciprocal(odd.value(builder))
+            while count:
+                if count & 1:
+                    result = (power if result is None
+                              else ty.op_mult(result, power, builder))
+                count >>= 1
+                if count:
+                    power = ty.op_mult(power, power, builder)
+            return one if result is None else result
+        if isinstance(ty, LLVMVector):
+            raise OperatorError(self.current_node,
+                                'The exponent of a vector of integers must '
+                                'be a constant.')
+
+        with self.relocate_to_entry():
+            slots = [builder.alloc(ty.type()) for _ in range(3)]
+        result_ptr, power_ptr, count_ptr = slots
+        for val, ptr in zip([one, base, exponent], slots):
+            builder.store(val, ptr)
+
+        bb_cond = self.new_basic_block('powcond')
+        bb_body = self.new_basic_block('powbody')
+        bb_exit = self.new_basic_block('powexit')
+        builder.branch(bb_cond)
+
+        builder.insert_at(bb_cond)
+        count = builder.load(count_ptr)
+        builder.cond_branch(ty.op_gt(count, zero, builder), bb_body, bb_exit)
+
+        builder.insert_at(bb_body)
+        count = builder.load(count_ptr)
+        power = builder.load(power_ptr)
+        result = builder.load(result_ptr)
+        odd = ty.op_noteq(ty.op_bitand(count, one, builder), zero, builder)
+        builder.store(builder.select(odd, ty.op_mult(result, power, builder),
+                                     result),
+                      result_ptr)
+        builder.store(ty.op_mult(power, power, builder), power_ptr)
+        builder.store(ty.op_rshift(count, one, builder), count_ptr)
+        builder.branch(bb_cond)
+
+        builder.insert_at(bb_exit)
+        result = builder.load(result_ptr)
+        # negative exponent
+        odd = ty.op_noteq(ty.op_bitand(exponent, one, builder), zero, builder)
+        return builder.select(ty.op_lt(exponent, zero, builder),
+                              reciprocal(odd), result)
+
+    def _constant_divisor(self):
+        '''Returns the value of the right operand of the current division if
+        it is a numeric constant. Otherwise, returns None.
+        '''
+        node = self.current_node
+        if isinstance(node, ast.BinOp):
+            operand = node.right
+        elif isinstance(node, ast.AugAssign):
+            operand = node.value
+        else:
+            return None
+        try:
+            return float(self.constant_number(operand))
+        except (NotImplementedError, KeyError, TypeError):
+            return None
+
     def generate_constant_int(self, value):
+        if type(value) is long: # beyond a native int
+            if value < 0:
+                raise OverflowError('Cannot use negative long constant.')
+            unsigned = value >= 1 << 63
+            return LLVMConstant(LLVMType(types.UInt64 if unsigned
+                                         else types.Int64), value)
         return LLVMConstant(LLVMType(types.Int), value)
 
     def generate_constant_real(self, value):
@@ -136,8 +443,17 @@ class LLVMCodeGenerator(CodeGenerationBase):
 
     def generate_declare(self, name, ty):
         with self.relocate_to_entry():
-            if issubclass(ty, types.GenericBoundedArray): # array
-                return LLVMArrayVariable(name, LLVMType(ty), ty.elemcount.value(self.builder), self.builder)
+            if type(ty) is type and issubclass(ty, types.GenericBoundedArray): # array
+                array = LLVMArrayVariable(name, LLVMType(ty), ty.elemcount.value(self.builder), self.builder)
+                if not self.boundscheck:
+                    return array
+                length = LLVMType(types.Int64).cast(ty.elemcount, self.builder)
+                desc = self._new_checked_array(checked_array(array.type),
+                                               array.value(self.builder),
+                                               length)
+                var = LLVMVariable(name, desc.type, self.builder)
+                self.builder.store(desc.value(self.builder), var.pointer)
+                return var
             else: # other types
                 realty = LLVMType(ty)
                 return LLVMVariable(name, realty, self.builder)
@@ -172,17 +488,357 @@ class LLVMCodeGenerator(CodeGenerationBase):
         return LLVMTempPointer(addr, ptr.type.elemtype)
 
     def generate_array_load_elem(self, ptr, idx):
-        ptr_val = ptr.value(self.builder)
-        idx_val = idx.value(self.builder)
-        ptr_offset = self.builder.gep(ptr_val, idx_val)
-        return LLVMTempValue(self.builder.load(ptr_offset), ptr.type.elemtype)
+        ptr_offset = self._array_element_pointer(ptr, idx)
+        return self._load_element(ptr_offset, ptr.type.elemtype)
+
+    def _load_element(self, addr, ty):
+        if isinstance(ty, LLVMStruct): # load the fields that are used
+            return LLVMStructReference(addr, ty)
+        return LLVMTempValue(self.builder.load(addr), ty)
 
     def generate_array_store_elem(self, ptr, idx):
-        ptr_val = ptr.value(self.builder)
-        idx_val = idx.value(self.builder)
-        ptr_offset = self.builder.gep(ptr_val, idx_val)
+        ptr_offset = self._array_element_pointer(ptr, idx)
         return LLVMTempPointer(ptr_offset, ptr.type.elemtype)
 
+    def _array_element_pointer(self, ptr, idx):
+        if isinstance(ptr.type, LLVMCheckedArray):
+            ptr_val, length = self.checked_array_fields(ptr)
+            if not self._is_hoisted(0):
+                self._check_bounds(idx, length)
+        else:
+            ptr_val = ptr.value(self.builder)
+        idx_val = idx.value(self.builder)
+        return self.builder.gep(ptr_val, idx_val)
+
+    def checked_array_fields(self, value):
+        '''Returns (data, length) of a bounds-checked array.
+        The fields of a variable are loaded once in the entry block. It is
+        valid because the variable is never reassigned.
+        '''
+        ty = value.type
+        if not isinstance(value, LLVMVariable): # e.g. a slice
+            desc = value.value(self.builder)
+            return (ty.field(desc, ty.DATA, self.builder),
+                    ty.field(desc, ty.LENGTH, self.builder))
+        try:
+            return self.ndarray_fields[value]
+        except KeyError:
+            pass
+
+        with self.relocate_to_entry():
+            desc = value.value(self.builder)
+            fields = (ty.field(desc, ty.DATA, self.builder),
+                      ty.field(desc, ty.LENGTH, self.builder))
+        self.ndarray_fields[value] = fields
+        return fields
+
+    def _new_checked_array(self, ty, data, length):
+        '''Returns a descriptor of a bounds-checked array.
+        data, length -- LLVM values of the fields.
+        '''
+        i32 = LLVMType(types.Int32)
+        with self.relocate_to_entry():
+            desc = self.builder.alloc(ty.descriptor_type())
+        for index, val in [(ty.DATA, data), (ty.LENGTH, length)]:
+            indices = [LLVMConstant(i32, X).value(self.builder)
+                       for X in (0, index)]
+            self.builder.store(val, self.builder.gep2(desc, indices))
+        return LLVMTempValue(desc, ty)
+
+    def _check_bounds(self, idx, length):
+        '''Report idx to the runtime and return from the function unless
+        0 <= idx < length.
+
+        idx -- Index as a LLVMValue.
+        length -- LLVM value of type i64.
+        '''
+        builder = self.builder
+        i32 = LLVMType(types.Int32)
+        i64 = LLVMType(types.Int64)
+        idx_val = i64.cast(idx, builder)
+
+        bb_fail = self.new_basic_block('boundsfail')
+        bb_ok = self.new_basic_block('boundsok')
+        # A negative index is a large unsigned number.
+        inbounds = builder.icmp(llvm.ICMP_ULT, idx_val, length)
+        builder.cond_branch(inbounds, bb_ok, bb_fail)
+
+        builder.insert_at(bb_fail)
+        report = self._declare_runtime('pymothoa_bounds_error',
+                                       LLVMType(types.Void).type(),
+                                       [i64.type(), i64.type(), i32.type()])
+        line = self.first_line + getattr(self.current_node, 'lineno', 1) - 1
+        builder.call(report, [idx_val, length,
+                              LLVMConstant(i32, line).value(builder)])
+        if isinstance(self.retty, LLVMVoid):
+            builder.ret_void()
+        else: # the caller discards the value and raises IndexError
+            builder.ret(llvm.ConstantFactory.make_null(self.retty.type()))
+
+        builder.insert_at(bb_ok)
+
+    def _is_hoisted(self, dim):
+        '''Returns True if the index of the current subscript in dimension
+        dim is checked before the enclosing loop.
+        '''
+        node = self.current_node
+        if not (isinstance(node, ast.Subscript)
+                and isinstance(node.value, ast.Name)
+                and isinstance(node.slice, ast.Index)):
+            return False
+        index = node.slice.value
+        indices = index.elts if isinstance(index, ast.Tuple) else [index]
+        return (dim < len(indices)
+                and isinstance(indices[dim], ast.Name)
+                and (node.value.id, dim, indices[dim].id) in self.hoisted)
+
+    def _hoistable_checks(self, counter_name, loopbody):
+        '''Returns the (array, dimension) pairs that are indexed by the
+        counter of a loop in its body. The checks of these indices can be
+        done once before the loop.
+
+        Only the subscripts that run in every iteration are hoisted: those
+        of the simple statements at the top level of the body, outside of
+        conditional expressions. Returns nothing if the counter or the end
+        of the loop may change in the body, or if the body may leave an
+        iteration early with break, continue or return.
+        '''
+        if not self.boundscheck or not self._is_counted_loop(counter_name,
+                                                             loopbody):
+            return set()
+        for node in (X for stmt in loopbody for X in ast.walk(stmt)):
+            if isinstance(node, (ast.Break, ast.Continue, ast.Return)):
+                return set()
+
+        pairs = set()
+        for node in self._unconditional_nodes(loopbody):
+            if (isinstance(node, ast.Subscript)
+                and isinstance(node.value, ast.Name)
+                and isinstance(node.slice, ast.Index)):
+                var = self.symbols.get(node.value.id)
+                if not isinstance(var, LLVMValue):
+                    continue
+                if isinstance(var.type, LLVMCheckedArray):
+                    ndim = 1
+                elif isinstance(var.type, LLVMNDArray):
+                    ndim = var.type.ndim
+                else:
+                    continue
+                index = node.slice.value
+                indices = index.elts if isinstance(index, ast.Tuple) else [index]
+                if len(indices) != ndim:
+                    continue # reported by the code generation
+                for dim, X in enumerate(indices):
+                    if isinstance(X, ast.Name) and X.id == counter_name:
+                        pairs.add((node.value.id, dim))
+        return pairs
+
+    def _unconditional_nodes(self, stmts):
+        '''Yields the nodes of the statements that run whenever the
+        statements run: compound statements, the operands of "and"/"or"
+        after the first and the branches of conditional expressions are
+        skipped.
+        '''
+        pending = [X for X in stmts
+                   if not isinstance(X, (ast.If, ast.For, ast.While,
+                                         ast.TryExcept, ast.TryFinally,
+                                         ast.With))]
+        while pending:
+            node = pending.pop()
+            yield node
+            if isinstance(node, ast.BoolOp):
+                pending.append(node.values[0])
+            elif isinstance(node, ast.IfExp):
+                pending.append(node.test)
+            else:
+                pending.extend(ast.iter_child_nodes(node))
+
+    def _is_counted_loop(self, counter_name, loopbody):
+        '''Returns True if the current node is a for-loop with a positive
+        constant step whose counter and end (if it is a variable) are not
+        assigned in the body.
+        '''
+        loop = self.current_node
+        if not isinstance(loop, ast.For):
+            return False
+
+        # The step must be a positive constant.
+        if len(loop.iter.args) == 3:
+            try:
+                step = self.constant_number(loop.iter.args[2])
+            except (NotImplementedError, KeyError, TypeError):
+                return False
+            if not isinstance(step, (int, long)) or step <= 0:
+                return False
+
+        # The end is loaded in every iteration if it is a variable.
+        fixed = set([counter_name])
+        end = loop.iter.args[0 if len(loop.iter.args) == 1 else 1]
+        if isinstance(end, ast.Name):
+            fixed.add(end.id)
+
+        for node in (X for stmt in loopbody for X in ast.walk(stmt)):
+            if isinstance(node, (ast.Assign, ast.AugAssign, ast.For)):
+                targets = getattr(node, 'targets', None) or [node.target]
+                for target in targets:
+                    if isinstance(target, ast.Name) and target.id in fixed:
+                        return False
+        return True
+
+    def _array_extent(self, var, dim):
+        '''Returns the LLVM value of the length of an array in dimension dim.
+        '''
+        if isinstance(var.type, LLVMCheckedArray):
+            return self.checked_array_fields(var)[1]
+        _, shape, _ = self.ndarray_descriptor(var)
+        return shape[dim]
+
+    def _generate_hoisted_checks(self, pairs, initcount, endcount, step,
+                                 count=None):
+        '''Check the first and the last index of a loop for each array once.
+        The loop runs init, init + step, ... while the index is below end,
+        or count times if the number of iterations (an LLVM value of type
+        Int) is given.
+        '''
+        if not pairs:
+            return
+        builder = self.builder
+        i64 = LLVMType(types.Int64)
+        init = i64.cast(initcount, builder)
+        end = i64.cast(endcount, builder)
+        stepval = i64.cast(step, builder)
+        one = LLVMConstant(i64, 1).value(builder)
+
+        bb_check = self.new_basic_block('hoistedchecks')
+        bb_loop = self.new_basic_block('hoistedok')
+        if count is None:
+            nonempty = builder.icmp(llvm.ICMP_SLT, init, end)
+            # last = init + (end - init - 1) / step * step
+            span = i64.op_sub(i64.op_sub(end, init, builder), one, builder)
+            iterations = i64.op_div(span, stepval, builder)
+        else:
+            count = i64.cast(LLVMTempValue(count, LLVMType(types.Int)), builder)
+            nonempty = i64.op_gt(count, LLVMConstant(i64, 0).value(builder),
+                                 builder)
+            # last = init + (count - 1) * step
+            iterations = i64.op_sub(count, one, builder)
+        builder.cond_branch(nonempty, bb_check, bb_loop)
+
+        builder.insert_at(bb_check)
+        last = i64.op_add(init, i64.op_mult(iterations, stepval, builder),
+                          builder)
+        for name, dim in sorted(pairs):
+            length = self._array_extent(self.symbols[name], dim)
+            for idx in (init, last):
+                self._check_bounds(LLVMTempValue(idx, i64), length)
+        builder.branch(bb_loop)
+
+        builder.insert_at(bb_loop)
+
+    @contextmanager
+    def hoisting(self, counter_name, pairs):
+        '''Skip the checks of the hoisted indices in the loop body.
+        '''
+        added = set((name, dim, counter_name) for name, dim in pairs)
+        added -= self.hoisted
+        self.hoisted |= added
+        try:
+            yield
+        finally:
+            self.hoisted -= added
+
+    def ndarray_descriptor(self, var):
+        '''Returns (data, shape, strides) of an N-dimensional array.
+        The fields are loaded once in the entry block. It is valid because
+        the variable is never reassigned.
+        '''
+        try:
+            return self.ndarray_fields[var]
+        except KeyError:
+            pass
+
+        ty = var.type
+        i32 = LLVMType(types.Int32)
+        def field(*indices):
+            indices = [LLVMConstant(i32, X).value(self.builder) for X in indices]
+            return self.builder.load(self.builder.gep2(desc, indices))
+
+        with self.relocate_to_entry():
+            desc = var.value(self.builder)
+            data = field(0, ty.DATA)
+            shape = tuple(field(0, ty.SHAPE, k) for k in range(ty.ndim))
+            strides = tuple(field(0, ty.STRIDES, k) for k in range(ty.ndim))
+        fields = self.ndarray_fields[var] = data, shape, strides
+        return fields
+
+    def _ndarray_element_pointer(self, ptr, indices):
+        ty = ptr.type
+        if len(indices) != ty.ndim:
+            raise InvalidSubscriptError(
+                    self.current_node,
+                    'Expecting %d indices for %d-dimensional array.' % (
+                        ty.ndim, ty.ndim)
+                  )
+        data, shape, strides = self.ndarray_descriptor(ptr)
+        i64 = LLVMType(types.Int64)
+        if self.boundscheck:
+            for dim, (idx, extent) in enumerate(zip(indices, shape)):
+                if not self._is_hoisted(dim):
+                    self._check_bounds(idx, extent)
+        offset = None
+        for idx, stride in zip(indices, strides):
+            term = self.builder.mul(i64.cast(idx, self.builder), stride)
+            offset = term if offset is None else self.builder.add(offset, term)
+        return self.builder.gep(data, offset)
+
+    def generate_ndarray_load_elem(self, ptr, indices):
+        addr = self._ndarray_element_pointer(ptr, indices)
+        return self._load_element(addr, ptr.type.elemtype)
+
+    def generate_ndarray_store_elem(self, ptr, indices):
+        addr = self._ndarray_element_pointer(ptr, indices)
+        return LLVMTempPointer(addr, ptr.type.elemtype)
+
+    def generate_attribute(self, value, attr):
+        if isinstance(value, LLVMValue) and isinstance(value.type, LLVMNDArray):
+            if attr == 'shape':
+                _, shape, _ = self.ndarray_descriptor(value)
+                i64 = LLVMType(types.Int64)
+                return tuple(LLVMTempValue(X, i64) for X in shape)
+            raise InvalidUseOfConstruct(
+                    self.current_node,
+                    'N-dimensional array has no attribute "%s".' % attr
+                  )
+        if isinstance(value, LLVMValue) and isinstance(value.type, LLVMStruct):
+            addr, ty = self._field_pointer(value, attr)
+            return self._load_element(addr, ty)
+        return super(LLVMCodeGenerator, self).generate_attribute(value, attr)
+
+    def generate_attribute_store(self, value, attr):
+        if isinstance(value, LLVMValue) and isinstance(value.type, LLVMStruct):
+            addr, ty = self._field_pointer(value, attr)
+            return LLVMTempPointer(addr, ty)
+        return super(LLVMCodeGenerator, self).generate_attribute_store(value,
+                                                                       attr)
+
+    def _field_pointer(self, value, attr):
+        '''Returns (pointer, LLVMType) of a field of a struct in memory.
+        '''
+        if not hasattr(value, 'pointer'):
+            raise InvalidUseOfConstruct(self.current_node,
+                                        'Struct is not in memory.')
+        try:
+            index, ty = value.type.field(attr)
+        except AttributeError:
+            raise InvalidUseOfConstruct(
+                    self.current_node,
+                    'Struct %s has no field "%s".' % (value.type.struct.name,
+                                                      attr)
+                  )
+        i32 = LLVMType(types.Int32)
+        indices = [LLVMConstant(i32, X).value(self.builder) for X in (0, index)]
+        return self.builder.gep2(value.pointer, indices), ty
+
     def generate_if(self, test, iftrue, orelse):
         bb_if = self.new_basic_block('if')
         bb_else = self.new_basic_block('else')
@@ -190,10 +846,11 @@ class LLVMCodeGenerator(CodeGenerationBase):
         is_endif_reachable = False
 
         boolean = self.ensure_boolean(test)
-        self.builder.cond_branch(boolean, bb_if, bb_else)
+        self._cond_branch(instrument.IF, boolean, bb_if, bb_else)
 
         # true branch
         self.builder.insert_at(bb_if)
+        self._count_branch(instrument.IF, True)
         for stmt in iftrue:
             self.visit(stmt)
         else:
@@ -203,6 +860,7 @@ class LLVMCodeGenerator(CodeGenerationBase):
 
         # false branch
         self.builder.insert_at(bb_else)
+        self._count_branch(instrument.IF, False)
         for stmt in orelse:
             self.visit(stmt)
         else:
@@ -225,11 +883,13 @@ class LLVMCodeGenerator(CodeGenerationBase):
         # condition
         self.builder.insert_at(bb_cond)
         cond = self.visit(test)
-        self.builder.cond_branch(self.ensure_boolean(cond), bb_body, bb_exit)
+        self._cond_branch(instrument.WHILE, self.ensure_boolean(cond),
+                          bb_body, bb_exit)
 
         # body
 
         self.builder.insert_at(bb_body)
+        self._count_branch(instrument.WHILE, True)
 
         for stmt in body:
             self.visit(stmt)
@@ -241,11 +901,35 @@ class LLVMCodeGenerator(CodeGenerationBase):
 
         # end loop
         self.builder.insert_at(bb_exit)
+        self._count_branch(instrument.WHILE, False)
 
     def generate_for_range(self, counter_ptr, initcount, endcount, step, loopbody):
+        counter_name = self.current_node.target.id
+        hoisted = self._hoistable_checks(counter_name, loopbody)
+        self._generate_hoisted_checks(hoisted, initcount, endcount, step)
+        reductions = self._interleavable_reductions(counter_name, loopbody)
 
         self.builder.store(initcount.value(self.builder), counter_ptr.pointer)
 
+        with self.hoisting(counter_name, hoisted):
+            if reductions:
+                partials = self._generate_interleaved_loop(counter_ptr,
+                                                           endcount, step,
+                                                           loopbody,
+                                                           reductions)
+            # the remaining iterations
+            self._generate_loop(counter_ptr, endcount, step, loopbody)
+            self._count_branch(instrument.FOR, False)
+            if reductions:
+                self._combine_partials(partials)
+
+    def _generate_loop(self, counter_ptr, endcount, step, loopbody,
+                       lanes=1, begin_lane=None, end_lane=None):
+        '''Run the body while the counter is below end. Each iteration runs
+        the body for the given number of consecutive values of the counter.
+        begin_lane(lane) and end_lane(lane) are called around each copy of
+        the body.
+        '''
         bb_cond = self.new_basic_block('loopcond')
         bb_body = self.new_basic_block('loopbody')
         bb_incr = self.new_basic_block('loopincr')
@@ -255,23 +939,79 @@ class LLVMCodeGenerator(CodeGenerationBase):
 
         # condition
         self.builder.insert_at(bb_cond)
-        test = self.builder.icmp(llvm.ICMP_SLT, counter_ptr.value(self.builder), endcount.value(self.builder))
-        self.builder.cond_branch(test, bb_body, bb_exit)
+        last = counter_ptr.value(self.builder)
+        if lanes > 1: # the counter of the last lane
+            span = counter_ptr.type.op_mult(
+                        step.value(self.builder),
+                        LLVMConstant(counter_ptr.type, lanes - 1).value(self.builder),
+                        self.builder)
+            last = counter_ptr.type.op_add(last, span, self.builder)
+        test = self.builder.icmp(llvm.ICMP_SLT, last, endcount.value(self.builder))
+        self._cond_branch(instrument.FOR, test, bb_body, bb_exit)
 
         # body
         self.builder.insert_at(bb_body)
 
-        for stmt in loopbody:
-            self.visit(stmt)
+        for lane in range(lanes):
+            if lane:
+                self._increment(counter_ptr, step)
+            self._count_branch(instrument.FOR, True)
+            if begin_lane is not None:
+                begin_lane(lane)
+            for stmt in loopbody:
+                self.visit(stmt)
+            if end_lane is not None:
+                end_lane(lane)
         else:
             self.builder.branch(bb_incr)
-            # Not sure if it is necessary
-            #            if not self.builder.is_block_closed():
-            #                self.builder.branch(bb_incr)
+        # Not sure if it is necessary
+        #            if not self.builder.is_block_closed():
+        #                self.builder.branch(bb_incr)
 
         # incr
         self.builder.insert_at(bb_incr)
+        self._increment(counter_ptr, step)
+        self.builder.branch(bb_cond)
 
+        # exit
+        self.builder.insert_at(bb_exit)
+
+    def _cond_branch(self, kind, cond, bb_true, bb_false):
+        '''Conditional branch of the current if-statement or loop. Uses the
+        branch weights of the construct if there are any.
+        '''
+        key = instrument.probe_key(kind, self.current_node)
+        weights = self.branch_weights.get(key)
+        if weights is None:
+            self.builder.cond_branch(cond, bb_true, bb_false)
+        else:
+            self.builder.cond_branch_weighted(cond, bb_true, bb_false,
+                                              *weights)
+
+    def _count_branch(self, kind, taken):
+        '''Increment the counter of a side of the branch of the current
+        if-statement or loop, if the function is instrumented.
+        '''
+        if self.counters is None:
+            return
+        builder = self.builder
+        i64 = LLVMType(types.Int64)
+        if self.counter_base is None:
+            # Load the address of the buffer from the cell of the counters.
+            with self.relocate_to_entry():
+                ptrty = llvm.TypeFactory.make_pointer(i64.type())
+                cell = llvm.ConstantFactory.make_pointer(
+                            llvm.TypeFactory.make_pointer(ptrty),
+                            ctypes.addressof(self.counters.cell))
+                self.counter_base = builder.load(cell)
+        index = self.counters.probe(instrument.probe_key(kind,
+                                                         self.current_node))
+        slot = LLVMConstant(i64, 2 * index + (0 if taken else 1))
+        ptr = builder.gep(self.counter_base, slot.value(builder))
+        one = LLVMConstant(i64, 1).value(builder)
+        builder.store(builder.add(builder.load(ptr), one), ptr)
+
+    def _increment(self, counter_ptr, step):
 #        counter_next = self.builder.add(counter_ptr.value(self.builder),
 #                                        step.value(self.builder))
 
@@ -280,10 +1020,860 @@ class LLVMCodeGenerator(CodeGenerationBase):
                                                self.builder)
 
         self.builder.store(counter_next, counter_ptr.pointer)
-        self.builder.branch(bb_cond)
 
-        # exit
-        self.builder.insert_at(bb_exit)
+    # Number of independent partial results of interleaved reductions.
+    REDUCTION_LANES = 4
+
+    def _interleavable_reductions(self, counter_name, loopbody):
+        '''Returns the floating-point reductions of a loop that can be
+        reassociated under fast-math: a dict mapping the names of scalar
+        variables to the reduction operator. The variables are only updated
+        with "x += expr", "x -= expr" or "x *= expr" in the body.
+        '''
+        if (fastmath.REASSOC not in self.fastmath
+            or not self._is_counted_loop(counter_name, loopbody)):
+            return {}
+
+        reductions = {}
+        updates = set() # targets of the reductions
+        for node in (X for stmt in loopbody for X in ast.walk(stmt)):
+            if isinstance(node, (ast.Return, ast.For)):
+                return {} # the body is generated more than once
+            elif (isinstance(node, ast.Call) and isinstance(node.func, ast.Name)
+                  and self.symbols.get(node.func.id) is dialect.var):
+                return {}
+            elif (isinstance(node, ast.AugAssign)
+                  and isinstance(node.target, ast.Name)
+                  and type(node.op) in self.PARALLEL_REDUCTIONS):
+                var = self.symbols.get(node.target.id)
+                if (isinstance(var, LLVMVariable)
+                    and not isinstance(var, LLVMArrayVariable)
+                    and isinstance(var.type, types.GenericReal)):
+                    reductions.setdefault(node.target.id, set()).add(
+                            self.PARALLEL_REDUCTIONS[type(node.op)][1])
+                    updates.add(node.target)
+
+        # any other use of the variable sees the partial result
+        used = set(X.id for stmt in loopbody for X in ast.walk(stmt)
+                   if isinstance(X, ast.Name) and X not in updates)
+        return dict((name, ops.pop()) for name, ops in reductions.items()
+                    if name not in used and len(ops) == 1)
+
+    def _generate_interleaved_loop(self, counter_ptr, endcount, step,
+                                   loopbody, reductions):
+        '''Run REDUCTION_LANES iterations at a time. Each lane accumulates
+        into its own element of a vector of partial results.
+
+        Returns [(name, combine, partial)] for _combine_partials().
+        '''
+        builder = self.builder
+        intty = LLVMType(types.Int)
+        lanes = self.REDUCTION_LANES
+        state = []
+        for name, combine in sorted(reductions.items()):
+            var = self.symbols[name]
+            vecty = vector_type(var.type, lanes)
+            # identities of the reductions; x + -0.0 is exactly x
+            identity = LLVMConstant(var.type, -0.0 if combine == 'op_add' else 1.0)
+            with self.relocate_to_entry():
+                lane_var = LLVMVariable('%s.lane' % name, var.type, builder)
+                partial = LLVMVariable('%s.partial' % name, vecty, builder)
+            builder.store(vecty.cast(identity, builder), partial.pointer)
+            state.append((name, var, combine, identity, lane_var, partial))
+
+        collected = {}
+        def begin_lane(lane):
+            for name, var, combine, identity, lane_var, partial in state:
+                builder.store(identity.value(builder), lane_var.pointer)
+                self.symbols[name] = lane_var
+                if not lane:
+                    collected[name] = llvm.ConstantFactory.make_undef(
+                                            partial.type.type())
+
+        def end_lane(lane):
+            index = LLVMConstant(intty, lane).value(builder)
+            for name, var, combine, identity, lane_var, partial in state:
+                collected[name] = builder.insert_element(collected[name],
+                                                         lane_var.value(builder),
+                                                         index)
+                self.symbols[name] = var
+                if lane == lanes - 1:
+                    op = getattr(partial.type, combine)
+                    builder.store(op(partial.value(builder), collected[name],
+                                     builder),
+                                  partial.pointer)
+
+        self._generate_loop(counter_ptr, endcount, step, loopbody,
+                            lanes=lanes, begin_lane=begin_lane,
+                            end_lane=end_lane)
+        return [(var, combine, partial)
+                for name, var, combine, identity, lane_var, partial in state]
+
+    def _combine_partials(self, partials):
+        '''Add the lanes of the partial results to the variables.
+        '''
+        builder = self.builder
+        intty = LLVMType(types.Int)
+        for var, combine, partial in partials:
+            op = getattr(var.type, combine)
+            vector = partial.value(builder)
+            total = var.value(builder)
+            for lane in range(partial.type.elemcount):
+                index = LLVMConstant(intty, lane).value(builder)
+                total = op(total, builder.extract_element(vector, index), builder)
+            builder.store(total, var.pointer)
+
+    # Reductions allowed in prange loops: operator -> (identity, combine)
+    PARALLEL_REDUCTIONS = {
+        ast.Add  : (0, 'op_add'),
+        ast.Sub  : (0, 'op_add'),   # partials hold the negated sums
+        ast.Mult : (1, 'op_mult'),
+    }
+
+    def _analyze_parallel_body(self, loopbody):
+        '''Classify the scalar variables of the enclosing function that are
+        written in the body of a prange loop.
+
+        Returns (private, reductions).
+        private -- set of names assigned in the loop.
+        reductions -- dict mapping names to the reduction operator.
+        '''
+        def is_outer_scalar(name):
+            var = self.symbols.get(name)
+            return (isinstance(var, LLVMVariable)
+                    and not isinstance(var, LLVMArrayVariable))
+
+        private = set()
+        reductions = {}
+        for node in (X for stmt in loopbody for X in ast.walk(stmt)):
+            if isinstance(node, ast.Return):
+                raise InvalidUseOfConstruct(
+                        node,
+                        'Cannot return from inside a prange loop.'
+                      )
+            elif isinstance(node, ast.Assign):
+                for target in node.targets:
+                    if isinstance(target, ast.Name) and is_outer_scalar(target.id):
+                        private.add(target.id)
+            elif (isinstance(node, ast.AugAssign)
+                  and isinstance(node.target, ast.Name)
+                  and is_outer_scalar(node.target.id)):
+                name = node.target.id
+                op = type(node.op)
+                if op not in self.PARALLEL_REDUCTIONS:
+                    raise InvalidUseOfConstruct(
+                            node,
+                            'Unsupported reduction operator in prange loop.'
+                          )
+                combine = self.PARALLEL_REDUCTIONS[op][1]
+                if name in reductions and self.PARALLEL_REDUCTIONS[reductions[name]][1] != combine:
+                    raise InvalidUseOfConstruct(
+                            node,
+                            'Mixed reduction operators for "%s".' % name
+                          )
+                reductions[name] = op
+
+        both = private & set(reductions)
+        if both:
+            raise InvalidUseOfConstruct(
+                    self.current_node,
+                    ('Variable "%s" is both assigned and reduced '
+                     'in a prange loop.') % both.pop()
+                  )
+        return private, reductions
+
+    def _range_count(self, initcount, endcount, step):
+        '''Returns the number of iterations of xrange(init, end, step) as a
+        LLVM value of type Int. A step of zero gives no iteration.
+        '''
+        builder = self.builder
+        intty = LLVMType(types.Int)
+        init = intty.cast(initcount, builder)
+        end = intty.cast(endcount, builder)
+        stepval = intty.cast(step, builder)
+        zero = LLVMConstant(intty, 0).value(builder)
+        one = LLVMConstant(intty, 1).value(builder)
+
+        # distance and stride in the direction of the step
+        forward = intty.op_gt(stepval, zero, builder)
+        distance = builder.select(forward,
+                                  intty.op_sub(end, init, builder),
+                                  intty.op_sub(init, end, builder))
+        stride = builder.select(forward, stepval,
+                                intty.op_sub(zero, stepval, builder))
+        nonzero = intty.op_noteq(stepval, zero, builder)
+        stride = builder.select(nonzero, stride, one) # no division by zero
+
+        # ceil(distance / stride) of a positive distance
+        count = intty.op_div(intty.op_add(distance,
+                                          intty.op_sub(stride, one, builder),
+                                          builder),
+                             stride, builder)
+        valid = builder.bitwise_and(nonzero,
+                                    intty.op_gt(distance, zero, builder))
+        return builder.select(valid, count, zero)
+
+    def generate_parallel_for_range(self, counter_name, initcount, endcount, step, loopbody):
+        '''Outline the loop body into a function and run it on the thread
+        pool of the runtime.
+
+        The body receives the variables of this function through an array
+        of pointers (env):
+            [init, step, captured variables..., reduction partials...]
+        '''
+        private, reductions = self._analyze_parallel_body(loopbody)
+        count = self._range_count(initcount, endcount, step)
+        hoisted = self._hoistable_checks(counter_name, loopbody)
+        self._generate_hoisted_checks(hoisted, initcount, endcount, step, count)
+        captured = sorted((name, var) for name, var in self.symbols.items()
+                          if isinstance(var, LLVMVariable))
+        reduced = sorted(reductions.items())
+
+        builder = self.builder
+        intty = LLVMType(types.Int)
+        i64 = LLVMType(types.Int64)
+        bytep = llvm.TypeFactory.make_pointer(llvm.TypeFactory.make_int(8))
+        envty = llvm.TypeFactory.make_pointer(bytep)
+
+        num_threads = self._declare_runtime('pymothoa_num_threads', i64.type(), [])
+        parallel_for = self._declare_runtime('pymothoa_parallel_for',
+                                             LLVMType(types.Void).type(),
+                                             [bytep, i64.type(), i64.type(), envty])
+
+        nslots = 2 + len(captured) + len(reduced)
+        with self.relocate_to_entry():
+            nchunks = builder.call(num_threads, [])
+            env = builder.alloc_array(bytep, LLVMConstant(i64, nslots).value(builder))
+            init_var = LLVMVariable('prange.init', intty, builder)
+            step_var = LLVMVariable('prange.step', intty, builder)
+            partials = [builder.alloc_array(self.symbols[name].type.type(), nchunks)
+                        for name, _ in reduced]
+
+        init = intty.cast(initcount, builder)
+        stepval = intty.cast(step, builder)
+        builder.store(init, init_var.pointer)
+        builder.store(stepval, step_var.pointer)
+
+        pointers = [init_var.pointer, step_var.pointer]
+        pointers += [var.pointer for _, var in captured]
+        pointers += partials
+        for i, ptr in enumerate(pointers):
+            slot = builder.gep(env, LLVMConstant(i64, i).value(builder))
+            builder.store(builder.bitcast(ptr, bytep), slot)
+
+        # outlined loop body
+        name = '%s.prange%d' % (self.function.name(), len(self.outlined))
+        body_fn = self.jit_engine.make_function(
+                        name,
+                        LLVMType(types.Void).type(),
+                        [i64.type(), i64.type(), i64.type(), envty])
+        if not body_fn.valid():
+            raise InternalError(self.current_node, self.jit_engine.last_error())
+        body_fn.set_internal()
+        self.outlined.append(body_fn)
+
+        symbols = dict((k, v) for k, v in self.symbols.items()
+                       if not isinstance(v, LLVMValue))
+        body_codegen = LLVMCodeGenerator(body_fn, LLVMType(types.Void), [],
+                                         symbols, jit_engine=self.jit_engine,
+                                         nogil=True,
+                                         boundscheck=self.boundscheck,
+                                         first_line=self.first_line,
+                                         fastmath=self.fastmath)
+        body_codegen.outlined = self.outlined
+        body_codegen.hoisted = set((name, dim, counter_name)
+                                   for name, dim in hoisted)
+        body_codegen.generate_parallel_body(counter_name, captured, private,
+                                            reduced, loopbody)
+
+        count64 = i64.cast(LLVMTempValue(count, intty), builder)
+        builder.call(parallel_for, [builder.bitcast(body_fn.as_value(), bytep),
+                                    count64, nchunks, env])
+
+        # combine the partials of the reductions serially
+        if reduced:
+            with self.relocate_to_entry():
+                chunk_var = LLVMVariable('prange.chunk', i64, builder)
+            builder.store(LLVMConstant(i64, 0).value(builder), chunk_var.pointer)
+
+            bb_cond = self.new_basic_block('reducecond')
+            bb_body = self.new_basic_block('reducebody')
+            bb_exit = self.new_basic_block('reduceexit')
+            builder.branch(bb_cond)
+
+            builder.insert_at(bb_cond)
+            chunk = chunk_var.value(builder)
+            more = builder.icmp(llvm.ICMP_SLT, chunk, nchunks)
+            builder.cond_branch(more, bb_body, bb_exit)
+
+            builder.insert_at(bb_body)
+            for (name, op), partial in zip(reduced, partials):
+                var = self.symbols[name]
+                combine = getattr(var.type, self.PARALLEL_REDUCTIONS[op][1])
+                value = builder.load(builder.gep(partial, chunk))
+                builder.store(combine(var.value(builder), value, builder),
+                              var.pointer)
+            chunk_next = i64.op_add(chunk, LLVMConstant(i64, 1).value(builder),
+                                    builder)
+            builder.store(chunk_next, chunk_var.pointer)
+            builder.branch(bb_cond)
+
+            builder.insert_at(bb_exit)
+
+    def generate_parallel_body(self, counter_name, captured, private, reduced, loopbody):
+        '''Generate the outlined body of a prange loop.
+        See generate_parallel_for_range().
+        '''
+        with self.generate_function(self.function.name()):
+            builder = self.builder
+            intty = LLVMType(types.Int)
+            i64 = LLVMType(types.Int64)
+            begin, end, chunk, env = self.function.arguments()
+
+            slots = iter(xrange(2 + len(captured) + len(reduced)))
+            def next_slot(elemty):
+                with self.relocate_to_entry():
+                    index = LLVMConstant(i64, slots.next()).value(builder)
+                    ptr = builder.load(builder.gep(env, index))
+                    return builder.bitcast(ptr, llvm.TypeFactory.make_pointer(elemty))
+
+            init = LLVMCapturedVariable(intty, next_slot(intty.type()))
+            step = LLVMCapturedVariable(intty, next_slot(intty.type()))
+
+            reductions = dict(reduced)
+            for name, var in captured:
+                if isinstance(var, LLVMArrayVariable):
+                    ptr = next_slot(var.type.elemtype.type())
+                    self.symbols[name] = LLVMCapturedArrayVariable(var.type, ptr)
+                    continue
+
+                shared = LLVMCapturedVariable(var.type, next_slot(var.type.type()))
+                if name in reductions:
+                    identity = self.PARALLEL_REDUCTIONS[reductions[name]][0]
+                    with self.relocate_to_entry():
+                        local = LLVMVariable(name, var.type, builder)
+                        builder.store(var.type.cast(LLVMConstant(intty, identity),
+                                                    builder),
+                                      local.pointer)
+                    self.symbols[name] = local
+                elif name in private:
+                    with self.relocate_to_entry():
+                        local = LLVMVariable(name, var.type, builder)
+                        builder.store(shared.value(builder), local.pointer)
+                    self.symbols[name] = local
+                else:
+                    self.symbols[name] = shared
+
+            partials = [next_slot(var.type.type()) for name, var in captured
+                        if name in reductions]
+
+            # iterate over [begin, end) of the iteration space
+            with self.relocate_to_entry():
+                index_var = LLVMVariable('prange.index', i64, builder)
+            counter = self.generate_declare(counter_name, types.Int)
+            self.symbols[counter_name] = counter
+            builder.store(begin, index_var.pointer)
+
+            bb_cond = self.new_basic_block('loopcond')
+            bb_body = self.new_basic_block('loopbody')
+            bb_incr = self.new_basic_block('loopincr')
+            bb_exit = self.new_basic_block('loopexit')
+
+            builder.branch(bb_cond)
+
+            builder.insert_at(bb_cond)
+            index = index_var.value(builder)
+            builder.cond_branch(builder.icmp(llvm.ICMP_SLT, index, end),
+                                bb_body, bb_exit)
+
+            builder.insert_at(bb_body)
+            # counter = init + index * step
+            offset = intty.op_mult(intty.cast(LLVMTempValue(index, i64), builder),
+                                   step.value(builder),
+                                   builder)
+            builder.store(intty.op_add(init.value(builder), offset, builder),
+                          counter.pointer)
+            for stmt in loopbody:
+                self.visit(stmt)
+            if not self.builder.is_block_closed():
+                builder.branch(bb_incr)
+
+            builder.insert_at(bb_incr)
+            index_next = i64.op_add(index_var.value(builder),
+                                    LLVMConstant(i64, 1).value(builder),
+                                    builder)
+            builder.store(index_next, index_var.pointer)
+            builder.branch(bb_cond)
+
+            # write the partials of the reductions
+            builder.insert_at(bb_exit)
+            for (name, _), partial in zip(reduced, partials):
+                slot = builder.gep(partial, chunk)
+                builder.store(self.symbols[name].value(builder), slot)
+
+    # Reductions accumulate into this number of vectors of this number of
+    # bytes. See generate_reduction().
+    REDUCTION_ACCUMULATORS = 4
+    REDUCTION_VECTOR_BYTES = 16
+
+    def generate_reduction(self, kind, operands):
+        '''Reduce arrays or vectors with sum, min, max, dot or argmax.
+
+        The elements of arrays are loaded as vectors into several
+        accumulators, which are combined pairwise after the loop. The
+        remaining elements are reduced one at a time. Sums are therefore
+        reassociated. The comparisons are ordered, so NaN elements are not
+        skipped: the result of min, max and argmax then depends on which
+        accumulator the NaN is loaded into. An empty range gives the
+        identity of the reduction: 0, the largest or the smallest value of
+        the type, or -1 for argmax (as dialect.argmax).
+        '''
+        seqs = [X for X, _, _ in operands]
+        elemty = None
+        for seq in seqs:
+            ty = seq.type
+            if not (isinstance(ty, (LLVMVector, LLVMUnboundedArray))
+                    and isinstance(ty.elemtype, (LLVMBasicIntMixin,
+                                                 LLVMBasicFloatMixin))):
+                raise InvalidCall(self.current_node,
+                                  '%s() reduces arrays and vectors of '
+                                  'numbers.' % kind)
+            if elemty is not None and ty.elemtype != elemty:
+                raise InvalidCall(self.current_node,
+                                  'Operands of %s() have different element '
+                                  'types.' % kind)
+            elemty = ty.elemtype
+
+        vectors = [isinstance(X.type, LLVMVector) for X in seqs]
+        if all(vectors):
+            if (any(lower is not None or upper is not None
+                    for _, lower, upper in operands)
+                or any(X.type.elemcount != seqs[0].type.elemcount
+                       for X in seqs)):
+                raise InvalidCall(self.current_node,
+                                  'Operands of %s() must be whole vectors of '
+                                  'the same size.' % kind)
+            return self._reduce_vectors(kind, elemty, seqs)
+        elif any(vectors):
+            raise InvalidCall(self.current_node,
+                              'Cannot mix arrays and vectors in %s().' % kind)
+
+        starts, count = [], None
+        for seq, lower, upper in operands:
+            start, length = self._reduction_range(seq, lower, upper)
+            starts.append(start)
+            # dot() stops at the end of the shorter operand, like zip().
+            count = length if count is None else self._select_min(count,
+                                                                  length)
+        return self._reduce_arrays(kind, elemty, starts, count)
+
+    def _reduction_range(self, seq, lower, upper):
+        '''Returns the pointer to the first element and the number of
+        elements of the slice seq[lower:upper] of an array.
+
+        In bounds-checked code, the length of the array is known and the
+        bounds are those of the slices of Python: negative bounds count from
+        the end and both are clamped to the array. Otherwise, constant
+        negative bounds are rejected and a negative lower bound is clamped
+        to 0 at runtime.
+        '''
+        builder = self.builder
+        intty = LLVMType(types.Int)
+        zero = LLVMConstant(intty, 0).value(builder)
+        if isinstance(seq.type, LLVMCheckedArray):
+            data, length = self.checked_array_fields(seq)
+            length = intty.cast(LLVMTempValue(length, LLVMType(types.Int64)),
+                                builder)
+            lo = zero
+            if lower is not None:
+                lo = self._slice_bound(intty.cast(lower, builder), length)
+            hi = length
+            if upper is not None:
+                hi = self._slice_bound(intty.cast(upper, builder), length)
+        elif upper is None:
+            raise InvalidCall(self.current_node,
+                              'The length of the array is unknown. Reduce a '
+                              'slice with an upper bound, e.g. A[:n].')
+        else:
+            for bound in (lower, upper):
+                if isinstance(bound, LLVMConstant) and bound.number < 0:
+                    raise InvalidCall(self.current_node,
+                                      'The length of the array is unknown. '
+                                      'Negative bounds of a slice need '
+                                      'bounds-checked code.')
+            data = seq.value(builder)
+            lo = zero
+            if lower is not None:
+                lo = self._select_max(intty.cast(lower, builder), zero)
+            hi = intty.cast(upper, builder)
+        count = builder.sub(hi, lo)
+        count = builder.select(intty.op_lt(count, zero, builder), zero, count)
+        return builder.gep(data, lo), count
+
+    def _slice_bound(self, bound, length):
+        '''Returns the bound of a slice of an array of the given length as
+        in Python: a negative bound counts from the end. The result is
+        clamped to [0, length]. All values are of type Int.
+        '''
+        builder = self.builder
+        intty = LLVMType(types.Int)
+        zero = LLVMConstant(intty, 0).value(builder)
+        from_end = self._select_max(intty.op_add(bound, length, builder), zero)
+        return builder.select(intty.op_lt(bound, zero, builder),
+                              from_end, self._select_min(bound, length))
+
+    def _select_min(self, lhs, rhs):
+        # of two values of type Int
+        less = LLVMType(types.Int).op_lt(lhs, rhs, self.builder)
+        return self.builder.select(less, lhs, rhs)
+
+    def _select_max(self, lhs, rhs):
+        # of two values of type Int
+        greater = LLVMType(types.Int).op_gt(lhs, rhs, self.builder)
+        return self.builder.select(greater, lhs, rhs)
+
+    def _reduction_identity(self, kind, elemty):
+        '''Returns the identity of a reduction of elements of type elemty.
+        '''
+        builder = self.builder
+        if kind in ('sum', 'dot'):
+            return LLVMConstant(elemty, 0).value(builder)
+        if isinstance(elemty, LLVMBasicFloatMixin):
+            inf = float('inf')
+            return LLVMConstant(elemty, inf if kind == 'min' else -inf
+                                ).value(builder)
+        if not elemty.signed: # 0 or all ones
+            zero = LLVMConstant(elemty, 0).value(builder)
+            if kind == 'min':
+                return builder.sub(zero, LLVMConstant(elemty, 1).value(builder))
+            return zero
+        largest = LLVMConstant(elemty, int((1 << (elemty.bitsize - 1)) - 1)
+                               ).value(builder)
+        if kind == 'min':
+            return largest
+        one = LLVMConstant(elemty, 1).value(builder)
+        return builder.sub(builder.negative(largest), one) # folded
+
+    def _reduction_combine(self, kind, ty):
+        '''Returns a function that combines two partial results of a
+        reduction. ty is the type of the elements or of a vector of them.
+        '''
+        builder = self.builder
+        if kind in ('sum', 'dot'):
+            return lambda lhs, rhs: ty.op_add(lhs, rhs, builder)
+        compare = ty.op_lt if kind == 'min' else ty.op_gt
+        return lambda lhs, rhs: builder.select(compare(lhs, rhs, builder),
+                                               lhs, rhs)
+
+    def _argmax_combine(self, elemty):
+        '''Returns a function that combines two (value, position) partial
+        results of argmax. The first largest value wins. A negative
+        position is no element.
+        '''
+        builder = self.builder
+        intty = LLVMType(types.Int)
+        zero = LLVMConstant(intty, 0).value(builder)
+        def combine(lhs, rhs):
+            (lval, lpos), (rval, rpos) = lhs, rhs
+            better = builder.bitwise_or(
+                        elemty.op_gt(rval, lval, builder),
+                        builder.bitwise_and(elemty.op_eq(rval, lval, builder),
+                                            intty.op_lt(rpos, lpos, builder)))
+            take = builder.bitwise_or(
+                        intty.op_lt(lpos, zero, builder),
+                        builder.bitwise_and(intty.op_gte(rpos, zero, builder),
+                                            better))
+            return (builder.select(take, rval, lval),
+                    builder.select(take, rpos, lpos))
+        return combine
+
+    def _combine_tree(self, partials, combine):
+        '''Combine the partial results pairwise.
+        '''
+        while len(partials) > 1:
+            pairs = [combine(partials[i], partials[i + 1])
+                     for i in range(0, len(partials) - 1, 2)]
+            if len(partials) % 2:
+                pairs.append(partials[-1])
+            partials = pairs
+        return partials[0]
+
+    def _vector_lanes(self, vector, elemcount):
+        builder = self.builder
+        intty = LLVMType(types.Int)
+        return [builder.extract_element(vector,
+                                        LLVMConstant(intty, i).value(builder))
+                for i in range(elemcount)]
+
+    def _reduce_vectors(self, kind, elemty, seqs):
+        builder = self.builder
+        intty = LLVMType(types.Int)
+        vecty = seqs[0].type
+        vector = seqs[0].value(builder)
+        if kind == 'dot':
+            vector = vecty.op_mult(vector, seqs[1].value(builder), builder)
+        lanes = self._vector_lanes(vector, vecty.elemcount)
+        if kind == 'argmax':
+            positions = [LLVMConstant(intty, i).value(builder)
+                         for i in range(vecty.elemcount)]
+            _, pos = self._combine_tree(zip(lanes, positions),
+                                        self._argmax_combine(elemty))
+            return LLVMTempValue(pos, intty)
+        combine = self._reduction_combine(kind, elemty)
+        return LLVMTempValue(self._combine_tree(lanes, combine), elemty)
+
+    def _reduce_arrays(self, kind, elemty, starts, count):
+        builder = self.builder
+        intty = LLVMType(types.Int)
+        def constant(value):
+            return LLVMConstant(intty, value).value(builder)
+
+        elemsize = ctypes.sizeof(elemty.ctype())
+        lanes = max(2, self.REDUCTION_VECTOR_BYTES // elemsize)
+        vecty = vector_type(elemty, lanes)
+        posty = vector_type(intty, lanes)
+        step = lanes * self.REDUCTION_ACCUMULATORS
+        identity = self._reduction_identity('max' if kind == 'argmax'
+                                            else kind, elemty)
+        none = builder.sub(constant(0), constant(1)) # argmax of nothing
+
+        with self.relocate_to_entry():
+            index = LLVMVariable('reduce.index', intty, builder)
+            partials = [LLVMVariable('reduce.partial', vecty, builder)
+                        for _ in range(self.REDUCTION_ACCUMULATORS)]
+            positions = [LLVMVariable('reduce.position', posty, builder)
+                         for _ in partials]
+            result = LLVMVariable('reduce.result', elemty, builder)
+            position = LLVMVariable('reduce.argmax', intty, builder)
+
+        builder.store(constant(0), index.pointer)
+        for partial, pos in zip(partials, positions):
+            builder.store(vecty.cast(LLVMTempValue(identity, elemty), builder),
+                          partial.pointer)
+            builder.store(posty.cast(LLVMTempValue(none, intty), builder),
+                          pos.pointer)
+
+        bb_cond = self.new_basic_block('reducecond')
+        bb_body = self.new_basic_block('reducebody')
+        bb_combine = self.new_basic_block('reducecombine')
+        bb_tailcond = self.new_basic_block('reducetailcond')
+        bb_tailbody = self.new_basic_block('reducetailbody')
+        bb_exit = self.new_basic_block('reduceexit')
+
+        # vector loop over step elements at a time
+        builder.branch(bb_cond)
+        builder.insert_at(bb_cond)
+        i = index.value(builder)
+        end = builder.add(i, constant(step))
+        builder.cond_branch(builder.icmp(llvm.ICMP_SLE, end, count),
+                            bb_body, bb_combine)
+
+        builder.insert_at(bb_body)
+        lane_offsets = posty.cast(LLVMTempValue(constant(0), intty), builder)
+        for lane in range(lanes):
+            lane_offsets = builder.insert_element(lane_offsets,
+                                                  constant(lane),
+                                                  constant(lane))
+        combine = self._reduction_combine(kind, vecty)
+        for j, (partial, pos) in enumerate(zip(partials, positions)):
+            offset = builder.add(i, constant(j * lanes))
+            loaded = [self._load_vector(X, offset, vecty) for X in starts]
+            value = loaded[0]
+            if kind == 'dot':
+                value = vecty.op_mult(value, loaded[1], builder)
+            if kind == 'argmax':
+                current = partial.value(builder)
+                found = pos.value(builder)
+                empty = posty.cast(LLVMTempValue(constant(0), intty), builder)
+                take = builder.bitwise_or(
+                            vecty.op_gt(value, current, builder),
+                            posty.op_lt(found, empty, builder))
+                at = posty.op_add(posty.cast(LLVMTempValue(offset, intty),
+                                             builder),
+                                  lane_offsets, builder)
+                builder.store(builder.select(take, value, current),
+                              partial.pointer)
+                builder.store(builder.select(take, at, found), pos.pointer)
+            else:
+                builder.store(combine(partial.value(builder), value),
+                              partial.pointer)
+        builder.store(end, index.pointer)
+        builder.branch(bb_cond)
+
+        # combine the accumulators and their lanes
+        builder.insert_at(bb_combine)
+        if kind == 'argmax':
+            argmax_combine = self._argmax_combine(elemty)
+            pairs = []
+            for partial, pos in zip(partials, positions):
+                pairs.extend(zip(self._vector_lanes(partial.value(builder),
+                                                    lanes),
+                                 self._vector_lanes(pos.value(builder),
+                                                    lanes)))
+            best, at = self._combine_tree(pairs, argmax_combine)
+            builder.store(best, result.pointer)
+            builder.store(at, position.pointer)
+        else:
+            vector = self._combine_tree([X.value(builder) for X in partials],
+                                        combine)
+            scalar_combine = self._reduction_combine(kind, elemty)
+            builder.store(self._combine_tree(self._vector_lanes(vector, lanes),
+                                             scalar_combine),
+                          result.pointer)
+        builder.branch(bb_tailcond)
+
+        # the remaining elements
+        builder.insert_at(bb_tailcond)
+        i = index.value(builder)
+        builder.cond_branch(builder.icmp(llvm.ICMP_SLT, i, count),
+                            bb_tailbody, bb_exit)
+
+        builder.insert_at(bb_tailbody)
+        loaded = [builder.load(builder.gep(X, i)) for X in starts]
+        value = loaded[0]
+        if kind == 'dot':
+            value = elemty.op_mult(value, loaded[1], builder)
+        if kind == 'argmax':
+            current = result.value(builder)
+            found = position.value(builder)
+            take = builder.bitwise_or(elemty.op_gt(value, current, builder),
+                                      intty.op_lt(found, constant(0), builder))
+            builder.store(builder.select(take, value, current), result.pointer)
+            builder.store(builder.select(take, i, found), position.pointer)
+        else:
+            scalar_combine = self._reduction_combine(kind, elemty)
+            builder.store(scalar_combine(result.value(builder), value),
+                          result.pointer)
+        builder.store(builder.add(i, constant(1)), index.pointer)
+        builder.branch(bb_tailcond)
+
+        builder.insert_at(bb_exit)
+        if kind == 'argmax':
+            return LLVMTempValue(position.value(builder), intty)
+        return LLVMTempValue(result.value(builder), elemty)
+
+    def _load_vector(self, start, offset, vecty, aligned=False):
+        '''Load a vector of consecutive elements. Arrays are only aligned to
+        their elements unless the caller knows better.
+        '''
+        builder = self.builder
+        ptr = builder.bitcast(builder.gep(start, offset),
+                              llvm.TypeFactory.make_pointer(vecty.type()))
+        return builder.load_aligned(ptr, self._vector_alignment(vecty, aligned))
+
+    def _vector_alignment(self, vecty, aligned):
+        # in bytes; the largest power of two that divides the vector size
+        size = ctypes.sizeof(vecty.elemtype.ctype())
+        if aligned:
+            size *= vecty.elemcount
+        return size & -size
+
+    def _vector_array_pointer(self, array, index, count):
+        '''Returns the pointer to A[index] of an array that holds at least
+        count elements from there. Checks the bounds of a checked array.
+        '''
+        ty = array.type
+        if not (isinstance(ty, LLVMUnboundedArray)
+                and isinstance(ty.elemtype, (LLVMBasicIntMixin,
+                                             LLVMBasicFloatMixin))):
+            raise InvalidCall(self.current_node,
+                              'Expecting an array of numbers.')
+        builder = self.builder
+        intty = LLVMType(types.Int)
+        index = LLVMTempValue(intty.cast(index, builder), intty)
+        if isinstance(ty, LLVMCheckedArray):
+            data, length = self.checked_array_fields(array)
+            last = builder.add(index.value(builder),
+                               LLVMConstant(intty, count - 1).value(builder))
+            self._check_bounds(index, length)
+            self._check_bounds(LLVMTempValue(last, intty), length)
+        else:
+            data = array.value(builder)
+        return data, index.value(builder)
+
+    def generate_vector_load(self, array, index, count, aligned):
+        '''Load count consecutive elements of an array as a vector with one
+        instruction.
+        '''
+        if not isinstance(count, (int, long)) or count < 2:
+            raise InvalidCall(self.current_node,
+                              'vload() loads a constant number of at least '
+                              '2 elements.')
+        data, offset = self._vector_array_pointer(array, index, count)
+        vecty = vector_type(array.type.elemtype, int(count))
+        value = self._load_vector(data, offset, vecty, aligned)
+        return LLVMTempValue(value, vecty)
+
+    def generate_vector_store(self, array, index, vector, aligned):
+        vecty = vector.type
+        if (not isinstance(vecty, LLVMVector)
+            or not isinstance(array.type, LLVMUnboundedArray)
+            or vecty.elemtype != array.type.elemtype):
+            raise InvalidCall(self.current_node,
+                              'vstore() stores a vector to an array of the '
+                              'same element type.')
+        builder = self.builder
+        data, offset = self._vector_array_pointer(array, index,
+                                                  vecty.elemcount)
+        ptr = builder.bitcast(builder.gep(data, offset),
+                              llvm.TypeFactory.make_pointer(vecty.type()))
+        builder.store_aligned(vector.value(builder), ptr,
+                              self._vector_alignment(vecty, aligned))
+
+    def generate_shuffle(self, first, second, mask):
+        vecty = first.type
+        if not isinstance(vecty, LLVMVector):
+            raise InvalidCall(self.current_node, 'shuffle() of a non-vector.')
+        if second is not None and second.type != vecty:
+            raise InvalidCall(self.current_node,
+                              'shuffle() of vectors of different types.')
+        lanes = vecty.elemcount * (1 if second is None else 2)
+        if len(mask) < 2 or not all(isinstance(X, (int, long))
+                                    and 0 <= X < lanes for X in mask):
+            raise InvalidCall(self.current_node,
+                              'The mask of shuffle() must have at least 2 '
+                              'indices in [0, %d).' % lanes)
+        builder = self.builder
+        first = first.value(builder)
+        if second is None:
+            second = llvm.ConstantFactory.make_undef(vecty.type())
+        else:
+            second = second.value(builder)
+        value = builder.shuffle(first, second, [int(X) for X in mask])
+        return LLVMTempValue(value, vector_type(vecty.elemtype, len(mask)))
+
+    def generate_select(self, cond, on_true, on_false):
+        '''cond ? on_true : on_false without a branch. A vector of Bool
+        from a comparison of vectors selects by lane; a scalar condition
+        selects whole values.
+        '''
+        builder = self.builder
+        try:
+            if isinstance(on_false.type, LLVMVector): # maybe scalar on_true
+                ty = on_false.type.coerce(on_true.type)
+            else:
+                ty = on_true.type.coerce(on_false.type)
+            lanewise = (isinstance(cond.type, LLVMVector)
+                        and isinstance(cond.type.elemtype, LLVMBool))
+            if lanewise:
+                if not isinstance(ty, LLVMVector):
+                    ty = vector_type(ty, cond.type.elemcount)
+                elif ty.elemcount != cond.type.elemcount:
+                    raise TypeError('Mask of %d lanes for vectors of %d.'
+                                    % (cond.type.elemcount, ty.elemcount))
+                condval = cond.value(builder)
+            else:
+                condval = LLVMType(types.Bool).cast(cond, builder)
+            values = [ty.cast(X, builder) for X in (on_true, on_false)]
+        except TypeError as e:
+            raise InvalidCall(self.current_node, 'select(): %s' % e)
+        return LLVMTempValue(builder.select(condval, *values), ty)
+
+    def _declare_runtime(self, name, retty, argtys):
+        fn = self.jit_engine.make_function(name, retty, argtys)
+        if not fn.valid():
+            raise InternalError(self.current_node, self.jit_engine.last_error())
+        return fn
 
     def generate_boolop(self, op_class, lhs, rhs):
         bb_left = self.builder.get_basic_block()
@@ -318,11 +1908,26 @@ class LLVMCodeGenerator(CodeGenerationBase):
     def generate_array_slice(self, ptr, lower, upper=None, step=None):
         assert upper is None
         assert step is None
+        if isinstance(ptr.type, LLVMCheckedArray):
+            return self._generate_checked_slice(ptr, lower)
         ptr_val = ptr.value(self.builder)
         lower_val = lower.value(self.builder)
         offsetted = self.builder.gep(ptr_val, lower_val)
         return LLVMTempValue(offsetted, ptr.type)
 
+    def _generate_checked_slice(self, ptr, lower):
+        '''A[lower:] is a new descriptor. lower may equal the length.
+        '''
+        i64 = LLVMType(types.Int64)
+        data, length = self.checked_array_fields(ptr)
+        one = LLVMConstant(i64, 1).value(self.builder)
+        self._check_bounds(lower, i64.op_add(length, one, self.builder))
+        lower_val = i64.cast(lower, self.builder)
+        return self._new_checked_array(ptr.type,
+                                       self.builder.gep(data, lower_val),
+                                       i64.op_sub(length, lower_val,
+                                                  self.builder))
+
     @contextmanager
     def relocate_to_entry(self):
         # goto entry block
@@ -334,3 +1939,32 @@ class LLVMCodeGenerator(CodeGenerationBase):
 
     def ensure_boolean(self, value):
         return LLVMType(types.Bool).cast(value, self.builder)
+
+class LLVMReturnTypeInference(LLVMCodeGenerator):
+    '''Generates the function only to find the type of its return value.
+    The generated function returns void and must be discarded.
+    '''
+    def __init__(self, *args, **kwargs):
+        super(LLVMReturnTypeInference, self).__init__(*args, **kwargs)
+        self.return_types = []
+
+    def generate_return(self, value=None):
+        if value is not None:
+            self.return_types.append(value.type)
+        self.builder.ret_void()
+
+    def generate_call(self, fn, args):
+        if fn is self.function:
+            raise FunctionDeclarationError(
+                    self.current_node,
+                    ('Cannot infer the return type of a recursive function. '
+                     'Specify "ret" in the decorator.')
+                  )
+        return super(LLVMReturnTypeInference, self).generate_call(fn, args)
+
+    def return_type(self):
+        '''Returns the public type that all returned values coerce to.
+        '''
+        if not self.return_types:
+            return types.Void
+        return public_type(reduce(lambda X, Y: X.coerce(Y), self.return_types))
@@ -0,0 +1,56 @@
+# Copyright (c) 2012, Siu Kwan Lam
+# All rights reserved.
+#
+# Compiles functions on a background thread.
+#
+# All modules share one LLVM execution engine and context. Code generation
+# is serialized by module.compile_lock, so a single worker thread is enough.
+# The work of the worker overlaps with the Python code of other threads,
+# e.g. the rest of the imports during startup, but not with compilations on
+# other threads: they wait for the lock.
+#
+
+import sys
+import logging
+import threading
+import Queue
+
+from pymothoa.util.future import Future
+
+logger = logging.getLogger(__name__)
+
+class BackgroundCompiler(object):
+    def __init__(self):
+        self.queue = Queue.Queue()
+        self.thread = None
+        self.lock = threading.Lock()
+
+    def submit(self, fn, *args):
+        '''Schedule fn(*args) on the worker thread.
+        Returns a Future for the result.
+        '''
+        future = Future()
+        self._ensure_started()
+        self.queue.put((future, fn, args))
+        return future
+
+    def _ensure_started(self):
+        with self.lock:
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run,
+                                               name='pymothoa-compiler')
+                self.thread.daemon = True
+                self.thread.start()
+
+    def _run(self):
+        while True:
+            future, fn, args = self.queue.get()
+            try:
+                result = fn(*args)
+            except:
+                logger.debug('Background compilation failed', exc_info=True)
+                future.set_exception_info(sys.exc_info())
+            else:
+                future.set_result(result)
+
+the_compiler = BackgroundCompiler()
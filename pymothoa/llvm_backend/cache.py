@@ -0,0 +1,176 @@
+# Copyright (c) 2012, Siu Kwan Lam
+# All rights reserved.
+#
+# Content-addressed on-disk cache for the optimized bitcode of JIT functions.
+#
+# Each entry is a file named by the hash of everything that affects the
+# generated code. The least recently used entries are removed when the total
+# size of the cache directory exceeds the limit.
+#
+
+import os
+import errno
+import hashlib
+import logging
+import tempfile
+
+from pymothoa import types
+from types import (LLVMUnboundedArray, LLVMCheckedArray, LLVMNDArray,
+                   LLVMVector, LLVMStruct)
+
+logger = logging.getLogger(__name__)
+
+ENTRY_SUFFIX = '.bc'
+
+DEFAULT_MAX_SIZE = 64 * 1024 * 1024 # bytes
+
+def type_signature(ty):
+    '''Returns a string that uniquely identifies a LLVMType.
+    '''
+    if isinstance(ty, LLVMCheckedArray):
+        return 'CheckedArray(%s)' % type_signature(ty.elemtype)
+    elif isinstance(ty, LLVMUnboundedArray):
+        return 'Array(%s)' % type_signature(ty.elemtype)
+    elif isinstance(ty, LLVMNDArray):
+        return 'NDArray(%s, %d)' % (type_signature(ty.elemtype), ty.ndim)
+    elif isinstance(ty, LLVMVector):
+        return 'Vector(%s, %d)' % (type_signature(ty.elemtype), ty.elemcount)
+    elif isinstance(ty, LLVMStruct):
+        return 'Struct(%s)' % ','.join('%s:%s' % (name, type_signature(X))
+                                       for name, X in zip(ty.struct.names(),
+                                                          ty.fieldtys))
+    else:
+        return type(ty).__name__
+
+def python_type_signature(ty):
+    '''Returns a string that uniquely identifies a type of pymothoa.types,
+    e.g. a Struct or an alias of a type in the globals of a function.
+    None if ty is not a type.
+    '''
+    if isinstance(ty, types.Struct):
+        return 'Struct(%s)' % ','.join('%s:%s' % (name, python_type_signature(X))
+                                       for name, X in ty.fields)
+    elif isinstance(ty, types.NDArray):
+        return 'NDArray(%s, %d)' % (python_type_signature(ty.elemtype), ty.ndim)
+    elif isinstance(ty, types.Array):
+        return 'Array(%s)' % python_type_signature(ty.elemtype)
+    elif isinstance(ty, types.Type):
+        return type(ty).__name__
+    elif isinstance(ty, type) and issubclass(ty, types.Type):
+        return ty.__name__
+    else:
+        return None
+
+class CompilationCache(object):
+    def __init__(self, path, max_size=DEFAULT_MAX_SIZE):
+        '''
+        path -- Directory to store the cache entries. Created if missing.
+        max_size -- Maximum total size (in bytes) of the cache entries.
+        '''
+        self.path = os.path.abspath(os.path.expanduser(path))
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+        try:
+            os.makedirs(self.path)
+        except OSError as e:
+            if e.errno != errno.EEXIST:
+                raise
+
+    def key(self, *parts):
+        '''Returns the cache key for the given parts.
+        Each part is converted to a string.
+        '''
+        digest = hashlib.sha1()
+        for part in parts:
+            digest.update(str(part))
+            digest.update('\0')
+        return digest.hexdigest()
+
+    def _entry_path(self, key):
+        return os.path.join(self.path, key + ENTRY_SUFFIX)
+
+    def load(self, key):
+        '''Returns the cached data or None if it is not in the cache.
+        '''
+        path = self._entry_path(key)
+        try:
+            with open(path, 'rb') as fin:
+                data = fin.read()
+        except IOError:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        try: # refresh for the LRU eviction
+            os.utime(path, None)
+        except OSError:
+            pass
+        return data
+
+    def store(self, key, data):
+        # Write to a temporary file first so that concurrent processes
+        # never read a partially written entry.
+        fd, tmppath = tempfile.mkstemp(dir=self.path, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as fout:
+                fout.write(data)
+            os.rename(tmppath, self._entry_path(key))
+        except (IOError, OSError) as e:
+            logger.warning('Cannot write cache entry %s: %s', key, e)
+            try:
+                os.unlink(tmppath)
+            except OSError:
+                pass
+            return
+        self.evict()
+
+    def entries(self):
+        '''Returns a list of (mtime, size, path) of all cache entries.
+        '''
+        out = []
+        for name in os.listdir(self.path):
+            if not name.endswith(ENTRY_SUFFIX):
+                continue
+            path = os.path.join(self.path, name)
+            try:
+                st = os.stat(path)
+            except OSError: # removed by another process
+                continue
+            out.append((st.st_mtime, st.st_size, path))
+        return out
+
+    def size(self):
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self):
+        '''Remove the least recently used entries until the total size
+        is within the limit.
+        '''
+        entries = sorted(self.entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_size:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+            total -= size
+
+    def clear(self):
+        for _, _, path in self.entries():
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+    def stats(self):
+        entries = self.entries()
+        return {
+            'hits'    : self.hits,
+            'misses'  : self.misses,
+            'entries' : len(entries),
+            'size'    : sum(size for _, size, _ in entries),
+        }
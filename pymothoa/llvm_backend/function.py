@@ -3,21 +3,43 @@
 
 import logging
 import ast, inspect
+import itertools
+import operator
+import threading
+from time import time
 
 from pymothoa.util.descriptor import Descriptor, instanceof
+from pymothoa.util.profiling import timed, timer
+from instrument import BranchCounters
 from pymothoa.compiler_errors import FunctionDeclarationError
-from module import LLVMModule
+from module import LLVMModule, synchronized
 from backend import LLVMCodeGenerator
+from pymothoa.backend import is_parallel_loop, written_names
 from types import *
 
 logger = logging.getLogger(__name__)
 
+# Execution tiers of a function.
+TIER_PYTHON = 'python'          # Runs the Python code. Counts the calls.
+TIER_COMPILING = 'compiling'    # The native code is being compiled.
+TIER_NATIVE = 'native'          # Runs the native code.
+TIER_FAILED = 'failed'          # The compilation failed.
+
+# Default hotness thresholds of tiered functions.
+HOT_CALLS = 1000        # number of calls
+HOT_SECONDS = 0.1       # cumulative time spent in the Python code
+
+# Default number of specializations kept for functions with static arguments.
+MAX_SPECIALIZATIONS = 16
+
 class LLVMFunction(object):
     retty = Descriptor(constant=True)
     argtys = Descriptor(constant=True)
 
     code_llvm = Descriptor(constant=True)
 
+    requires_gil = False # Calls into the Python interpreter.
+
 class LLVMFuncDecl(LLVMFunction):
     def __init__(self, retty, argtys, module, fn_decl):
         self.retty = retty
@@ -28,11 +50,32 @@ class LLVMFuncDecl(LLVMFunction):
 class LLVMFuncDef(LLVMFunction):
     code_python = Descriptor(constant=True)
 
-    c_funcptr_type = Descriptor(constant=True)
-    c_funcptr = Descriptor(constant=True)
+    c_funcptr_type = Descriptor()
+    c_funcptr = Descriptor()
+    trampoline = Descriptor()
 
     manager = Descriptor(constant=True)
 
+    is_ret_bool = False
+    nogil = False   # The native code runs without holding the GIL.
+    compiled = False
+    written_args = frozenset()  # indices of the array arguments written to
+    boundscheck = False # The native code checks the indices of arrays.
+    check_bounds = None # Raises the index violation of the last call.
+    stats = None        # FunctionStats if the module is profiled
+    counters = None     # BranchCounters if the module is instrumented
+    branch_weights = None   # {probe key: weights} from the counters of a run
+    feedback = None     # the BranchCounters of the branch weights
+    pipeline = None     # PassPipeline; None uses the one of the module.
+    fastmath = frozenset()  # fast-math flags, see pymothoa.fastmath
+    constants = None    # {name: value} of the static arguments
+    outlined = ()       # helper functions generated for this function
+
+    tier = TIER_NATIVE
+    tier_error = None   # why the function failed to leave the Python tier
+    call_count = 0      # calls in the Python tier
+    python_time = 0.0   # seconds spent in the Python tier
+
     def __init__(self, fnobj, retty, argtys, module, fn_decl):
         self.code_python = fnobj
         self.retty = retty
@@ -40,75 +83,800 @@ class LLVMFuncDef(LLVMFunction):
         self.manager = module
         self.code_llvm = fn_decl
 
-    def compile(self):
-        from pymothoa.compiler_errors import CompilerError, wrap_by_function
+        self.c_funcptr_type = None
+        self.c_funcptr = None
+        self.trampoline = None
+        self.future = None # background compilation
 
+    def compile(self):
         func = self.code_python
         source = inspect.getsource(func)
+        self.generate(source, func.func_code.co_names, func.func_globals,
+                      errfunc=func)
+
+    def compile_async(self, fallback=False):
+        '''Compile the function on the background compiler thread.
+        Returns a Future (see pymothoa.util.future).
+
+        fallback -- If True, calls made before the compilation completes run
+                    the Python code. Otherwise, they wait for the compilation.
+
+        The compilation holds compile_lock (see LLVMModule.compile_async).
+        Compiling another function meanwhile waits for it.
+        '''
+        self.future = self.manager.compile_async(self.compile)
+        if fallback:
+            self._install_call(self._call_pending_fallback)
+        else:
+            self._install_call(self._call_pending)
+        return self.future
+
+    def enable_tiering(self, hot_calls=None, hot_seconds=None,
+                       background=True):
+        '''Run the Python code until the function is hot, then compile it.
+
+        hot_calls -- Compile after this number of calls.
+                     Defaults to HOT_CALLS.
+        hot_seconds -- Compile after this cumulative time in the Python code.
+                       Defaults to HOT_SECONDS.
+        background -- Compile on the background thread and keep running the
+                      Python code meanwhile.
+        '''
+        self.hot_calls = HOT_CALLS if hot_calls is None else hot_calls
+        self.hot_seconds = HOT_SECONDS if hot_seconds is None else hot_seconds
+        self.tier_background = background
+        self.call_count = 0
+        self.python_time = 0.0
+        self.tier = TIER_PYTHON
+        self._tier_lock = threading.Lock() # guards the counts and the tier
+        self._install_call(self._call_tiered)
+
+    def is_hot(self):
+        return (self.call_count >= self.hot_calls or
+                self.python_time >= self.hot_seconds)
+
+    def _call_tiered(self, *args):
+        start = time()
+        try:
+            return self.run_py(*args)
+        finally:
+            elapsed = time() - start
+            # Only the thread that leaves the Python tier promotes.
+            with self._tier_lock:
+                self.python_time += elapsed
+                self.call_count += 1
+                promote = self.tier == TIER_PYTHON and self.is_hot()
+                if promote:
+                    self._set_tier(TIER_COMPILING)
+            if promote:
+                self._promote()
 
-        logger.debug('Compiling function: %s', func.__name__)
+    def _promote(self):
+        '''Compile the function and switch to the native tier.
+        The Python code keeps running while it compiles in the background.
+        The tier is already TIER_COMPILING.
+        '''
+        if self.tier_background:
+            self.future = self.manager.compile_async(self.compile)
+            self.future.add_done_callback(self._promoted)
+        else:
+            try:
+                self.compile()
+            except Exception as e:
+                self._demote(e)
+            else:
+                self._promoted(None)
+
+    def _promoted(self, future):
+        if future is not None and future.exception() is not None:
+            self._demote(future.exception())
+            return
+        self.bind()
+        self._set_tier(TIER_NATIVE)
+
+    def _demote(self, error):
+        '''The compilation failed. Keep running the Python code.
+        '''
+        logger.warning('%s stays in the Python tier: %s',
+                       self.code_python.__name__, error)
+        self.tier_error = error
+        self._install_call(self.run_py)
+        self._set_tier(TIER_FAILED)
+
+    def _set_tier(self, tier):
+        old, self.tier = self.tier, tier
+        self.manager.notify_tier(self, old, tier)
+
+    def _call_pending(self, *args):
+        self.future.result() # raises the compiler error, if any
+        self.bind()
+        return self(*args)
+
+    def _call_pending_fallback(self, *args):
+        if not self.future.done():
+            return self.run_py(*args)
+        return self._call_pending(*args)
+
+    @synchronized
+    def generate(self, source, names, symbols, errfunc=None, inline=False):
+        '''Generate and optimize the code for the function from its source.
+
+        source -- Python source containing only the function definition.
+        names -- Global names referenced by the source.
+        symbols -- A dict containing global symbols for the function.
+        errfunc -- Python function for reporting the location of errors.
+        inline -- Inline calls to other JIT functions before optimizing.
+        '''
+        from pymothoa.compiler_errors import CompilerError, wrap_by_function
+
+        if self.compiled: # e.g. compiled by another thread meanwhile
+            return
+
+        name = self.code_python.__name__
 
         tree = ast.parse(source)
 
         assert type(tree).__name__=='Module'
         assert len(tree.body)==1
 
+        argnames = [X.id for X in tree.body[0].args.args
+                    if X.id not in (self.constants or ())] # static arguments
+        written = written_names(tree.body[0])
+        self.written_args = frozenset(i for i, X in enumerate(argnames)
+                                      if X in written)
+
+        # Functions with parallel loops release the GIL while they run.
+        if any(isinstance(X, ast.For) and is_parallel_loop(X, symbols)
+               for X in ast.walk(tree)):
+            self.nogil = True
+
+        # Calling a function that needs the interpreter needs it as well.
+        self.requires_gil = any(isinstance(symbols.get(X), LLVMFunction)
+                                and symbols[X].requires_gil
+                                for X in names)
+
+        # The addresses of the counters are constants of the code.
+        counters = None
+        if self.manager.instrument and self.branch_weights is None:
+            counters = BranchCounters(1 if errfunc is None else
+                                      inspect.getsourcelines(errfunc)[1])
+
+        cache = self.manager.cache
+        if cache is not None and counters is None:
+            cachekey = self._cache_key(source, names, symbols)
+            bitcode = cache.load(cachekey)
+            if bitcode is not None:
+                engine = self.manager.jit_engine
+                if engine.load_bitcode(self.code_llvm, bitcode):
+                    logger.debug('Loaded function from cache: %s', name)
+                    self.outlined = [engine.loaded_helper(i) for i in
+                                     range(engine.loaded_helper_count())]
+                    self.compiled = True
+                    self.manager.function_compiled(self)
+                    return
+                logger.warning('Ignoring invalid cache entry for %s: %s',
+                               name,
+                               self.manager.jit_engine.last_error())
+
+        logger.debug('Compiling function: %s', name)
+
         # Code generation for LLVM
         try:
             codegen = LLVMCodeGenerator(
                             self.code_llvm,
                             self.retty,
                             self.argtys,
-                            symbols=func.func_globals
+                            symbols=symbols,
+                            jit_engine=self.manager.jit_engine,
+                            nogil=self.nogil,
+                            boundscheck=self.boundscheck,
+                            first_line=(1 if errfunc is None else
+                                        inspect.getsourcelines(errfunc)[1]),
+                            fastmath=self.fastmath,
+                            constants=self.constants,
+                            counters=counters,
+                            branch_weights=self.branch_weights,
                         )
             codegen.visit(tree.body[0])
         except CompilerError as e:
             logger.exception(e)
-            raise wrap_by_function(e, func)
+            if errfunc is None:
+                raise
+            raise wrap_by_function(e, errfunc)
 
         self.code_llvm.verify()     # verify generated code
-        self.manager.jit_engine.optimize_function(self.code_llvm) # optimize generated code to reduce space
+        if counters is not None:
+            counters.allocate()
+            self.counters = counters
+        self.outlined = codegen.outlined
+        for fn in codegen.outlined:
+            fn.verify()
+            self.manager.optimize_function(fn, self.pipeline)
+        if inline:
+            self.manager.jit_engine.inline_calls(self.code_llvm)
+        self.manager.optimize_function(self.code_llvm, self.pipeline) # optimize generated code to reduce space
 
         logger.debug('Dump LLVM IR\n%s', self.code_llvm.dump())
 
+        if cache is not None and counters is None:
+            cache.store(cachekey, self.manager.jit_engine.dump_bitcode(self.code_llvm))
+
+        self.compiled = True
+        self.manager.function_compiled(self)
+
+    def _cache_key(self, source, names, symbols):
+        '''Everything that affects the generated code must be part of the key.
+        '''
+        from cache import type_signature, python_type_signature
+        from backend import LLVM_VERSION
+        import pymothoa
+        engine = self.manager.jit_engine
+        pipeline = self.pipeline or self.manager.pipeline
+
+        parts = [
+            pymothoa.__version__,
+            LLVM_VERSION,
+            source,
+            type_signature(self.retty),
+            ','.join(map(type_signature, self.argtys)),
+            self.manager.optlevel,
+            self.manager.vectorize,
+            self.boundscheck,
+            ','.join(sorted(self.fastmath)),
+            sorted((self.constants or {}).items()),
+            sorted((self.branch_weights or {}).items()),
+            pipeline.key() if pipeline is not None else None,
+            engine.target_triple(),
+            engine.target_cpu(),
+            engine.target_features(),
+        ]
+
+        # Numeric globals are folded into the code as constants, the
+        # signature of callees is baked into the call instructions and
+        # the types (e.g. structs and aliases) determine the layout.
+        for name in sorted(set(names)):
+            value = symbols.get(name)
+            if isinstance(value, (int, long, float)):
+                parts.append('%s=%r' % (name, value))
+            elif isinstance(value, LLVMFunction):
+                parts.append('%s:%s:%s(%s)' % (
+                                name,
+                                value.code_llvm.name(),
+                                type_signature(value.retty),
+                                ','.join(map(type_signature, value.argtys))))
+            else:
+                signature = python_type_signature(value)
+                if signature is not None:
+                    parts.append('%s:%s' % (name, signature))
+
+        return self.manager.cache.key(*parts)
+
     def assembly(self):
         return self.manager.dump_asm(self.code_llvm)
 
+    @synchronized
     def prepare_pointer_to_function(self):
         '''Obtain pointer to function from the JIT engine'''
+        self.manager.finalize()
         addr = self.manager.jit_engine.get_pointer_to_function(self.code_llvm)
         # Create binding with ctypes library
-        from ctypes import CFUNCTYPE, cast
+        # CFUNCTYPE releases the GIL during the call; PYFUNCTYPE holds it.
+        from ctypes import CFUNCTYPE, PYFUNCTYPE, cast
         c_argtys = map(lambda T: T.ctype(), self.argtys)
         c_retty = self.retty.ctype()
-        self.c_funcptr_type = CFUNCTYPE(c_retty, *c_argtys)
+        functype = PYFUNCTYPE if self.requires_gil else CFUNCTYPE
+        self.c_funcptr_type = functype(c_retty, *c_argtys)
         self.c_funcptr = cast( int(addr), self.c_funcptr_type )
+        self.arg_adaptors = map(self._argument_adaptor, range(len(self.argtys)))
+        if self.boundscheck:
+            self.check_bounds = self.manager.bounds_checker()
+        if self.manager.profiler is not None:
+            self.stats = self.manager.profiler.register(self)
+
+    @synchronized
+    def refresh_pointer(self):
+        '''Fetch the pointer again after the native code is recompiled.
+        '''
+        if self.c_funcptr is not None:
+            self.prepare_pointer_to_function()
+
+    def _argument_adaptor(self, i):
+        ty = self.argtys[i]
+        if isinstance(ty, (LLVMUnboundedArray, LLVMNDArray)):
+            return ty.adaptor(writable=i in self.written_args)
+        return ty.argument_adaptor
+
+    @synchronized
+    def bind(self):
+        '''Create the native binding to the function and route __call__ to
+        the fastest dispatcher available for its signature.
+        '''
+        from trampoline import build_trampoline
+        if self.c_funcptr is None:
+            self.prepare_pointer_to_function()
+
+        if self.boundscheck: # index violations are raised after the call
+            self.trampoline = None
+        else:
+            self.trampoline = build_trampoline(self)
+        if self.trampoline is not None:
+            if self.stats is not None:
+                self._install_call(timed(self.stats,
+                                         self.trampoline.function))
+            else:
+                self._install_call(self.trampoline.function)
+        else: # arrays are passed through ctypes
+            self._install_call(self.run_jit)
+
+    def _install_call(self, fn):
+        '''Use fn as the implementation of __call__ for this instance.
+
+        Special methods are looked up on the type. Installing fn on a
+        per-instance subclass avoids an extra Python frame for every call.
+        '''
+        base = self.__dict__.get('_call_base', type(self))
+        self._call_base = base
+        self.__class__ = type(base.__name__, (base,), {
+                            '__call__': staticmethod(fn),
+                         })
 
     def run_py(self, *args):
         return self.code_python(*args)
 
     def run_jit(self, *args):
         from itertools import izip
+        if self.c_funcptr is None: # Has not create binding to the function.
+            self.prepare_pointer_to_function()
+        if self.stats is not None:
+            return self._run_jit_profiled(args)
+
         # Cast the arguments to corresponding types
         argvals = []
-        for aty, aval in izip(self.argtys, args):
-            argvals.append(aty.argument_adaptor(aval))
+        for adaptor, aval in izip(self.arg_adaptors, args):
+            argvals.append(adaptor(aval))
 
+        retval = self.c_funcptr(*argvals)
+        if self.check_bounds is not None:
+            self.check_bounds()
+        return retval
+
+    def _run_jit_profiled(self, args):
+        from itertools import izip
+        start = timer()
+        argvals = [adaptor(aval)
+                   for adaptor, aval in izip(self.arg_adaptors, args)]
+        marshalled = timer()
         try:
             retval = self.c_funcptr(*argvals)
-        except AttributeError: # Has not create binding to the function.
-            self.prepare_pointer_to_function()
-            # Call the function
-            retval = self.c_funcptr(*argvals)
-
+        finally:
+            self.stats.add(timer() - marshalled, marshalled - start)
+        if self.check_bounds is not None:
+            self.check_bounds()
         return retval
 
-    __call__ = run_jit
+    def __call__(self, *args):
+        # First call. Later calls go directly to the installed dispatcher.
+        self.bind()
+        return self(*args)
+
+    @synchronized
+    def recompile_with_profile(self):
+        '''Generate the code again with the branch weights measured by the
+        counters of the instrumented function, and without the counters.
+        Functions that were already called switch to the new native code.
+        '''
+        if self.counters is None:
+            raise RuntimeError('%s is not instrumented.'
+                               % self.code_python.__name__)
+        # Callers that inlined the instrumented code still use the counters.
+        self.feedback = self.counters
+        self.branch_weights = self.counters.weights()
+        self.counters = None
+
+        engine = self.manager.jit_engine
+        self.code_llvm.delete_body()
+        for helper in self.outlined: # used only by the old body
+            engine.free_function(helper)
+        self.outlined = ()
+        self.compiled = False
+        self.compile()
+        self.manager.finalize()
+        self.manager._recompile([self])
+
+    @synchronized
+    def free(self):
+        '''Free the native code of the function and remove it from the
+        module. Returns False if it is still called by other functions.
+        The function cannot be called afterward.
+        '''
+        if not self.manager.free_function(self):
+            return False
+        self.c_funcptr = None
+        self.trampoline = None
+        self._install_call(self._call_freed)
+        return True
+
+    def _call_freed(self, *args):
+        raise RuntimeError('%s has been freed.' % self.code_python.__name__)
 
 class LLVMFuncDef_BoolRet(LLVMFuncDef):
+    is_ret_bool = True
+
     def run_jit(self, *args):
         retval = super(LLVMFuncDef_BoolRet, self).run_jit(*args)
         # workaround for boolean return type
         return bool(retval)
 
+class LLVMUFuncDef(LLVMFuncDef):
+    '''Maps a scalar JIT function over arrays in a single native call.
+
+    The generated function takes an array for each argument of the kernel,
+    an output array and the number of elements. The kernel is inlined into
+    the loop so that LLVM can vectorize it.
+    '''
+    kernel = Descriptor(constant=True)
+
+    MAP_TEMPLATE = '''def %(name)s(%(args)s):
+    for i in xrange(n):
+        out[i] = kernel(%(elems)s)
+'''
+
+    def __init__(self, kernel, retty, argtys, module, fn_decl):
+        super(LLVMUFuncDef, self).__init__(kernel.code_python, retty, argtys,
+                                           module, fn_decl)
+        self.kernel = kernel
+
+    def compile(self):
+        argnames = ['arg%d' % i for i in range(len(self.kernel.argtys))]
+        source = self.MAP_TEMPLATE % {
+            'name'  : self.code_python.__name__,
+            'args'  : ', '.join(argnames + ['out', 'n']),
+            'elems' : ', '.join('%s[i]' % X for X in argnames),
+        }
+        self.generate(source, ['kernel'], {'kernel': self.kernel}, inline=True)
+
+    def _cache_key(self, source, names, symbols):
+        # The body of the kernel is inlined.
+        kernel = self.kernel.code_python
+        source += inspect.getsource(kernel)
+        names = list(names) + list(kernel.func_code.co_names)
+        symbols = dict(kernel.func_globals, **symbols)
+        return super(LLVMUFuncDef, self)._cache_key(source, names, symbols)
+
+    def _prepare_arguments(self, args, kwargs):
+        out = kwargs.pop('out', None)
+        if kwargs:
+            raise TypeError('Unexpected keyword arguments: %s'
+                            % ', '.join(kwargs.keys()))
+
+        if len(args) != len(self.kernel.argtys):
+            raise TypeError('%s() takes exactly %d arguments' % (
+                                self.code_python.__name__,
+                                len(self.kernel.argtys)))
+        n = len(args[0])
+        for arg in args[1:]:
+            if len(arg) != n:
+                raise ValueError('Input arrays have different lengths.')
+
+        if out is None:
+            out = self._new_output(args[0], n)
+        elif len(out) < n:
+            raise ValueError('Output array is too short.')
+        return out, n
+
+    def _new_output(self, like, n):
+        '''Allocate an output array of the same kind as the input.
+        numpy.ndarray for numpy.ndarray inputs; otherwise, array.array.
+        '''
+        ctype = self.kernel.retty.ctype()
+        try:
+            import numpy
+        except ImportError:
+            pass
+        else:
+            if isinstance(like, numpy.ndarray):
+                return numpy.empty(n, dtype=ctype)
+        from array import array
+        from types import _ctype_to_array_type_code
+        return array(_ctype_to_array_type_code[ctype], [0]) * n
+
+    def run_py(self, *args, **kwargs):
+        out, n = self._prepare_arguments(args, kwargs)
+        kernel = self.kernel.run_py
+        for i in xrange(n):
+            out[i] = kernel(*[arg[i] for arg in args])
+        return out
+
+    def run_jit(self, *args, **kwargs):
+        out, n = self._prepare_arguments(args, kwargs)
+        super(LLVMUFuncDef, self).run_jit(*(args + (out, n)))
+        return out
+
     __call__ = run_jit
+
+class LLVMLazyFuncDef(object):
+    '''A function without declared types.
+
+    Each call infers the argument types from the values and compiles a
+    specialization for them on first use. Later calls with the same types
+    dispatch to the compiled specialization directly.
+    '''
+    code_python = Descriptor(constant=True)
+    manager = Descriptor(constant=True)
+
+    def __init__(self, fnobj, ret, module, nogil=False, pipeline=None,
+                 fastmath=None):
+        '''
+        ret -- Public return type or None to infer it from the code.
+        pipeline -- PassPipeline of the specializations.
+        fastmath -- Fast-math flags of the specializations.
+        '''
+        self.code_python = fnobj
+        self.ret = ret
+        self.manager = module
+        self.nogil = nogil
+        self.pipeline = pipeline
+        self.fastmath = fastmath
+        self.specializations = {}   # type keys -> LLVMFuncDef
+        self._inferring = set()
+
+    def __call__(self, *args):
+        argtys = map(typeof, args)
+        try:
+            fn = self.specializations[tuple(map(type_key, argtys))]
+        except KeyError:
+            fn = self.specialize(argtys)
+        return fn(*args)
+
+    def run_py(self, *args):
+        return self.code_python(*args)
+
+    def is_inferring(self, argtys):
+        '''Returns True if the return type of the specialization for argtys
+        is being inferred.
+        '''
+        return tuple(map(type_key, argtys)) in self._inferring
+
+    @synchronized
+    def specialize(self, argtys):
+        '''Returns the specialization for the list of public argument types.
+        Compiles it if necessary.
+        '''
+        key = tuple(map(type_key, argtys))
+        try:
+            return self.specializations[key]
+        except KeyError:
+            pass
+
+        func = self.code_python
+        argct = func.func_code.co_argcount
+        if len(argtys) != argct:
+            raise TypeError('%s() takes exactly %d arguments (%d given)' % (
+                                func.__name__, argct, len(argtys)))
+
+        ret = self.ret
+        if ret is None:
+            self._inferring.add(key)
+            try:
+                ret = self._infer_return_type(argtys)
+            finally:
+                self._inferring.discard(key)
+
+        suffix = ','.join(map(self._type_name, argtys))
+        logger.debug('Specializing %s[%s]', func.__name__, suffix)
+        fn = self.manager.new_function(func, ret, argtys, nogil=self.nogil,
+                                       suffix=suffix, pipeline=self.pipeline,
+                                       fastmath=self.fastmath)
+        self.specializations[key] = fn # visible to recursive calls
+        try:
+            fn.compile()
+        except:
+            del self.specializations[key]
+            raise
+        return fn
+
+    @staticmethod
+    def _type_name(ty):
+        if isinstance(ty, types.Array):
+            return 'Array(%s)' % ty.elemtype.__name__
+        if isinstance(ty, types.NDArray):
+            return 'NDArray(%s, %d)' % (ty.elemtype.__name__, ty.ndim)
+        return ty.__name__
+
+    def _infer_return_type(self, argtys):
+        from pymothoa.compiler_errors import CompilerError, wrap_by_function
+        from backend import LLVMReturnTypeInference
+
+        func = self.code_python
+        engine = self.manager.jit_engine
+
+        # Same workaround for boolean arguments as the real function.
+        llvm_argtys = [LLVMType(types.Int8) if X is types.Bool
+                       else self.manager.argument_type(X)
+                       for X in argtys]
+        name = '%s.%s.infer' % (func.func_globals['__name__'], func.__name__)
+        fn_decl = engine.make_function(name,
+                                       LLVMType(types.Void).type(),
+                                       [X.type() for X in llvm_argtys])
+
+        tree = ast.parse(inspect.getsource(func))
+        codegen = LLVMReturnTypeInference(
+                        fn_decl,
+                        LLVMType(types.Void),
+                        llvm_argtys,
+                        symbols=func.func_globals,
+                        jit_engine=engine,
+                        nogil=self.nogil,
+                        boundscheck=self.manager.boundscheck,
+                    )
+        try:
+            codegen.visit(tree.body[0])
+        except CompilerError as e:
+            logger.exception(e)
+            raise wrap_by_function(e, func)
+        finally: # discard the generated code
+            engine.delete_function(fn_decl)
+            for fn in codegen.outlined:
+                engine.delete_function(fn)
+
+        ret = codegen.return_type()
+        logger.debug('Inferred return type of %s: %s', func.__name__, ret.__name__)
+        return ret
+
+class LLVMStaticFuncDef(object):
+    '''A function with static arguments.
+
+    The static arguments are compile-time constants. Each call compiles a
+    specialization for the values of the static arguments on first use.
+    The values are folded into its code, so that loops over them can be
+    unrolled. The specializations do not take the static arguments.
+
+    At most max_specializations are kept. Compiling another one frees the
+    native code of the least recently used one. Specializations that are
+    called by other JIT functions or that are running on other threads are
+    kept; the limit may then be exceeded.
+    '''
+    code_python = Descriptor(constant=True)
+    manager = Descriptor(constant=True)
+
+    def __init__(self, fnobj, ret, argtys, static, module, nogil=False,
+                 pipeline=None, fastmath=None, max_specializations=None):
+        '''
+        argtys -- Public types of all arguments, including the static ones.
+        static -- Names of the static arguments. Their types must be integer
+                  or floating-point types.
+        '''
+        self.code_python = fnobj
+        self.manager = module
+        self.ret = ret
+        self.argtys = list(argtys)
+        self.nogil = nogil
+        self.pipeline = pipeline
+        self.fastmath = fastmath
+        if max_specializations is None:
+            max_specializations = MAX_SPECIALIZATIONS
+        if max_specializations < 1:
+            raise ValueError('max_specializations must be positive.')
+        self.max_specializations = max_specializations
+
+        code = fnobj.func_code
+        argnames = code.co_varnames[:code.co_argcount]
+        if len(argnames) != len(self.argtys):
+            raise TypeError('%s() takes %d arguments but %d types are given.'
+                            % (fnobj.__name__, len(argnames), len(self.argtys)))
+        unknown = set(static).difference(argnames)
+        if unknown:
+            raise TypeError('%s() has no argument %s.'
+                            % (fnobj.__name__, ', '.join(sorted(unknown))))
+        self.static_indices = tuple(i for i, X in enumerate(argnames)
+                                    if X in static)
+        self.dynamic_indices = tuple(i for i, X in enumerate(argnames)
+                                     if X not in static)
+        self.static_names = tuple(argnames[i] for i in self.static_indices)
+        for i in self.static_indices:
+            ty = self.argtys[i]
+            if not (type(ty) is type and
+                    issubclass(ty, (types.GenericInt, types.GenericReal))):
+                raise TypeError('Static argument %s must be of an integer or '
+                                'floating-point type.' % argnames[i])
+
+        self.specializations = {}   # static values -> LLVMFuncDef
+        self._last_used = {}        # static values -> clock
+        self._clock = itertools.count()
+        self._active = {}           # static values -> calls in progress
+        # Guards the state above. Taken inside compile_lock, never the
+        # other way around.
+        self._lock = threading.Lock()
+
+    def key(self, values):
+        '''Returns the key of the specialization for the values of the static
+        arguments. Raises TypeError for a non-integral value of an integer
+        argument.
+        '''
+        key = []
+        for i, value in zip(self.static_indices, values):
+            if issubclass(self.argtys[i], types.GenericInt):
+                key.append(operator.index(value))
+            else:
+                key.append(float(value))
+        return tuple(key)
+
+    def __call__(self, *args):
+        if len(args) != len(self.argtys):
+            raise TypeError('%s() takes exactly %d arguments (%d given)' % (
+                                self.code_python.__name__, len(self.argtys),
+                                len(args)))
+        key = self.key([args[i] for i in self.static_indices])
+        fn = self._acquire(key)
+        try:
+            return fn(*[args[i] for i in self.dynamic_indices])
+        finally:
+            with self._lock:
+                self._active[key] -= 1
+                if not self._active[key]:
+                    del self._active[key]
+
+    def _acquire(self, key):
+        '''Returns the specialization for the key and marks a call of it in
+        progress, so that it is not freed until the call returns.
+        '''
+        while True:
+            with self._lock:
+                fn = self.specializations.get(key)
+                if fn is not None:
+                    self._last_used[key] = next(self._clock)
+                    self._active[key] = self._active.get(key, 0) + 1
+                    return fn
+            # Another thread may evict it before it is marked. Try again.
+            self.specialize(key)
+
+    def run_py(self, *args):
+        return self.code_python(*args)
+
+    @synchronized
+    def specialize(self, key):
+        '''Returns the specialization for a key (see key()).
+        Compiles it if necessary.
+        '''
+        with self._lock:
+            if key in self.specializations:
+                return self.specializations[key]
+
+        self._evict(self.max_specializations - 1)
+
+        func = self.code_python
+        suffix = ','.join('%s=%r' % X for X in zip(self.static_names, key))
+        logger.debug('Specializing %s[%s]', func.__name__, suffix)
+        fn = self.manager.new_function(
+                    func, self.ret,
+                    [self.argtys[i] for i in self.dynamic_indices],
+                    nogil=self.nogil, suffix=suffix, pipeline=self.pipeline,
+                    fastmath=self.fastmath,
+                    constants=dict(zip(self.static_names, key)))
+        with self._lock:
+            self.specializations[key] = fn # visible to recursive calls
+            self._last_used[key] = next(self._clock)
+        try:
+            fn.compile()
+        except:
+            with self._lock:
+                del self.specializations[key]
+                del self._last_used[key]
+            raise
+        return fn
+
+    def _evict(self, size):
+        '''Free the least recently used specializations until at most size
+        are left. Specializations with calls in progress are kept.
+        '''
+        with self._lock:
+            for key in sorted(self.specializations, key=self._last_used.get):
+                if len(self.specializations) <= size:
+                    break
+                if key in self._active:
+                    continue
+                fn = self.specializations[key]
+                if fn.free():
+                    logger.debug('Freed %s', fn.code_python.__name__)
+                    del self.specializations[key]
+                    del self._last_used[key]
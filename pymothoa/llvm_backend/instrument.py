@@ -0,0 +1,96 @@
+# Copyright (c) 2012, Siu Kwan Lam
+# All rights reserved.
+#
+# Counters of the conditional branches of the generated code.
+#
+# An instrumented function increments a native counter on each side of the
+# branch of every if-statement, while-loop and for-range loop. The counts are
+# read from Python after a run and fed back as branch weights ("!prof"
+# metadata) when the function is generated again:
+#
+#   module = JITModule('kernels', modargs={'instrument': True})
+#   ...run a representative workload...
+#   module.recompile_with_profile()
+#
+# The counters are not atomic and the bodies of prange loops are not
+# instrumented.
+#
+
+import ctypes
+from collections import namedtuple
+
+IF = 'if'           # taken: the if-branch; not taken: the else-branch
+WHILE = 'while'     # taken: an iteration; not taken: the exit
+FOR = 'for'         # taken: an iteration; not taken: the exit
+
+# Branch weights are 32-bit. Larger counts are scaled down.
+MAX_WEIGHT = 2**30
+
+BranchCount = namedtuple('BranchCount', ['kind', 'line', 'taken', 'not_taken'])
+
+def probe_key(kind, node):
+    '''Identifies a construct of the source across code generations.
+    '''
+    return (kind, node.lineno, node.col_offset)
+
+def branch_weights(taken, not_taken):
+    '''Returns the weights of a branch from its counts. A side that was
+    never taken keeps a small weight.
+    '''
+    scale = max(1, (max(taken, not_taken) + MAX_WEIGHT - 1) // MAX_WEIGHT)
+    return (int(taken // scale) + 1, int(not_taken // scale) + 1)
+
+class BranchCounters(object):
+    '''The counters of a function.
+
+    The generated code loads the address of the counter buffer from a cell
+    whose address is a constant of the code. The buffer is allocated when
+    the number of probes is known, after the code generation.
+    '''
+    def __init__(self, first_line=1):
+        '''
+        first_line -- Line number of the source in its file. For reporting.
+        '''
+        self.first_line = first_line
+        self.probes = []    # probe keys in the order of their slots
+        self.slots = {}     # probe key -> index of the probe
+        self.cell = ctypes.c_void_p()
+        self.buffer = None
+
+    def probe(self, key):
+        '''Returns the index of a probe. Its counters are at 2 * index
+        (taken) and 2 * index + 1 (not taken).
+        '''
+        try:
+            return self.slots[key]
+        except KeyError:
+            self.probes.append(key)
+            return self.slots.setdefault(key, len(self.probes) - 1)
+
+    def allocate(self):
+        self.buffer = (ctypes.c_uint64 * max(1, 2 * len(self.probes)))()
+        self.cell.value = ctypes.addressof(self.buffer)
+
+    def counts(self):
+        '''Returns a BranchCount for each probe in the order of the source.
+        '''
+        counts = []
+        for i, (kind, lineno, _) in enumerate(self.probes):
+            counts.append(BranchCount(kind, self.first_line + lineno - 1,
+                                      self.buffer[2 * i],
+                                      self.buffer[2 * i + 1]))
+        return sorted(counts, key=lambda X: X.line)
+
+    def reset(self):
+        ctypes.memset(self.buffer, 0, ctypes.sizeof(self.buffer))
+
+    def weights(self):
+        '''Returns a dict of probe key -> branch weights of the probes that
+        were reached.
+        '''
+        weights = {}
+        for i, key in enumerate(self.probes):
+            taken, not_taken = self.buffer[2 * i], self.buffer[2 * i + 1]
+            if taken or not_taken:
+                weights[key] = branch_weights(taken, not_taken)
+        return weights
@@ -0,0 +1,59 @@
+# Copyright (c) 2012, Siu Kwan Lam
+# All rights reserved.
+#
+# LLVM intrinsics of the functions of math.h (see pymothoa.builtins.math).
+#
+# A call to a libm function declared with declare_builtin is an opaque call
+# that blocks the optimizations. Where LLVM has an intrinsic for the
+# function, the call is emitted as the intrinsic instead; the optimizer
+# folds it and vectorizes it. The intrinsics also take vectors; the code
+# generator expands those that the target has no instruction for into a call
+# per lane.
+#
+
+# libm function (the double version) -> (intrinsic, first version of LLVM
+# as 100 * major + minor)
+INTRINSICS = {
+    'sqrt'  : ('llvm.sqrt',  300),
+    'sin'   : ('llvm.sin',   300),
+    'cos'   : ('llvm.cos',   300),
+    'pow'   : ('llvm.pow',   300),
+    'exp'   : ('llvm.exp',   300),
+    'exp2'  : ('llvm.exp2',  300),
+    'log'   : ('llvm.log',   300),
+    'log2'  : ('llvm.log2',  300),
+    'log10' : ('llvm.log10', 300),
+    'fma'   : ('llvm.fma',   300),
+    'fabs'  : ('llvm.fabs',  302),
+    'floor' : ('llvm.floor', 303),
+    'ceil'  : ('llvm.ceil',  303),
+}
+
+# libm functions of pymothoa.builtins.math that map to the same function of
+# each lane of a vector
+LIBM = frozenset(['sin', 'cos', 'tan', 'asin', 'acos', 'atan', 'sinh', 'cosh',
+                  'tanh', 'sqrt', 'pow', 'exp', 'exp2', 'log', 'log2', 'log10',
+                  'fabs', 'ceil', 'floor', 'fmod', 'fma'])
+
+def math_function(name):
+    '''Returns the libm function (the double version) of a float or double
+    function of math.h, e.g. "sqrt" for "sqrtf". None for other names.
+    '''
+    if name in LIBM:
+        return name
+    if name.endswith('f') and name[:-1] in LIBM:
+        return name[:-1]
+    return None
+
+def intrinsic_name(function, suffix, version):
+    '''Returns the name of the intrinsic of a libm function for operands of
+    the type suffix (e.g. "f32" or "v4f64"), or None if there is no
+    intrinsic in this version of LLVM.
+    '''
+    try:
+        name, since = INTRINSICS[function]
+    except KeyError:
+        return None
+    if version < since:
+        return None
+    return '%s.%s' % (name, suffix)
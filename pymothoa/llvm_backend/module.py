@@ -5,39 +5,345 @@
 # linked with the callee module. Or, a function pointer is brought from the callee
 # to the caller. (Any alternative?)
 #
+import os
 import logging
+import threading
+import functools
 logger = logging.getLogger()
 
 from pymothoa import types
 from pymothoa.util.descriptor import Descriptor, instanceof
-from types import LLVMType
+from pymothoa.pipeline import PassPipeline
+from pymothoa.fastmath import fastmath_flags
+from types import LLVMType, LLVMUnboundedArray, LLVMStruct, checked_array
 import llvm # binding
 
+# Calls to functions of at most this number of instructions are inlined when
+# a module is finalized.
+INLINE_THRESHOLD = 100
+
+# The execution engine and the LLVM context are shared by all modules.
+# Every use of LLVM that may run concurrently with background compilation
+# must hold this lock.
+compile_lock = threading.RLock()
+
+def synchronized(fn):
+    '''Decorator for holding compile_lock during the call.
+    '''
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        with compile_lock:
+            return fn(*args, **kwargs)
+    return wrapper
+
+def set_target(cpu=None, features=()):
+    '''Select the CPU and the features (e.g. ['+avx', '-fma']) of the native
+    code. Defaults to the host CPU, or $PYMOTHOA_CPU and
+    $PYMOTHOA_CPU_FEATURES (comma separated) if they are set.
+
+    The execution engine is shared by all modules. This must be called
+    before the first module is created (pymothoa.jit creates one).
+    '''
+    if not llvm.JITEngine.set_target(cpu or '', ','.join(features)):
+        raise RuntimeError('Cannot change the target after the first module '
+                           'is created.')
+
+def _default_target():
+    cpu = os.environ.get('PYMOTHOA_CPU')
+    features = os.environ.get('PYMOTHOA_CPU_FEATURES')
+    if cpu or features:
+        # Ignored if the execution engine exists.
+        llvm.JITEngine.set_target(cpu or '', features or '')
+
 class LLVMModule(object):
     jit_engine = Descriptor(constant=True)
 
-    def __init__(self, name, optlevel=3, vectorize=True):
+    def __init__(self, name, optlevel=3, vectorize=True,
+                 cache=None, cache_size=None, boundscheck=False,
+                 pipeline=None, finalize=True,
+                 inline_threshold=INLINE_THRESHOLD, profile=None,
+                 instrument=False):
+        '''
+        cache -- A directory or a CompilationCache for storing the optimized
+                 bitcode of compiled functions across processes.
+                 Defaults to $PYMOTHOA_CACHE_DIR if it is set.
+        cache_size -- Maximum size of the cache directory in bytes.
+        boundscheck -- Check the indices of array accesses. Functions pass
+                       the lengths of arrays along with the pointers and
+                       raise IndexError on a violation.
+        pipeline -- Default PassPipeline (or optimization level or list of
+                    pass names) for the functions of this module.
+                    Defaults to the function passes of optlevel.
+        finalize -- Finalize the module automatically before the first
+                    native call of each newly compiled function.
+                    See finalize().
+        inline_threshold -- Size limit of the callees inlined by finalize().
+                            Negative inlines all calls.
+        profile -- Count the calls and measure the time of the native code
+                   of each function. See pymothoa.util.profiling.
+                   Defaults to True if $PYMOTHOA_PROFILE is set.
+        instrument -- Count the branches of the if-statements and the loops
+                      of the functions in their native code.
+                      See recompile_with_profile().
+        '''
+        _default_target()
         self.jit_engine = llvm.JITEngine(name, optlevel, vectorize)
+        self.optlevel = optlevel
+        self.vectorize = vectorize
+        self.boundscheck = boundscheck
+        self._bounds_checker = None
+        self.pipeline = PassPipeline.coerce(pipeline)
+        self._pipelines = {} # PassPipeline -> llvm.PassPipeline
+        self.auto_finalize = finalize
+        self.instrument = instrument
+        self.inline_threshold = inline_threshold
+        self.functions = []     # compiled functions, callees first
+        self._unfinalized = []  # compiled since the last finalize()
+
+        from cache import CompilationCache, DEFAULT_MAX_SIZE
+        if cache is None:
+            cache = os.environ.get('PYMOTHOA_CACHE_DIR')
+        if cache is not None and not isinstance(cache, CompilationCache):
+            cache = CompilationCache(cache, cache_size or DEFAULT_MAX_SIZE)
+        self.cache = cache
+
+        if profile is None:
+            profile = bool(os.environ.get('PYMOTHOA_PROFILE'))
+        if profile:
+            from pymothoa.util.profiling import Profiler
+            self.profiler = Profiler()
+        else:
+            self.profiler = None
+
+        self.pending = [] # futures of background compilations
+        self.tier_listeners = []
+
+    def compile_async(self, fn, *args):
+        '''Call fn(*args) on the background compiler thread.
+        Returns a Future.
+
+        The code generation holds compile_lock since all modules share the
+        LLVM context. The background compiler only frees the calling thread
+        from waiting: a compile() or a specialization on another thread
+        waits for the job that is running, and the jobs run one at a time.
+        '''
+        from background import the_compiler
+        if not self.jit_engine.is_multithreaded():
+            self.jit_engine.start_multithreaded()
+        future = the_compiler.submit(fn, *args)
+        self.pending.append(future)
+        return future
+
+    def wait(self):
+        '''Wait for all background compilations of this module.
+        '''
+        for future in self.pending:
+            future.wait()
+        self.pending = []
+
+    def add_tier_listener(self, listener):
+        '''Call listener(function, old_tier, new_tier) when a tiered function
+        of this module changes its tier.
+        '''
+        self.tier_listeners.append(listener)
+
+    def remove_tier_listener(self, listener):
+        self.tier_listeners.remove(listener)
+
+    def notify_tier(self, fn, old, new):
+        logger.info('%s: tier %s -> %s', fn.code_python.__name__, old, new)
+        for listener in list(self.tier_listeners):
+            listener(fn, old, new)
 
     def optimize(self):
-        self.jit_engine.optimize()
+        '''Run the module passes over all functions. Functions that were
+        already called are recompiled.
+        '''
+        self.wait()
+        with compile_lock:
+            self.jit_engine.optimize()
+            self._unfinalized = []
+            self._recompile(self.functions)
+
+    @synchronized
+    def function_compiled(self, fn):
+        '''Called by LLVMFuncDef after generating the code of fn.
+        '''
+        if fn not in self.functions: # generated again
+            self.functions.append(fn)
+        self._unfinalized.append(fn)
+
+    @synchronized
+    def finalize(self, force=False):
+        '''Optimize across the functions compiled since the last call.
+
+        Infers the attributes of the functions from their callees, inlines
+        the calls to small functions (see inline_threshold) and optimizes
+        the callers again with their own pipelines. Unlike optimize(), the
+        code of the other functions is left as is.
+
+        Called before the first native call of every function unless the
+        module is created with finalize=False. Use force=True to finalize
+        such a module.
+        '''
+        if not (self.auto_finalize or force) or not self._unfinalized:
+            return
+        engine = self.jit_engine
+        engine.optimize_interprocedural()
+        changed = []
+        # Callees are compiled before their callers and are finalized first.
+        for fn in self._unfinalized:
+            threshold = self.inline_threshold
+            if fn.pipeline is not None and fn.pipeline.inline_threshold is not None:
+                threshold = fn.pipeline.inline_threshold
+            if engine.inline_calls(fn.code_llvm, threshold):
+                self.optimize_function(fn.code_llvm, fn.pipeline)
+                changed.append(fn)
+        self._unfinalized = []
+        self._recompile(changed)
+
+    @synchronized
+    def recompile_with_profile(self):
+        '''Generate the instrumented functions again with the branch weights
+        of their counters. Callees are generated before their callers so
+        that the callers inline the new code.
+        '''
+        for fn in list(self.functions):
+            if fn.counters is not None:
+                fn.recompile_with_profile()
+
+    @synchronized
+    def free_function(self, fn):
+        '''Free the native code of a compiled function and remove it from
+        the module. Returns False if other functions still use it.
+        '''
+        engine = self.jit_engine
+        trampoline = fn.trampoline
+        users = 0 if trampoline is None else 1
+        if engine.count_uses(fn.code_llvm) > users:
+            return False
+        if trampoline is not None:
+            engine.free_function(trampoline.code_llvm)
+        if not engine.free_function(fn.code_llvm):
+            raise RuntimeError(engine.last_error())
+        for helper in fn.outlined: # used only by fn
+            engine.free_function(helper)
+        for functions in (self.functions, self._unfinalized):
+            if fn in functions:
+                functions.remove(fn)
+        return True
+
+    def _recompile(self, functions):
+        '''Regenerate the native code of the functions that were already
+        called and refresh their pointers.
+        '''
+        for fn in functions:
+            if self.jit_engine.recompile_function(fn.code_llvm):
+                logger.debug('Recompiled %s', fn.code_llvm.name())
+                fn.refresh_pointer()
 
+    @synchronized
+    def native_pipeline(self, pipeline):
+        '''Returns the llvm.PassPipeline for a PassPipeline.
+        Raises ValueError for passes that cannot be run on a function.
+        '''
+        try:
+            return self._pipelines[pipeline]
+        except KeyError:
+            pass
+        native = llvm.PassPipeline(pipeline.optlevel)
+        native.set_vectorize(pipeline.vectorize)
+        if pipeline.unroll_threshold is not None:
+            native.set_unroll_threshold(pipeline.unroll_threshold)
+        if pipeline.inline_threshold is not None:
+            native.set_inline_threshold(pipeline.inline_threshold)
+        for name in pipeline.passes:
+            if not native.add_pass(name):
+                raise ValueError(native.last_error())
+        self._pipelines[pipeline] = native
+        return native
+
+    @synchronized
+    def optimize_function(self, fn, pipeline=None):
+        '''Optimize a single function with the pipeline.
+        Uses the pipeline of the module if it is None.
+        '''
+        pipeline = pipeline or self.pipeline
+        if pipeline is None:
+            self.jit_engine.optimize_function(fn)
+        else:
+            self.jit_engine.run_pipeline(fn, self.native_pipeline(pipeline))
+
+    @synchronized
     def verify(self):
         self.jit_engine.verify()
 
+    @synchronized
     def dump_asm(self, fn):
         return self.jit_engine.dump_asm(fn)
 
+    @synchronized
     def dump(self):
         return self.jit_engine.dump()
 
-    def _new_func_def_or_decl(self, ret, args, name_or_func):
+    @synchronized
+    def emit_object(self, path, cpu=None, features=(), symbol_suffix=''):
+        '''Write the native code of the module to an object file.
+
+        cpu, features -- Target of the code. Each defaults to that of the
+                         JIT; the features of the JIT are used only with
+                         the CPU of the JIT.
+        symbol_suffix -- Appended to the names of the exported functions.
+        '''
+        self.finalize()
+        if not self.jit_engine.emit_object(path, cpu or '', ','.join(features),
+                                           symbol_suffix):
+            raise RuntimeError('Cannot emit object file %s: %s' % (
+                                    path, self.jit_engine.last_error()))
+
+    def argument_type(self, ty):
+        '''Returns the LLVMType of an argument of the functions defined in
+        this module.
+        '''
+        llty = LLVMType(ty)
+        if isinstance(llty, LLVMStruct):
+            raise TypeError('Cannot pass struct %s by value. Use Array(%s).'
+                            % (ty.name, ty.name))
+        if self.boundscheck and type(llty) is LLVMUnboundedArray:
+            return checked_array(llty)
+        return llty
+
+    @synchronized
+    def bounds_checker(self):
+        '''Returns the BoundsChecker for the runtime of the native code.
+        See pymothoa.util.boundscheck.
+        '''
+        if self._bounds_checker is None:
+            from pymothoa.util import boundscheck
+            engine = self.jit_engine
+            i32 = LLVMType(types.Int32).type()
+            i64p = llvm.TypeFactory.make_pointer(LLVMType(types.Int64).type())
+            i32p = llvm.TypeFactory.make_pointer(i32)
+            pending = engine.make_function(boundscheck.PENDING_SYMBOL, i32, [])
+            take = engine.make_function(boundscheck.TAKE_SYMBOL, i32,
+                                        [i64p, i64p, i32p])
+            self._bounds_checker = boundscheck.BoundsChecker(
+                boundscheck.PENDING_PROTOTYPE(
+                    int(engine.get_pointer_to_function(pending))),
+                boundscheck.TAKE_PROTOTYPE(
+                    int(engine.get_pointer_to_function(take))))
+        return self._bounds_checker
+
+    @synchronized
+    def _new_func_def_or_decl(self, ret, args, name_or_func, suffix=None):
         from function import LLVMFuncDef, LLVMFuncDecl, LLVMFuncDef_BoolRet
         is_func_def = not isinstance(name_or_func, basestring)
         if is_func_def:
             func = name_or_func
             namespace = func.func_globals['__name__']
             realname = '.'.join([namespace, func.__name__])
+            if suffix:
+                realname = '%s[%s]' % (realname, suffix)
         else:
             name = name_or_func
             realname = name
@@ -51,6 +357,8 @@ class LLVMModule(object):
             logger.warning('Using workaround (change to Int8) for boolean return type.')
         else:
             retty = LLVMType(ret)
+            if isinstance(retty, LLVMStruct):
+                raise TypeError('Cannot return struct %s by value.' % ret.name)
 
         # workaround for boolean argument type
         argtys = []
@@ -59,7 +367,9 @@ class LLVMModule(object):
             if arg is types.Bool:
                 argtys.append(LLVMType(types.Int8))
                 count_converted_boolean += 1
-            else:
+            elif is_func_def:
+                argtys.append(self.argument_type(arg))
+            else: # external functions take raw pointers
                 argtys.append(LLVMType(arg))
         else:
             if count_converted_boolean:
@@ -78,15 +388,101 @@ class LLVMModule(object):
 
         if is_func_def:
             if is_ret_bool:
-                return LLVMFuncDef_BoolRet(func, retty, argtys, self, fn_decl)
+                fn = LLVMFuncDef_BoolRet(func, retty, argtys, self, fn_decl)
             else:
-                return LLVMFuncDef(func, retty, argtys, self, fn_decl)
+                fn = LLVMFuncDef(func, retty, argtys, self, fn_decl)
+            fn.boundscheck = self.boundscheck
+            return fn
         else:
             return LLVMFuncDecl(retty, argtys, self, fn_decl)
 
-    def new_function(self, func, ret, args):
-        return self._new_func_def_or_decl(ret, args, func)
+    def new_function(self, func, ret, args, nogil=False, suffix=None,
+                     pipeline=None, fastmath=None, constants=None):
+        '''
+        suffix -- Distinguishes multiple definitions of the same function.
+        pipeline -- PassPipeline of the function. See PassPipeline.coerce.
+        fastmath -- Fast-math flags of the function. See fastmath_flags.
+        constants -- Values of the static arguments by name. args are the
+                     types of the other arguments.
+        '''
+        pipeline = PassPipeline.coerce(pipeline)
+        if pipeline is not None:
+            self.native_pipeline(pipeline) # report invalid passes early
+        flags = fastmath_flags(fastmath)
+        fn = self._new_func_def_or_decl(ret, args, func, suffix)
+        if nogil:
+            fn.nogil = True
+        fn.pipeline = pipeline
+        fn.fastmath = flags
+        fn.constants = constants
+        return fn
+
+    def new_static_function(self, func, ret, args, static, nogil=False,
+                            pipeline=None, fastmath=None,
+                            max_specializations=None):
+        '''Create a function that is compiled for the values of its static
+        arguments. See LLVMStaticFuncDef.
+        '''
+        from function import LLVMStaticFuncDef
+        pipeline = PassPipeline.coerce(pipeline)
+        if pipeline is not None:
+            self.native_pipeline(pipeline)
+        fastmath_flags(fastmath)
+        return LLVMStaticFuncDef(func, ret, args, static, self, nogil=nogil,
+                                 pipeline=pipeline, fastmath=fastmath,
+                                 max_specializations=max_specializations)
+
+    def new_lazy_function(self, func, ret=None, nogil=False, pipeline=None,
+                          fastmath=None):
+        '''Create a function that is compiled for the argument types of
+        each call. The return type is inferred if ret is None.
+        '''
+        from function import LLVMLazyFuncDef
+        fastmath_flags(fastmath) # report invalid flags early
+        return LLVMLazyFuncDef(func, ret, self, nogil=nogil,
+                               pipeline=pipeline, fastmath=fastmath)
+
+    def new_declaration(self, realname, ret, args, requires_gil=None):
+        fn = self._new_func_def_or_decl(ret, args, realname)
+        if requires_gil is None:
+            requires_gil = realname.startswith(('Py', '_Py'))
+        fn.requires_gil = requires_gil
+        return fn
+
+    def new_vectorized(self, kernel, ret, args, pipeline=None, fastmath=None):
+        '''Create a function that maps the kernel over arrays.
+        The kernel must be a function defined in this module.
+        '''
+        pipeline = PassPipeline.coerce(pipeline)
+        if pipeline is not None:
+            self.native_pipeline(pipeline)
+        from function import LLVMUFuncDef
+        if kernel.manager is not self:
+            raise ValueError('Kernel must be defined in the same module.')
+        for ty in [ret] + list(args):
+            if ty is types.Void or ty is types.Bool:
+                raise TypeError('Cannot vectorize function with %s type.'
+                                % ty.__name__)
 
-    def new_declaration(self, realname, ret, args):
-        return self._new_func_def_or_decl(ret, args, realname)
+        realname = '%s.map' % kernel.code_llvm.name()
+        argtys = [self.argument_type(types.Array(X)) for X in args]
+        argtys.append(self.argument_type(types.Array(ret)))   # output
+        argtys.append(LLVMType(types.Int))          # element count
+        retty = LLVMType(types.Void)
+
+        fn_decl = self.jit_engine.make_function(
+                    realname,
+                    retty.type(),
+                    map(lambda X: X.type(), argtys),
+                  )
+
+        if fn_decl.name() != realname:
+            raise NameError(
+                    'Generated function has a different name: %s'%(
+                        fn_decl.name()))
 
+        fn = LLVMUFuncDef(kernel, retty, argtys, self, fn_decl)
+        fn.boundscheck = self.boundscheck
+        fn.pipeline = pipeline
+        fn.fastmath = fastmath_flags(fastmath)
+        return fn
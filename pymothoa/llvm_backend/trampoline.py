@@ -0,0 +1,259 @@
+# Copyright (c) 2012, Siu Kwan Lam
+# All rights reserved.
+#
+# Generates a native Python builtin function for each JIT function with
+# scalar arguments. The wrapper is emitted as LLVM IR next to the function.
+# It unpacks the argument tuple with the Python C-API, calls the function
+# and boxes the return value. Calling it costs about as much as calling any
+# other builtin function. Functions that take arrays still go through ctypes.
+# The GIL is released around the call for functions that do not need it.
+#
+
+import ctypes
+import logging
+
+from pymothoa import types
+from types import LLVMBasicIntMixin, LLVMBasicFloatMixin, LLVMDouble
+
+import llvm # binding
+
+logger = logging.getLogger(__name__)
+
+METH_VARARGS = 0x0001
+
+class PyMethodDef(ctypes.Structure):
+    _fields_ = [
+        ('ml_name',  ctypes.c_char_p),
+        ('ml_meth',  ctypes.c_void_p),
+        ('ml_flags', ctypes.c_int),
+        ('ml_doc',   ctypes.c_char_p),
+    ]
+
+_PyCFunction_NewEx = ctypes.pythonapi.PyCFunction_NewEx
+_PyCFunction_NewEx.restype = ctypes.py_object
+_PyCFunction_NewEx.argtypes = [ctypes.c_void_p, ctypes.py_object, ctypes.py_object]
+
+_SIZEOF_LONG = ctypes.sizeof(ctypes.c_long) * 8
+_SIZEOF_SSIZE_T = ctypes.sizeof(ctypes.c_ssize_t) * 8
+
+def is_supported(funcdef):
+    '''Returns True if a trampoline can be generated for the function.
+    Only scalar arguments and return values are supported.
+    '''
+    scalar = (LLVMBasicIntMixin, LLVMBasicFloatMixin)
+    if not (isinstance(funcdef.retty, types.Void)
+            or isinstance(funcdef.retty, scalar)):
+        return False
+    return all(isinstance(ty, scalar) for ty in funcdef.argtys)
+
+class Trampoline(object):
+    '''A Python builtin function that calls a JIT function.
+    Keeps the method definition alive for as long as the builtin is used.
+    '''
+    def __init__(self, name, addr, code_llvm):
+        self.code_llvm = code_llvm # the wrapper function
+        self.methoddef = PyMethodDef(name, addr, METH_VARARGS, None)
+        self.function = _PyCFunction_NewEx(ctypes.addressof(self.methoddef),
+                                           None, None)
+
+class TrampolineGenerator(object):
+    def __init__(self, funcdef):
+        self.funcdef = funcdef
+        self.engine = funcdef.manager.jit_engine
+
+        self.pyobject = llvm.TypeFactory.make_pointer(llvm.TypeFactory.make_int(8))
+        self.ssize_t = llvm.TypeFactory.make_int(_SIZEOF_SSIZE_T)
+        self.long = llvm.TypeFactory.make_int(_SIZEOF_LONG)
+        self.longlong = llvm.TypeFactory.make_int(64)
+        self.double = llvm.TypeFactory.make_double()
+        self.void = llvm.TypeFactory.make_void()
+
+    def declare(self, name, retty, argtys):
+        fn = self.engine.make_function(name, retty, argtys)
+        if not fn.valid():
+            raise RuntimeError('Cannot declare %s: %s' % (name,
+                                                           self.engine.last_error()))
+        return fn
+
+    def generate(self):
+        '''Emit the wrapper function and returns it.
+        '''
+        funcdef = self.funcdef
+        name = '%s.trampoline' % funcdef.code_llvm.name()
+        fn = self.declare(name, self.pyobject, [self.pyobject, self.pyobject])
+
+        self.fn = fn
+        builder = self.builder = llvm.Builder()
+        bb_entry = fn.append_basic_block('entry')
+        bb_badargs = fn.append_basic_block('badargs')
+        bb_unpack = fn.append_basic_block('unpack')
+        bb_error = self.bb_error = fn.append_basic_block('error')
+        bb_call = fn.append_basic_block('call')
+
+        args = fn.arguments()[1] # (self, args)
+        null = llvm.ConstantFactory.make_null(self.pyobject)
+        argct = len(funcdef.argtys)
+
+        # check argument count
+        builder.insert_at(bb_entry)
+        PyTuple_Size = self.declare('PyTuple_Size', self.ssize_t, [self.pyobject])
+        size = builder.call(PyTuple_Size, [args])
+        expect = llvm.ConstantFactory.make_int(self.ssize_t, argct)
+        builder.cond_branch(builder.icmp(llvm.ICMP_EQ, size, expect),
+                            bb_unpack, bb_badargs)
+
+        builder.insert_at(bb_badargs)
+        message = '%s() takes exactly %d argument%s' % (
+                        funcdef.code_python.__name__,
+                        argct,
+                        '' if argct == 1 else 's')
+        self.raise_type_error(message)
+        builder.ret(null)
+
+        # unpack arguments
+        builder.insert_at(bb_unpack)
+        PyTuple_GetItem = self.declare('PyTuple_GetItem', self.pyobject,
+                                       [self.pyobject, self.ssize_t])
+        argvals = []
+        for i, argty in enumerate(funcdef.argtys):
+            idx = llvm.ConstantFactory.make_int(self.ssize_t, i)
+            item = builder.call(PyTuple_GetItem, [args, idx])
+            argvals.append(self.unbox(item, argty))
+
+        PyErr_Occurred = self.declare('PyErr_Occurred', self.pyobject, [])
+        error = builder.call(PyErr_Occurred, [])
+        builder.cond_branch(builder.icmp(llvm.ICMP_NE, error, null),
+                            bb_error, bb_call)
+
+        builder.insert_at(bb_error)
+        builder.ret(null)
+
+        # call and box the result
+        builder.insert_at(bb_call)
+        if not funcdef.requires_gil:
+            PyEval_SaveThread = self.declare('PyEval_SaveThread', self.pyobject, [])
+            PyEval_RestoreThread = self.declare('PyEval_RestoreThread', self.void,
+                                                [self.pyobject])
+            state = builder.call(PyEval_SaveThread, [])
+            retval = builder.call(funcdef.code_llvm, argvals)
+            builder.call(PyEval_RestoreThread, [state])
+        else:
+            retval = builder.call(funcdef.code_llvm, argvals)
+        builder.ret(self.box(retval, funcdef.retty))
+
+        if not fn.verify():
+            raise RuntimeError('Invalid trampoline for %s' % funcdef.code_llvm.name())
+        self.engine.optimize_function(fn)
+        return fn
+
+    def raise_type_error(self, message):
+        self.raise_error('PyExc_TypeError', message)
+
+    def raise_error(self, exception, message):
+        builder = self.builder
+        PyErr_SetString = self.declare('PyErr_SetString', self.void,
+                                       [self.pyobject, self.pyobject])
+        exc = self.engine.declare_global(exception, self.pyobject)
+        msg = builder.global_string_ptr(message)
+        builder.call(PyErr_SetString, [builder.load(exc), msg])
+
+    def check_not_null(self, obj):
+        '''Branch to the error block if obj is NULL. Continues in a new block.
+        '''
+        builder = self.builder
+        null = llvm.ConstantFactory.make_null(self.pyobject)
+        bb_ok = self.fn.append_basic_block('unbox')
+        builder.cond_branch(builder.icmp(llvm.ICMP_EQ, obj, null),
+                            self.bb_error, bb_ok)
+        builder.insert_at(bb_ok)
+
+    def unbox(self, obj, ty):
+        builder = self.builder
+        if isinstance(ty, LLVMBasicIntMixin):
+            # Accepts int and long (and other types that implement __index__).
+            # Floats raise TypeError and out of range values raise
+            # OverflowError.
+            Py_DecRef = self.declare('Py_DecRef', self.void, [self.pyobject])
+            PyNumber_Index = self.declare('PyNumber_Index', self.pyobject,
+                                          [self.pyobject])
+            index = builder.call(PyNumber_Index, [obj])
+            self.check_not_null(index)
+            if ty.bitsize == 64 and not ty.signed:
+                # PyLong_AsUnsignedLongLong takes only long.
+                PyNumber_Long = self.declare('PyNumber_Long', self.pyobject,
+                                             [self.pyobject])
+                num = builder.call(PyNumber_Long, [index])
+                builder.call(Py_DecRef, [index])
+                self.check_not_null(num)
+                conv = self.declare('PyLong_AsUnsignedLongLong', self.longlong,
+                                    [self.pyobject])
+                val = builder.call(conv, [num])
+                builder.call(Py_DecRef, [num])
+                return val
+
+            conv = self.declare('PyLong_AsLongLong', self.longlong, [self.pyobject])
+            val = builder.call(conv, [index])
+            builder.call(Py_DecRef, [index])
+            if ty.bitsize == 64:
+                return val
+
+            # A single unsigned compare checks the range; negative values
+            # wrap around to large unsigned values.
+            offset = 1 << (ty.bitsize - 1) if ty.signed else 0
+            biased = builder.add(val, llvm.ConstantFactory.make_int(self.longlong,
+                                                                   offset))
+            limit = llvm.ConstantFactory.make_int(self.longlong, 1 << ty.bitsize)
+            bb_overflow = self.fn.append_basic_block('overflow')
+            bb_ok = self.fn.append_basic_block('unbox')
+            builder.cond_branch(builder.icmp(llvm.ICMP_ULT, biased, limit),
+                                bb_ok, bb_overflow)
+            builder.insert_at(bb_overflow)
+            self.raise_error('PyExc_OverflowError',
+                             'argument out of range for %s %d-bit integer' % (
+                                'signed' if ty.signed else 'unsigned',
+                                ty.bitsize))
+            builder.branch(self.bb_error)
+            builder.insert_at(bb_ok)
+            return builder.icast(val, ty.type(), ty.signed)
+        else:
+            conv = self.declare('PyFloat_AsDouble', self.double, [self.pyobject])
+            val = builder.call(conv, [obj])
+            if not isinstance(ty, LLVMDouble):
+                val = builder.fcast(val, ty.type())
+            return val
+
+    def box(self, val, ty):
+        builder = self.builder
+        if isinstance(ty, types.Void):
+            Py_IncRef = self.declare('Py_IncRef', self.void, [self.pyobject])
+            none = self.engine.declare_global('_Py_NoneStruct',
+                                              llvm.TypeFactory.make_int(8))
+            builder.call(Py_IncRef, [none])
+            return none
+        elif self.funcdef.is_ret_bool:
+            conv = self.declare('PyBool_FromLong', self.pyobject, [self.long])
+            return builder.call(conv, [builder.icast(val, self.long, True)])
+        elif isinstance(ty, LLVMBasicIntMixin):
+            if ty.bitsize <= _SIZEOF_LONG and (ty.signed or ty.bitsize < _SIZEOF_LONG):
+                conv = self.declare('PyInt_FromLong', self.pyobject, [self.long])
+                return builder.call(conv, [builder.icast(val, self.long, ty.signed)])
+            elif ty.signed:
+                conv = self.declare('PyLong_FromLongLong', self.pyobject,
+                                    [self.longlong])
+            else:
+                conv = self.declare('PyLong_FromUnsignedLongLong', self.pyobject,
+                                    [self.longlong])
+            return builder.call(conv, [builder.icast(val, self.longlong, ty.signed)])
+        else:
+            conv = self.declare('PyFloat_FromDouble', self.pyobject, [self.double])
+            return builder.call(conv, [builder.fcast(val, self.double)])
+
+def build_trampoline(funcdef):
+    '''Returns a Trampoline for the function or None if it is not supported.
+    '''
+    if not is_supported(funcdef):
+        return None
+    fn = TrampolineGenerator(funcdef).generate()
+    addr = funcdef.manager.jit_engine.get_pointer_to_function(fn)
+    logger.debug('Generated trampoline for %s', funcdef.code_llvm.name())
+    return Trampoline(funcdef.code_python.__name__, int(addr), fn)
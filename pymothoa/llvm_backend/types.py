@@ -9,19 +9,11 @@ from pymothoa import types
 import llvm # binding
 import values
 
-_array_type_code_to_ctype = {
-    'c': ctypes.c_char,
-    'b': ctypes.c_ubyte,
-    'B': ctypes.c_byte,
-    'h': ctypes.c_short,
-    'H': ctypes.c_ushort,
-    'i': ctypes.c_int,
-    'I': ctypes.c_uint,
-    'l': ctypes.c_long,
-    'L': ctypes.c_ulong,
-    'f': ctypes.c_float,
-    'd': ctypes.c_double,
-}
+from pymothoa.util.arrays import (array_adaptor, ndarray_adaptor, ndarray_struct,
+                                  checked_array_adaptor, checked_array_struct,
+                                  _array_type_code_to_ctype,
+                                  _ctype_to_array_type_code)
+from pymothoa.util.layout import struct_ctype, struct_from_dtype
 
 class LLVMType(object):
 
@@ -33,6 +25,10 @@ class LLVMType(object):
             types.Int16     : LLVMInt16,
             types.Int32     : LLVMInt32,
             types.Int64     : LLVMInt64,
+            types.UInt8     : LLVMUInt8,
+            types.UInt16    : LLVMUInt16,
+            types.UInt32    : LLVMUInt32,
+            types.UInt64    : LLVMUInt64,
             types.Float     : LLVMFloat,
             types.Double    : LLVMDouble,
         }
@@ -56,27 +52,45 @@ class LLVMType(object):
                 obj = object.__new__(LLVMUnboundedArray)
                 obj.elemtype = LLVMType(elemtype)
                 return obj
-            elif type(datatype) is type and issubclass(datatype, types.GenericVector):
-                elemtype = LLVMType(datatype.elemtype)
-                elemcount = datatype.elemcount
-                # determine mixin classes to install
-                if isinstance(elemtype, LLVMRealBinOpMixin):
-                    mixins = (LLVMRealBinOpMixin ,)
-                elif isinstance(elemtype, LLVMIntBinOpMixin):
-                    mixins = (LLVMIntBinOpMixin ,)
-                else:
-                    raise NotImplementedError
-                # create new class for the vector type
-                clsname = 'LLVMVector__%s%d'%(datatype.elemtype.__name__, elemcount)
-                vectorcls = type(clsname, (LLVMVector,)+mixins, {})
-                # create instance of the class
-                obj = object.__new__(vectorcls)
-                obj.elemtype = elemtype
-                obj.elemcount = elemcount
+            elif isinstance(datatype, types.NDArray):
+                obj = object.__new__(LLVMNDArray)
+                obj.elemtype = LLVMType(datatype.elemtype)
+                obj.ndim = datatype.ndim
                 return obj
+            elif isinstance(datatype, types.Struct):
+                obj = object.__new__(LLVMStruct)
+                obj.struct = datatype
+                obj.fieldtys = [LLVMType(X) for _, X in datatype.fields]
+                return obj
+            elif type(datatype) is type and issubclass(datatype, types.GenericVector):
+                return vector_type(LLVMType(datatype.elemtype),
+                                   datatype.elemcount)
             else:
                 raise TypeError(datatype)
 
+def vector_type(elemtype, elemcount):
+    '''Returns the LLVMVector of elemcount elements of the LLVMType elemtype.
+    '''
+    # determine mixin classes to install
+    if isinstance(elemtype, LLVMRealBinOpMixin):
+        mixins = (LLVMRealBinOpMixin ,)
+    elif isinstance(elemtype, LLVMUIntBinOpMixin):
+        mixins = (LLVMUIntBinOpMixin ,)
+    elif isinstance(elemtype, LLVMIntBinOpMixin):
+        mixins = (LLVMIntBinOpMixin ,)
+    elif isinstance(elemtype, LLVMBool): # mask of a comparison of vectors
+        mixins = ()
+    else:
+        raise NotImplementedError
+    # create new class for the vector type
+    clsname = 'LLVMVector__%s%d'%(public_type(elemtype).__name__, elemcount)
+    vectorcls = type(clsname, (LLVMVector,)+mixins, {})
+    # create instance of the class
+    obj = object.__new__(vectorcls)
+    obj.elemtype = elemtype
+    obj.elemcount = elemcount
+    return obj
+
 class LLVMVoid(types.Void):
     def ctype(self):
         return None
@@ -124,25 +138,6 @@ class LLVMIntBinOpMixin(object):
     def op_mod(self, lhs, rhs, builder):
         return builder.smod(lhs, rhs)
 
-    def op_pow(self, lhs, rhs, builder):
-        # Workaround:
-        # Instrinsic_pow can only accept float types.
-        # Convert to Double (prefer precision over speed?)
-        if self.signed:
-            lhs_as_float = builder.sitofp(lhs, LLVMType(types.Double).type())
-        else:
-            lhs_as_float = builder.sitofp(lhs, LLVMType(types.Double).type())
-
-        res = builder.intrinsic_pow(lhs_as_float, rhs)
-
-        # Convert result back to integer type
-        if self.signed:
-            res_as_int = builder.fptosi(res, self.type())
-        else:
-            res_as_int = builder.fptosi(res, self.type())
-
-        return res_as_int
-
     def op_eq(self, lhs, rhs, builder):
         return builder.icmp(llvm.ICMP_EQ, lhs, rhs)
 
@@ -176,6 +171,28 @@ class LLVMIntBinOpMixin(object):
     def op_rshift(self, lhs, rhs, builder):
         return builder.ashr(lhs, rhs)
 
+class LLVMUIntBinOpMixin(LLVMIntBinOpMixin):
+    def op_div(self, lhs, rhs, builder):
+        return builder.udiv(lhs, rhs)
+
+    def op_mod(self, lhs, rhs, builder):
+        return builder.umod(lhs, rhs)
+
+    def op_lt(self, lhs, rhs, builder):
+        return builder.icmp(llvm.ICMP_ULT, lhs, rhs)
+
+    def op_lte(self, lhs, rhs, builder):
+        return builder.icmp(llvm.ICMP_ULE, lhs, rhs)
+
+    def op_gt(self, lhs, rhs, builder):
+        return builder.icmp(llvm.ICMP_UGT, lhs, rhs)
+
+    def op_gte(self, lhs, rhs, builder):
+        return builder.icmp(llvm.ICMP_UGE, lhs, rhs)
+
+    def op_rshift(self, lhs, rhs, builder):
+        return builder.lshr(lhs, rhs)
+
 class LLVMBasicIntMixin(LLVMIntBinOpMixin):
 
     def argument_adaptor(self, val):
@@ -183,21 +200,27 @@ class LLVMBasicIntMixin(LLVMIntBinOpMixin):
 
     def ctype(self):
         mapping = {
-             8: ctypes.c_int8,
-            16: ctypes.c_int16,
-            32: ctypes.c_int32,
-            64: ctypes.c_int64,
+             8: (ctypes.c_uint8, ctypes.c_int8),
+            16: (ctypes.c_uint16, ctypes.c_int16),
+            32: (ctypes.c_uint32, ctypes.c_int32),
+            64: (ctypes.c_uint64, ctypes.c_int64),
         }
-        return mapping[self.bitsize]
+        return mapping[self.bitsize][self.signed]
 
     def type(self):
         return llvm.TypeFactory.make_int(self.bitsize)
 
     def constant(self, val):
-        if type(val) is not int:
+        # A long must be in range; e.g. the 64-bit constants of hashes.
+        if type(val) is long:
+            if not 0 <= val < 1 << (self.bitsize - self.signed):
+                raise OverflowError('%d does not fit in %s'
+                                    % (val, type(self).__name__))
+        elif type(val) is not int:
             raise TypeError(type(val))
-        else:
-            return llvm.ConstantFactory.make_int(self.type(), val)
+        elif val < 0: # two's complement; truncated to the type by LLVM
+            val &= (1 << 64) - 1
+        return llvm.ConstantFactory.make_int(self.type(), val)
 
     def cast(self, old, builder):
         if old.type == self:
@@ -205,11 +228,15 @@ class LLVMBasicIntMixin(LLVMIntBinOpMixin):
         elif isinstance(old.type, types.Bool):
             return builder.icast(old.value(builder), self.type(), True)
         elif isinstance(old.type, types.GenericInt):
-            assert old.type.bitsize != self.bitsize
             val = old.value(builder)
-            return builder.icast(val, self.type(), self.signed)
+            if old.type.bitsize == self.bitsize: # only the signedness differs
+                return val
+            # extended according to the signedness of the source
+            return builder.icast(val, self.type(), old.type.signed)
         elif isinstance(old.type, types.GenericReal):
             val = old.value(builder)
+            if not self.signed:
+                return builder.fptoui(val, self.type())
             return builder.fptosi(val, self.type())
         else:
             print 'cast %s -> %s'%(old.type, self)
@@ -273,6 +300,8 @@ class LLVMBasicFloatMixin(LLVMRealBinOpMixin):
             return old.value(builder)
         elif isinstance(old.type, types.GenericInt):
             val = old.value(builder)
+            if not old.type.signed:
+                return builder.uitofp(val, self.type())
             return builder.sitofp(val, self.type())
         elif isinstance(old.type, types.GenericReal):
             val = old.value(builder)
@@ -301,6 +330,21 @@ class LLVMInt32(types.Int32, LLVMBasicIntMixin):
 class LLVMInt64(types.Int64, LLVMBasicIntMixin):
     pass
 
+class LLVMBasicUIntMixin(LLVMUIntBinOpMixin, LLVMBasicIntMixin):
+    pass
+
+class LLVMUInt8(types.UInt8, LLVMBasicUIntMixin):
+    pass
+
+class LLVMUInt16(types.UInt16, LLVMBasicUIntMixin):
+    pass
+
+class LLVMUInt32(types.UInt32, LLVMBasicUIntMixin):
+    pass
+
+class LLVMUInt64(types.UInt64, LLVMBasicUIntMixin):
+    pass
+
 class LLVMFloat(types.Float, LLVMBasicFloatMixin):
     pass
 
@@ -312,7 +356,9 @@ class LLVMUnboundedArray(types.GenericUnboundedArray):
     elemtype = Descriptor(constant=True, constrains=instanceof(types.BuiltinType))
 
     def cast(self, old, builder):
-        if isinstance(old.type, LLVMUnboundedArray):
+        if isinstance(old.type, LLVMCheckedArray): # pass to unchecked code
+            return old.type.field(old.value(builder), old.type.DATA, builder)
+        elif isinstance(old.type, LLVMUnboundedArray):
             return old.value(builder)
         else:
             raise TypeError('Casting unbounded-array to something else.')
@@ -323,34 +369,131 @@ class LLVMUnboundedArray(types.GenericUnboundedArray):
     def type(self):
         return llvm.TypeFactory.make_pointer(self.elemtype.type())
 
+    def adaptor(self, writable=False):
+        return array_adaptor(self.elemtype.ctype(), writable)
+
+    def argument_adaptor(self, val, writable=False):
+        return self.adaptor(writable)(val)
+
+class LLVMCheckedArray(LLVMUnboundedArray):
+    '''Pointer to a descriptor of an array that carries its length:
+        { T * data, i64 length }
+    Bounds-checked modules pass arrays as such. See pymothoa.util.arrays.
+    '''
+    DATA, LENGTH = range(2) # fields of the descriptor
+
+    def __eq__(self, other):
+        return (isinstance(other, LLVMCheckedArray)
+                and self.elemtype == other.elemtype)
+
+    def cast(self, old, builder):
+        if old.type == self:
+            return old.value(builder)
+        else:
+            raise TypeError('Casting unchecked array to bounds-checked array.')
+
+    def ctype(self):
+        return ctypes.POINTER(checked_array_struct(self.elemtype.ctype()))
+
+    def descriptor_type(self):
+        return llvm.TypeFactory.make_struct([
+                    llvm.TypeFactory.make_pointer(self.elemtype.type()),
+                    llvm.TypeFactory.make_int(64),
+               ])
+
+    def type(self):
+        return llvm.TypeFactory.make_pointer(self.descriptor_type())
+
+    def field(self, desc, index, builder):
+        '''Load a field of the descriptor.
+        '''
+        i32 = LLVMType(types.Int32)
+        indices = [values.LLVMConstant(i32, X).value(builder) for X in (0, index)]
+        return builder.load(builder.gep2(desc, indices))
+
+    def adaptor(self, writable=False):
+        return checked_array_adaptor(self.elemtype.ctype(), writable)
+
+def checked_array(ty):
+    '''Returns the bounds-checked version of an array type.
+    '''
+    obj = object.__new__(LLVMCheckedArray)
+    obj.elemtype = ty.elemtype
+    return obj
+
+class LLVMNDArray(types.GenericNDArray):
+    '''Pointer to a descriptor of a strided N-dimensional array:
+        { T * data, [ndim x i64] shape, [ndim x i64] strides }
+    See pymothoa.util.arrays.
+    '''
+    elemtype = Descriptor(constant=True, constrains=instanceof(types.BuiltinType))
+    ndim = Descriptor(constant=True, constrains=lambda N: N>0)
+
+    DATA, SHAPE, STRIDES = range(3) # fields of the descriptor
+
+    def __eq__(self, other):
+        return (isinstance(other, LLVMNDArray)
+                and self.elemtype == other.elemtype
+                and self.ndim == other.ndim)
+
+    def cast(self, old, builder):
+        if old.type == self:
+            return old.value(builder)
+        else:
+            raise TypeError('Casting N-dimensional array to something else.')
+
+    def ctype(self):
+        return ctypes.POINTER(ndarray_struct(self.elemtype.ctype(), self.ndim))
+
+    def type(self):
+        i64 = llvm.TypeFactory.make_int(64)
+        extents = llvm.TypeFactory.make_array(i64, self.ndim)
+        desc = llvm.TypeFactory.make_struct([
+                    llvm.TypeFactory.make_pointer(self.elemtype.type()),
+                    extents,
+                    extents,
+               ])
+        return llvm.TypeFactory.make_pointer(desc)
+
+    def adaptor(self, writable=False):
+        return ndarray_adaptor(self.elemtype.ctype(), self.ndim, writable)
+
+    def argument_adaptor(self, val, writable=False):
+        return self.adaptor(writable)(val)
+
+class LLVMStruct(types.GenericStruct):
+    '''Record of named fields. A literal LLVM struct, which has the layout
+    of the C struct (see pymothoa.util.layout).
+    '''
+    struct = Descriptor(constant=True, constrains=instanceof(types.Struct))
+    fieldtys = Descriptor(constant=True)
+
+    def __eq__(self, other):
+        return isinstance(other, LLVMStruct) and self.struct == other.struct
+
+    def field(self, name):
+        '''Returns (index, LLVMType) of a field.
+        '''
+        names = self.struct.names()
+        if name not in names:
+            raise AttributeError(name)
+        index = names.index(name)
+        return index, self.fieldtys[index]
+
+    def cast(self, old, builder):
+        if old.type != self:
+            raise TypeError('Casting to struct %s from another type.'
+                            % self.struct.name)
+        return old.value(builder)
+
+    def ctype(self):
+        return struct_ctype(self.struct)
+
+    def type(self):
+        return llvm.TypeFactory.make_struct([X.type() for X in self.fieldtys])
+
     def argument_adaptor(self, val):
-        try: # try to use numpy.ndarray
-            from numpy import ndarray
-            if isinstance(val, ndarray):
-                if val.dtype != self.elemtype.ctype():
-                    raise TypeError('dtype of the numpy.ndarray '
-                                    'does not match argument type.')
-                return val.ctypes.data_as(self.ctype())
-        except ImportError:
-            pass
-
-        # No numpy or val is not ndarray.
-        # Try to use array.array
-        from array import array
-        if isinstance(val, array):
-            elemctype = self.elemtype.ctype()
-
-            if _array_type_code_to_ctype[val.typecode]!=elemctype:
-                raise TypeError('array.array contains a different datatype.')
-
-            address, length = val.buffer_info()
-            ptr = ctypes.cast(address, self.ctype())
-            return ptr
-
-        # Build a ctype array from iterable. This can be very slow.
-        ctype = self.elemtype.ctype()
-        argtype = ctype*len(val)
-        return argtype(*val)
+        raise NotImplementedError('Cannot pass struct by value.')
 
 class LLVMVector(types.GenericVector):
     elemtype = Descriptor(constant=True, constrains=instanceof(types.BuiltinType))
@@ -385,3 +528,116 @@ class LLVMVector(types.GenericVector):
 
     def argument_adaptor(self, val):
         raise NotImplementedError('Cannot use vector as argument.')
+
+# Public type (in pymothoa.types) of each basic LLVM type
+_public_type = {
+    LLVMVoid    : types.Void,
+    LLVMBool    : types.Bool,
+    LLVMInt8    : types.Int8,
+    LLVMInt16   : types.Int16,
+    LLVMInt32   : types.Int32,
+    LLVMInt64   : types.Int64,
+    LLVMUInt8   : types.UInt8,
+    LLVMUInt16  : types.UInt16,
+    LLVMUInt32  : types.UInt32,
+    LLVMUInt64  : types.UInt64,
+    LLVMFloat   : types.Float,
+    LLVMDouble  : types.Double,
+}
+
+def public_type(ty):
+    '''Returns the public type of a LLVMType.
+    '''
+    if isinstance(ty, LLVMUnboundedArray):
+        return types.Array(public_type(ty.elemtype))
+    if isinstance(ty, LLVMNDArray):
+        return types.NDArray(public_type(ty.elemtype), ty.ndim)
+    if isinstance(ty, LLVMStruct):
+        return ty.struct
+    try:
+        return _public_type[type(ty)]
+    except KeyError:
+        raise TypeError('No public type for %s' % type(ty).__name__)
+
+_ctype_to_public_type = {
+    ctypes.c_int8   : types.Int8,
+    ctypes.c_int16  : types.Int16,
+    ctypes.c_int32  : types.Int32,
+    ctypes.c_int64  : types.Int64,
+    ctypes.c_uint8  : types.UInt8,
+    ctypes.c_uint16 : types.UInt16,
+    ctypes.c_uint32 : types.UInt32,
+    ctypes.c_uint64 : types.UInt64,
+    ctypes.c_float  : types.Float,
+    ctypes.c_double : types.Double,
+}
+
+_dtype_to_public_type = {
+    'int8'    : types.Int8,
+    'int16'   : types.Int16,
+    'int32'   : types.Int32,
+    'int64'   : types.Int64,
+    'uint8'   : types.UInt8,
+    'uint16'  : types.UInt16,
+    'uint32'  : types.UInt32,
+    'uint64'  : types.UInt64,
+    'float32' : types.Float,
+    'float64' : types.Double,
+}
+
+# Python int is a C long
+_python_int_type = types.Int64 if ctypes.sizeof(ctypes.c_long) == 8 else types.Int32
+
+def typeof(value):
+    '''Returns the public type for passing value to a JIT function.
+    Supports bool, int, long, float, numpy.ndarray, numpy scalars and
+    array.array. Multi-dimensional or non-contiguous numpy.ndarray are
+    NDArray. Structured numpy.ndarray are arrays of Struct.
+    '''
+    if isinstance(value, bool):
+        return types.Bool
+    elif isinstance(value, int):
+        return _python_int_type
+    elif isinstance(value, long):
+        return types.Int64
+    elif isinstance(value, float):
+        return types.Double
+
+    from array import array
+    if isinstance(value, array):
+        ctype = _array_type_code_to_ctype.get(value.typecode)
+        if ctype in _ctype_to_public_type:
+            return types.Array(_ctype_to_public_type[ctype])
+        raise TypeError('Unsupported array.array typecode: %s' % value.typecode)
+
+    try:
+        import numpy
+    except ImportError:
+        pass
+    else:
+        if isinstance(value, (numpy.ndarray, numpy.generic)):
+            if value.dtype.names is not None:
+                if not isinstance(value, numpy.ndarray):
+                    raise TypeError('Cannot pass struct by value.')
+                elemtype = struct_from_dtype(value.dtype)
+            else:
+                try:
+                    elemtype = _dtype_to_public_type[value.dtype.name]
+                except KeyError:
+                    raise TypeError('Unsupported dtype: %s' % value.dtype)
+            if isinstance(value, numpy.ndarray):
+                if value.ndim == 1 and value.flags.c_contiguous:
+                    return types.Array(elemtype)
+                return types.NDArray(elemtype, value.ndim)
+            return elemtype
+
+    raise TypeError('Cannot infer the type of %s object.' % type(value).__name__)
+
+def type_key(ty):
+    '''Returns a hashable key for a public type.
+    '''
+    if isinstance(ty, types.Array):
+        return (types.Array, ty.elemtype)
+    if isinstance(ty, types.NDArray):
+        return (types.NDArray, ty.elemtype, ty.ndim)
+    return ty
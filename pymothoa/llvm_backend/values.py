@@ -27,6 +27,13 @@ class LLVMTempPointer(LLVMValue):
         self.type = ty
         self.pointer = ptr
 
+class LLVMStructReference(LLVMTempPointer):
+    '''A struct in memory, e.g. an element of an array of structs.
+    Its fields are accessed through the pointer without loading the rest.
+    '''
+    def value(self, builder):
+        return builder.load(self.pointer)
+
 class LLVMVariable(LLVMValue):
     pointer = Descriptor(constant=True)
 
@@ -49,12 +56,29 @@ class LLVMArrayVariable(LLVMVariable):
         zero = LLVMConstant(LLVMType(types.Int), 0).value(builder)
         return builder.gep(self.pointer, zero)
 
+class LLVMCapturedVariable(LLVMVariable):
+    '''A variable of an enclosing function accessed through a pointer.
+    '''
+    def __init__(self, ty, ptr):
+        '''Overides parent ctor.
+        '''
+        self.type = ty
+        self.pointer = ptr
+
+class LLVMCapturedArrayVariable(LLVMArrayVariable):
+    def __init__(self, ty, ptr):
+        '''Overides parent ctor.
+        '''
+        self.type = ty
+        self.pointer = ptr
+
 class LLVMConstant(LLVMValue):
     constant = Descriptor(constant=True)
 
     def __init__(self, ty, val):
         self.type = ty
         self.constant = self.type.constant(val)
+        self.number = val # the Python value
 
     def value(self, builder):
         return self.constant
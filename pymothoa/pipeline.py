@@ -0,0 +1,67 @@
+# Copyright (c) 2012, Siu Kwan Lam
+# All rights reserved.
+#
+# Description of the optimization passes run on a function after code
+# generation. Does not depend on LLVM.
+#
+#   @module.function(ret=Int, args=[Int], pipeline=PassPipeline(optlevel=1))
+#   @module.function(ret=Int, args=[Int], pipeline=['mem2reg', 'instcombine'])
+#
+# A pipeline can be set for a module (see LLVMModule) and for each function.
+# Only passes that run on a single function can be used. JITModule.optimize()
+# still runs the module passes over every function of the module.
+#
+
+class PassPipeline(object):
+    def __init__(self, optlevel=3, passes=None, vectorize=True,
+                 unroll_threshold=None, inline_threshold=None):
+        '''
+        optlevel -- Optimization level (0-3) of the standard pipeline.
+        passes -- Names of the passes to run instead of the standard pipeline.
+                  See JITEngine.dump_passes() for the available names.
+        vectorize -- Run the basic-block (SLP) vectorizer.
+        unroll_threshold -- Size threshold for unrolling loops.
+                            None uses the LLVM default.
+        inline_threshold -- Inline calls to functions of the module with at
+                            most this number of instructions before running
+                            the passes. None disables inlining.
+        '''
+        if not 0 <= optlevel <= 3:
+            raise ValueError('Invalid optimization level: %r' % optlevel)
+        self.optlevel = optlevel
+        self.passes = tuple(passes or ())
+        self.vectorize = vectorize
+        self.unroll_threshold = unroll_threshold
+        self.inline_threshold = inline_threshold
+
+    @classmethod
+    def coerce(cls, value):
+        '''Returns a PassPipeline for an optimization level, a list of pass
+        names or a PassPipeline. None is returned unchanged.
+        '''
+        if value is None or isinstance(value, cls):
+            return value
+        if isinstance(value, (int, long)):
+            return cls(optlevel=value)
+        if isinstance(value, basestring):
+            raise TypeError('Expecting a list of pass names, got %r' % value)
+        return cls(passes=value)
+
+    def key(self):
+        '''A string that identifies the generated code of the pipeline.
+        '''
+        return 'O%d:%s:vectorize=%s:unroll=%s:inline=%s' % (
+                    self.optlevel, ','.join(self.passes), self.vectorize,
+                    self.unroll_threshold, self.inline_threshold)
+
+    def __eq__(self, other):
+        return isinstance(other, PassPipeline) and self.key() == other.key()
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __hash__(self):
+        return hash(self.key())
+
+    def __repr__(self):
+        return 'PassPipeline(%s)' % self.key()
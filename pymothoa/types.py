@@ -28,28 +28,48 @@ class GenericInt(BuiltinType):
 class Bool(BuiltinType):
     rank = 5
 
+# Ranks of the integers follow C: an unsigned type wins over the signed type
+# of the same size.
 class Int8(GenericInt):
     rank = 10
     bitsize = 8
     signed = True
 
+class UInt8(GenericInt):
+    rank = 11
+    bitsize = 8
+    signed = False
 
 class Int16(GenericInt):
-    rank = 11
+    rank = 12
     bitsize = 16
     signed = True
 
+class UInt16(GenericInt):
+    rank = 13
+    bitsize = 16
+    signed = False
 
 class Int32(GenericInt):
-    rank = 12
+    rank = 14
     bitsize = 32
     signed = True
 
+class UInt32(GenericInt):
+    rank = 15
+    bitsize = 32
+    signed = False
+
 class Int64(GenericInt):
-    rank = 13
+    rank = 16
     bitsize = 64
     signed = True
 
+class UInt64(GenericInt):
+    rank = 17
+    bitsize = 64
+    signed = False
+
 def _determine_native_int_size():
     from ctypes import c_int, c_int32, c_int64
     if c_int is c_int32:
@@ -79,6 +99,12 @@ class GenericUnboundedArray(AggregateType):
 class GenericBoundedArray(AggregateType):
     pass
 
+class GenericNDArray(AggregateType):
+    pass
+
+class GenericStruct(AggregateType):
+    pass
+
 class GenericVector(Type):
     pass
 
@@ -99,6 +125,67 @@ class Array(DummyType):
         '''
         self.elemtype = elemtype
 
+class NDArray(DummyType):
+    __slots__ = 'elemtype', 'ndim'
+    def __init__(self, elemtype, ndim):
+        '''N-dimensional strided array, e.g. a view of a numpy.ndarray.
+        Index with A[i, j]. The extents are A.shape[0], A.shape[1], ...
+        '''
+        self.elemtype = elemtype
+        self.ndim = ndim
+
 class Slice(DummyType):
     def __init__(self, elemtype):
         pass
+
+class Struct(DummyType):
+    __slots__ = 'name', 'fields'
+    def __init__(self, name, fields):
+        '''Record of named fields laid out as a C struct, e.g.
+
+            Particle = Struct('Particle', [('x', Double), ('y', Double),
+                                           ('mass', Float)])
+
+        Arrays of structs, Array(Particle), are numpy structured arrays of
+        the same layout. Read and write the fields with P[i].x.
+        See pymothoa.util.layout.
+
+        fields -- List of (name, type) pairs. The types are integer and
+                  floating-point types or other structs.
+        '''
+        self.name = name
+        self.fields = tuple((fname, ty) for fname, ty in fields)
+        if not self.fields:
+            raise TypeError('Struct %s has no field.' % name)
+        names = self.names()
+        if len(set(names)) != len(names):
+            raise TypeError('Struct %s has duplicated field names.' % name)
+        for fname, ty in self.fields:
+            if not (isinstance(ty, Struct) or (type(ty) is type and
+                    issubclass(ty, (GenericInt, GenericReal)))):
+                raise TypeError('Invalid type of field %s.%s.' % (name, fname))
+
+    @property
+    def __name__(self):
+        return self.name
+
+    def names(self):
+        return [fname for fname, _ in self.fields]
+
+    def field_type(self, name):
+        for fname, ty in self.fields:
+            if fname == name:
+                return ty
+        raise AttributeError('Struct %s has no field "%s".' % (self.name, name))
+
+    # Structs of the same fields are the same type.
+    def __eq__(self, other):
+        return isinstance(other, Struct) and self.fields == other.fields
+
+    def __hash__(self):
+        return hash(self.fields)
+
+    def __repr__(self):
+        return 'Struct(%r, [%s])' % (self.name, ', '.join(
+                        '(%r, %s)' % (fname, getattr(ty, '__name__', ty))
+                        for fname, ty in self.fields))
@@ -0,0 +1,444 @@
+# Copyright (c) 2012, Siu Kwan Lam
+# All rights reserved.
+#
+# Passing arrays to native code through ctypes.
+# Does not depend on LLVM. Used by the JIT and by the AOT loader.
+#
+# Any object that exports a buffer is passed without copying: numpy.ndarray,
+# array.array, bytearray, memoryview, mmap, ctypes arrays, etc. Other
+# sequences are copied into a temporary array in a single bulk conversion.
+#
+# N-dimensional arrays are passed as a pointer to a descriptor:
+#     struct { T * data; int64 shape[ndim]; int64 strides[ndim]; }
+# The strides are in number of elements.
+#
+# Bounds-checked functions take 1-dimensional arrays as a pointer to a
+# descriptor that carries the number of elements:
+#     struct { T * data; int64 length; }
+#
+# The elements of arrays of structs are ctypes.Structure. numpy structured
+# arrays are accepted if their records have the same layout.
+#
+
+import array
+import ctypes
+import sys
+
+_array_type_code_to_ctype = {
+    'c': ctypes.c_char,
+    'b': ctypes.c_byte,
+    'B': ctypes.c_ubyte,
+    'h': ctypes.c_short,
+    'H': ctypes.c_ushort,
+    'i': ctypes.c_int,
+    'I': ctypes.c_uint,
+    'l': ctypes.c_long,
+    'L': ctypes.c_ulong,
+    'f': ctypes.c_float,
+    'd': ctypes.c_double,
+}
+
+_ctype_to_array_type_code = dict((v, k) for k, v in _array_type_code_to_ctype.items())
+
+#-------------------------------------------------------------------------------
+# Buffer protocol of the Python C-API
+
+class _Py_buffer(ctypes.Structure):
+    # Layout of Py_buffer in Python 2.7
+    _fields_ = [
+        ('buf',         ctypes.c_void_p),
+        ('obj',         ctypes.c_void_p),
+        ('len',         ctypes.c_ssize_t),
+        ('itemsize',    ctypes.c_ssize_t),
+        ('readonly',    ctypes.c_int),
+        ('ndim',        ctypes.c_int),
+        ('format',      ctypes.c_char_p),
+        ('shape',       ctypes.POINTER(ctypes.c_ssize_t)),
+        ('strides',     ctypes.POINTER(ctypes.c_ssize_t)),
+        ('suboffsets',  ctypes.POINTER(ctypes.c_ssize_t)),
+        ('smalltable',  ctypes.c_ssize_t * 2),
+        ('internal',    ctypes.c_void_p),
+    ]
+
+_PyBUF_FORMAT = 0x0004
+_PyBUF_STRIDES = 0x0010 | 0x0008 # with shape
+_PyBUF_C_CONTIGUOUS = 0x0020 | _PyBUF_STRIDES
+
+def _pythonapi(name, restype, *argtypes):
+    # A private prototype. Does not modify the attributes of ctypes.pythonapi.
+    return ctypes.PYFUNCTYPE(restype, *argtypes)((name, ctypes.pythonapi))
+
+_PyObject_GetBuffer = _pythonapi('PyObject_GetBuffer', ctypes.c_int,
+                                 ctypes.py_object, ctypes.POINTER(_Py_buffer),
+                                 ctypes.c_int)
+_PyBuffer_Release = _pythonapi('PyBuffer_Release', None,
+                               ctypes.POINTER(_Py_buffer))
+
+# The old buffer protocol. array.array and mmap support only this one.
+_PyObject_AsReadBuffer = _pythonapi('PyObject_AsReadBuffer', ctypes.c_int,
+                                    ctypes.py_object,
+                                    ctypes.POINTER(ctypes.c_void_p),
+                                    ctypes.POINTER(ctypes.c_ssize_t))
+_PyObject_AsWriteBuffer = _pythonapi('PyObject_AsWriteBuffer', ctypes.c_int,
+                                     ctypes.py_object,
+                                     ctypes.POINTER(ctypes.c_void_p),
+                                     ctypes.POINTER(ctypes.c_ssize_t))
+
+# Kind of the items of each struct format character: float, signed, unsigned.
+_format_kind = {}
+_format_kind.update(dict.fromkeys('fd', 'f'))
+_format_kind.update(dict.fromkeys('bhilqn', 'i'))
+_format_kind.update(dict.fromkeys('cBHILQN?', 'u'))
+
+_native_byteorder = '<' if sys.byteorder == 'little' else '>'
+
+class _Argument(object):
+    '''A pointer for ctypes that keeps the owner of the memory alive until
+    the native call returns.
+    '''
+    def __init__(self, ptr, owner):
+        self._as_parameter_ = ptr
+        self.owner = owner
+
+class _BufferArgument(object):
+    '''Holds an exported buffer until the native call returns.
+    '''
+    def __init__(self, view, ptr):
+        self.view = view
+        self._as_parameter_ = ptr
+
+    def __del__(self):
+        _PyBuffer_Release(ctypes.byref(self.view))
+
+#-------------------------------------------------------------------------------
+
+class ArrayAdaptor(object):
+    '''Converts the arguments for an array parameter to pointers.
+
+    The conversion for each type of argument is selected on first use and
+    cached. So is the validation of the item format of buffers.
+    '''
+    def __init__(self, elemctype, writable=False):
+        '''
+        elemctype -- ctype of the elements.
+        writable -- The native code writes to the array. Read-only buffers
+                    are rejected.
+        '''
+        self.elemctype = elemctype
+        self.ptrtype = ctypes.POINTER(elemctype)
+        self.writable = writable
+        self.itemsize = ctypes.sizeof(elemctype)
+        self.typecode = _ctype_to_array_type_code.get(elemctype)
+        self.converters = {}    # type of argument -> conversion
+        self.formats = {}       # item format -> is compatible
+
+    def __call__(self, val):
+        try:
+            convert = self.converters[type(val)]
+        except KeyError:
+            convert = self.converters[type(val)] = self._select(val)
+        return convert(val)
+
+    def _select(self, val):
+        try:
+            import numpy
+        except ImportError:
+            pass
+        else:
+            if isinstance(val, numpy.ndarray):
+                self.dtype = numpy.dtype(self.elemctype)
+                return self._from_ndarray
+
+        if isinstance(val, array.array):
+            return self._from_array
+        if isinstance(val, (list, tuple)):
+            return self._from_sequence
+
+        try:
+            memoryview(val)
+        except TypeError:
+            pass
+        else:
+            return self._from_buffer
+
+        try:
+            buffer(val)
+        except TypeError:
+            pass
+        else:
+            return self._from_old_buffer
+
+        return self._from_sequence
+
+    def _check_writable(self, readonly):
+        if self.writable and readonly:
+            raise TypeError('Array argument is read-only but the function '
+                            'writes to it.')
+
+    def _check_size(self, nbytes):
+        if nbytes % self.itemsize:
+            raise TypeError('Buffer size is not a multiple of the item size.')
+
+    def _check_dtype(self, dtype):
+        if dtype == self.dtype:
+            return
+        if dtype.names is not None and _is_struct(self.elemctype):
+            # Compare the layout; the dtype of a ctypes.Structure may
+            # differ in flags from an equivalent aligned dtype.
+            if _record_layout(dtype) == _record_layout(self.dtype):
+                return
+        raise TypeError('dtype of the numpy.ndarray '
+                        'does not match argument type.')
+
+    def _from_ndarray(self, val):
+        self._check_dtype(val.dtype)
+        if not val.flags.c_contiguous:
+            raise ValueError('numpy.ndarray is not contiguous.')
+        self._check_writable(not val.flags.writeable)
+        return ctypes.cast(val.ctypes.data, self.ptrtype)
+
+    def _from_array(self, val):
+        if _array_type_code_to_ctype[val.typecode]!=self.elemctype:
+            raise TypeError('array.array contains a different datatype.')
+
+        address, length = val.buffer_info()
+        return ctypes.cast(address, self.ptrtype)
+
+    def _from_buffer(self, val):
+        view = _Py_buffer()
+        _PyObject_GetBuffer(val, ctypes.byref(view),
+                            _PyBUF_C_CONTIGUOUS | _PyBUF_FORMAT)
+        try:
+            self._check_writable(view.readonly)
+            self._check_format(view.format, view.itemsize)
+            self._check_size(view.len)
+        except:
+            _PyBuffer_Release(ctypes.byref(view))
+            raise
+        return _BufferArgument(view, ctypes.cast(view.buf, self.ptrtype))
+
+    def _from_old_buffer(self, val):
+        ptr = ctypes.c_void_p()
+        size = ctypes.c_ssize_t()
+        if self.writable:
+            # Raises TypeError for read-only buffers.
+            _PyObject_AsWriteBuffer(val, ctypes.byref(ptr), ctypes.byref(size))
+        else:
+            _PyObject_AsReadBuffer(val, ctypes.byref(ptr), ctypes.byref(size))
+        self._check_size(size.value)
+        return ctypes.cast(ptr, self.ptrtype)
+
+    def _from_sequence(self, val):
+        # A copy. Writes by the native code are not visible to the caller.
+        if self.typecode is not None:
+            copy = array.array(self.typecode, val) # bulk conversion
+            address, length = copy.buffer_info()
+            return _Argument(ctypes.cast(address, self.ptrtype), copy)
+        if not isinstance(val, (list, tuple)):
+            val = list(val)
+        return (self.elemctype * len(val))(*val)
+
+    def _check_format(self, format, itemsize):
+        try:
+            ok = self.formats[format]
+        except KeyError:
+            ok = self.formats[format] = self._is_compatible(format, itemsize)
+        if not ok:
+            raise TypeError('Buffer of format "%s" does not match '
+                            'argument type.' % format)
+
+    def _is_compatible(self, format, itemsize):
+        if format is None or format in ('B', 'c'):
+            return True # raw bytes are reinterpreted
+        if _is_struct(self.elemctype): # e.g. ctypes arrays of the struct
+            return format.startswith('T{') and itemsize == self.itemsize
+        if format[0] in '@=' + _native_byteorder:
+            format = format[1:]
+        if len(format) != 1 or format not in _format_kind:
+            return False
+        return (_format_kind[format] == _format_kind.get(self.elemctype._type_)
+                and itemsize == self.itemsize)
+
+def _is_struct(ctype):
+    return issubclass(ctype, ctypes.Structure)
+
+def _record_layout(dtype):
+    '''Returns (itemsize, fields) of a structured numpy dtype, where fields
+    are (name, offset, layout or dtype) of each field.
+    '''
+    fields = []
+    for name in dtype.names:
+        fdtype, offset = dtype.fields[name][:2]
+        if fdtype.names is not None:
+            fdtype = _record_layout(fdtype)
+        fields.append((name, offset, fdtype))
+    return dtype.itemsize, fields
+
+_ndarray_structs = {}
+
+def ndarray_struct(elemctype, ndim):
+    '''Returns the ctypes structure of the descriptor of N-dimensional arrays.
+    '''
+    key = elemctype, ndim
+    try:
+        return _ndarray_structs[key]
+    except KeyError:
+        class NDArrayStruct(ctypes.Structure):
+            _fields_ = [
+                ('data',    ctypes.POINTER(elemctype)),
+                ('shape',   ctypes.c_int64 * ndim),
+                ('strides', ctypes.c_int64 * ndim),
+            ]
+        return _ndarray_structs.setdefault(key, NDArrayStruct)
+
+class NDArrayAdaptor(ArrayAdaptor):
+    '''Converts the arguments for an N-dimensional array parameter to
+    pointers to descriptors. Accepts numpy.ndarray and any object exporting
+    a strided buffer (e.g. memoryview). Views are passed without copying.
+    '''
+    def __init__(self, elemctype, ndim, writable=False):
+        super(NDArrayAdaptor, self).__init__(elemctype, writable)
+        self.ndim = ndim
+        self.struct = ndarray_struct(elemctype, ndim)
+
+    def _select(self, val):
+        try:
+            import numpy
+        except ImportError:
+            pass
+        else:
+            if isinstance(val, numpy.ndarray):
+                self.dtype = numpy.dtype(self.elemctype)
+                return self._from_ndarray
+
+        try:
+            memoryview(val)
+        except TypeError:
+            pass
+        else:
+            return self._from_buffer
+
+        raise TypeError('Cannot pass %s as %d-dimensional array.'
+                        % (type(val).__name__, self.ndim))
+
+    def _descriptor(self, data, shape, strides):
+        if len(shape) != self.ndim:
+            raise TypeError('Expecting %d-dimensional array, got %d dimensions.'
+                            % (self.ndim, len(shape)))
+        desc = self.struct()
+        desc.data = ctypes.cast(data, self.ptrtype)
+        for k in range(self.ndim):
+            if strides[k] % self.itemsize:
+                raise ValueError('Strides are not a multiple of the item size.')
+            desc.shape[k] = shape[k]
+            desc.strides[k] = strides[k] // self.itemsize
+        return desc
+
+    def _from_ndarray(self, val):
+        self._check_dtype(val.dtype)
+        self._check_writable(not val.flags.writeable)
+        desc = self._descriptor(val.ctypes.data, val.shape, val.strides)
+        return _Argument(ctypes.pointer(desc), val)
+
+    def _from_buffer(self, val):
+        view = _Py_buffer()
+        _PyObject_GetBuffer(val, ctypes.byref(view),
+                            _PyBUF_STRIDES | _PyBUF_FORMAT)
+        try:
+            self._check_writable(view.readonly)
+            self._check_format(view.format, view.itemsize)
+            if view.itemsize != self.itemsize:
+                raise TypeError('Buffer item size does not match argument type.')
+            if view.shape:
+                shape = [view.shape[k] for k in range(view.ndim)]
+            else:
+                shape = [view.len // view.itemsize]
+            if view.strides:
+                strides = [view.strides[k] for k in range(len(shape))]
+            else: # C-contiguous
+                strides = [view.itemsize] * len(shape)
+                for k in reversed(range(len(shape) - 1)):
+                    strides[k] = strides[k + 1] * shape[k + 1]
+            desc = self._descriptor(view.buf, shape, strides)
+        except:
+            _PyBuffer_Release(ctypes.byref(view))
+            raise
+        return _BufferArgument(view, ctypes.pointer(desc))
+
+_checked_array_structs = {}
+
+def checked_array_struct(elemctype):
+    '''Returns the ctypes structure of the descriptor of bounds-checked arrays.
+    '''
+    try:
+        return _checked_array_structs[elemctype]
+    except KeyError:
+        class CheckedArrayStruct(ctypes.Structure):
+            _fields_ = [
+                ('data',    ctypes.POINTER(elemctype)),
+                ('length',  ctypes.c_int64),
+            ]
+        return _checked_array_structs.setdefault(elemctype, CheckedArrayStruct)
+
+class CheckedArrayAdaptor(ArrayAdaptor):
+    '''Converts the arguments for an array parameter of a bounds-checked
+    function to pointers to descriptors. Accepts the same arguments as
+    ArrayAdaptor.
+    '''
+    def __init__(self, elemctype, writable=False):
+        super(CheckedArrayAdaptor, self).__init__(elemctype, writable)
+        self.struct = checked_array_struct(elemctype)
+
+    def __call__(self, val):
+        arg = super(CheckedArrayAdaptor, self).__call__(val)
+        desc = self.struct()
+        desc.data = ctypes.cast(getattr(arg, '_as_parameter_', arg), self.ptrtype)
+        desc.length = self._length(val, arg)
+        return _Argument(ctypes.pointer(desc), arg)
+
+    def _length(self, val, arg):
+        '''Number of elements of the argument converted by ArrayAdaptor.
+        '''
+        convert = self.converters[type(val)]
+        if convert == self._from_ndarray:
+            return val.size
+        elif convert == self._from_array:
+            return len(val)
+        elif convert == self._from_buffer:
+            return arg.view.len // self.itemsize
+        elif convert == self._from_old_buffer:
+            return len(buffer(val)) // self.itemsize
+        elif isinstance(arg, _Argument): # copy of a sequence
+            return len(arg.owner)
+        else:
+            return len(arg)
+
+_adaptors = {}
+
+def array_adaptor(elemctype, writable=False):
+    '''Returns the (shared) ArrayAdaptor for the element type.
+    '''
+    key = elemctype, writable
+    try:
+        return _adaptors[key]
+    except KeyError:
+        return _adaptors.setdefault(key, ArrayAdaptor(elemctype, writable))
+
+def ndarray_adaptor(elemctype, ndim, writable=False):
+    '''Returns the (shared) NDArrayAdaptor for the element type and the
+    number of dimensions.
+    '''
+    key = elemctype, ndim, writable
+    try:
+        return _adaptors[key]
+    except KeyError:
+        return _adaptors.setdefault(key, NDArrayAdaptor(elemctype, ndim, writable))
+
+def checked_array_adaptor(elemctype, writable=False):
+    '''Returns the (shared) CheckedArrayAdaptor for the element type.
+    '''
+    key = CheckedArrayAdaptor, elemctype, writable
+    try:
+        return _adaptors[key]
+    except KeyError:
+        return _adaptors.setdefault(key, CheckedArrayAdaptor(elemctype, writable))
@@ -0,0 +1,53 @@
+# Copyright (c) 2012, Siu Kwan Lam
+# All rights reserved.
+#
+# Reporting of the index violations detected by bounds-checked native code.
+# Does not depend on LLVM. Used by the JIT and by the AOT loader.
+#
+# The native code records the first violation of the thread in the runtime
+# (see Runtime.cpp) and returns from the function. The caller raises it as
+# IndexError after the call.
+#
+
+import ctypes
+
+# Prototypes of the functions of the runtime
+PENDING_PROTOTYPE = ctypes.CFUNCTYPE(ctypes.c_int)
+TAKE_PROTOTYPE = ctypes.CFUNCTYPE(ctypes.c_int,
+                                  ctypes.POINTER(ctypes.c_int64),
+                                  ctypes.POINTER(ctypes.c_int64),
+                                  ctypes.POINTER(ctypes.c_int32))
+
+PENDING_SYMBOL = 'pymothoa_bounds_error_pending'
+TAKE_SYMBOL = 'pymothoa_take_bounds_error'
+
+class BoundsChecker(object):
+    def __init__(self, pending, take):
+        '''
+        pending -- pymothoa_bounds_error_pending of the runtime.
+        take -- pymothoa_take_bounds_error of the runtime.
+        '''
+        self.pending = pending
+        self.take = take
+
+    @classmethod
+    def from_library(cls, lib):
+        '''The runtime linked into a shared library (see pymothoa.aot).
+        '''
+        return cls(PENDING_PROTOTYPE((PENDING_SYMBOL, lib)),
+                   TAKE_PROTOTYPE((TAKE_SYMBOL, lib)))
+
+    def __call__(self):
+        '''Raises IndexError for the violation recorded on this thread.
+        Does nothing if there is none.
+        '''
+        if not self.pending():
+            return
+        index = ctypes.c_int64()
+        length = ctypes.c_int64()
+        line = ctypes.c_int32()
+        if self.take(ctypes.byref(index), ctypes.byref(length),
+                     ctypes.byref(line)):
+            raise IndexError('index %d is out of bounds for length %d '
+                             '(line %d)' % (index.value, length.value,
+                                            line.value))
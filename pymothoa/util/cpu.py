@@ -0,0 +1,106 @@
+# Copyright (c) 2012, Siu Kwan Lam
+# All rights reserved.
+#
+# Runtime detection of the instruction set of the host CPU.
+# Does not depend on LLVM. Used for selecting the version of an AOT compiled
+# kernel (see pymothoa.aot) that suits the machine it runs on.
+#
+
+import sys
+import subprocess
+
+class ISALevel(object):
+    '''An instruction set level of x86-64.
+    '''
+    def __init__(self, name, cpu, requires):
+        '''
+        name -- Name of the level. Used in the suffix of the symbols.
+        cpu -- LLVM name of the CPU to compile for.
+        requires -- Features (as in /proc/cpuinfo) that the host must have.
+        '''
+        self.name = name
+        self.cpu = cpu
+        self.requires = frozenset(requires)
+
+    def is_supported(self, features=None):
+        '''Returns True if the host supports the level.
+        features -- The features of the host. Detected if it is None.
+        '''
+        if features is None:
+            features = host_features()
+        return self.requires.issubset(features)
+
+    def __repr__(self):
+        return 'ISALevel(%s)' % self.name
+
+# From the most capable to the least.
+ISA_LEVELS = [
+    ISALevel('avx2',    'core-avx2',    ['avx2', 'fma', 'bmi2', 'avx']),
+    ISALevel('avx',     'corei7-avx',   ['avx', 'sse4_2', 'popcnt']),
+    ISALevel('sse4.2',  'corei7',       ['sse4_2', 'popcnt']),
+    ISALevel('sse2',    'x86-64',       []),
+]
+
+_levels = dict((X.name, X) for X in ISA_LEVELS)
+
+def isa_level(name):
+    '''Returns the ISALevel of a name.
+    '''
+    try:
+        return _levels[name]
+    except KeyError:
+        raise ValueError('Unknown instruction set level: %s (expecting one '
+                         'of %s)' % (name, ', '.join(X.name for X in ISA_LEVELS)))
+
+_host_features = None
+
+_darwin_names = {'avx1_0': 'avx'}
+
+def host_features():
+    '''Returns the set of features of the host CPU with the names used by
+    /proc/cpuinfo (e.g. sse4_2, avx, avx2, fma, avx512f).
+    Returns an empty set if they cannot be detected.
+    '''
+    global _host_features
+    if _host_features is None:
+        _host_features = frozenset(_detect_features())
+    return _host_features
+
+def _detect_features():
+    if sys.platform.startswith('linux'):
+        try:
+            with open('/proc/cpuinfo') as fin:
+                for line in fin:
+                    key, _, value = line.partition(':')
+                    if key.strip() == 'flags':
+                        return value.split()
+        except IOError:
+            pass
+    elif sys.platform == 'darwin':
+        names = []
+        for key in ['machdep.cpu.features', 'machdep.cpu.leaf7_features']:
+            try:
+                names += subprocess.check_output(['sysctl', '-n', key]).split()
+            except (OSError, subprocess.CalledProcessError):
+                pass
+        # Same names as Linux
+        names = [X.lower().replace('.', '_') for X in names]
+        return [_darwin_names.get(X, X) for X in names]
+    return []
+
+def best_level(names=None, features=None):
+    '''Returns the most capable ISALevel that the host supports.
+
+    names -- Names of the candidate levels. Defaults to all levels.
+    features -- The features of the host. Detected if it is None.
+
+    Returns None if none of the candidates is supported.
+    '''
+    if names is None:
+        candidates = ISA_LEVELS
+    else:
+        candidates = sorted(map(isa_level, names), key=ISA_LEVELS.index)
+    for level in candidates:
+        if level.is_supported(features):
+            return level
+    return None
@@ -0,0 +1,101 @@
+# Copyright (c) 2012, Siu Kwan Lam
+# All rights reserved.
+#
+# A minimal thread-safe Future for the results of background work.
+# Can be bridged to an asyncio (or trollius) event loop.
+#
+
+import threading
+
+class TimeoutError(Exception):
+    pass
+
+class Future(object):
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._result = None
+        self._exc_info = None
+        self._callbacks = []
+
+    def done(self):
+        return self._event.is_set()
+
+    def wait(self, timeout=None):
+        '''Wait until the work is done.
+        Returns False if the timeout expires first.
+        '''
+        self._event.wait(timeout)
+        return self._event.is_set()
+
+    def result(self, timeout=None):
+        '''Returns the result of the work or raises its exception.
+        '''
+        if not self.wait(timeout):
+            raise TimeoutError()
+        if self._exc_info is not None:
+            exc_type, exc_value, exc_tb = self._exc_info
+            raise exc_type, exc_value, exc_tb
+        return self._result
+
+    def exception(self, timeout=None):
+        '''Returns the exception raised by the work or None.
+        '''
+        if not self.wait(timeout):
+            raise TimeoutError()
+        if self._exc_info is not None:
+            return self._exc_info[1]
+        return None
+
+    def add_done_callback(self, fn):
+        '''Call fn(future) when the work is done.
+        Called immediately if it is already done.
+        '''
+        with self._lock:
+            if not self.done():
+                self._callbacks.append(fn)
+                return
+        fn(self)
+
+    def set_result(self, value):
+        self._result = value
+        self._finish()
+
+    def set_exception_info(self, exc_info):
+        self._exc_info = exc_info
+        self._finish()
+
+    def _finish(self):
+        with self._lock:
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for fn in callbacks:
+            fn(self)
+
+    def as_asyncio(self, loop=None):
+        '''Returns an asyncio.Future that completes with this future.
+        The result is delivered on the thread of the event loop.
+        '''
+        try:
+            import asyncio
+        except ImportError:
+            import trollius as asyncio
+
+        if loop is None:
+            loop = asyncio.get_event_loop()
+        if hasattr(loop, 'create_future'):
+            target = loop.create_future()
+        else:
+            target = asyncio.Future(loop=loop)
+
+        def settle():
+            if target.cancelled():
+                return
+            exc = self.exception()
+            if exc is not None:
+                target.set_exception(exc)
+            else:
+                target.set_result(self._result)
+
+        self.add_done_callback(lambda _: loop.call_soon_threadsafe(settle))
+        return target
@@ -0,0 +1,211 @@
+# Copyright (c) 2012, Siu Kwan Lam
+# All rights reserved.
+#
+# Memory layout of records (see pymothoa.types.Struct).
+# Does not depend on LLVM. Requires numpy for the array functions.
+#
+#   Particle = Struct('Particle', [('x', Double), ('y', Double),
+#                                  ('mass', Float)])
+#
+#   records = aos(Particle, n)      # array-of-structs: one Array(Particle)
+#   columns = soa(Particle, n)      # struct-of-arrays: an Array(T) per field
+#
+# A kernel that reads a record of an array-of-structs brings the whole record
+# into the cache. That is good when the kernel uses most of the fields of
+# each record. When it uses a few of them, the other bytes of each cache line
+# are wasted and a struct-of-arrays is faster; each field is a contiguous
+# stream that can be vectorized. choose_layout() picks one of the two.
+#
+
+import ast
+import ctypes
+import inspect
+import textwrap
+from collections import OrderedDict
+
+from pymothoa import types
+
+AOS = 'aos'     # array-of-structs
+SOA = 'soa'     # struct-of-arrays
+
+_scalar_ctypes = {
+    types.Int8      : ctypes.c_int8,
+    types.Int16     : ctypes.c_int16,
+    types.Int32     : ctypes.c_int32,
+    types.Int64     : ctypes.c_int64,
+    types.UInt8     : ctypes.c_uint8,
+    types.UInt16    : ctypes.c_uint16,
+    types.UInt32    : ctypes.c_uint32,
+    types.UInt64    : ctypes.c_uint64,
+    types.Float     : ctypes.c_float,
+    types.Double    : ctypes.c_double,
+}
+
+_dtype_to_scalar = {
+    'int8'    : types.Int8,
+    'int16'   : types.Int16,
+    'int32'   : types.Int32,
+    'int64'   : types.Int64,
+    'uint8'   : types.UInt8,
+    'uint16'  : types.UInt16,
+    'uint32'  : types.UInt32,
+    'uint64'  : types.UInt64,
+    'float32' : types.Float,
+    'float64' : types.Double,
+}
+
+_struct_ctypes = {}
+
+def field_ctype(ty):
+    '''Returns the ctype of a field type.
+    '''
+    if isinstance(ty, types.Struct):
+        return struct_ctype(ty)
+    return _scalar_ctypes[ty]
+
+def struct_ctype(struct):
+    '''Returns the ctypes.Structure of a Struct. Its layout is the layout of
+    the struct in the native code.
+    '''
+    try:
+        return _struct_ctypes[struct]
+    except KeyError:
+        ctype = type(struct.name, (ctypes.Structure,), {
+                    '_fields_': [(fname, field_ctype(ty))
+                                 for fname, ty in struct.fields],
+                })
+        return _struct_ctypes.setdefault(struct, ctype)
+
+def sizeof(struct):
+    '''Size of a record in bytes, including the padding.
+    '''
+    return ctypes.sizeof(struct_ctype(struct))
+
+def offsets(struct):
+    '''Returns the offset in bytes of each field.
+    '''
+    ctype = struct_ctype(struct)
+    return [getattr(ctype, fname).offset for fname in struct.names()]
+
+def struct_dtype(struct):
+    '''Returns the numpy.dtype of the records of a Struct.
+    '''
+    import numpy
+    formats = []
+    for _, ty in struct.fields:
+        if isinstance(ty, types.Struct):
+            formats.append(struct_dtype(ty))
+        else:
+            formats.append(numpy.dtype(_scalar_ctypes[ty]))
+    return numpy.dtype({'names'     : struct.names(),
+                        'formats'   : formats,
+                        'offsets'   : offsets(struct),
+                        'itemsize'  : sizeof(struct)})
+
+def struct_from_dtype(dtype, name='record'):
+    '''Returns the Struct of the records of a numpy structured dtype.
+    Raises TypeError if the dtype is not laid out as a C struct; create it
+    with numpy.dtype(..., align=True) or struct_dtype().
+    '''
+    fields = []
+    for fname in dtype.names:
+        fdtype = dtype.fields[fname][0]
+        if fdtype.names is not None:
+            fields.append((fname, struct_from_dtype(fdtype, fname)))
+        elif fdtype.isnative and fdtype.name in _dtype_to_scalar:
+            fields.append((fname, _dtype_to_scalar[fdtype.name]))
+        else:
+            raise TypeError('Unsupported dtype of field %s: %s'
+                            % (fname, fdtype))
+    struct = types.Struct(name, fields)
+    if not is_c_layout(dtype, struct):
+        raise TypeError('Structured dtype is not laid out as a C struct. '
+                        'Use align=True.')
+    return struct
+
+def is_c_layout(dtype, struct):
+    '''Returns True if the records of the numpy dtype are laid out as the
+    struct in the native code.
+    '''
+    if dtype.names is None or list(dtype.names) != struct.names():
+        return False
+    if dtype.itemsize != sizeof(struct):
+        return False
+    for (fname, ty), offset in zip(struct.fields, offsets(struct)):
+        fdtype, foffset = dtype.fields[fname][:2]
+        if foffset != offset:
+            return False
+        if isinstance(ty, types.Struct):
+            if not is_c_layout(fdtype, ty):
+                return False
+        elif (not fdtype.isnative
+              or _dtype_to_scalar.get(fdtype.name) is not ty):
+            return False
+    return True
+
+def aos(struct, n):
+    '''Returns a zero-filled array-of-structs of n records.
+    '''
+    import numpy
+    return numpy.zeros(n, dtype=struct_dtype(struct))
+
+def soa(struct, n):
+    '''Returns a zero-filled struct-of-arrays of n records: an ordered dict
+    of an array for each field.
+    '''
+    import numpy
+    columns = OrderedDict()
+    for fname, ty in struct.fields:
+        if isinstance(ty, types.Struct):
+            columns[fname] = aos(ty, n)
+        else:
+            columns[fname] = numpy.zeros(n, dtype=_scalar_ctypes[ty])
+    return columns
+
+def to_soa(records):
+    '''Copy an array-of-structs into a struct-of-arrays.
+    '''
+    import numpy
+    return OrderedDict((fname, numpy.ascontiguousarray(records[fname]))
+                       for fname in records.dtype.names)
+
+def to_aos(struct, columns):
+    '''Copy a struct-of-arrays into an array-of-structs.
+    '''
+    n = len(columns[struct.names()[0]])
+    records = aos(struct, n)
+    for fname in struct.names():
+        records[fname] = columns[fname]
+    return records
+
+def accessed_fields(func, argname):
+    '''Returns the names of the fields of the records of an array argument
+    that a function reads or writes (as in argname[i].field).
+
+    func -- A Python function or a JIT function.
+    '''
+    func = getattr(func, 'code_python', func)
+    tree = ast.parse(textwrap.dedent(inspect.getsource(func)))
+    fields = set()
+    for node in ast.walk(tree):
+        if (isinstance(node, ast.Attribute)
+            and isinstance(node.value, ast.Subscript)
+            and isinstance(node.value.value, ast.Name)
+            and node.value.value.id == argname):
+            fields.add(node.attr)
+    return frozenset(fields)
+
+def choose_layout(struct, fields, threshold=0.5):
+    '''Returns AOS or SOA for a kernel that accesses some fields of each
+    record.
+
+    fields -- Names of the accessed fields. See accessed_fields().
+    threshold -- Use AOS if the accessed fields are at least this fraction
+                 of the bytes of a record.
+    '''
+    used = 0
+    for fname in set(fields):
+        used += ctypes.sizeof(field_ctype(struct.field_type(fname)))
+    if used >= threshold * sizeof(struct):
+        return AOS
+    return SOA
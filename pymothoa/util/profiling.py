@@ -0,0 +1,162 @@
+# Copyright (c) 2012, Siu Kwan Lam
+# All rights reserved.
+#
+# Call counts and native time of the JIT functions of a module.
+# Does not depend on LLVM.
+#
+#   module = JITModule('kernels', modargs={'profile': True})
+#   ...
+#   module.print_stats()
+#   module.dump_stats('kernels.prof')   # read with pstats.Stats
+#
+# The time of a call is split in the marshalling of the arguments (the
+# adaptors of run_jit) and the native code. Functions that are called
+# through a trampoline unbox their arguments in the native code; their
+# marshalling time is counted as native time.
+#
+
+import inspect
+import marshal
+import threading
+from timeit import default_timer as timer
+
+class FunctionStats(object):
+    '''Accumulated statistics of one native function.
+    '''
+    def __init__(self, name, filename, lineno):
+        self.name = name
+        self.filename = filename
+        self.lineno = lineno
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.calls = 0
+            self.native_time = 0.0  # seconds in the native code
+            self.max_time = 0.0     # longest native call
+            self.marshal_time = 0.0 # seconds converting the arguments
+
+    def add(self, native, marshalling=0.0):
+        with self._lock:
+            self.calls += 1
+            self.native_time += native
+            self.marshal_time += marshalling
+            if native > self.max_time:
+                self.max_time = native
+
+    @property
+    def mean_time(self):
+        if not self.calls:
+            return 0.0
+        return self.native_time / self.calls
+
+    @property
+    def total_time(self):
+        return self.native_time + self.marshal_time
+
+    def key(self):
+        '''The key of the function in a pstats dump.
+        '''
+        return (self.filename, self.lineno, self.name)
+
+    def __repr__(self):
+        return '<%s: %d calls, %.3gs native, %.3gs marshal>' % (
+                    self.name, self.calls, self.native_time,
+                    self.marshal_time)
+
+def timed(stats, fn):
+    '''Returns a function that calls fn and adds the time of the call
+    to stats.
+    '''
+    def call(*args):
+        start = timer()
+        try:
+            return fn(*args)
+        finally:
+            stats.add(timer() - start)
+    return call
+
+class Profiler(object):
+    '''Statistics of the functions of a module.
+
+    In pstats, the native time is the "tottime" and the native and the
+    marshalling time is the "cumtime".
+    '''
+    def __init__(self):
+        self.functions = {} # LLVMFuncDef -> FunctionStats
+        self._lock = threading.Lock()
+
+    def register(self, fn):
+        '''Returns the FunctionStats of a JIT function.
+        '''
+        with self._lock:
+            try:
+                return self.functions[fn]
+            except KeyError:
+                code = fn.code_python
+                try:
+                    filename = inspect.getsourcefile(code)
+                except TypeError:
+                    filename = None
+                stats = FunctionStats(fn.code_llvm.name(),
+                                      filename or code.func_code.co_filename,
+                                      code.func_code.co_firstlineno)
+                self.functions[fn] = stats
+                return stats
+
+    def stats(self):
+        '''Returns a dict of function name -> FunctionStats.
+        '''
+        with self._lock:
+            return dict((stats.name, stats)
+                        for stats in self.functions.values())
+
+    def reset(self):
+        for stats in self.stats().values():
+            stats.reset()
+
+    def table(self):
+        '''Returns the statistics as the table of cProfile: a dict of
+        (filename, lineno, name) -> (calls, calls, tottime, cumtime, callers).
+        Functions that were not called are omitted.
+        '''
+        table = {}
+        for stats in self.stats().values():
+            if stats.calls:
+                table[stats.key()] = (stats.calls, stats.calls,
+                                      stats.native_time, stats.total_time, {})
+        return table
+
+    def pstats(self):
+        '''Returns a pstats.Stats of the statistics.
+        '''
+        import pstats
+        return pstats.Stats(_Table(self.table()))
+
+    def dump(self, path):
+        '''Write the statistics in the format of cProfile.Profile.dump_stats.
+        '''
+        with open(path, 'wb') as fout:
+            marshal.dump(self.table(), fout)
+
+    def print_stats(self, sort='native_time'):
+        '''Print a table of the functions, sorted by the given attribute of
+        FunctionStats in decreasing order.
+        '''
+        ordered = sorted(self.stats().values(),
+                         key=lambda X: getattr(X, sort), reverse=True)
+        print '%8s %12s %12s %12s %12s  %s' % ('calls', 'native', 'mean',
+                                              'max', 'marshal', 'function')
+        for stats in ordered:
+            print '%8d %12.6f %12.6f %12.6f %12.6f  %s' % (
+                    stats.calls, stats.native_time, stats.mean_time,
+                    stats.max_time, stats.marshal_time, stats.name)
+
+class _Table(object):
+    # The interface of a profiler expected by pstats.Stats.
+    def __init__(self, table):
+        self.table = table
+
+    def create_stats(self):
+        self.stats = self.table
@@ -87,3 +87,31 @@ def benchmark(title=''):
     yield bm
     BENCHMARK_SUMMARY.append(bm)
 
+
+def benchmark_dispatch(funcdef, args, repeat=100000):
+    '''Measure the per-call overhead of calling a JIT function through the
+    ctypes dispatcher (run_jit) and through the trampoline (__call__).
+
+    Use a function that does little work so that the dispatch dominates.
+    The benchmark is added to the summary. Returns a dict mapping each entry
+    to the time per call in seconds.
+    '''
+    funcdef(*args) # bind the function before timing
+
+    run_jit = funcdef.run_jit
+    name = 'Dispatch overhead of %s (%d calls)' % (
+                funcdef.code_python.__name__, repeat)
+    bm = Benchmark(name)
+
+    loop = xrange(repeat)
+    with bm.entry('ctypes'):
+        for _ in loop:
+            run_jit(*args)
+
+    with bm.entry('trampoline'):
+        for _ in loop:
+            funcdef(*args)
+
+    BENCHMARK_SUMMARY.append(bm)
+    return dict((entry, timer.duration() / repeat)
+                for entry, timer in bm.entries.items())
@@ -4,7 +4,7 @@ from distutils.core import setup, Extension
 import os, sys
 
 LLVM_CONFIG_PATH = 'llvm-config'
-LLVM_LIBS = 'core jit native vectorize ipo ipa transformutils instcombine instrumentation'
+LLVM_LIBS = 'core jit native vectorize ipo ipa transformutils instcombine instrumentation bitreader bitwriter'
 #LLVM_LIBS = 'all'
 
 def llvm_config(args):
@@ -40,7 +40,7 @@ def create_llvm_wrapper():
             define_macros   = llvm_config_macros(),
             include_dirs    = INC,
             library_dirs    = [llvm_config('--libdir')],
-            libraries       = llvm_config_static_lib(),
+            libraries       = llvm_config_static_lib() + ['pthread'],
             extra_link_args = [llvm_config('--ldflags')],
 #            extra_objects  = llvm_config_static_lib(),
             language        = 'c++',
@@ -57,10 +57,12 @@ setup (name = 'Pymothoa',
        package_dir={'pymothoa.llvm_backend.llvm': 'llvm'},
        packages = [ 'pymothoa',
                     'pymothoa.llvm_backend',
+                    'pymothoa.llvm_backend.llvm',
                     'pymothoa.util',
                     'pymothoa.builtins',],
 
-       py_modules = ['pymothoa.llvm_backend.llvm.llvm_wrapper'],
+       # The runtime is linked into the libraries built by pymothoa.aot
+       package_data = {'pymothoa.llvm_backend.llvm': ['src/Runtime.cpp']},
 
        ext_modules = [ext_llvm_wrapper])
 
@@ -0,0 +1,109 @@
+import logging
+#logging.basicConfig(level=logging.DEBUG)
+
+from pymothoa.jit import default_module, function
+from pymothoa.types import *
+from pymothoa.dialect import *
+
+@function(ret=Int, args=[Int, Int])
+def test_add(A, B):
+    return A + B
+
+@function(ret=Double, args=[Array(Double), Int])
+def test_sum(A, n):
+    var ( total = Double )
+    total = 0
+    for i in xrange(n):
+        total += A[i]
+    return total
+
+@function(ret=Double, args=[Array(Double), Int])
+def test_parallel_sum(A, n):
+    var ( total = Double )
+    total = 0
+    for i in prange(n):
+        total += A[i]
+    return total
+
+@function(ret=Bool, args=[Double, Double])
+def test_less(A, B):
+    return A < B
+
+@function(ret=Int, args=[Int], later=True)
+def test_later(A):
+    return A * 3
+
+default_module.optimize()
+
+#-------------------------------------------------------------------------------
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+import numpy as np
+from pymothoa import aot
+from pymothoa.util import cpu
+
+class Test(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'kernels.so')
+        functions = aot.collect_functions(sys.modules[__name__])
+        aot.build(functions, self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_collect(self):
+        functions = dict(aot.collect_functions(sys.modules[__name__]))
+        self.assertEqual(sorted(functions), ['test_add', 'test_later',
+                                             'test_less', 'test_parallel_sum',
+                                             'test_sum'])
+        self.assertTrue(test_later.compiled)
+
+    def test_load(self):
+        lib = aot.load(self.path)
+        self.assertEqual(lib.test_add(1, 2), 3)
+        self.assertEqual(lib.test_later(5), 15)
+        self.assertIs(lib.test_less(1.0, 2.0), True)
+
+        A = np.random.random(1000)
+        self.assertAlmostEqual(lib.test_sum(A, len(A)), A.sum())
+        self.assertAlmostEqual(lib.test_parallel_sum(A, len(A)), A.sum())
+
+    def test_namespace(self):
+        namespace = {}
+        aot.load(self.path, namespace)
+        self.assertEqual(namespace['test_add'](3, 4), 7)
+
+    def test_isa(self):
+        path = os.path.join(self.tmpdir, 'kernels_isa.so')
+        functions = aot.collect_functions(sys.modules[__name__])
+        aot.build(functions, path, isa=['avx2', 'sse2'])
+
+        lib = aot.load(path)
+        self.assertEqual(lib.isa, cpu.best_level(['avx2', 'sse2']).name)
+        self.assertEqual(lib.test_add(1, 2), 3)
+
+        # The baseline runs everywhere.
+        lib = aot.load(path, isa='sse2')
+        self.assertEqual(lib.isa, 'sse2')
+        A = np.random.random(1000)
+        self.assertAlmostEqual(lib.test_sum(A, len(A)), A.sum())
+        self.assertTrue(lib.test_sum.symbol.endswith('.isa_sse2'))
+
+        with self.assertRaises(ImportError):
+            aot.load(path, isa='avx')
+        self.assertIsNone(aot.load(self.path).isa)
+
+    def test_errors(self):
+        lib = aot.load(self.path)
+        with self.assertRaises(TypeError):
+            lib.test_add(1)
+        with self.assertRaises(AttributeError):
+            lib.missing
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import logging
+#logging.basicConfig(level=logging.DEBUG)
+
+from pymothoa.jit import JITModule, default_module, function
+from pymothoa.types import *
+from pymothoa.dialect import *
+
+@function(ret=Int, args=[Int, Int], background=True)
+def test_add(A, B):
+    return A + B
+
+@function(ret=Double, args=[Array(Double), Int], background=True)
+def test_sum(A, n):
+    var ( total = Double )
+    total = 0
+    for i in xrange(n):
+        total += A[i]
+    return total
+
+default_module.optimize() # waits for the background compilations
+
+pending = JITModule('testbackground_pending')
+
+@pending.function(ret=Int, args=[Int], background=True)
+def test_square(A):
+    return A * A
+
+@pending.function(ret=Int, args=[Int], background=True, fallback=True)
+def test_cube(A):
+    return A * A * A
+
+@pending.function(ret=Int, args=[Int], background=True)
+def test_bad(A):
+    return undefined_symbol + A
+
+locked = JITModule('testbackground_locked')
+
+@locked.function(ret=Int, args=[Int], later=True)
+def test_double(A):
+    return A * 2
+
+#-------------------------------------------------------------------------------
+
+import time
+import unittest
+import numpy as np
+from pymothoa.compiler_errors import CompilerError
+from pymothoa.util.future import Future
+from pymothoa.llvm_backend.module import compile_lock
+
+class Test(unittest.TestCase):
+    def test_future(self):
+        self.assertIsInstance(test_add.future, Future)
+        self.assertTrue(test_add.future.done())
+        test_add.future.result()
+        self.assertEqual(test_add(1, 2), 3)
+
+        A = np.arange(10, dtype=np.float64)
+        self.assertEqual(test_sum(A, len(A)), A.sum())
+
+    def test_blocking_call(self):
+        # waits for the compilation if it is still running
+        self.assertEqual(test_square(7), 49)
+        self.assertTrue(test_square.future.done())
+
+    def test_fallback(self):
+        # correct whether it ran in Python or in native code
+        self.assertEqual(test_cube(3), 27)
+        test_cube.future.result()
+        self.assertEqual(test_cube(4), 64)
+
+    def test_error(self):
+        self.assertIsInstance(test_bad.future.exception(), CompilerError)
+        with self.assertRaises(CompilerError):
+            test_bad(1)
+
+    def test_asyncio(self):
+        try:
+            import asyncio
+        except ImportError:
+            try:
+                import trollius as asyncio
+            except ImportError:
+                self.skipTest('asyncio is not available')
+        loop = asyncio.new_event_loop()
+        try:
+            future = test_square.future.as_asyncio(loop=loop)
+            loop.run_until_complete(future)
+            self.assertTrue(future.done())
+        finally:
+            loop.close()
+
+    def test_serialized(self):
+        # The code generation holds compile_lock. A background job waits
+        # while another thread compiles, and the other way around.
+        with compile_lock:
+            future = test_double.compile_async()
+            time.sleep(0.2)
+            self.assertFalse(future.done())
+        future.result()
+        self.assertEqual(test_double(21), 42)
+
+    def test_wait(self):
+        pending.wait()
+        for fn in [test_square, test_cube, test_bad]:
+            self.assertTrue(fn.future.done())
+
+if __name__ == '__main__':
+    unittest.main()
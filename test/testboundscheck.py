@@ -0,0 +1,205 @@
+import logging
+#logging.basicConfig(level=logging.DEBUG)
+
+from pymothoa.jit import JITModule
+from pymothoa.types import *
+from pymothoa.dialect import *
+
+checked = JITModule('testboundscheck', modargs={'boundscheck': True})
+
+@checked.function(ret=Double, args=[Array(Double), Int])
+def test_get(A, i):
+    return A[i]
+
+@checked.function(args=[Array(Double), Int, Double])
+def test_set(A, i, value):
+    A[i] = value
+
+@checked.function(args=[Array(Double), Int, Double])
+def test_fill(A, n, value):
+    # The checks of A[i] are done once before the loop.
+    for i in xrange(n):
+        A[i] = value
+
+@checked.function(ret=Double, args=[Array(Double), Int, Int, Int])
+def test_step_sum(A, begin, end, step):
+    var ( total = Double )
+    total = 0
+    for i in xrange(begin, end, step):
+        total += A[i]
+    return total
+
+@checked.function(ret=Double, args=[Array(Double), Int])
+def test_shifted_sum(A, n):
+    var ( total = Double )
+    total = 0
+    for i in xrange(n):
+        total += A[i + 1]
+    return total
+
+@checked.function(args=[Array(Double), Int, Int])
+def test_guarded_fill(A, n, m):
+    for i in xrange(n):
+        if i < m:
+            A[i] = 1
+
+@checked.function(ret=Int, args=[Array(Double), Int])
+def test_find_zero(A, n):
+    for i in xrange(n):
+        if A[i] == 0:
+            return i
+    return -1
+
+@checked.function(ret=Double, args=[Array(Double), Int])
+def test_slice(A, offset):
+    return test_get(A[offset:], 0)
+
+@checked.function(ret=Int, args=[Int])
+def test_local(i):
+    var ( A = Array(Int, 4) )
+    for j in xrange(4):
+        A[j] = j
+    return A[i]
+
+@checked.function(ret=Double, args=[Array(Double), Int])
+def test_parallel_sum(A, n):
+    var ( total = Double )
+    total = 0
+    for i in prange(n):
+        total += A[i]
+    return total
+
+@checked.function(ret=Double, args=[NDArray(Double, 2), Int, Int])
+def test_get2d(A, i, j):
+    return A[i, j]
+
+@checked.vectorize(ret=Double, args=[Double])
+def test_twice(x):
+    return 2 * x
+
+checked.optimize()
+
+invalid = JITModule('testboundscheck_invalid', modargs={'boundscheck': True})
+
+@invalid.function(args=[Array(Double), Array(Double)], later=True)
+def test_bad_assign(A, B):
+    A = B
+
+#-------------------------------------------------------------------------------
+
+import unittest
+import array
+import numpy as np
+from pymothoa.compiler_errors import CompilerError, InvalidUseOfConstruct
+
+class Test(unittest.TestCase):
+    def test_in_bounds(self):
+        A = np.arange(10, dtype=np.float64)
+        self.assertEqual(test_get(A, 9), 9)
+        test_set(A, 0, 42)
+        self.assertEqual(A[0], 42)
+        test_fill(A, len(A), 1.5)
+        self.assertTrue((A == 1.5).all())
+
+    def test_out_of_bounds(self):
+        A = np.arange(10, dtype=np.float64)
+        for i in [10, 11, -1]:
+            with self.assertRaises(IndexError):
+                test_get(A, i)
+            with self.assertRaises(IndexError):
+                test_set(A, i, 1)
+        self.assertTrue((A == np.arange(10)).all())
+        # no violation left behind
+        self.assertEqual(test_get(A, 3), 3)
+
+    def test_message(self):
+        with self.assertRaises(IndexError) as handle:
+            test_get(array.array('d', [1, 2, 3]), 5)
+        message = str(handle.exception)
+        self.assertIn('index 5', message)
+        self.assertIn('length 3', message)
+        self.assertIn('line', message)
+
+    def test_lengths(self):
+        for A in [[1.0, 2.0], (1.0, 2.0), array.array('d', [1, 2]),
+                  bytearray(16), np.zeros(2)]:
+            test_get(A, 1)
+            with self.assertRaises(IndexError):
+                test_get(A, 2)
+
+    def test_hoisted(self):
+        # The violation is found before the loop writes anything.
+        A = np.zeros(10)
+        with self.assertRaises(IndexError):
+            test_fill(A, 11, 1)
+        self.assertTrue((A == 0).all())
+        test_fill(A, 0, 1) # an empty loop checks nothing
+        test_fill(A, -5, 1)
+
+    def test_step(self):
+        A = np.arange(10, dtype=np.float64)
+        self.assertEqual(test_step_sum(A, 0, 10, 4), 0 + 4 + 8)
+        self.assertEqual(test_step_sum(A, 1, 10, 3), 1 + 4 + 7)
+        with self.assertRaises(IndexError):
+            test_step_sum(A, 0, 11, 5)
+        with self.assertRaises(IndexError):
+            test_step_sum(A, -1, 5, 1)
+
+    def test_not_hoisted(self):
+        A = np.arange(10, dtype=np.float64)
+        self.assertEqual(test_shifted_sum(A, 9), A[1:].sum())
+        with self.assertRaises(IndexError):
+            test_shifted_sum(A, 10)
+
+    def test_guarded(self):
+        # Accesses behind a condition or an early exit are checked where
+        # they run.
+        A = np.zeros(10)
+        test_guarded_fill(A, 20, 10)
+        self.assertTrue((A == 1).all())
+        with self.assertRaises(IndexError):
+            test_guarded_fill(A, 20, 11)
+        A[3] = 0
+        self.assertEqual(test_find_zero(A, 20), 3)
+
+    def test_slice(self):
+        A = np.arange(10, dtype=np.float64)
+        self.assertEqual(test_slice(A, 9), 9)
+        with self.assertRaises(IndexError):
+            test_slice(A, 10) # empty slice
+        with self.assertRaises(IndexError):
+            test_slice(A, 11)
+
+    def test_local(self):
+        self.assertEqual(test_local(3), 3)
+        with self.assertRaises(IndexError):
+            test_local(4)
+
+    def test_parallel(self):
+        A = np.arange(1000, dtype=np.float64)
+        self.assertEqual(test_parallel_sum(A, len(A)), A.sum())
+        with self.assertRaises(IndexError):
+            test_parallel_sum(A, len(A) + 1)
+
+    def test_ndarray(self):
+        A = np.arange(12, dtype=np.float64).reshape(3, 4)
+        self.assertEqual(test_get2d(A, 2, 3), 11)
+        self.assertEqual(test_get2d(A.T, 3, 2), 11)
+        with self.assertRaises(IndexError):
+            test_get2d(A, 3, 0)
+        with self.assertRaises(IndexError):
+            test_get2d(A, 0, 4)
+
+    def test_vectorize(self):
+        A = np.arange(5, dtype=np.float64)
+        self.assertTrue((test_twice(A) == 2 * A).all())
+        with self.assertRaises(ValueError):
+            test_twice(A, out=np.zeros(4))
+
+    def test_reject_assign(self):
+        with self.assertRaises(CompilerError) as handle:
+            test_bad_assign.compile()
+        self.assertTrue(handle.exception.is_due_to(InvalidUseOfConstruct))
+
+if __name__ == '__main__':
+    unittest.main()
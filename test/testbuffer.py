@@ -0,0 +1,111 @@
+import logging
+#logging.basicConfig(level=logging.DEBUG)
+
+from pymothoa.jit import default_module, function
+from pymothoa.types import *
+from pymothoa.dialect import *
+
+@function(ret=Double, args=[Array(Double), Int])
+def test_sum(A, n):
+    var ( total = Double )
+    total = 0
+    for i in xrange(n):
+        total += A[i]
+    return total
+
+@function(args=[Array(Double), Double, Int])
+def test_fill(A, value, n):
+    for i in xrange(n):
+        A[i] = value
+
+@function(ret=Int, args=[Array(Int32), Int])
+def test_sum_int(A, n):
+    var ( total = Int )
+    total = 0
+    for i in xrange(n):
+        total += A[i]
+    return total
+
+default_module.optimize()
+
+#-------------------------------------------------------------------------------
+
+import array
+import ctypes
+import mmap
+import struct
+import unittest
+import numpy as np
+
+def pack(values):
+    return struct.pack('%dd' % len(values), *values)
+
+class Test(unittest.TestCase):
+    def test_written_args(self):
+        self.assertEqual(test_sum.written_args, frozenset())
+        self.assertEqual(test_fill.written_args, frozenset([0]))
+
+    def test_buffers(self):
+        values = [1.0, 2.0, 3.5]
+        expect = sum(values)
+        for buf in [bytearray(pack(values)),
+                    memoryview(bytearray(pack(values))),
+                    (ctypes.c_double * 3)(*values),
+                    array.array('d', values),
+                    np.array(values),
+                    pack(values)]:
+            self.assertEqual(test_sum(buf, 3), expect)
+
+    def test_mmap(self):
+        buf = mmap.mmap(-1, 8 * 4)
+        test_fill(buf, 2.5, 4)
+        self.assertEqual(struct.unpack('4d', buf[:]), (2.5,) * 4)
+        self.assertEqual(test_sum(buf, 4), 10.0)
+
+    def test_zero_copy(self):
+        buf = bytearray(8 * 4)
+        test_fill(buf, 1.5, 4)
+        self.assertEqual(struct.unpack('4d', bytes(buf)), (1.5,) * 4)
+        buf.extend(b'\0' * 8) # the buffer is released after the call
+
+        values = (ctypes.c_double * 4)()
+        test_fill(values, -1.0, 4)
+        self.assertEqual(list(values), [-1.0] * 4)
+
+        view = memoryview(buf)[8:]
+        test_fill(view, 3.0, 1)
+        self.assertEqual(struct.unpack('d', bytes(buf[8:16])), (3.0,))
+
+    def test_sequences(self):
+        self.assertEqual(test_sum([1.0, 2.0, 3.0], 3), 6.0)
+        self.assertEqual(test_sum((1, 2, 3), 3), 6.0)
+        self.assertEqual(test_sum(xrange(4), 4), 6.0)
+        self.assertEqual(test_sum_int([1, 2, 3], 3), 6)
+
+    def test_readonly(self):
+        A = np.zeros(4)
+        A.flags.writeable = False
+        self.assertEqual(test_sum(A, 4), 0)
+        with self.assertRaises(TypeError):
+            test_fill(A, 1.0, 4)
+        with self.assertRaises(TypeError):
+            test_fill(pack([0.0] * 4), 1.0, 4)
+
+    def test_format(self):
+        with self.assertRaises(TypeError):
+            test_sum((ctypes.c_float * 4)(), 4)
+        with self.assertRaises(TypeError):
+            test_sum_int((ctypes.c_double * 4)(), 4)
+        with self.assertRaises(TypeError):
+            test_sum(bytearray(7), 0)
+        with self.assertRaises(TypeError):
+            test_sum(np.zeros(4, dtype=np.float32), 4)
+
+    def test_contiguous(self):
+        A = np.arange(10, dtype=np.float64)
+        self.assertEqual(test_sum(A[2:], 8), A[2:].sum())
+        with self.assertRaises(ValueError):
+            test_sum(A[::2], 5)
+
+if __name__ == '__main__':
+    unittest.main()
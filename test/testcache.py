@@ -0,0 +1,115 @@
+import logging
+#logging.basicConfig(level=logging.DEBUG)
+
+import shutil
+import tempfile
+
+from pymothoa.jit import JITModule
+from pymothoa.types import *
+from pymothoa.dialect import *
+from pymothoa.llvm_backend.cache import CompilationCache
+
+def test_sum(A, B):
+    var ( res = Int )
+    res = 0
+    for i in xrange(A, B):
+        res += i * i
+    return res
+
+def test_sum_py(A, B):
+    return sum(i * i for i in xrange(A, B))
+
+Elem = Int32
+
+def test_alias(A, B):
+    var ( res = Elem )
+    res = A
+    return res + B
+
+def test_psum(A, B):
+    var ( res = Int )
+    res = 0
+    for i in prange(A, B):
+        res += i * i
+    return res
+
+def compile_in_new_module(name, cache, func=test_sum):
+    module = JITModule(name, modargs={'cache': cache})
+    fn = module.function(ret=Int, args=[Int, Int], later=True)(func)
+    fn.compile()
+    return fn
+
+#-------------------------------------------------------------------------------
+
+import os
+import unittest
+
+class Test(unittest.TestCase):
+    def setUp(self):
+        self.cachedir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cachedir)
+
+    def test_hit(self):
+        cache = CompilationCache(self.cachedir)
+
+        first = compile_in_new_module('testcache_1', cache)
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.hits, 0)
+        self.assertEqual(cache.stats()['entries'], 1)
+
+        second = compile_in_new_module('testcache_2', cache)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.stats()['entries'], 1)
+
+        for args in [(0, 10), (3, 100), (-5, 5)]:
+            self.assertEqual(first(*args), test_sum_py(*args))
+            self.assertEqual(second(*args), test_sum_py(*args))
+
+    def test_path(self):
+        fn = compile_in_new_module('testcache_3', self.cachedir)
+        self.assertEqual(fn.manager.cache.misses, 1)
+        self.assertEqual(fn(1, 4), test_sum_py(1, 4))
+
+    def test_global_type(self):
+        global Elem
+        cache = CompilationCache(self.cachedir)
+        compile_in_new_module('testcache_4', cache, test_alias)
+        Elem = Int64
+        try:
+            fn = compile_in_new_module('testcache_5', cache, test_alias)
+        finally:
+            Elem = Int32
+        self.assertEqual(cache.misses, 2)
+        self.assertEqual(cache.hits, 0)
+        self.assertEqual(fn(1, 2), 3)
+
+    def test_outlined(self):
+        cache = CompilationCache(self.cachedir)
+        first = compile_in_new_module('testcache_6', cache, test_psum)
+        second = compile_in_new_module('testcache_7', cache, test_psum)
+        self.assertEqual(cache.hits, 1)
+        # the outlined loop body comes with the cached function
+        self.assertEqual(len(second.outlined), len(first.outlined))
+        self.assertGreater(len(second.outlined), 0)
+        self.assertEqual(first(3, 100), test_sum_py(3, 100))
+        self.assertEqual(second(3, 100), test_sum_py(3, 100))
+        self.assertTrue(second.free())
+        self.assertTrue(first.free())
+
+    def test_eviction(self):
+        cache = CompilationCache(self.cachedir, max_size=1024)
+        for i in xrange(16):
+            # age the existing entries so that the order is well defined
+            for _, _, path in cache.entries():
+                atime = mtime = os.stat(path).st_mtime - 10
+                os.utime(path, (atime, mtime))
+            cache.store(cache.key(i), 'x' * 256)
+        self.assertLessEqual(cache.size(), 1024)
+        # the most recent entry survives
+        self.assertIsNotNone(cache.load(cache.key(15)))
+        self.assertIsNone(cache.load(cache.key(0)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -15,6 +15,34 @@ def test_power_int(X, Y):
 def test_power_float(X, Y):
     return X ** Y
 
+@function(ret=Int64, args=[Int64, Int64])
+def test_power_int64(X, Y):
+    return X ** Y
+
+@function(ret=Int32, args=[Int32])
+def test_power_const(X):
+    return X ** 5 + X ** 0
+
+@function(ret=Int, args=[Int])
+def test_power_const_negative(X):
+    return X ** -1 * 10 + X ** -2
+
+@function(ret=Int, args=[Int, Int, Int])
+def test_min_int(X, Y, Z):
+    return min(X, Y, Z)
+
+@function(ret=Double, args=[Double, Double])
+def test_max_double(X, Y):
+    return max(X, Y)
+
+@function(ret=Int, args=[Int])
+def test_abs_int(X):
+    return abs(X)
+
+@function(ret=Float, args=[Float])
+def test_abs_float(X):
+    return abs(X)
+
 @function(ret=Int, args=[Int, Int])
 def test_mod_int(X, Y):
     return X % Y
@@ -52,6 +80,37 @@ class Test(unittest.TestCase):
             error = relative_error(py_result, jit_result)
             self.assertLess(error, 0.01/100)
 
+    def test_power_exact(self):
+        self.assertEqual(test_power_int64(3, 39), 3 ** 39) # beyond a double
+        self.assertEqual(test_power_int64(-2, 63), -2 ** 63)
+        self.assertEqual(test_power_int64(7, 0), 1)
+        self.assertEqual(test_power_const(3), 3 ** 5 + 1)
+        self.assertEqual(test_power_const(-2), -32 + 1)
+        self.assertNotIn('sitofp', test_power_int64.code_llvm.dump())
+
+    def test_power_negative(self):
+        self.assertEqual(test_power_int64(2, -1), 0)
+        self.assertEqual(test_power_int64(1, -5), 1)
+        self.assertEqual(test_power_int64(-1, -5), -1)
+        self.assertEqual(test_power_int64(-1, -4), 1)
+        self.assertEqual(test_power_const_negative(2), 0)
+        self.assertEqual(test_power_const_negative(1), 11)
+        self.assertEqual(test_power_const_negative(-1), -10 + 1)
+        self.assertEqual(test_power_const_negative(0), 0)
+
+    def test_minmax(self):
+        for _ in xrange(100):
+            ARG = randint(-100, 100), randint(-100, 100), randint(-100, 100)
+            self.assertEqual(test_min_int(*ARG), min(ARG))
+            ARG = random(), random()
+            self.assertEqual(test_max_double(*ARG), max(ARG))
+        self.assertEqual(test_min_int.run_py(3, 1, 2), 1)
+
+    def test_abs(self):
+        for X in [-7, 0, 7, -2 ** 40]:
+            self.assertEqual(test_abs_int(X), abs(X))
+        self.assertEqual(test_abs_float(-2.5), 2.5)
+        self.assertEqual(str(test_abs_float(-0.0)), '0.0')
 
     def test_mod_int(self):
         for _ in xrange(100):
@@ -0,0 +1,31 @@
+'''
+Detection of the instruction set of the host. Does not use LLVM.
+'''
+
+import unittest
+from pymothoa.util import cpu
+
+class Test(unittest.TestCase):
+    def test_levels(self):
+        avx2 = set(['avx2', 'fma', 'bmi2', 'avx', 'sse4_2', 'popcnt'])
+        self.assertEqual(cpu.best_level(features=avx2).name, 'avx2')
+        self.assertEqual(cpu.best_level(features=set(['sse4_2', 'popcnt'])).name,
+                         'sse4.2')
+        self.assertEqual(cpu.best_level(features=set()).name, 'sse2')
+
+    def test_candidates(self):
+        avx = set(['avx', 'sse4_2', 'popcnt'])
+        self.assertEqual(cpu.best_level(['sse2', 'avx2', 'avx'], avx).name, 'avx')
+        self.assertIsNone(cpu.best_level(['avx2'], avx))
+        with self.assertRaises(ValueError):
+            cpu.best_level(['avx9000'])
+
+    def test_host(self):
+        features = cpu.host_features()
+        self.assertIsInstance(features, frozenset)
+        self.assertTrue(cpu.isa_level('sse2').is_supported())
+        best = cpu.best_level()
+        self.assertTrue(best.is_supported(features))
+
+if __name__ == '__main__':
+    unittest.main()
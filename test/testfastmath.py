@@ -0,0 +1,148 @@
+import logging
+#logging.basicConfig(level=logging.DEBUG)
+
+from pymothoa.jit import JITModule
+from pymothoa.types import *
+from pymothoa.dialect import *
+
+module = JITModule('testfastmath')
+
+@module.function(ret=Float, args=[Array(Float), Int])
+def test_sum_strict(A, n):
+    var ( total = Float )
+    total = 0
+    for i in xrange(n):
+        total += A[i]
+    return total
+
+@module.function(ret=Float, args=[Array(Float), Int], fastmath=True)
+def test_sum(A, n):
+    var ( total = Float )
+    total = 0
+    for i in xrange(n):
+        total += A[i]
+    return total
+
+@module.function(ret=Double, args=[Array(Double), Array(Double), Int],
+                 fastmath=['reassoc'])
+def test_dot_step(A, B, n):
+    var ( total = Double, count = Double )
+    total = 0
+    count = 0
+    for i in xrange(0, n, 3):
+        total += A[i] * B[i]
+        total -= A[i]
+        count += 1
+        B[i] += 1
+    return total + count
+
+@module.function(ret=Double, args=[Array(Double), Int], fastmath=True)
+def test_product(A, n):
+    var ( total = Double )
+    total = 1
+    for i in xrange(n):
+        total *= A[i]
+    return total
+
+@module.function(ret=Double, args=[Array(Double), Int], fastmath=True)
+def test_running(A, n):
+    # Reads the variable in the loop; not interleaved.
+    var ( total = Double )
+    total = 0
+    for i in xrange(n):
+        total += A[i]
+        A[i] = total
+    return total
+
+@module.function(ret=Double, args=[Double], fastmath=['arcp'])
+def test_divide(x):
+    return x / 3.0
+
+@module.function(ret=Double, args=[Double], fastmath=['nnan'])
+def test_tagged(x):
+    return x * x + x
+
+@module.function(ret=Double, args=[Double, Double, Double],
+                 fastmath=['contract'])
+def test_contract(x, y, z):
+    return (x * y + z) - (z - x * y)
+
+@module.function(ret=Double, args=[Array(Double), Int], fastmath=True)
+def test_parallel(A, n):
+    var ( total = Double )
+    total = 0
+    for i in prange(n):
+        total += A[i]
+    return total
+
+module.optimize()
+
+#-------------------------------------------------------------------------------
+
+import unittest
+import numpy as np
+from pymothoa.util.testing import relative_error
+from pymothoa.llvm_backend.backend import LLVM_VERSION
+
+class Test(unittest.TestCase):
+    def test_reduction(self):
+        for n in [0, 1, 3, 4, 5, 17, 1000]:
+            A = np.arange(n, dtype=np.float32) / 7
+            self.assertLess(relative_error(A.sum(), test_sum(A, n)), 1e-5)
+            self.assertLess(relative_error(test_sum_strict(A, n),
+                                           test_sum(A, n)), 1e-5)
+
+    def test_vectorized(self):
+        # The float reduction vectorizes only under fastmath.
+        pattern = r'fadd( \w+)* <\d+ x float>'
+        self.assertRegexpMatches(test_sum.code_llvm.dump(), pattern)
+        self.assertNotRegexpMatches(test_sum_strict.code_llvm.dump(), pattern)
+
+    def test_step(self):
+        for n in [0, 2, 10, 13, 100]:
+            A = np.arange(n, dtype=np.float64)
+            B = np.ones(n) * 2
+            expect = (A[::3] * B[::3] - A[::3]).sum() + len(A[::3])
+            self.assertAlmostEqual(test_dot_step(A, B, n), expect)
+            self.assertTrue((B[::3] == 3).all())
+            self.assertEqual((B == 2).sum(), n - len(B[::3]))
+
+    def test_product(self):
+        A = np.array([1, 2, 3, 4, 5, 0.5], dtype=np.float64)
+        self.assertAlmostEqual(test_product(A, len(A)), A.prod())
+        self.assertEqual(test_product(A, 0), 1)
+
+    def test_not_interleaved(self):
+        A = np.arange(10, dtype=np.float64)
+        expect = np.cumsum(A)
+        self.assertEqual(test_running(A, len(A)), expect[-1])
+        self.assertTrue((A == expect).all())
+        self.assertNotRegexpMatches(test_running.code_llvm.dump(),
+                                    r'<\d+ x double>')
+
+    def test_reciprocal(self):
+        self.assertAlmostEqual(test_divide(9.0), 3.0)
+        self.assertNotIn('fdiv', test_divide.code_llvm.dump())
+
+    def test_tagged(self):
+        self.assertEqual(test_tagged(2.0), 6.0)
+        ir = test_tagged.code_llvm.dump()
+        self.assertTrue('nnan' in ir or '!pymothoa.fastmath' in ir)
+
+    def test_contract(self):
+        self.assertEqual(test_contract(2.0, 3.0, 1.0), 12.0)
+        if LLVM_VERSION >= 302:
+            ir = test_contract.code_llvm.dump()
+            self.assertIn('llvm.fmuladd', ir)
+
+    def test_parallel(self):
+        A = np.arange(1000, dtype=np.float64)
+        self.assertEqual(test_parallel(A, len(A)), A.sum())
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            module.function(ret=Double, args=[Double], later=True,
+                            fastmath=['fast'])(lambda x: x)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import logging
+#logging.basicConfig(level=logging.DEBUG)
+
+from pymothoa.jit import JITModule
+from pymothoa.types import *
+from pymothoa.dialect import *
+
+# No call to optimize(); the module is finalized before the first call.
+module = JITModule('testfinalize')
+
+@module.function(ret=Double, args=[Double])
+def test_square(x):
+    return x * x
+
+@module.function(ret=Double, args=[Array(Double), Int])
+def test_sum_squares(A, n):
+    var ( total = Double )
+    total = 0
+    for i in xrange(n):
+        total += test_square(A[i])
+    return total
+
+@module.function(ret=Double, args=[Double], later=True)
+def test_later(x):
+    return test_square(x) + 1
+
+manual = JITModule('testfinalize_manual', modargs={'finalize': False})
+
+@manual.function(ret=Int, args=[Int])
+def test_double(x):
+    return x * 2
+
+@manual.function(ret=Int, args=[Int])
+def test_call_double(x):
+    return test_double(x) + 1
+
+no_inline = JITModule('testfinalize_no_inline',
+                      modargs={'inline_threshold': 0})
+
+@no_inline.function(ret=Int, args=[Int])
+def test_triple(x):
+    return x * 3
+
+@no_inline.function(ret=Int, args=[Int])
+def test_call_triple(x):
+    return test_triple(x) + 1
+
+#-------------------------------------------------------------------------------
+
+import unittest
+import numpy as np
+
+class Test(unittest.TestCase):
+    def test_inlined(self):
+        A = np.arange(10, dtype=np.float64)
+        self.assertEqual(test_sum_squares(A, len(A)), (A * A).sum())
+        self.assertNotIn('call', test_sum_squares.code_llvm.dump())
+
+    def test_later(self):
+        self.assertEqual(test_square(3.0), 9.0)
+        test_later.compile() # after the module is finalized
+        self.assertEqual(test_later(3.0), 10.0)
+        self.assertNotIn('call', test_later.code_llvm.dump())
+
+    def test_manual(self):
+        self.assertEqual(test_call_double(3), 7)
+        self.assertIn('call', test_call_double.code_llvm.dump())
+        manual.finalize()
+        self.assertNotIn('call', test_call_double.code_llvm.dump())
+        # The native code is recompiled with the new body.
+        self.assertEqual(test_call_double(4), 9)
+
+    def test_threshold(self):
+        self.assertEqual(test_call_triple(2), 7)
+        self.assertIn('call', test_call_triple.code_llvm.dump())
+
+    def test_optimize(self):
+        self.assertEqual(test_square(2.0), 4.0)
+        module.optimize() # recompiles the functions that were called
+        self.assertEqual(test_square(5.0), 25.0)
+        A = np.ones(4)
+        self.assertEqual(test_sum_squares(A, len(A)), 4.0)
+
+if __name__ == '__main__':
+    unittest.main()
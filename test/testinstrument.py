@@ -0,0 +1,86 @@
+import logging
+#logging.basicConfig(level=logging.DEBUG)
+
+from pymothoa.jit import JITModule
+from pymothoa.types import *
+from pymothoa.dialect import *
+
+module = JITModule('testinstrument', modargs={'instrument': True})
+
+@module.function(ret=Int, args=[Array(Int32), Int])
+def test_count_positive(A, n):
+    var ( count = Int )
+    count = 0
+    for i in xrange(n):
+        if A[i] > 0:
+            count += 1
+    return count
+
+@module.function(ret=Int, args=[Int])
+def test_halvings(n):
+    var ( steps = Int )
+    steps = 0
+    while n > 1:
+        n /= 2
+        steps += 1
+    return steps
+
+@module.function(ret=Int, args=[Array(Int32), Int])
+def test_caller(A, n):
+    return test_count_positive(A, n) + 1
+
+#-------------------------------------------------------------------------------
+
+import unittest
+import numpy as np
+from pymothoa.llvm_backend import instrument
+
+class Test(unittest.TestCase):
+    def test_counts(self):
+        A = np.array([1, -1, 2, 3, 0, 5], dtype=np.int32)
+        self.assertEqual(test_count_positive(A, len(A)), 4)
+        loop, branch = test_count_positive.counters.counts()
+        self.assertEqual((loop.kind, loop.taken, loop.not_taken),
+                         (instrument.FOR, 6, 1))
+        self.assertEqual((branch.kind, branch.taken, branch.not_taken),
+                         (instrument.IF, 4, 2))
+        self.assertEqual(branch.line, loop.line + 1)
+
+        test_count_positive.counters.reset()
+        self.assertEqual(test_count_positive.counters.counts()[0].taken, 0)
+
+    def test_feedback(self):
+        self.assertEqual(test_halvings(16), 4)
+        self.assertEqual(test_halvings(1), 0)
+        counters = test_halvings.counters
+        (loop,) = counters.counts()
+        self.assertEqual((loop.kind, loop.taken, loop.not_taken),
+                         (instrument.WHILE, 4, 2))
+        test_halvings.recompile_with_profile()
+        self.assertIsNone(test_halvings.counters)
+        self.assertIs(test_halvings.feedback, counters)
+        self.assertIn('branch_weights', test_halvings.code_llvm.dump())
+        self.assertEqual(test_halvings(1024), 10)
+        self.assertEqual(counters.counts()[0].taken, 4) # no longer counted
+        with self.assertRaises(RuntimeError):
+            test_halvings.recompile_with_profile()
+
+    def test_module(self):
+        A = np.ones(10, dtype=np.int32)
+        self.assertEqual(test_caller(A, len(A)), 11)
+        counts = module.branch_counts()
+        self.assertIn(test_caller.code_llvm.name(), counts)
+        self.assertEqual(counts[test_caller.code_llvm.name()], [])
+        module.recompile_with_profile()
+        self.assertEqual(module.branch_counts(), {})
+        self.assertEqual(test_caller(A, len(A)), 11)
+
+    def test_weights(self):
+        self.assertEqual(instrument.branch_weights(0, 5), (1, 6))
+        big = instrument.MAX_WEIGHT * 4
+        taken, not_taken = instrument.branch_weights(big, 1)
+        self.assertLessEqual(taken, instrument.MAX_WEIGHT + 1)
+        self.assertEqual(not_taken, 1)
+
+if __name__ == '__main__':
+    unittest.main()
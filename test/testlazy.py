@@ -0,0 +1,122 @@
+import logging
+#logging.basicConfig(level=logging.DEBUG)
+
+from pymothoa.jit import JITModule, default_module, function
+from pymothoa.types import *
+from pymothoa.dialect import *
+
+@function
+def test_add(A, B):
+    return A + B
+
+@function
+def test_sum(A, n):
+    var ( total = Double )
+    total = 0
+    for i in xrange(n):
+        total += A[i]
+    return total
+
+@function
+def test_compare(A, B):
+    return A < B
+
+@function
+def test_caller(A):
+    return test_add(A, A) * 2
+
+@function(ret=Int64)
+def test_fact(n):
+    if n <= 1:
+        return 1
+    return n * test_fact(n - 1)
+
+@function
+def test_fill(A, n, value):
+    for i in xrange(n):
+        A[i] = value
+
+@function
+def test_never_called(A):
+    return undefined_symbol + A
+
+lazy = JITModule('testlazy')
+
+@lazy.function
+def test_recursive(n):
+    if n <= 1:
+        return 1
+    return n * test_recursive(n - 1)
+
+#-------------------------------------------------------------------------------
+
+import unittest
+import array
+import ctypes
+import numpy as np
+from pymothoa.compiler_errors import CompilerError, FunctionDeclarationError
+from pymothoa.llvm_backend.function import LLVMLazyFuncDef
+from pymothoa.llvm_backend.types import typeof, type_key
+
+class Test(unittest.TestCase):
+    def test_not_compiled_until_called(self):
+        self.assertIsInstance(test_never_called, LLVMLazyFuncDef)
+        self.assertEqual(test_never_called.specializations, {})
+
+    def test_specialize_by_type(self):
+        self.assertEqual(test_add(1, 2), 3)
+        self.assertAlmostEqual(test_add(1.5, 2.25), 3.75)
+        self.assertAlmostEqual(test_add(1, 2.5), 3.5)
+        self.assertEqual(test_add(2**40, 1), 2**40 + 1)
+        self.assertEqual(len(test_add.specializations), 3)
+
+        # same types dispatch to the same specialization
+        test_add(5, 6)
+        self.assertEqual(len(test_add.specializations), 3)
+
+        key = (type_key(typeof(1)), type_key(typeof(2.5)))
+        retty = test_add.specializations[key].retty
+        self.assertIs(retty.ctype(), ctypes.c_double)
+
+    def test_inferred_return(self):
+        self.assertIs(test_compare(1, 2), True)
+        self.assertIs(test_compare(2.0, 1.0), False)
+
+    def test_arrays(self):
+        A = np.arange(10, dtype=np.float64)
+        self.assertEqual(test_sum(A, len(A)), A.sum())
+
+        B = np.arange(10, dtype=np.float32)
+        self.assertEqual(test_sum(B, len(B)), B.sum())
+
+        C = array.array('d', [1.0, 2.0, 3.0])
+        self.assertEqual(test_sum(C, len(C)), 6.0)
+
+        # float32 and float64 arrays need different specializations
+        self.assertEqual(len(test_sum.specializations), 2)
+
+        D = np.zeros(5, dtype=np.int32)
+        test_fill(D, len(D), 7)
+        self.assertEqual(list(D), [7] * 5)
+
+    def test_numpy_scalar(self):
+        self.assertAlmostEqual(test_add(np.float32(1.5), np.float32(2)), 3.5)
+
+    def test_call_lazy(self):
+        self.assertEqual(test_caller(3), 12)
+        self.assertAlmostEqual(test_caller(0.5), 2.0)
+
+    def test_recursion(self):
+        self.assertEqual(test_fact(10), 3628800)
+        with self.assertRaises(CompilerError) as handle:
+            test_recursive(10)
+        self.assertTrue(handle.exception.is_due_to(FunctionDeclarationError))
+
+    def test_unsupported(self):
+        with self.assertRaises(TypeError):
+            test_add('a', 'b')
+        with self.assertRaises(TypeError):
+            test_add(1)
+
+if __name__ == '__main__':
+    unittest.main()
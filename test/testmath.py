@@ -63,6 +63,12 @@ floor = declare_builtin(*cmath.floor)
 fmodf = declare_builtin(*cmath.fmodf)
 fmod = declare_builtin(*cmath.fmod)
 
+fmaf = declare_builtin(*cmath.fmaf)
+fma = declare_builtin(*cmath.fma)
+
+exp2 = declare_builtin(*cmath.exp2)
+log2 = declare_builtin(*cmath.log2)
+
 # Tri
 
 @function(ret=Float, args=[Float])
@@ -218,16 +224,44 @@ def test_fmodf(n, d):
 def test_fmod(n, d):
     return fmod(n, d)
 
+@function(ret=Double, args=[Double, Double, Double])
+def test_fma(a, b, c):
+    return fma(a, b, c)
+
+@function(ret=Double, args=[Double])
+def test_exp2_log2(val):
+    return exp2(log2(val))
+
 # combined experiment
 @function(ret=Double, args=[Double, Double])
 def test_pythagoras(x, y):
     return sqrt(x*x + y*y)
 
+# vectors
+
+@function(args=[Array(Float), Array(Float), Int])
+def test_vector_math(A, B, n):
+    var ( V = Vector(Float, 4) )
+    for i in xrange(0, n, 4):
+        V = vload(A, i, 4)
+        vstore(B, i, sqrtf(fabsf(V)) + expf(V) + floorf(V))
+
+@function(args=[Array(Float), Array(Float), Int])
+def test_vector_sqrt(A, B, n):
+    for i in xrange(0, n, 4):
+        vstore(B, i, sqrtf(vload(A, i, 4)))
+
+@function(args=[Array(Float), Array(Float), Int])
+def test_scalar_sqrt(A, B, n):
+    for i in xrange(n):
+        B[i] = sqrtf(A[i])
+
 default_module.optimize()
 
 #-------------------------------------------------------------------------------
 
 import unittest
+import numpy as np
 from pymothoa.util.testing import relative_error, benchmark, benchmark_summary
 
 def random(lo=-1, hi=1):
@@ -465,6 +499,44 @@ class Test(unittest.TestCase):
             answer = test_fmod(numerator, denominator)
             self.assertLess(relative_error(golden, answer), 0.001/100)
 
+    def test_fma(self):
+        self.assertEqual(test_fma(2.0, 3.0, 4.0), 10.0)
+        self.assertAlmostEqual(test_exp2_log2(12.5), 12.5)
+
+    def test_intrinsics(self):
+        self.assertIn('llvm.sqrt', test_sqrt.code_llvm.dump())
+        self.assertIn('llvm.fma', test_fma.code_llvm.dump())
+
+    def test_vector(self):
+        A = np.linspace(-4, 4, 64).astype(np.float32)
+        B = np.zeros_like(A)
+        test_vector_math(A, B, len(A))
+        golden = np.sqrt(np.abs(A)) + np.exp(A) + np.floor(A)
+        self.assertLess(np.max(np.abs(B - golden) / np.abs(golden)), 1e-5)
+        self.assertIn('<4 x float> @llvm.sqrt.v4f32',
+                      test_vector_math.code_llvm.dump())
+
+    def test_vector_throughput(self):
+        A = np.random.random(2**20).astype(np.float32)
+        B = np.zeros_like(A)
+        test_vector_sqrt(A, B, len(A))
+        self.assertTrue(np.allclose(B, np.sqrt(A)))
+
+        with benchmark('Vector sqrt') as bm:
+            REP = 20
+
+            with bm.entry('Numpy'):
+                for _ in xrange(REP):
+                    np.sqrt(A, B)
+
+            with bm.entry('JIT scalar'):
+                for _ in xrange(REP):
+                    test_scalar_sqrt(A, B, len(A))
+
+            with bm.entry('JIT vector'):
+                for _ in xrange(REP):
+                    test_vector_sqrt(A, B, len(A))
+
     def test_pythagoras(self):
         from math import sqrt
         def pythagoras(x, y):
@@ -0,0 +1,133 @@
+import logging
+#logging.basicConfig(level=logging.DEBUG)
+
+from pymothoa.jit import JITModule, default_module, function
+from pymothoa.types import *
+from pymothoa.dialect import *
+
+@function(ret=Double, args=[NDArray(Double, 2)])
+def test_sum2d(A):
+    var ( total = Double )
+    total = 0
+    for i in xrange(A.shape[0]):
+        for j in xrange(A.shape[1]):
+            total += A[i, j]
+    return total
+
+@function(args=[NDArray(Double, 2), NDArray(Double, 2)])
+def test_copy2d(Out, In):
+    for i in xrange(In.shape[0]):
+        for j in xrange(In.shape[1]):
+            Out[i, j] = In[i, j]
+
+@function(ret=Int, args=[NDArray(Int32, 1)])
+def test_sum1d(A):
+    var ( total = Int )
+    total = 0
+    for i in xrange(A.shape[0]):
+        total += A[i]
+    return total
+
+@function(ret=Int64, args=[NDArray(Double, 3)])
+def test_size3d(A):
+    return A.shape[0] * A.shape[1] * A.shape[2]
+
+@function(ret=Double, args=[NDArray(Double, 2)])
+def test_parallel_sum2d(A):
+    var ( total = Double )
+    total = 0
+    for i in prange(A.shape[0]):
+        for j in xrange(A.shape[1]):
+            total += A[i, j]
+    return total
+
+@function
+def test_lazy_trace(A):
+    var ( total = Double )
+    total = 0
+    for i in xrange(A.shape[0]):
+        total += A[i, i]
+    return total
+
+default_module.optimize()
+
+invalid = JITModule('testndarray_invalid')
+
+@invalid.function(ret=Double, args=[NDArray(Double, 2)], later=True)
+def test_bad_indices(A):
+    return A[0]
+
+@invalid.function(ret=Int64, args=[NDArray(Double, 2)], later=True)
+def test_bad_shape(A):
+    return A.shape[2]
+
+@invalid.function(args=[NDArray(Double, 2), NDArray(Double, 2)], later=True)
+def test_bad_assign(A, B):
+    A = B
+
+#-------------------------------------------------------------------------------
+
+import unittest
+import ctypes
+import numpy as np
+from pymothoa.compiler_errors import (CompilerError, InvalidSubscriptError,
+                                      InvalidUseOfConstruct)
+
+class Test(unittest.TestCase):
+    def test_contiguous(self):
+        A = np.random.random((13, 7))
+        self.assertAlmostEqual(test_sum2d(A), A.sum())
+
+    def test_views(self):
+        A = np.random.random((20, 30))
+        for view in [A.T, A[::2, ::3], A[5:15, 10:], A[::-1, ::-2]]:
+            self.assertAlmostEqual(test_sum2d(view), view.sum())
+
+        B = np.arange(10, dtype=np.int32)
+        self.assertEqual(test_sum1d(B[::3]), B[::3].sum())
+
+    def test_store(self):
+        A = np.random.random((6, 8))
+        Out = np.zeros((8, 6))
+        test_copy2d(Out.T, A) # write through a transposed view
+        self.assertTrue(np.all(Out.T == A))
+
+    def test_shape(self):
+        self.assertEqual(test_size3d(np.zeros((2, 3, 4))), 24)
+
+    def test_prange(self):
+        A = np.random.random((100, 50))
+        self.assertAlmostEqual(test_parallel_sum2d(A.T), A.sum())
+
+    def test_buffer(self):
+        buf = ((ctypes.c_double * 3) * 2)()
+        buf[1][2] = 5.0
+        self.assertEqual(test_sum2d(buf), 5.0)
+
+    def test_lazy(self):
+        A = np.random.random((5, 5))
+        self.assertAlmostEqual(test_lazy_trace(A), np.trace(A))
+        self.assertAlmostEqual(test_lazy_trace(A.T), np.trace(A))
+
+    def test_mismatch(self):
+        with self.assertRaises(TypeError):
+            test_sum2d(np.zeros(4))
+        with self.assertRaises(TypeError):
+            test_sum2d(np.zeros((2, 2), dtype=np.float32))
+        with self.assertRaises(TypeError):
+            test_sum2d([[1.0, 2.0]])
+        A = np.zeros((2, 2))
+        A.flags.writeable = False
+        with self.assertRaises(TypeError):
+            test_copy2d(A, np.ones((2, 2)))
+
+    def test_invalid(self):
+        for fn, err in [(test_bad_indices, InvalidSubscriptError),
+                        (test_bad_shape, InvalidSubscriptError),
+                        (test_bad_assign, InvalidUseOfConstruct)]:
+            with self.assertRaises(CompilerError) as handle:
+                fn.compile()
+            self.assertTrue(handle.exception.is_due_to(err))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+import logging
+#logging.basicConfig(level=logging.DEBUG)
+
+from pymothoa.jit import JITModule, default_module, function, declare_builtin
+from pymothoa.types import *
+from pymothoa.dialect import *
+
+@function(ret=Int, args=[Int], nogil=True)
+def test_spin(n):
+    var ( total = Int )
+    total = 0
+    for i in xrange(n):
+        total = (total * 31 + i) % 1000003
+    return total
+
+@function(ret=Double, args=[Array(Double), Int], nogil=True)
+def test_array_sum(A, n):
+    var ( total = Double )
+    total = 0
+    for i in xrange(n):
+        total += A[i]
+    return total
+
+# Calls into the Python interpreter
+Py_GetRecursionLimit = declare_builtin('Py_GetRecursionLimit', Int, [])
+
+@function(ret=Int)
+def test_with_gil():
+    return Py_GetRecursionLimit()
+
+default_module.optimize()
+
+invalid = JITModule('testnogil_invalid')
+
+@invalid.function(ret=Int, later=True, nogil=True)
+def test_bad_nogil():
+    return Py_GetRecursionLimit()
+
+@invalid.function(ret=Int, later=True, nogil=True)
+def test_bad_nogil_indirect():
+    return test_with_gil()
+
+#-------------------------------------------------------------------------------
+
+import sys
+import threading
+import multiprocessing
+import unittest
+import numpy as np
+from pymothoa.compiler_errors import CompilerError, GILRequiredError
+from pymothoa.util.testing import Timer
+
+def test_spin_py(n):
+    total = 0
+    for i in xrange(n):
+        total = (total * 31 + i) % 1000003
+    return total
+
+def run_in_threads(fn, args, count):
+    results = [None] * count
+    def work(i):
+        results[i] = fn(*args)
+    threads = [threading.Thread(target=work, args=(i,)) for i in xrange(count)]
+    timer = Timer()
+    with timer:
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    return results, timer.duration()
+
+class Test(unittest.TestCase):
+    def test_flags(self):
+        self.assertTrue(test_spin.nogil)
+        self.assertFalse(test_with_gil.nogil)
+        self.assertTrue(test_with_gil.requires_gil)
+
+    def test_results(self):
+        self.assertEqual(test_spin(10000), test_spin_py(10000))
+        A = np.arange(100, dtype=np.float64)
+        self.assertEqual(test_array_sum(A, len(A)), A.sum())
+        self.assertEqual(test_with_gil(), sys.getrecursionlimit())
+
+    def test_threads(self):
+        n = 10**5
+        expect = test_spin_py(n)
+        results, _ = run_in_threads(test_spin, (n,), 4)
+        self.assertEqual(results, [expect] * 4)
+
+        A = np.random.random(1000)
+        results, _ = run_in_threads(test_array_sum, (A, len(A)), 4)
+        for got in results:
+            self.assertAlmostEqual(got, A.sum())
+
+    def test_reject(self):
+        for fn in [test_bad_nogil, test_bad_nogil_indirect]:
+            with self.assertRaises(CompilerError) as handle:
+                fn.compile()
+            self.assertTrue(handle.exception.is_due_to(GILRequiredError))
+
+    @unittest.skipIf(multiprocessing.cpu_count() < 2, 'needs two processors')
+    def test_scaling(self):
+        n = 2 * 10**7
+        test_spin(1) # bind the function before timing
+        _, single = run_in_threads(test_spin, (n,), 1)
+        _, double = run_in_threads(test_spin, (n,), 2)
+        # Twice the work in two threads. Holding the GIL would take twice
+        # as long.
+        self.assertLess(double, 1.5 * single)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+import logging
+#logging.basicConfig(level=logging.DEBUG)
+
+from pymothoa.jit import JITModule
+from pymothoa.types import *
+from pymothoa.dialect import *
+from pymothoa.pipeline import PassPipeline
+
+# No call to optimize(); the functions keep the code of their own pipeline.
+module = JITModule('testpipeline')
+
+@module.function(ret=Int, args=[Int], pipeline=0)
+def test_unoptimized(n):
+    var ( total = Int )
+    total = 0
+    for i in xrange(n):
+        total += i
+    return total
+
+@module.function(ret=Int, args=[Int], pipeline=['mem2reg'])
+def test_mem2reg(n):
+    var ( total = Int )
+    total = 0
+    for i in xrange(n):
+        total += i
+    return total
+
+@module.function(ret=Double, args=[Array(Double), Int],
+                 pipeline=PassPipeline(optlevel=2, vectorize=False,
+                                       unroll_threshold=0))
+def test_no_unroll(A, n):
+    var ( total = Double )
+    total = 0
+    for i in xrange(n):
+        total += A[i]
+    return total
+
+@module.function(ret=Int, args=[Int])
+def test_square(x):
+    return x * x
+
+@module.function(ret=Int, args=[Int],
+                 pipeline=PassPipeline(inline_threshold=100))
+def test_inlined(x):
+    return test_square(x) + 1
+
+@module.function(ret=Int, args=[Int],
+                 pipeline=PassPipeline(inline_threshold=0))
+def test_not_inlined(x):
+    return test_square(x) + 1
+
+@module.vectorize(ret=Double, args=[Double], pipeline=1)
+def test_twice(x):
+    return 2 * x
+
+@module.function(pipeline=['mem2reg', 'instcombine'])
+def test_lazy(x):
+    return x + 1
+
+level1 = JITModule('testpipeline_level1', modargs={'pipeline': 1})
+
+@level1.function(ret=Int, args=[Int])
+def test_module_default(x):
+    return x * 3
+
+#-------------------------------------------------------------------------------
+
+import unittest
+import numpy as np
+
+class Test(unittest.TestCase):
+    def test_levels(self):
+        self.assertEqual(test_unoptimized(10), sum(range(10)))
+        self.assertIn('alloca', test_unoptimized.code_llvm.dump())
+
+    def test_passes(self):
+        self.assertEqual(test_mem2reg(10), sum(range(10)))
+        self.assertNotIn('alloca', test_mem2reg.code_llvm.dump())
+
+    def test_thresholds(self):
+        A = np.arange(10, dtype=np.float64)
+        self.assertEqual(test_no_unroll(A, len(A)), A.sum())
+
+    def test_inline(self):
+        self.assertEqual(test_inlined(3), 10)
+        self.assertEqual(test_not_inlined(3), 10)
+        self.assertNotIn('call', test_inlined.code_llvm.dump())
+        self.assertIn('call', test_not_inlined.code_llvm.dump())
+
+    def test_vectorize(self):
+        A = np.arange(5, dtype=np.float64)
+        self.assertTrue((test_twice(A) == 2 * A).all())
+
+    def test_lazy(self):
+        self.assertEqual(test_lazy(1), 2)
+        self.assertEqual(test_lazy(1.5), 2.5)
+
+    def test_module_default(self):
+        self.assertEqual(level1.module.pipeline, PassPipeline(optlevel=1))
+        self.assertEqual(test_module_default(3), 9)
+
+    def test_invalid(self):
+        for passes in [['no-such-pass'], ['globaldce']]:
+            with self.assertRaises(ValueError):
+                module.function(ret=Int, args=[Int], later=True,
+                                pipeline=passes)(lambda x: x)
+        with self.assertRaises(ValueError):
+            PassPipeline(optlevel=4)
+        with self.assertRaises(TypeError):
+            PassPipeline.coerce('mem2reg')
+
+    def test_coerce(self):
+        self.assertIsNone(PassPipeline.coerce(None))
+        self.assertEqual(PassPipeline.coerce(2), PassPipeline(optlevel=2))
+        self.assertEqual(PassPipeline.coerce(['gvn']).passes, ('gvn',))
+        self.assertNotEqual(PassPipeline(vectorize=False).key(),
+                            PassPipeline().key())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+import logging
+#logging.basicConfig(level=logging.DEBUG)
+
+from pymothoa.jit import JITModule, default_module, function
+from pymothoa.types import *
+from pymothoa.dialect import *
+
+@function(args=[Array(Double), Array(Double), Double, Int])
+def test_scale(Out, In, factor, n):
+    for i in prange(n):
+        Out[i] = In[i] * factor
+
+@function(ret=Double, args=[Array(Double), Int])
+def test_sum(A, n):
+    var ( total = Double )
+    total = 0
+    for i in prange(n):
+        total += A[i]
+    return total
+
+@function(ret=Int, args=[Int, Int, Int])
+def test_step_sum(begin, end, step):
+    var ( total = Int )
+    total = 0
+    for i in prange(begin, end, step):
+        total += i
+    return total
+
+@function(ret=Int, args=[Int])
+def test_countdown(n):
+    var ( total = Int )
+    total = 0
+    for i in prange(n, 0, -2):
+        total += i
+    return total
+
+@function(ret=Double, args=[Array(Double), Int])
+def test_private(A, n):
+    var ( tmp = Double, total = Double )
+    total = 1
+    for i in prange(n):
+        tmp = A[i] + 1
+        total *= tmp
+    return total
+
+@function(ret=Int, args=[Int])
+def test_nested(n):
+    var ( total = Int )
+    total = 0
+    for i in prange(n):
+        for j in prange(n):
+            total += i * j
+    return total
+
+default_module.optimize()
+
+invalid = JITModule('testprange_invalid')
+
+@invalid.function(ret=Int, args=[Int], later=True)
+def test_bad_return(n):
+    for i in prange(n):
+        return i
+
+@invalid.function(ret=Int, args=[Int], later=True)
+def test_bad_reduction(n):
+    var ( total = Int )
+    total = 0
+    for i in prange(n):
+        total -= i
+        total = i
+    return total
+
+#-------------------------------------------------------------------------------
+
+import threading
+import unittest
+import numpy as np
+from pymothoa.compiler_errors import CompilerError, InvalidUseOfConstruct
+from pymothoa.util.testing import benchmark, benchmark_summary, relative_error
+
+class Test(unittest.TestCase):
+    def test_independent(self):
+        n = 10007
+        In = np.arange(n, dtype=np.float64)
+        Out = np.zeros(n)
+        test_scale(Out, In, 1.5, n)
+        self.assertTrue(np.allclose(Out, In * 1.5))
+
+    def test_reduction(self):
+        n = 100003
+        A = np.random.random(n)
+        self.assertLess(relative_error(A.sum(), test_sum(A, n)), 1e-9)
+        self.assertEqual(test_sum(A, 0), 0)
+
+    def test_range(self):
+        for args in [(0, 100, 1), (3, 1000, 7), (10, 0, 1), (-50, 50, 3),
+                     (100, 0, -1), (50, -50, -7), (0, 10, -1), (3, 4, 5)]:
+            self.assertEqual(test_step_sum(*args), sum(xrange(*args)))
+        self.assertEqual(test_step_sum(0, 10, 0), 0)
+        self.assertEqual(test_step_sum.run_py(0, 10, 0), 0)
+        for n in [0, 1, 10, 11]:
+            self.assertEqual(test_countdown(n), sum(xrange(n, 0, -2)))
+
+    def test_private(self):
+        A = np.random.random(64) * 0.01
+        expect = np.prod(A + 1)
+        self.assertLess(relative_error(expect, test_private(A, len(A))), 1e-9)
+
+    def test_nested(self):
+        n = 50
+        expect = sum(i * j for i in xrange(n) for j in xrange(n))
+        self.assertEqual(test_nested(n), expect)
+
+    def test_concurrent(self):
+        # Loops started by several threads at once are queued.
+        A = np.random.random(100003)
+        expect = A.sum()
+        results = [None] * 4
+        def work(i):
+            results[i] = [test_sum(A, len(A)) for _ in xrange(20)]
+        threads = [threading.Thread(target=work, args=(i,)) for i in xrange(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        for got in results:
+            for value in got:
+                self.assertLess(relative_error(expect, value), 1e-9)
+
+    def test_releases_gil(self):
+        self.assertTrue(test_sum.nogil)
+        self.assertTrue(test_scale.nogil)
+
+    def test_python(self):
+        A = [1.0, 2.0, 3.0]
+        self.assertEqual(test_sum.run_py(A, len(A)), 6.0)
+
+    def test_invalid(self):
+        for fn in [test_bad_return, test_bad_reduction]:
+            with self.assertRaises(CompilerError) as handle:
+                fn.compile()
+            self.assertTrue(handle.exception.is_due_to(InvalidUseOfConstruct))
+
+    def test_speed(self):
+        n = 10**7
+        A = np.random.random(n)
+        with benchmark('prange reduction') as bm:
+            with bm.entry('numpy'):
+                expect = A.sum()
+            with bm.entry('JIT prange'):
+                got = test_sum(A, n)
+        self.assertLess(relative_error(expect, got), 1e-9)
+        benchmark_summary()
+
+if __name__ == '__main__':
+    unittest.main()
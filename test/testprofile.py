@@ -0,0 +1,101 @@
+import logging
+#logging.basicConfig(level=logging.DEBUG)
+
+from pymothoa.jit import JITModule
+from pymothoa.types import *
+from pymothoa.dialect import *
+
+module = JITModule('testprofile', modargs={'profile': True})
+
+@module.function(ret=Int, args=[Int, Int])
+def test_add(A, B):
+    return A + B
+
+@module.function(ret=Double, args=[Array(Double), Int])
+def test_sum(A, n):
+    var ( total = Double )
+    total = 0
+    for i in xrange(n):
+        total += A[i]
+    return total
+
+@module.function(ret=Bool, args=[Array(Double), Int])
+def test_any(A, n):
+    for i in xrange(n):
+        if A[i] != 0:
+            return True
+    return False
+
+@module.function(ret=Int, args=[Int])
+def test_unused(A):
+    return A
+
+unprofiled = JITModule('testprofile_off')
+
+@unprofiled.function(ret=Int, args=[Int])
+def test_plain(A):
+    return A
+
+#-------------------------------------------------------------------------------
+
+import os
+import shutil
+import pstats
+import tempfile
+import unittest
+import numpy as np
+
+class Test(unittest.TestCase):
+    def setUp(self):
+        module.reset_stats()
+
+    def stats_of(self, fn):
+        return module.stats()[fn.code_llvm.name()]
+
+    def test_trampoline(self):
+        for i in range(10):
+            self.assertEqual(test_add(i, 1), i + 1)
+        stats = self.stats_of(test_add)
+        self.assertEqual(stats.calls, 10)
+        self.assertEqual(stats.marshal_time, 0) # unboxed in the native code
+
+    def test_ctypes(self):
+        A = np.ones(1000000)
+        for _ in range(3):
+            self.assertEqual(test_sum(A, len(A)), len(A))
+        self.assertIs(test_any(A, len(A)), True)
+        stats = self.stats_of(test_sum)
+        self.assertEqual(stats.calls, 3)
+        self.assertGreater(stats.native_time, 0)
+        self.assertLessEqual(stats.mean_time, stats.max_time)
+        self.assertEqual(stats.total_time,
+                         stats.native_time + stats.marshal_time)
+        self.assertEqual(self.stats_of(test_any).calls, 1)
+
+    def test_reset(self):
+        test_add(1, 2)
+        module.reset_stats()
+        self.assertEqual(self.stats_of(test_add).calls, 0)
+
+    def test_pstats(self):
+        test_add(1, 2)
+        tmpdir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmpdir, 'testprofile.prof')
+            module.dump_stats(path)
+            stats = pstats.Stats(path)
+        finally:
+            shutil.rmtree(tmpdir)
+        names = [name for _, _, name in stats.stats]
+        self.assertIn(test_add.code_llvm.name(), names)
+        self.assertNotIn(test_unused.code_llvm.name(), names)
+        self.assertEqual(stats.total_calls, 1)
+
+    def test_disabled(self):
+        self.assertEqual(test_plain(3), 3)
+        self.assertIsNone(test_plain.stats)
+        with self.assertRaises(RuntimeError):
+            unprofiled.stats()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,157 @@
+import logging
+#logging.basicConfig(level=logging.DEBUG)
+
+from pymothoa.jit import JITModule, default_module, function
+from pymothoa.types import *
+from pymothoa.dialect import *
+
+@function(ret=Double, args=[Array(Double), Int])
+def test_sum(A, n):
+    return sum(A[:n])
+
+@function(ret=Float, args=[Array(Float), Int, Int])
+def test_sum_range(A, lo, hi):
+    return sum(A[lo:hi])
+
+@function(ret=Int32, args=[Array(Int32), Int])
+def test_sum_int(A, n):
+    return sum(A[:n])
+
+@function(ret=Double, args=[Array(Double), Int])
+def test_min(A, n):
+    return min(A[:n])
+
+@function(ret=Int16, args=[Array(Int16), Int])
+def test_max(A, n):
+    return max(A[:n])
+
+@function(ret=Double, args=[Array(Double), Array(Double), Int])
+def test_dot(A, B, n):
+    return dot(A[:n], B[:n])
+
+@function(ret=Int, args=[Array(Float), Int])
+def test_argmax(A, n):
+    return argmax(A[:n])
+
+@function(ret=Float, args=[Array(Float)])
+def test_vector(A):
+    var ( V = Vector(Float, 4), W = Vector(Float, 4) )
+    for i in xrange(4):
+        V[i] = A[i]
+        W[i] = A[i + 4]
+    return sum(V) + max(W) * 10 + dot(V, W) * 100 + argmax(W) * 1000
+
+default_module.optimize()
+
+checked = JITModule('testreduce_checked', modargs={'boundscheck': True})
+
+@checked.function(ret=Double, args=[Array(Double)])
+def test_checked_sum(A):
+    return sum(A)
+
+@checked.function(ret=Double, args=[Array(Double), Int])
+def test_checked_tail(A, lo):
+    return sum(A[lo:])
+
+@checked.function(ret=Double, args=[Array(Double), Int, Int])
+def test_checked_slice(A, lo, hi):
+    return sum(A[lo:hi])
+
+errors = JITModule('testreduce_errors')
+
+@errors.function(ret=Double, args=[Array(Double)], later=True)
+def test_unknown_length(A):
+    return sum(A)
+
+@errors.function(ret=Double, args=[Array(Double), Array(Float)], later=True)
+def test_mixed_types(A, B):
+    return dot(A[:3], B[:3])
+
+@errors.function(ret=Double, args=[Array(Double), Int], later=True)
+def test_negative_bound(A, n):
+    return sum(A[-3:n])
+
+#-------------------------------------------------------------------------------
+
+import unittest
+import numpy as np
+from pymothoa.compiler_errors import CompilerError
+
+class Test(unittest.TestCase):
+    def test_sum(self):
+        for n in [0, 1, 7, 16, 17, 100, 1001]:
+            A = np.random.random(n)
+            self.assertAlmostEqual(test_sum(A, n), A.sum())
+        A = np.arange(100, dtype=np.float32)
+        self.assertEqual(test_sum_range(A, 10, 50), A[10:50].sum())
+        self.assertEqual(test_sum_range(A, 50, 10), 0)
+
+    def test_int(self):
+        A = np.arange(-50, 53, dtype=np.int32)
+        self.assertEqual(test_sum_int(A, len(A)), A.sum())
+        B = np.array([3, -7, 12, 5] * 9 + [40], dtype=np.int16)
+        self.assertEqual(test_max(B, len(B)), 40)
+        self.assertEqual(test_max(B, 4), 12)
+        self.assertEqual(test_max(B, 0), np.iinfo(np.int16).min)
+
+    def test_min(self):
+        A = np.random.random(333)
+        self.assertEqual(test_min(A, len(A)), A.min())
+        self.assertEqual(test_min(A, 0), float('inf'))
+
+    def test_dot(self):
+        A = np.random.random(99)
+        B = np.random.random(99)
+        self.assertAlmostEqual(test_dot(A, B, len(A)), np.dot(A, B))
+
+    def test_argmax(self):
+        A = np.zeros(70, dtype=np.float32)
+        A[[13, 41, 66]] = 5 # the first one wins
+        self.assertEqual(test_argmax(A, len(A)), 13)
+        self.assertEqual(test_argmax(A, 10), 0)
+        A[:] = -np.inf
+        self.assertEqual(test_argmax(A, len(A)), 0)
+        self.assertEqual(test_argmax(A, 0), -1)
+        self.assertEqual(test_argmax.run_py(A, 0), -1)
+
+    def test_python(self):
+        A = np.arange(10, dtype=np.float32)
+        self.assertEqual(test_argmax.run_py(A, 10), test_argmax(A, 10))
+        self.assertEqual(test_sum_range.run_py(A, 2, 5),
+                         test_sum_range(A, 2, 5))
+
+    def test_vector(self):
+        A = np.array([1, 2, 3, 4, 8, 5, 7, 6], dtype=np.float32)
+        V, W = A[:4], A[4:]
+        expect = V.sum() + W.max() * 10 + np.dot(V, W) * 100 + 0 * 1000
+        self.assertEqual(test_vector(A), expect)
+
+    def test_checked(self):
+        A = np.arange(37, dtype=np.float64)
+        self.assertEqual(test_checked_sum(A), A.sum())
+        self.assertEqual(test_checked_tail(A, 30), A[30:].sum())
+        self.assertEqual(test_checked_tail(A, 50), 0)
+
+    def test_negative_bounds(self):
+        # negative bounds count from the end like the slices of Python
+        A = np.arange(37, dtype=np.float64)
+        for lo, hi in [(-1, 37), (-5, -2), (-50, 3), (2, -30), (-3, -5),
+                       (0, -50), (-37, 100)]:
+            self.assertEqual(test_checked_slice(A, lo, hi), A[lo:hi].sum())
+            self.assertEqual(test_checked_slice.run_py(A, lo, hi),
+                             A[lo:hi].sum())
+        self.assertEqual(test_checked_tail(A, -3), A[-3:].sum())
+        # without the length, a negative lower bound starts at 0
+        B = np.arange(10, dtype=np.float32)
+        self.assertEqual(test_sum_range(B, -2, 5), B[:5].sum())
+
+    def test_errors(self):
+        with self.assertRaises(CompilerError):
+            test_unknown_length.compile()
+        with self.assertRaises(CompilerError):
+            test_mixed_types.compile()
+        with self.assertRaises(CompilerError):
+            test_negative_bound.compile()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+import logging
+#logging.basicConfig(level=logging.DEBUG)
+
+from pymothoa.jit import JITModule
+from pymothoa.types import *
+from pymothoa.dialect import *
+
+module = JITModule('teststatic')
+
+@module.function(ret=Double, args=[Array(Double), Int], static=['n'])
+def test_sum_n(A, n):
+    var ( total = Double )
+    total = 0
+    for i in xrange(n):
+        total += A[i]
+    return total
+
+@module.function(args=[Array(Double), Int, Double], static=['k'])
+def test_scale(A, n, k):
+    for i in xrange(n):
+        A[i] *= k
+
+@module.function(args=[Array(Float), Array(Float), Array(Float), Int],
+                 static=['n'])
+def test_matrixmul(Pn, Mn, Nn, n):
+    var ( column = Array(Float, n), total = Float )
+    for col in xrange(n):
+        for i in xrange(n):
+            column[i] = Nn[i * n + col]
+        for row in xrange(n):
+            total = 0
+            for k in xrange(n):
+                total += Mn[row * n + k] * column[k]
+            Pn[row * n + col] = total
+
+@module.function(ret=Int, args=[Int], static=['x'], max_specializations=2)
+def test_limited(x):
+    return x * 2
+
+@module.function(ret=Int, args=[Int, Int], static=['x'],
+                 max_specializations=1)
+def test_single(x, y):
+    return x * 3 + y
+
+@module.function(ret=Int, args=[Int], static=['x'])
+def test_negate(x):
+    return -x
+
+@module.function(ret=Double, args=[Array(Double)])
+def test_caller(A):
+    return test_sum_n(A, 3)
+
+#-------------------------------------------------------------------------------
+
+import threading
+import unittest
+import numpy as np
+
+class Test(unittest.TestCase):
+    def test_int(self):
+        A = np.arange(10, dtype=np.float64)
+        for n in [0, 1, 4, 10]:
+            self.assertEqual(test_sum_n(A, n), A[:n].sum())
+        spec = test_sum_n.specializations[(4,)]
+        self.assertEqual(len(spec.argtys), 1) # the constant is not passed
+        self.assertIs(test_sum_n.specialize((4,)), spec)
+
+    def test_float(self):
+        A = np.ones(5)
+        test_scale(A, len(A), 2.5)
+        test_scale(A, len(A), 2)
+        self.assertTrue((A == 5).all())
+        self.assertIn((2.0,), test_scale.specializations)
+
+    def test_local_array(self):
+        n = 2
+        M = np.arange(n * n, dtype=np.float32)
+        N = np.arange(n * n, dtype=np.float32) + 1
+        P = np.zeros(n * n, dtype=np.float32)
+        test_matrixmul(P, M, N, n)
+        expect = np.dot(M.reshape(n, n), N.reshape(n, n)).ravel()
+        self.assertTrue((P == expect).all())
+
+    def test_lru(self):
+        self.assertEqual(test_limited(1), 2)
+        self.assertEqual(test_limited(2), 4)
+        first = test_limited.specializations[(1,)]
+        self.assertEqual(test_limited(1), 2) # (2,) is the least recent
+        self.assertEqual(test_limited(3), 6)
+        self.assertEqual(sorted(test_limited.specializations), [(1,), (3,)])
+        self.assertIs(test_limited.specializations[(1,)], first)
+        self.assertEqual(test_limited(2), 4) # compiled again
+        self.assertEqual(len(test_limited.specializations), 2)
+
+    def test_threads(self):
+        # Alternating keys evict each other. A running specialization must
+        # not be freed under another thread.
+        errors = []
+        def work(offset):
+            try:
+                for i in xrange(200):
+                    x = (i + offset) % 2
+                    self.assertEqual(test_single(x, i), x * 3 + i)
+            except Exception as e:
+                errors.append(e)
+        threads = [threading.Thread(target=work, args=(i,)) for i in xrange(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(errors, [])
+
+    def test_freed(self):
+        fn = test_negate.specialize((1,))
+        self.assertEqual(fn(), -1)
+        self.assertTrue(fn.free())
+        with self.assertRaises(RuntimeError):
+            fn()
+
+    def test_call(self):
+        A = np.arange(5, dtype=np.float64)
+        self.assertEqual(test_caller(A), 3)
+
+    def test_errors(self):
+        with self.assertRaises(TypeError):
+            test_sum_n(np.ones(3), 1.5)
+        with self.assertRaises(TypeError):
+            test_sum_n(np.ones(3))
+        with self.assertRaises(TypeError):
+            module.function(args=[Array(Double)], static=['A'])(lambda A: A)
+        with self.assertRaises(TypeError):
+            module.function(args=[Int], static=['y'])(lambda x: x)
+        with self.assertRaises(TypeError):
+            module.function(static=['x'])(lambda x: x)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+import logging
+#logging.basicConfig(level=logging.DEBUG)
+
+from pymothoa.jit import default_module, function
+from pymothoa.types import *
+from pymothoa.dialect import *
+
+Vec2 = Struct('Vec2', [('x', Double), ('y', Double)])
+Particle = Struct('Particle', [('pos', Vec2), ('vel', Vec2),
+                               ('mass', Float), ('id', Int32)])
+
+@function(args=[Array(Particle), Int, Double])
+def test_advance(P, n, dt):
+    for i in xrange(n):
+        P[i].pos.x += P[i].vel.x * dt
+        P[i].pos.y += P[i].vel.y * dt
+
+@function(ret=Double, args=[Array(Particle), Int])
+def test_total_mass(P, n):
+    var ( total = Double )
+    total = 0
+    for i in xrange(n):
+        total += P[i].mass
+    return total
+
+@function(args=[Array(Particle), Int])
+def test_reverse(P, n):
+    var ( tmp = Particle )
+    for i in xrange(n / 2):
+        tmp = P[i]
+        P[i] = P[n - 1 - i]
+        P[n - 1 - i] = tmp
+
+@function(ret=Double, args=[NDArray(Vec2, 2)])
+def test_grid(G):
+    var ( total = Double )
+    total = 0
+    for i in xrange(G.shape[0]):
+        for j in xrange(G.shape[1]):
+            total += G[i, j].x * G[i, j].y
+    return total
+
+@function
+def test_lazy_sum_x(A, n):
+    var ( total = Double )
+    total = 0
+    for i in xrange(n):
+        total += A[i].x
+    return total
+
+default_module.optimize()
+
+#-------------------------------------------------------------------------------
+
+import unittest
+import numpy as np
+from pymothoa.util import layout
+
+class Test(unittest.TestCase):
+    def particles(self, n):
+        P = layout.aos(Particle, n)
+        P['pos']['x'] = np.arange(n)
+        P['vel']['x'] = 1
+        P['vel']['y'] = 2
+        P['mass'] = 0.5
+        P['id'] = np.arange(n)
+        return P
+
+    def test_fields(self):
+        P = self.particles(10)
+        test_advance(P, len(P), 0.5)
+        self.assertTrue((P['pos']['x'] == np.arange(10) + 0.5).all())
+        self.assertTrue((P['pos']['y'] == 1).all())
+        self.assertEqual(test_total_mass(P, len(P)), 5)
+
+    def test_copy(self):
+        P = self.particles(5)
+        test_reverse(P, len(P))
+        self.assertEqual(list(P['id']), [4, 3, 2, 1, 0])
+        self.assertEqual(list(P['pos']['x']), [4, 3, 2, 1, 0])
+
+    def test_ndarray(self):
+        G = np.zeros((3, 4), dtype=layout.struct_dtype(Vec2))
+        G['x'] = 2
+        G['y'] = np.arange(12).reshape(3, 4)
+        self.assertEqual(test_grid(G), 2 * np.arange(12).sum())
+        self.assertEqual(test_grid(G[:, ::2]), 2 * np.arange(12)[::2].sum())
+
+    def test_aligned_dtype(self):
+        dtype = np.dtype([('x', np.float64), ('y', np.float64)], align=True)
+        A = np.ones(4, dtype=dtype)
+        self.assertEqual(test_lazy_sum_x(A, len(A)), 4)
+        packed = np.dtype([('a', np.int8), ('x', np.float64)])
+        with self.assertRaises(TypeError):
+            test_lazy_sum_x(np.ones(4, dtype=packed), 4)
+
+    def test_invalid(self):
+        with self.assertRaises(TypeError):
+            test_total_mass(np.zeros(4, dtype=layout.struct_dtype(Vec2)), 4)
+        with self.assertRaises(TypeError):
+            function(ret=Double, args=[Vec2], later=True)(lambda v: v.x)
+        with self.assertRaises(TypeError):
+            Struct('Invalid', [('flag', Bool)])
+
+    def test_layout(self):
+        self.assertEqual(layout.sizeof(Particle), 40)
+        self.assertEqual(layout.offsets(Particle), [0, 16, 32, 36])
+        self.assertEqual(layout.struct_dtype(Particle).itemsize, 40)
+        self.assertEqual(layout.struct_from_dtype(
+                            layout.struct_dtype(Particle)), Particle)
+
+    def test_choose_layout(self):
+        fields = layout.accessed_fields(test_total_mass, 'P')
+        self.assertEqual(fields, frozenset(['mass']))
+        self.assertEqual(layout.choose_layout(Particle, fields), layout.SOA)
+        self.assertEqual(layout.choose_layout(Particle, ['pos', 'vel']),
+                         layout.AOS)
+
+    def test_conversion(self):
+        P = self.particles(6)
+        columns = layout.to_soa(P)
+        self.assertEqual(columns.keys(), Particle.names())
+        self.assertTrue((columns['mass'] == 0.5).all())
+        self.assertEqual(layout.to_aos(Particle, columns).tostring(),
+                         P.tostring())
+
+if __name__ == '__main__':
+    unittest.main()
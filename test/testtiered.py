@@ -0,0 +1,110 @@
+import logging
+#logging.basicConfig(level=logging.DEBUG)
+
+from pymothoa.jit import JITModule, default_module, function
+from pymothoa.types import *
+from pymothoa.dialect import *
+
+tiered = JITModule('testtiered')
+
+EVENTS = []
+tiered.add_tier_listener(lambda fn, old, new: EVENTS.append((fn, old, new)))
+
+@tiered.function(ret=Int, args=[Int, Int], tiered=True, hot_calls=10)
+def test_add(A, B):
+    return A + B
+
+@tiered.function(ret=Double, args=[Array(Double), Int], tiered=True,
+                 hot_calls=5, background=True)
+def test_sum(A, n):
+    var ( total = Double )
+    total = 0
+    for i in xrange(n):
+        total += A[i]
+    return total
+
+@tiered.function(ret=Int, args=[Int], tiered=True, hot_calls=10**9,
+                 hot_seconds=0)
+def test_timed(A):
+    return A * 2
+
+@tiered.function(ret=Int, args=[Int, Int], tiered=True, hot_calls=20)
+def test_threaded(A, B):
+    return A * B
+
+@tiered.function(ret=Int, args=[Int], tiered=True, hot_calls=3)
+def test_bad(A):
+    return len([A])   # not supported by the compiler
+
+#-------------------------------------------------------------------------------
+
+import threading
+import unittest
+import numpy as np
+from pymothoa.llvm_backend.function import (TIER_PYTHON, TIER_COMPILING,
+                                            TIER_NATIVE, TIER_FAILED)
+
+def events_of(fn):
+    return [(old, new) for X, old, new in EVENTS if X is fn]
+
+class Test(unittest.TestCase):
+    def test_promote(self):
+        self.assertEqual(test_add.tier, TIER_PYTHON)
+        for i in xrange(9):
+            self.assertEqual(test_add(i, 1), i + 1)
+        self.assertEqual(test_add.tier, TIER_PYTHON)
+        self.assertEqual(test_add.call_count, 9)
+        self.assertGreater(test_add.python_time, 0)
+
+        test_add(1, 2) # the 10th call compiles the function
+        self.assertEqual(test_add.tier, TIER_NATIVE)
+        self.assertEqual(test_add(3, 4), 7)
+        self.assertEqual(test_add.call_count, 10) # native calls are not counted
+        self.assertEqual(events_of(test_add),
+                         [(TIER_PYTHON, TIER_COMPILING),
+                          (TIER_COMPILING, TIER_NATIVE)])
+
+    def test_background(self):
+        A = np.arange(10, dtype=np.float64)
+        for i in xrange(5):
+            self.assertEqual(test_sum(A, len(A)), A.sum())
+        # keeps running the Python code while compiling
+        self.assertNotEqual(test_sum.tier, TIER_PYTHON)
+        test_sum.future.result()
+        self.assertEqual(test_sum.tier, TIER_NATIVE)
+        self.assertEqual(test_sum(A, len(A)), A.sum())
+
+    def test_time_threshold(self):
+        self.assertEqual(test_timed(1), 2)
+        self.assertEqual(test_timed.tier, TIER_NATIVE)
+        self.assertEqual(test_timed(2), 4)
+
+    def test_threads(self):
+        # Threads that cross the threshold together compile it once.
+        errors = []
+        def work():
+            try:
+                for i in xrange(100):
+                    self.assertEqual(test_threaded(i, 3), i * 3)
+            except Exception as e:
+                errors.append(e)
+        threads = [threading.Thread(target=work) for _ in xrange(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(test_threaded.tier, TIER_NATIVE)
+        self.assertEqual(events_of(test_threaded),
+                         [(TIER_PYTHON, TIER_COMPILING),
+                          (TIER_COMPILING, TIER_NATIVE)])
+
+    def test_failed(self):
+        for i in xrange(5):
+            self.assertEqual(test_bad(i), 1)
+        self.assertEqual(test_bad.tier, TIER_FAILED)
+        self.assertIsNotNone(test_bad.tier_error)
+        self.assertEqual(events_of(test_bad)[-1], (TIER_COMPILING, TIER_FAILED))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import logging
+#logging.basicConfig(level=logging.DEBUG)
+
+from pymothoa.jit import default_module, function
+from pymothoa.types import *
+from pymothoa.dialect import *
+
+@function(ret=Int, args=[Int, Int])
+def test_add(A, B):
+    return A + B
+
+@function(ret=Int64, args=[Int64])
+def test_int64(A):
+    return A * 2
+
+@function(ret=Double, args=[Double, Int])
+def test_mixed(A, B):
+    return A * B
+
+@function(ret=Float, args=[Float])
+def test_float(A):
+    return A / 2.0
+
+@function(ret=Bool, args=[Int])
+def test_bool(A):
+    return A > 0
+
+@function(args=[Int])
+def test_void(A):
+    pass
+
+@function(ret=Float, args=[Array(Float), Int])
+def test_array(A, n):
+    var ( tmp = Float )
+    tmp = 0
+    for i in xrange(n):
+        tmp += A[i]
+    return tmp
+
+default_module.optimize()
+#-------------------------------------------------------------------------------
+
+import unittest
+from pymothoa.util.testing import benchmark_dispatch
+
+class Test(unittest.TestCase):
+    def test_results(self):
+        self.assertEqual(test_add(1, 2), 3)
+        self.assertEqual(test_add(-7, 2), -5)
+        self.assertEqual(test_int64(2**40), 2**41)
+        self.assertAlmostEqual(test_mixed(1.5, 3), 4.5)
+        self.assertAlmostEqual(test_float(3), 1.5)
+        self.assertIs(test_bool(1), True)
+        self.assertIs(test_bool(-1), False)
+        self.assertIsNone(test_void(1))
+
+    def test_same_as_ctypes(self):
+        for args in [(0, 0), (1, -1), (2**31 - 1, 1)]:
+            self.assertEqual(test_add(*args), test_add.run_jit(*args))
+
+    def test_uses_trampoline(self):
+        test_add(1, 2)
+        self.assertIsNotNone(test_add.trampoline)
+        test_array([1.0, 2.0], 2)
+        self.assertIsNone(test_array.trampoline)
+        self.assertEqual(test_array([1.0, 2.0, 3.0], 3), 6.0)
+
+    def test_wrong_arguments(self):
+        with self.assertRaises(TypeError):
+            test_add(1)
+        with self.assertRaises(TypeError):
+            test_add(1, 2, 3)
+        with self.assertRaises(TypeError):
+            test_add(1, 'a')
+        with self.assertRaises(TypeError):
+            test_add(1.5, 2)
+        with self.assertRaises(OverflowError):
+            test_add(1, 2 ** 40)
+        with self.assertRaises(OverflowError):
+            test_int64(2 ** 64)
+
+    def test_dispatch_overhead(self):
+        times = benchmark_dispatch(test_add, (1, 2))
+        self.assertLess(times['trampoline'], times['ctypes'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import logging
+#logging.basicConfig(level=logging.DEBUG)
+
+from pymothoa.jit import default_module, function
+from pymothoa.types import *
+from pymothoa.dialect import *
+
+@function(ret=UInt32, args=[Array(UInt8), Int])
+def test_fnv1a(data, n):
+    var ( h = UInt32 )
+    h = 2166136261
+    for i in xrange(n):
+        h ^= data[i]
+        h *= 16777619
+    return h
+
+@function(ret=UInt64, args=[UInt64, UInt64])
+def test_div(a, b):
+    return a / b + a % b
+
+@function(ret=UInt32, args=[UInt32, Int])
+def test_shift(a, n):
+    return a >> n
+
+@function(ret=Bool, args=[UInt32, UInt32])
+def test_less(a, b):
+    return a < b
+
+@function(ret=Double, args=[UInt32])
+def test_to_double(a):
+    return a
+
+@function(ret=Int64, args=[UInt8])
+def test_widen(a):
+    return a
+
+@function(ret=UInt64, args=[])
+def test_long_constant():
+    return 14695981039346656037
+
+@function(ret=UInt8, args=[Array(UInt8), Int])
+def test_max(A, n):
+    return max(A[:n])
+
+@function(args=[Array(UInt8), Int])
+def test_invert(image, n):
+    for i in xrange(n):
+        image[i] = 255 - image[i]
+
+default_module.optimize()
+
+#-------------------------------------------------------------------------------
+
+import unittest
+import array
+import numpy as np
+from pymothoa.llvm_backend.types import typeof
+
+def fnv1a(data):
+    h = 2166136261
+    for x in data:
+        h = ((h ^ x) * 16777619) & 0xffffffff
+    return h
+
+class Test(unittest.TestCase):
+    def test_hash(self):
+        data = np.frombuffer('hello, world', dtype=np.uint8)
+        self.assertEqual(test_fnv1a(data, len(data)), fnv1a(data))
+
+    def test_arithmetic(self):
+        big = 2 ** 64 - 5
+        self.assertEqual(test_div(big, 3), big // 3 + big % 3)
+        self.assertEqual(test_shift(0x80000000, 4), 0x08000000)
+        self.assertTrue(test_less(1, 0x80000000))
+        self.assertEqual(test_to_double(0xffffffff), 4294967295.0)
+        self.assertEqual(test_widen(200), 200)
+        self.assertEqual(test_long_constant(), 14695981039346656037)
+
+    def test_reduction(self):
+        A = np.array([3, 250, 7, 128], dtype=np.uint8)
+        self.assertEqual(test_max(A, len(A)), 250)
+        self.assertEqual(test_max(A, 0), 0)
+
+    def test_arrays(self):
+        image = array.array('B', [0, 100, 255])
+        test_invert(image, len(image))
+        self.assertEqual(list(image), [255, 155, 0])
+        with self.assertRaises(TypeError):
+            test_invert(array.array('b', [0, 1]), 2)
+        A = np.arange(4, dtype=np.uint8)
+        test_invert(A, len(A))
+        self.assertEqual(list(A), [255, 254, 253, 252])
+        with self.assertRaises(TypeError):
+            test_invert(np.zeros(4, dtype=np.int8), 4)
+
+    def test_typeof(self):
+        self.assertIs(typeof(np.zeros(2, dtype=np.uint16)).elemtype, UInt16)
+        self.assertIs(typeof(array.array('I', [1])).elemtype, UInt32)
+        self.assertIs(typeof(array.array('b', [1])).elemtype, Int8)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import logging
+#logging.basicConfig(level=logging.DEBUG)
+
+from pymothoa.jit import default_module, vectorize
+from pymothoa.types import *
+from pymothoa.dialect import *
+
+@vectorize(ret=Double, args=[Double, Double])
+def test_axpy(X, Y):
+    return 2.5 * X + Y
+
+@vectorize(ret=Float, args=[Float])
+def test_clamp(X):
+    if X < 0:
+        return 0
+    return X
+
+@vectorize(ret=Int, args=[Int])
+def test_square(X):
+    return X * X
+
+default_module.optimize()
+#-------------------------------------------------------------------------------
+
+import unittest
+import array
+from random import random
+import numpy as np
+from pymothoa.util.testing import benchmark, benchmark_summary
+
+class Test(unittest.TestCase):
+    def setUp(self):
+        self.N = 1024 * 64
+        self.X = np.array([random() - 0.5 for _ in xrange(self.N)])
+        self.Y = np.array([random() - 0.5 for _ in xrange(self.N)])
+
+    def test_numpy(self):
+        out = test_axpy(self.X, self.Y)
+        self.assertIsInstance(out, np.ndarray)
+        self.assertEqual(out.dtype, np.float64)
+        self.assertTrue(np.allclose(out, 2.5 * self.X + self.Y))
+
+    def test_array_array(self):
+        data = array.array('f', [-1.5, 0.5, -0.25, 2.0])
+        out = test_clamp(data)
+        self.assertIsInstance(out, array.array)
+        self.assertEqual(list(out), [0, 0.5, 0, 2.0])
+
+        data = array.array('i', range(-5, 5))
+        self.assertEqual(list(test_square(data)), [i * i for i in range(-5, 5)])
+
+    def test_out(self):
+        out = np.zeros(self.N)
+        ret = test_axpy(self.X, self.Y, out=out)
+        self.assertIs(ret, out)
+        self.assertTrue(np.allclose(out, 2.5 * self.X + self.Y))
+
+    def test_run_py(self):
+        X = self.X[:16]
+        Y = self.Y[:16]
+        self.assertTrue(np.allclose(test_axpy.run_py(X, Y), test_axpy(X, Y)))
+
+    def test_kernel(self):
+        self.assertAlmostEqual(test_axpy.kernel(2, 1), 6.0)
+
+    def test_bad_arguments(self):
+        with self.assertRaises(ValueError):
+            test_axpy(self.X, self.Y[:10])
+        with self.assertRaises(ValueError):
+            test_axpy(self.X, self.Y, out=np.zeros(10))
+        with self.assertRaises(TypeError):
+            test_axpy(self.X)
+
+    def test_speed(self):
+        kernel = test_axpy.kernel
+        X, Y = self.X, self.Y
+        with benchmark('vectorize') as bm:
+            with bm.entry('NumPy'):
+                expect = 2.5 * X + Y
+            with bm.entry('JIT per element'):
+                for i in xrange(self.N):
+                    kernel(X[i], Y[i])
+            with bm.entry('JIT vectorize'):
+                got = test_axpy(X, Y)
+        self.assertTrue(np.allclose(expect, got))
+        benchmark_summary()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+import logging
+#logging.basicConfig(level=logging.DEBUG)
+
+from pymothoa.jit import JITModule, default_module, function
+from pymothoa.types import *
+from pymothoa.dialect import *
+
+VW = 4 # width of vector (unit: # of element)
+
+@function(ret=Float, args=[Array(Float), Int])
+def test_vload_sum(A, N):
+    var ( acc = Vector(Float, VW) )
+    acc = 0.0
+    for i in xrange(N / VW):
+        acc += vload(A, i * VW, VW)
+    return acc[0] + acc[1] + acc[2] + acc[3]
+
+@function(args=[Array(Double), Array(Double), Int])
+def test_vstore_scale(A, B, N):
+    var ( V = Vector(Double, 2) )
+    for i in xrange(N / 2):
+        V = vload(A, i * 2, 2, aligned=True)
+        vstore(B, i * 2, V * 2.0, aligned=True)
+
+@function(args=[Array(Int32), Array(Int32)])
+def test_shuffle(A, B):
+    var ( V = Vector(Int32, 4), W = Vector(Int32, 4) )
+    V = vload(A, 0, 4)
+    W = vload(A, 4, 4)
+    vstore(B, 0, shuffle(V, (3, 2, 1, 0)))
+    vstore(B, 4, shuffle(V, W, (0, 4, 1, 5)))
+    vstore(B, 8, shuffle(W, (0, 0)))
+
+@function(args=[Array(Float), Array(Float), Array(Float)])
+def test_select(A, B, C):
+    var ( V = Vector(Float, 4), W = Vector(Float, 4) )
+    V = vload(A, 0, 4)
+    W = vload(B, 0, 4)
+    vstore(C, 0, select(V < W, V, W))
+    vstore(C, 4, select(V > 2.0, V, 0.0))
+
+@function(ret=Int, args=[Int, Int])
+def test_select_scalar(a, b):
+    return select(a > b, a, b)
+
+default_module.optimize()
+
+checked = JITModule('testvload_checked', modargs={'boundscheck': True})
+
+@checked.function(ret=Int32, args=[Array(Int32), Int])
+def test_checked_vload(A, i):
+    var ( V = Vector(Int32, 4) )
+    V = vload(A, i, 4)
+    return V[0] + V[3]
+
+errors = JITModule('testvload_errors')
+
+@errors.function(args=[Array(Float), Array(Double)], later=True)
+def test_mixed_types(A, B):
+    vstore(B, 0, vload(A, 0, 4))
+
+@errors.function(ret=Float, args=[Array(Float)], later=True)
+def test_bad_mask(A):
+    var ( V = Vector(Float, 4) )
+    V = vload(A, 0, 4)
+    return shuffle(V, (0, 4))[0]
+
+#-------------------------------------------------------------------------------
+
+import unittest
+import numpy as np
+from pymothoa.compiler_errors import CompilerError
+
+class Test(unittest.TestCase):
+    def test_vload(self):
+        A = np.arange(16, dtype=np.float32)
+        self.assertEqual(test_vload_sum(A, len(A)), A.sum())
+        self.assertIn('load <4 x float>', test_vload_sum.code_llvm.dump())
+
+    def test_vstore(self):
+        A = np.random.random(10)
+        B = np.zeros_like(A)
+        test_vstore_scale(A, B, len(A))
+        self.assertTrue(np.all(B == A * 2))
+        dump = test_vstore_scale.code_llvm.dump()
+        self.assertIn('store <2 x double>', dump)
+        self.assertIn('align 16', dump)
+
+    def test_shuffle(self):
+        A = np.arange(10, 18, dtype=np.int32)
+        B = np.zeros(10, dtype=np.int32)
+        test_shuffle(A, B)
+        self.assertEqual(list(B), [13, 12, 11, 10, 10, 14, 11, 15, 14, 14])
+
+    def test_select(self):
+        A = np.array([1, 5, 3, 7], dtype=np.float32)
+        B = np.array([4, 2, 6, 0], dtype=np.float32)
+        C = np.zeros(8, dtype=np.float32)
+        test_select(A, B, C)
+        self.assertEqual(list(C), [1, 2, 3, 0, 0, 5, 3, 7])
+        self.assertEqual(test_select_scalar(3, 8), 8)
+        self.assertEqual(test_select_scalar(9, 8), 9)
+
+    def test_checked(self):
+        A = np.arange(8, dtype=np.int32)
+        self.assertEqual(test_checked_vload(A, 4), 4 + 7)
+        with self.assertRaises(IndexError):
+            test_checked_vload(A, 5)
+        with self.assertRaises(IndexError):
+            test_checked_vload(A, -1)
+
+    def test_python(self):
+        self.assertEqual(vload([1, 2, 3, 4, 5], 1, 3), [2, 3, 4])
+        self.assertEqual(shuffle([1, 2], [3, 4], (3, 0)), [4, 1])
+        self.assertEqual(select([True, False], [1, 2], 0), [1, 0])
+        A = [0] * 4
+        vstore(A, 2, [7, 8])
+        self.assertEqual(A, [0, 0, 7, 8])
+
+    def test_errors(self):
+        with self.assertRaises(CompilerError):
+            test_mixed_types.compile()
+        with self.assertRaises(CompilerError):
+            test_bad_mask.compile()
+
+if __name__ == '__main__':
+    unittest.main()